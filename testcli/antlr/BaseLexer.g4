@@ -330,6 +330,8 @@ MONITOR_START         : 'START';
 MONITOR_STOP          : 'STOP';
 MONITOR_REPORT        : 'REPORT';
 MONITOR_LIST          : 'LIST';
+MONITOR_SUMMARY       : 'SUMMARY';
+MONITOR_EXPORT        : 'EXPORT';
 MONITOR_ON            : 'ON';
 MONITOR_OFF           : 'OFF';
 MONITOR_EXPRESSION    :
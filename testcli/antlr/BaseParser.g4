@@ -199,16 +199,24 @@ help       :
 monitor    :
            MONITOR
            (
-               (MONITOR_MANAGER MONITOR_ON (MONITOR_WORKERS MONITOR_EXPRESSION)?) |
+               (MONITOR_MANAGER MONITOR_ON (MONITOR_WORKERS monitorExpression)?) |
                (MONITOR_MANAGER MONITOR_OFF) |
-               (MONITOR_CREATE MONITOR_TASK ((MONITOR_EXPRESSION)?
-                    (MONITOR_EXPRESSION MONITOR_EQUAL MONITOR_EXPRESSION)+))|
-               (MONITOR_START MONITOR_TASK MONITOR_EXPRESSION) |
-               (MONITOR_STOP MONITOR_TASK MONITOR_EXPRESSION) |
-               (MONITOR_REPORT MONITOR_TASK MONITOR_EXPRESSION) |
+               (MONITOR_CREATE MONITOR_TASK ((monitorExpression)?
+                    (monitorExpression MONITOR_EQUAL monitorExpression)+))|
+               (MONITOR_START MONITOR_TASK monitorExpression) |
+               (MONITOR_STOP MONITOR_TASK monitorExpression) |
+               (MONITOR_REPORT MONITOR_TASK monitorExpression) |
+               (MONITOR_SUMMARY MONITOR_TASK monitorExpression
+                    (monitorExpression MONITOR_EQUAL monitorExpression)*) |
+               (MONITOR_EXPORT MONITOR_TASK monitorExpression
+                    (monitorExpression MONITOR_EQUAL monitorExpression)+) |
                (MONITOR_LIST MONITOR_TASK)
            )
            (MONITOR_SEMICOLON)? MONITOR_CRLF?;
 
+// 监控命令中的任务名称和参数，SUMMARY和EXPORT是后加入的关键字，仍然可以作为任务名称和参数使用
+monitorExpression :
+           MONITOR_EXPRESSION | MONITOR_SUMMARY | MONITOR_EXPORT;
+
 plugin     :
            PLUGIN (PLUGIN_EXPRESSION)+ (PLUGIN_SEMICOLON)? PLUGIN_CRLF?;
@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,272,2485,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,
+        4,0,274,2504,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,
         -1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,
         -1,6,-1,6,-1,6,-1,6,-1,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,
         7,4,2,5,7,5,2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,
@@ -61,941 +61,948 @@ def serializedATN():
         7,267,2,268,7,268,2,269,7,269,2,270,7,270,2,271,7,271,2,272,7,272,
         2,273,7,273,2,274,7,274,2,275,7,275,2,276,7,276,2,277,7,277,2,278,
         7,278,2,279,7,279,2,280,7,280,2,281,7,281,2,282,7,282,2,283,7,283,
-        2,284,7,284,2,285,7,285,2,286,7,286,2,287,7,287,2,288,7,288,1,0,
-        1,0,1,0,1,0,1,0,5,0,613,8,0,10,0,12,0,616,9,0,1,0,1,0,1,0,1,0,1,
-        1,1,1,1,1,1,1,5,1,626,8,1,10,1,12,1,629,9,1,1,1,1,1,3,1,633,8,1,
-        1,1,1,1,1,2,1,2,1,2,1,2,5,2,641,8,2,10,2,12,2,644,9,2,1,2,1,2,3,
-        2,648,8,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,
-        4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,8,1,8,1,9,1,9,1,
-        10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,15,1,15,1,16,1,
-        16,1,17,1,17,1,18,1,18,1,19,4,19,698,8,19,11,19,12,19,699,1,19,1,
-        19,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,
-        22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,
-        23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,5,24,739,8,24,10,
-        24,12,24,742,9,24,1,24,1,24,3,24,746,8,24,1,24,1,24,1,25,1,25,1,
-        25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,
-        26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,28,1,28,1,
-        28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,
-        29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,
-        31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,
-        33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,
-        35,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,
-        36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,
-        38,1,38,1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,
-        39,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,
-        41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,4,
-        42,895,8,42,11,42,12,42,896,1,42,1,42,1,43,4,43,902,8,43,11,43,12,
-        43,903,1,44,4,44,907,8,44,11,44,12,44,908,1,44,1,44,4,44,913,8,44,
-        11,44,12,44,914,1,45,1,45,1,45,1,45,1,45,1,45,4,45,923,8,45,11,45,
-        12,45,924,1,46,1,46,1,46,3,46,930,8,46,1,47,1,47,1,48,1,48,1,48,
-        1,48,1,49,1,49,1,50,1,50,1,51,1,51,1,52,1,52,1,53,1,53,1,53,1,53,
-        1,53,3,53,951,8,53,5,53,953,8,53,10,53,12,53,956,9,53,1,53,1,53,
-        1,54,1,54,1,54,1,54,3,54,964,8,54,1,54,1,54,3,54,968,8,54,5,54,970,
-        8,54,10,54,12,54,973,9,54,1,54,1,54,1,55,1,55,1,55,1,55,5,55,981,
-        8,55,10,55,12,55,984,9,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,
-        1,57,1,57,1,58,4,58,997,8,58,11,58,12,58,998,1,58,1,58,1,59,1,59,
-        1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,
-        1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,
-        1,59,1,59,1,59,1,59,3,59,1035,8,59,1,59,1,59,1,60,1,60,1,60,1,60,
-        1,60,1,60,1,61,4,61,1046,8,61,11,61,12,61,1047,1,62,1,62,1,62,1,
-        62,1,62,1,63,5,63,1056,8,63,10,63,12,63,1059,9,63,1,63,1,63,1,63,
-        1,63,1,63,1,63,1,63,4,63,1068,8,63,11,63,12,63,1069,1,63,1,63,4,
-        63,1074,8,63,11,63,12,63,1075,1,63,3,63,1079,8,63,1,63,1,63,1,63,
-        1,63,1,64,1,64,1,64,1,64,1,65,4,65,1090,8,65,11,65,12,65,1091,1,
-        65,1,65,1,66,1,66,1,66,1,66,1,66,1,66,1,66,4,66,1103,8,66,11,66,
-        12,66,1104,1,67,1,67,1,67,1,67,1,68,3,68,1112,8,68,1,68,1,68,1,68,
-        1,68,1,68,1,69,4,69,1120,8,69,11,69,12,69,1121,1,70,1,70,1,70,1,
-        70,1,71,4,71,1129,8,71,11,71,12,71,1130,1,71,1,71,1,72,1,72,1,72,
-        1,72,1,73,1,73,1,73,1,73,1,73,1,73,1,73,1,73,1,73,1,74,1,74,1,74,
-        1,74,1,74,1,74,1,74,1,74,1,75,1,75,1,75,1,75,5,75,1160,8,75,10,75,
-        12,75,1163,9,75,1,75,1,75,1,75,1,75,1,76,1,76,1,76,3,76,1172,8,76,
-        1,76,5,76,1175,8,76,10,76,12,76,1178,9,76,1,76,1,76,1,77,1,77,1,
-        77,1,77,1,77,1,77,1,77,1,78,1,78,1,78,1,78,1,79,1,79,1,79,1,79,1,
-        80,4,80,1198,8,80,11,80,12,80,1199,1,80,1,80,1,81,1,81,1,81,1,81,
-        1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,
-        1,82,1,82,1,83,1,83,1,83,1,84,1,84,1,84,1,84,1,85,1,85,1,85,1,85,
-        1,85,1,85,1,85,4,85,1237,8,85,11,85,12,85,1238,1,86,1,86,1,87,1,
-        87,1,87,1,87,1,88,4,88,1248,8,88,11,88,12,88,1249,1,88,1,88,1,89,
-        1,89,1,89,1,89,1,89,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,91,
-        1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,92,1,92,1,92,1,92,1,92,1,93,
-        1,93,1,93,1,93,1,93,1,93,1,93,4,93,1287,8,93,11,93,12,93,1288,1,
-        94,1,94,1,95,1,95,1,95,1,95,1,96,5,96,1298,8,96,10,96,12,96,1301,
-        9,96,1,96,1,96,1,96,1,96,3,96,1307,8,96,1,96,1,96,1,97,5,97,1312,
-        8,97,10,97,12,97,1315,9,97,1,97,1,97,1,97,1,97,1,97,1,97,4,97,1323,
-        8,97,11,97,12,97,1324,1,97,1,97,1,97,1,97,1,97,1,97,1,98,4,98,1334,
-        8,98,11,98,12,98,1335,1,98,1,98,1,99,1,99,1,99,1,100,1,100,1,100,
-        1,101,1,101,1,101,1,101,1,102,1,102,5,102,1352,8,102,10,102,12,102,
-        1355,9,102,1,102,1,102,1,103,1,103,1,103,1,103,1,103,1,103,4,103,
-        1365,8,103,11,103,12,103,1366,1,104,1,104,1,105,1,105,1,106,4,106,
-        1374,8,106,11,106,12,106,1375,1,106,1,106,1,107,1,107,1,108,1,108,
-        1,108,1,108,1,108,1,108,1,108,1,109,1,109,1,109,1,109,1,109,1,109,
-        1,109,1,110,1,110,1,110,1,110,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,112,1,112,1,112,1,112,1,112,1,113,
-        1,113,1,113,1,113,1,113,1,113,1,114,1,114,1,114,1,114,1,114,1,115,
-        1,115,1,115,1,115,1,115,1,115,1,116,1,116,1,116,1,116,1,117,1,117,
-        1,117,1,117,1,117,1,117,4,117,1443,8,117,11,117,12,117,1444,1,118,
-        1,118,1,119,1,119,1,119,1,119,1,120,4,120,1454,8,120,11,120,12,120,
-        1455,1,120,1,120,1,121,1,121,1,121,1,121,1,121,1,121,1,121,4,121,
-        1467,8,121,11,121,12,121,1468,1,122,1,122,1,122,1,122,1,123,4,123,
-        1476,8,123,11,123,12,123,1477,1,123,1,123,1,124,1,124,1,124,1,124,
-        1,124,1,124,1,124,4,124,1489,8,124,11,124,12,124,1490,1,125,1,125,
-        1,125,1,125,1,126,4,126,1498,8,126,11,126,12,126,1499,1,126,1,126,
-        1,127,1,127,1,127,1,128,1,128,1,128,1,129,1,129,5,129,1512,8,129,
-        10,129,12,129,1515,9,129,1,129,1,129,1,129,1,129,1,130,1,130,1,131,
-        4,131,1524,8,131,11,131,12,131,1525,1,131,1,131,1,132,1,132,1,132,
-        1,132,1,132,1,132,1,133,1,133,1,133,1,133,1,133,1,133,1,134,1,134,
-        1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,135,1,135,1,136,1,136,
-        1,136,1,137,1,137,1,137,1,138,1,138,1,138,1,138,1,138,1,138,1,139,
-        1,139,1,139,1,139,1,140,1,140,1,140,1,140,1,140,1,140,1,140,1,140,
-        1,140,1,141,1,141,5,141,1580,8,141,10,141,12,141,1583,9,141,1,141,
-        1,141,1,142,1,142,1,142,1,142,1,143,4,143,1592,8,143,11,143,12,143,
-        1593,1,143,1,143,1,144,1,144,1,145,1,145,1,145,1,145,1,145,1,145,
-        1,146,1,146,1,147,1,147,1,147,1,147,1,147,1,147,1,147,1,147,1,147,
-        1,148,1,148,1,148,1,148,1,148,1,149,1,149,1,149,1,149,1,150,4,150,
-        1627,8,150,11,150,12,150,1628,1,150,1,150,1,151,1,151,1,151,1,151,
-        1,151,1,151,1,151,4,151,1640,8,151,11,151,12,151,1641,1,152,1,152,
-        1,153,1,153,1,153,1,153,1,154,1,154,1,154,1,154,1,155,4,155,1655,
-        8,155,11,155,12,155,1656,1,155,1,155,1,156,1,156,1,156,1,156,1,156,
-        1,156,1,156,4,156,1668,8,156,11,156,12,156,1669,1,157,1,157,1,158,
-        1,158,1,158,1,158,1,159,1,159,1,159,1,159,1,160,1,160,1,160,1,160,
-        1,161,4,161,1687,8,161,11,161,12,161,1688,1,161,1,161,1,162,1,162,
-        1,163,1,163,1,163,1,163,1,164,1,164,1,164,1,164,1,164,1,164,1,164,
-        1,164,1,165,1,165,1,165,1,165,1,165,1,166,1,166,1,166,1,166,1,166,
-        1,167,1,167,1,167,1,167,1,168,1,168,1,168,1,168,1,168,1,168,1,168,
-        1,168,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,170,
-        1,170,1,170,1,170,1,170,1,170,1,170,1,170,1,171,1,171,1,171,1,171,
-        1,171,1,171,1,171,1,171,1,171,1,171,1,171,1,172,1,172,1,172,1,172,
-        1,172,1,173,1,173,1,173,1,173,1,173,1,173,1,173,1,173,1,174,1,174,
-        1,174,1,174,1,174,1,175,1,175,1,175,1,175,1,175,1,175,1,176,1,176,
-        1,176,1,176,1,176,1,176,1,176,1,177,1,177,1,177,1,177,1,177,1,177,
-        1,178,1,178,1,178,1,178,1,178,1,178,1,179,1,179,1,179,1,179,1,179,
-        1,179,1,180,1,180,1,180,1,180,1,181,1,181,1,181,1,181,1,182,1,182,
-        1,182,1,182,1,182,1,182,1,182,1,183,1,183,1,183,1,183,1,183,1,183,
-        1,183,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,185,1,185,
-        1,185,1,185,1,185,1,185,1,185,1,185,1,185,1,186,1,186,1,187,4,187,
-        1848,8,187,11,187,12,187,1849,1,187,1,187,1,188,1,188,1,189,1,189,
-        1,189,1,189,1,190,1,190,1,190,1,190,1,190,1,190,1,190,4,190,1867,
-        8,190,11,190,12,190,1868,1,191,4,191,1872,8,191,11,191,12,191,1873,
-        1,191,1,191,1,192,1,192,1,193,1,193,1,194,1,194,1,194,1,194,1,195,
-        1,195,1,195,1,195,1,195,1,195,1,195,1,196,1,196,1,196,1,196,1,196,
-        1,197,1,197,1,197,1,197,1,198,1,198,1,198,1,198,1,198,1,198,1,199,
-        1,199,1,199,1,199,1,199,1,200,1,200,1,200,1,200,1,200,1,200,1,200,
-        1,200,1,200,1,201,1,201,1,201,1,201,1,201,1,201,1,202,1,202,1,202,
-        1,202,1,202,1,202,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,
-        1,203,1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,204,
-        1,204,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,206,1,206,1,206,
-        1,206,1,206,1,206,1,206,1,206,1,206,1,206,1,206,1,207,1,207,1,207,
-        1,208,1,208,1,208,1,208,1,209,1,209,1,209,1,210,1,210,1,210,1,210,
-        1,210,1,210,4,210,1988,8,210,11,210,12,210,1989,1,211,4,211,1993,
-        8,211,11,211,12,211,1994,1,211,1,211,1,212,1,212,1,213,1,213,1,213,
-        1,214,1,214,1,214,1,214,1,215,1,215,1,215,1,215,1,216,1,216,1,216,
-        1,216,1,216,1,216,1,217,1,217,1,217,1,217,1,217,1,218,1,218,1,218,
-        1,218,1,218,1,218,1,218,1,219,1,219,1,219,1,219,1,219,1,219,1,219,
-        1,219,1,219,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,
-        1,220,1,220,1,221,1,221,1,221,1,221,1,221,1,222,1,222,1,222,1,222,
-        1,222,1,222,1,222,1,223,1,223,1,223,1,223,1,223,1,223,1,223,1,223,
-        1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,225,
-        1,225,1,225,1,225,1,225,1,226,1,226,1,226,1,226,1,226,1,226,1,226,
-        1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,228,1,228,1,228,1,228,
-        1,228,1,228,1,228,1,228,1,229,1,229,1,229,1,229,1,229,1,229,1,229,
-        1,229,1,229,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,
-        1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,232,1,232,
-        1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,233,1,233,
-        1,233,1,233,1,233,1,233,1,234,1,234,1,234,1,234,1,234,1,234,1,234,
-        1,234,1,234,1,234,1,235,1,235,1,235,1,235,1,235,1,235,1,235,1,235,
-        1,235,1,236,1,236,1,236,1,236,1,236,1,237,1,237,1,237,1,237,1,237,
-        1,237,1,237,1,237,1,237,1,237,1,238,1,238,1,238,1,238,1,239,1,239,
-        1,239,1,239,1,239,1,239,1,240,1,240,1,240,1,240,1,240,1,240,1,240,
-        1,240,1,241,1,241,1,241,1,241,1,241,1,242,1,242,1,242,1,242,1,242,
-        1,242,4,242,2214,8,242,11,242,12,242,2215,1,243,4,243,2219,8,243,
-        11,243,12,243,2220,1,243,1,243,1,244,1,244,1,244,1,244,1,245,1,245,
-        1,245,1,245,1,246,1,246,1,246,1,246,1,246,1,246,1,246,1,246,1,246,
-        1,247,1,247,1,247,1,247,1,248,1,248,1,248,1,248,1,248,1,248,1,248,
-        1,249,1,249,1,249,1,249,1,249,1,250,1,250,1,250,1,250,1,250,1,250,
-        1,250,1,250,1,250,3,250,2267,8,250,1,251,1,251,1,251,1,251,1,251,
-        1,251,1,251,1,251,1,251,1,252,1,252,1,252,1,252,1,252,1,253,1,253,
-        1,254,1,254,1,255,1,255,1,255,1,255,1,256,1,256,1,256,1,256,1,256,
-        1,256,1,256,1,256,1,257,1,257,1,257,1,258,1,258,1,258,1,258,1,258,
-        1,258,4,258,2308,8,258,11,258,12,258,2309,1,259,4,259,2313,8,259,
-        11,259,12,259,2314,1,259,1,259,1,260,1,260,1,261,5,261,2322,8,261,
-        10,261,12,261,2325,9,261,1,261,4,261,2328,8,261,11,261,12,261,2329,
-        1,261,1,261,1,262,4,262,2335,8,262,11,262,12,262,2336,1,262,1,262,
-        1,263,4,263,2342,8,263,11,263,12,263,2343,1,264,1,264,1,264,1,264,
-        1,265,1,265,1,266,4,266,2353,8,266,11,266,12,266,2354,1,266,1,266,
-        1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,
-        1,267,1,267,1,267,1,267,1,268,1,268,1,268,1,268,1,268,1,268,1,268,
-        1,268,1,269,1,269,1,269,1,269,1,269,1,269,1,269,1,270,1,270,1,270,
-        1,270,1,270,1,271,1,271,1,272,1,272,1,272,1,272,1,272,1,272,1,273,
-        1,273,1,273,1,273,1,273,1,274,1,274,1,274,1,274,1,274,1,274,1,274,
-        1,275,1,275,1,275,1,275,1,275,1,276,1,276,1,276,1,277,1,277,1,277,
-        1,277,1,278,1,278,1,278,1,278,1,278,4,278,2431,8,278,11,278,12,278,
-        2432,1,279,1,279,1,279,1,279,1,280,1,280,1,281,4,281,2442,8,281,
-        11,281,12,281,2443,1,281,1,281,1,282,1,282,1,282,1,282,1,282,4,282,
-        2453,8,282,11,282,12,282,2454,1,283,1,283,1,283,1,283,1,284,1,284,
-        1,285,4,285,2464,8,285,11,285,12,285,2465,1,285,1,285,1,286,1,286,
-        1,286,1,286,1,286,1,286,4,286,2476,8,286,11,286,12,286,2477,1,287,
-        1,287,1,287,1,287,1,288,1,288,14,614,627,642,740,982,1057,1161,1176,
-        1299,1313,1353,1513,1581,2323,0,289,29,1,31,2,33,3,35,4,37,5,39,
-        6,41,7,43,8,45,9,47,10,49,11,51,12,53,13,55,14,57,15,59,16,61,17,
-        63,18,65,19,67,20,69,21,71,22,73,23,75,24,77,25,79,26,81,27,83,28,
-        85,29,87,30,89,31,91,32,93,33,95,34,97,35,99,36,101,37,103,38,105,
-        39,107,40,109,41,111,42,113,43,115,44,117,45,119,46,121,0,123,0,
-        125,0,127,0,129,0,131,0,133,0,135,0,137,0,139,47,141,0,143,48,145,
-        49,147,50,149,51,151,52,153,0,155,53,157,0,159,54,161,55,163,56,
-        165,57,167,58,169,59,171,0,173,0,175,60,177,61,179,62,181,63,183,
-        0,185,0,187,0,189,64,191,65,193,66,195,67,197,68,199,69,201,70,203,
-        71,205,72,207,73,209,74,211,75,213,76,215,77,217,78,219,79,221,80,
-        223,81,225,82,227,83,229,84,231,85,233,86,235,87,237,88,239,89,241,
-        90,243,91,245,92,247,93,249,94,251,95,253,96,255,97,257,98,259,99,
-        261,100,263,101,265,102,267,103,269,104,271,105,273,106,275,107,
-        277,108,279,109,281,110,283,111,285,112,287,113,289,114,291,115,
-        293,116,295,117,297,118,299,119,301,120,303,121,305,122,307,123,
-        309,124,311,125,313,126,315,127,317,128,319,129,321,130,323,131,
-        325,132,327,133,329,134,331,135,333,136,335,137,337,138,339,139,
-        341,140,343,141,345,142,347,143,349,144,351,145,353,146,355,147,
-        357,148,359,149,361,150,363,151,365,152,367,153,369,154,371,155,
-        373,156,375,157,377,158,379,159,381,160,383,161,385,162,387,163,
-        389,164,391,165,393,166,395,167,397,168,399,169,401,170,403,171,
-        405,172,407,173,409,174,411,175,413,176,415,177,417,178,419,179,
-        421,180,423,181,425,182,427,183,429,184,431,185,433,186,435,187,
-        437,188,439,189,441,190,443,191,445,192,447,193,449,194,451,195,
-        453,196,455,197,457,198,459,199,461,200,463,201,465,202,467,203,
-        469,204,471,205,473,206,475,207,477,208,479,209,481,210,483,211,
-        485,212,487,213,489,214,491,215,493,216,495,217,497,218,499,219,
-        501,220,503,221,505,222,507,223,509,224,511,225,513,226,515,227,
-        517,228,519,229,521,230,523,231,525,232,527,233,529,234,531,235,
-        533,236,535,237,537,238,539,239,541,240,543,241,545,242,547,243,
-        549,244,551,245,553,246,555,247,557,248,559,249,561,250,563,251,
-        565,252,567,253,569,254,571,255,573,256,575,257,577,258,579,259,
-        581,260,583,261,585,262,587,263,589,264,591,265,593,266,595,267,
-        597,268,599,269,601,270,603,271,605,272,29,0,1,2,3,4,5,6,7,8,9,10,
-        11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,42,2,0,83,
-        83,115,115,2,0,69,69,101,101,2,0,84,84,116,116,2,0,73,73,105,105,
-        2,0,79,79,111,111,2,0,78,78,110,110,2,0,9,9,32,32,2,0,88,88,120,
-        120,2,0,81,81,113,113,2,0,85,85,117,117,2,0,76,76,108,108,2,0,80,
-        80,112,112,2,0,67,67,99,99,2,0,72,72,104,104,2,0,65,65,97,97,2,0,
-        82,82,114,114,2,0,68,68,100,100,2,0,70,70,102,102,2,0,87,87,119,
-        119,2,0,86,86,118,118,2,0,74,74,106,106,2,0,66,66,98,98,2,0,77,77,
-        109,109,2,0,65,90,97,122,3,0,45,46,95,95,126,126,5,0,33,33,36,36,
-        38,38,40,43,61,61,1,0,48,57,3,0,48,57,65,70,97,102,1,0,34,34,1,0,
-        39,39,2,0,71,71,103,103,2,0,10,10,13,13,2,0,60,60,62,62,2,0,89,89,
-        121,121,7,0,37,37,47,47,58,58,64,64,92,92,123,123,125,125,3,0,47,
-        47,58,58,92,92,4,0,32,32,47,47,58,58,92,92,2,0,75,75,107,107,6,0,
-        44,44,47,47,58,58,64,64,92,92,123,125,5,0,47,47,58,58,92,92,123,
-        123,125,125,2,0,9,10,32,32,3,0,48,57,65,90,97,122,2629,0,29,1,0,
-        0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,
-        0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,
-        0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,
-        0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,
-        0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,
-        0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,
-        0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,
-        0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,
-        1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,
-        0,119,1,0,0,0,1,139,1,0,0,0,1,141,1,0,0,0,1,143,1,0,0,0,1,145,1,
-        0,0,0,1,147,1,0,0,0,1,149,1,0,0,0,2,151,1,0,0,0,2,153,1,0,0,0,2,
-        155,1,0,0,0,2,157,1,0,0,0,3,159,1,0,0,0,3,161,1,0,0,0,3,163,1,0,
-        0,0,3,165,1,0,0,0,4,167,1,0,0,0,4,169,1,0,0,0,5,171,1,0,0,0,5,173,
-        1,0,0,0,5,175,1,0,0,0,5,177,1,0,0,0,5,179,1,0,0,0,5,181,1,0,0,0,
-        5,183,1,0,0,0,5,185,1,0,0,0,5,187,1,0,0,0,6,189,1,0,0,0,6,191,1,
-        0,0,0,6,193,1,0,0,0,6,195,1,0,0,0,6,197,1,0,0,0,6,199,1,0,0,0,6,
-        201,1,0,0,0,6,203,1,0,0,0,7,205,1,0,0,0,7,207,1,0,0,0,7,209,1,0,
-        0,0,7,211,1,0,0,0,7,213,1,0,0,0,7,215,1,0,0,0,7,217,1,0,0,0,7,219,
-        1,0,0,0,8,221,1,0,0,0,9,223,1,0,0,0,10,225,1,0,0,0,10,227,1,0,0,
-        0,10,229,1,0,0,0,10,231,1,0,0,0,10,233,1,0,0,0,10,235,1,0,0,0,10,
-        237,1,0,0,0,10,239,1,0,0,0,11,241,1,0,0,0,11,243,1,0,0,0,11,245,
-        1,0,0,0,11,247,1,0,0,0,11,249,1,0,0,0,11,251,1,0,0,0,11,253,1,0,
-        0,0,11,255,1,0,0,0,11,257,1,0,0,0,11,259,1,0,0,0,11,261,1,0,0,0,
-        11,263,1,0,0,0,11,265,1,0,0,0,11,267,1,0,0,0,12,269,1,0,0,0,12,271,
-        1,0,0,0,12,273,1,0,0,0,13,275,1,0,0,0,13,277,1,0,0,0,13,279,1,0,
-        0,0,14,281,1,0,0,0,14,283,1,0,0,0,14,285,1,0,0,0,14,287,1,0,0,0,
-        15,289,1,0,0,0,15,291,1,0,0,0,15,293,1,0,0,0,15,295,1,0,0,0,15,297,
-        1,0,0,0,15,299,1,0,0,0,15,301,1,0,0,0,15,303,1,0,0,0,15,305,1,0,
-        0,0,15,307,1,0,0,0,15,309,1,0,0,0,15,311,1,0,0,0,15,313,1,0,0,0,
-        16,315,1,0,0,0,16,317,1,0,0,0,16,319,1,0,0,0,16,321,1,0,0,0,16,323,
-        1,0,0,0,16,325,1,0,0,0,16,327,1,0,0,0,17,329,1,0,0,0,17,331,1,0,
-        0,0,17,333,1,0,0,0,17,335,1,0,0,0,17,337,1,0,0,0,18,339,1,0,0,0,
-        18,341,1,0,0,0,18,343,1,0,0,0,18,345,1,0,0,0,19,347,1,0,0,0,19,349,
-        1,0,0,0,19,351,1,0,0,0,19,353,1,0,0,0,19,355,1,0,0,0,20,357,1,0,
-        0,0,20,359,1,0,0,0,20,361,1,0,0,0,20,363,1,0,0,0,20,365,1,0,0,0,
-        20,367,1,0,0,0,20,369,1,0,0,0,20,371,1,0,0,0,20,373,1,0,0,0,20,375,
-        1,0,0,0,20,377,1,0,0,0,20,379,1,0,0,0,20,381,1,0,0,0,20,383,1,0,
-        0,0,20,385,1,0,0,0,20,387,1,0,0,0,20,389,1,0,0,0,20,391,1,0,0,0,
-        20,393,1,0,0,0,20,395,1,0,0,0,20,397,1,0,0,0,20,399,1,0,0,0,20,401,
-        1,0,0,0,20,403,1,0,0,0,20,405,1,0,0,0,20,407,1,0,0,0,20,409,1,0,
-        0,0,21,411,1,0,0,0,21,413,1,0,0,0,21,415,1,0,0,0,21,417,1,0,0,0,
-        21,419,1,0,0,0,21,421,1,0,0,0,21,423,1,0,0,0,21,425,1,0,0,0,21,427,
-        1,0,0,0,21,429,1,0,0,0,21,431,1,0,0,0,21,433,1,0,0,0,21,435,1,0,
-        0,0,21,437,1,0,0,0,21,439,1,0,0,0,21,441,1,0,0,0,21,443,1,0,0,0,
-        21,445,1,0,0,0,21,447,1,0,0,0,21,449,1,0,0,0,22,451,1,0,0,0,22,453,
-        1,0,0,0,22,455,1,0,0,0,22,457,1,0,0,0,22,459,1,0,0,0,22,461,1,0,
-        0,0,22,463,1,0,0,0,22,465,1,0,0,0,22,467,1,0,0,0,22,469,1,0,0,0,
-        22,471,1,0,0,0,22,473,1,0,0,0,22,475,1,0,0,0,22,477,1,0,0,0,22,479,
-        1,0,0,0,22,481,1,0,0,0,22,483,1,0,0,0,22,485,1,0,0,0,22,487,1,0,
-        0,0,22,489,1,0,0,0,22,491,1,0,0,0,22,493,1,0,0,0,22,495,1,0,0,0,
-        22,497,1,0,0,0,22,499,1,0,0,0,22,501,1,0,0,0,22,503,1,0,0,0,22,505,
-        1,0,0,0,22,507,1,0,0,0,22,509,1,0,0,0,22,511,1,0,0,0,22,513,1,0,
-        0,0,23,515,1,0,0,0,23,517,1,0,0,0,23,519,1,0,0,0,23,521,1,0,0,0,
-        23,523,1,0,0,0,23,525,1,0,0,0,23,527,1,0,0,0,23,529,1,0,0,0,23,531,
-        1,0,0,0,23,533,1,0,0,0,23,535,1,0,0,0,23,537,1,0,0,0,23,539,1,0,
-        0,0,23,541,1,0,0,0,23,543,1,0,0,0,23,545,1,0,0,0,24,547,1,0,0,0,
-        24,549,1,0,0,0,24,551,1,0,0,0,25,553,1,0,0,0,25,555,1,0,0,0,25,557,
-        1,0,0,0,25,559,1,0,0,0,26,561,1,0,0,0,26,563,1,0,0,0,26,565,1,0,
-        0,0,26,567,1,0,0,0,26,569,1,0,0,0,26,571,1,0,0,0,26,573,1,0,0,0,
-        26,575,1,0,0,0,26,577,1,0,0,0,26,579,1,0,0,0,26,581,1,0,0,0,26,583,
-        1,0,0,0,26,585,1,0,0,0,26,587,1,0,0,0,26,589,1,0,0,0,27,591,1,0,
-        0,0,27,593,1,0,0,0,27,595,1,0,0,0,27,597,1,0,0,0,28,599,1,0,0,0,
-        28,601,1,0,0,0,28,603,1,0,0,0,28,605,1,0,0,0,29,607,1,0,0,0,31,621,
-        1,0,0,0,33,636,1,0,0,0,35,651,1,0,0,0,37,657,1,0,0,0,39,668,1,0,
-        0,0,41,670,1,0,0,0,43,672,1,0,0,0,45,674,1,0,0,0,47,676,1,0,0,0,
-        49,678,1,0,0,0,51,680,1,0,0,0,53,682,1,0,0,0,55,684,1,0,0,0,57,686,
-        1,0,0,0,59,688,1,0,0,0,61,690,1,0,0,0,63,692,1,0,0,0,65,694,1,0,
-        0,0,67,697,1,0,0,0,69,703,1,0,0,0,71,709,1,0,0,0,73,715,1,0,0,0,
-        75,724,1,0,0,0,77,731,1,0,0,0,79,749,1,0,0,0,81,756,1,0,0,0,83,766,
-        1,0,0,0,85,775,1,0,0,0,87,783,1,0,0,0,89,791,1,0,0,0,91,799,1,0,
-        0,0,93,805,1,0,0,0,95,812,1,0,0,0,97,819,1,0,0,0,99,828,1,0,0,0,
-        101,836,1,0,0,0,103,848,1,0,0,0,105,855,1,0,0,0,107,862,1,0,0,0,
-        109,873,1,0,0,0,111,881,1,0,0,0,113,892,1,0,0,0,115,901,1,0,0,0,
-        117,906,1,0,0,0,119,922,1,0,0,0,121,929,1,0,0,0,123,931,1,0,0,0,
-        125,933,1,0,0,0,127,937,1,0,0,0,129,939,1,0,0,0,131,941,1,0,0,0,
-        133,943,1,0,0,0,135,945,1,0,0,0,137,959,1,0,0,0,139,976,1,0,0,0,
-        141,989,1,0,0,0,143,993,1,0,0,0,145,996,1,0,0,0,147,1034,1,0,0,0,
-        149,1038,1,0,0,0,151,1045,1,0,0,0,153,1049,1,0,0,0,155,1057,1,0,
-        0,0,157,1084,1,0,0,0,159,1089,1,0,0,0,161,1102,1,0,0,0,163,1106,
-        1,0,0,0,165,1111,1,0,0,0,167,1119,1,0,0,0,169,1123,1,0,0,0,171,1128,
-        1,0,0,0,173,1134,1,0,0,0,175,1138,1,0,0,0,177,1147,1,0,0,0,179,1155,
-        1,0,0,0,181,1171,1,0,0,0,183,1181,1,0,0,0,185,1188,1,0,0,0,187,1192,
-        1,0,0,0,189,1197,1,0,0,0,191,1203,1,0,0,0,193,1209,1,0,0,0,195,1222,
-        1,0,0,0,197,1225,1,0,0,0,199,1236,1,0,0,0,201,1240,1,0,0,0,203,1242,
-        1,0,0,0,205,1247,1,0,0,0,207,1253,1,0,0,0,209,1258,1,0,0,0,211,1266,
-        1,0,0,0,213,1274,1,0,0,0,215,1286,1,0,0,0,217,1290,1,0,0,0,219,1292,
-        1,0,0,0,221,1299,1,0,0,0,223,1313,1,0,0,0,225,1333,1,0,0,0,227,1339,
-        1,0,0,0,229,1342,1,0,0,0,231,1345,1,0,0,0,233,1349,1,0,0,0,235,1364,
-        1,0,0,0,237,1368,1,0,0,0,239,1370,1,0,0,0,241,1373,1,0,0,0,243,1379,
-        1,0,0,0,245,1381,1,0,0,0,247,1388,1,0,0,0,249,1395,1,0,0,0,251,1399,
-        1,0,0,0,253,1410,1,0,0,0,255,1415,1,0,0,0,257,1421,1,0,0,0,259,1426,
-        1,0,0,0,261,1432,1,0,0,0,263,1442,1,0,0,0,265,1446,1,0,0,0,267,1448,
-        1,0,0,0,269,1453,1,0,0,0,271,1466,1,0,0,0,273,1470,1,0,0,0,275,1475,
-        1,0,0,0,277,1488,1,0,0,0,279,1492,1,0,0,0,281,1497,1,0,0,0,283,1503,
-        1,0,0,0,285,1506,1,0,0,0,287,1509,1,0,0,0,289,1520,1,0,0,0,291,1523,
-        1,0,0,0,293,1529,1,0,0,0,295,1535,1,0,0,0,297,1541,1,0,0,0,299,1550,
-        1,0,0,0,301,1552,1,0,0,0,303,1555,1,0,0,0,305,1558,1,0,0,0,307,1564,
-        1,0,0,0,309,1568,1,0,0,0,311,1577,1,0,0,0,313,1586,1,0,0,0,315,1591,
-        1,0,0,0,317,1597,1,0,0,0,319,1599,1,0,0,0,321,1605,1,0,0,0,323,1607,
-        1,0,0,0,325,1616,1,0,0,0,327,1621,1,0,0,0,329,1626,1,0,0,0,331,1639,
-        1,0,0,0,333,1643,1,0,0,0,335,1645,1,0,0,0,337,1649,1,0,0,0,339,1654,
-        1,0,0,0,341,1667,1,0,0,0,343,1671,1,0,0,0,345,1673,1,0,0,0,347,1677,
-        1,0,0,0,349,1681,1,0,0,0,351,1686,1,0,0,0,353,1692,1,0,0,0,355,1694,
-        1,0,0,0,357,1698,1,0,0,0,359,1706,1,0,0,0,361,1711,1,0,0,0,363,1716,
-        1,0,0,0,365,1720,1,0,0,0,367,1728,1,0,0,0,369,1737,1,0,0,0,371,1745,
-        1,0,0,0,373,1756,1,0,0,0,375,1761,1,0,0,0,377,1769,1,0,0,0,379,1774,
-        1,0,0,0,381,1780,1,0,0,0,383,1787,1,0,0,0,385,1793,1,0,0,0,387,1799,
-        1,0,0,0,389,1805,1,0,0,0,391,1809,1,0,0,0,393,1813,1,0,0,0,395,1820,
-        1,0,0,0,397,1827,1,0,0,0,399,1835,1,0,0,0,401,1844,1,0,0,0,403,1847,
-        1,0,0,0,405,1853,1,0,0,0,407,1855,1,0,0,0,409,1866,1,0,0,0,411,1871,
-        1,0,0,0,413,1877,1,0,0,0,415,1879,1,0,0,0,417,1881,1,0,0,0,419,1885,
-        1,0,0,0,421,1892,1,0,0,0,423,1897,1,0,0,0,425,1901,1,0,0,0,427,1907,
-        1,0,0,0,429,1912,1,0,0,0,431,1921,1,0,0,0,433,1927,1,0,0,0,435,1933,
-        1,0,0,0,437,1942,1,0,0,0,439,1953,1,0,0,0,441,1960,1,0,0,0,443,1971,
-        1,0,0,0,445,1974,1,0,0,0,447,1978,1,0,0,0,449,1987,1,0,0,0,451,1992,
-        1,0,0,0,453,1998,1,0,0,0,455,2000,1,0,0,0,457,2003,1,0,0,0,459,2007,
-        1,0,0,0,461,2011,1,0,0,0,463,2017,1,0,0,0,465,2022,1,0,0,0,467,2029,
-        1,0,0,0,469,2038,1,0,0,0,471,2049,1,0,0,0,473,2054,1,0,0,0,475,2061,
-        1,0,0,0,477,2069,1,0,0,0,479,2079,1,0,0,0,481,2084,1,0,0,0,483,2091,
-        1,0,0,0,485,2098,1,0,0,0,487,2106,1,0,0,0,489,2115,1,0,0,0,491,2124,
-        1,0,0,0,493,2133,1,0,0,0,495,2144,1,0,0,0,497,2150,1,0,0,0,499,2160,
-        1,0,0,0,501,2169,1,0,0,0,503,2174,1,0,0,0,505,2184,1,0,0,0,507,2188,
-        1,0,0,0,509,2194,1,0,0,0,511,2202,1,0,0,0,513,2213,1,0,0,0,515,2218,
-        1,0,0,0,517,2224,1,0,0,0,519,2228,1,0,0,0,521,2232,1,0,0,0,523,2241,
-        1,0,0,0,525,2245,1,0,0,0,527,2252,1,0,0,0,529,2266,1,0,0,0,531,2268,
-        1,0,0,0,533,2277,1,0,0,0,535,2282,1,0,0,0,537,2284,1,0,0,0,539,2286,
-        1,0,0,0,541,2290,1,0,0,0,543,2298,1,0,0,0,545,2307,1,0,0,0,547,2312,
-        1,0,0,0,549,2318,1,0,0,0,551,2327,1,0,0,0,553,2334,1,0,0,0,555,2341,
-        1,0,0,0,557,2345,1,0,0,0,559,2349,1,0,0,0,561,2352,1,0,0,0,563,2358,
-        1,0,0,0,565,2373,1,0,0,0,567,2381,1,0,0,0,569,2388,1,0,0,0,571,2393,
-        1,0,0,0,573,2395,1,0,0,0,575,2401,1,0,0,0,577,2406,1,0,0,0,579,2413,
-        1,0,0,0,581,2418,1,0,0,0,583,2421,1,0,0,0,585,2430,1,0,0,0,587,2434,
-        1,0,0,0,589,2438,1,0,0,0,591,2441,1,0,0,0,593,2452,1,0,0,0,595,2456,
-        1,0,0,0,597,2460,1,0,0,0,599,2463,1,0,0,0,601,2475,1,0,0,0,603,2479,
-        1,0,0,0,605,2483,1,0,0,0,607,608,5,35,0,0,608,609,5,35,0,0,609,610,
-        5,35,0,0,610,614,1,0,0,0,611,613,9,0,0,0,612,611,1,0,0,0,613,616,
-        1,0,0,0,614,615,1,0,0,0,614,612,1,0,0,0,615,617,1,0,0,0,616,614,
-        1,0,0,0,617,618,3,39,5,0,618,619,1,0,0,0,619,620,6,0,0,0,620,30,
-        1,0,0,0,621,622,5,47,0,0,622,623,5,47,0,0,623,627,1,0,0,0,624,626,
-        9,0,0,0,625,624,1,0,0,0,626,629,1,0,0,0,627,628,1,0,0,0,627,625,
-        1,0,0,0,628,632,1,0,0,0,629,627,1,0,0,0,630,633,3,39,5,0,631,633,
-        5,0,0,1,632,630,1,0,0,0,632,631,1,0,0,0,633,634,1,0,0,0,634,635,
-        6,1,1,0,635,32,1,0,0,0,636,637,5,45,0,0,637,638,5,45,0,0,638,642,
-        1,0,0,0,639,641,9,0,0,0,640,639,1,0,0,0,641,644,1,0,0,0,642,643,
-        1,0,0,0,642,640,1,0,0,0,643,647,1,0,0,0,644,642,1,0,0,0,645,648,
-        3,39,5,0,646,648,5,0,0,1,647,645,1,0,0,0,647,646,1,0,0,0,648,649,
-        1,0,0,0,649,650,6,2,1,0,650,34,1,0,0,0,651,652,7,0,0,0,652,653,7,
-        1,0,0,653,654,7,2,0,0,654,655,1,0,0,0,655,656,6,3,2,0,656,36,1,0,
-        0,0,657,658,5,95,0,0,658,659,7,0,0,0,659,660,7,1,0,0,660,661,7,0,
-        0,0,661,662,7,0,0,0,662,663,7,3,0,0,663,664,7,4,0,0,664,665,7,5,
-        0,0,665,666,1,0,0,0,666,667,6,4,3,0,667,38,1,0,0,0,668,669,5,10,
-        0,0,669,40,1,0,0,0,670,671,5,44,0,0,671,42,1,0,0,0,672,673,5,59,
-        0,0,673,44,1,0,0,0,674,675,5,58,0,0,675,46,1,0,0,0,676,677,5,64,
-        0,0,677,48,1,0,0,0,678,679,5,46,0,0,679,50,1,0,0,0,680,681,5,47,
-        0,0,681,52,1,0,0,0,682,683,5,40,0,0,683,54,1,0,0,0,684,685,5,41,
-        0,0,685,56,1,0,0,0,686,687,5,91,0,0,687,58,1,0,0,0,688,689,5,93,
-        0,0,689,60,1,0,0,0,690,691,5,34,0,0,691,62,1,0,0,0,692,693,5,39,
-        0,0,693,64,1,0,0,0,694,695,5,92,0,0,695,66,1,0,0,0,696,698,7,6,0,
-        0,697,696,1,0,0,0,698,699,1,0,0,0,699,697,1,0,0,0,699,700,1,0,0,
-        0,700,701,1,0,0,0,701,702,6,19,1,0,702,68,1,0,0,0,703,704,5,95,0,
-        0,704,705,7,1,0,0,705,706,7,7,0,0,706,707,7,3,0,0,707,708,7,2,0,
-        0,708,70,1,0,0,0,709,710,5,95,0,0,710,711,7,8,0,0,711,712,7,9,0,
-        0,712,713,7,3,0,0,713,714,7,2,0,0,714,72,1,0,0,0,715,716,5,95,0,
-        0,716,717,7,0,0,0,717,718,7,10,0,0,718,719,7,1,0,0,719,720,7,1,0,
-        0,720,721,7,11,0,0,721,722,1,0,0,0,722,723,6,22,4,0,723,74,1,0,0,
-        0,724,725,5,95,0,0,725,726,7,9,0,0,726,727,7,0,0,0,727,728,7,1,0,
-        0,728,729,1,0,0,0,729,730,6,23,5,0,730,76,1,0,0,0,731,732,5,95,0,
-        0,732,733,7,1,0,0,733,734,7,12,0,0,734,735,7,13,0,0,735,736,7,4,
-        0,0,736,740,1,0,0,0,737,739,9,0,0,0,738,737,1,0,0,0,739,742,1,0,
-        0,0,740,741,1,0,0,0,740,738,1,0,0,0,741,745,1,0,0,0,742,740,1,0,
-        0,0,743,746,3,39,5,0,744,746,5,0,0,1,745,743,1,0,0,0,745,744,1,0,
-        0,0,746,747,1,0,0,0,747,748,6,24,6,0,748,78,1,0,0,0,749,750,5,62,
-        0,0,750,751,5,32,0,0,751,752,5,123,0,0,752,753,5,37,0,0,753,754,
-        1,0,0,0,754,755,6,25,7,0,755,80,1,0,0,0,756,757,5,95,0,0,757,758,
-        7,14,0,0,758,759,7,0,0,0,759,760,7,0,0,0,760,761,7,1,0,0,761,762,
-        7,15,0,0,762,763,7,2,0,0,763,764,1,0,0,0,764,765,6,26,8,0,765,82,
-        1,0,0,0,766,767,5,95,0,0,767,768,7,0,0,0,768,769,7,2,0,0,769,770,
-        7,14,0,0,770,771,7,15,0,0,771,772,7,2,0,0,772,773,1,0,0,0,773,774,
-        6,27,9,0,774,84,1,0,0,0,775,776,5,95,0,0,776,777,7,10,0,0,777,778,
-        7,4,0,0,778,779,7,14,0,0,779,780,7,16,0,0,780,781,1,0,0,0,781,782,
-        6,28,10,0,782,86,1,0,0,0,783,784,5,95,0,0,784,785,7,13,0,0,785,786,
-        7,4,0,0,786,787,7,0,0,0,787,788,7,2,0,0,788,789,1,0,0,0,789,790,
-        6,29,11,0,790,88,1,0,0,0,791,792,5,95,0,0,792,793,7,13,0,0,793,794,
-        7,1,0,0,794,795,7,10,0,0,795,796,7,11,0,0,796,797,1,0,0,0,797,798,
-        6,30,12,0,798,90,1,0,0,0,799,800,5,95,0,0,800,801,7,3,0,0,801,802,
-        7,17,0,0,802,803,1,0,0,0,803,804,6,31,13,0,804,92,1,0,0,0,805,806,
-        5,95,0,0,806,807,7,1,0,0,807,808,7,5,0,0,808,809,7,16,0,0,809,810,
-        7,3,0,0,810,811,7,17,0,0,811,94,1,0,0,0,812,813,5,95,0,0,813,814,
-        7,0,0,0,814,815,7,1,0,0,815,816,7,2,0,0,816,817,1,0,0,0,817,818,
-        6,33,14,0,818,96,1,0,0,0,819,820,5,95,0,0,820,821,7,0,0,0,821,822,
-        7,11,0,0,822,823,7,4,0,0,823,824,7,4,0,0,824,825,7,10,0,0,825,826,
-        1,0,0,0,826,827,6,34,15,0,827,98,1,0,0,0,828,829,5,95,0,0,829,830,
-        7,10,0,0,830,831,7,4,0,0,831,832,7,4,0,0,832,833,7,11,0,0,833,834,
-        1,0,0,0,834,835,6,35,16,0,835,100,1,0,0,0,836,837,5,95,0,0,837,838,
-        7,18,0,0,838,839,7,13,0,0,839,840,7,1,0,0,840,841,7,5,0,0,841,842,
-        7,1,0,0,842,843,7,19,0,0,843,844,7,1,0,0,844,845,7,15,0,0,845,846,
-        1,0,0,0,846,847,6,36,17,0,847,102,1,0,0,0,848,849,5,95,0,0,849,850,
-        7,0,0,0,850,851,7,0,0,0,851,852,7,13,0,0,852,853,1,0,0,0,853,854,
-        6,37,18,0,854,104,1,0,0,0,855,856,5,95,0,0,856,857,7,20,0,0,857,
-        858,7,4,0,0,858,859,7,21,0,0,859,860,1,0,0,0,860,861,6,38,19,0,861,
-        106,1,0,0,0,862,863,5,95,0,0,863,864,7,12,0,0,864,865,7,4,0,0,865,
-        866,7,22,0,0,866,867,7,11,0,0,867,868,7,14,0,0,868,869,7,15,0,0,
-        869,870,7,1,0,0,870,871,1,0,0,0,871,872,6,39,20,0,872,108,1,0,0,
-        0,873,874,5,95,0,0,874,875,7,16,0,0,875,876,7,14,0,0,876,877,7,2,
-        0,0,877,878,7,14,0,0,878,879,1,0,0,0,879,880,6,40,21,0,880,110,1,
-        0,0,0,881,882,5,95,0,0,882,883,7,22,0,0,883,884,7,4,0,0,884,885,
-        7,5,0,0,885,886,7,3,0,0,886,887,7,2,0,0,887,888,7,4,0,0,888,889,
-        7,15,0,0,889,890,1,0,0,0,890,891,6,41,22,0,891,112,1,0,0,0,892,894,
-        5,95,0,0,893,895,7,23,0,0,894,893,1,0,0,0,895,896,1,0,0,0,896,894,
-        1,0,0,0,896,897,1,0,0,0,897,898,1,0,0,0,898,899,6,42,23,0,899,114,
-        1,0,0,0,900,902,3,127,49,0,901,900,1,0,0,0,902,903,1,0,0,0,903,901,
-        1,0,0,0,903,904,1,0,0,0,904,116,1,0,0,0,905,907,3,127,49,0,906,905,
-        1,0,0,0,907,908,1,0,0,0,908,906,1,0,0,0,908,909,1,0,0,0,909,910,
-        1,0,0,0,910,912,5,46,0,0,911,913,3,127,49,0,912,911,1,0,0,0,913,
-        914,1,0,0,0,914,912,1,0,0,0,914,915,1,0,0,0,915,118,1,0,0,0,916,
-        923,3,133,52,0,917,923,3,121,46,0,918,923,3,123,47,0,919,923,3,125,
-        48,0,920,923,3,135,53,0,921,923,3,137,54,0,922,916,1,0,0,0,922,917,
-        1,0,0,0,922,918,1,0,0,0,922,919,1,0,0,0,922,920,1,0,0,0,922,921,
-        1,0,0,0,923,924,1,0,0,0,924,922,1,0,0,0,924,925,1,0,0,0,925,120,
-        1,0,0,0,926,930,3,129,50,0,927,930,3,127,49,0,928,930,7,24,0,0,929,
-        926,1,0,0,0,929,927,1,0,0,0,929,928,1,0,0,0,930,122,1,0,0,0,931,
-        932,7,25,0,0,932,124,1,0,0,0,933,934,5,37,0,0,934,935,3,131,51,0,
-        935,936,3,131,51,0,936,126,1,0,0,0,937,938,7,26,0,0,938,128,1,0,
-        0,0,939,940,7,23,0,0,940,130,1,0,0,0,941,942,7,27,0,0,942,132,1,
-        0,0,0,943,944,2,255,65535,0,944,134,1,0,0,0,945,954,5,34,0,0,946,
-        953,8,28,0,0,947,950,5,92,0,0,948,951,5,10,0,0,949,951,9,0,0,0,950,
-        948,1,0,0,0,950,949,1,0,0,0,951,953,1,0,0,0,952,946,1,0,0,0,952,
-        947,1,0,0,0,953,956,1,0,0,0,954,952,1,0,0,0,954,955,1,0,0,0,955,
-        957,1,0,0,0,956,954,1,0,0,0,957,958,5,34,0,0,958,136,1,0,0,0,959,
-        971,5,39,0,0,960,970,8,29,0,0,961,967,5,92,0,0,962,964,5,13,0,0,
-        963,962,1,0,0,0,963,964,1,0,0,0,964,965,1,0,0,0,965,968,5,10,0,0,
-        966,968,9,0,0,0,967,963,1,0,0,0,967,966,1,0,0,0,968,970,1,0,0,0,
-        969,960,1,0,0,0,969,961,1,0,0,0,970,973,1,0,0,0,971,969,1,0,0,0,
-        971,972,1,0,0,0,972,974,1,0,0,0,973,971,1,0,0,0,974,975,5,39,0,0,
-        975,138,1,0,0,0,976,977,5,47,0,0,977,978,5,47,0,0,978,982,1,0,0,
-        0,979,981,9,0,0,0,980,979,1,0,0,0,981,984,1,0,0,0,982,983,1,0,0,
-        0,982,980,1,0,0,0,983,985,1,0,0,0,984,982,1,0,0,0,985,986,3,39,5,
-        0,986,987,1,0,0,0,987,988,6,55,24,0,988,140,1,0,0,0,989,990,3,39,
-        5,0,990,991,1,0,0,0,991,992,6,56,25,0,992,142,1,0,0,0,993,994,5,
-        47,0,0,994,144,1,0,0,0,995,997,7,6,0,0,996,995,1,0,0,0,997,998,1,
-        0,0,0,998,996,1,0,0,0,998,999,1,0,0,0,999,1000,1,0,0,0,1000,1001,
-        6,58,1,0,1001,146,1,0,0,0,1002,1003,7,11,0,0,1003,1004,7,4,0,0,1004,
-        1005,7,0,0,0,1005,1035,7,2,0,0,1006,1007,7,30,0,0,1007,1008,7,1,
-        0,0,1008,1035,7,2,0,0,1009,1010,7,11,0,0,1010,1011,7,9,0,0,1011,
-        1035,7,2,0,0,1012,1013,7,13,0,0,1013,1014,7,1,0,0,1014,1015,7,14,
-        0,0,1015,1035,7,16,0,0,1016,1017,7,16,0,0,1017,1018,7,1,0,0,1018,
-        1019,7,10,0,0,1019,1020,7,1,0,0,1020,1021,7,2,0,0,1021,1035,7,1,
-        0,0,1022,1023,7,4,0,0,1023,1024,7,11,0,0,1024,1025,7,2,0,0,1025,
-        1026,7,3,0,0,1026,1027,7,4,0,0,1027,1028,7,5,0,0,1028,1035,7,0,0,
-        0,1029,1030,7,2,0,0,1030,1031,7,15,0,0,1031,1032,7,14,0,0,1032,1033,
-        7,12,0,0,1033,1035,7,1,0,0,1034,1002,1,0,0,0,1034,1006,1,0,0,0,1034,
-        1009,1,0,0,0,1034,1012,1,0,0,0,1034,1016,1,0,0,0,1034,1022,1,0,0,
-        0,1034,1029,1,0,0,0,1035,1036,1,0,0,0,1036,1037,6,59,26,0,1037,148,
-        1,0,0,0,1038,1039,5,35,0,0,1039,1040,5,35,0,0,1040,1041,5,35,0,0,
-        1041,1042,1,0,0,0,1042,1043,6,60,27,0,1043,150,1,0,0,0,1044,1046,
-        7,6,0,0,1045,1044,1,0,0,0,1046,1047,1,0,0,0,1047,1045,1,0,0,0,1047,
-        1048,1,0,0,0,1048,152,1,0,0,0,1049,1050,3,39,5,0,1050,1051,1,0,0,
-        0,1051,1052,6,62,25,0,1052,1053,6,62,28,0,1053,154,1,0,0,0,1054,
-        1056,9,0,0,0,1055,1054,1,0,0,0,1056,1059,1,0,0,0,1057,1058,1,0,0,
-        0,1057,1055,1,0,0,0,1058,1060,1,0,0,0,1059,1057,1,0,0,0,1060,1061,
-        7,13,0,0,1061,1062,7,2,0,0,1062,1063,7,2,0,0,1063,1064,7,11,0,0,
-        1064,1065,5,47,0,0,1065,1067,1,0,0,0,1066,1068,3,127,49,0,1067,1066,
-        1,0,0,0,1068,1069,1,0,0,0,1069,1067,1,0,0,0,1069,1070,1,0,0,0,1070,
-        1071,1,0,0,0,1071,1073,5,46,0,0,1072,1074,3,127,49,0,1073,1072,1,
-        0,0,0,1074,1075,1,0,0,0,1075,1073,1,0,0,0,1075,1076,1,0,0,0,1076,
-        1078,1,0,0,0,1077,1079,3,151,61,0,1078,1077,1,0,0,0,1078,1079,1,
-        0,0,0,1079,1080,1,0,0,0,1080,1081,5,10,0,0,1081,1082,1,0,0,0,1082,
-        1083,6,63,28,0,1083,156,1,0,0,0,1084,1085,9,0,0,0,1085,1086,1,0,
-        0,0,1086,1087,6,64,29,0,1087,158,1,0,0,0,1088,1090,7,6,0,0,1089,
-        1088,1,0,0,0,1090,1091,1,0,0,0,1091,1089,1,0,0,0,1091,1092,1,0,0,
-        0,1092,1093,1,0,0,0,1093,1094,6,65,1,0,1094,160,1,0,0,0,1095,1103,
-        3,133,52,0,1096,1103,3,121,46,0,1097,1103,3,123,47,0,1098,1103,3,
-        125,48,0,1099,1103,3,135,53,0,1100,1103,3,137,54,0,1101,1103,5,63,
-        0,0,1102,1095,1,0,0,0,1102,1096,1,0,0,0,1102,1097,1,0,0,0,1102,1098,
-        1,0,0,0,1102,1099,1,0,0,0,1102,1100,1,0,0,0,1102,1101,1,0,0,0,1103,
-        1104,1,0,0,0,1104,1102,1,0,0,0,1104,1105,1,0,0,0,1105,162,1,0,0,
-        0,1106,1107,5,58,0,0,1107,1108,1,0,0,0,1108,1109,6,67,30,0,1109,
-        164,1,0,0,0,1110,1112,3,159,65,0,1111,1110,1,0,0,0,1111,1112,1,0,
-        0,0,1112,1113,1,0,0,0,1113,1114,5,10,0,0,1114,1115,1,0,0,0,1115,
-        1116,6,68,31,0,1116,1117,6,68,32,0,1117,166,1,0,0,0,1118,1120,8,
-        31,0,0,1119,1118,1,0,0,0,1120,1121,1,0,0,0,1121,1119,1,0,0,0,1121,
-        1122,1,0,0,0,1122,168,1,0,0,0,1123,1124,5,10,0,0,1124,1125,1,0,0,
-        0,1125,1126,6,70,28,0,1126,170,1,0,0,0,1127,1129,7,6,0,0,1128,1127,
-        1,0,0,0,1129,1130,1,0,0,0,1130,1128,1,0,0,0,1130,1131,1,0,0,0,1131,
-        1132,1,0,0,0,1132,1133,6,71,33,0,1133,172,1,0,0,0,1134,1135,5,10,
-        0,0,1135,1136,1,0,0,0,1136,1137,6,72,25,0,1137,174,1,0,0,0,1138,
-        1139,5,45,0,0,1139,1140,5,45,0,0,1140,1141,1,0,0,0,1141,1142,3,119,
-        45,0,1142,1143,5,45,0,0,1143,1144,5,45,0,0,1144,1145,1,0,0,0,1145,
-        1146,3,39,5,0,1146,176,1,0,0,0,1147,1148,5,45,0,0,1148,1149,5,45,
-        0,0,1149,1150,1,0,0,0,1150,1151,3,119,45,0,1151,1152,3,39,5,0,1152,
-        1153,1,0,0,0,1153,1154,6,74,28,0,1154,178,1,0,0,0,1155,1156,5,47,
-        0,0,1156,1157,5,47,0,0,1157,1161,1,0,0,0,1158,1160,9,0,0,0,1159,
-        1158,1,0,0,0,1160,1163,1,0,0,0,1161,1162,1,0,0,0,1161,1159,1,0,0,
-        0,1162,1164,1,0,0,0,1163,1161,1,0,0,0,1164,1165,3,39,5,0,1165,1166,
-        1,0,0,0,1166,1167,6,75,1,0,1167,180,1,0,0,0,1168,1169,5,62,0,0,1169,
-        1172,5,62,0,0,1170,1172,7,32,0,0,1171,1168,1,0,0,0,1171,1170,1,0,
-        0,0,1172,1176,1,0,0,0,1173,1175,9,0,0,0,1174,1173,1,0,0,0,1175,1178,
-        1,0,0,0,1176,1177,1,0,0,0,1176,1174,1,0,0,0,1177,1179,1,0,0,0,1178,
-        1176,1,0,0,0,1179,1180,3,39,5,0,1180,182,1,0,0,0,1181,1182,5,35,
-        0,0,1182,1183,5,35,0,0,1183,1184,5,35,0,0,1184,1185,1,0,0,0,1185,
-        1186,6,77,34,0,1186,1187,6,77,35,0,1187,184,1,0,0,0,1188,1189,3,
-        119,45,0,1189,1190,1,0,0,0,1190,1191,6,78,33,0,1191,186,1,0,0,0,
-        1192,1193,9,0,0,0,1193,1194,1,0,0,0,1194,1195,6,79,33,0,1195,188,
-        1,0,0,0,1196,1198,7,6,0,0,1197,1196,1,0,0,0,1198,1199,1,0,0,0,1199,
-        1197,1,0,0,0,1199,1200,1,0,0,0,1200,1201,1,0,0,0,1201,1202,6,80,
-        1,0,1202,190,1,0,0,0,1203,1204,7,11,0,0,1204,1205,7,15,0,0,1205,
-        1206,7,4,0,0,1206,1207,7,7,0,0,1207,1208,7,33,0,0,1208,192,1,0,0,
-        0,1209,1210,7,13,0,0,1210,1211,7,2,0,0,1211,1212,7,2,0,0,1212,1213,
-        7,11,0,0,1213,1214,7,0,0,0,1214,1215,5,95,0,0,1215,1216,7,19,0,0,
-        1216,1217,7,1,0,0,1217,1218,7,15,0,0,1218,1219,7,3,0,0,1219,1220,
-        7,17,0,0,1220,1221,7,33,0,0,1221,194,1,0,0,0,1222,1223,7,4,0,0,1223,
-        1224,7,5,0,0,1224,196,1,0,0,0,1225,1226,7,4,0,0,1226,1227,7,17,0,
-        0,1227,1228,7,17,0,0,1228,198,1,0,0,0,1229,1237,3,133,52,0,1230,
-        1237,3,121,46,0,1231,1237,3,123,47,0,1232,1237,3,125,48,0,1233,1237,
-        3,135,53,0,1234,1237,3,137,54,0,1235,1237,7,34,0,0,1236,1229,1,0,
-        0,0,1236,1230,1,0,0,0,1236,1231,1,0,0,0,1236,1232,1,0,0,0,1236,1233,
-        1,0,0,0,1236,1234,1,0,0,0,1236,1235,1,0,0,0,1237,1238,1,0,0,0,1238,
-        1236,1,0,0,0,1238,1239,1,0,0,0,1239,200,1,0,0,0,1240,1241,5,59,0,
-        0,1241,202,1,0,0,0,1242,1243,3,39,5,0,1243,1244,1,0,0,0,1244,1245,
-        6,87,27,0,1245,204,1,0,0,0,1246,1248,7,6,0,0,1247,1246,1,0,0,0,1248,
-        1249,1,0,0,0,1249,1247,1,0,0,0,1249,1250,1,0,0,0,1250,1251,1,0,0,
-        0,1251,1252,6,88,1,0,1252,206,1,0,0,0,1253,1254,7,0,0,0,1254,1255,
-        7,14,0,0,1255,1256,7,19,0,0,1256,1257,7,1,0,0,1257,208,1,0,0,0,1258,
-        1259,7,15,0,0,1259,1260,7,1,0,0,1260,1261,7,10,0,0,1261,1262,7,1,
-        0,0,1262,1263,7,14,0,0,1263,1264,7,0,0,0,1264,1265,7,1,0,0,1265,
-        210,1,0,0,0,1266,1267,7,15,0,0,1267,1268,7,1,0,0,1268,1269,7,0,0,
-        0,1269,1270,7,2,0,0,1270,1271,7,4,0,0,1271,1272,7,15,0,0,1272,1273,
-        7,1,0,0,1273,212,1,0,0,0,1274,1275,7,0,0,0,1275,1276,7,13,0,0,1276,
-        1277,7,4,0,0,1277,1278,7,18,0,0,1278,214,1,0,0,0,1279,1287,3,133,
-        52,0,1280,1287,3,121,46,0,1281,1287,3,123,47,0,1282,1287,3,125,48,
-        0,1283,1287,3,135,53,0,1284,1287,3,137,54,0,1285,1287,7,34,0,0,1286,
-        1279,1,0,0,0,1286,1280,1,0,0,0,1286,1281,1,0,0,0,1286,1282,1,0,0,
-        0,1286,1283,1,0,0,0,1286,1284,1,0,0,0,1286,1285,1,0,0,0,1287,1288,
-        1,0,0,0,1288,1286,1,0,0,0,1288,1289,1,0,0,0,1289,216,1,0,0,0,1290,
-        1291,5,59,0,0,1291,218,1,0,0,0,1292,1293,3,39,5,0,1293,1294,1,0,
-        0,0,1294,1295,6,95,27,0,1295,220,1,0,0,0,1296,1298,9,0,0,0,1297,
-        1296,1,0,0,0,1298,1301,1,0,0,0,1299,1300,1,0,0,0,1299,1297,1,0,0,
-        0,1300,1306,1,0,0,0,1301,1299,1,0,0,0,1302,1303,5,10,0,0,1303,1304,
-        5,37,0,0,1304,1307,5,125,0,0,1305,1307,5,0,0,1,1306,1302,1,0,0,0,
-        1306,1305,1,0,0,0,1307,1308,1,0,0,0,1308,1309,6,96,27,0,1309,222,
-        1,0,0,0,1310,1312,9,0,0,0,1311,1310,1,0,0,0,1312,1315,1,0,0,0,1313,
-        1314,1,0,0,0,1313,1311,1,0,0,0,1314,1316,1,0,0,0,1315,1313,1,0,0,
-        0,1316,1317,7,1,0,0,1317,1318,7,12,0,0,1318,1319,7,13,0,0,1319,1320,
-        7,4,0,0,1320,1322,1,0,0,0,1321,1323,7,6,0,0,1322,1321,1,0,0,0,1323,
-        1324,1,0,0,0,1324,1322,1,0,0,0,1324,1325,1,0,0,0,1325,1326,1,0,0,
-        0,1326,1327,7,4,0,0,1327,1328,7,17,0,0,1328,1329,7,17,0,0,1329,1330,
-        1,0,0,0,1330,1331,6,97,27,0,1331,224,1,0,0,0,1332,1334,7,6,0,0,1333,
-        1332,1,0,0,0,1334,1335,1,0,0,0,1335,1333,1,0,0,0,1335,1336,1,0,0,
-        0,1336,1337,1,0,0,0,1337,1338,6,98,1,0,1338,226,1,0,0,0,1339,1340,
-        5,123,0,0,1340,1341,5,37,0,0,1341,228,1,0,0,0,1342,1343,5,37,0,0,
-        1343,1344,5,125,0,0,1344,230,1,0,0,0,1345,1346,3,39,5,0,1346,1347,
-        1,0,0,0,1347,1348,6,101,27,0,1348,232,1,0,0,0,1349,1353,3,227,99,
-        0,1350,1352,9,0,0,0,1351,1350,1,0,0,0,1352,1355,1,0,0,0,1353,1354,
-        1,0,0,0,1353,1351,1,0,0,0,1354,1356,1,0,0,0,1355,1353,1,0,0,0,1356,
-        1357,3,229,100,0,1357,234,1,0,0,0,1358,1365,3,133,52,0,1359,1365,
-        3,121,46,0,1360,1365,3,125,48,0,1361,1365,3,135,53,0,1362,1365,3,
-        137,54,0,1363,1365,7,35,0,0,1364,1358,1,0,0,0,1364,1359,1,0,0,0,
-        1364,1360,1,0,0,0,1364,1361,1,0,0,0,1364,1362,1,0,0,0,1364,1363,
-        1,0,0,0,1365,1366,1,0,0,0,1366,1364,1,0,0,0,1366,1367,1,0,0,0,1367,
-        236,1,0,0,0,1368,1369,5,44,0,0,1369,238,1,0,0,0,1370,1371,5,59,0,
-        0,1371,240,1,0,0,0,1372,1374,7,6,0,0,1373,1372,1,0,0,0,1374,1375,
-        1,0,0,0,1375,1373,1,0,0,0,1375,1376,1,0,0,0,1376,1377,1,0,0,0,1377,
-        1378,6,106,1,0,1378,242,1,0,0,0,1379,1380,5,61,0,0,1380,244,1,0,
-        0,0,1381,1382,7,11,0,0,1382,1383,7,10,0,0,1383,1384,7,9,0,0,1384,
-        1385,7,30,0,0,1385,1386,7,3,0,0,1386,1387,7,5,0,0,1387,246,1,0,0,
-        0,1388,1389,7,0,0,0,1389,1390,7,12,0,0,1390,1391,7,15,0,0,1391,1392,
-        7,3,0,0,1392,1393,7,11,0,0,1393,1394,7,2,0,0,1394,248,1,0,0,0,1395,
-        1396,7,22,0,0,1396,1397,7,14,0,0,1397,1398,7,11,0,0,1398,250,1,0,
-        0,0,1399,1400,7,20,0,0,1400,1401,7,16,0,0,1401,1402,7,21,0,0,1402,
-        1403,7,12,0,0,1403,1404,7,16,0,0,1404,1405,7,15,0,0,1405,1406,7,
-        3,0,0,1406,1407,7,19,0,0,1407,1408,7,1,0,0,1408,1409,7,15,0,0,1409,
-        252,1,0,0,0,1410,1411,7,17,0,0,1411,1412,7,3,0,0,1412,1413,7,10,
-        0,0,1413,1414,7,1,0,0,1414,254,1,0,0,0,1415,1416,7,12,0,0,1416,1417,
-        7,10,0,0,1417,1418,7,14,0,0,1418,1419,7,0,0,0,1419,1420,7,0,0,0,
-        1420,256,1,0,0,0,1421,1422,7,5,0,0,1422,1423,7,14,0,0,1423,1424,
-        7,22,0,0,1424,1425,7,1,0,0,1425,258,1,0,0,0,1426,1427,7,11,0,0,1427,
-        1428,7,15,0,0,1428,1429,7,4,0,0,1429,1430,7,11,0,0,1430,1431,7,0,
-        0,0,1431,260,1,0,0,0,1432,1433,7,9,0,0,1433,1434,7,15,0,0,1434,1435,
-        7,10,0,0,1435,262,1,0,0,0,1436,1443,3,133,52,0,1437,1443,3,121,46,
-        0,1438,1443,3,125,48,0,1439,1443,3,135,53,0,1440,1443,3,137,54,0,
-        1441,1443,7,35,0,0,1442,1436,1,0,0,0,1442,1437,1,0,0,0,1442,1438,
-        1,0,0,0,1442,1439,1,0,0,0,1442,1440,1,0,0,0,1442,1441,1,0,0,0,1443,
-        1444,1,0,0,0,1444,1442,1,0,0,0,1444,1445,1,0,0,0,1445,264,1,0,0,
-        0,1446,1447,5,59,0,0,1447,266,1,0,0,0,1448,1449,3,39,5,0,1449,1450,
-        1,0,0,0,1450,1451,6,119,27,0,1451,268,1,0,0,0,1452,1454,7,6,0,0,
-        1453,1452,1,0,0,0,1454,1455,1,0,0,0,1455,1453,1,0,0,0,1455,1456,
-        1,0,0,0,1456,1457,1,0,0,0,1457,1458,6,120,1,0,1458,270,1,0,0,0,1459,
-        1467,3,133,52,0,1460,1467,3,121,46,0,1461,1467,3,123,47,0,1462,1467,
-        3,125,48,0,1463,1467,3,135,53,0,1464,1467,3,137,54,0,1465,1467,7,
-        35,0,0,1466,1459,1,0,0,0,1466,1460,1,0,0,0,1466,1461,1,0,0,0,1466,
-        1462,1,0,0,0,1466,1463,1,0,0,0,1466,1464,1,0,0,0,1466,1465,1,0,0,
-        0,1467,1468,1,0,0,0,1468,1466,1,0,0,0,1468,1469,1,0,0,0,1469,272,
-        1,0,0,0,1470,1471,3,39,5,0,1471,1472,1,0,0,0,1472,1473,6,122,27,
-        0,1473,274,1,0,0,0,1474,1476,7,6,0,0,1475,1474,1,0,0,0,1476,1477,
-        1,0,0,0,1477,1475,1,0,0,0,1477,1478,1,0,0,0,1478,1479,1,0,0,0,1479,
-        1480,6,123,1,0,1480,276,1,0,0,0,1481,1489,3,133,52,0,1482,1489,3,
-        121,46,0,1483,1489,3,123,47,0,1484,1489,3,125,48,0,1485,1489,3,135,
-        53,0,1486,1489,3,137,54,0,1487,1489,7,36,0,0,1488,1481,1,0,0,0,1488,
-        1482,1,0,0,0,1488,1483,1,0,0,0,1488,1484,1,0,0,0,1488,1485,1,0,0,
-        0,1488,1486,1,0,0,0,1488,1487,1,0,0,0,1489,1490,1,0,0,0,1490,1488,
-        1,0,0,0,1490,1491,1,0,0,0,1491,278,1,0,0,0,1492,1493,3,39,5,0,1493,
-        1494,1,0,0,0,1494,1495,6,125,27,0,1495,280,1,0,0,0,1496,1498,7,6,
-        0,0,1497,1496,1,0,0,0,1498,1499,1,0,0,0,1499,1497,1,0,0,0,1499,1500,
-        1,0,0,0,1500,1501,1,0,0,0,1501,1502,6,126,1,0,1502,282,1,0,0,0,1503,
-        1504,5,123,0,0,1504,1505,5,37,0,0,1505,284,1,0,0,0,1506,1507,5,37,
-        0,0,1507,1508,5,125,0,0,1508,286,1,0,0,0,1509,1513,3,283,127,0,1510,
-        1512,9,0,0,0,1511,1510,1,0,0,0,1512,1515,1,0,0,0,1513,1514,1,0,0,
-        0,1513,1511,1,0,0,0,1514,1516,1,0,0,0,1515,1513,1,0,0,0,1516,1517,
-        3,285,128,0,1517,1518,1,0,0,0,1518,1519,6,129,27,0,1519,288,1,0,
-        0,0,1520,1521,5,59,0,0,1521,290,1,0,0,0,1522,1524,7,6,0,0,1523,1522,
-        1,0,0,0,1524,1525,1,0,0,0,1525,1523,1,0,0,0,1525,1526,1,0,0,0,1526,
-        1527,1,0,0,0,1527,1528,6,131,1,0,1528,292,1,0,0,0,1529,1530,7,21,
-        0,0,1530,1531,7,1,0,0,1531,1532,7,30,0,0,1532,1533,7,3,0,0,1533,
-        1534,7,5,0,0,1534,294,1,0,0,0,1535,1536,7,9,0,0,1536,1537,7,5,0,
-        0,1537,1538,7,2,0,0,1538,1539,7,3,0,0,1539,1540,7,10,0,0,1540,296,
-        1,0,0,0,1541,1542,7,3,0,0,1542,1543,7,5,0,0,1543,1544,7,2,0,0,1544,
-        1545,7,1,0,0,1545,1546,7,15,0,0,1546,1547,7,19,0,0,1547,1548,7,14,
-        0,0,1548,1549,7,10,0,0,1549,298,1,0,0,0,1550,1551,3,115,43,0,1551,
-        300,1,0,0,0,1552,1553,5,123,0,0,1553,1554,5,37,0,0,1554,302,1,0,
-        0,0,1555,1556,5,37,0,0,1556,1557,5,125,0,0,1557,304,1,0,0,0,1558,
-        1559,7,21,0,0,1559,1560,7,15,0,0,1560,1561,7,1,0,0,1561,1562,7,14,
-        0,0,1562,1563,7,37,0,0,1563,306,1,0,0,0,1564,1565,7,1,0,0,1565,1566,
-        7,5,0,0,1566,1567,7,16,0,0,1567,308,1,0,0,0,1568,1569,7,12,0,0,1569,
-        1570,7,4,0,0,1570,1571,7,5,0,0,1571,1572,7,2,0,0,1572,1573,7,3,0,
-        0,1573,1574,7,5,0,0,1574,1575,7,9,0,0,1575,1576,7,1,0,0,1576,310,
-        1,0,0,0,1577,1581,3,301,136,0,1578,1580,9,0,0,0,1579,1578,1,0,0,
-        0,1580,1583,1,0,0,0,1581,1582,1,0,0,0,1581,1579,1,0,0,0,1582,1584,
-        1,0,0,0,1583,1581,1,0,0,0,1584,1585,3,303,137,0,1585,312,1,0,0,0,
-        1586,1587,3,39,5,0,1587,1588,1,0,0,0,1588,1589,6,142,27,0,1589,314,
-        1,0,0,0,1590,1592,7,6,0,0,1591,1590,1,0,0,0,1592,1593,1,0,0,0,1593,
-        1591,1,0,0,0,1593,1594,1,0,0,0,1594,1595,1,0,0,0,1595,1596,6,143,
-        1,0,1596,316,1,0,0,0,1597,1598,3,115,43,0,1598,318,1,0,0,0,1599,
-        1600,7,1,0,0,1600,1601,7,15,0,0,1601,1602,7,15,0,0,1602,1603,7,4,
-        0,0,1603,1604,7,15,0,0,1604,320,1,0,0,0,1605,1606,5,59,0,0,1606,
-        322,1,0,0,0,1607,1608,7,12,0,0,1608,1609,7,4,0,0,1609,1610,7,5,0,
-        0,1610,1611,7,2,0,0,1611,1612,7,3,0,0,1612,1613,7,5,0,0,1613,1614,
-        7,9,0,0,1614,1615,7,1,0,0,1615,324,1,0,0,0,1616,1617,7,1,0,0,1617,
-        1618,7,7,0,0,1618,1619,7,3,0,0,1619,1620,7,2,0,0,1620,326,1,0,0,
-        0,1621,1622,3,39,5,0,1622,1623,1,0,0,0,1623,1624,6,149,27,0,1624,
-        328,1,0,0,0,1625,1627,7,6,0,0,1626,1625,1,0,0,0,1627,1628,1,0,0,
-        0,1628,1626,1,0,0,0,1628,1629,1,0,0,0,1629,1630,1,0,0,0,1630,1631,
-        6,150,1,0,1631,330,1,0,0,0,1632,1640,3,133,52,0,1633,1640,3,121,
-        46,0,1634,1640,3,123,47,0,1635,1640,3,125,48,0,1636,1640,3,135,53,
-        0,1637,1640,3,137,54,0,1638,1640,7,34,0,0,1639,1632,1,0,0,0,1639,
-        1633,1,0,0,0,1639,1634,1,0,0,0,1639,1635,1,0,0,0,1639,1636,1,0,0,
-        0,1639,1637,1,0,0,0,1639,1638,1,0,0,0,1640,1641,1,0,0,0,1641,1639,
-        1,0,0,0,1641,1642,1,0,0,0,1642,332,1,0,0,0,1643,1644,5,59,0,0,1644,
-        334,1,0,0,0,1645,1646,7,4,0,0,1646,1647,7,17,0,0,1647,1648,7,17,
-        0,0,1648,336,1,0,0,0,1649,1650,3,39,5,0,1650,1651,1,0,0,0,1651,1652,
-        6,154,27,0,1652,338,1,0,0,0,1653,1655,7,6,0,0,1654,1653,1,0,0,0,
-        1655,1656,1,0,0,0,1656,1654,1,0,0,0,1656,1657,1,0,0,0,1657,1658,
-        1,0,0,0,1658,1659,6,155,1,0,1659,340,1,0,0,0,1660,1668,3,133,52,
-        0,1661,1668,3,121,46,0,1662,1668,3,123,47,0,1663,1668,3,125,48,0,
-        1664,1668,3,135,53,0,1665,1668,3,137,54,0,1666,1668,7,34,0,0,1667,
-        1660,1,0,0,0,1667,1661,1,0,0,0,1667,1662,1,0,0,0,1667,1663,1,0,0,
-        0,1667,1664,1,0,0,0,1667,1665,1,0,0,0,1667,1666,1,0,0,0,1668,1669,
-        1,0,0,0,1669,1667,1,0,0,0,1669,1670,1,0,0,0,1670,342,1,0,0,0,1671,
-        1672,5,59,0,0,1672,344,1,0,0,0,1673,1674,3,39,5,0,1674,1675,1,0,
-        0,0,1675,1676,6,158,27,0,1676,346,1,0,0,0,1677,1678,7,14,0,0,1678,
-        1679,7,11,0,0,1679,1680,7,3,0,0,1680,348,1,0,0,0,1681,1682,7,0,0,
-        0,1682,1683,7,8,0,0,1683,1684,7,10,0,0,1684,350,1,0,0,0,1685,1687,
-        7,6,0,0,1686,1685,1,0,0,0,1687,1688,1,0,0,0,1688,1686,1,0,0,0,1688,
-        1689,1,0,0,0,1689,1690,1,0,0,0,1690,1691,6,161,1,0,1691,352,1,0,
-        0,0,1692,1693,5,59,0,0,1693,354,1,0,0,0,1694,1695,3,39,5,0,1695,
-        1696,1,0,0,0,1696,1697,6,163,27,0,1697,356,1,0,0,0,1698,1699,7,12,
-        0,0,1699,1700,7,4,0,0,1700,1701,7,5,0,0,1701,1702,7,5,0,0,1702,1703,
-        7,1,0,0,1703,1704,7,12,0,0,1704,1705,7,2,0,0,1705,358,1,0,0,0,1706,
-        1707,7,18,0,0,1707,1708,7,3,0,0,1708,1709,7,2,0,0,1709,1710,7,13,
-        0,0,1710,360,1,0,0,0,1711,1712,7,9,0,0,1712,1713,7,0,0,0,1713,1714,
-        7,1,0,0,1714,1715,7,15,0,0,1715,362,1,0,0,0,1716,1717,7,0,0,0,1717,
-        1718,7,1,0,0,1718,1719,7,2,0,0,1719,364,1,0,0,0,1720,1721,7,37,0,
-        0,1721,1722,7,1,0,0,1722,1723,7,33,0,0,1723,1724,7,17,0,0,1724,1725,
-        7,3,0,0,1725,1726,7,10,0,0,1726,1727,7,1,0,0,1727,366,1,0,0,0,1728,
-        1729,7,11,0,0,1729,1730,7,14,0,0,1730,1731,7,0,0,0,1731,1732,7,0,
-        0,0,1732,1733,7,18,0,0,1733,1734,7,4,0,0,1734,1735,7,15,0,0,1735,
-        1736,7,16,0,0,1736,368,1,0,0,0,1737,1738,7,1,0,0,1738,1739,7,7,0,
-        0,1739,1740,7,1,0,0,1740,1741,7,12,0,0,1741,1742,7,9,0,0,1742,1743,
-        7,2,0,0,1743,1744,7,1,0,0,1744,370,1,0,0,0,1745,1746,7,16,0,0,1746,
-        1747,7,3,0,0,1747,1748,7,0,0,0,1748,1749,7,12,0,0,1749,1750,7,4,
-        0,0,1750,1751,7,5,0,0,1751,1752,7,5,0,0,1752,1753,7,1,0,0,1753,1754,
-        7,12,0,0,1754,1755,7,2,0,0,1755,372,1,0,0,0,1756,1757,7,0,0,0,1757,
-        1758,7,14,0,0,1758,1759,7,19,0,0,1759,1760,7,1,0,0,1760,374,1,0,
-        0,0,1761,1762,7,15,0,0,1762,1763,7,1,0,0,1763,1764,7,0,0,0,1764,
-        1765,7,2,0,0,1765,1766,7,4,0,0,1766,1767,7,15,0,0,1767,1768,7,1,
-        0,0,1768,376,1,0,0,0,1769,1770,7,0,0,0,1770,1771,7,17,0,0,1771,1772,
-        7,2,0,0,1772,1773,7,11,0,0,1773,378,1,0,0,0,1774,1775,7,12,0,0,1775,
-        1776,7,13,0,0,1776,1777,7,22,0,0,1777,1778,7,4,0,0,1778,1779,7,16,
-        0,0,1779,380,1,0,0,0,1780,1781,7,30,0,0,1781,1782,7,1,0,0,1782,1783,
-        7,2,0,0,1783,1784,7,12,0,0,1784,1785,7,18,0,0,1785,1786,7,16,0,0,
-        1786,382,1,0,0,0,1787,1788,7,12,0,0,1788,1789,7,13,0,0,1789,1790,
-        7,16,0,0,1790,1791,7,3,0,0,1791,1792,7,15,0,0,1792,384,1,0,0,0,1793,
-        1794,7,12,0,0,1794,1795,7,13,0,0,1795,1796,7,4,0,0,1796,1797,7,18,
-        0,0,1797,1798,7,5,0,0,1798,386,1,0,0,0,1799,1800,7,22,0,0,1800,1801,
-        7,37,0,0,1801,1802,7,16,0,0,1802,1803,7,3,0,0,1803,1804,7,15,0,0,
-        1804,388,1,0,0,0,1805,1806,7,30,0,0,1806,1807,7,1,0,0,1807,1808,
-        7,2,0,0,1808,390,1,0,0,0,1809,1810,7,11,0,0,1810,1811,7,9,0,0,1811,
-        1812,7,2,0,0,1812,392,1,0,0,0,1813,1814,7,15,0,0,1814,1815,7,1,0,
-        0,1815,1816,7,22,0,0,1816,1817,7,4,0,0,1817,1818,7,19,0,0,1818,1819,
-        7,1,0,0,1819,394,1,0,0,0,1820,1821,7,15,0,0,1821,1822,7,1,0,0,1822,
-        1823,7,5,0,0,1823,1824,7,14,0,0,1824,1825,7,22,0,0,1825,1826,7,1,
-        0,0,1826,396,1,0,0,0,1827,1828,7,10,0,0,1828,1829,7,3,0,0,1829,1830,
-        7,0,0,0,1830,1831,7,2,0,0,1831,1832,7,16,0,0,1832,1833,7,3,0,0,1833,
-        1834,7,15,0,0,1834,398,1,0,0,0,1835,1836,7,2,0,0,1836,1837,7,15,
-        0,0,1837,1838,7,9,0,0,1838,1839,7,5,0,0,1839,1840,7,12,0,0,1840,
-        1841,7,14,0,0,1841,1842,7,2,0,0,1842,1843,7,1,0,0,1843,400,1,0,0,
-        0,1844,1845,5,61,0,0,1845,402,1,0,0,0,1846,1848,7,6,0,0,1847,1846,
-        1,0,0,0,1848,1849,1,0,0,0,1849,1847,1,0,0,0,1849,1850,1,0,0,0,1850,
-        1851,1,0,0,0,1851,1852,6,187,1,0,1852,404,1,0,0,0,1853,1854,5,59,
-        0,0,1854,406,1,0,0,0,1855,1856,3,39,5,0,1856,1857,1,0,0,0,1857,1858,
-        6,189,27,0,1858,408,1,0,0,0,1859,1867,3,133,52,0,1860,1867,3,121,
-        46,0,1861,1867,3,123,47,0,1862,1867,3,125,48,0,1863,1867,3,135,53,
-        0,1864,1867,3,137,54,0,1865,1867,7,38,0,0,1866,1859,1,0,0,0,1866,
-        1860,1,0,0,0,1866,1861,1,0,0,0,1866,1862,1,0,0,0,1866,1863,1,0,0,
-        0,1866,1864,1,0,0,0,1866,1865,1,0,0,0,1867,1868,1,0,0,0,1868,1866,
-        1,0,0,0,1868,1869,1,0,0,0,1869,410,1,0,0,0,1870,1872,7,6,0,0,1871,
-        1870,1,0,0,0,1872,1873,1,0,0,0,1873,1871,1,0,0,0,1873,1874,1,0,0,
-        0,1874,1875,1,0,0,0,1875,1876,6,191,1,0,1876,412,1,0,0,0,1877,1878,
-        5,59,0,0,1878,414,1,0,0,0,1879,1880,5,61,0,0,1880,416,1,0,0,0,1881,
-        1882,3,39,5,0,1882,1883,1,0,0,0,1883,1884,6,194,27,0,1884,418,1,
-        0,0,0,1885,1886,7,12,0,0,1886,1887,7,15,0,0,1887,1888,7,1,0,0,1888,
-        1889,7,14,0,0,1889,1890,7,2,0,0,1890,1891,7,1,0,0,1891,420,1,0,0,
-        0,1892,1893,7,0,0,0,1893,1894,7,13,0,0,1894,1895,7,4,0,0,1895,1896,
-        7,18,0,0,1896,422,1,0,0,0,1897,1898,7,0,0,0,1898,1899,7,1,0,0,1899,
-        1900,7,2,0,0,1900,424,1,0,0,0,1901,1902,7,0,0,0,1902,1903,7,2,0,
-        0,1903,1904,7,14,0,0,1904,1905,7,15,0,0,1905,1906,7,2,0,0,1906,426,
-        1,0,0,0,1907,1908,7,18,0,0,1908,1909,7,14,0,0,1909,1910,7,3,0,0,
-        1910,1911,7,2,0,0,1911,428,1,0,0,0,1912,1913,7,0,0,0,1913,1914,7,
-        13,0,0,1914,1915,7,9,0,0,1915,1916,7,2,0,0,1916,1917,7,16,0,0,1917,
-        1918,7,4,0,0,1918,1919,7,18,0,0,1919,1920,7,5,0,0,1920,430,1,0,0,
-        0,1921,1922,7,14,0,0,1922,1923,7,21,0,0,1923,1924,7,4,0,0,1924,1925,
-        7,15,0,0,1925,1926,7,2,0,0,1926,432,1,0,0,0,1927,1928,7,2,0,0,1928,
-        1929,7,3,0,0,1929,1930,7,22,0,0,1930,1931,7,1,0,0,1931,1932,7,15,
-        0,0,1932,434,1,0,0,0,1933,1934,7,15,0,0,1934,1935,7,1,0,0,1935,1936,
-        7,30,0,0,1936,1937,7,3,0,0,1937,1938,7,0,0,0,1938,1939,7,2,0,0,1939,
-        1940,7,1,0,0,1940,1941,7,15,0,0,1941,436,1,0,0,0,1942,1943,7,16,
-        0,0,1943,1944,7,1,0,0,1944,1945,7,15,0,0,1945,1946,7,1,0,0,1946,
-        1947,7,30,0,0,1947,1948,7,3,0,0,1948,1949,7,0,0,0,1949,1950,7,2,
-        0,0,1950,1951,7,1,0,0,1951,1952,7,15,0,0,1952,438,1,0,0,0,1953,1954,
-        7,18,0,0,1954,1955,7,4,0,0,1955,1956,7,15,0,0,1956,1957,7,37,0,0,
-        1957,1958,7,1,0,0,1958,1959,7,15,0,0,1959,440,1,0,0,0,1960,1961,
-        7,20,0,0,1961,1962,7,4,0,0,1962,1963,7,21,0,0,1963,1964,7,22,0,0,
-        1964,1965,7,14,0,0,1965,1966,7,5,0,0,1966,1967,7,14,0,0,1967,1968,
-        7,30,0,0,1968,1969,7,1,0,0,1969,1970,7,15,0,0,1970,442,1,0,0,0,1971,
-        1972,7,4,0,0,1972,1973,7,5,0,0,1973,444,1,0,0,0,1974,1975,7,4,0,
-        0,1975,1976,7,17,0,0,1976,1977,7,17,0,0,1977,446,1,0,0,0,1978,1979,
-        7,2,0,0,1979,1980,7,4,0,0,1980,448,1,0,0,0,1981,1988,3,133,52,0,
-        1982,1988,3,121,46,0,1983,1988,3,125,48,0,1984,1988,3,135,53,0,1985,
-        1988,3,137,54,0,1986,1988,7,39,0,0,1987,1981,1,0,0,0,1987,1982,1,
-        0,0,0,1987,1983,1,0,0,0,1987,1984,1,0,0,0,1987,1985,1,0,0,0,1987,
-        1986,1,0,0,0,1988,1989,1,0,0,0,1989,1987,1,0,0,0,1989,1990,1,0,0,
-        0,1990,450,1,0,0,0,1991,1993,7,6,0,0,1992,1991,1,0,0,0,1993,1994,
-        1,0,0,0,1994,1992,1,0,0,0,1994,1995,1,0,0,0,1995,1996,1,0,0,0,1996,
-        1997,6,211,1,0,1997,452,1,0,0,0,1998,1999,5,59,0,0,1999,454,1,0,
-        0,0,2000,2001,5,61,0,0,2001,2002,5,62,0,0,2002,456,1,0,0,0,2003,
-        2004,3,39,5,0,2004,2005,1,0,0,0,2005,2006,6,214,27,0,2006,458,1,
-        0,0,0,2007,2008,7,0,0,0,2008,2009,7,1,0,0,2009,2010,7,2,0,0,2010,
-        460,1,0,0,0,2011,2012,7,9,0,0,2012,2013,7,5,0,0,2013,2014,7,0,0,
-        0,2014,2015,7,1,0,0,2015,2016,7,2,0,0,2016,462,1,0,0,0,2017,2018,
-        7,22,0,0,2018,2019,7,14,0,0,2019,2020,7,0,0,0,2020,2021,7,37,0,0,
-        2021,464,1,0,0,0,2022,2023,7,5,0,0,2023,2024,7,4,0,0,2024,2025,7,
-        22,0,0,2025,2026,7,14,0,0,2026,2027,7,0,0,0,2027,2028,7,37,0,0,2028,
-        466,1,0,0,0,2029,2030,7,22,0,0,2030,2031,7,14,0,0,2031,2032,7,0,
-        0,0,2032,2033,7,37,0,0,2033,2034,7,10,0,0,2034,2035,7,3,0,0,2035,
-        2036,7,5,0,0,2036,2037,7,1,0,0,2037,468,1,0,0,0,2038,2039,7,5,0,
-        0,2039,2040,7,4,0,0,2040,2041,7,22,0,0,2041,2042,7,14,0,0,2042,2043,
-        7,0,0,0,2043,2044,7,37,0,0,2044,2045,7,10,0,0,2045,2046,7,3,0,0,
-        2046,2047,7,5,0,0,2047,2048,7,1,0,0,2048,470,1,0,0,0,2049,2050,7,
-        12,0,0,2050,2051,7,14,0,0,2051,2052,7,0,0,0,2052,2053,7,1,0,0,2053,
-        472,1,0,0,0,2054,2055,7,5,0,0,2055,2056,7,4,0,0,2056,2057,7,12,0,
-        0,2057,2058,7,14,0,0,2058,2059,7,0,0,0,2059,2060,7,1,0,0,2060,474,
-        1,0,0,0,2061,2062,7,3,0,0,2062,2063,7,30,0,0,2063,2064,7,21,0,0,
-        2064,2065,7,10,0,0,2065,2066,7,14,0,0,2066,2067,7,5,0,0,2067,2068,
-        7,37,0,0,2068,476,1,0,0,0,2069,2070,7,5,0,0,2070,2071,7,4,0,0,2071,
-        2072,7,3,0,0,2072,2073,7,30,0,0,2073,2074,7,21,0,0,2074,2075,7,10,
-        0,0,2075,2076,7,14,0,0,2076,2077,7,5,0,0,2077,2078,7,37,0,0,2078,
-        478,1,0,0,0,2079,2080,7,2,0,0,2080,2081,7,15,0,0,2081,2082,7,3,0,
-        0,2082,2083,7,22,0,0,2083,480,1,0,0,0,2084,2085,7,5,0,0,2085,2086,
-        7,4,0,0,2086,2087,7,2,0,0,2087,2088,7,15,0,0,2088,2089,7,3,0,0,2089,
-        2090,7,22,0,0,2090,482,1,0,0,0,2091,2092,7,4,0,0,2092,2093,7,9,0,
-        0,2093,2094,7,2,0,0,2094,2095,7,11,0,0,2095,2096,7,9,0,0,2096,2097,
-        7,2,0,0,2097,484,1,0,0,0,2098,2099,7,12,0,0,2099,2100,7,4,0,0,2100,
-        2101,7,5,0,0,2101,2102,7,0,0,0,2102,2103,7,4,0,0,2103,2104,7,10,
-        0,0,2104,2105,7,1,0,0,2105,486,1,0,0,0,2106,2107,7,16,0,0,2107,2108,
-        7,3,0,0,2108,2109,7,17,0,0,2109,2110,7,17,0,0,2110,2111,7,17,0,0,
-        2111,2112,7,3,0,0,2112,2113,7,10,0,0,2113,2114,7,1,0,0,2114,488,
-        1,0,0,0,2115,2116,7,13,0,0,2116,2117,7,2,0,0,2117,2118,7,22,0,0,
-        2118,2119,7,10,0,0,2119,2120,7,17,0,0,2120,2121,7,3,0,0,2121,2122,
-        7,10,0,0,2122,2123,7,1,0,0,2123,490,1,0,0,0,2124,2125,7,0,0,0,2125,
-        2126,7,37,0,0,2126,2127,7,3,0,0,2127,2128,7,11,0,0,2128,2129,7,10,
-        0,0,2129,2130,7,3,0,0,2130,2131,7,5,0,0,2131,2132,7,1,0,0,2132,492,
-        1,0,0,0,2133,2134,7,5,0,0,2134,2135,7,4,0,0,2135,2136,7,0,0,0,2136,
-        2137,7,37,0,0,2137,2138,7,3,0,0,2138,2139,7,11,0,0,2139,2140,7,10,
-        0,0,2140,2141,7,3,0,0,2141,2142,7,5,0,0,2142,2143,7,1,0,0,2143,494,
-        1,0,0,0,2144,2145,7,15,0,0,2145,2146,7,1,0,0,2146,2147,7,0,0,0,2147,
-        2148,7,1,0,0,2148,2149,7,2,0,0,2149,496,1,0,0,0,2150,2151,7,14,0,
-        0,2151,2152,7,10,0,0,2152,2153,7,30,0,0,2153,2154,7,4,0,0,2154,2155,
-        7,15,0,0,2155,2156,7,3,0,0,2156,2157,7,2,0,0,2157,2158,7,13,0,0,
-        2158,2159,7,22,0,0,2159,498,1,0,0,0,2160,2161,7,1,0,0,2161,2162,
-        7,5,0,0,2162,2163,7,12,0,0,2163,2164,7,4,0,0,2164,2165,7,16,0,0,
-        2165,2166,7,3,0,0,2166,2167,7,5,0,0,2167,2168,7,30,0,0,2168,500,
-        1,0,0,0,2169,2170,7,18,0,0,2170,2171,7,4,0,0,2171,2172,7,15,0,0,
-        2172,2173,7,37,0,0,2173,502,1,0,0,0,2174,2175,7,15,0,0,2175,2176,
-        7,1,0,0,2176,2177,7,17,0,0,2177,2178,7,1,0,0,2178,2179,7,15,0,0,
-        2179,2180,7,1,0,0,2180,2181,7,5,0,0,2181,2182,7,12,0,0,2182,2183,
-        7,1,0,0,2183,504,1,0,0,0,2184,2185,7,10,0,0,2185,2186,7,12,0,0,2186,
-        2187,7,0,0,0,2187,506,1,0,0,0,2188,2189,7,22,0,0,2189,2190,7,33,
-        0,0,2190,2191,7,1,0,0,2191,2192,7,15,0,0,2192,2193,7,0,0,0,2193,
-        508,1,0,0,0,2194,2195,7,16,0,0,2195,2196,7,3,0,0,2196,2197,7,17,
-        0,0,2197,2198,7,17,0,0,2198,2199,7,10,0,0,2199,2200,7,3,0,0,2200,
-        2201,7,21,0,0,2201,510,1,0,0,0,2202,2203,7,14,0,0,2203,2204,7,9,
-        0,0,2204,2205,7,2,0,0,2205,2206,7,4,0,0,2206,512,1,0,0,0,2207,2214,
-        3,133,52,0,2208,2214,3,121,46,0,2209,2214,3,125,48,0,2210,2214,3,
-        135,53,0,2211,2214,3,137,54,0,2212,2214,7,39,0,0,2213,2207,1,0,0,
-        0,2213,2208,1,0,0,0,2213,2209,1,0,0,0,2213,2210,1,0,0,0,2213,2211,
-        1,0,0,0,2213,2212,1,0,0,0,2214,2215,1,0,0,0,2215,2213,1,0,0,0,2215,
-        2216,1,0,0,0,2216,514,1,0,0,0,2217,2219,7,40,0,0,2218,2217,1,0,0,
-        0,2219,2220,1,0,0,0,2220,2218,1,0,0,0,2220,2221,1,0,0,0,2221,2222,
-        1,0,0,0,2222,2223,6,243,1,0,2223,516,1,0,0,0,2224,2225,5,59,0,0,
-        2225,2226,1,0,0,0,2226,2227,6,244,27,0,2227,518,1,0,0,0,2228,2229,
-        7,0,0,0,2229,2230,7,1,0,0,2230,2231,7,2,0,0,2231,520,1,0,0,0,2232,
-        2233,7,0,0,0,2233,2234,7,1,0,0,2234,2235,7,1,0,0,2235,2236,7,16,
-        0,0,2236,2237,7,17,0,0,2237,2238,7,3,0,0,2238,2239,7,10,0,0,2239,
-        2240,7,1,0,0,2240,522,1,0,0,0,2241,2242,7,16,0,0,2242,2243,7,3,0,
-        0,2243,2244,7,15,0,0,2244,524,1,0,0,0,2245,2246,7,12,0,0,2246,2247,
-        7,15,0,0,2247,2248,7,1,0,0,2248,2249,7,14,0,0,2249,2250,7,2,0,0,
-        2250,2251,7,1,0,0,2251,526,1,0,0,0,2252,2253,7,17,0,0,2253,2254,
-        7,3,0,0,2254,2255,7,10,0,0,2255,2256,7,1,0,0,2256,528,1,0,0,0,2257,
-        2258,7,17,0,0,2258,2267,7,0,0,0,2259,2260,7,22,0,0,2260,2261,7,1,
-        0,0,2261,2267,7,22,0,0,2262,2263,7,13,0,0,2263,2264,7,16,0,0,2264,
-        2265,7,17,0,0,2265,2267,7,0,0,0,2266,2257,1,0,0,0,2266,2259,1,0,
-        0,0,2266,2262,1,0,0,0,2267,530,1,0,0,0,2268,2269,7,13,0,0,2269,2270,
-        7,16,0,0,2270,2271,7,17,0,0,2271,2272,7,0,0,0,2272,2273,7,9,0,0,
-        2273,2274,7,0,0,0,2274,2275,7,1,0,0,2275,2276,7,15,0,0,2276,532,
-        1,0,0,0,2277,2278,7,15,0,0,2278,2279,7,4,0,0,2279,2280,7,18,0,0,
-        2280,2281,7,0,0,0,2281,534,1,0,0,0,2282,2283,3,115,43,0,2283,536,
-        1,0,0,0,2284,2285,5,44,0,0,2285,538,1,0,0,0,2286,2287,5,40,0,0,2287,
-        2288,1,0,0,0,2288,2289,6,255,36,0,2289,540,1,0,0,0,2290,2291,7,12,
-        0,0,2291,2292,7,4,0,0,2292,2293,7,5,0,0,2293,2294,7,19,0,0,2294,
-        2295,7,1,0,0,2295,2296,7,15,0,0,2296,2297,7,2,0,0,2297,542,1,0,0,
-        0,2298,2299,7,2,0,0,2299,2300,7,4,0,0,2300,544,1,0,0,0,2301,2308,
-        3,133,52,0,2302,2308,3,121,46,0,2303,2308,3,125,48,0,2304,2308,3,
-        135,53,0,2305,2308,3,137,54,0,2306,2308,7,39,0,0,2307,2301,1,0,0,
-        0,2307,2302,1,0,0,0,2307,2303,1,0,0,0,2307,2304,1,0,0,0,2307,2305,
-        1,0,0,0,2307,2306,1,0,0,0,2308,2309,1,0,0,0,2309,2307,1,0,0,0,2309,
-        2310,1,0,0,0,2310,546,1,0,0,0,2311,2313,7,40,0,0,2312,2311,1,0,0,
-        0,2313,2314,1,0,0,0,2314,2312,1,0,0,0,2314,2315,1,0,0,0,2315,2316,
-        1,0,0,0,2316,2317,6,259,1,0,2317,548,1,0,0,0,2318,2319,5,41,0,0,
-        2319,550,1,0,0,0,2320,2322,9,0,0,0,2321,2320,1,0,0,0,2322,2325,1,
-        0,0,0,2323,2324,1,0,0,0,2323,2321,1,0,0,0,2324,2326,1,0,0,0,2325,
-        2323,1,0,0,0,2326,2328,3,549,260,0,2327,2323,1,0,0,0,2328,2329,1,
-        0,0,0,2329,2327,1,0,0,0,2329,2330,1,0,0,0,2330,2331,1,0,0,0,2331,
-        2332,6,261,27,0,2332,552,1,0,0,0,2333,2335,7,6,0,0,2334,2333,1,0,
-        0,0,2335,2336,1,0,0,0,2336,2334,1,0,0,0,2336,2337,1,0,0,0,2337,2338,
-        1,0,0,0,2338,2339,6,262,1,0,2339,554,1,0,0,0,2340,2342,7,41,0,0,
-        2341,2340,1,0,0,0,2342,2343,1,0,0,0,2343,2341,1,0,0,0,2343,2344,
-        1,0,0,0,2344,556,1,0,0,0,2345,2346,3,39,5,0,2346,2347,1,0,0,0,2347,
-        2348,6,264,27,0,2348,558,1,0,0,0,2349,2350,5,59,0,0,2350,560,1,0,
-        0,0,2351,2353,7,6,0,0,2352,2351,1,0,0,0,2353,2354,1,0,0,0,2354,2352,
-        1,0,0,0,2354,2355,1,0,0,0,2355,2356,1,0,0,0,2356,2357,6,266,1,0,
-        2357,562,1,0,0,0,2358,2359,7,22,0,0,2359,2360,7,4,0,0,2360,2361,
-        7,5,0,0,2361,2362,7,3,0,0,2362,2363,7,2,0,0,2363,2364,7,4,0,0,2364,
-        2365,7,15,0,0,2365,2366,7,22,0,0,2366,2367,7,14,0,0,2367,2368,7,
-        5,0,0,2368,2369,7,14,0,0,2369,2370,7,30,0,0,2370,2371,7,1,0,0,2371,
-        2372,7,15,0,0,2372,564,1,0,0,0,2373,2374,7,18,0,0,2374,2375,7,4,
-        0,0,2375,2376,7,15,0,0,2376,2377,7,37,0,0,2377,2378,7,1,0,0,2378,
-        2379,7,15,0,0,2379,2380,7,0,0,0,2380,566,1,0,0,0,2381,2382,7,12,
-        0,0,2382,2383,7,15,0,0,2383,2384,7,1,0,0,2384,2385,7,14,0,0,2385,
-        2386,7,2,0,0,2386,2387,7,1,0,0,2387,568,1,0,0,0,2388,2389,7,2,0,
-        0,2389,2390,7,14,0,0,2390,2391,7,0,0,0,2391,2392,7,37,0,0,2392,570,
-        1,0,0,0,2393,2394,5,61,0,0,2394,572,1,0,0,0,2395,2396,7,0,0,0,2396,
-        2397,7,2,0,0,2397,2398,7,14,0,0,2398,2399,7,15,0,0,2399,2400,7,2,
-        0,0,2400,574,1,0,0,0,2401,2402,7,0,0,0,2402,2403,7,2,0,0,2403,2404,
-        7,4,0,0,2404,2405,7,11,0,0,2405,576,1,0,0,0,2406,2407,7,15,0,0,2407,
-        2408,7,1,0,0,2408,2409,7,11,0,0,2409,2410,7,4,0,0,2410,2411,7,15,
-        0,0,2411,2412,7,2,0,0,2412,578,1,0,0,0,2413,2414,7,10,0,0,2414,2415,
-        7,3,0,0,2415,2416,7,0,0,0,2416,2417,7,2,0,0,2417,580,1,0,0,0,2418,
-        2419,7,4,0,0,2419,2420,7,5,0,0,2420,582,1,0,0,0,2421,2422,7,4,0,
-        0,2422,2423,7,17,0,0,2423,2424,7,17,0,0,2424,584,1,0,0,0,2425,2431,
-        3,133,52,0,2426,2431,3,121,46,0,2427,2431,3,125,48,0,2428,2431,3,
-        135,53,0,2429,2431,3,137,54,0,2430,2425,1,0,0,0,2430,2426,1,0,0,
-        0,2430,2427,1,0,0,0,2430,2428,1,0,0,0,2430,2429,1,0,0,0,2431,2432,
-        1,0,0,0,2432,2430,1,0,0,0,2432,2433,1,0,0,0,2433,586,1,0,0,0,2434,
-        2435,3,39,5,0,2435,2436,1,0,0,0,2436,2437,6,279,27,0,2437,588,1,
-        0,0,0,2438,2439,5,59,0,0,2439,590,1,0,0,0,2440,2442,7,6,0,0,2441,
-        2440,1,0,0,0,2442,2443,1,0,0,0,2443,2441,1,0,0,0,2443,2444,1,0,0,
-        0,2444,2445,1,0,0,0,2445,2446,6,281,1,0,2446,592,1,0,0,0,2447,2453,
-        3,133,52,0,2448,2453,3,121,46,0,2449,2453,3,125,48,0,2450,2453,3,
-        135,53,0,2451,2453,3,137,54,0,2452,2447,1,0,0,0,2452,2448,1,0,0,
-        0,2452,2449,1,0,0,0,2452,2450,1,0,0,0,2452,2451,1,0,0,0,2453,2454,
-        1,0,0,0,2454,2452,1,0,0,0,2454,2455,1,0,0,0,2455,594,1,0,0,0,2456,
-        2457,3,39,5,0,2457,2458,1,0,0,0,2458,2459,6,283,27,0,2459,596,1,
-        0,0,0,2460,2461,5,59,0,0,2461,598,1,0,0,0,2462,2464,7,6,0,0,2463,
-        2462,1,0,0,0,2464,2465,1,0,0,0,2465,2463,1,0,0,0,2465,2466,1,0,0,
-        0,2466,2467,1,0,0,0,2467,2468,6,285,1,0,2468,600,1,0,0,0,2469,2476,
-        3,133,52,0,2470,2476,3,121,46,0,2471,2476,3,125,48,0,2472,2476,3,
-        135,53,0,2473,2476,3,137,54,0,2474,2476,7,39,0,0,2475,2469,1,0,0,
-        0,2475,2470,1,0,0,0,2475,2471,1,0,0,0,2475,2472,1,0,0,0,2475,2473,
-        1,0,0,0,2475,2474,1,0,0,0,2476,2477,1,0,0,0,2477,2475,1,0,0,0,2477,
-        2478,1,0,0,0,2478,602,1,0,0,0,2479,2480,3,39,5,0,2480,2481,1,0,0,
-        0,2481,2482,6,287,27,0,2482,604,1,0,0,0,2483,2484,5,59,0,0,2484,
-        606,1,0,0,0,130,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,
-        20,21,22,23,24,25,26,27,28,614,627,632,642,647,699,740,745,896,903,
-        908,914,922,924,929,950,952,954,963,967,969,971,982,998,1034,1047,
-        1057,1069,1075,1078,1091,1102,1104,1111,1121,1130,1161,1171,1176,
-        1199,1236,1238,1249,1286,1288,1299,1306,1313,1324,1335,1353,1364,
-        1366,1375,1442,1444,1455,1466,1468,1477,1488,1490,1499,1513,1525,
-        1581,1593,1628,1639,1641,1656,1667,1669,1688,1849,1866,1868,1873,
-        1987,1989,1994,2213,2215,2220,2266,2307,2309,2314,2323,2329,2336,
-        2343,2354,2430,2432,2443,2452,2454,2465,2475,2477,37,5,1,0,0,1,0,
-        5,6,0,5,7,0,5,28,0,5,19,0,5,9,0,5,8,0,5,10,0,5,12,0,5,11,0,5,13,
-        0,5,25,0,5,14,0,5,18,0,5,17,0,5,15,0,5,16,0,5,20,0,5,21,0,5,22,0,
-        5,23,0,5,26,0,5,27,0,0,2,0,7,6,0,2,2,0,4,0,0,2,3,0,3,0,0,2,4,0,6,
-        0,0,2,5,0,7,46,0,7,51,0,2,0,0,5,24,0
+        2,284,7,284,2,285,7,285,2,286,7,286,2,287,7,287,2,288,7,288,2,289,
+        7,289,2,290,7,290,1,0,1,0,1,0,1,0,1,0,5,0,617,8,0,10,0,12,0,620,
+        9,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,5,1,630,8,1,10,1,12,1,633,9,
+        1,1,1,1,1,3,1,637,8,1,1,1,1,1,1,2,1,2,1,2,1,2,5,2,645,8,2,10,2,12,
+        2,648,9,2,1,2,1,2,3,2,652,8,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,
+        7,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,1,14,1,
+        14,1,15,1,15,1,16,1,16,1,17,1,17,1,18,1,18,1,19,4,19,702,8,19,11,
+        19,12,19,703,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,
+        21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,
+        23,1,23,1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,
+        24,5,24,743,8,24,10,24,12,24,746,9,24,1,24,1,24,3,24,750,8,24,1,
+        24,1,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,
+        26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,
+        27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,
+        29,1,29,1,29,1,29,1,29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,
+        31,1,31,1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,
+        33,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,
+        34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,
+        36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,
+        37,1,37,1,37,1,37,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,
+        39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,1,
+        40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,
+        41,1,41,1,42,1,42,4,42,899,8,42,11,42,12,42,900,1,42,1,42,1,43,4,
+        43,906,8,43,11,43,12,43,907,1,44,4,44,911,8,44,11,44,12,44,912,1,
+        44,1,44,4,44,917,8,44,11,44,12,44,918,1,45,1,45,1,45,1,45,1,45,1,
+        45,4,45,927,8,45,11,45,12,45,928,1,46,1,46,1,46,3,46,934,8,46,1,
+        47,1,47,1,48,1,48,1,48,1,48,1,49,1,49,1,50,1,50,1,51,1,51,1,52,1,
+        52,1,53,1,53,1,53,1,53,1,53,3,53,955,8,53,5,53,957,8,53,10,53,12,
+        53,960,9,53,1,53,1,53,1,54,1,54,1,54,1,54,3,54,968,8,54,1,54,1,54,
+        3,54,972,8,54,5,54,974,8,54,10,54,12,54,977,9,54,1,54,1,54,1,55,
+        1,55,1,55,1,55,5,55,985,8,55,10,55,12,55,988,9,55,1,55,1,55,1,55,
+        1,55,1,56,1,56,1,56,1,56,1,57,1,57,1,58,4,58,1001,8,58,11,58,12,
+        58,1002,1,58,1,58,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,
+        59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,
+        59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,3,59,1039,8,59,1,
+        59,1,59,1,60,1,60,1,60,1,60,1,60,1,60,1,61,4,61,1050,8,61,11,61,
+        12,61,1051,1,62,1,62,1,62,1,62,1,62,1,63,5,63,1060,8,63,10,63,12,
+        63,1063,9,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,4,63,1072,8,63,11,
+        63,12,63,1073,1,63,1,63,4,63,1078,8,63,11,63,12,63,1079,1,63,3,63,
+        1083,8,63,1,63,1,63,1,63,1,63,1,64,1,64,1,64,1,64,1,65,4,65,1094,
+        8,65,11,65,12,65,1095,1,65,1,65,1,66,1,66,1,66,1,66,1,66,1,66,1,
+        66,4,66,1107,8,66,11,66,12,66,1108,1,67,1,67,1,67,1,67,1,68,3,68,
+        1116,8,68,1,68,1,68,1,68,1,68,1,68,1,69,4,69,1124,8,69,11,69,12,
+        69,1125,1,70,1,70,1,70,1,70,1,71,4,71,1133,8,71,11,71,12,71,1134,
+        1,71,1,71,1,72,1,72,1,72,1,72,1,73,1,73,1,73,1,73,1,73,1,73,1,73,
+        1,73,1,73,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,75,1,75,1,75,
+        1,75,5,75,1164,8,75,10,75,12,75,1167,9,75,1,75,1,75,1,75,1,75,1,
+        76,1,76,1,76,3,76,1176,8,76,1,76,5,76,1179,8,76,10,76,12,76,1182,
+        9,76,1,76,1,76,1,77,1,77,1,77,1,77,1,77,1,77,1,77,1,78,1,78,1,78,
+        1,78,1,79,1,79,1,79,1,79,1,80,4,80,1202,8,80,11,80,12,80,1203,1,
+        80,1,80,1,81,1,81,1,81,1,81,1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,
+        82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,83,1,83,1,83,1,84,1,84,1,
+        84,1,84,1,85,1,85,1,85,1,85,1,85,1,85,1,85,4,85,1241,8,85,11,85,
+        12,85,1242,1,86,1,86,1,87,1,87,1,87,1,87,1,88,4,88,1252,8,88,11,
+        88,12,88,1253,1,88,1,88,1,89,1,89,1,89,1,89,1,89,1,90,1,90,1,90,
+        1,90,1,90,1,90,1,90,1,90,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,91,
+        1,92,1,92,1,92,1,92,1,92,1,93,1,93,1,93,1,93,1,93,1,93,1,93,4,93,
+        1291,8,93,11,93,12,93,1292,1,94,1,94,1,95,1,95,1,95,1,95,1,96,5,
+        96,1302,8,96,10,96,12,96,1305,9,96,1,96,1,96,1,96,1,96,3,96,1311,
+        8,96,1,96,1,96,1,97,5,97,1316,8,97,10,97,12,97,1319,9,97,1,97,1,
+        97,1,97,1,97,1,97,1,97,4,97,1327,8,97,11,97,12,97,1328,1,97,1,97,
+        1,97,1,97,1,97,1,97,1,98,4,98,1338,8,98,11,98,12,98,1339,1,98,1,
+        98,1,99,1,99,1,99,1,100,1,100,1,100,1,101,1,101,1,101,1,101,1,102,
+        1,102,5,102,1356,8,102,10,102,12,102,1359,9,102,1,102,1,102,1,103,
+        1,103,1,103,1,103,1,103,1,103,4,103,1369,8,103,11,103,12,103,1370,
+        1,104,1,104,1,105,1,105,1,106,4,106,1378,8,106,11,106,12,106,1379,
+        1,106,1,106,1,107,1,107,1,108,1,108,1,108,1,108,1,108,1,108,1,108,
+        1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,110,1,110,1,110,1,110,
+        1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
+        1,112,1,112,1,112,1,112,1,112,1,113,1,113,1,113,1,113,1,113,1,113,
+        1,114,1,114,1,114,1,114,1,114,1,115,1,115,1,115,1,115,1,115,1,115,
+        1,116,1,116,1,116,1,116,1,117,1,117,1,117,1,117,1,117,1,117,4,117,
+        1447,8,117,11,117,12,117,1448,1,118,1,118,1,119,1,119,1,119,1,119,
+        1,120,4,120,1458,8,120,11,120,12,120,1459,1,120,1,120,1,121,1,121,
+        1,121,1,121,1,121,1,121,1,121,4,121,1471,8,121,11,121,12,121,1472,
+        1,122,1,122,1,122,1,122,1,123,4,123,1480,8,123,11,123,12,123,1481,
+        1,123,1,123,1,124,1,124,1,124,1,124,1,124,1,124,1,124,4,124,1493,
+        8,124,11,124,12,124,1494,1,125,1,125,1,125,1,125,1,126,4,126,1502,
+        8,126,11,126,12,126,1503,1,126,1,126,1,127,1,127,1,127,1,128,1,128,
+        1,128,1,129,1,129,5,129,1516,8,129,10,129,12,129,1519,9,129,1,129,
+        1,129,1,129,1,129,1,130,1,130,1,131,4,131,1528,8,131,11,131,12,131,
+        1529,1,131,1,131,1,132,1,132,1,132,1,132,1,132,1,132,1,133,1,133,
+        1,133,1,133,1,133,1,133,1,134,1,134,1,134,1,134,1,134,1,134,1,134,
+        1,134,1,134,1,135,1,135,1,136,1,136,1,136,1,137,1,137,1,137,1,138,
+        1,138,1,138,1,138,1,138,1,138,1,139,1,139,1,139,1,139,1,140,1,140,
+        1,140,1,140,1,140,1,140,1,140,1,140,1,140,1,141,1,141,5,141,1584,
+        8,141,10,141,12,141,1587,9,141,1,141,1,141,1,142,1,142,1,142,1,142,
+        1,143,4,143,1596,8,143,11,143,12,143,1597,1,143,1,143,1,144,1,144,
+        1,145,1,145,1,145,1,145,1,145,1,145,1,146,1,146,1,147,1,147,1,147,
+        1,147,1,147,1,147,1,147,1,147,1,147,1,148,1,148,1,148,1,148,1,148,
+        1,149,1,149,1,149,1,149,1,150,4,150,1631,8,150,11,150,12,150,1632,
+        1,150,1,150,1,151,1,151,1,151,1,151,1,151,1,151,1,151,4,151,1644,
+        8,151,11,151,12,151,1645,1,152,1,152,1,153,1,153,1,153,1,153,1,154,
+        1,154,1,154,1,154,1,155,4,155,1659,8,155,11,155,12,155,1660,1,155,
+        1,155,1,156,1,156,1,156,1,156,1,156,1,156,1,156,4,156,1672,8,156,
+        11,156,12,156,1673,1,157,1,157,1,158,1,158,1,158,1,158,1,159,1,159,
+        1,159,1,159,1,160,1,160,1,160,1,160,1,161,4,161,1691,8,161,11,161,
+        12,161,1692,1,161,1,161,1,162,1,162,1,163,1,163,1,163,1,163,1,164,
+        1,164,1,164,1,164,1,164,1,164,1,164,1,164,1,165,1,165,1,165,1,165,
+        1,165,1,166,1,166,1,166,1,166,1,166,1,167,1,167,1,167,1,167,1,168,
+        1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,169,1,169,1,169,1,169,
+        1,169,1,169,1,169,1,169,1,169,1,170,1,170,1,170,1,170,1,170,1,170,
+        1,170,1,170,1,171,1,171,1,171,1,171,1,171,1,171,1,171,1,171,1,171,
+        1,171,1,171,1,172,1,172,1,172,1,172,1,172,1,173,1,173,1,173,1,173,
+        1,173,1,173,1,173,1,173,1,174,1,174,1,174,1,174,1,174,1,175,1,175,
+        1,175,1,175,1,175,1,175,1,176,1,176,1,176,1,176,1,176,1,176,1,176,
+        1,177,1,177,1,177,1,177,1,177,1,177,1,178,1,178,1,178,1,178,1,178,
+        1,178,1,179,1,179,1,179,1,179,1,179,1,179,1,180,1,180,1,180,1,180,
+        1,181,1,181,1,181,1,181,1,182,1,182,1,182,1,182,1,182,1,182,1,182,
+        1,183,1,183,1,183,1,183,1,183,1,183,1,183,1,184,1,184,1,184,1,184,
+        1,184,1,184,1,184,1,184,1,185,1,185,1,185,1,185,1,185,1,185,1,185,
+        1,185,1,185,1,186,1,186,1,187,4,187,1852,8,187,11,187,12,187,1853,
+        1,187,1,187,1,188,1,188,1,189,1,189,1,189,1,189,1,190,1,190,1,190,
+        1,190,1,190,1,190,1,190,4,190,1871,8,190,11,190,12,190,1872,1,191,
+        4,191,1876,8,191,11,191,12,191,1877,1,191,1,191,1,192,1,192,1,193,
+        1,193,1,194,1,194,1,194,1,194,1,195,1,195,1,195,1,195,1,195,1,195,
+        1,195,1,196,1,196,1,196,1,196,1,196,1,197,1,197,1,197,1,197,1,198,
+        1,198,1,198,1,198,1,198,1,198,1,199,1,199,1,199,1,199,1,199,1,200,
+        1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,201,1,201,1,201,
+        1,201,1,201,1,201,1,202,1,202,1,202,1,202,1,202,1,202,1,203,1,203,
+        1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,204,1,204,1,204,1,204,
+        1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,205,1,205,1,205,1,205,
+        1,205,1,205,1,205,1,206,1,206,1,206,1,206,1,206,1,206,1,206,1,206,
+        1,206,1,206,1,206,1,207,1,207,1,207,1,208,1,208,1,208,1,208,1,209,
+        1,209,1,209,1,210,1,210,1,210,1,210,1,210,1,210,4,210,1992,8,210,
+        11,210,12,210,1993,1,211,4,211,1997,8,211,11,211,12,211,1998,1,211,
+        1,211,1,212,1,212,1,213,1,213,1,213,1,214,1,214,1,214,1,214,1,215,
+        1,215,1,215,1,215,1,216,1,216,1,216,1,216,1,216,1,216,1,217,1,217,
+        1,217,1,217,1,217,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,219,
+        1,219,1,219,1,219,1,219,1,219,1,219,1,219,1,219,1,220,1,220,1,220,
+        1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,221,1,221,1,221,
+        1,221,1,221,1,222,1,222,1,222,1,222,1,222,1,222,1,222,1,223,1,223,
+        1,223,1,223,1,223,1,223,1,223,1,223,1,224,1,224,1,224,1,224,1,224,
+        1,224,1,224,1,224,1,224,1,224,1,225,1,225,1,225,1,225,1,225,1,226,
+        1,226,1,226,1,226,1,226,1,226,1,226,1,227,1,227,1,227,1,227,1,227,
+        1,227,1,227,1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,229,
+        1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,230,1,230,1,230,
+        1,230,1,230,1,230,1,230,1,230,1,230,1,231,1,231,1,231,1,231,1,231,
+        1,231,1,231,1,231,1,231,1,232,1,232,1,232,1,232,1,232,1,232,1,232,
+        1,232,1,232,1,232,1,232,1,233,1,233,1,233,1,233,1,233,1,233,1,234,
+        1,234,1,234,1,234,1,234,1,234,1,234,1,234,1,234,1,234,1,235,1,235,
+        1,235,1,235,1,235,1,235,1,235,1,235,1,235,1,236,1,236,1,236,1,236,
+        1,236,1,237,1,237,1,237,1,237,1,237,1,237,1,237,1,237,1,237,1,237,
+        1,238,1,238,1,238,1,238,1,239,1,239,1,239,1,239,1,239,1,239,1,240,
+        1,240,1,240,1,240,1,240,1,240,1,240,1,240,1,241,1,241,1,241,1,241,
+        1,241,1,242,1,242,1,242,1,242,1,242,1,242,4,242,2218,8,242,11,242,
+        12,242,2219,1,243,4,243,2223,8,243,11,243,12,243,2224,1,243,1,243,
+        1,244,1,244,1,244,1,244,1,245,1,245,1,245,1,245,1,246,1,246,1,246,
+        1,246,1,246,1,246,1,246,1,246,1,246,1,247,1,247,1,247,1,247,1,248,
+        1,248,1,248,1,248,1,248,1,248,1,248,1,249,1,249,1,249,1,249,1,249,
+        1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,3,250,2271,
+        8,250,1,251,1,251,1,251,1,251,1,251,1,251,1,251,1,251,1,251,1,252,
+        1,252,1,252,1,252,1,252,1,253,1,253,1,254,1,254,1,255,1,255,1,255,
+        1,255,1,256,1,256,1,256,1,256,1,256,1,256,1,256,1,256,1,257,1,257,
+        1,257,1,258,1,258,1,258,1,258,1,258,1,258,4,258,2312,8,258,11,258,
+        12,258,2313,1,259,4,259,2317,8,259,11,259,12,259,2318,1,259,1,259,
+        1,260,1,260,1,261,5,261,2326,8,261,10,261,12,261,2329,9,261,1,261,
+        4,261,2332,8,261,11,261,12,261,2333,1,261,1,261,1,262,4,262,2339,
+        8,262,11,262,12,262,2340,1,262,1,262,1,263,4,263,2346,8,263,11,263,
+        12,263,2347,1,264,1,264,1,264,1,264,1,265,1,265,1,266,4,266,2357,
+        8,266,11,266,12,266,2358,1,266,1,266,1,267,1,267,1,267,1,267,1,267,
+        1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,268,
+        1,268,1,268,1,268,1,268,1,268,1,268,1,268,1,269,1,269,1,269,1,269,
+        1,269,1,269,1,269,1,270,1,270,1,270,1,270,1,270,1,271,1,271,1,272,
+        1,272,1,272,1,272,1,272,1,272,1,273,1,273,1,273,1,273,1,273,1,274,
+        1,274,1,274,1,274,1,274,1,274,1,274,1,275,1,275,1,275,1,275,1,275,
+        1,276,1,276,1,276,1,276,1,276,1,276,1,276,1,276,1,277,1,277,1,277,
+        1,277,1,277,1,277,1,277,1,278,1,278,1,278,1,279,1,279,1,279,1,279,
+        1,280,1,280,1,280,1,280,1,280,4,280,2450,8,280,11,280,12,280,2451,
+        1,281,1,281,1,281,1,281,1,282,1,282,1,283,4,283,2461,8,283,11,283,
+        12,283,2462,1,283,1,283,1,284,1,284,1,284,1,284,1,284,4,284,2472,
+        8,284,11,284,12,284,2473,1,285,1,285,1,285,1,285,1,286,1,286,1,287,
+        4,287,2483,8,287,11,287,12,287,2484,1,287,1,287,1,288,1,288,1,288,
+        1,288,1,288,1,288,4,288,2495,8,288,11,288,12,288,2496,1,289,1,289,
+        1,289,1,289,1,290,1,290,14,618,631,646,744,986,1061,1165,1180,1303,
+        1317,1357,1517,1585,2327,0,291,29,1,31,2,33,3,35,4,37,5,39,6,41,
+        7,43,8,45,9,47,10,49,11,51,12,53,13,55,14,57,15,59,16,61,17,63,18,
+        65,19,67,20,69,21,71,22,73,23,75,24,77,25,79,26,81,27,83,28,85,29,
+        87,30,89,31,91,32,93,33,95,34,97,35,99,36,101,37,103,38,105,39,107,
+        40,109,41,111,42,113,43,115,44,117,45,119,46,121,0,123,0,125,0,127,
+        0,129,0,131,0,133,0,135,0,137,0,139,47,141,0,143,48,145,49,147,50,
+        149,51,151,52,153,0,155,53,157,0,159,54,161,55,163,56,165,57,167,
+        58,169,59,171,0,173,0,175,60,177,61,179,62,181,63,183,0,185,0,187,
+        0,189,64,191,65,193,66,195,67,197,68,199,69,201,70,203,71,205,72,
+        207,73,209,74,211,75,213,76,215,77,217,78,219,79,221,80,223,81,225,
+        82,227,83,229,84,231,85,233,86,235,87,237,88,239,89,241,90,243,91,
+        245,92,247,93,249,94,251,95,253,96,255,97,257,98,259,99,261,100,
+        263,101,265,102,267,103,269,104,271,105,273,106,275,107,277,108,
+        279,109,281,110,283,111,285,112,287,113,289,114,291,115,293,116,
+        295,117,297,118,299,119,301,120,303,121,305,122,307,123,309,124,
+        311,125,313,126,315,127,317,128,319,129,321,130,323,131,325,132,
+        327,133,329,134,331,135,333,136,335,137,337,138,339,139,341,140,
+        343,141,345,142,347,143,349,144,351,145,353,146,355,147,357,148,
+        359,149,361,150,363,151,365,152,367,153,369,154,371,155,373,156,
+        375,157,377,158,379,159,381,160,383,161,385,162,387,163,389,164,
+        391,165,393,166,395,167,397,168,399,169,401,170,403,171,405,172,
+        407,173,409,174,411,175,413,176,415,177,417,178,419,179,421,180,
+        423,181,425,182,427,183,429,184,431,185,433,186,435,187,437,188,
+        439,189,441,190,443,191,445,192,447,193,449,194,451,195,453,196,
+        455,197,457,198,459,199,461,200,463,201,465,202,467,203,469,204,
+        471,205,473,206,475,207,477,208,479,209,481,210,483,211,485,212,
+        487,213,489,214,491,215,493,216,495,217,497,218,499,219,501,220,
+        503,221,505,222,507,223,509,224,511,225,513,226,515,227,517,228,
+        519,229,521,230,523,231,525,232,527,233,529,234,531,235,533,236,
+        535,237,537,238,539,239,541,240,543,241,545,242,547,243,549,244,
+        551,245,553,246,555,247,557,248,559,249,561,250,563,251,565,252,
+        567,253,569,254,571,255,573,256,575,257,577,258,579,259,581,260,
+        583,261,585,262,587,263,589,264,591,265,593,266,595,267,597,268,
+        599,269,601,270,603,271,605,272,607,273,609,274,29,0,1,2,3,4,5,6,
+        7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,42,
+        2,0,83,83,115,115,2,0,69,69,101,101,2,0,84,84,116,116,2,0,73,73,
+        105,105,2,0,79,79,111,111,2,0,78,78,110,110,2,0,9,9,32,32,2,0,88,
+        88,120,120,2,0,81,81,113,113,2,0,85,85,117,117,2,0,76,76,108,108,
+        2,0,80,80,112,112,2,0,67,67,99,99,2,0,72,72,104,104,2,0,65,65,97,
+        97,2,0,82,82,114,114,2,0,68,68,100,100,2,0,70,70,102,102,2,0,87,
+        87,119,119,2,0,86,86,118,118,2,0,74,74,106,106,2,0,66,66,98,98,2,
+        0,77,77,109,109,2,0,65,90,97,122,3,0,45,46,95,95,126,126,5,0,33,
+        33,36,36,38,38,40,43,61,61,1,0,48,57,3,0,48,57,65,70,97,102,1,0,
+        34,34,1,0,39,39,2,0,71,71,103,103,2,0,10,10,13,13,2,0,60,60,62,62,
+        2,0,89,89,121,121,7,0,37,37,47,47,58,58,64,64,92,92,123,123,125,
+        125,3,0,47,47,58,58,92,92,4,0,32,32,47,47,58,58,92,92,2,0,75,75,
+        107,107,6,0,44,44,47,47,58,58,64,64,92,92,123,125,5,0,47,47,58,58,
+        92,92,123,123,125,125,2,0,9,10,32,32,3,0,48,57,65,90,97,122,2648,
+        0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,
+        0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,
+        0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,
+        0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,
+        0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,
+        0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,
+        0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,
+        0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,
+        0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,0,117,
+        1,0,0,0,0,119,1,0,0,0,1,139,1,0,0,0,1,141,1,0,0,0,1,143,1,0,0,0,
+        1,145,1,0,0,0,1,147,1,0,0,0,1,149,1,0,0,0,2,151,1,0,0,0,2,153,1,
+        0,0,0,2,155,1,0,0,0,2,157,1,0,0,0,3,159,1,0,0,0,3,161,1,0,0,0,3,
+        163,1,0,0,0,3,165,1,0,0,0,4,167,1,0,0,0,4,169,1,0,0,0,5,171,1,0,
+        0,0,5,173,1,0,0,0,5,175,1,0,0,0,5,177,1,0,0,0,5,179,1,0,0,0,5,181,
+        1,0,0,0,5,183,1,0,0,0,5,185,1,0,0,0,5,187,1,0,0,0,6,189,1,0,0,0,
+        6,191,1,0,0,0,6,193,1,0,0,0,6,195,1,0,0,0,6,197,1,0,0,0,6,199,1,
+        0,0,0,6,201,1,0,0,0,6,203,1,0,0,0,7,205,1,0,0,0,7,207,1,0,0,0,7,
+        209,1,0,0,0,7,211,1,0,0,0,7,213,1,0,0,0,7,215,1,0,0,0,7,217,1,0,
+        0,0,7,219,1,0,0,0,8,221,1,0,0,0,9,223,1,0,0,0,10,225,1,0,0,0,10,
+        227,1,0,0,0,10,229,1,0,0,0,10,231,1,0,0,0,10,233,1,0,0,0,10,235,
+        1,0,0,0,10,237,1,0,0,0,10,239,1,0,0,0,11,241,1,0,0,0,11,243,1,0,
+        0,0,11,245,1,0,0,0,11,247,1,0,0,0,11,249,1,0,0,0,11,251,1,0,0,0,
+        11,253,1,0,0,0,11,255,1,0,0,0,11,257,1,0,0,0,11,259,1,0,0,0,11,261,
+        1,0,0,0,11,263,1,0,0,0,11,265,1,0,0,0,11,267,1,0,0,0,12,269,1,0,
+        0,0,12,271,1,0,0,0,12,273,1,0,0,0,13,275,1,0,0,0,13,277,1,0,0,0,
+        13,279,1,0,0,0,14,281,1,0,0,0,14,283,1,0,0,0,14,285,1,0,0,0,14,287,
+        1,0,0,0,15,289,1,0,0,0,15,291,1,0,0,0,15,293,1,0,0,0,15,295,1,0,
+        0,0,15,297,1,0,0,0,15,299,1,0,0,0,15,301,1,0,0,0,15,303,1,0,0,0,
+        15,305,1,0,0,0,15,307,1,0,0,0,15,309,1,0,0,0,15,311,1,0,0,0,15,313,
+        1,0,0,0,16,315,1,0,0,0,16,317,1,0,0,0,16,319,1,0,0,0,16,321,1,0,
+        0,0,16,323,1,0,0,0,16,325,1,0,0,0,16,327,1,0,0,0,17,329,1,0,0,0,
+        17,331,1,0,0,0,17,333,1,0,0,0,17,335,1,0,0,0,17,337,1,0,0,0,18,339,
+        1,0,0,0,18,341,1,0,0,0,18,343,1,0,0,0,18,345,1,0,0,0,19,347,1,0,
+        0,0,19,349,1,0,0,0,19,351,1,0,0,0,19,353,1,0,0,0,19,355,1,0,0,0,
+        20,357,1,0,0,0,20,359,1,0,0,0,20,361,1,0,0,0,20,363,1,0,0,0,20,365,
+        1,0,0,0,20,367,1,0,0,0,20,369,1,0,0,0,20,371,1,0,0,0,20,373,1,0,
+        0,0,20,375,1,0,0,0,20,377,1,0,0,0,20,379,1,0,0,0,20,381,1,0,0,0,
+        20,383,1,0,0,0,20,385,1,0,0,0,20,387,1,0,0,0,20,389,1,0,0,0,20,391,
+        1,0,0,0,20,393,1,0,0,0,20,395,1,0,0,0,20,397,1,0,0,0,20,399,1,0,
+        0,0,20,401,1,0,0,0,20,403,1,0,0,0,20,405,1,0,0,0,20,407,1,0,0,0,
+        20,409,1,0,0,0,21,411,1,0,0,0,21,413,1,0,0,0,21,415,1,0,0,0,21,417,
+        1,0,0,0,21,419,1,0,0,0,21,421,1,0,0,0,21,423,1,0,0,0,21,425,1,0,
+        0,0,21,427,1,0,0,0,21,429,1,0,0,0,21,431,1,0,0,0,21,433,1,0,0,0,
+        21,435,1,0,0,0,21,437,1,0,0,0,21,439,1,0,0,0,21,441,1,0,0,0,21,443,
+        1,0,0,0,21,445,1,0,0,0,21,447,1,0,0,0,21,449,1,0,0,0,22,451,1,0,
+        0,0,22,453,1,0,0,0,22,455,1,0,0,0,22,457,1,0,0,0,22,459,1,0,0,0,
+        22,461,1,0,0,0,22,463,1,0,0,0,22,465,1,0,0,0,22,467,1,0,0,0,22,469,
+        1,0,0,0,22,471,1,0,0,0,22,473,1,0,0,0,22,475,1,0,0,0,22,477,1,0,
+        0,0,22,479,1,0,0,0,22,481,1,0,0,0,22,483,1,0,0,0,22,485,1,0,0,0,
+        22,487,1,0,0,0,22,489,1,0,0,0,22,491,1,0,0,0,22,493,1,0,0,0,22,495,
+        1,0,0,0,22,497,1,0,0,0,22,499,1,0,0,0,22,501,1,0,0,0,22,503,1,0,
+        0,0,22,505,1,0,0,0,22,507,1,0,0,0,22,509,1,0,0,0,22,511,1,0,0,0,
+        22,513,1,0,0,0,23,515,1,0,0,0,23,517,1,0,0,0,23,519,1,0,0,0,23,521,
+        1,0,0,0,23,523,1,0,0,0,23,525,1,0,0,0,23,527,1,0,0,0,23,529,1,0,
+        0,0,23,531,1,0,0,0,23,533,1,0,0,0,23,535,1,0,0,0,23,537,1,0,0,0,
+        23,539,1,0,0,0,23,541,1,0,0,0,23,543,1,0,0,0,23,545,1,0,0,0,24,547,
+        1,0,0,0,24,549,1,0,0,0,24,551,1,0,0,0,25,553,1,0,0,0,25,555,1,0,
+        0,0,25,557,1,0,0,0,25,559,1,0,0,0,26,561,1,0,0,0,26,563,1,0,0,0,
+        26,565,1,0,0,0,26,567,1,0,0,0,26,569,1,0,0,0,26,571,1,0,0,0,26,573,
+        1,0,0,0,26,575,1,0,0,0,26,577,1,0,0,0,26,579,1,0,0,0,26,581,1,0,
+        0,0,26,583,1,0,0,0,26,585,1,0,0,0,26,587,1,0,0,0,26,589,1,0,0,0,
+        26,591,1,0,0,0,26,593,1,0,0,0,27,595,1,0,0,0,27,597,1,0,0,0,27,599,
+        1,0,0,0,27,601,1,0,0,0,28,603,1,0,0,0,28,605,1,0,0,0,28,607,1,0,
+        0,0,28,609,1,0,0,0,29,611,1,0,0,0,31,625,1,0,0,0,33,640,1,0,0,0,
+        35,655,1,0,0,0,37,661,1,0,0,0,39,672,1,0,0,0,41,674,1,0,0,0,43,676,
+        1,0,0,0,45,678,1,0,0,0,47,680,1,0,0,0,49,682,1,0,0,0,51,684,1,0,
+        0,0,53,686,1,0,0,0,55,688,1,0,0,0,57,690,1,0,0,0,59,692,1,0,0,0,
+        61,694,1,0,0,0,63,696,1,0,0,0,65,698,1,0,0,0,67,701,1,0,0,0,69,707,
+        1,0,0,0,71,713,1,0,0,0,73,719,1,0,0,0,75,728,1,0,0,0,77,735,1,0,
+        0,0,79,753,1,0,0,0,81,760,1,0,0,0,83,770,1,0,0,0,85,779,1,0,0,0,
+        87,787,1,0,0,0,89,795,1,0,0,0,91,803,1,0,0,0,93,809,1,0,0,0,95,816,
+        1,0,0,0,97,823,1,0,0,0,99,832,1,0,0,0,101,840,1,0,0,0,103,852,1,
+        0,0,0,105,859,1,0,0,0,107,866,1,0,0,0,109,877,1,0,0,0,111,885,1,
+        0,0,0,113,896,1,0,0,0,115,905,1,0,0,0,117,910,1,0,0,0,119,926,1,
+        0,0,0,121,933,1,0,0,0,123,935,1,0,0,0,125,937,1,0,0,0,127,941,1,
+        0,0,0,129,943,1,0,0,0,131,945,1,0,0,0,133,947,1,0,0,0,135,949,1,
+        0,0,0,137,963,1,0,0,0,139,980,1,0,0,0,141,993,1,0,0,0,143,997,1,
+        0,0,0,145,1000,1,0,0,0,147,1038,1,0,0,0,149,1042,1,0,0,0,151,1049,
+        1,0,0,0,153,1053,1,0,0,0,155,1061,1,0,0,0,157,1088,1,0,0,0,159,1093,
+        1,0,0,0,161,1106,1,0,0,0,163,1110,1,0,0,0,165,1115,1,0,0,0,167,1123,
+        1,0,0,0,169,1127,1,0,0,0,171,1132,1,0,0,0,173,1138,1,0,0,0,175,1142,
+        1,0,0,0,177,1151,1,0,0,0,179,1159,1,0,0,0,181,1175,1,0,0,0,183,1185,
+        1,0,0,0,185,1192,1,0,0,0,187,1196,1,0,0,0,189,1201,1,0,0,0,191,1207,
+        1,0,0,0,193,1213,1,0,0,0,195,1226,1,0,0,0,197,1229,1,0,0,0,199,1240,
+        1,0,0,0,201,1244,1,0,0,0,203,1246,1,0,0,0,205,1251,1,0,0,0,207,1257,
+        1,0,0,0,209,1262,1,0,0,0,211,1270,1,0,0,0,213,1278,1,0,0,0,215,1290,
+        1,0,0,0,217,1294,1,0,0,0,219,1296,1,0,0,0,221,1303,1,0,0,0,223,1317,
+        1,0,0,0,225,1337,1,0,0,0,227,1343,1,0,0,0,229,1346,1,0,0,0,231,1349,
+        1,0,0,0,233,1353,1,0,0,0,235,1368,1,0,0,0,237,1372,1,0,0,0,239,1374,
+        1,0,0,0,241,1377,1,0,0,0,243,1383,1,0,0,0,245,1385,1,0,0,0,247,1392,
+        1,0,0,0,249,1399,1,0,0,0,251,1403,1,0,0,0,253,1414,1,0,0,0,255,1419,
+        1,0,0,0,257,1425,1,0,0,0,259,1430,1,0,0,0,261,1436,1,0,0,0,263,1446,
+        1,0,0,0,265,1450,1,0,0,0,267,1452,1,0,0,0,269,1457,1,0,0,0,271,1470,
+        1,0,0,0,273,1474,1,0,0,0,275,1479,1,0,0,0,277,1492,1,0,0,0,279,1496,
+        1,0,0,0,281,1501,1,0,0,0,283,1507,1,0,0,0,285,1510,1,0,0,0,287,1513,
+        1,0,0,0,289,1524,1,0,0,0,291,1527,1,0,0,0,293,1533,1,0,0,0,295,1539,
+        1,0,0,0,297,1545,1,0,0,0,299,1554,1,0,0,0,301,1556,1,0,0,0,303,1559,
+        1,0,0,0,305,1562,1,0,0,0,307,1568,1,0,0,0,309,1572,1,0,0,0,311,1581,
+        1,0,0,0,313,1590,1,0,0,0,315,1595,1,0,0,0,317,1601,1,0,0,0,319,1603,
+        1,0,0,0,321,1609,1,0,0,0,323,1611,1,0,0,0,325,1620,1,0,0,0,327,1625,
+        1,0,0,0,329,1630,1,0,0,0,331,1643,1,0,0,0,333,1647,1,0,0,0,335,1649,
+        1,0,0,0,337,1653,1,0,0,0,339,1658,1,0,0,0,341,1671,1,0,0,0,343,1675,
+        1,0,0,0,345,1677,1,0,0,0,347,1681,1,0,0,0,349,1685,1,0,0,0,351,1690,
+        1,0,0,0,353,1696,1,0,0,0,355,1698,1,0,0,0,357,1702,1,0,0,0,359,1710,
+        1,0,0,0,361,1715,1,0,0,0,363,1720,1,0,0,0,365,1724,1,0,0,0,367,1732,
+        1,0,0,0,369,1741,1,0,0,0,371,1749,1,0,0,0,373,1760,1,0,0,0,375,1765,
+        1,0,0,0,377,1773,1,0,0,0,379,1778,1,0,0,0,381,1784,1,0,0,0,383,1791,
+        1,0,0,0,385,1797,1,0,0,0,387,1803,1,0,0,0,389,1809,1,0,0,0,391,1813,
+        1,0,0,0,393,1817,1,0,0,0,395,1824,1,0,0,0,397,1831,1,0,0,0,399,1839,
+        1,0,0,0,401,1848,1,0,0,0,403,1851,1,0,0,0,405,1857,1,0,0,0,407,1859,
+        1,0,0,0,409,1870,1,0,0,0,411,1875,1,0,0,0,413,1881,1,0,0,0,415,1883,
+        1,0,0,0,417,1885,1,0,0,0,419,1889,1,0,0,0,421,1896,1,0,0,0,423,1901,
+        1,0,0,0,425,1905,1,0,0,0,427,1911,1,0,0,0,429,1916,1,0,0,0,431,1925,
+        1,0,0,0,433,1931,1,0,0,0,435,1937,1,0,0,0,437,1946,1,0,0,0,439,1957,
+        1,0,0,0,441,1964,1,0,0,0,443,1975,1,0,0,0,445,1978,1,0,0,0,447,1982,
+        1,0,0,0,449,1991,1,0,0,0,451,1996,1,0,0,0,453,2002,1,0,0,0,455,2004,
+        1,0,0,0,457,2007,1,0,0,0,459,2011,1,0,0,0,461,2015,1,0,0,0,463,2021,
+        1,0,0,0,465,2026,1,0,0,0,467,2033,1,0,0,0,469,2042,1,0,0,0,471,2053,
+        1,0,0,0,473,2058,1,0,0,0,475,2065,1,0,0,0,477,2073,1,0,0,0,479,2083,
+        1,0,0,0,481,2088,1,0,0,0,483,2095,1,0,0,0,485,2102,1,0,0,0,487,2110,
+        1,0,0,0,489,2119,1,0,0,0,491,2128,1,0,0,0,493,2137,1,0,0,0,495,2148,
+        1,0,0,0,497,2154,1,0,0,0,499,2164,1,0,0,0,501,2173,1,0,0,0,503,2178,
+        1,0,0,0,505,2188,1,0,0,0,507,2192,1,0,0,0,509,2198,1,0,0,0,511,2206,
+        1,0,0,0,513,2217,1,0,0,0,515,2222,1,0,0,0,517,2228,1,0,0,0,519,2232,
+        1,0,0,0,521,2236,1,0,0,0,523,2245,1,0,0,0,525,2249,1,0,0,0,527,2256,
+        1,0,0,0,529,2270,1,0,0,0,531,2272,1,0,0,0,533,2281,1,0,0,0,535,2286,
+        1,0,0,0,537,2288,1,0,0,0,539,2290,1,0,0,0,541,2294,1,0,0,0,543,2302,
+        1,0,0,0,545,2311,1,0,0,0,547,2316,1,0,0,0,549,2322,1,0,0,0,551,2331,
+        1,0,0,0,553,2338,1,0,0,0,555,2345,1,0,0,0,557,2349,1,0,0,0,559,2353,
+        1,0,0,0,561,2356,1,0,0,0,563,2362,1,0,0,0,565,2377,1,0,0,0,567,2385,
+        1,0,0,0,569,2392,1,0,0,0,571,2397,1,0,0,0,573,2399,1,0,0,0,575,2405,
+        1,0,0,0,577,2410,1,0,0,0,579,2417,1,0,0,0,581,2422,1,0,0,0,583,2430,
+        1,0,0,0,585,2437,1,0,0,0,587,2440,1,0,0,0,589,2449,1,0,0,0,591,2453,
+        1,0,0,0,593,2457,1,0,0,0,595,2460,1,0,0,0,597,2471,1,0,0,0,599,2475,
+        1,0,0,0,601,2479,1,0,0,0,603,2482,1,0,0,0,605,2494,1,0,0,0,607,2498,
+        1,0,0,0,609,2502,1,0,0,0,611,612,5,35,0,0,612,613,5,35,0,0,613,614,
+        5,35,0,0,614,618,1,0,0,0,615,617,9,0,0,0,616,615,1,0,0,0,617,620,
+        1,0,0,0,618,619,1,0,0,0,618,616,1,0,0,0,619,621,1,0,0,0,620,618,
+        1,0,0,0,621,622,3,39,5,0,622,623,1,0,0,0,623,624,6,0,0,0,624,30,
+        1,0,0,0,625,626,5,47,0,0,626,627,5,47,0,0,627,631,1,0,0,0,628,630,
+        9,0,0,0,629,628,1,0,0,0,630,633,1,0,0,0,631,632,1,0,0,0,631,629,
+        1,0,0,0,632,636,1,0,0,0,633,631,1,0,0,0,634,637,3,39,5,0,635,637,
+        5,0,0,1,636,634,1,0,0,0,636,635,1,0,0,0,637,638,1,0,0,0,638,639,
+        6,1,1,0,639,32,1,0,0,0,640,641,5,45,0,0,641,642,5,45,0,0,642,646,
+        1,0,0,0,643,645,9,0,0,0,644,643,1,0,0,0,645,648,1,0,0,0,646,647,
+        1,0,0,0,646,644,1,0,0,0,647,651,1,0,0,0,648,646,1,0,0,0,649,652,
+        3,39,5,0,650,652,5,0,0,1,651,649,1,0,0,0,651,650,1,0,0,0,652,653,
+        1,0,0,0,653,654,6,2,1,0,654,34,1,0,0,0,655,656,7,0,0,0,656,657,7,
+        1,0,0,657,658,7,2,0,0,658,659,1,0,0,0,659,660,6,3,2,0,660,36,1,0,
+        0,0,661,662,5,95,0,0,662,663,7,0,0,0,663,664,7,1,0,0,664,665,7,0,
+        0,0,665,666,7,0,0,0,666,667,7,3,0,0,667,668,7,4,0,0,668,669,7,5,
+        0,0,669,670,1,0,0,0,670,671,6,4,3,0,671,38,1,0,0,0,672,673,5,10,
+        0,0,673,40,1,0,0,0,674,675,5,44,0,0,675,42,1,0,0,0,676,677,5,59,
+        0,0,677,44,1,0,0,0,678,679,5,58,0,0,679,46,1,0,0,0,680,681,5,64,
+        0,0,681,48,1,0,0,0,682,683,5,46,0,0,683,50,1,0,0,0,684,685,5,47,
+        0,0,685,52,1,0,0,0,686,687,5,40,0,0,687,54,1,0,0,0,688,689,5,41,
+        0,0,689,56,1,0,0,0,690,691,5,91,0,0,691,58,1,0,0,0,692,693,5,93,
+        0,0,693,60,1,0,0,0,694,695,5,34,0,0,695,62,1,0,0,0,696,697,5,39,
+        0,0,697,64,1,0,0,0,698,699,5,92,0,0,699,66,1,0,0,0,700,702,7,6,0,
+        0,701,700,1,0,0,0,702,703,1,0,0,0,703,701,1,0,0,0,703,704,1,0,0,
+        0,704,705,1,0,0,0,705,706,6,19,1,0,706,68,1,0,0,0,707,708,5,95,0,
+        0,708,709,7,1,0,0,709,710,7,7,0,0,710,711,7,3,0,0,711,712,7,2,0,
+        0,712,70,1,0,0,0,713,714,5,95,0,0,714,715,7,8,0,0,715,716,7,9,0,
+        0,716,717,7,3,0,0,717,718,7,2,0,0,718,72,1,0,0,0,719,720,5,95,0,
+        0,720,721,7,0,0,0,721,722,7,10,0,0,722,723,7,1,0,0,723,724,7,1,0,
+        0,724,725,7,11,0,0,725,726,1,0,0,0,726,727,6,22,4,0,727,74,1,0,0,
+        0,728,729,5,95,0,0,729,730,7,9,0,0,730,731,7,0,0,0,731,732,7,1,0,
+        0,732,733,1,0,0,0,733,734,6,23,5,0,734,76,1,0,0,0,735,736,5,95,0,
+        0,736,737,7,1,0,0,737,738,7,12,0,0,738,739,7,13,0,0,739,740,7,4,
+        0,0,740,744,1,0,0,0,741,743,9,0,0,0,742,741,1,0,0,0,743,746,1,0,
+        0,0,744,745,1,0,0,0,744,742,1,0,0,0,745,749,1,0,0,0,746,744,1,0,
+        0,0,747,750,3,39,5,0,748,750,5,0,0,1,749,747,1,0,0,0,749,748,1,0,
+        0,0,750,751,1,0,0,0,751,752,6,24,6,0,752,78,1,0,0,0,753,754,5,62,
+        0,0,754,755,5,32,0,0,755,756,5,123,0,0,756,757,5,37,0,0,757,758,
+        1,0,0,0,758,759,6,25,7,0,759,80,1,0,0,0,760,761,5,95,0,0,761,762,
+        7,14,0,0,762,763,7,0,0,0,763,764,7,0,0,0,764,765,7,1,0,0,765,766,
+        7,15,0,0,766,767,7,2,0,0,767,768,1,0,0,0,768,769,6,26,8,0,769,82,
+        1,0,0,0,770,771,5,95,0,0,771,772,7,0,0,0,772,773,7,2,0,0,773,774,
+        7,14,0,0,774,775,7,15,0,0,775,776,7,2,0,0,776,777,1,0,0,0,777,778,
+        6,27,9,0,778,84,1,0,0,0,779,780,5,95,0,0,780,781,7,10,0,0,781,782,
+        7,4,0,0,782,783,7,14,0,0,783,784,7,16,0,0,784,785,1,0,0,0,785,786,
+        6,28,10,0,786,86,1,0,0,0,787,788,5,95,0,0,788,789,7,13,0,0,789,790,
+        7,4,0,0,790,791,7,0,0,0,791,792,7,2,0,0,792,793,1,0,0,0,793,794,
+        6,29,11,0,794,88,1,0,0,0,795,796,5,95,0,0,796,797,7,13,0,0,797,798,
+        7,1,0,0,798,799,7,10,0,0,799,800,7,11,0,0,800,801,1,0,0,0,801,802,
+        6,30,12,0,802,90,1,0,0,0,803,804,5,95,0,0,804,805,7,3,0,0,805,806,
+        7,17,0,0,806,807,1,0,0,0,807,808,6,31,13,0,808,92,1,0,0,0,809,810,
+        5,95,0,0,810,811,7,1,0,0,811,812,7,5,0,0,812,813,7,16,0,0,813,814,
+        7,3,0,0,814,815,7,17,0,0,815,94,1,0,0,0,816,817,5,95,0,0,817,818,
+        7,0,0,0,818,819,7,1,0,0,819,820,7,2,0,0,820,821,1,0,0,0,821,822,
+        6,33,14,0,822,96,1,0,0,0,823,824,5,95,0,0,824,825,7,0,0,0,825,826,
+        7,11,0,0,826,827,7,4,0,0,827,828,7,4,0,0,828,829,7,10,0,0,829,830,
+        1,0,0,0,830,831,6,34,15,0,831,98,1,0,0,0,832,833,5,95,0,0,833,834,
+        7,10,0,0,834,835,7,4,0,0,835,836,7,4,0,0,836,837,7,11,0,0,837,838,
+        1,0,0,0,838,839,6,35,16,0,839,100,1,0,0,0,840,841,5,95,0,0,841,842,
+        7,18,0,0,842,843,7,13,0,0,843,844,7,1,0,0,844,845,7,5,0,0,845,846,
+        7,1,0,0,846,847,7,19,0,0,847,848,7,1,0,0,848,849,7,15,0,0,849,850,
+        1,0,0,0,850,851,6,36,17,0,851,102,1,0,0,0,852,853,5,95,0,0,853,854,
+        7,0,0,0,854,855,7,0,0,0,855,856,7,13,0,0,856,857,1,0,0,0,857,858,
+        6,37,18,0,858,104,1,0,0,0,859,860,5,95,0,0,860,861,7,20,0,0,861,
+        862,7,4,0,0,862,863,7,21,0,0,863,864,1,0,0,0,864,865,6,38,19,0,865,
+        106,1,0,0,0,866,867,5,95,0,0,867,868,7,12,0,0,868,869,7,4,0,0,869,
+        870,7,22,0,0,870,871,7,11,0,0,871,872,7,14,0,0,872,873,7,15,0,0,
+        873,874,7,1,0,0,874,875,1,0,0,0,875,876,6,39,20,0,876,108,1,0,0,
+        0,877,878,5,95,0,0,878,879,7,16,0,0,879,880,7,14,0,0,880,881,7,2,
+        0,0,881,882,7,14,0,0,882,883,1,0,0,0,883,884,6,40,21,0,884,110,1,
+        0,0,0,885,886,5,95,0,0,886,887,7,22,0,0,887,888,7,4,0,0,888,889,
+        7,5,0,0,889,890,7,3,0,0,890,891,7,2,0,0,891,892,7,4,0,0,892,893,
+        7,15,0,0,893,894,1,0,0,0,894,895,6,41,22,0,895,112,1,0,0,0,896,898,
+        5,95,0,0,897,899,7,23,0,0,898,897,1,0,0,0,899,900,1,0,0,0,900,898,
+        1,0,0,0,900,901,1,0,0,0,901,902,1,0,0,0,902,903,6,42,23,0,903,114,
+        1,0,0,0,904,906,3,127,49,0,905,904,1,0,0,0,906,907,1,0,0,0,907,905,
+        1,0,0,0,907,908,1,0,0,0,908,116,1,0,0,0,909,911,3,127,49,0,910,909,
+        1,0,0,0,911,912,1,0,0,0,912,910,1,0,0,0,912,913,1,0,0,0,913,914,
+        1,0,0,0,914,916,5,46,0,0,915,917,3,127,49,0,916,915,1,0,0,0,917,
+        918,1,0,0,0,918,916,1,0,0,0,918,919,1,0,0,0,919,118,1,0,0,0,920,
+        927,3,133,52,0,921,927,3,121,46,0,922,927,3,123,47,0,923,927,3,125,
+        48,0,924,927,3,135,53,0,925,927,3,137,54,0,926,920,1,0,0,0,926,921,
+        1,0,0,0,926,922,1,0,0,0,926,923,1,0,0,0,926,924,1,0,0,0,926,925,
+        1,0,0,0,927,928,1,0,0,0,928,926,1,0,0,0,928,929,1,0,0,0,929,120,
+        1,0,0,0,930,934,3,129,50,0,931,934,3,127,49,0,932,934,7,24,0,0,933,
+        930,1,0,0,0,933,931,1,0,0,0,933,932,1,0,0,0,934,122,1,0,0,0,935,
+        936,7,25,0,0,936,124,1,0,0,0,937,938,5,37,0,0,938,939,3,131,51,0,
+        939,940,3,131,51,0,940,126,1,0,0,0,941,942,7,26,0,0,942,128,1,0,
+        0,0,943,944,7,23,0,0,944,130,1,0,0,0,945,946,7,27,0,0,946,132,1,
+        0,0,0,947,948,2,255,65535,0,948,134,1,0,0,0,949,958,5,34,0,0,950,
+        957,8,28,0,0,951,954,5,92,0,0,952,955,5,10,0,0,953,955,9,0,0,0,954,
+        952,1,0,0,0,954,953,1,0,0,0,955,957,1,0,0,0,956,950,1,0,0,0,956,
+        951,1,0,0,0,957,960,1,0,0,0,958,956,1,0,0,0,958,959,1,0,0,0,959,
+        961,1,0,0,0,960,958,1,0,0,0,961,962,5,34,0,0,962,136,1,0,0,0,963,
+        975,5,39,0,0,964,974,8,29,0,0,965,971,5,92,0,0,966,968,5,13,0,0,
+        967,966,1,0,0,0,967,968,1,0,0,0,968,969,1,0,0,0,969,972,5,10,0,0,
+        970,972,9,0,0,0,971,967,1,0,0,0,971,970,1,0,0,0,972,974,1,0,0,0,
+        973,964,1,0,0,0,973,965,1,0,0,0,974,977,1,0,0,0,975,973,1,0,0,0,
+        975,976,1,0,0,0,976,978,1,0,0,0,977,975,1,0,0,0,978,979,5,39,0,0,
+        979,138,1,0,0,0,980,981,5,47,0,0,981,982,5,47,0,0,982,986,1,0,0,
+        0,983,985,9,0,0,0,984,983,1,0,0,0,985,988,1,0,0,0,986,987,1,0,0,
+        0,986,984,1,0,0,0,987,989,1,0,0,0,988,986,1,0,0,0,989,990,3,39,5,
+        0,990,991,1,0,0,0,991,992,6,55,24,0,992,140,1,0,0,0,993,994,3,39,
+        5,0,994,995,1,0,0,0,995,996,6,56,25,0,996,142,1,0,0,0,997,998,5,
+        47,0,0,998,144,1,0,0,0,999,1001,7,6,0,0,1000,999,1,0,0,0,1001,1002,
+        1,0,0,0,1002,1000,1,0,0,0,1002,1003,1,0,0,0,1003,1004,1,0,0,0,1004,
+        1005,6,58,1,0,1005,146,1,0,0,0,1006,1007,7,11,0,0,1007,1008,7,4,
+        0,0,1008,1009,7,0,0,0,1009,1039,7,2,0,0,1010,1011,7,30,0,0,1011,
+        1012,7,1,0,0,1012,1039,7,2,0,0,1013,1014,7,11,0,0,1014,1015,7,9,
+        0,0,1015,1039,7,2,0,0,1016,1017,7,13,0,0,1017,1018,7,1,0,0,1018,
+        1019,7,14,0,0,1019,1039,7,16,0,0,1020,1021,7,16,0,0,1021,1022,7,
+        1,0,0,1022,1023,7,10,0,0,1023,1024,7,1,0,0,1024,1025,7,2,0,0,1025,
+        1039,7,1,0,0,1026,1027,7,4,0,0,1027,1028,7,11,0,0,1028,1029,7,2,
+        0,0,1029,1030,7,3,0,0,1030,1031,7,4,0,0,1031,1032,7,5,0,0,1032,1039,
+        7,0,0,0,1033,1034,7,2,0,0,1034,1035,7,15,0,0,1035,1036,7,14,0,0,
+        1036,1037,7,12,0,0,1037,1039,7,1,0,0,1038,1006,1,0,0,0,1038,1010,
+        1,0,0,0,1038,1013,1,0,0,0,1038,1016,1,0,0,0,1038,1020,1,0,0,0,1038,
+        1026,1,0,0,0,1038,1033,1,0,0,0,1039,1040,1,0,0,0,1040,1041,6,59,
+        26,0,1041,148,1,0,0,0,1042,1043,5,35,0,0,1043,1044,5,35,0,0,1044,
+        1045,5,35,0,0,1045,1046,1,0,0,0,1046,1047,6,60,27,0,1047,150,1,0,
+        0,0,1048,1050,7,6,0,0,1049,1048,1,0,0,0,1050,1051,1,0,0,0,1051,1049,
+        1,0,0,0,1051,1052,1,0,0,0,1052,152,1,0,0,0,1053,1054,3,39,5,0,1054,
+        1055,1,0,0,0,1055,1056,6,62,25,0,1056,1057,6,62,28,0,1057,154,1,
+        0,0,0,1058,1060,9,0,0,0,1059,1058,1,0,0,0,1060,1063,1,0,0,0,1061,
+        1062,1,0,0,0,1061,1059,1,0,0,0,1062,1064,1,0,0,0,1063,1061,1,0,0,
+        0,1064,1065,7,13,0,0,1065,1066,7,2,0,0,1066,1067,7,2,0,0,1067,1068,
+        7,11,0,0,1068,1069,5,47,0,0,1069,1071,1,0,0,0,1070,1072,3,127,49,
+        0,1071,1070,1,0,0,0,1072,1073,1,0,0,0,1073,1071,1,0,0,0,1073,1074,
+        1,0,0,0,1074,1075,1,0,0,0,1075,1077,5,46,0,0,1076,1078,3,127,49,
+        0,1077,1076,1,0,0,0,1078,1079,1,0,0,0,1079,1077,1,0,0,0,1079,1080,
+        1,0,0,0,1080,1082,1,0,0,0,1081,1083,3,151,61,0,1082,1081,1,0,0,0,
+        1082,1083,1,0,0,0,1083,1084,1,0,0,0,1084,1085,5,10,0,0,1085,1086,
+        1,0,0,0,1086,1087,6,63,28,0,1087,156,1,0,0,0,1088,1089,9,0,0,0,1089,
+        1090,1,0,0,0,1090,1091,6,64,29,0,1091,158,1,0,0,0,1092,1094,7,6,
+        0,0,1093,1092,1,0,0,0,1094,1095,1,0,0,0,1095,1093,1,0,0,0,1095,1096,
+        1,0,0,0,1096,1097,1,0,0,0,1097,1098,6,65,1,0,1098,160,1,0,0,0,1099,
+        1107,3,133,52,0,1100,1107,3,121,46,0,1101,1107,3,123,47,0,1102,1107,
+        3,125,48,0,1103,1107,3,135,53,0,1104,1107,3,137,54,0,1105,1107,5,
+        63,0,0,1106,1099,1,0,0,0,1106,1100,1,0,0,0,1106,1101,1,0,0,0,1106,
+        1102,1,0,0,0,1106,1103,1,0,0,0,1106,1104,1,0,0,0,1106,1105,1,0,0,
+        0,1107,1108,1,0,0,0,1108,1106,1,0,0,0,1108,1109,1,0,0,0,1109,162,
+        1,0,0,0,1110,1111,5,58,0,0,1111,1112,1,0,0,0,1112,1113,6,67,30,0,
+        1113,164,1,0,0,0,1114,1116,3,159,65,0,1115,1114,1,0,0,0,1115,1116,
+        1,0,0,0,1116,1117,1,0,0,0,1117,1118,5,10,0,0,1118,1119,1,0,0,0,1119,
+        1120,6,68,31,0,1120,1121,6,68,32,0,1121,166,1,0,0,0,1122,1124,8,
+        31,0,0,1123,1122,1,0,0,0,1124,1125,1,0,0,0,1125,1123,1,0,0,0,1125,
+        1126,1,0,0,0,1126,168,1,0,0,0,1127,1128,5,10,0,0,1128,1129,1,0,0,
+        0,1129,1130,6,70,28,0,1130,170,1,0,0,0,1131,1133,7,6,0,0,1132,1131,
+        1,0,0,0,1133,1134,1,0,0,0,1134,1132,1,0,0,0,1134,1135,1,0,0,0,1135,
+        1136,1,0,0,0,1136,1137,6,71,33,0,1137,172,1,0,0,0,1138,1139,5,10,
+        0,0,1139,1140,1,0,0,0,1140,1141,6,72,25,0,1141,174,1,0,0,0,1142,
+        1143,5,45,0,0,1143,1144,5,45,0,0,1144,1145,1,0,0,0,1145,1146,3,119,
+        45,0,1146,1147,5,45,0,0,1147,1148,5,45,0,0,1148,1149,1,0,0,0,1149,
+        1150,3,39,5,0,1150,176,1,0,0,0,1151,1152,5,45,0,0,1152,1153,5,45,
+        0,0,1153,1154,1,0,0,0,1154,1155,3,119,45,0,1155,1156,3,39,5,0,1156,
+        1157,1,0,0,0,1157,1158,6,74,28,0,1158,178,1,0,0,0,1159,1160,5,47,
+        0,0,1160,1161,5,47,0,0,1161,1165,1,0,0,0,1162,1164,9,0,0,0,1163,
+        1162,1,0,0,0,1164,1167,1,0,0,0,1165,1166,1,0,0,0,1165,1163,1,0,0,
+        0,1166,1168,1,0,0,0,1167,1165,1,0,0,0,1168,1169,3,39,5,0,1169,1170,
+        1,0,0,0,1170,1171,6,75,1,0,1171,180,1,0,0,0,1172,1173,5,62,0,0,1173,
+        1176,5,62,0,0,1174,1176,7,32,0,0,1175,1172,1,0,0,0,1175,1174,1,0,
+        0,0,1176,1180,1,0,0,0,1177,1179,9,0,0,0,1178,1177,1,0,0,0,1179,1182,
+        1,0,0,0,1180,1181,1,0,0,0,1180,1178,1,0,0,0,1181,1183,1,0,0,0,1182,
+        1180,1,0,0,0,1183,1184,3,39,5,0,1184,182,1,0,0,0,1185,1186,5,35,
+        0,0,1186,1187,5,35,0,0,1187,1188,5,35,0,0,1188,1189,1,0,0,0,1189,
+        1190,6,77,34,0,1190,1191,6,77,35,0,1191,184,1,0,0,0,1192,1193,3,
+        119,45,0,1193,1194,1,0,0,0,1194,1195,6,78,33,0,1195,186,1,0,0,0,
+        1196,1197,9,0,0,0,1197,1198,1,0,0,0,1198,1199,6,79,33,0,1199,188,
+        1,0,0,0,1200,1202,7,6,0,0,1201,1200,1,0,0,0,1202,1203,1,0,0,0,1203,
+        1201,1,0,0,0,1203,1204,1,0,0,0,1204,1205,1,0,0,0,1205,1206,6,80,
+        1,0,1206,190,1,0,0,0,1207,1208,7,11,0,0,1208,1209,7,15,0,0,1209,
+        1210,7,4,0,0,1210,1211,7,7,0,0,1211,1212,7,33,0,0,1212,192,1,0,0,
+        0,1213,1214,7,13,0,0,1214,1215,7,2,0,0,1215,1216,7,2,0,0,1216,1217,
+        7,11,0,0,1217,1218,7,0,0,0,1218,1219,5,95,0,0,1219,1220,7,19,0,0,
+        1220,1221,7,1,0,0,1221,1222,7,15,0,0,1222,1223,7,3,0,0,1223,1224,
+        7,17,0,0,1224,1225,7,33,0,0,1225,194,1,0,0,0,1226,1227,7,4,0,0,1227,
+        1228,7,5,0,0,1228,196,1,0,0,0,1229,1230,7,4,0,0,1230,1231,7,17,0,
+        0,1231,1232,7,17,0,0,1232,198,1,0,0,0,1233,1241,3,133,52,0,1234,
+        1241,3,121,46,0,1235,1241,3,123,47,0,1236,1241,3,125,48,0,1237,1241,
+        3,135,53,0,1238,1241,3,137,54,0,1239,1241,7,34,0,0,1240,1233,1,0,
+        0,0,1240,1234,1,0,0,0,1240,1235,1,0,0,0,1240,1236,1,0,0,0,1240,1237,
+        1,0,0,0,1240,1238,1,0,0,0,1240,1239,1,0,0,0,1241,1242,1,0,0,0,1242,
+        1240,1,0,0,0,1242,1243,1,0,0,0,1243,200,1,0,0,0,1244,1245,5,59,0,
+        0,1245,202,1,0,0,0,1246,1247,3,39,5,0,1247,1248,1,0,0,0,1248,1249,
+        6,87,27,0,1249,204,1,0,0,0,1250,1252,7,6,0,0,1251,1250,1,0,0,0,1252,
+        1253,1,0,0,0,1253,1251,1,0,0,0,1253,1254,1,0,0,0,1254,1255,1,0,0,
+        0,1255,1256,6,88,1,0,1256,206,1,0,0,0,1257,1258,7,0,0,0,1258,1259,
+        7,14,0,0,1259,1260,7,19,0,0,1260,1261,7,1,0,0,1261,208,1,0,0,0,1262,
+        1263,7,15,0,0,1263,1264,7,1,0,0,1264,1265,7,10,0,0,1265,1266,7,1,
+        0,0,1266,1267,7,14,0,0,1267,1268,7,0,0,0,1268,1269,7,1,0,0,1269,
+        210,1,0,0,0,1270,1271,7,15,0,0,1271,1272,7,1,0,0,1272,1273,7,0,0,
+        0,1273,1274,7,2,0,0,1274,1275,7,4,0,0,1275,1276,7,15,0,0,1276,1277,
+        7,1,0,0,1277,212,1,0,0,0,1278,1279,7,0,0,0,1279,1280,7,13,0,0,1280,
+        1281,7,4,0,0,1281,1282,7,18,0,0,1282,214,1,0,0,0,1283,1291,3,133,
+        52,0,1284,1291,3,121,46,0,1285,1291,3,123,47,0,1286,1291,3,125,48,
+        0,1287,1291,3,135,53,0,1288,1291,3,137,54,0,1289,1291,7,34,0,0,1290,
+        1283,1,0,0,0,1290,1284,1,0,0,0,1290,1285,1,0,0,0,1290,1286,1,0,0,
+        0,1290,1287,1,0,0,0,1290,1288,1,0,0,0,1290,1289,1,0,0,0,1291,1292,
+        1,0,0,0,1292,1290,1,0,0,0,1292,1293,1,0,0,0,1293,216,1,0,0,0,1294,
+        1295,5,59,0,0,1295,218,1,0,0,0,1296,1297,3,39,5,0,1297,1298,1,0,
+        0,0,1298,1299,6,95,27,0,1299,220,1,0,0,0,1300,1302,9,0,0,0,1301,
+        1300,1,0,0,0,1302,1305,1,0,0,0,1303,1304,1,0,0,0,1303,1301,1,0,0,
+        0,1304,1310,1,0,0,0,1305,1303,1,0,0,0,1306,1307,5,10,0,0,1307,1308,
+        5,37,0,0,1308,1311,5,125,0,0,1309,1311,5,0,0,1,1310,1306,1,0,0,0,
+        1310,1309,1,0,0,0,1311,1312,1,0,0,0,1312,1313,6,96,27,0,1313,222,
+        1,0,0,0,1314,1316,9,0,0,0,1315,1314,1,0,0,0,1316,1319,1,0,0,0,1317,
+        1318,1,0,0,0,1317,1315,1,0,0,0,1318,1320,1,0,0,0,1319,1317,1,0,0,
+        0,1320,1321,7,1,0,0,1321,1322,7,12,0,0,1322,1323,7,13,0,0,1323,1324,
+        7,4,0,0,1324,1326,1,0,0,0,1325,1327,7,6,0,0,1326,1325,1,0,0,0,1327,
+        1328,1,0,0,0,1328,1326,1,0,0,0,1328,1329,1,0,0,0,1329,1330,1,0,0,
+        0,1330,1331,7,4,0,0,1331,1332,7,17,0,0,1332,1333,7,17,0,0,1333,1334,
+        1,0,0,0,1334,1335,6,97,27,0,1335,224,1,0,0,0,1336,1338,7,6,0,0,1337,
+        1336,1,0,0,0,1338,1339,1,0,0,0,1339,1337,1,0,0,0,1339,1340,1,0,0,
+        0,1340,1341,1,0,0,0,1341,1342,6,98,1,0,1342,226,1,0,0,0,1343,1344,
+        5,123,0,0,1344,1345,5,37,0,0,1345,228,1,0,0,0,1346,1347,5,37,0,0,
+        1347,1348,5,125,0,0,1348,230,1,0,0,0,1349,1350,3,39,5,0,1350,1351,
+        1,0,0,0,1351,1352,6,101,27,0,1352,232,1,0,0,0,1353,1357,3,227,99,
+        0,1354,1356,9,0,0,0,1355,1354,1,0,0,0,1356,1359,1,0,0,0,1357,1358,
+        1,0,0,0,1357,1355,1,0,0,0,1358,1360,1,0,0,0,1359,1357,1,0,0,0,1360,
+        1361,3,229,100,0,1361,234,1,0,0,0,1362,1369,3,133,52,0,1363,1369,
+        3,121,46,0,1364,1369,3,125,48,0,1365,1369,3,135,53,0,1366,1369,3,
+        137,54,0,1367,1369,7,35,0,0,1368,1362,1,0,0,0,1368,1363,1,0,0,0,
+        1368,1364,1,0,0,0,1368,1365,1,0,0,0,1368,1366,1,0,0,0,1368,1367,
+        1,0,0,0,1369,1370,1,0,0,0,1370,1368,1,0,0,0,1370,1371,1,0,0,0,1371,
+        236,1,0,0,0,1372,1373,5,44,0,0,1373,238,1,0,0,0,1374,1375,5,59,0,
+        0,1375,240,1,0,0,0,1376,1378,7,6,0,0,1377,1376,1,0,0,0,1378,1379,
+        1,0,0,0,1379,1377,1,0,0,0,1379,1380,1,0,0,0,1380,1381,1,0,0,0,1381,
+        1382,6,106,1,0,1382,242,1,0,0,0,1383,1384,5,61,0,0,1384,244,1,0,
+        0,0,1385,1386,7,11,0,0,1386,1387,7,10,0,0,1387,1388,7,9,0,0,1388,
+        1389,7,30,0,0,1389,1390,7,3,0,0,1390,1391,7,5,0,0,1391,246,1,0,0,
+        0,1392,1393,7,0,0,0,1393,1394,7,12,0,0,1394,1395,7,15,0,0,1395,1396,
+        7,3,0,0,1396,1397,7,11,0,0,1397,1398,7,2,0,0,1398,248,1,0,0,0,1399,
+        1400,7,22,0,0,1400,1401,7,14,0,0,1401,1402,7,11,0,0,1402,250,1,0,
+        0,0,1403,1404,7,20,0,0,1404,1405,7,16,0,0,1405,1406,7,21,0,0,1406,
+        1407,7,12,0,0,1407,1408,7,16,0,0,1408,1409,7,15,0,0,1409,1410,7,
+        3,0,0,1410,1411,7,19,0,0,1411,1412,7,1,0,0,1412,1413,7,15,0,0,1413,
+        252,1,0,0,0,1414,1415,7,17,0,0,1415,1416,7,3,0,0,1416,1417,7,10,
+        0,0,1417,1418,7,1,0,0,1418,254,1,0,0,0,1419,1420,7,12,0,0,1420,1421,
+        7,10,0,0,1421,1422,7,14,0,0,1422,1423,7,0,0,0,1423,1424,7,0,0,0,
+        1424,256,1,0,0,0,1425,1426,7,5,0,0,1426,1427,7,14,0,0,1427,1428,
+        7,22,0,0,1428,1429,7,1,0,0,1429,258,1,0,0,0,1430,1431,7,11,0,0,1431,
+        1432,7,15,0,0,1432,1433,7,4,0,0,1433,1434,7,11,0,0,1434,1435,7,0,
+        0,0,1435,260,1,0,0,0,1436,1437,7,9,0,0,1437,1438,7,15,0,0,1438,1439,
+        7,10,0,0,1439,262,1,0,0,0,1440,1447,3,133,52,0,1441,1447,3,121,46,
+        0,1442,1447,3,125,48,0,1443,1447,3,135,53,0,1444,1447,3,137,54,0,
+        1445,1447,7,35,0,0,1446,1440,1,0,0,0,1446,1441,1,0,0,0,1446,1442,
+        1,0,0,0,1446,1443,1,0,0,0,1446,1444,1,0,0,0,1446,1445,1,0,0,0,1447,
+        1448,1,0,0,0,1448,1446,1,0,0,0,1448,1449,1,0,0,0,1449,264,1,0,0,
+        0,1450,1451,5,59,0,0,1451,266,1,0,0,0,1452,1453,3,39,5,0,1453,1454,
+        1,0,0,0,1454,1455,6,119,27,0,1455,268,1,0,0,0,1456,1458,7,6,0,0,
+        1457,1456,1,0,0,0,1458,1459,1,0,0,0,1459,1457,1,0,0,0,1459,1460,
+        1,0,0,0,1460,1461,1,0,0,0,1461,1462,6,120,1,0,1462,270,1,0,0,0,1463,
+        1471,3,133,52,0,1464,1471,3,121,46,0,1465,1471,3,123,47,0,1466,1471,
+        3,125,48,0,1467,1471,3,135,53,0,1468,1471,3,137,54,0,1469,1471,7,
+        35,0,0,1470,1463,1,0,0,0,1470,1464,1,0,0,0,1470,1465,1,0,0,0,1470,
+        1466,1,0,0,0,1470,1467,1,0,0,0,1470,1468,1,0,0,0,1470,1469,1,0,0,
+        0,1471,1472,1,0,0,0,1472,1470,1,0,0,0,1472,1473,1,0,0,0,1473,272,
+        1,0,0,0,1474,1475,3,39,5,0,1475,1476,1,0,0,0,1476,1477,6,122,27,
+        0,1477,274,1,0,0,0,1478,1480,7,6,0,0,1479,1478,1,0,0,0,1480,1481,
+        1,0,0,0,1481,1479,1,0,0,0,1481,1482,1,0,0,0,1482,1483,1,0,0,0,1483,
+        1484,6,123,1,0,1484,276,1,0,0,0,1485,1493,3,133,52,0,1486,1493,3,
+        121,46,0,1487,1493,3,123,47,0,1488,1493,3,125,48,0,1489,1493,3,135,
+        53,0,1490,1493,3,137,54,0,1491,1493,7,36,0,0,1492,1485,1,0,0,0,1492,
+        1486,1,0,0,0,1492,1487,1,0,0,0,1492,1488,1,0,0,0,1492,1489,1,0,0,
+        0,1492,1490,1,0,0,0,1492,1491,1,0,0,0,1493,1494,1,0,0,0,1494,1492,
+        1,0,0,0,1494,1495,1,0,0,0,1495,278,1,0,0,0,1496,1497,3,39,5,0,1497,
+        1498,1,0,0,0,1498,1499,6,125,27,0,1499,280,1,0,0,0,1500,1502,7,6,
+        0,0,1501,1500,1,0,0,0,1502,1503,1,0,0,0,1503,1501,1,0,0,0,1503,1504,
+        1,0,0,0,1504,1505,1,0,0,0,1505,1506,6,126,1,0,1506,282,1,0,0,0,1507,
+        1508,5,123,0,0,1508,1509,5,37,0,0,1509,284,1,0,0,0,1510,1511,5,37,
+        0,0,1511,1512,5,125,0,0,1512,286,1,0,0,0,1513,1517,3,283,127,0,1514,
+        1516,9,0,0,0,1515,1514,1,0,0,0,1516,1519,1,0,0,0,1517,1518,1,0,0,
+        0,1517,1515,1,0,0,0,1518,1520,1,0,0,0,1519,1517,1,0,0,0,1520,1521,
+        3,285,128,0,1521,1522,1,0,0,0,1522,1523,6,129,27,0,1523,288,1,0,
+        0,0,1524,1525,5,59,0,0,1525,290,1,0,0,0,1526,1528,7,6,0,0,1527,1526,
+        1,0,0,0,1528,1529,1,0,0,0,1529,1527,1,0,0,0,1529,1530,1,0,0,0,1530,
+        1531,1,0,0,0,1531,1532,6,131,1,0,1532,292,1,0,0,0,1533,1534,7,21,
+        0,0,1534,1535,7,1,0,0,1535,1536,7,30,0,0,1536,1537,7,3,0,0,1537,
+        1538,7,5,0,0,1538,294,1,0,0,0,1539,1540,7,9,0,0,1540,1541,7,5,0,
+        0,1541,1542,7,2,0,0,1542,1543,7,3,0,0,1543,1544,7,10,0,0,1544,296,
+        1,0,0,0,1545,1546,7,3,0,0,1546,1547,7,5,0,0,1547,1548,7,2,0,0,1548,
+        1549,7,1,0,0,1549,1550,7,15,0,0,1550,1551,7,19,0,0,1551,1552,7,14,
+        0,0,1552,1553,7,10,0,0,1553,298,1,0,0,0,1554,1555,3,115,43,0,1555,
+        300,1,0,0,0,1556,1557,5,123,0,0,1557,1558,5,37,0,0,1558,302,1,0,
+        0,0,1559,1560,5,37,0,0,1560,1561,5,125,0,0,1561,304,1,0,0,0,1562,
+        1563,7,21,0,0,1563,1564,7,15,0,0,1564,1565,7,1,0,0,1565,1566,7,14,
+        0,0,1566,1567,7,37,0,0,1567,306,1,0,0,0,1568,1569,7,1,0,0,1569,1570,
+        7,5,0,0,1570,1571,7,16,0,0,1571,308,1,0,0,0,1572,1573,7,12,0,0,1573,
+        1574,7,4,0,0,1574,1575,7,5,0,0,1575,1576,7,2,0,0,1576,1577,7,3,0,
+        0,1577,1578,7,5,0,0,1578,1579,7,9,0,0,1579,1580,7,1,0,0,1580,310,
+        1,0,0,0,1581,1585,3,301,136,0,1582,1584,9,0,0,0,1583,1582,1,0,0,
+        0,1584,1587,1,0,0,0,1585,1586,1,0,0,0,1585,1583,1,0,0,0,1586,1588,
+        1,0,0,0,1587,1585,1,0,0,0,1588,1589,3,303,137,0,1589,312,1,0,0,0,
+        1590,1591,3,39,5,0,1591,1592,1,0,0,0,1592,1593,6,142,27,0,1593,314,
+        1,0,0,0,1594,1596,7,6,0,0,1595,1594,1,0,0,0,1596,1597,1,0,0,0,1597,
+        1595,1,0,0,0,1597,1598,1,0,0,0,1598,1599,1,0,0,0,1599,1600,6,143,
+        1,0,1600,316,1,0,0,0,1601,1602,3,115,43,0,1602,318,1,0,0,0,1603,
+        1604,7,1,0,0,1604,1605,7,15,0,0,1605,1606,7,15,0,0,1606,1607,7,4,
+        0,0,1607,1608,7,15,0,0,1608,320,1,0,0,0,1609,1610,5,59,0,0,1610,
+        322,1,0,0,0,1611,1612,7,12,0,0,1612,1613,7,4,0,0,1613,1614,7,5,0,
+        0,1614,1615,7,2,0,0,1615,1616,7,3,0,0,1616,1617,7,5,0,0,1617,1618,
+        7,9,0,0,1618,1619,7,1,0,0,1619,324,1,0,0,0,1620,1621,7,1,0,0,1621,
+        1622,7,7,0,0,1622,1623,7,3,0,0,1623,1624,7,2,0,0,1624,326,1,0,0,
+        0,1625,1626,3,39,5,0,1626,1627,1,0,0,0,1627,1628,6,149,27,0,1628,
+        328,1,0,0,0,1629,1631,7,6,0,0,1630,1629,1,0,0,0,1631,1632,1,0,0,
+        0,1632,1630,1,0,0,0,1632,1633,1,0,0,0,1633,1634,1,0,0,0,1634,1635,
+        6,150,1,0,1635,330,1,0,0,0,1636,1644,3,133,52,0,1637,1644,3,121,
+        46,0,1638,1644,3,123,47,0,1639,1644,3,125,48,0,1640,1644,3,135,53,
+        0,1641,1644,3,137,54,0,1642,1644,7,34,0,0,1643,1636,1,0,0,0,1643,
+        1637,1,0,0,0,1643,1638,1,0,0,0,1643,1639,1,0,0,0,1643,1640,1,0,0,
+        0,1643,1641,1,0,0,0,1643,1642,1,0,0,0,1644,1645,1,0,0,0,1645,1643,
+        1,0,0,0,1645,1646,1,0,0,0,1646,332,1,0,0,0,1647,1648,5,59,0,0,1648,
+        334,1,0,0,0,1649,1650,7,4,0,0,1650,1651,7,17,0,0,1651,1652,7,17,
+        0,0,1652,336,1,0,0,0,1653,1654,3,39,5,0,1654,1655,1,0,0,0,1655,1656,
+        6,154,27,0,1656,338,1,0,0,0,1657,1659,7,6,0,0,1658,1657,1,0,0,0,
+        1659,1660,1,0,0,0,1660,1658,1,0,0,0,1660,1661,1,0,0,0,1661,1662,
+        1,0,0,0,1662,1663,6,155,1,0,1663,340,1,0,0,0,1664,1672,3,133,52,
+        0,1665,1672,3,121,46,0,1666,1672,3,123,47,0,1667,1672,3,125,48,0,
+        1668,1672,3,135,53,0,1669,1672,3,137,54,0,1670,1672,7,34,0,0,1671,
+        1664,1,0,0,0,1671,1665,1,0,0,0,1671,1666,1,0,0,0,1671,1667,1,0,0,
+        0,1671,1668,1,0,0,0,1671,1669,1,0,0,0,1671,1670,1,0,0,0,1672,1673,
+        1,0,0,0,1673,1671,1,0,0,0,1673,1674,1,0,0,0,1674,342,1,0,0,0,1675,
+        1676,5,59,0,0,1676,344,1,0,0,0,1677,1678,3,39,5,0,1678,1679,1,0,
+        0,0,1679,1680,6,158,27,0,1680,346,1,0,0,0,1681,1682,7,14,0,0,1682,
+        1683,7,11,0,0,1683,1684,7,3,0,0,1684,348,1,0,0,0,1685,1686,7,0,0,
+        0,1686,1687,7,8,0,0,1687,1688,7,10,0,0,1688,350,1,0,0,0,1689,1691,
+        7,6,0,0,1690,1689,1,0,0,0,1691,1692,1,0,0,0,1692,1690,1,0,0,0,1692,
+        1693,1,0,0,0,1693,1694,1,0,0,0,1694,1695,6,161,1,0,1695,352,1,0,
+        0,0,1696,1697,5,59,0,0,1697,354,1,0,0,0,1698,1699,3,39,5,0,1699,
+        1700,1,0,0,0,1700,1701,6,163,27,0,1701,356,1,0,0,0,1702,1703,7,12,
+        0,0,1703,1704,7,4,0,0,1704,1705,7,5,0,0,1705,1706,7,5,0,0,1706,1707,
+        7,1,0,0,1707,1708,7,12,0,0,1708,1709,7,2,0,0,1709,358,1,0,0,0,1710,
+        1711,7,18,0,0,1711,1712,7,3,0,0,1712,1713,7,2,0,0,1713,1714,7,13,
+        0,0,1714,360,1,0,0,0,1715,1716,7,9,0,0,1716,1717,7,0,0,0,1717,1718,
+        7,1,0,0,1718,1719,7,15,0,0,1719,362,1,0,0,0,1720,1721,7,0,0,0,1721,
+        1722,7,1,0,0,1722,1723,7,2,0,0,1723,364,1,0,0,0,1724,1725,7,37,0,
+        0,1725,1726,7,1,0,0,1726,1727,7,33,0,0,1727,1728,7,17,0,0,1728,1729,
+        7,3,0,0,1729,1730,7,10,0,0,1730,1731,7,1,0,0,1731,366,1,0,0,0,1732,
+        1733,7,11,0,0,1733,1734,7,14,0,0,1734,1735,7,0,0,0,1735,1736,7,0,
+        0,0,1736,1737,7,18,0,0,1737,1738,7,4,0,0,1738,1739,7,15,0,0,1739,
+        1740,7,16,0,0,1740,368,1,0,0,0,1741,1742,7,1,0,0,1742,1743,7,7,0,
+        0,1743,1744,7,1,0,0,1744,1745,7,12,0,0,1745,1746,7,9,0,0,1746,1747,
+        7,2,0,0,1747,1748,7,1,0,0,1748,370,1,0,0,0,1749,1750,7,16,0,0,1750,
+        1751,7,3,0,0,1751,1752,7,0,0,0,1752,1753,7,12,0,0,1753,1754,7,4,
+        0,0,1754,1755,7,5,0,0,1755,1756,7,5,0,0,1756,1757,7,1,0,0,1757,1758,
+        7,12,0,0,1758,1759,7,2,0,0,1759,372,1,0,0,0,1760,1761,7,0,0,0,1761,
+        1762,7,14,0,0,1762,1763,7,19,0,0,1763,1764,7,1,0,0,1764,374,1,0,
+        0,0,1765,1766,7,15,0,0,1766,1767,7,1,0,0,1767,1768,7,0,0,0,1768,
+        1769,7,2,0,0,1769,1770,7,4,0,0,1770,1771,7,15,0,0,1771,1772,7,1,
+        0,0,1772,376,1,0,0,0,1773,1774,7,0,0,0,1774,1775,7,17,0,0,1775,1776,
+        7,2,0,0,1776,1777,7,11,0,0,1777,378,1,0,0,0,1778,1779,7,12,0,0,1779,
+        1780,7,13,0,0,1780,1781,7,22,0,0,1781,1782,7,4,0,0,1782,1783,7,16,
+        0,0,1783,380,1,0,0,0,1784,1785,7,30,0,0,1785,1786,7,1,0,0,1786,1787,
+        7,2,0,0,1787,1788,7,12,0,0,1788,1789,7,18,0,0,1789,1790,7,16,0,0,
+        1790,382,1,0,0,0,1791,1792,7,12,0,0,1792,1793,7,13,0,0,1793,1794,
+        7,16,0,0,1794,1795,7,3,0,0,1795,1796,7,15,0,0,1796,384,1,0,0,0,1797,
+        1798,7,12,0,0,1798,1799,7,13,0,0,1799,1800,7,4,0,0,1800,1801,7,18,
+        0,0,1801,1802,7,5,0,0,1802,386,1,0,0,0,1803,1804,7,22,0,0,1804,1805,
+        7,37,0,0,1805,1806,7,16,0,0,1806,1807,7,3,0,0,1807,1808,7,15,0,0,
+        1808,388,1,0,0,0,1809,1810,7,30,0,0,1810,1811,7,1,0,0,1811,1812,
+        7,2,0,0,1812,390,1,0,0,0,1813,1814,7,11,0,0,1814,1815,7,9,0,0,1815,
+        1816,7,2,0,0,1816,392,1,0,0,0,1817,1818,7,15,0,0,1818,1819,7,1,0,
+        0,1819,1820,7,22,0,0,1820,1821,7,4,0,0,1821,1822,7,19,0,0,1822,1823,
+        7,1,0,0,1823,394,1,0,0,0,1824,1825,7,15,0,0,1825,1826,7,1,0,0,1826,
+        1827,7,5,0,0,1827,1828,7,14,0,0,1828,1829,7,22,0,0,1829,1830,7,1,
+        0,0,1830,396,1,0,0,0,1831,1832,7,10,0,0,1832,1833,7,3,0,0,1833,1834,
+        7,0,0,0,1834,1835,7,2,0,0,1835,1836,7,16,0,0,1836,1837,7,3,0,0,1837,
+        1838,7,15,0,0,1838,398,1,0,0,0,1839,1840,7,2,0,0,1840,1841,7,15,
+        0,0,1841,1842,7,9,0,0,1842,1843,7,5,0,0,1843,1844,7,12,0,0,1844,
+        1845,7,14,0,0,1845,1846,7,2,0,0,1846,1847,7,1,0,0,1847,400,1,0,0,
+        0,1848,1849,5,61,0,0,1849,402,1,0,0,0,1850,1852,7,6,0,0,1851,1850,
+        1,0,0,0,1852,1853,1,0,0,0,1853,1851,1,0,0,0,1853,1854,1,0,0,0,1854,
+        1855,1,0,0,0,1855,1856,6,187,1,0,1856,404,1,0,0,0,1857,1858,5,59,
+        0,0,1858,406,1,0,0,0,1859,1860,3,39,5,0,1860,1861,1,0,0,0,1861,1862,
+        6,189,27,0,1862,408,1,0,0,0,1863,1871,3,133,52,0,1864,1871,3,121,
+        46,0,1865,1871,3,123,47,0,1866,1871,3,125,48,0,1867,1871,3,135,53,
+        0,1868,1871,3,137,54,0,1869,1871,7,38,0,0,1870,1863,1,0,0,0,1870,
+        1864,1,0,0,0,1870,1865,1,0,0,0,1870,1866,1,0,0,0,1870,1867,1,0,0,
+        0,1870,1868,1,0,0,0,1870,1869,1,0,0,0,1871,1872,1,0,0,0,1872,1870,
+        1,0,0,0,1872,1873,1,0,0,0,1873,410,1,0,0,0,1874,1876,7,6,0,0,1875,
+        1874,1,0,0,0,1876,1877,1,0,0,0,1877,1875,1,0,0,0,1877,1878,1,0,0,
+        0,1878,1879,1,0,0,0,1879,1880,6,191,1,0,1880,412,1,0,0,0,1881,1882,
+        5,59,0,0,1882,414,1,0,0,0,1883,1884,5,61,0,0,1884,416,1,0,0,0,1885,
+        1886,3,39,5,0,1886,1887,1,0,0,0,1887,1888,6,194,27,0,1888,418,1,
+        0,0,0,1889,1890,7,12,0,0,1890,1891,7,15,0,0,1891,1892,7,1,0,0,1892,
+        1893,7,14,0,0,1893,1894,7,2,0,0,1894,1895,7,1,0,0,1895,420,1,0,0,
+        0,1896,1897,7,0,0,0,1897,1898,7,13,0,0,1898,1899,7,4,0,0,1899,1900,
+        7,18,0,0,1900,422,1,0,0,0,1901,1902,7,0,0,0,1902,1903,7,1,0,0,1903,
+        1904,7,2,0,0,1904,424,1,0,0,0,1905,1906,7,0,0,0,1906,1907,7,2,0,
+        0,1907,1908,7,14,0,0,1908,1909,7,15,0,0,1909,1910,7,2,0,0,1910,426,
+        1,0,0,0,1911,1912,7,18,0,0,1912,1913,7,14,0,0,1913,1914,7,3,0,0,
+        1914,1915,7,2,0,0,1915,428,1,0,0,0,1916,1917,7,0,0,0,1917,1918,7,
+        13,0,0,1918,1919,7,9,0,0,1919,1920,7,2,0,0,1920,1921,7,16,0,0,1921,
+        1922,7,4,0,0,1922,1923,7,18,0,0,1923,1924,7,5,0,0,1924,430,1,0,0,
+        0,1925,1926,7,14,0,0,1926,1927,7,21,0,0,1927,1928,7,4,0,0,1928,1929,
+        7,15,0,0,1929,1930,7,2,0,0,1930,432,1,0,0,0,1931,1932,7,2,0,0,1932,
+        1933,7,3,0,0,1933,1934,7,22,0,0,1934,1935,7,1,0,0,1935,1936,7,15,
+        0,0,1936,434,1,0,0,0,1937,1938,7,15,0,0,1938,1939,7,1,0,0,1939,1940,
+        7,30,0,0,1940,1941,7,3,0,0,1941,1942,7,0,0,0,1942,1943,7,2,0,0,1943,
+        1944,7,1,0,0,1944,1945,7,15,0,0,1945,436,1,0,0,0,1946,1947,7,16,
+        0,0,1947,1948,7,1,0,0,1948,1949,7,15,0,0,1949,1950,7,1,0,0,1950,
+        1951,7,30,0,0,1951,1952,7,3,0,0,1952,1953,7,0,0,0,1953,1954,7,2,
+        0,0,1954,1955,7,1,0,0,1955,1956,7,15,0,0,1956,438,1,0,0,0,1957,1958,
+        7,18,0,0,1958,1959,7,4,0,0,1959,1960,7,15,0,0,1960,1961,7,37,0,0,
+        1961,1962,7,1,0,0,1962,1963,7,15,0,0,1963,440,1,0,0,0,1964,1965,
+        7,20,0,0,1965,1966,7,4,0,0,1966,1967,7,21,0,0,1967,1968,7,22,0,0,
+        1968,1969,7,14,0,0,1969,1970,7,5,0,0,1970,1971,7,14,0,0,1971,1972,
+        7,30,0,0,1972,1973,7,1,0,0,1973,1974,7,15,0,0,1974,442,1,0,0,0,1975,
+        1976,7,4,0,0,1976,1977,7,5,0,0,1977,444,1,0,0,0,1978,1979,7,4,0,
+        0,1979,1980,7,17,0,0,1980,1981,7,17,0,0,1981,446,1,0,0,0,1982,1983,
+        7,2,0,0,1983,1984,7,4,0,0,1984,448,1,0,0,0,1985,1992,3,133,52,0,
+        1986,1992,3,121,46,0,1987,1992,3,125,48,0,1988,1992,3,135,53,0,1989,
+        1992,3,137,54,0,1990,1992,7,39,0,0,1991,1985,1,0,0,0,1991,1986,1,
+        0,0,0,1991,1987,1,0,0,0,1991,1988,1,0,0,0,1991,1989,1,0,0,0,1991,
+        1990,1,0,0,0,1992,1993,1,0,0,0,1993,1991,1,0,0,0,1993,1994,1,0,0,
+        0,1994,450,1,0,0,0,1995,1997,7,6,0,0,1996,1995,1,0,0,0,1997,1998,
+        1,0,0,0,1998,1996,1,0,0,0,1998,1999,1,0,0,0,1999,2000,1,0,0,0,2000,
+        2001,6,211,1,0,2001,452,1,0,0,0,2002,2003,5,59,0,0,2003,454,1,0,
+        0,0,2004,2005,5,61,0,0,2005,2006,5,62,0,0,2006,456,1,0,0,0,2007,
+        2008,3,39,5,0,2008,2009,1,0,0,0,2009,2010,6,214,27,0,2010,458,1,
+        0,0,0,2011,2012,7,0,0,0,2012,2013,7,1,0,0,2013,2014,7,2,0,0,2014,
+        460,1,0,0,0,2015,2016,7,9,0,0,2016,2017,7,5,0,0,2017,2018,7,0,0,
+        0,2018,2019,7,1,0,0,2019,2020,7,2,0,0,2020,462,1,0,0,0,2021,2022,
+        7,22,0,0,2022,2023,7,14,0,0,2023,2024,7,0,0,0,2024,2025,7,37,0,0,
+        2025,464,1,0,0,0,2026,2027,7,5,0,0,2027,2028,7,4,0,0,2028,2029,7,
+        22,0,0,2029,2030,7,14,0,0,2030,2031,7,0,0,0,2031,2032,7,37,0,0,2032,
+        466,1,0,0,0,2033,2034,7,22,0,0,2034,2035,7,14,0,0,2035,2036,7,0,
+        0,0,2036,2037,7,37,0,0,2037,2038,7,10,0,0,2038,2039,7,3,0,0,2039,
+        2040,7,5,0,0,2040,2041,7,1,0,0,2041,468,1,0,0,0,2042,2043,7,5,0,
+        0,2043,2044,7,4,0,0,2044,2045,7,22,0,0,2045,2046,7,14,0,0,2046,2047,
+        7,0,0,0,2047,2048,7,37,0,0,2048,2049,7,10,0,0,2049,2050,7,3,0,0,
+        2050,2051,7,5,0,0,2051,2052,7,1,0,0,2052,470,1,0,0,0,2053,2054,7,
+        12,0,0,2054,2055,7,14,0,0,2055,2056,7,0,0,0,2056,2057,7,1,0,0,2057,
+        472,1,0,0,0,2058,2059,7,5,0,0,2059,2060,7,4,0,0,2060,2061,7,12,0,
+        0,2061,2062,7,14,0,0,2062,2063,7,0,0,0,2063,2064,7,1,0,0,2064,474,
+        1,0,0,0,2065,2066,7,3,0,0,2066,2067,7,30,0,0,2067,2068,7,21,0,0,
+        2068,2069,7,10,0,0,2069,2070,7,14,0,0,2070,2071,7,5,0,0,2071,2072,
+        7,37,0,0,2072,476,1,0,0,0,2073,2074,7,5,0,0,2074,2075,7,4,0,0,2075,
+        2076,7,3,0,0,2076,2077,7,30,0,0,2077,2078,7,21,0,0,2078,2079,7,10,
+        0,0,2079,2080,7,14,0,0,2080,2081,7,5,0,0,2081,2082,7,37,0,0,2082,
+        478,1,0,0,0,2083,2084,7,2,0,0,2084,2085,7,15,0,0,2085,2086,7,3,0,
+        0,2086,2087,7,22,0,0,2087,480,1,0,0,0,2088,2089,7,5,0,0,2089,2090,
+        7,4,0,0,2090,2091,7,2,0,0,2091,2092,7,15,0,0,2092,2093,7,3,0,0,2093,
+        2094,7,22,0,0,2094,482,1,0,0,0,2095,2096,7,4,0,0,2096,2097,7,9,0,
+        0,2097,2098,7,2,0,0,2098,2099,7,11,0,0,2099,2100,7,9,0,0,2100,2101,
+        7,2,0,0,2101,484,1,0,0,0,2102,2103,7,12,0,0,2103,2104,7,4,0,0,2104,
+        2105,7,5,0,0,2105,2106,7,0,0,0,2106,2107,7,4,0,0,2107,2108,7,10,
+        0,0,2108,2109,7,1,0,0,2109,486,1,0,0,0,2110,2111,7,16,0,0,2111,2112,
+        7,3,0,0,2112,2113,7,17,0,0,2113,2114,7,17,0,0,2114,2115,7,17,0,0,
+        2115,2116,7,3,0,0,2116,2117,7,10,0,0,2117,2118,7,1,0,0,2118,488,
+        1,0,0,0,2119,2120,7,13,0,0,2120,2121,7,2,0,0,2121,2122,7,22,0,0,
+        2122,2123,7,10,0,0,2123,2124,7,17,0,0,2124,2125,7,3,0,0,2125,2126,
+        7,10,0,0,2126,2127,7,1,0,0,2127,490,1,0,0,0,2128,2129,7,0,0,0,2129,
+        2130,7,37,0,0,2130,2131,7,3,0,0,2131,2132,7,11,0,0,2132,2133,7,10,
+        0,0,2133,2134,7,3,0,0,2134,2135,7,5,0,0,2135,2136,7,1,0,0,2136,492,
+        1,0,0,0,2137,2138,7,5,0,0,2138,2139,7,4,0,0,2139,2140,7,0,0,0,2140,
+        2141,7,37,0,0,2141,2142,7,3,0,0,2142,2143,7,11,0,0,2143,2144,7,10,
+        0,0,2144,2145,7,3,0,0,2145,2146,7,5,0,0,2146,2147,7,1,0,0,2147,494,
+        1,0,0,0,2148,2149,7,15,0,0,2149,2150,7,1,0,0,2150,2151,7,0,0,0,2151,
+        2152,7,1,0,0,2152,2153,7,2,0,0,2153,496,1,0,0,0,2154,2155,7,14,0,
+        0,2155,2156,7,10,0,0,2156,2157,7,30,0,0,2157,2158,7,4,0,0,2158,2159,
+        7,15,0,0,2159,2160,7,3,0,0,2160,2161,7,2,0,0,2161,2162,7,13,0,0,
+        2162,2163,7,22,0,0,2163,498,1,0,0,0,2164,2165,7,1,0,0,2165,2166,
+        7,5,0,0,2166,2167,7,12,0,0,2167,2168,7,4,0,0,2168,2169,7,16,0,0,
+        2169,2170,7,3,0,0,2170,2171,7,5,0,0,2171,2172,7,30,0,0,2172,500,
+        1,0,0,0,2173,2174,7,18,0,0,2174,2175,7,4,0,0,2175,2176,7,15,0,0,
+        2176,2177,7,37,0,0,2177,502,1,0,0,0,2178,2179,7,15,0,0,2179,2180,
+        7,1,0,0,2180,2181,7,17,0,0,2181,2182,7,1,0,0,2182,2183,7,15,0,0,
+        2183,2184,7,1,0,0,2184,2185,7,5,0,0,2185,2186,7,12,0,0,2186,2187,
+        7,1,0,0,2187,504,1,0,0,0,2188,2189,7,10,0,0,2189,2190,7,12,0,0,2190,
+        2191,7,0,0,0,2191,506,1,0,0,0,2192,2193,7,22,0,0,2193,2194,7,33,
+        0,0,2194,2195,7,1,0,0,2195,2196,7,15,0,0,2196,2197,7,0,0,0,2197,
+        508,1,0,0,0,2198,2199,7,16,0,0,2199,2200,7,3,0,0,2200,2201,7,17,
+        0,0,2201,2202,7,17,0,0,2202,2203,7,10,0,0,2203,2204,7,3,0,0,2204,
+        2205,7,21,0,0,2205,510,1,0,0,0,2206,2207,7,14,0,0,2207,2208,7,9,
+        0,0,2208,2209,7,2,0,0,2209,2210,7,4,0,0,2210,512,1,0,0,0,2211,2218,
+        3,133,52,0,2212,2218,3,121,46,0,2213,2218,3,125,48,0,2214,2218,3,
+        135,53,0,2215,2218,3,137,54,0,2216,2218,7,39,0,0,2217,2211,1,0,0,
+        0,2217,2212,1,0,0,0,2217,2213,1,0,0,0,2217,2214,1,0,0,0,2217,2215,
+        1,0,0,0,2217,2216,1,0,0,0,2218,2219,1,0,0,0,2219,2217,1,0,0,0,2219,
+        2220,1,0,0,0,2220,514,1,0,0,0,2221,2223,7,40,0,0,2222,2221,1,0,0,
+        0,2223,2224,1,0,0,0,2224,2222,1,0,0,0,2224,2225,1,0,0,0,2225,2226,
+        1,0,0,0,2226,2227,6,243,1,0,2227,516,1,0,0,0,2228,2229,5,59,0,0,
+        2229,2230,1,0,0,0,2230,2231,6,244,27,0,2231,518,1,0,0,0,2232,2233,
+        7,0,0,0,2233,2234,7,1,0,0,2234,2235,7,2,0,0,2235,520,1,0,0,0,2236,
+        2237,7,0,0,0,2237,2238,7,1,0,0,2238,2239,7,1,0,0,2239,2240,7,16,
+        0,0,2240,2241,7,17,0,0,2241,2242,7,3,0,0,2242,2243,7,10,0,0,2243,
+        2244,7,1,0,0,2244,522,1,0,0,0,2245,2246,7,16,0,0,2246,2247,7,3,0,
+        0,2247,2248,7,15,0,0,2248,524,1,0,0,0,2249,2250,7,12,0,0,2250,2251,
+        7,15,0,0,2251,2252,7,1,0,0,2252,2253,7,14,0,0,2253,2254,7,2,0,0,
+        2254,2255,7,1,0,0,2255,526,1,0,0,0,2256,2257,7,17,0,0,2257,2258,
+        7,3,0,0,2258,2259,7,10,0,0,2259,2260,7,1,0,0,2260,528,1,0,0,0,2261,
+        2262,7,17,0,0,2262,2271,7,0,0,0,2263,2264,7,22,0,0,2264,2265,7,1,
+        0,0,2265,2271,7,22,0,0,2266,2267,7,13,0,0,2267,2268,7,16,0,0,2268,
+        2269,7,17,0,0,2269,2271,7,0,0,0,2270,2261,1,0,0,0,2270,2263,1,0,
+        0,0,2270,2266,1,0,0,0,2271,530,1,0,0,0,2272,2273,7,13,0,0,2273,2274,
+        7,16,0,0,2274,2275,7,17,0,0,2275,2276,7,0,0,0,2276,2277,7,9,0,0,
+        2277,2278,7,0,0,0,2278,2279,7,1,0,0,2279,2280,7,15,0,0,2280,532,
+        1,0,0,0,2281,2282,7,15,0,0,2282,2283,7,4,0,0,2283,2284,7,18,0,0,
+        2284,2285,7,0,0,0,2285,534,1,0,0,0,2286,2287,3,115,43,0,2287,536,
+        1,0,0,0,2288,2289,5,44,0,0,2289,538,1,0,0,0,2290,2291,5,40,0,0,2291,
+        2292,1,0,0,0,2292,2293,6,255,36,0,2293,540,1,0,0,0,2294,2295,7,12,
+        0,0,2295,2296,7,4,0,0,2296,2297,7,5,0,0,2297,2298,7,19,0,0,2298,
+        2299,7,1,0,0,2299,2300,7,15,0,0,2300,2301,7,2,0,0,2301,542,1,0,0,
+        0,2302,2303,7,2,0,0,2303,2304,7,4,0,0,2304,544,1,0,0,0,2305,2312,
+        3,133,52,0,2306,2312,3,121,46,0,2307,2312,3,125,48,0,2308,2312,3,
+        135,53,0,2309,2312,3,137,54,0,2310,2312,7,39,0,0,2311,2305,1,0,0,
+        0,2311,2306,1,0,0,0,2311,2307,1,0,0,0,2311,2308,1,0,0,0,2311,2309,
+        1,0,0,0,2311,2310,1,0,0,0,2312,2313,1,0,0,0,2313,2311,1,0,0,0,2313,
+        2314,1,0,0,0,2314,546,1,0,0,0,2315,2317,7,40,0,0,2316,2315,1,0,0,
+        0,2317,2318,1,0,0,0,2318,2316,1,0,0,0,2318,2319,1,0,0,0,2319,2320,
+        1,0,0,0,2320,2321,6,259,1,0,2321,548,1,0,0,0,2322,2323,5,41,0,0,
+        2323,550,1,0,0,0,2324,2326,9,0,0,0,2325,2324,1,0,0,0,2326,2329,1,
+        0,0,0,2327,2328,1,0,0,0,2327,2325,1,0,0,0,2328,2330,1,0,0,0,2329,
+        2327,1,0,0,0,2330,2332,3,549,260,0,2331,2327,1,0,0,0,2332,2333,1,
+        0,0,0,2333,2331,1,0,0,0,2333,2334,1,0,0,0,2334,2335,1,0,0,0,2335,
+        2336,6,261,27,0,2336,552,1,0,0,0,2337,2339,7,6,0,0,2338,2337,1,0,
+        0,0,2339,2340,1,0,0,0,2340,2338,1,0,0,0,2340,2341,1,0,0,0,2341,2342,
+        1,0,0,0,2342,2343,6,262,1,0,2343,554,1,0,0,0,2344,2346,7,41,0,0,
+        2345,2344,1,0,0,0,2346,2347,1,0,0,0,2347,2345,1,0,0,0,2347,2348,
+        1,0,0,0,2348,556,1,0,0,0,2349,2350,3,39,5,0,2350,2351,1,0,0,0,2351,
+        2352,6,264,27,0,2352,558,1,0,0,0,2353,2354,5,59,0,0,2354,560,1,0,
+        0,0,2355,2357,7,6,0,0,2356,2355,1,0,0,0,2357,2358,1,0,0,0,2358,2356,
+        1,0,0,0,2358,2359,1,0,0,0,2359,2360,1,0,0,0,2360,2361,6,266,1,0,
+        2361,562,1,0,0,0,2362,2363,7,22,0,0,2363,2364,7,4,0,0,2364,2365,
+        7,5,0,0,2365,2366,7,3,0,0,2366,2367,7,2,0,0,2367,2368,7,4,0,0,2368,
+        2369,7,15,0,0,2369,2370,7,22,0,0,2370,2371,7,14,0,0,2371,2372,7,
+        5,0,0,2372,2373,7,14,0,0,2373,2374,7,30,0,0,2374,2375,7,1,0,0,2375,
+        2376,7,15,0,0,2376,564,1,0,0,0,2377,2378,7,18,0,0,2378,2379,7,4,
+        0,0,2379,2380,7,15,0,0,2380,2381,7,37,0,0,2381,2382,7,1,0,0,2382,
+        2383,7,15,0,0,2383,2384,7,0,0,0,2384,566,1,0,0,0,2385,2386,7,12,
+        0,0,2386,2387,7,15,0,0,2387,2388,7,1,0,0,2388,2389,7,14,0,0,2389,
+        2390,7,2,0,0,2390,2391,7,1,0,0,2391,568,1,0,0,0,2392,2393,7,2,0,
+        0,2393,2394,7,14,0,0,2394,2395,7,0,0,0,2395,2396,7,37,0,0,2396,570,
+        1,0,0,0,2397,2398,5,61,0,0,2398,572,1,0,0,0,2399,2400,7,0,0,0,2400,
+        2401,7,2,0,0,2401,2402,7,14,0,0,2402,2403,7,15,0,0,2403,2404,7,2,
+        0,0,2404,574,1,0,0,0,2405,2406,7,0,0,0,2406,2407,7,2,0,0,2407,2408,
+        7,4,0,0,2408,2409,7,11,0,0,2409,576,1,0,0,0,2410,2411,7,15,0,0,2411,
+        2412,7,1,0,0,2412,2413,7,11,0,0,2413,2414,7,4,0,0,2414,2415,7,15,
+        0,0,2415,2416,7,2,0,0,2416,578,1,0,0,0,2417,2418,7,10,0,0,2418,2419,
+        7,3,0,0,2419,2420,7,0,0,0,2420,2421,7,2,0,0,2421,580,1,0,0,0,2422,
+        2423,7,0,0,0,2423,2424,7,9,0,0,2424,2425,7,22,0,0,2425,2426,7,22,
+        0,0,2426,2427,7,14,0,0,2427,2428,7,15,0,0,2428,2429,7,33,0,0,2429,
+        582,1,0,0,0,2430,2431,7,1,0,0,2431,2432,7,7,0,0,2432,2433,7,11,0,
+        0,2433,2434,7,4,0,0,2434,2435,7,15,0,0,2435,2436,7,2,0,0,2436,584,
+        1,0,0,0,2437,2438,7,4,0,0,2438,2439,7,5,0,0,2439,586,1,0,0,0,2440,
+        2441,7,4,0,0,2441,2442,7,17,0,0,2442,2443,7,17,0,0,2443,588,1,0,
+        0,0,2444,2450,3,133,52,0,2445,2450,3,121,46,0,2446,2450,3,125,48,
+        0,2447,2450,3,135,53,0,2448,2450,3,137,54,0,2449,2444,1,0,0,0,2449,
+        2445,1,0,0,0,2449,2446,1,0,0,0,2449,2447,1,0,0,0,2449,2448,1,0,0,
+        0,2450,2451,1,0,0,0,2451,2449,1,0,0,0,2451,2452,1,0,0,0,2452,590,
+        1,0,0,0,2453,2454,3,39,5,0,2454,2455,1,0,0,0,2455,2456,6,281,27,
+        0,2456,592,1,0,0,0,2457,2458,5,59,0,0,2458,594,1,0,0,0,2459,2461,
+        7,6,0,0,2460,2459,1,0,0,0,2461,2462,1,0,0,0,2462,2460,1,0,0,0,2462,
+        2463,1,0,0,0,2463,2464,1,0,0,0,2464,2465,6,283,1,0,2465,596,1,0,
+        0,0,2466,2472,3,133,52,0,2467,2472,3,121,46,0,2468,2472,3,125,48,
+        0,2469,2472,3,135,53,0,2470,2472,3,137,54,0,2471,2466,1,0,0,0,2471,
+        2467,1,0,0,0,2471,2468,1,0,0,0,2471,2469,1,0,0,0,2471,2470,1,0,0,
+        0,2472,2473,1,0,0,0,2473,2471,1,0,0,0,2473,2474,1,0,0,0,2474,598,
+        1,0,0,0,2475,2476,3,39,5,0,2476,2477,1,0,0,0,2477,2478,6,285,27,
+        0,2478,600,1,0,0,0,2479,2480,5,59,0,0,2480,602,1,0,0,0,2481,2483,
+        7,6,0,0,2482,2481,1,0,0,0,2483,2484,1,0,0,0,2484,2482,1,0,0,0,2484,
+        2485,1,0,0,0,2485,2486,1,0,0,0,2486,2487,6,287,1,0,2487,604,1,0,
+        0,0,2488,2495,3,133,52,0,2489,2495,3,121,46,0,2490,2495,3,125,48,
+        0,2491,2495,3,135,53,0,2492,2495,3,137,54,0,2493,2495,7,39,0,0,2494,
+        2488,1,0,0,0,2494,2489,1,0,0,0,2494,2490,1,0,0,0,2494,2491,1,0,0,
+        0,2494,2492,1,0,0,0,2494,2493,1,0,0,0,2495,2496,1,0,0,0,2496,2494,
+        1,0,0,0,2496,2497,1,0,0,0,2497,606,1,0,0,0,2498,2499,3,39,5,0,2499,
+        2500,1,0,0,0,2500,2501,6,289,27,0,2501,608,1,0,0,0,2502,2503,5,59,
+        0,0,2503,610,1,0,0,0,130,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,
+        17,18,19,20,21,22,23,24,25,26,27,28,618,631,636,646,651,703,744,
+        749,900,907,912,918,926,928,933,954,956,958,967,971,973,975,986,
+        1002,1038,1051,1061,1073,1079,1082,1095,1106,1108,1115,1125,1134,
+        1165,1175,1180,1203,1240,1242,1253,1290,1292,1303,1310,1317,1328,
+        1339,1357,1368,1370,1379,1446,1448,1459,1470,1472,1481,1492,1494,
+        1503,1517,1529,1585,1597,1632,1643,1645,1660,1671,1673,1692,1853,
+        1870,1872,1877,1991,1993,1998,2217,2219,2224,2270,2311,2313,2318,
+        2327,2333,2340,2347,2358,2449,2451,2462,2471,2473,2484,2494,2496,
+        37,5,1,0,0,1,0,5,6,0,5,7,0,5,28,0,5,19,0,5,9,0,5,8,0,5,10,0,5,12,
+        0,5,11,0,5,13,0,5,25,0,5,14,0,5,18,0,5,17,0,5,15,0,5,16,0,5,20,0,
+        5,21,0,5,22,0,5,23,0,5,26,0,5,27,0,0,2,0,7,6,0,2,2,0,4,0,0,2,3,0,
+        3,0,0,2,4,0,6,0,0,2,5,0,7,46,0,7,51,0,2,0,0,5,24,0
     ]
 
 class APILexer(Lexer):
@@ -1294,19 +1301,21 @@ class APILexer(Lexer):
     MONITOR_STOP = 257
     MONITOR_REPORT = 258
     MONITOR_LIST = 259
-    MONITOR_ON = 260
-    MONITOR_OFF = 261
-    MONITOR_EXPRESSION = 262
-    MONITOR_CRLF = 263
-    MONITOR_SEMICOLON = 264
-    PLUGIN_SPACE = 265
-    PLUGIN_EXPRESSION = 266
-    PLUGIN_CRLF = 267
-    PLUGIN_SEMICOLON = 268
-    SLEEP_SPACE = 269
-    SLEEP_EXPRESSION = 270
-    SLEEP_CRLF = 271
-    SLEEP_SEMICOLON = 272
+    MONITOR_SUMMARY = 260
+    MONITOR_EXPORT = 261
+    MONITOR_ON = 262
+    MONITOR_OFF = 263
+    MONITOR_EXPRESSION = 264
+    MONITOR_CRLF = 265
+    MONITOR_SEMICOLON = 266
+    PLUGIN_SPACE = 267
+    PLUGIN_EXPRESSION = 268
+    PLUGIN_CRLF = 269
+    PLUGIN_SEMICOLON = 270
+    SLEEP_SPACE = 271
+    SLEEP_EXPRESSION = 272
+    SLEEP_CRLF = 273
+    SLEEP_SEMICOLON = 274
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN", u"COMMENT_CHANNEL" ]
 
@@ -1339,7 +1348,7 @@ class APILexer(Lexer):
             "'ENCODING'", "'WORK'", "'REFERENCE'", "'LCS'", "'MYERS'", "'DIFFLIB'", 
             "'AUTO'", "'SEEDFILE'", "'DIR'", "'HDFSUSER'", "'ROWS'", "'CONVERT'", 
             "'MONITORMANAGER'", "'WORKERS'", "'TASK'", "'STOP'", "'REPORT'", 
-            "'LIST'" ]
+            "'LIST'", "'SUMMARY'", "'EXPORT'" ]
 
     symbolicNames = [ "<INVALID>",
             "HTTP_OPEN", "COMMENT1", "COMMENT2", "APISET", "SESSION", "CRLF", 
@@ -1398,10 +1407,11 @@ class APILexer(Lexer):
             "DATACOLUMN_CONTENT", "HELP_SPACE", "HELP_COMMAND", "HELP_CRLF", 
             "HELP_SEMICOLON", "MONITOR_SPACE", "MONITOR_MANAGER", "MONITOR_WORKERS", 
             "MONITOR_CREATE", "MONITOR_TASK", "MONITOR_EQUAL", "MONITOR_START", 
-            "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", "MONITOR_ON", 
-            "MONITOR_OFF", "MONITOR_EXPRESSION", "MONITOR_CRLF", "MONITOR_SEMICOLON", 
-            "PLUGIN_SPACE", "PLUGIN_EXPRESSION", "PLUGIN_CRLF", "PLUGIN_SEMICOLON", 
-            "SLEEP_SPACE", "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
+            "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", "MONITOR_SUMMARY", 
+            "MONITOR_EXPORT", "MONITOR_ON", "MONITOR_OFF", "MONITOR_EXPRESSION", 
+            "MONITOR_CRLF", "MONITOR_SEMICOLON", "PLUGIN_SPACE", "PLUGIN_EXPRESSION", 
+            "PLUGIN_CRLF", "PLUGIN_SEMICOLON", "SLEEP_SPACE", "SLEEP_EXPRESSION", 
+            "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
 
     ruleNames = [ "HTTP_OPEN", "COMMENT1", "COMMENT2", "APISET", "SESSION", 
                   "CRLF", "COMMA", "SEMICOLON", "COLON", "AT", "DOT", "SLASH", 
@@ -1470,10 +1480,10 @@ class APILexer(Lexer):
                   "HELP_SEMICOLON", "MONITOR_SPACE", "MONITOR_MANAGER", 
                   "MONITOR_WORKERS", "MONITOR_CREATE", "MONITOR_TASK", "MONITOR_EQUAL", 
                   "MONITOR_START", "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", 
-                  "MONITOR_ON", "MONITOR_OFF", "MONITOR_EXPRESSION", "MONITOR_CRLF", 
-                  "MONITOR_SEMICOLON", "PLUGIN_SPACE", "PLUGIN_EXPRESSION", 
-                  "PLUGIN_CRLF", "PLUGIN_SEMICOLON", "SLEEP_SPACE", "SLEEP_EXPRESSION", 
-                  "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
+                  "MONITOR_SUMMARY", "MONITOR_EXPORT", "MONITOR_ON", "MONITOR_OFF", 
+                  "MONITOR_EXPRESSION", "MONITOR_CRLF", "MONITOR_SEMICOLON", 
+                  "PLUGIN_SPACE", "PLUGIN_EXPRESSION", "PLUGIN_CRLF", "PLUGIN_SEMICOLON", 
+                  "SLEEP_SPACE", "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
 
     grammarFileName = "APILexer.g4"
 
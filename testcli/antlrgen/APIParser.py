@@ -10,281 +10,293 @@ else:
 
 def serializedATN():
     return [
-        4,1,272,683,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
+        4,1,274,711,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
         7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,
         13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,
         20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,
         26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,
         33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,
-        39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,1,0,1,0,1,0,1,1,1,1,1,
-        1,1,1,1,1,3,1,97,8,1,1,2,1,2,1,2,1,2,1,2,1,2,3,2,105,8,2,1,2,3,2,
-        108,8,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,3,3,118,8,3,3,3,120,8,3,
-        1,3,3,3,123,8,3,1,4,1,4,5,4,127,8,4,10,4,12,4,130,9,4,1,4,1,4,1,
-        4,1,5,1,5,1,5,3,5,138,8,5,1,6,1,6,1,6,1,7,1,7,1,8,1,8,1,9,5,9,148,
-        8,9,10,9,12,9,151,9,9,1,10,1,10,1,10,1,10,1,11,1,11,1,12,1,12,1,
-        12,1,13,1,13,4,13,164,8,13,11,13,12,13,165,1,14,4,14,169,8,14,11,
-        14,12,14,170,1,14,1,14,1,15,1,15,1,15,1,15,1,16,1,16,1,17,1,17,4,
-        17,183,8,17,11,17,12,17,184,1,18,1,18,1,19,4,19,190,8,19,11,19,12,
-        19,191,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,
-        20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,3,20,217,
-        8,20,1,21,1,21,3,21,221,8,21,1,21,3,21,224,8,21,1,21,3,21,227,8,
-        21,1,22,1,22,3,22,231,8,22,1,22,3,22,234,8,22,1,22,3,22,237,8,22,
-        1,23,1,23,1,23,3,23,242,8,23,1,23,3,23,245,8,23,1,24,1,24,1,24,3,
-        24,250,8,24,1,24,3,24,253,8,24,1,25,1,25,4,25,257,8,25,11,25,12,
-        25,258,1,25,3,25,262,8,25,1,25,3,25,265,8,25,1,26,1,26,1,26,1,26,
+        39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,1,0,1,0,1,0,
+        1,1,1,1,1,1,1,1,1,1,3,1,99,8,1,1,2,1,2,1,2,1,2,1,2,1,2,3,2,107,8,
+        2,1,2,3,2,110,8,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,3,3,120,8,3,3,
+        3,122,8,3,1,3,3,3,125,8,3,1,4,1,4,5,4,129,8,4,10,4,12,4,132,9,4,
+        1,4,1,4,1,4,1,5,1,5,1,5,3,5,140,8,5,1,6,1,6,1,6,1,7,1,7,1,8,1,8,
+        1,9,5,9,150,8,9,10,9,12,9,153,9,9,1,10,1,10,1,10,1,10,1,11,1,11,
+        1,12,1,12,1,12,1,13,1,13,4,13,166,8,13,11,13,12,13,167,1,14,4,14,
+        171,8,14,11,14,12,14,172,1,14,1,14,1,15,1,15,1,15,1,15,1,16,1,16,
+        1,17,1,17,4,17,185,8,17,11,17,12,17,186,1,18,1,18,1,19,4,19,192,
+        8,19,11,19,12,19,193,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,
+        1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,
+        1,20,3,20,219,8,20,1,21,1,21,3,21,223,8,21,1,21,3,21,226,8,21,1,
+        21,3,21,229,8,21,1,22,1,22,3,22,233,8,22,1,22,3,22,236,8,22,1,22,
+        3,22,239,8,22,1,23,1,23,1,23,3,23,244,8,23,1,23,3,23,247,8,23,1,
+        24,1,24,1,24,3,24,252,8,24,1,24,3,24,255,8,24,1,25,1,25,4,25,259,
+        8,25,11,25,12,25,260,1,25,3,25,264,8,25,1,25,3,25,267,8,25,1,26,
         1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,
-        1,26,1,26,1,26,1,26,1,26,1,26,5,26,290,8,26,10,26,12,26,293,9,26,
-        3,26,295,8,26,1,26,3,26,298,8,26,1,26,3,26,301,8,26,1,27,1,27,1,
-        27,3,27,306,8,27,1,27,3,27,309,8,27,1,27,3,27,312,8,27,1,27,3,27,
-        315,8,27,1,28,1,28,1,28,3,28,320,8,28,1,28,3,28,323,8,28,1,29,1,
-        29,1,29,1,29,1,29,1,29,1,29,1,29,3,29,333,8,29,1,29,1,29,1,29,1,
-        29,3,29,339,8,29,1,29,3,29,342,8,29,1,29,3,29,345,8,29,1,30,1,30,
-        1,30,3,30,350,8,30,1,30,3,30,353,8,30,1,31,1,31,3,31,357,8,31,1,
-        31,3,31,360,8,31,1,32,1,32,1,32,1,32,1,32,3,32,367,8,32,1,32,3,32,
-        370,8,32,1,32,3,32,373,8,32,1,33,1,33,1,33,3,33,378,8,33,1,33,3,
-        33,381,8,33,1,34,1,34,1,34,3,34,386,8,34,1,35,1,35,1,35,3,35,391,
-        8,35,1,36,1,36,5,36,395,8,36,10,36,12,36,398,9,36,1,36,3,36,401,
-        8,36,1,36,3,36,404,8,36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
-        1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,3,37,425,
-        8,37,1,37,1,37,4,37,429,8,37,11,37,12,37,430,1,37,1,37,1,37,1,37,
+        1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,5,26,292,8,26,10,26,
+        12,26,295,9,26,3,26,297,8,26,1,26,3,26,300,8,26,1,26,3,26,303,8,
+        26,1,27,1,27,1,27,3,27,308,8,27,1,27,3,27,311,8,27,1,27,3,27,314,
+        8,27,1,27,3,27,317,8,27,1,28,1,28,1,28,3,28,322,8,28,1,28,3,28,325,
+        8,28,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,3,29,335,8,29,1,29,
+        1,29,1,29,1,29,3,29,341,8,29,1,29,3,29,344,8,29,1,29,3,29,347,8,
+        29,1,30,1,30,1,30,3,30,352,8,30,1,30,3,30,355,8,30,1,31,1,31,3,31,
+        359,8,31,1,31,3,31,362,8,31,1,32,1,32,1,32,1,32,1,32,3,32,369,8,
+        32,1,32,3,32,372,8,32,1,32,3,32,375,8,32,1,33,1,33,1,33,3,33,380,
+        8,33,1,33,3,33,383,8,33,1,34,1,34,1,34,3,34,388,8,34,1,35,1,35,1,
+        35,3,35,393,8,35,1,36,1,36,5,36,397,8,36,10,36,12,36,400,9,36,1,
+        36,3,36,403,8,36,1,36,3,36,406,8,36,1,37,1,37,1,37,1,37,1,37,1,37,
         1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
+        3,37,427,8,37,1,37,1,37,4,37,431,8,37,11,37,12,37,432,1,37,1,37,
         1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
-        1,37,1,37,1,37,1,37,1,37,3,37,468,8,37,3,37,470,8,37,1,37,3,37,473,
-        8,37,1,37,3,37,476,8,37,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
-        3,38,486,8,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
-        1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,4,38,509,
-        8,38,11,38,12,38,510,1,38,1,38,1,38,1,38,1,38,5,38,518,8,38,10,38,
-        12,38,521,9,38,3,38,523,8,38,1,38,3,38,526,8,38,1,38,3,38,529,8,
-        38,1,39,1,39,1,39,1,39,5,39,535,8,39,10,39,12,39,538,9,39,1,39,1,
-        39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,5,39,551,8,39,10,
-        39,12,39,554,9,39,1,39,1,39,1,39,4,39,559,8,39,11,39,12,39,560,1,
-        39,1,39,1,39,1,39,1,39,1,39,1,39,3,39,570,8,39,1,39,3,39,573,8,39,
-        1,39,3,39,576,8,39,1,40,1,40,1,40,1,40,1,40,1,40,3,40,584,8,40,1,
-        40,1,40,1,40,1,40,3,40,590,8,40,1,40,1,40,1,40,1,40,1,40,1,40,3,
-        40,598,8,40,1,40,1,40,3,40,602,8,40,1,40,1,40,1,40,1,40,1,40,1,40,
-        1,40,1,40,1,40,1,40,3,40,614,8,40,3,40,616,8,40,1,40,3,40,619,8,
-        40,1,41,1,41,3,41,623,8,41,1,41,3,41,626,8,41,1,41,3,41,629,8,41,
-        1,42,1,42,1,42,1,42,1,42,3,42,636,8,42,1,42,1,42,1,42,1,42,1,42,
-        3,42,643,8,42,1,42,1,42,1,42,4,42,648,8,42,11,42,12,42,649,1,42,
-        1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,3,42,663,8,42,
-        1,42,3,42,666,8,42,1,42,3,42,669,8,42,1,43,1,43,4,43,673,8,43,11,
-        43,12,43,674,1,43,3,43,678,8,43,1,43,3,43,681,8,43,1,43,0,0,44,0,
-        2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,
-        48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,0,12,
-        1,0,67,68,1,1,51,51,2,0,6,6,46,46,1,0,143,144,2,0,135,135,137,137,
-        1,1,6,6,1,0,191,192,2,0,201,202,205,210,1,0,215,216,1,0,212,214,
-        1,0,222,225,1,0,220,221,806,0,88,1,0,0,0,2,96,1,0,0,0,4,98,1,0,0,
-        0,6,109,1,0,0,0,8,124,1,0,0,0,10,134,1,0,0,0,12,139,1,0,0,0,14,142,
-        1,0,0,0,16,144,1,0,0,0,18,149,1,0,0,0,20,152,1,0,0,0,22,156,1,0,
-        0,0,24,158,1,0,0,0,26,163,1,0,0,0,28,168,1,0,0,0,30,174,1,0,0,0,
-        32,178,1,0,0,0,34,182,1,0,0,0,36,186,1,0,0,0,38,189,1,0,0,0,40,216,
-        1,0,0,0,42,218,1,0,0,0,44,228,1,0,0,0,46,238,1,0,0,0,48,246,1,0,
-        0,0,50,254,1,0,0,0,52,266,1,0,0,0,54,302,1,0,0,0,56,316,1,0,0,0,
-        58,324,1,0,0,0,60,346,1,0,0,0,62,354,1,0,0,0,64,361,1,0,0,0,66,374,
-        1,0,0,0,68,382,1,0,0,0,70,387,1,0,0,0,72,392,1,0,0,0,74,405,1,0,
-        0,0,76,477,1,0,0,0,78,530,1,0,0,0,80,577,1,0,0,0,82,620,1,0,0,0,
-        84,630,1,0,0,0,86,670,1,0,0,0,88,89,3,2,1,0,89,90,5,0,0,1,90,1,1,
-        0,0,0,91,97,3,40,20,0,92,97,3,4,2,0,93,97,3,6,3,0,94,97,3,8,4,0,
-        95,97,5,0,0,1,96,91,1,0,0,0,96,92,1,0,0,0,96,93,1,0,0,0,96,94,1,
-        0,0,0,96,95,1,0,0,0,97,3,1,0,0,0,98,104,5,4,0,0,99,100,5,65,0,0,
-        100,105,5,69,0,0,101,102,5,66,0,0,102,105,7,0,0,0,103,105,1,0,0,
-        0,104,99,1,0,0,0,104,101,1,0,0,0,104,103,1,0,0,0,105,107,1,0,0,0,
-        106,108,5,70,0,0,107,106,1,0,0,0,107,108,1,0,0,0,108,5,1,0,0,0,109,
-        119,5,5,0,0,110,111,5,73,0,0,111,120,5,77,0,0,112,120,5,74,0,0,113,
-        114,5,75,0,0,114,120,5,77,0,0,115,117,5,76,0,0,116,118,5,77,0,0,
-        117,116,1,0,0,0,117,118,1,0,0,0,118,120,1,0,0,0,119,110,1,0,0,0,
-        119,112,1,0,0,0,119,113,1,0,0,0,119,115,1,0,0,0,120,122,1,0,0,0,
-        121,123,5,78,0,0,122,121,1,0,0,0,122,123,1,0,0,0,123,7,1,0,0,0,124,
-        128,5,1,0,0,125,127,5,6,0,0,126,125,1,0,0,0,127,130,1,0,0,0,128,
-        126,1,0,0,0,128,129,1,0,0,0,129,131,1,0,0,0,130,128,1,0,0,0,131,
-        132,3,10,5,0,132,133,7,1,0,0,133,9,1,0,0,0,134,135,3,12,6,0,135,
-        137,3,18,9,0,136,138,3,26,13,0,137,136,1,0,0,0,137,138,1,0,0,0,138,
-        11,1,0,0,0,139,140,3,14,7,0,140,141,3,16,8,0,141,13,1,0,0,0,142,
-        143,5,50,0,0,143,15,1,0,0,0,144,145,5,53,0,0,145,17,1,0,0,0,146,
-        148,3,20,10,0,147,146,1,0,0,0,148,151,1,0,0,0,149,147,1,0,0,0,149,
-        150,1,0,0,0,150,19,1,0,0,0,151,149,1,0,0,0,152,153,3,22,11,0,153,
-        154,5,56,0,0,154,155,3,24,12,0,155,21,1,0,0,0,156,157,5,55,0,0,157,
-        23,1,0,0,0,158,159,5,58,0,0,159,160,5,59,0,0,160,25,1,0,0,0,161,
-        164,3,28,14,0,162,164,3,34,17,0,163,161,1,0,0,0,163,162,1,0,0,0,
-        164,165,1,0,0,0,165,163,1,0,0,0,165,166,1,0,0,0,166,27,1,0,0,0,167,
-        169,3,30,15,0,168,167,1,0,0,0,169,170,1,0,0,0,170,168,1,0,0,0,170,
-        171,1,0,0,0,171,172,1,0,0,0,172,173,5,60,0,0,173,29,1,0,0,0,174,
-        175,3,32,16,0,175,176,3,18,9,0,176,177,3,34,17,0,177,31,1,0,0,0,
-        178,179,5,61,0,0,179,33,1,0,0,0,180,183,3,36,18,0,181,183,3,38,19,
-        0,182,180,1,0,0,0,182,181,1,0,0,0,183,184,1,0,0,0,184,182,1,0,0,
-        0,184,185,1,0,0,0,185,35,1,0,0,0,186,187,5,63,0,0,187,37,1,0,0,0,
-        188,190,7,2,0,0,189,188,1,0,0,0,190,191,1,0,0,0,191,189,1,0,0,0,
-        191,192,1,0,0,0,192,39,1,0,0,0,193,217,3,54,27,0,194,217,3,52,26,
-        0,195,217,3,56,28,0,196,217,3,50,25,0,197,217,3,58,29,0,198,217,
-        3,60,30,0,199,217,3,62,31,0,200,217,3,64,32,0,201,217,3,72,36,0,
-        202,217,3,46,23,0,203,217,3,42,21,0,204,217,3,44,22,0,205,217,3,
-        48,24,0,206,217,3,66,33,0,207,217,3,70,35,0,208,217,3,68,34,0,209,
-        217,3,74,37,0,210,217,3,76,38,0,211,217,3,78,39,0,212,217,3,80,40,
-        0,213,217,3,82,41,0,214,217,3,84,42,0,215,217,3,86,43,0,216,193,
-        1,0,0,0,216,194,1,0,0,0,216,195,1,0,0,0,216,196,1,0,0,0,216,197,
-        1,0,0,0,216,198,1,0,0,0,216,199,1,0,0,0,216,200,1,0,0,0,216,201,
-        1,0,0,0,216,202,1,0,0,0,216,203,1,0,0,0,216,204,1,0,0,0,216,205,
-        1,0,0,0,216,206,1,0,0,0,216,207,1,0,0,0,216,208,1,0,0,0,216,209,
-        1,0,0,0,216,210,1,0,0,0,216,211,1,0,0,0,216,212,1,0,0,0,216,213,
-        1,0,0,0,216,214,1,0,0,0,216,215,1,0,0,0,217,41,1,0,0,0,218,220,5,
-        21,0,0,219,221,5,44,0,0,220,219,1,0,0,0,220,221,1,0,0,0,221,223,
-        1,0,0,0,222,224,5,8,0,0,223,222,1,0,0,0,223,224,1,0,0,0,224,226,
-        1,0,0,0,225,227,5,6,0,0,226,225,1,0,0,0,226,227,1,0,0,0,227,43,1,
-        0,0,0,228,230,5,22,0,0,229,231,5,44,0,0,230,229,1,0,0,0,230,231,
-        1,0,0,0,231,233,1,0,0,0,232,234,5,8,0,0,233,232,1,0,0,0,233,234,
-        1,0,0,0,234,236,1,0,0,0,235,237,5,6,0,0,236,235,1,0,0,0,236,237,
-        1,0,0,0,237,45,1,0,0,0,238,239,5,24,0,0,239,241,7,3,0,0,240,242,
-        5,146,0,0,241,240,1,0,0,0,241,242,1,0,0,0,242,244,1,0,0,0,243,245,
-        5,6,0,0,244,243,1,0,0,0,244,245,1,0,0,0,245,47,1,0,0,0,246,247,5,
-        23,0,0,247,249,5,270,0,0,248,250,5,272,0,0,249,248,1,0,0,0,249,250,
-        1,0,0,0,250,252,1,0,0,0,251,253,5,6,0,0,252,251,1,0,0,0,252,253,
-        1,0,0,0,253,49,1,0,0,0,254,256,5,28,0,0,255,257,5,105,0,0,256,255,
-        1,0,0,0,257,258,1,0,0,0,258,256,1,0,0,0,258,259,1,0,0,0,259,261,
-        1,0,0,0,260,262,5,8,0,0,261,260,1,0,0,0,261,262,1,0,0,0,262,264,
-        1,0,0,0,263,265,5,6,0,0,264,263,1,0,0,0,264,265,1,0,0,0,265,51,1,
-        0,0,0,266,294,5,29,0,0,267,268,5,92,0,0,268,295,5,101,0,0,269,270,
-        5,93,0,0,270,295,5,101,0,0,271,272,5,94,0,0,272,295,5,101,0,0,273,
-        291,5,95,0,0,274,275,5,97,0,0,275,276,5,91,0,0,276,290,5,101,0,0,
-        277,278,5,96,0,0,278,279,5,91,0,0,279,290,5,101,0,0,280,281,5,98,
-        0,0,281,282,5,91,0,0,282,290,5,101,0,0,283,284,5,99,0,0,284,285,
-        5,91,0,0,285,290,5,101,0,0,286,287,5,100,0,0,287,288,5,91,0,0,288,
-        290,5,101,0,0,289,274,1,0,0,0,289,277,1,0,0,0,289,280,1,0,0,0,289,
-        283,1,0,0,0,289,286,1,0,0,0,290,293,1,0,0,0,291,289,1,0,0,0,291,
-        292,1,0,0,0,292,295,1,0,0,0,293,291,1,0,0,0,294,267,1,0,0,0,294,
-        269,1,0,0,0,294,271,1,0,0,0,294,273,1,0,0,0,295,297,1,0,0,0,296,
-        298,5,102,0,0,297,296,1,0,0,0,297,298,1,0,0,0,298,300,1,0,0,0,299,
-        301,5,103,0,0,300,299,1,0,0,0,300,301,1,0,0,0,301,53,1,0,0,0,302,
-        303,5,27,0,0,303,308,5,86,0,0,304,306,5,88,0,0,305,304,1,0,0,0,305,
-        306,1,0,0,0,306,307,1,0,0,0,307,309,5,87,0,0,308,305,1,0,0,0,308,
-        309,1,0,0,0,309,311,1,0,0,0,310,312,5,89,0,0,311,310,1,0,0,0,311,
-        312,1,0,0,0,312,314,1,0,0,0,313,315,5,6,0,0,314,313,1,0,0,0,314,
-        315,1,0,0,0,315,55,1,0,0,0,316,317,5,30,0,0,317,319,5,108,0,0,318,
-        320,5,8,0,0,319,318,1,0,0,0,319,320,1,0,0,0,320,322,1,0,0,0,321,
-        323,5,6,0,0,322,321,1,0,0,0,322,323,1,0,0,0,323,57,1,0,0,0,324,338,
-        5,36,0,0,325,339,5,122,0,0,326,339,5,123,0,0,327,339,5,124,0,0,328,
-        329,5,116,0,0,329,330,5,117,0,0,330,339,5,125,0,0,331,333,5,119,
-        0,0,332,331,1,0,0,0,332,333,1,0,0,0,333,334,1,0,0,0,334,335,5,117,
-        0,0,335,336,5,125,0,0,336,337,5,118,0,0,337,339,5,119,0,0,338,325,
-        1,0,0,0,338,326,1,0,0,0,338,327,1,0,0,0,338,328,1,0,0,0,338,332,
-        1,0,0,0,339,341,1,0,0,0,340,342,5,114,0,0,341,340,1,0,0,0,341,342,
-        1,0,0,0,342,344,1,0,0,0,343,345,5,6,0,0,344,343,1,0,0,0,344,345,
-        1,0,0,0,345,59,1,0,0,0,346,347,5,32,0,0,347,349,5,113,0,0,348,350,
-        5,8,0,0,349,348,1,0,0,0,349,350,1,0,0,0,350,352,1,0,0,0,351,353,
-        5,6,0,0,352,351,1,0,0,0,352,353,1,0,0,0,353,61,1,0,0,0,354,356,5,
-        33,0,0,355,357,5,8,0,0,356,355,1,0,0,0,356,357,1,0,0,0,357,359,1,
-        0,0,0,358,360,5,6,0,0,359,358,1,0,0,0,359,360,1,0,0,0,360,63,1,0,
-        0,0,361,362,5,37,0,0,362,366,5,129,0,0,363,367,5,131,0,0,364,365,
-        5,132,0,0,365,367,5,128,0,0,366,363,1,0,0,0,366,364,1,0,0,0,367,
-        369,1,0,0,0,368,370,5,130,0,0,369,368,1,0,0,0,369,370,1,0,0,0,370,
-        372,1,0,0,0,371,373,5,6,0,0,372,371,1,0,0,0,372,373,1,0,0,0,373,
-        65,1,0,0,0,374,375,5,35,0,0,375,377,7,4,0,0,376,378,5,136,0,0,377,
-        376,1,0,0,0,377,378,1,0,0,0,378,380,1,0,0,0,379,381,5,138,0,0,380,
-        379,1,0,0,0,380,381,1,0,0,0,381,67,1,0,0,0,382,383,5,25,0,0,383,
-        385,5,81,0,0,384,386,7,5,0,0,385,384,1,0,0,0,385,386,1,0,0,0,386,
-        69,1,0,0,0,387,388,5,26,0,0,388,390,5,80,0,0,389,391,5,6,0,0,390,
-        389,1,0,0,0,390,391,1,0,0,0,391,71,1,0,0,0,392,396,5,34,0,0,393,
-        395,5,140,0,0,394,393,1,0,0,0,395,398,1,0,0,0,396,394,1,0,0,0,396,
-        397,1,0,0,0,397,400,1,0,0,0,398,396,1,0,0,0,399,401,5,141,0,0,400,
-        399,1,0,0,0,400,401,1,0,0,0,401,403,1,0,0,0,402,404,5,6,0,0,403,
-        402,1,0,0,0,403,404,1,0,0,0,404,73,1,0,0,0,405,469,5,38,0,0,406,
-        407,5,148,0,0,407,408,5,174,0,0,408,409,5,149,0,0,409,410,5,150,
-        0,0,410,411,5,174,0,0,411,412,5,152,0,0,412,470,5,174,0,0,413,414,
-        5,151,0,0,414,415,5,174,0,0,415,416,5,170,0,0,416,470,5,174,0,0,
-        417,418,5,148,0,0,418,419,5,174,0,0,419,420,5,149,0,0,420,421,5,
-        150,0,0,421,424,5,174,0,0,422,423,5,153,0,0,423,425,5,174,0,0,424,
-        422,1,0,0,0,424,425,1,0,0,0,425,470,1,0,0,0,426,428,5,154,0,0,427,
-        429,5,174,0,0,428,427,1,0,0,0,429,430,1,0,0,0,430,428,1,0,0,0,430,
-        431,1,0,0,0,431,470,1,0,0,0,432,470,5,155,0,0,433,434,5,156,0,0,
-        434,470,5,174,0,0,435,436,5,157,0,0,436,470,5,174,0,0,437,467,5,
-        158,0,0,438,439,5,159,0,0,439,440,5,174,0,0,440,468,5,44,0,0,441,
-        468,5,160,0,0,442,443,5,161,0,0,443,468,5,174,0,0,444,445,5,162,
-        0,0,445,446,5,174,0,0,446,447,5,44,0,0,447,468,5,44,0,0,448,449,
-        5,163,0,0,449,450,5,174,0,0,450,468,5,44,0,0,451,452,5,164,0,0,452,
-        453,5,174,0,0,453,468,5,174,0,0,454,455,5,165,0,0,455,456,5,174,
-        0,0,456,468,5,174,0,0,457,458,5,166,0,0,458,468,5,174,0,0,459,460,
-        5,167,0,0,460,461,5,174,0,0,461,468,5,174,0,0,462,463,5,168,0,0,
-        463,468,5,174,0,0,464,465,5,169,0,0,465,466,5,174,0,0,466,468,5,
-        44,0,0,467,438,1,0,0,0,467,441,1,0,0,0,467,442,1,0,0,0,467,444,1,
-        0,0,0,467,448,1,0,0,0,467,451,1,0,0,0,467,454,1,0,0,0,467,457,1,
-        0,0,0,467,459,1,0,0,0,467,462,1,0,0,0,467,464,1,0,0,0,468,470,1,
-        0,0,0,469,406,1,0,0,0,469,413,1,0,0,0,469,417,1,0,0,0,469,426,1,
-        0,0,0,469,432,1,0,0,0,469,433,1,0,0,0,469,435,1,0,0,0,469,437,1,
-        0,0,0,470,472,1,0,0,0,471,473,5,172,0,0,472,471,1,0,0,0,472,473,
-        1,0,0,0,473,475,1,0,0,0,474,476,5,6,0,0,475,474,1,0,0,0,475,476,
-        1,0,0,0,476,75,1,0,0,0,477,522,5,39,0,0,478,479,5,190,0,0,479,523,
-        7,6,0,0,480,481,5,183,0,0,481,485,5,194,0,0,482,483,5,194,0,0,483,
-        484,5,177,0,0,484,486,5,194,0,0,485,482,1,0,0,0,485,486,1,0,0,0,
-        486,523,1,0,0,0,487,488,5,180,0,0,488,523,5,194,0,0,489,490,5,185,
-        0,0,490,523,5,194,0,0,491,492,5,184,0,0,492,523,5,194,0,0,493,494,
-        5,186,0,0,494,523,5,194,0,0,495,496,5,182,0,0,496,523,5,194,0,0,
-        497,498,5,188,0,0,498,523,5,189,0,0,499,500,5,187,0,0,500,501,5,
-        189,0,0,501,502,5,193,0,0,502,523,5,194,0,0,503,504,5,181,0,0,504,
-        508,5,194,0,0,505,506,5,194,0,0,506,507,5,177,0,0,507,509,5,194,
-        0,0,508,505,1,0,0,0,509,510,1,0,0,0,510,508,1,0,0,0,510,511,1,0,
-        0,0,511,523,1,0,0,0,512,513,5,179,0,0,513,519,5,194,0,0,514,515,
-        5,194,0,0,515,516,5,177,0,0,516,518,5,194,0,0,517,514,1,0,0,0,518,
-        521,1,0,0,0,519,517,1,0,0,0,519,520,1,0,0,0,520,523,1,0,0,0,521,
-        519,1,0,0,0,522,478,1,0,0,0,522,480,1,0,0,0,522,487,1,0,0,0,522,
-        489,1,0,0,0,522,491,1,0,0,0,522,493,1,0,0,0,522,495,1,0,0,0,522,
-        497,1,0,0,0,522,499,1,0,0,0,522,503,1,0,0,0,522,512,1,0,0,0,523,
-        525,1,0,0,0,524,526,5,176,0,0,525,524,1,0,0,0,525,526,1,0,0,0,526,
-        528,1,0,0,0,527,529,5,6,0,0,528,527,1,0,0,0,528,529,1,0,0,0,529,
-        77,1,0,0,0,530,569,5,40,0,0,531,532,5,226,0,0,532,536,5,226,0,0,
-        533,535,7,7,0,0,534,533,1,0,0,0,535,538,1,0,0,0,536,534,1,0,0,0,
-        536,537,1,0,0,0,537,570,1,0,0,0,538,536,1,0,0,0,539,540,7,8,0,0,
-        540,570,5,226,0,0,541,542,5,203,0,0,542,543,5,226,0,0,543,544,5,
-        197,0,0,544,570,5,226,0,0,545,546,5,204,0,0,546,570,5,226,0,0,547,
-        570,5,217,0,0,548,552,5,199,0,0,549,551,7,7,0,0,550,549,1,0,0,0,
-        551,554,1,0,0,0,552,550,1,0,0,0,552,553,1,0,0,0,553,570,1,0,0,0,
-        554,552,1,0,0,0,555,556,5,199,0,0,556,558,5,211,0,0,557,559,7,9,
-        0,0,558,557,1,0,0,0,559,560,1,0,0,0,560,558,1,0,0,0,560,561,1,0,
-        0,0,561,570,1,0,0,0,562,563,5,199,0,0,563,564,5,218,0,0,564,570,
-        7,10,0,0,565,566,5,199,0,0,566,567,7,11,0,0,567,568,5,219,0,0,568,
-        570,5,226,0,0,569,531,1,0,0,0,569,539,1,0,0,0,569,541,1,0,0,0,569,
-        545,1,0,0,0,569,547,1,0,0,0,569,548,1,0,0,0,569,555,1,0,0,0,569,
-        562,1,0,0,0,569,565,1,0,0,0,570,572,1,0,0,0,571,573,5,196,0,0,572,
-        571,1,0,0,0,572,573,1,0,0,0,573,575,1,0,0,0,574,576,5,6,0,0,575,
-        574,1,0,0,0,575,576,1,0,0,0,576,79,1,0,0,0,577,615,5,41,0,0,578,
-        579,5,229,0,0,579,580,5,230,0,0,580,581,5,231,0,0,581,583,5,242,
-        0,0,582,584,5,228,0,0,583,582,1,0,0,0,583,584,1,0,0,0,584,616,1,
-        0,0,0,585,586,5,229,0,0,586,587,5,235,0,0,587,589,5,242,0,0,588,
-        590,5,228,0,0,589,588,1,0,0,0,589,590,1,0,0,0,590,616,1,0,0,0,591,
-        592,5,232,0,0,592,593,5,234,0,0,593,594,5,233,0,0,594,595,5,242,
-        0,0,595,597,5,239,0,0,596,598,5,245,0,0,597,596,1,0,0,0,597,598,
-        1,0,0,0,598,601,1,0,0,0,599,600,5,236,0,0,600,602,5,237,0,0,601,
-        599,1,0,0,0,601,602,1,0,0,0,602,603,1,0,0,0,603,616,5,228,0,0,604,
-        605,5,240,0,0,605,606,5,234,0,0,606,607,5,233,0,0,607,608,5,242,
-        0,0,608,609,5,241,0,0,609,610,5,234,0,0,610,611,5,233,0,0,611,613,
-        5,242,0,0,612,614,5,228,0,0,613,612,1,0,0,0,613,614,1,0,0,0,614,
-        616,1,0,0,0,615,578,1,0,0,0,615,585,1,0,0,0,615,591,1,0,0,0,615,
-        604,1,0,0,0,616,618,1,0,0,0,617,619,5,6,0,0,618,617,1,0,0,0,618,
-        619,1,0,0,0,619,81,1,0,0,0,620,622,5,31,0,0,621,623,5,247,0,0,622,
-        621,1,0,0,0,622,623,1,0,0,0,623,625,1,0,0,0,624,626,5,249,0,0,625,
-        624,1,0,0,0,625,626,1,0,0,0,626,628,1,0,0,0,627,629,5,6,0,0,628,
-        627,1,0,0,0,628,629,1,0,0,0,629,83,1,0,0,0,630,662,5,42,0,0,631,
-        632,5,251,0,0,632,635,5,260,0,0,633,634,5,252,0,0,634,636,5,262,
-        0,0,635,633,1,0,0,0,635,636,1,0,0,0,636,663,1,0,0,0,637,638,5,251,
-        0,0,638,663,5,261,0,0,639,640,5,253,0,0,640,642,5,254,0,0,641,643,
-        5,262,0,0,642,641,1,0,0,0,642,643,1,0,0,0,643,647,1,0,0,0,644,645,
-        5,262,0,0,645,646,5,255,0,0,646,648,5,262,0,0,647,644,1,0,0,0,648,
-        649,1,0,0,0,649,647,1,0,0,0,649,650,1,0,0,0,650,663,1,0,0,0,651,
-        652,5,256,0,0,652,653,5,254,0,0,653,663,5,262,0,0,654,655,5,257,
-        0,0,655,656,5,254,0,0,656,663,5,262,0,0,657,658,5,258,0,0,658,659,
-        5,254,0,0,659,663,5,262,0,0,660,661,5,259,0,0,661,663,5,254,0,0,
-        662,631,1,0,0,0,662,637,1,0,0,0,662,639,1,0,0,0,662,651,1,0,0,0,
-        662,654,1,0,0,0,662,657,1,0,0,0,662,660,1,0,0,0,663,665,1,0,0,0,
-        664,666,5,264,0,0,665,664,1,0,0,0,665,666,1,0,0,0,666,668,1,0,0,
-        0,667,669,5,263,0,0,668,667,1,0,0,0,668,669,1,0,0,0,669,85,1,0,0,
-        0,670,672,5,43,0,0,671,673,5,266,0,0,672,671,1,0,0,0,673,674,1,0,
-        0,0,674,672,1,0,0,0,674,675,1,0,0,0,675,677,1,0,0,0,676,678,5,268,
-        0,0,677,676,1,0,0,0,677,678,1,0,0,0,678,680,1,0,0,0,679,681,5,267,
-        0,0,680,679,1,0,0,0,680,681,1,0,0,0,681,87,1,0,0,0,95,96,104,107,
-        117,119,122,128,137,149,163,165,170,182,184,191,216,220,223,226,
-        230,233,236,241,244,249,252,258,261,264,289,291,294,297,300,305,
-        308,311,314,319,322,332,338,341,344,349,352,356,359,366,369,372,
-        377,380,385,390,396,400,403,424,430,467,469,472,475,485,510,519,
-        522,525,528,536,552,560,569,572,575,583,589,597,601,613,615,618,
-        622,625,628,635,642,649,662,665,668,674,677,680
+        1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
+        1,37,1,37,1,37,1,37,1,37,1,37,1,37,3,37,470,8,37,3,37,472,8,37,1,
+        37,3,37,475,8,37,1,37,3,37,478,8,37,1,38,1,38,1,38,1,38,1,38,1,38,
+        1,38,1,38,3,38,488,8,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
+        1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
+        4,38,511,8,38,11,38,12,38,512,1,38,1,38,1,38,1,38,1,38,5,38,520,
+        8,38,10,38,12,38,523,9,38,3,38,525,8,38,1,38,3,38,528,8,38,1,38,
+        3,38,531,8,38,1,39,1,39,1,39,1,39,5,39,537,8,39,10,39,12,39,540,
+        9,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,5,39,
+        553,8,39,10,39,12,39,556,9,39,1,39,1,39,1,39,4,39,561,8,39,11,39,
+        12,39,562,1,39,1,39,1,39,1,39,1,39,1,39,1,39,3,39,572,8,39,1,39,
+        3,39,575,8,39,1,39,3,39,578,8,39,1,40,1,40,1,40,1,40,1,40,1,40,3,
+        40,586,8,40,1,40,1,40,1,40,1,40,3,40,592,8,40,1,40,1,40,1,40,1,40,
+        1,40,1,40,3,40,600,8,40,1,40,1,40,3,40,604,8,40,1,40,1,40,1,40,1,
+        40,1,40,1,40,1,40,1,40,1,40,1,40,3,40,616,8,40,3,40,618,8,40,1,40,
+        3,40,621,8,40,1,41,1,41,3,41,625,8,41,1,41,3,41,628,8,41,1,41,3,
+        41,631,8,41,1,42,1,42,1,42,1,42,1,42,3,42,638,8,42,1,42,1,42,1,42,
+        1,42,1,42,3,42,645,8,42,1,42,1,42,1,42,1,42,4,42,651,8,42,11,42,
+        12,42,652,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,
+        1,42,1,42,1,42,1,42,1,42,5,42,671,8,42,10,42,12,42,674,9,42,1,42,
+        1,42,1,42,1,42,1,42,1,42,1,42,4,42,683,8,42,11,42,12,42,684,1,42,
+        1,42,3,42,689,8,42,1,42,3,42,692,8,42,1,42,3,42,695,8,42,1,43,1,
+        43,1,44,1,44,4,44,701,8,44,11,44,12,44,702,1,44,3,44,706,8,44,1,
+        44,3,44,709,8,44,1,44,0,0,45,0,2,4,6,8,10,12,14,16,18,20,22,24,26,
+        28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,
+        72,74,76,78,80,82,84,86,88,0,13,1,0,67,68,1,1,51,51,2,0,6,6,46,46,
+        1,0,143,144,2,0,135,135,137,137,1,1,6,6,1,0,191,192,2,0,201,202,
+        205,210,1,0,215,216,1,0,212,214,1,0,222,225,1,0,220,221,2,0,260,
+        261,264,264,837,0,90,1,0,0,0,2,98,1,0,0,0,4,100,1,0,0,0,6,111,1,
+        0,0,0,8,126,1,0,0,0,10,136,1,0,0,0,12,141,1,0,0,0,14,144,1,0,0,0,
+        16,146,1,0,0,0,18,151,1,0,0,0,20,154,1,0,0,0,22,158,1,0,0,0,24,160,
+        1,0,0,0,26,165,1,0,0,0,28,170,1,0,0,0,30,176,1,0,0,0,32,180,1,0,
+        0,0,34,184,1,0,0,0,36,188,1,0,0,0,38,191,1,0,0,0,40,218,1,0,0,0,
+        42,220,1,0,0,0,44,230,1,0,0,0,46,240,1,0,0,0,48,248,1,0,0,0,50,256,
+        1,0,0,0,52,268,1,0,0,0,54,304,1,0,0,0,56,318,1,0,0,0,58,326,1,0,
+        0,0,60,348,1,0,0,0,62,356,1,0,0,0,64,363,1,0,0,0,66,376,1,0,0,0,
+        68,384,1,0,0,0,70,389,1,0,0,0,72,394,1,0,0,0,74,407,1,0,0,0,76,479,
+        1,0,0,0,78,532,1,0,0,0,80,579,1,0,0,0,82,622,1,0,0,0,84,632,1,0,
+        0,0,86,696,1,0,0,0,88,698,1,0,0,0,90,91,3,2,1,0,91,92,5,0,0,1,92,
+        1,1,0,0,0,93,99,3,40,20,0,94,99,3,4,2,0,95,99,3,6,3,0,96,99,3,8,
+        4,0,97,99,5,0,0,1,98,93,1,0,0,0,98,94,1,0,0,0,98,95,1,0,0,0,98,96,
+        1,0,0,0,98,97,1,0,0,0,99,3,1,0,0,0,100,106,5,4,0,0,101,102,5,65,
+        0,0,102,107,5,69,0,0,103,104,5,66,0,0,104,107,7,0,0,0,105,107,1,
+        0,0,0,106,101,1,0,0,0,106,103,1,0,0,0,106,105,1,0,0,0,107,109,1,
+        0,0,0,108,110,5,70,0,0,109,108,1,0,0,0,109,110,1,0,0,0,110,5,1,0,
+        0,0,111,121,5,5,0,0,112,113,5,73,0,0,113,122,5,77,0,0,114,122,5,
+        74,0,0,115,116,5,75,0,0,116,122,5,77,0,0,117,119,5,76,0,0,118,120,
+        5,77,0,0,119,118,1,0,0,0,119,120,1,0,0,0,120,122,1,0,0,0,121,112,
+        1,0,0,0,121,114,1,0,0,0,121,115,1,0,0,0,121,117,1,0,0,0,122,124,
+        1,0,0,0,123,125,5,78,0,0,124,123,1,0,0,0,124,125,1,0,0,0,125,7,1,
+        0,0,0,126,130,5,1,0,0,127,129,5,6,0,0,128,127,1,0,0,0,129,132,1,
+        0,0,0,130,128,1,0,0,0,130,131,1,0,0,0,131,133,1,0,0,0,132,130,1,
+        0,0,0,133,134,3,10,5,0,134,135,7,1,0,0,135,9,1,0,0,0,136,137,3,12,
+        6,0,137,139,3,18,9,0,138,140,3,26,13,0,139,138,1,0,0,0,139,140,1,
+        0,0,0,140,11,1,0,0,0,141,142,3,14,7,0,142,143,3,16,8,0,143,13,1,
+        0,0,0,144,145,5,50,0,0,145,15,1,0,0,0,146,147,5,53,0,0,147,17,1,
+        0,0,0,148,150,3,20,10,0,149,148,1,0,0,0,150,153,1,0,0,0,151,149,
+        1,0,0,0,151,152,1,0,0,0,152,19,1,0,0,0,153,151,1,0,0,0,154,155,3,
+        22,11,0,155,156,5,56,0,0,156,157,3,24,12,0,157,21,1,0,0,0,158,159,
+        5,55,0,0,159,23,1,0,0,0,160,161,5,58,0,0,161,162,5,59,0,0,162,25,
+        1,0,0,0,163,166,3,28,14,0,164,166,3,34,17,0,165,163,1,0,0,0,165,
+        164,1,0,0,0,166,167,1,0,0,0,167,165,1,0,0,0,167,168,1,0,0,0,168,
+        27,1,0,0,0,169,171,3,30,15,0,170,169,1,0,0,0,171,172,1,0,0,0,172,
+        170,1,0,0,0,172,173,1,0,0,0,173,174,1,0,0,0,174,175,5,60,0,0,175,
+        29,1,0,0,0,176,177,3,32,16,0,177,178,3,18,9,0,178,179,3,34,17,0,
+        179,31,1,0,0,0,180,181,5,61,0,0,181,33,1,0,0,0,182,185,3,36,18,0,
+        183,185,3,38,19,0,184,182,1,0,0,0,184,183,1,0,0,0,185,186,1,0,0,
+        0,186,184,1,0,0,0,186,187,1,0,0,0,187,35,1,0,0,0,188,189,5,63,0,
+        0,189,37,1,0,0,0,190,192,7,2,0,0,191,190,1,0,0,0,192,193,1,0,0,0,
+        193,191,1,0,0,0,193,194,1,0,0,0,194,39,1,0,0,0,195,219,3,54,27,0,
+        196,219,3,52,26,0,197,219,3,56,28,0,198,219,3,50,25,0,199,219,3,
+        58,29,0,200,219,3,60,30,0,201,219,3,62,31,0,202,219,3,64,32,0,203,
+        219,3,72,36,0,204,219,3,46,23,0,205,219,3,42,21,0,206,219,3,44,22,
+        0,207,219,3,48,24,0,208,219,3,66,33,0,209,219,3,70,35,0,210,219,
+        3,68,34,0,211,219,3,74,37,0,212,219,3,76,38,0,213,219,3,78,39,0,
+        214,219,3,80,40,0,215,219,3,82,41,0,216,219,3,84,42,0,217,219,3,
+        88,44,0,218,195,1,0,0,0,218,196,1,0,0,0,218,197,1,0,0,0,218,198,
+        1,0,0,0,218,199,1,0,0,0,218,200,1,0,0,0,218,201,1,0,0,0,218,202,
+        1,0,0,0,218,203,1,0,0,0,218,204,1,0,0,0,218,205,1,0,0,0,218,206,
+        1,0,0,0,218,207,1,0,0,0,218,208,1,0,0,0,218,209,1,0,0,0,218,210,
+        1,0,0,0,218,211,1,0,0,0,218,212,1,0,0,0,218,213,1,0,0,0,218,214,
+        1,0,0,0,218,215,1,0,0,0,218,216,1,0,0,0,218,217,1,0,0,0,219,41,1,
+        0,0,0,220,222,5,21,0,0,221,223,5,44,0,0,222,221,1,0,0,0,222,223,
+        1,0,0,0,223,225,1,0,0,0,224,226,5,8,0,0,225,224,1,0,0,0,225,226,
+        1,0,0,0,226,228,1,0,0,0,227,229,5,6,0,0,228,227,1,0,0,0,228,229,
+        1,0,0,0,229,43,1,0,0,0,230,232,5,22,0,0,231,233,5,44,0,0,232,231,
+        1,0,0,0,232,233,1,0,0,0,233,235,1,0,0,0,234,236,5,8,0,0,235,234,
+        1,0,0,0,235,236,1,0,0,0,236,238,1,0,0,0,237,239,5,6,0,0,238,237,
+        1,0,0,0,238,239,1,0,0,0,239,45,1,0,0,0,240,241,5,24,0,0,241,243,
+        7,3,0,0,242,244,5,146,0,0,243,242,1,0,0,0,243,244,1,0,0,0,244,246,
+        1,0,0,0,245,247,5,6,0,0,246,245,1,0,0,0,246,247,1,0,0,0,247,47,1,
+        0,0,0,248,249,5,23,0,0,249,251,5,272,0,0,250,252,5,274,0,0,251,250,
+        1,0,0,0,251,252,1,0,0,0,252,254,1,0,0,0,253,255,5,6,0,0,254,253,
+        1,0,0,0,254,255,1,0,0,0,255,49,1,0,0,0,256,258,5,28,0,0,257,259,
+        5,105,0,0,258,257,1,0,0,0,259,260,1,0,0,0,260,258,1,0,0,0,260,261,
+        1,0,0,0,261,263,1,0,0,0,262,264,5,8,0,0,263,262,1,0,0,0,263,264,
+        1,0,0,0,264,266,1,0,0,0,265,267,5,6,0,0,266,265,1,0,0,0,266,267,
+        1,0,0,0,267,51,1,0,0,0,268,296,5,29,0,0,269,270,5,92,0,0,270,297,
+        5,101,0,0,271,272,5,93,0,0,272,297,5,101,0,0,273,274,5,94,0,0,274,
+        297,5,101,0,0,275,293,5,95,0,0,276,277,5,97,0,0,277,278,5,91,0,0,
+        278,292,5,101,0,0,279,280,5,96,0,0,280,281,5,91,0,0,281,292,5,101,
+        0,0,282,283,5,98,0,0,283,284,5,91,0,0,284,292,5,101,0,0,285,286,
+        5,99,0,0,286,287,5,91,0,0,287,292,5,101,0,0,288,289,5,100,0,0,289,
+        290,5,91,0,0,290,292,5,101,0,0,291,276,1,0,0,0,291,279,1,0,0,0,291,
+        282,1,0,0,0,291,285,1,0,0,0,291,288,1,0,0,0,292,295,1,0,0,0,293,
+        291,1,0,0,0,293,294,1,0,0,0,294,297,1,0,0,0,295,293,1,0,0,0,296,
+        269,1,0,0,0,296,271,1,0,0,0,296,273,1,0,0,0,296,275,1,0,0,0,297,
+        299,1,0,0,0,298,300,5,102,0,0,299,298,1,0,0,0,299,300,1,0,0,0,300,
+        302,1,0,0,0,301,303,5,103,0,0,302,301,1,0,0,0,302,303,1,0,0,0,303,
+        53,1,0,0,0,304,305,5,27,0,0,305,310,5,86,0,0,306,308,5,88,0,0,307,
+        306,1,0,0,0,307,308,1,0,0,0,308,309,1,0,0,0,309,311,5,87,0,0,310,
+        307,1,0,0,0,310,311,1,0,0,0,311,313,1,0,0,0,312,314,5,89,0,0,313,
+        312,1,0,0,0,313,314,1,0,0,0,314,316,1,0,0,0,315,317,5,6,0,0,316,
+        315,1,0,0,0,316,317,1,0,0,0,317,55,1,0,0,0,318,319,5,30,0,0,319,
+        321,5,108,0,0,320,322,5,8,0,0,321,320,1,0,0,0,321,322,1,0,0,0,322,
+        324,1,0,0,0,323,325,5,6,0,0,324,323,1,0,0,0,324,325,1,0,0,0,325,
+        57,1,0,0,0,326,340,5,36,0,0,327,341,5,122,0,0,328,341,5,123,0,0,
+        329,341,5,124,0,0,330,331,5,116,0,0,331,332,5,117,0,0,332,341,5,
+        125,0,0,333,335,5,119,0,0,334,333,1,0,0,0,334,335,1,0,0,0,335,336,
+        1,0,0,0,336,337,5,117,0,0,337,338,5,125,0,0,338,339,5,118,0,0,339,
+        341,5,119,0,0,340,327,1,0,0,0,340,328,1,0,0,0,340,329,1,0,0,0,340,
+        330,1,0,0,0,340,334,1,0,0,0,341,343,1,0,0,0,342,344,5,114,0,0,343,
+        342,1,0,0,0,343,344,1,0,0,0,344,346,1,0,0,0,345,347,5,6,0,0,346,
+        345,1,0,0,0,346,347,1,0,0,0,347,59,1,0,0,0,348,349,5,32,0,0,349,
+        351,5,113,0,0,350,352,5,8,0,0,351,350,1,0,0,0,351,352,1,0,0,0,352,
+        354,1,0,0,0,353,355,5,6,0,0,354,353,1,0,0,0,354,355,1,0,0,0,355,
+        61,1,0,0,0,356,358,5,33,0,0,357,359,5,8,0,0,358,357,1,0,0,0,358,
+        359,1,0,0,0,359,361,1,0,0,0,360,362,5,6,0,0,361,360,1,0,0,0,361,
+        362,1,0,0,0,362,63,1,0,0,0,363,364,5,37,0,0,364,368,5,129,0,0,365,
+        369,5,131,0,0,366,367,5,132,0,0,367,369,5,128,0,0,368,365,1,0,0,
+        0,368,366,1,0,0,0,369,371,1,0,0,0,370,372,5,130,0,0,371,370,1,0,
+        0,0,371,372,1,0,0,0,372,374,1,0,0,0,373,375,5,6,0,0,374,373,1,0,
+        0,0,374,375,1,0,0,0,375,65,1,0,0,0,376,377,5,35,0,0,377,379,7,4,
+        0,0,378,380,5,136,0,0,379,378,1,0,0,0,379,380,1,0,0,0,380,382,1,
+        0,0,0,381,383,5,138,0,0,382,381,1,0,0,0,382,383,1,0,0,0,383,67,1,
+        0,0,0,384,385,5,25,0,0,385,387,5,81,0,0,386,388,7,5,0,0,387,386,
+        1,0,0,0,387,388,1,0,0,0,388,69,1,0,0,0,389,390,5,26,0,0,390,392,
+        5,80,0,0,391,393,5,6,0,0,392,391,1,0,0,0,392,393,1,0,0,0,393,71,
+        1,0,0,0,394,398,5,34,0,0,395,397,5,140,0,0,396,395,1,0,0,0,397,400,
+        1,0,0,0,398,396,1,0,0,0,398,399,1,0,0,0,399,402,1,0,0,0,400,398,
+        1,0,0,0,401,403,5,141,0,0,402,401,1,0,0,0,402,403,1,0,0,0,403,405,
+        1,0,0,0,404,406,5,6,0,0,405,404,1,0,0,0,405,406,1,0,0,0,406,73,1,
+        0,0,0,407,471,5,38,0,0,408,409,5,148,0,0,409,410,5,174,0,0,410,411,
+        5,149,0,0,411,412,5,150,0,0,412,413,5,174,0,0,413,414,5,152,0,0,
+        414,472,5,174,0,0,415,416,5,151,0,0,416,417,5,174,0,0,417,418,5,
+        170,0,0,418,472,5,174,0,0,419,420,5,148,0,0,420,421,5,174,0,0,421,
+        422,5,149,0,0,422,423,5,150,0,0,423,426,5,174,0,0,424,425,5,153,
+        0,0,425,427,5,174,0,0,426,424,1,0,0,0,426,427,1,0,0,0,427,472,1,
+        0,0,0,428,430,5,154,0,0,429,431,5,174,0,0,430,429,1,0,0,0,431,432,
+        1,0,0,0,432,430,1,0,0,0,432,433,1,0,0,0,433,472,1,0,0,0,434,472,
+        5,155,0,0,435,436,5,156,0,0,436,472,5,174,0,0,437,438,5,157,0,0,
+        438,472,5,174,0,0,439,469,5,158,0,0,440,441,5,159,0,0,441,442,5,
+        174,0,0,442,470,5,44,0,0,443,470,5,160,0,0,444,445,5,161,0,0,445,
+        470,5,174,0,0,446,447,5,162,0,0,447,448,5,174,0,0,448,449,5,44,0,
+        0,449,470,5,44,0,0,450,451,5,163,0,0,451,452,5,174,0,0,452,470,5,
+        44,0,0,453,454,5,164,0,0,454,455,5,174,0,0,455,470,5,174,0,0,456,
+        457,5,165,0,0,457,458,5,174,0,0,458,470,5,174,0,0,459,460,5,166,
+        0,0,460,470,5,174,0,0,461,462,5,167,0,0,462,463,5,174,0,0,463,470,
+        5,174,0,0,464,465,5,168,0,0,465,470,5,174,0,0,466,467,5,169,0,0,
+        467,468,5,174,0,0,468,470,5,44,0,0,469,440,1,0,0,0,469,443,1,0,0,
+        0,469,444,1,0,0,0,469,446,1,0,0,0,469,450,1,0,0,0,469,453,1,0,0,
+        0,469,456,1,0,0,0,469,459,1,0,0,0,469,461,1,0,0,0,469,464,1,0,0,
+        0,469,466,1,0,0,0,470,472,1,0,0,0,471,408,1,0,0,0,471,415,1,0,0,
+        0,471,419,1,0,0,0,471,428,1,0,0,0,471,434,1,0,0,0,471,435,1,0,0,
+        0,471,437,1,0,0,0,471,439,1,0,0,0,472,474,1,0,0,0,473,475,5,172,
+        0,0,474,473,1,0,0,0,474,475,1,0,0,0,475,477,1,0,0,0,476,478,5,6,
+        0,0,477,476,1,0,0,0,477,478,1,0,0,0,478,75,1,0,0,0,479,524,5,39,
+        0,0,480,481,5,190,0,0,481,525,7,6,0,0,482,483,5,183,0,0,483,487,
+        5,194,0,0,484,485,5,194,0,0,485,486,5,177,0,0,486,488,5,194,0,0,
+        487,484,1,0,0,0,487,488,1,0,0,0,488,525,1,0,0,0,489,490,5,180,0,
+        0,490,525,5,194,0,0,491,492,5,185,0,0,492,525,5,194,0,0,493,494,
+        5,184,0,0,494,525,5,194,0,0,495,496,5,186,0,0,496,525,5,194,0,0,
+        497,498,5,182,0,0,498,525,5,194,0,0,499,500,5,188,0,0,500,525,5,
+        189,0,0,501,502,5,187,0,0,502,503,5,189,0,0,503,504,5,193,0,0,504,
+        525,5,194,0,0,505,506,5,181,0,0,506,510,5,194,0,0,507,508,5,194,
+        0,0,508,509,5,177,0,0,509,511,5,194,0,0,510,507,1,0,0,0,511,512,
+        1,0,0,0,512,510,1,0,0,0,512,513,1,0,0,0,513,525,1,0,0,0,514,515,
+        5,179,0,0,515,521,5,194,0,0,516,517,5,194,0,0,517,518,5,177,0,0,
+        518,520,5,194,0,0,519,516,1,0,0,0,520,523,1,0,0,0,521,519,1,0,0,
+        0,521,522,1,0,0,0,522,525,1,0,0,0,523,521,1,0,0,0,524,480,1,0,0,
+        0,524,482,1,0,0,0,524,489,1,0,0,0,524,491,1,0,0,0,524,493,1,0,0,
+        0,524,495,1,0,0,0,524,497,1,0,0,0,524,499,1,0,0,0,524,501,1,0,0,
+        0,524,505,1,0,0,0,524,514,1,0,0,0,525,527,1,0,0,0,526,528,5,176,
+        0,0,527,526,1,0,0,0,527,528,1,0,0,0,528,530,1,0,0,0,529,531,5,6,
+        0,0,530,529,1,0,0,0,530,531,1,0,0,0,531,77,1,0,0,0,532,571,5,40,
+        0,0,533,534,5,226,0,0,534,538,5,226,0,0,535,537,7,7,0,0,536,535,
+        1,0,0,0,537,540,1,0,0,0,538,536,1,0,0,0,538,539,1,0,0,0,539,572,
+        1,0,0,0,540,538,1,0,0,0,541,542,7,8,0,0,542,572,5,226,0,0,543,544,
+        5,203,0,0,544,545,5,226,0,0,545,546,5,197,0,0,546,572,5,226,0,0,
+        547,548,5,204,0,0,548,572,5,226,0,0,549,572,5,217,0,0,550,554,5,
+        199,0,0,551,553,7,7,0,0,552,551,1,0,0,0,553,556,1,0,0,0,554,552,
+        1,0,0,0,554,555,1,0,0,0,555,572,1,0,0,0,556,554,1,0,0,0,557,558,
+        5,199,0,0,558,560,5,211,0,0,559,561,7,9,0,0,560,559,1,0,0,0,561,
+        562,1,0,0,0,562,560,1,0,0,0,562,563,1,0,0,0,563,572,1,0,0,0,564,
+        565,5,199,0,0,565,566,5,218,0,0,566,572,7,10,0,0,567,568,5,199,0,
+        0,568,569,7,11,0,0,569,570,5,219,0,0,570,572,5,226,0,0,571,533,1,
+        0,0,0,571,541,1,0,0,0,571,543,1,0,0,0,571,547,1,0,0,0,571,549,1,
+        0,0,0,571,550,1,0,0,0,571,557,1,0,0,0,571,564,1,0,0,0,571,567,1,
+        0,0,0,572,574,1,0,0,0,573,575,5,196,0,0,574,573,1,0,0,0,574,575,
+        1,0,0,0,575,577,1,0,0,0,576,578,5,6,0,0,577,576,1,0,0,0,577,578,
+        1,0,0,0,578,79,1,0,0,0,579,617,5,41,0,0,580,581,5,229,0,0,581,582,
+        5,230,0,0,582,583,5,231,0,0,583,585,5,242,0,0,584,586,5,228,0,0,
+        585,584,1,0,0,0,585,586,1,0,0,0,586,618,1,0,0,0,587,588,5,229,0,
+        0,588,589,5,235,0,0,589,591,5,242,0,0,590,592,5,228,0,0,591,590,
+        1,0,0,0,591,592,1,0,0,0,592,618,1,0,0,0,593,594,5,232,0,0,594,595,
+        5,234,0,0,595,596,5,233,0,0,596,597,5,242,0,0,597,599,5,239,0,0,
+        598,600,5,245,0,0,599,598,1,0,0,0,599,600,1,0,0,0,600,603,1,0,0,
+        0,601,602,5,236,0,0,602,604,5,237,0,0,603,601,1,0,0,0,603,604,1,
+        0,0,0,604,605,1,0,0,0,605,618,5,228,0,0,606,607,5,240,0,0,607,608,
+        5,234,0,0,608,609,5,233,0,0,609,610,5,242,0,0,610,611,5,241,0,0,
+        611,612,5,234,0,0,612,613,5,233,0,0,613,615,5,242,0,0,614,616,5,
+        228,0,0,615,614,1,0,0,0,615,616,1,0,0,0,616,618,1,0,0,0,617,580,
+        1,0,0,0,617,587,1,0,0,0,617,593,1,0,0,0,617,606,1,0,0,0,618,620,
+        1,0,0,0,619,621,5,6,0,0,620,619,1,0,0,0,620,621,1,0,0,0,621,81,1,
+        0,0,0,622,624,5,31,0,0,623,625,5,247,0,0,624,623,1,0,0,0,624,625,
+        1,0,0,0,625,627,1,0,0,0,626,628,5,249,0,0,627,626,1,0,0,0,627,628,
+        1,0,0,0,628,630,1,0,0,0,629,631,5,6,0,0,630,629,1,0,0,0,630,631,
+        1,0,0,0,631,83,1,0,0,0,632,688,5,42,0,0,633,634,5,251,0,0,634,637,
+        5,262,0,0,635,636,5,252,0,0,636,638,3,86,43,0,637,635,1,0,0,0,637,
+        638,1,0,0,0,638,689,1,0,0,0,639,640,5,251,0,0,640,689,5,263,0,0,
+        641,642,5,253,0,0,642,644,5,254,0,0,643,645,3,86,43,0,644,643,1,
+        0,0,0,644,645,1,0,0,0,645,650,1,0,0,0,646,647,3,86,43,0,647,648,
+        5,255,0,0,648,649,3,86,43,0,649,651,1,0,0,0,650,646,1,0,0,0,651,
+        652,1,0,0,0,652,650,1,0,0,0,652,653,1,0,0,0,653,689,1,0,0,0,654,
+        655,5,256,0,0,655,656,5,254,0,0,656,689,3,86,43,0,657,658,5,257,
+        0,0,658,659,5,254,0,0,659,689,3,86,43,0,660,661,5,258,0,0,661,662,
+        5,254,0,0,662,689,3,86,43,0,663,664,5,260,0,0,664,665,5,254,0,0,
+        665,672,3,86,43,0,666,667,3,86,43,0,667,668,5,255,0,0,668,669,3,
+        86,43,0,669,671,1,0,0,0,670,666,1,0,0,0,671,674,1,0,0,0,672,670,
+        1,0,0,0,672,673,1,0,0,0,673,689,1,0,0,0,674,672,1,0,0,0,675,676,
+        5,261,0,0,676,677,5,254,0,0,677,682,3,86,43,0,678,679,3,86,43,0,
+        679,680,5,255,0,0,680,681,3,86,43,0,681,683,1,0,0,0,682,678,1,0,
+        0,0,683,684,1,0,0,0,684,682,1,0,0,0,684,685,1,0,0,0,685,689,1,0,
+        0,0,686,687,5,259,0,0,687,689,5,254,0,0,688,633,1,0,0,0,688,639,
+        1,0,0,0,688,641,1,0,0,0,688,654,1,0,0,0,688,657,1,0,0,0,688,660,
+        1,0,0,0,688,663,1,0,0,0,688,675,1,0,0,0,688,686,1,0,0,0,689,691,
+        1,0,0,0,690,692,5,266,0,0,691,690,1,0,0,0,691,692,1,0,0,0,692,694,
+        1,0,0,0,693,695,5,265,0,0,694,693,1,0,0,0,694,695,1,0,0,0,695,85,
+        1,0,0,0,696,697,7,12,0,0,697,87,1,0,0,0,698,700,5,43,0,0,699,701,
+        5,268,0,0,700,699,1,0,0,0,701,702,1,0,0,0,702,700,1,0,0,0,702,703,
+        1,0,0,0,703,705,1,0,0,0,704,706,5,270,0,0,705,704,1,0,0,0,705,706,
+        1,0,0,0,706,708,1,0,0,0,707,709,5,269,0,0,708,707,1,0,0,0,708,709,
+        1,0,0,0,709,89,1,0,0,0,97,98,106,109,119,121,124,130,139,151,165,
+        167,172,184,186,193,218,222,225,228,232,235,238,243,246,251,254,
+        260,263,266,291,293,296,299,302,307,310,313,316,321,324,334,340,
+        343,346,351,354,358,361,368,371,374,379,382,387,392,398,402,405,
+        426,432,469,471,474,477,487,512,521,524,527,530,538,554,562,571,
+        574,577,585,591,599,603,615,617,620,624,627,630,637,644,652,672,
+        684,688,691,694,702,705,708
     ]
 
 class APIParser ( Parser ):
@@ -355,7 +367,7 @@ class APIParser ( Parser ):
                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                      "<INVALID>", "<INVALID>", "'MONITORMANAGER'", "'WORKERS'", 
                      "<INVALID>", "'TASK'", "<INVALID>", "<INVALID>", "'STOP'", 
-                     "'REPORT'", "'LIST'" ]
+                     "'REPORT'", "'LIST'", "'SUMMARY'", "'EXPORT'" ]
 
     symbolicNames = [ "<INVALID>", "HTTP_OPEN", "COMMENT1", "COMMENT2", 
                       "APISET", "SESSION", "CRLF", "COMMA", "SEMICOLON", 
@@ -426,10 +438,11 @@ class APIParser ( Parser ):
                       "MONITOR_MANAGER", "MONITOR_WORKERS", "MONITOR_CREATE", 
                       "MONITOR_TASK", "MONITOR_EQUAL", "MONITOR_START", 
                       "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", 
-                      "MONITOR_ON", "MONITOR_OFF", "MONITOR_EXPRESSION", 
-                      "MONITOR_CRLF", "MONITOR_SEMICOLON", "PLUGIN_SPACE", 
-                      "PLUGIN_EXPRESSION", "PLUGIN_CRLF", "PLUGIN_SEMICOLON", 
-                      "SLEEP_SPACE", "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
+                      "MONITOR_SUMMARY", "MONITOR_EXPORT", "MONITOR_ON", 
+                      "MONITOR_OFF", "MONITOR_EXPRESSION", "MONITOR_CRLF", 
+                      "MONITOR_SEMICOLON", "PLUGIN_SPACE", "PLUGIN_EXPRESSION", 
+                      "PLUGIN_CRLF", "PLUGIN_SEMICOLON", "SLEEP_SPACE", 
+                      "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
 
     RULE_prog = 0
     RULE_command = 1
@@ -474,7 +487,8 @@ class APIParser ( Parser ):
     RULE_data = 40
     RULE_help = 41
     RULE_monitor = 42
-    RULE_plugin = 43
+    RULE_monitorExpression = 43
+    RULE_plugin = 44
 
     ruleNames =  [ "prog", "command", "apiset", "session", "http", "httpMessage", 
                    "httpRequestLine", "httpMethod", "httpRequestTarget", 
@@ -485,7 +499,7 @@ class APIParser ( Parser ):
                    "exit", "quit", "use", "sleep", "start", "load", "assert", 
                    "host", "loop", "if", "endif", "whenever", "spool", "echo", 
                    "script", "set", "ssh", "job", "compare", "data", "help", 
-                   "monitor", "plugin" ]
+                   "monitor", "monitorExpression", "plugin" ]
 
     EOF = Token.EOF
     HTTP_OPEN=1
@@ -747,19 +761,21 @@ class APIParser ( Parser ):
     MONITOR_STOP=257
     MONITOR_REPORT=258
     MONITOR_LIST=259
-    MONITOR_ON=260
-    MONITOR_OFF=261
-    MONITOR_EXPRESSION=262
-    MONITOR_CRLF=263
-    MONITOR_SEMICOLON=264
-    PLUGIN_SPACE=265
-    PLUGIN_EXPRESSION=266
-    PLUGIN_CRLF=267
-    PLUGIN_SEMICOLON=268
-    SLEEP_SPACE=269
-    SLEEP_EXPRESSION=270
-    SLEEP_CRLF=271
-    SLEEP_SEMICOLON=272
+    MONITOR_SUMMARY=260
+    MONITOR_EXPORT=261
+    MONITOR_ON=262
+    MONITOR_OFF=263
+    MONITOR_EXPRESSION=264
+    MONITOR_CRLF=265
+    MONITOR_SEMICOLON=266
+    PLUGIN_SPACE=267
+    PLUGIN_EXPRESSION=268
+    PLUGIN_CRLF=269
+    PLUGIN_SEMICOLON=270
+    SLEEP_SPACE=271
+    SLEEP_EXPRESSION=272
+    SLEEP_CRLF=273
+    SLEEP_SEMICOLON=274
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -802,9 +818,9 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 0, self.RULE_prog)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 88
+            self.state = 90
             self.command()
-            self.state = 89
+            self.state = 91
             self.match(APIParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -858,32 +874,32 @@ class APIParser ( Parser ):
         localctx = APIParser.CommandContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_command)
         try:
-            self.state = 96
+            self.state = 98
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 91
+                self.state = 93
                 self.baseCommand()
                 pass
             elif token in [4]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 92
+                self.state = 94
                 self.apiset()
                 pass
             elif token in [5]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 93
+                self.state = 95
                 self.session()
                 pass
             elif token in [1]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 94
+                self.state = 96
                 self.http()
                 pass
             elif token in [-1]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 95
+                self.state = 97
                 self.match(APIParser.EOF)
                 pass
             else:
@@ -945,21 +961,21 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 98
+            self.state = 100
             self.match(APIParser.APISET)
-            self.state = 104
+            self.state = 106
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [65]:
-                self.state = 99
+                self.state = 101
                 self.match(APIParser.APISET_PROXY)
-                self.state = 100
+                self.state = 102
                 self.match(APIParser.APISET_EXPRESSION)
                 pass
             elif token in [66]:
-                self.state = 101
+                self.state = 103
                 self.match(APIParser.APISET_HTTPSVERIFY)
-                self.state = 102
+                self.state = 104
                 _la = self._input.LA(1)
                 if not(_la==67 or _la==68):
                     self._errHandler.recoverInline(self)
@@ -972,11 +988,11 @@ class APIParser ( Parser ):
             else:
                 raise NoViableAltException(self)
 
-            self.state = 107
+            self.state = 109
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==70:
-                self.state = 106
+                self.state = 108
                 self.match(APIParser.APISET_SEMICOLON)
 
 
@@ -1036,35 +1052,35 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 109
+            self.state = 111
             self.match(APIParser.SESSION)
-            self.state = 119
+            self.state = 121
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [73]:
-                self.state = 110
+                self.state = 112
                 self.match(APIParser.SESSION_SAVE)
-                self.state = 111
+                self.state = 113
                 self.match(APIParser.SESSION_NAME)
                 pass
             elif token in [74]:
-                self.state = 112
+                self.state = 114
                 self.match(APIParser.SESSION_RELEASE)
                 pass
             elif token in [75]:
-                self.state = 113
+                self.state = 115
                 self.match(APIParser.SESSION_RESTORE)
-                self.state = 114
+                self.state = 116
                 self.match(APIParser.SESSION_NAME)
                 pass
             elif token in [76]:
-                self.state = 115
-                self.match(APIParser.SESSION_SHOW)
                 self.state = 117
+                self.match(APIParser.SESSION_SHOW)
+                self.state = 119
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==77:
-                    self.state = 116
+                    self.state = 118
                     self.match(APIParser.SESSION_NAME)
 
 
@@ -1072,11 +1088,11 @@ class APIParser ( Parser ):
             else:
                 raise NoViableAltException(self)
 
-            self.state = 122
+            self.state = 124
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==78:
-                self.state = 121
+                self.state = 123
                 self.match(APIParser.SESSION_SEMICOLON)
 
 
@@ -1134,21 +1150,21 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 124
+            self.state = 126
             self.match(APIParser.HTTP_OPEN)
-            self.state = 128
+            self.state = 130
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==6:
-                self.state = 125
+                self.state = 127
                 self.match(APIParser.CRLF)
-                self.state = 130
+                self.state = 132
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 131
+            self.state = 133
             self.httpMessage()
-            self.state = 132
+            self.state = 134
             _la = self._input.LA(1)
             if not(_la==-1 or _la==51):
                 self._errHandler.recoverInline(self)
@@ -1202,15 +1218,15 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 134
+            self.state = 136
             self.httpRequestLine()
-            self.state = 135
-            self.httpHeaderFields()
             self.state = 137
+            self.httpHeaderFields()
+            self.state = 139
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((_la) & ~0x3f) == 0 and ((1 << _la) & -6917458658896904128) != 0:
-                self.state = 136
+                self.state = 138
                 self.httpMessageBody()
 
 
@@ -1256,9 +1272,9 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_httpRequestLine)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 139
+            self.state = 141
             self.httpMethod()
-            self.state = 140
+            self.state = 142
             self.httpRequestTarget()
         except RecognitionException as re:
             localctx.exception = re
@@ -1297,7 +1313,7 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 14, self.RULE_httpMethod)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 142
+            self.state = 144
             self.match(APIParser.HttpMethod)
         except RecognitionException as re:
             localctx.exception = re
@@ -1336,7 +1352,7 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_httpRequestTarget)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 144
+            self.state = 146
             self.match(APIParser.HttpRequestTarget)
         except RecognitionException as re:
             localctx.exception = re
@@ -1380,13 +1396,13 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 149
+            self.state = 151
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==55:
-                self.state = 146
+                self.state = 148
                 self.httpHeaderField()
-                self.state = 151
+                self.state = 153
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1435,11 +1451,11 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 20, self.RULE_httpHeaderField)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 152
+            self.state = 154
             self.httpHeaderFieldName()
-            self.state = 153
+            self.state = 155
             self.match(APIParser.FIELD_COLON)
-            self.state = 154
+            self.state = 156
             self.httpHeaderFieldValue()
         except RecognitionException as re:
             localctx.exception = re
@@ -1478,7 +1494,7 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_httpHeaderFieldName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 156
+            self.state = 158
             self.match(APIParser.HttpHeaderFieldName)
         except RecognitionException as re:
             localctx.exception = re
@@ -1520,9 +1536,9 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 24, self.RULE_httpHeaderFieldValue)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 158
+            self.state = 160
             self.match(APIParser.HttpHeaderFieldValue)
-            self.state = 159
+            self.state = 161
             self.match(APIParser.HttpHeaderFieldValueEnd)
         except RecognitionException as re:
             localctx.exception = re
@@ -1573,25 +1589,25 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 163 
+            self.state = 165 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 163
+                self.state = 165
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [61]:
-                    self.state = 161
+                    self.state = 163
                     self.httpMultipart()
                     pass
                 elif token in [6, 46, 63]:
-                    self.state = 162
+                    self.state = 164
                     self.httpMessageBodyContent()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 165 
+                self.state = 167 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if not (((_la) & ~0x3f) == 0 and ((1 << _la) & -6917458658896904128) != 0):
@@ -1642,19 +1658,19 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 168 
+            self.state = 170 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 167
+                self.state = 169
                 self.httpMultipartBoundary()
-                self.state = 170 
+                self.state = 172 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if not (_la==61):
                     break
 
-            self.state = 172
+            self.state = 174
             self.match(APIParser.HttpMultipartBoundaryEnd)
         except RecognitionException as re:
             localctx.exception = re
@@ -1702,11 +1718,11 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 30, self.RULE_httpMultipartBoundary)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 174
+            self.state = 176
             self.httpBoundaryDelimiter()
-            self.state = 175
+            self.state = 177
             self.httpHeaderFields()
-            self.state = 176
+            self.state = 178
             self.httpMessageBodyContent()
         except RecognitionException as re:
             localctx.exception = re
@@ -1745,7 +1761,7 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 32, self.RULE_httpBoundaryDelimiter)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 178
+            self.state = 180
             self.match(APIParser.HttpMultipartBoundary)
         except RecognitionException as re:
             localctx.exception = re
@@ -1795,20 +1811,20 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 34, self.RULE_httpMessageBodyContent)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 182 
+            self.state = 184 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 182
+                    self.state = 184
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [63]:
-                        self.state = 180
+                        self.state = 182
                         self.httpMessageBodyOperate()
                         pass
                     elif token in [6, 46]:
-                        self.state = 181
+                        self.state = 183
                         self.httpMessageBodyOther()
                         pass
                     else:
@@ -1817,7 +1833,7 @@ class APIParser ( Parser ):
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 184 
+                self.state = 186 
                 self._errHandler.sync(self)
                 _alt = self._interp.adaptivePredict(self._input,13,self._ctx)
 
@@ -1858,7 +1874,7 @@ class APIParser ( Parser ):
         self.enterRule(localctx, 36, self.RULE_httpMessageBodyOperate)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 186
+            self.state = 188
             self.match(APIParser.HttpMessageBodyOperate)
         except RecognitionException as re:
             localctx.exception = re
@@ -1907,12 +1923,12 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 189 
+            self.state = 191 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 188
+                    self.state = 190
                     _la = self._input.LA(1)
                     if not(_la==6 or _la==46):
                         self._errHandler.recoverInline(self)
@@ -1922,7 +1938,7 @@ class APIParser ( Parser ):
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 191 
+                self.state = 193 
                 self._errHandler.sync(self)
                 _alt = self._interp.adaptivePredict(self._input,14,self._ctx)
 
@@ -2051,122 +2067,122 @@ class APIParser ( Parser ):
         localctx = APIParser.BaseCommandContext(self, self._ctx, self.state)
         self.enterRule(localctx, 40, self.RULE_baseCommand)
         try:
-            self.state = 216
+            self.state = 218
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [27]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 193
+                self.state = 195
                 self.assert_()
                 pass
             elif token in [29]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 194
+                self.state = 196
                 self.load()
                 pass
             elif token in [30]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 195
+                self.state = 197
                 self.host()
                 pass
             elif token in [28]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 196
+                self.state = 198
                 self.start()
                 pass
             elif token in [36]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 197
+                self.state = 199
                 self.loop()
                 pass
             elif token in [32]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 198
+                self.state = 200
                 self.if_()
                 pass
             elif token in [33]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 199
+                self.state = 201
                 self.endif()
                 pass
             elif token in [37]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 200
+                self.state = 202
                 self.whenever()
                 pass
             elif token in [34]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 201
+                self.state = 203
                 self.set_()
                 pass
             elif token in [24]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 202
+                self.state = 204
                 self.use()
                 pass
             elif token in [21]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 203
+                self.state = 205
                 self.exit()
                 pass
             elif token in [22]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 204
+                self.state = 206
                 self.quit()
                 pass
             elif token in [23]:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 205
+                self.state = 207
                 self.sleep()
                 pass
             elif token in [35]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 206
+                self.state = 208
                 self.spool()
                 pass
             elif token in [26]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 207
+                self.state = 209
                 self.script()
                 pass
             elif token in [25]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 208
+                self.state = 210
                 self.echo()
                 pass
             elif token in [38]:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 209
+                self.state = 211
                 self.ssh()
                 pass
             elif token in [39]:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 210
+                self.state = 212
                 self.job()
                 pass
             elif token in [40]:
                 self.enterOuterAlt(localctx, 19)
-                self.state = 211
+                self.state = 213
                 self.compare()
                 pass
             elif token in [41]:
                 self.enterOuterAlt(localctx, 20)
-                self.state = 212
+                self.state = 214
                 self.data()
                 pass
             elif token in [31]:
                 self.enterOuterAlt(localctx, 21)
-                self.state = 213
+                self.state = 215
                 self.help_()
                 pass
             elif token in [42]:
                 self.enterOuterAlt(localctx, 22)
-                self.state = 214
+                self.state = 216
                 self.monitor()
                 pass
             elif token in [43]:
                 self.enterOuterAlt(localctx, 23)
-                self.state = 215
+                self.state = 217
                 self.plugin()
                 pass
             else:
@@ -2219,29 +2235,29 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 218
-            self.match(APIParser.EXIT)
             self.state = 220
+            self.match(APIParser.EXIT)
+            self.state = 222
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==44:
-                self.state = 219
+                self.state = 221
                 self.match(APIParser.INT)
 
 
-            self.state = 223
+            self.state = 225
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 222
+                self.state = 224
                 self.match(APIParser.SEMICOLON)
 
 
-            self.state = 226
+            self.state = 228
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 225
+                self.state = 227
                 self.match(APIParser.CRLF)
 
 
@@ -2292,29 +2308,29 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 228
-            self.match(APIParser.QUIT)
             self.state = 230
+            self.match(APIParser.QUIT)
+            self.state = 232
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==44:
-                self.state = 229
+                self.state = 231
                 self.match(APIParser.INT)
 
 
-            self.state = 233
+            self.state = 235
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 232
+                self.state = 234
                 self.match(APIParser.SEMICOLON)
 
 
-            self.state = 236
+            self.state = 238
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 235
+                self.state = 237
                 self.match(APIParser.CRLF)
 
 
@@ -2368,28 +2384,28 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 238
+            self.state = 240
             self.match(APIParser.USE)
-            self.state = 239
+            self.state = 241
             _la = self._input.LA(1)
             if not(_la==143 or _la==144):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 241
+            self.state = 243
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==146:
-                self.state = 240
+                self.state = 242
                 self.match(APIParser.USE_SEMICOLON)
 
 
-            self.state = 244
+            self.state = 246
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 243
+                self.state = 245
                 self.match(APIParser.CRLF)
 
 
@@ -2440,23 +2456,23 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 246
+            self.state = 248
             self.match(APIParser.SLEEP)
-            self.state = 247
-            self.match(APIParser.SLEEP_EXPRESSION)
             self.state = 249
+            self.match(APIParser.SLEEP_EXPRESSION)
+            self.state = 251
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==272:
-                self.state = 248
+            if _la==274:
+                self.state = 250
                 self.match(APIParser.SLEEP_SEMICOLON)
 
 
-            self.state = 252
+            self.state = 254
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 251
+                self.state = 253
                 self.match(APIParser.CRLF)
 
 
@@ -2510,33 +2526,33 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 254
+            self.state = 256
             self.match(APIParser.START)
-            self.state = 256 
+            self.state = 258 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 255
+                self.state = 257
                 self.match(APIParser.START_EXPRESSION)
-                self.state = 258 
+                self.state = 260 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if not (_la==105):
                     break
 
-            self.state = 261
+            self.state = 263
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 260
+                self.state = 262
                 self.match(APIParser.SEMICOLON)
 
 
-            self.state = 264
+            self.state = 266
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 263
+                self.state = 265
                 self.match(APIParser.CRLF)
 
 
@@ -2638,83 +2654,83 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 266
+            self.state = 268
             self.match(APIParser.LOAD)
-            self.state = 294
+            self.state = 296
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [92]:
-                self.state = 267
+                self.state = 269
                 self.match(APIParser.LOAD_PLUGIN)
-                self.state = 268
+                self.state = 270
                 self.match(APIParser.LOAD_EXPRESSION)
                 pass
             elif token in [93]:
-                self.state = 269
+                self.state = 271
                 self.match(APIParser.LOAD_SCRIPT)
-                self.state = 270
+                self.state = 272
                 self.match(APIParser.LOAD_EXPRESSION)
                 pass
             elif token in [94]:
-                self.state = 271
+                self.state = 273
                 self.match(APIParser.LOAD_MAP)
-                self.state = 272
+                self.state = 274
                 self.match(APIParser.LOAD_EXPRESSION)
                 pass
             elif token in [95]:
-                self.state = 273
+                self.state = 275
                 self.match(APIParser.LOAD_JDBCDRIVER)
-                self.state = 291
+                self.state = 293
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la - 96)) & ~0x3f) == 0 and ((1 << (_la - 96)) & 31) != 0:
-                    self.state = 289
+                    self.state = 291
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [97]:
-                        self.state = 274
+                        self.state = 276
                         self.match(APIParser.LOAD_JDBCCLASS)
-                        self.state = 275
+                        self.state = 277
                         self.match(APIParser.LOAD_EQUAL)
-                        self.state = 276
+                        self.state = 278
                         self.match(APIParser.LOAD_EXPRESSION)
                         pass
                     elif token in [96]:
-                        self.state = 277
+                        self.state = 279
                         self.match(APIParser.LOAD_JDBCFILE)
-                        self.state = 278
+                        self.state = 280
                         self.match(APIParser.LOAD_EQUAL)
-                        self.state = 279
+                        self.state = 281
                         self.match(APIParser.LOAD_EXPRESSION)
                         pass
                     elif token in [98]:
-                        self.state = 280
+                        self.state = 282
                         self.match(APIParser.LOAD_JDBCNAME)
-                        self.state = 281
+                        self.state = 283
                         self.match(APIParser.LOAD_EQUAL)
-                        self.state = 282
+                        self.state = 284
                         self.match(APIParser.LOAD_EXPRESSION)
                         pass
                     elif token in [99]:
-                        self.state = 283
+                        self.state = 285
                         self.match(APIParser.LOAD_JDBCPROP)
-                        self.state = 284
+                        self.state = 286
                         self.match(APIParser.LOAD_EQUAL)
-                        self.state = 285
+                        self.state = 287
                         self.match(APIParser.LOAD_EXPRESSION)
                         pass
                     elif token in [100]:
-                        self.state = 286
+                        self.state = 288
                         self.match(APIParser.LOAD_JDBCURL)
-                        self.state = 287
+                        self.state = 289
                         self.match(APIParser.LOAD_EQUAL)
-                        self.state = 288
+                        self.state = 290
                         self.match(APIParser.LOAD_EXPRESSION)
                         pass
                     else:
                         raise NoViableAltException(self)
 
-                    self.state = 293
+                    self.state = 295
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -2722,19 +2738,19 @@ class APIParser ( Parser ):
             else:
                 raise NoViableAltException(self)
 
-            self.state = 297
+            self.state = 299
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==102:
-                self.state = 296
+                self.state = 298
                 self.match(APIParser.LOAD_SEMICOLON)
 
 
-            self.state = 300
+            self.state = 302
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==103:
-                self.state = 299
+                self.state = 301
                 self.match(APIParser.LOAD_CRLF)
 
 
@@ -2791,39 +2807,39 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 302
+            self.state = 304
             self.match(APIParser.ASSERT)
-            self.state = 303
+            self.state = 305
             self.match(APIParser.ASSERT_EXPRESSION)
-            self.state = 308
+            self.state = 310
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==87 or _la==88:
-                self.state = 305
+                self.state = 307
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==88:
-                    self.state = 304
+                    self.state = 306
                     self.match(APIParser.ASSERT_COMMA)
 
 
-                self.state = 307
+                self.state = 309
                 self.match(APIParser.ASSERT_NAME)
 
 
-            self.state = 311
+            self.state = 313
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==89:
-                self.state = 310
+                self.state = 312
                 self.match(APIParser.ASSERT_SEMICOLON)
 
 
-            self.state = 314
+            self.state = 316
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 313
+                self.state = 315
                 self.match(APIParser.CRLF)
 
 
@@ -2874,23 +2890,23 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 316
+            self.state = 318
             self.match(APIParser.HOST)
-            self.state = 317
-            self.match(APIParser.HOST_EXPRESSION)
             self.state = 319
+            self.match(APIParser.HOST_EXPRESSION)
+            self.state = 321
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 318
+                self.state = 320
                 self.match(APIParser.SEMICOLON)
 
 
-            self.state = 322
+            self.state = 324
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 321
+                self.state = 323
                 self.match(APIParser.CRLF)
 
 
@@ -2965,65 +2981,65 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 324
+            self.state = 326
             self.match(APIParser.LOOP)
-            self.state = 338
+            self.state = 340
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [122]:
-                self.state = 325
+                self.state = 327
                 self.match(APIParser.LOOP_BREAK)
                 pass
             elif token in [123]:
-                self.state = 326
+                self.state = 328
                 self.match(APIParser.LOOP_END)
                 pass
             elif token in [124]:
-                self.state = 327
+                self.state = 329
                 self.match(APIParser.LOOP_CONTINUE)
                 pass
             elif token in [116]:
-                self.state = 328
+                self.state = 330
                 self.match(APIParser.LOOP_BEGIN)
-                self.state = 329
+                self.state = 331
                 self.match(APIParser.LOOP_UNTIL)
-                self.state = 330
+                self.state = 332
                 self.match(APIParser.LOOP_EXPRESSION)
                 pass
             elif token in [117, 119]:
-                self.state = 332
+                self.state = 334
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==119:
-                    self.state = 331
+                    self.state = 333
                     self.match(APIParser.LOOP_INT)
 
 
-                self.state = 334
+                self.state = 336
                 self.match(APIParser.LOOP_UNTIL)
-                self.state = 335
+                self.state = 337
                 self.match(APIParser.LOOP_EXPRESSION)
-                self.state = 336
+                self.state = 338
                 self.match(APIParser.LOOP_INTERVAL)
-                self.state = 337
+                self.state = 339
                 self.match(APIParser.LOOP_INT)
                 pass
             else:
                 raise NoViableAltException(self)
 
-            self.state = 341
+            self.state = 343
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==114:
-                self.state = 340
+                self.state = 342
                 self.match(APIParser.LOOP_SEMICOLON)
 
 
-            self.state = 344
+            self.state = 346
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 343
+                self.state = 345
                 self.match(APIParser.CRLF)
 
 
@@ -3074,23 +3090,23 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 346
+            self.state = 348
             self.match(APIParser.IF)
-            self.state = 347
-            self.match(APIParser.IF_EXPRESSION)
             self.state = 349
+            self.match(APIParser.IF_EXPRESSION)
+            self.state = 351
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 348
+                self.state = 350
                 self.match(APIParser.SEMICOLON)
 
 
-            self.state = 352
+            self.state = 354
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 351
+                self.state = 353
                 self.match(APIParser.CRLF)
 
 
@@ -3138,21 +3154,21 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 354
-            self.match(APIParser.ENDIF)
             self.state = 356
+            self.match(APIParser.ENDIF)
+            self.state = 358
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 355
+                self.state = 357
                 self.match(APIParser.SEMICOLON)
 
 
-            self.state = 359
+            self.state = 361
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 358
+                self.state = 360
                 self.match(APIParser.CRLF)
 
 
@@ -3212,39 +3228,39 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 361
+            self.state = 363
             self.match(APIParser.WHENEVER)
-            self.state = 362
+            self.state = 364
             self.match(APIParser.WHENEVER_ERROR)
-            self.state = 366
+            self.state = 368
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [131]:
-                self.state = 363
+                self.state = 365
                 self.match(APIParser.WHENEVER_CONTINUE)
                 pass
             elif token in [132]:
-                self.state = 364
+                self.state = 366
                 self.match(APIParser.WHENEVER_EXIT)
-                self.state = 365
+                self.state = 367
                 self.match(APIParser.WHENEVER_EXITCODE)
                 pass
             else:
                 raise NoViableAltException(self)
 
-            self.state = 369
+            self.state = 371
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==130:
-                self.state = 368
+                self.state = 370
                 self.match(APIParser.WHENEVER_SEMICOLON)
 
 
-            self.state = 372
+            self.state = 374
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 371
+                self.state = 373
                 self.match(APIParser.CRLF)
 
 
@@ -3298,28 +3314,28 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 374
+            self.state = 376
             self.match(APIParser.SPOOL)
-            self.state = 375
+            self.state = 377
             _la = self._input.LA(1)
             if not(_la==135 or _la==137):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 377
+            self.state = 379
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==136:
-                self.state = 376
+                self.state = 378
                 self.match(APIParser.SPOOL_SEMICOLON)
 
 
-            self.state = 380
+            self.state = 382
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==138:
-                self.state = 379
+                self.state = 381
                 self.match(APIParser.SPOOL_CRLF)
 
 
@@ -3370,15 +3386,15 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 382
+            self.state = 384
             self.match(APIParser.ECHO)
-            self.state = 383
-            self.match(APIParser.EchoBlock)
             self.state = 385
+            self.match(APIParser.EchoBlock)
+            self.state = 387
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,53,self._ctx)
             if la_ == 1:
-                self.state = 384
+                self.state = 386
                 _la = self._input.LA(1)
                 if not(_la==-1 or _la==6):
                     self._errHandler.recoverInline(self)
@@ -3431,15 +3447,15 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 387
+            self.state = 389
             self.match(APIParser.SCRIPT)
-            self.state = 388
-            self.match(APIParser.ScriptBlock)
             self.state = 390
+            self.match(APIParser.ScriptBlock)
+            self.state = 392
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 389
+                self.state = 391
                 self.match(APIParser.CRLF)
 
 
@@ -3493,31 +3509,31 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 392
+            self.state = 394
             self.match(APIParser.SET)
-            self.state = 396
+            self.state = 398
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==140:
-                self.state = 393
+                self.state = 395
                 self.match(APIParser.SET_EXPRESSION)
-                self.state = 398
+                self.state = 400
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 400
+            self.state = 402
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==141:
-                self.state = 399
+                self.state = 401
                 self.match(APIParser.SET_SEMICOLON)
 
 
-            self.state = 403
+            self.state = 405
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 402
+                self.state = 404
                 self.match(APIParser.CRLF)
 
 
@@ -3646,72 +3662,72 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 405
+            self.state = 407
             self.match(APIParser.SSH)
-            self.state = 469
+            self.state = 471
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,61,self._ctx)
             if la_ == 1:
-                self.state = 406
+                self.state = 408
                 self.match(APIParser.SSH_CONNECT)
-                self.state = 407
+                self.state = 409
                 self.match(APIParser.SSH_EXPRESSION)
-                self.state = 408
+                self.state = 410
                 self.match(APIParser.SSH_WITH)
-                self.state = 409
+                self.state = 411
                 self.match(APIParser.SSH_USER)
-                self.state = 410
+                self.state = 412
                 self.match(APIParser.SSH_EXPRESSION)
-                self.state = 411
+                self.state = 413
                 self.match(APIParser.SSH_KEYFILE)
-                self.state = 412
+                self.state = 414
                 self.match(APIParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 2:
-                self.state = 413
+                self.state = 415
                 self.match(APIParser.SSH_SET)
-                self.state = 414
+                self.state = 416
                 self.match(APIParser.SSH_EXPRESSION)
-                self.state = 415
+                self.state = 417
                 self.match(APIParser.SSH_EQUAL)
-                self.state = 416
+                self.state = 418
                 self.match(APIParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 3:
-                self.state = 417
+                self.state = 419
                 self.match(APIParser.SSH_CONNECT)
-                self.state = 418
+                self.state = 420
                 self.match(APIParser.SSH_EXPRESSION)
-                self.state = 419
+                self.state = 421
                 self.match(APIParser.SSH_WITH)
-                self.state = 420
+                self.state = 422
                 self.match(APIParser.SSH_USER)
-                self.state = 421
+                self.state = 423
                 self.match(APIParser.SSH_EXPRESSION)
-                self.state = 424
+                self.state = 426
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==153:
-                    self.state = 422
+                    self.state = 424
                     self.match(APIParser.SSH_PASSWORD)
-                    self.state = 423
+                    self.state = 425
                     self.match(APIParser.SSH_EXPRESSION)
 
 
                 pass
 
             elif la_ == 4:
-                self.state = 426
+                self.state = 428
                 self.match(APIParser.SSH_EXECUTE)
-                self.state = 428 
+                self.state = 430 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 427
+                    self.state = 429
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 430 
+                    self.state = 432 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not (_la==174):
@@ -3720,108 +3736,108 @@ class APIParser ( Parser ):
                 pass
 
             elif la_ == 5:
-                self.state = 432
+                self.state = 434
                 self.match(APIParser.SSH_DISCONNECT)
                 pass
 
             elif la_ == 6:
-                self.state = 433
+                self.state = 435
                 self.match(APIParser.SSH_SAVE)
-                self.state = 434
+                self.state = 436
                 self.match(APIParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 7:
-                self.state = 435
+                self.state = 437
                 self.match(APIParser.SSH_RESTORE)
-                self.state = 436
+                self.state = 438
                 self.match(APIParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 8:
-                self.state = 437
+                self.state = 439
                 self.match(APIParser.SFTP)
-                self.state = 467
+                self.state = 469
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [159]:
-                    self.state = 438
+                    self.state = 440
                     self.match(APIParser.SFTP_CHMOD)
-                    self.state = 439
+                    self.state = 441
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 440
+                    self.state = 442
                     self.match(APIParser.INT)
                     pass
                 elif token in [160]:
-                    self.state = 441
+                    self.state = 443
                     self.match(APIParser.SFTP_GETCWD)
                     pass
                 elif token in [161]:
-                    self.state = 442
+                    self.state = 444
                     self.match(APIParser.SFTP_CHDIR)
-                    self.state = 443
+                    self.state = 445
                     self.match(APIParser.SSH_EXPRESSION)
                     pass
                 elif token in [162]:
-                    self.state = 444
+                    self.state = 446
                     self.match(APIParser.SFTP_CHOWN)
-                    self.state = 445
+                    self.state = 447
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 446
+                    self.state = 448
                     self.match(APIParser.INT)
-                    self.state = 447
+                    self.state = 449
                     self.match(APIParser.INT)
                     pass
                 elif token in [163]:
-                    self.state = 448
+                    self.state = 450
                     self.match(APIParser.SFTP_MKDIR)
-                    self.state = 449
+                    self.state = 451
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 450
+                    self.state = 452
                     self.match(APIParser.INT)
                     pass
                 elif token in [164]:
-                    self.state = 451
+                    self.state = 453
                     self.match(APIParser.SFTP_GET)
-                    self.state = 452
+                    self.state = 454
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 453
+                    self.state = 455
                     self.match(APIParser.SSH_EXPRESSION)
                     pass
                 elif token in [165]:
-                    self.state = 454
+                    self.state = 456
                     self.match(APIParser.SFTP_PUT)
-                    self.state = 455
+                    self.state = 457
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 456
+                    self.state = 458
                     self.match(APIParser.SSH_EXPRESSION)
                     pass
                 elif token in [166]:
-                    self.state = 457
+                    self.state = 459
                     self.match(APIParser.SFTP_REMOVE)
-                    self.state = 458
+                    self.state = 460
                     self.match(APIParser.SSH_EXPRESSION)
                     pass
                 elif token in [167]:
-                    self.state = 459
+                    self.state = 461
                     self.match(APIParser.SFTP_RENAME)
-                    self.state = 460
+                    self.state = 462
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 461
+                    self.state = 463
                     self.match(APIParser.SSH_EXPRESSION)
                     pass
                 elif token in [168]:
-                    self.state = 462
+                    self.state = 464
                     self.match(APIParser.SFTP_LISTDIR)
-                    self.state = 463
+                    self.state = 465
                     self.match(APIParser.SSH_EXPRESSION)
                     pass
                 elif token in [169]:
-                    self.state = 464
+                    self.state = 466
                     self.match(APIParser.SFTP_TRUNCATE)
-                    self.state = 465
+                    self.state = 467
                     self.match(APIParser.SSH_EXPRESSION)
-                    self.state = 466
+                    self.state = 468
                     self.match(APIParser.INT)
                     pass
                 else:
@@ -3830,19 +3846,19 @@ class APIParser ( Parser ):
                 pass
 
 
-            self.state = 472
+            self.state = 474
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==172:
-                self.state = 471
+                self.state = 473
                 self.match(APIParser.SSH_SEMICOLON)
 
 
-            self.state = 475
+            self.state = 477
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 474
+                self.state = 476
                 self.match(APIParser.CRLF)
 
 
@@ -3947,15 +3963,15 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 477
+            self.state = 479
             self.match(APIParser.JOB)
-            self.state = 522
+            self.state = 524
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [190]:
-                self.state = 478
+                self.state = 480
                 self.match(APIParser.JOB_MANGER)
-                self.state = 479
+                self.state = 481
                 _la = self._input.LA(1)
                 if not(_la==191 or _la==192):
                     self._errHandler.recoverInline(self)
@@ -3964,85 +3980,85 @@ class APIParser ( Parser ):
                     self.consume()
                 pass
             elif token in [183]:
-                self.state = 480
+                self.state = 482
                 self.match(APIParser.JOB_WAIT)
-                self.state = 481
+                self.state = 483
                 self.match(APIParser.JOB_EXPRESSION)
-                self.state = 485
+                self.state = 487
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==194:
-                    self.state = 482
+                    self.state = 484
                     self.match(APIParser.JOB_EXPRESSION)
-                    self.state = 483
+                    self.state = 485
                     self.match(APIParser.JOB_EQUAL)
-                    self.state = 484
+                    self.state = 486
                     self.match(APIParser.JOB_EXPRESSION)
 
 
                 pass
             elif token in [180]:
-                self.state = 487
+                self.state = 489
                 self.match(APIParser.JOB_SHOW)
-                self.state = 488
+                self.state = 490
                 self.match(APIParser.JOB_EXPRESSION)
                 pass
             elif token in [185]:
-                self.state = 489
+                self.state = 491
                 self.match(APIParser.JOB_ABORT)
-                self.state = 490
+                self.state = 492
                 self.match(APIParser.JOB_EXPRESSION)
                 pass
             elif token in [184]:
-                self.state = 491
+                self.state = 493
                 self.match(APIParser.JOB_SHUTDOWN)
-                self.state = 492
+                self.state = 494
                 self.match(APIParser.JOB_EXPRESSION)
                 pass
             elif token in [186]:
-                self.state = 493
+                self.state = 495
                 self.match(APIParser.JOB_TIMER)
-                self.state = 494
+                self.state = 496
                 self.match(APIParser.JOB_EXPRESSION)
                 pass
             elif token in [182]:
-                self.state = 495
+                self.state = 497
                 self.match(APIParser.JOB_START)
-                self.state = 496
+                self.state = 498
                 self.match(APIParser.JOB_EXPRESSION)
                 pass
             elif token in [188]:
-                self.state = 497
+                self.state = 499
                 self.match(APIParser.JOB_DEREGISTER)
-                self.state = 498
+                self.state = 500
                 self.match(APIParser.JOB_WORKER)
                 pass
             elif token in [187]:
-                self.state = 499
+                self.state = 501
                 self.match(APIParser.JOB_REGISTER)
-                self.state = 500
+                self.state = 502
                 self.match(APIParser.JOB_WORKER)
-                self.state = 501
+                self.state = 503
                 self.match(APIParser.JOB_TO)
-                self.state = 502
+                self.state = 504
                 self.match(APIParser.JOB_EXPRESSION)
                 pass
             elif token in [181]:
-                self.state = 503
+                self.state = 505
                 self.match(APIParser.JOB_SET)
-                self.state = 504
+                self.state = 506
                 self.match(APIParser.JOB_EXPRESSION)
-                self.state = 508 
+                self.state = 510 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 505
+                    self.state = 507
                     self.match(APIParser.JOB_EXPRESSION)
-                    self.state = 506
+                    self.state = 508
                     self.match(APIParser.JOB_EQUAL)
-                    self.state = 507
+                    self.state = 509
                     self.match(APIParser.JOB_EXPRESSION)
-                    self.state = 510 
+                    self.state = 512 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not (_la==194):
@@ -4050,21 +4066,21 @@ class APIParser ( Parser ):
 
                 pass
             elif token in [179]:
-                self.state = 512
+                self.state = 514
                 self.match(APIParser.JOB_CREATE)
-                self.state = 513
+                self.state = 515
                 self.match(APIParser.JOB_EXPRESSION)
-                self.state = 519
+                self.state = 521
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==194:
-                    self.state = 514
+                    self.state = 516
                     self.match(APIParser.JOB_EXPRESSION)
-                    self.state = 515
+                    self.state = 517
                     self.match(APIParser.JOB_EQUAL)
-                    self.state = 516
+                    self.state = 518
                     self.match(APIParser.JOB_EXPRESSION)
-                    self.state = 521
+                    self.state = 523
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -4072,19 +4088,19 @@ class APIParser ( Parser ):
             else:
                 raise NoViableAltException(self)
 
-            self.state = 525
+            self.state = 527
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==176:
-                self.state = 524
+                self.state = 526
                 self.match(APIParser.JOB_SEMICOLON)
 
 
-            self.state = 528
+            self.state = 530
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 527
+                self.state = 529
                 self.match(APIParser.CRLF)
 
 
@@ -4252,105 +4268,105 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 530
+            self.state = 532
             self.match(APIParser.COMPARE)
-            self.state = 569
+            self.state = 571
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,73,self._ctx)
             if la_ == 1:
-                self.state = 531
+                self.state = 533
                 self.match(APIParser.COMPARE_EXPRESSION)
-                self.state = 532
+                self.state = 534
                 self.match(APIParser.COMPARE_EXPRESSION)
-                self.state = 536
+                self.state = 538
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 1011) != 0:
-                    self.state = 533
+                    self.state = 535
                     _la = self._input.LA(1)
                     if not((((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 1011) != 0):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 538
+                    self.state = 540
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
 
             elif la_ == 2:
-                self.state = 539
+                self.state = 541
                 _la = self._input.LA(1)
                 if not(_la==215 or _la==216):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 540
+                self.state = 542
                 self.match(APIParser.COMPARE_EXPRESSION)
                 pass
 
             elif la_ == 3:
-                self.state = 541
+                self.state = 543
                 self.match(APIParser.COMPARE_MASKLINE)
-                self.state = 542
+                self.state = 544
                 self.match(APIParser.COMPARE_EXPRESSION)
-                self.state = 543
+                self.state = 545
                 self.match(APIParser.COMPARE_EQUAL)
-                self.state = 544
+                self.state = 546
                 self.match(APIParser.COMPARE_EXPRESSION)
                 pass
 
             elif la_ == 4:
-                self.state = 545
+                self.state = 547
                 self.match(APIParser.COMPARE_NOMASKLINE)
-                self.state = 546
+                self.state = 548
                 self.match(APIParser.COMPARE_EXPRESSION)
                 pass
 
             elif la_ == 5:
-                self.state = 547
+                self.state = 549
                 self.match(APIParser.COMPARE_RESET)
                 pass
 
             elif la_ == 6:
-                self.state = 548
+                self.state = 550
                 self.match(APIParser.COMPARE_SET)
-                self.state = 552
+                self.state = 554
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 1011) != 0:
-                    self.state = 549
+                    self.state = 551
                     _la = self._input.LA(1)
                     if not((((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 1011) != 0):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 554
+                    self.state = 556
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
 
             elif la_ == 7:
-                self.state = 555
+                self.state = 557
                 self.match(APIParser.COMPARE_SET)
-                self.state = 556
+                self.state = 558
                 self.match(APIParser.COMPARE_OUTPUT)
-                self.state = 558 
+                self.state = 560 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 557
+                    self.state = 559
                     _la = self._input.LA(1)
                     if not((((_la - 212)) & ~0x3f) == 0 and ((1 << (_la - 212)) & 7) != 0):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 560 
+                    self.state = 562 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not ((((_la - 212)) & ~0x3f) == 0 and ((1 << (_la - 212)) & 7) != 0):
@@ -4359,11 +4375,11 @@ class APIParser ( Parser ):
                 pass
 
             elif la_ == 8:
-                self.state = 562
+                self.state = 564
                 self.match(APIParser.COMPARE_SET)
-                self.state = 563
+                self.state = 565
                 self.match(APIParser.COMPARE_ALGORITHM)
-                self.state = 564
+                self.state = 566
                 _la = self._input.LA(1)
                 if not((((_la - 222)) & ~0x3f) == 0 and ((1 << (_la - 222)) & 15) != 0):
                     self._errHandler.recoverInline(self)
@@ -4373,35 +4389,35 @@ class APIParser ( Parser ):
                 pass
 
             elif la_ == 9:
-                self.state = 565
+                self.state = 567
                 self.match(APIParser.COMPARE_SET)
-                self.state = 566
+                self.state = 568
                 _la = self._input.LA(1)
                 if not(_la==220 or _la==221):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 567
+                self.state = 569
                 self.match(APIParser.COMPARE_ENCODING)
-                self.state = 568
+                self.state = 570
                 self.match(APIParser.COMPARE_EXPRESSION)
                 pass
 
 
-            self.state = 572
+            self.state = 574
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==196:
-                self.state = 571
+                self.state = 573
                 self.match(APIParser.COMPARE_SEMICOLON)
 
 
-            self.state = 575
+            self.state = 577
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 574
+                self.state = 576
                 self.match(APIParser.CRLF)
 
 
@@ -4500,113 +4516,113 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 577
+            self.state = 579
             self.match(APIParser.DATA)
-            self.state = 615
+            self.state = 617
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,81,self._ctx)
             if la_ == 1:
-                self.state = 578
+                self.state = 580
                 self.match(APIParser.DATA_SET)
-                self.state = 579
+                self.state = 581
                 self.match(APIParser.DATA_SEEDFILE)
-                self.state = 580
+                self.state = 582
                 self.match(APIParser.DATA_DIR)
-                self.state = 581
-                self.match(APIParser.DATA_EXPRESSION)
                 self.state = 583
+                self.match(APIParser.DATA_EXPRESSION)
+                self.state = 585
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==228:
-                    self.state = 582
+                    self.state = 584
                     self.match(APIParser.DATA_SEMICOLON)
 
 
                 pass
 
             elif la_ == 2:
-                self.state = 585
+                self.state = 587
                 self.match(APIParser.DATA_SET)
-                self.state = 586
+                self.state = 588
                 self.match(APIParser.DATA_HDFSUSER)
-                self.state = 587
-                self.match(APIParser.DATA_EXPRESSION)
                 self.state = 589
+                self.match(APIParser.DATA_EXPRESSION)
+                self.state = 591
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==228:
-                    self.state = 588
+                    self.state = 590
                     self.match(APIParser.DATA_SEMICOLON)
 
 
                 pass
 
             elif la_ == 3:
-                self.state = 591
+                self.state = 593
                 self.match(APIParser.DATA_CREATE)
-                self.state = 592
+                self.state = 594
                 self.match(APIParser.DATA_FILETYPE)
-                self.state = 593
+                self.state = 595
                 self.match(APIParser.DATA_FILE)
-                self.state = 594
+                self.state = 596
                 self.match(APIParser.DATA_EXPRESSION)
-                self.state = 595
-                self.match(APIParser.DATACOLUMN_OPEN)
                 self.state = 597
+                self.match(APIParser.DATACOLUMN_OPEN)
+                self.state = 599
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==245:
-                    self.state = 596
+                    self.state = 598
                     self.match(APIParser.DATACOLUMN_CONTENT)
 
 
-                self.state = 601
+                self.state = 603
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==236:
-                    self.state = 599
+                    self.state = 601
                     self.match(APIParser.DATA_ROWS)
-                    self.state = 600
+                    self.state = 602
                     self.match(APIParser.DATA_INT)
 
 
-                self.state = 603
+                self.state = 605
                 self.match(APIParser.DATA_SEMICOLON)
                 pass
 
             elif la_ == 4:
-                self.state = 604
+                self.state = 606
                 self.match(APIParser.DATA_CONVERT)
-                self.state = 605
+                self.state = 607
                 self.match(APIParser.DATA_FILETYPE)
-                self.state = 606
+                self.state = 608
                 self.match(APIParser.DATA_FILE)
-                self.state = 607
+                self.state = 609
                 self.match(APIParser.DATA_EXPRESSION)
-                self.state = 608
+                self.state = 610
                 self.match(APIParser.DATA_TO)
-                self.state = 609
+                self.state = 611
                 self.match(APIParser.DATA_FILETYPE)
-                self.state = 610
+                self.state = 612
                 self.match(APIParser.DATA_FILE)
-                self.state = 611
-                self.match(APIParser.DATA_EXPRESSION)
                 self.state = 613
+                self.match(APIParser.DATA_EXPRESSION)
+                self.state = 615
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==228:
-                    self.state = 612
+                    self.state = 614
                     self.match(APIParser.DATA_SEMICOLON)
 
 
                 pass
 
 
-            self.state = 618
+            self.state = 620
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 617
+                self.state = 619
                 self.match(APIParser.CRLF)
 
 
@@ -4657,29 +4673,29 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 620
-            self.match(APIParser.HELP)
             self.state = 622
+            self.match(APIParser.HELP)
+            self.state = 624
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==247:
-                self.state = 621
+                self.state = 623
                 self.match(APIParser.HELP_COMMAND)
 
 
-            self.state = 625
+            self.state = 627
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==249:
-                self.state = 624
+                self.state = 626
                 self.match(APIParser.HELP_SEMICOLON)
 
 
-            self.state = 628
+            self.state = 630
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 627
+                self.state = 629
                 self.match(APIParser.CRLF)
 
 
@@ -4726,11 +4742,12 @@ class APIParser ( Parser ):
         def MONITOR_START(self):
             return self.getToken(APIParser.MONITOR_START, 0)
 
-        def MONITOR_EXPRESSION(self, i:int=None):
+        def monitorExpression(self, i:int=None):
             if i is None:
-                return self.getTokens(APIParser.MONITOR_EXPRESSION)
+                return self.getTypedRuleContexts(APIParser.MonitorExpressionContext)
             else:
-                return self.getToken(APIParser.MONITOR_EXPRESSION, i)
+                return self.getTypedRuleContext(APIParser.MonitorExpressionContext,i)
+
 
         def MONITOR_STOP(self):
             return self.getToken(APIParser.MONITOR_STOP, 0)
@@ -4738,6 +4755,12 @@ class APIParser ( Parser ):
         def MONITOR_REPORT(self):
             return self.getToken(APIParser.MONITOR_REPORT, 0)
 
+        def MONITOR_SUMMARY(self):
+            return self.getToken(APIParser.MONITOR_SUMMARY, 0)
+
+        def MONITOR_EXPORT(self):
+            return self.getToken(APIParser.MONITOR_EXPORT, 0)
+
         def MONITOR_LIST(self):
             return self.getToken(APIParser.MONITOR_LIST, 0)
 
@@ -4769,115 +4792,163 @@ class APIParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 630
+            self.state = 632
             self.match(APIParser.MONITOR)
-            self.state = 662
+            self.state = 688
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,89,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,91,self._ctx)
             if la_ == 1:
-                self.state = 631
+                self.state = 633
                 self.match(APIParser.MONITOR_MANAGER)
-                self.state = 632
+                self.state = 634
                 self.match(APIParser.MONITOR_ON)
-                self.state = 635
+                self.state = 637
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==252:
-                    self.state = 633
+                    self.state = 635
                     self.match(APIParser.MONITOR_WORKERS)
-                    self.state = 634
-                    self.match(APIParser.MONITOR_EXPRESSION)
+                    self.state = 636
+                    self.monitorExpression()
 
 
                 pass
 
             elif la_ == 2:
-                self.state = 637
+                self.state = 639
                 self.match(APIParser.MONITOR_MANAGER)
-                self.state = 638
+                self.state = 640
                 self.match(APIParser.MONITOR_OFF)
                 pass
 
             elif la_ == 3:
-                self.state = 639
+                self.state = 641
                 self.match(APIParser.MONITOR_CREATE)
-                self.state = 640
+                self.state = 642
                 self.match(APIParser.MONITOR_TASK)
 
-                self.state = 642
+                self.state = 644
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,87,self._ctx)
                 if la_ == 1:
-                    self.state = 641
-                    self.match(APIParser.MONITOR_EXPRESSION)
+                    self.state = 643
+                    self.monitorExpression()
 
 
-                self.state = 647 
+                self.state = 650 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 644
-                    self.match(APIParser.MONITOR_EXPRESSION)
-                    self.state = 645
-                    self.match(APIParser.MONITOR_EQUAL)
                     self.state = 646
-                    self.match(APIParser.MONITOR_EXPRESSION)
-                    self.state = 649 
+                    self.monitorExpression()
+                    self.state = 647
+                    self.match(APIParser.MONITOR_EQUAL)
+                    self.state = 648
+                    self.monitorExpression()
+                    self.state = 652 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==262):
+                    if not ((((_la - 260)) & ~0x3f) == 0 and ((1 << (_la - 260)) & 19) != 0):
                         break
 
                 pass
 
             elif la_ == 4:
-                self.state = 651
+                self.state = 654
                 self.match(APIParser.MONITOR_START)
-                self.state = 652
+                self.state = 655
                 self.match(APIParser.MONITOR_TASK)
-                self.state = 653
-                self.match(APIParser.MONITOR_EXPRESSION)
+                self.state = 656
+                self.monitorExpression()
                 pass
 
             elif la_ == 5:
-                self.state = 654
+                self.state = 657
                 self.match(APIParser.MONITOR_STOP)
-                self.state = 655
+                self.state = 658
                 self.match(APIParser.MONITOR_TASK)
-                self.state = 656
-                self.match(APIParser.MONITOR_EXPRESSION)
+                self.state = 659
+                self.monitorExpression()
                 pass
 
             elif la_ == 6:
-                self.state = 657
+                self.state = 660
                 self.match(APIParser.MONITOR_REPORT)
-                self.state = 658
+                self.state = 661
                 self.match(APIParser.MONITOR_TASK)
-                self.state = 659
-                self.match(APIParser.MONITOR_EXPRESSION)
+                self.state = 662
+                self.monitorExpression()
                 pass
 
             elif la_ == 7:
-                self.state = 660
+                self.state = 663
+                self.match(APIParser.MONITOR_SUMMARY)
+                self.state = 664
+                self.match(APIParser.MONITOR_TASK)
+                self.state = 665
+                self.monitorExpression()
+                self.state = 672
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la - 260)) & ~0x3f) == 0 and ((1 << (_la - 260)) & 19) != 0:
+                    self.state = 666
+                    self.monitorExpression()
+                    self.state = 667
+                    self.match(APIParser.MONITOR_EQUAL)
+                    self.state = 668
+                    self.monitorExpression()
+                    self.state = 674
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+
+            elif la_ == 8:
+                self.state = 675
+                self.match(APIParser.MONITOR_EXPORT)
+                self.state = 676
+                self.match(APIParser.MONITOR_TASK)
+                self.state = 677
+                self.monitorExpression()
+                self.state = 682 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 678
+                    self.monitorExpression()
+                    self.state = 679
+                    self.match(APIParser.MONITOR_EQUAL)
+                    self.state = 680
+                    self.monitorExpression()
+                    self.state = 684 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la - 260)) & ~0x3f) == 0 and ((1 << (_la - 260)) & 19) != 0):
+                        break
+
+                pass
+
+            elif la_ == 9:
+                self.state = 686
                 self.match(APIParser.MONITOR_LIST)
-                self.state = 661
+                self.state = 687
                 self.match(APIParser.MONITOR_TASK)
                 pass
 
 
-            self.state = 665
+            self.state = 691
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==264:
-                self.state = 664
+            if _la==266:
+                self.state = 690
                 self.match(APIParser.MONITOR_SEMICOLON)
 
 
-            self.state = 668
+            self.state = 694
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==263:
-                self.state = 667
+            if _la==265:
+                self.state = 693
                 self.match(APIParser.MONITOR_CRLF)
 
 
@@ -4890,6 +4961,57 @@ class APIParser ( Parser ):
         return localctx
 
 
+    class MonitorExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MONITOR_EXPRESSION(self):
+            return self.getToken(APIParser.MONITOR_EXPRESSION, 0)
+
+        def MONITOR_SUMMARY(self):
+            return self.getToken(APIParser.MONITOR_SUMMARY, 0)
+
+        def MONITOR_EXPORT(self):
+            return self.getToken(APIParser.MONITOR_EXPORT, 0)
+
+        def getRuleIndex(self):
+            return APIParser.RULE_monitorExpression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMonitorExpression" ):
+                return visitor.visitMonitorExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def monitorExpression(self):
+
+        localctx = APIParser.MonitorExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_monitorExpression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 696
+            _la = self._input.LA(1)
+            if not((((_la - 260)) & ~0x3f) == 0 and ((1 << (_la - 260)) & 19) != 0):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class PluginContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -4927,37 +5049,37 @@ class APIParser ( Parser ):
     def plugin(self):
 
         localctx = APIParser.PluginContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 86, self.RULE_plugin)
+        self.enterRule(localctx, 88, self.RULE_plugin)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 670
+            self.state = 698
             self.match(APIParser.PLUGIN)
-            self.state = 672 
+            self.state = 700 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 671
+                self.state = 699
                 self.match(APIParser.PLUGIN_EXPRESSION)
-                self.state = 674 
+                self.state = 702 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==266):
+                if not (_la==268):
                     break
 
-            self.state = 677
+            self.state = 705
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==268:
-                self.state = 676
+            if _la==270:
+                self.state = 704
                 self.match(APIParser.PLUGIN_SEMICOLON)
 
 
-            self.state = 680
+            self.state = 708
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==267:
-                self.state = 679
+            if _la==269:
+                self.state = 707
                 self.match(APIParser.PLUGIN_CRLF)
 
 
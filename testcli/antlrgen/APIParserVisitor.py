@@ -224,6 +224,11 @@ class APIParserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by APIParser#monitorExpression.
+    def visitMonitorExpression(self, ctx:APIParser.MonitorExpressionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by APIParser#plugin.
     def visitPlugin(self, ctx:APIParser.PluginContext):
         return self.visitChildren(ctx)
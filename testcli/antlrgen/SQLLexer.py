@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,288,2615,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,
+        4,0,290,2634,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,
         -1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,
         -1,6,-1,6,-1,6,-1,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,
         5,7,5,2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,
@@ -64,113 +64,113 @@ def serializedATN():
         7,284,2,285,7,285,2,286,7,286,2,287,7,287,2,288,7,288,2,289,7,289,
         2,290,7,290,2,291,7,291,2,292,7,292,2,293,7,293,2,294,7,294,2,295,
         7,295,2,296,7,296,2,297,7,297,2,298,7,298,2,299,7,299,2,300,7,300,
-        2,301,7,301,2,302,7,302,2,303,7,303,2,304,7,304,1,0,1,0,1,0,1,0,
-        1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,
-        1,3,1,3,5,3,677,8,3,10,3,12,3,680,9,3,1,3,1,3,3,3,684,8,3,1,3,1,
-        3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,
-        5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,
-        7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,
-        9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
-        1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,12,
-        1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,
-        1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,15,
-        1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,
-        1,15,1,15,1,15,1,15,1,15,4,15,807,8,15,11,15,12,15,808,1,15,1,15,
-        4,15,813,8,15,11,15,12,15,814,1,15,1,15,1,15,1,15,1,15,1,15,1,15,
-        1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,
-        1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,
-        1,15,1,15,1,15,3,15,853,8,15,1,15,1,15,1,16,1,16,1,17,1,17,1,18,
-        1,18,1,19,1,19,1,20,1,20,1,21,1,21,1,22,1,22,1,23,1,23,1,24,1,24,
-        1,25,1,25,1,26,1,26,1,27,1,27,1,28,1,28,1,29,1,29,1,30,4,30,886,
-        8,30,11,30,12,30,887,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,31,1,32,
-        1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,
-        1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,
-        1,35,1,35,5,35,927,8,35,10,35,12,35,930,9,35,1,35,1,35,3,35,934,
-        8,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,
-        1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,38,1,38,1,38,1,38,1,38,1,38,
-        1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,40,1,40,
-        1,40,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
-        1,41,1,42,1,42,1,42,1,42,1,42,1,42,1,43,1,43,1,43,1,43,1,43,1,43,
-        1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,
-        1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,
-        1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,48,1,48,
-        1,48,1,48,1,48,1,48,1,48,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,50,
-        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,51,
-        1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,
-        1,52,1,52,1,52,1,53,1,53,4,53,1083,8,53,11,53,12,53,1084,1,53,1,
-        53,1,54,4,54,1090,8,54,11,54,12,54,1091,1,55,4,55,1095,8,55,11,55,
-        12,55,1096,1,55,1,55,4,55,1101,8,55,11,55,12,55,1102,1,56,1,56,1,
-        56,1,56,1,56,1,56,4,56,1111,8,56,11,56,12,56,1112,1,57,1,57,1,57,
-        3,57,1118,8,57,1,58,1,58,1,59,1,59,1,59,1,59,1,60,1,60,1,61,1,61,
-        1,62,1,62,1,63,1,63,1,64,1,64,1,64,1,64,1,64,3,64,1139,8,64,5,64,
-        1141,8,64,10,64,12,64,1144,9,64,1,64,1,64,1,65,1,65,1,65,1,65,3,
-        65,1152,8,65,1,65,1,65,3,65,1156,8,65,5,65,1158,8,65,10,65,12,65,
-        1161,9,65,1,65,1,65,1,66,4,66,1166,8,66,11,66,12,66,1167,1,66,1,
-        66,1,67,1,67,1,67,1,67,1,67,1,68,1,68,1,69,1,69,1,70,1,70,1,71,1,
-        71,1,72,1,72,1,73,1,73,1,74,1,74,1,74,1,75,1,75,1,76,1,76,1,77,1,
-        77,1,78,1,78,1,78,1,78,1,78,1,79,4,79,1204,8,79,11,79,12,79,1205,
-        1,79,1,79,4,79,1210,8,79,11,79,12,79,1211,1,79,1,79,4,79,1216,8,
-        79,11,79,12,79,1217,1,79,1,79,4,79,1222,8,79,11,79,12,79,1223,1,
-        80,1,80,1,80,4,80,1229,8,80,11,80,12,80,1230,1,80,1,80,1,81,1,81,
-        1,81,1,81,3,81,1239,8,81,1,81,1,81,3,81,1243,8,81,5,81,1245,8,81,
-        10,81,12,81,1248,9,81,1,81,1,81,1,82,1,82,1,82,1,82,3,82,1256,8,
-        82,1,82,1,82,3,82,1260,8,82,5,82,1262,8,82,10,82,12,82,1265,9,82,
-        1,82,1,82,1,83,1,83,1,83,1,83,1,83,1,83,4,83,1275,8,83,11,83,12,
-        83,1276,1,84,1,84,1,84,1,84,1,84,1,85,4,85,1285,8,85,11,85,12,85,
-        1286,1,86,4,86,1290,8,86,11,86,12,86,1291,1,86,1,86,1,87,1,87,1,
-        87,1,87,1,87,1,88,1,88,1,88,1,88,1,89,1,89,1,89,1,89,1,90,1,90,1,
-        90,1,90,1,91,1,91,1,92,1,92,1,92,1,92,1,93,4,93,1320,8,93,11,93,
-        12,93,1321,1,93,1,93,1,94,1,94,1,94,1,94,1,94,1,95,1,95,1,95,1,95,
-        1,95,1,95,1,95,1,95,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,97,
-        1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,98,1,98,1,98,1,98,1,98,1,99,
-        1,99,1,99,1,99,1,99,1,99,4,99,1366,8,99,11,99,12,99,1367,1,100,1,
-        100,1,100,1,100,1,101,1,101,1,101,1,101,1,102,4,102,1379,8,102,11,
-        102,12,102,1380,1,102,1,102,1,103,1,103,1,103,1,103,1,103,1,103,
-        1,104,1,104,1,104,1,104,1,105,1,105,1,105,1,105,1,106,1,106,1,106,
-        1,106,1,107,1,107,1,107,1,107,1,108,1,108,1,108,1,108,1,109,1,109,
-        1,109,1,109,1,109,1,110,1,110,1,110,1,110,1,111,4,111,1421,8,111,
-        11,111,12,111,1422,1,111,1,111,1,112,5,112,1428,8,112,10,112,12,
-        112,1431,9,112,1,112,1,112,1,112,1,112,3,112,1437,8,112,1,112,1,
-        112,1,113,5,113,1442,8,113,10,113,12,113,1445,9,113,1,113,1,113,
-        1,113,1,113,1,113,1,113,4,113,1453,8,113,11,113,12,113,1454,1,113,
-        1,113,1,113,1,113,1,113,1,113,1,114,4,114,1464,8,114,11,114,12,114,
-        1465,1,114,1,114,1,115,1,115,1,115,1,116,1,116,1,116,1,117,1,117,
-        1,117,1,117,1,118,1,118,5,118,1482,8,118,10,118,12,118,1485,9,118,
-        1,118,1,118,1,119,1,119,1,119,1,119,1,119,1,119,4,119,1495,8,119,
-        11,119,12,119,1496,1,120,1,120,1,121,1,121,1,122,4,122,1504,8,122,
-        11,122,12,122,1505,1,122,1,122,1,123,1,123,1,124,1,124,1,124,1,124,
+        2,301,7,301,2,302,7,302,2,303,7,303,2,304,7,304,2,305,7,305,2,306,
+        7,306,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,
+        2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,5,3,681,8,3,10,3,12,3,684,9,3,1,3,
+        1,3,3,3,688,8,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,
+        1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,
+        1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,
+        1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,
+        10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,
+        11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,
+        13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,
+        14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,
+        15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,4,15,811,8,15,11,
+        15,12,15,812,1,15,1,15,4,15,817,8,15,11,15,12,15,818,1,15,1,15,1,
+        15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,
+        15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,
+        15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,3,15,857,8,15,1,15,1,15,1,
+        16,1,16,1,17,1,17,1,18,1,18,1,19,1,19,1,20,1,20,1,21,1,21,1,22,1,
+        22,1,23,1,23,1,24,1,24,1,25,1,25,1,26,1,26,1,27,1,27,1,28,1,28,1,
+        29,1,29,1,30,4,30,890,8,30,11,30,12,30,891,1,30,1,30,1,31,1,31,1,
+        31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,
+        33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,
+        35,1,35,1,35,1,35,1,35,1,35,1,35,5,35,931,8,35,10,35,12,35,934,9,
+        35,1,35,1,35,3,35,938,8,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,
+        36,1,36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,
+        39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,
+        41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,42,1,42,1,42,1,42,1,43,1,
+        43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,
+        45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,46,1,
+        46,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,
+        47,1,47,1,47,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,49,1,49,1,49,1,
+        49,1,49,1,49,1,49,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,
+        50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,
+        52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,4,53,1087,8,53,11,
+        53,12,53,1088,1,53,1,53,1,54,4,54,1094,8,54,11,54,12,54,1095,1,55,
+        4,55,1099,8,55,11,55,12,55,1100,1,55,1,55,4,55,1105,8,55,11,55,12,
+        55,1106,1,56,1,56,1,56,1,56,1,56,1,56,4,56,1115,8,56,11,56,12,56,
+        1116,1,57,1,57,1,57,3,57,1122,8,57,1,58,1,58,1,59,1,59,1,59,1,59,
+        1,60,1,60,1,61,1,61,1,62,1,62,1,63,1,63,1,64,1,64,1,64,1,64,1,64,
+        3,64,1143,8,64,5,64,1145,8,64,10,64,12,64,1148,9,64,1,64,1,64,1,
+        65,1,65,1,65,1,65,3,65,1156,8,65,1,65,1,65,3,65,1160,8,65,5,65,1162,
+        8,65,10,65,12,65,1165,9,65,1,65,1,65,1,66,4,66,1170,8,66,11,66,12,
+        66,1171,1,66,1,66,1,67,1,67,1,67,1,67,1,67,1,68,1,68,1,69,1,69,1,
+        70,1,70,1,71,1,71,1,72,1,72,1,73,1,73,1,74,1,74,1,74,1,75,1,75,1,
+        76,1,76,1,77,1,77,1,78,1,78,1,78,1,78,1,78,1,79,4,79,1208,8,79,11,
+        79,12,79,1209,1,79,1,79,4,79,1214,8,79,11,79,12,79,1215,1,79,1,79,
+        4,79,1220,8,79,11,79,12,79,1221,1,79,1,79,4,79,1226,8,79,11,79,12,
+        79,1227,1,80,1,80,1,80,4,80,1233,8,80,11,80,12,80,1234,1,80,1,80,
+        1,81,1,81,1,81,1,81,3,81,1243,8,81,1,81,1,81,3,81,1247,8,81,5,81,
+        1249,8,81,10,81,12,81,1252,9,81,1,81,1,81,1,82,1,82,1,82,1,82,3,
+        82,1260,8,82,1,82,1,82,3,82,1264,8,82,5,82,1266,8,82,10,82,12,82,
+        1269,9,82,1,82,1,82,1,83,1,83,1,83,1,83,1,83,1,83,4,83,1279,8,83,
+        11,83,12,83,1280,1,84,1,84,1,84,1,84,1,84,1,85,4,85,1289,8,85,11,
+        85,12,85,1290,1,86,4,86,1294,8,86,11,86,12,86,1295,1,86,1,86,1,87,
+        1,87,1,87,1,87,1,87,1,88,1,88,1,88,1,88,1,89,1,89,1,89,1,89,1,90,
+        1,90,1,90,1,90,1,91,1,91,1,92,1,92,1,92,1,92,1,93,4,93,1324,8,93,
+        11,93,12,93,1325,1,93,1,93,1,94,1,94,1,94,1,94,1,94,1,95,1,95,1,
+        95,1,95,1,95,1,95,1,95,1,95,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,
+        96,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,98,1,98,1,98,1,98,1,
+        98,1,99,1,99,1,99,1,99,1,99,1,99,4,99,1370,8,99,11,99,12,99,1371,
+        1,100,1,100,1,100,1,100,1,101,1,101,1,101,1,101,1,102,4,102,1383,
+        8,102,11,102,12,102,1384,1,102,1,102,1,103,1,103,1,103,1,103,1,103,
+        1,103,1,104,1,104,1,104,1,104,1,105,1,105,1,105,1,105,1,106,1,106,
+        1,106,1,106,1,107,1,107,1,107,1,107,1,108,1,108,1,108,1,108,1,109,
+        1,109,1,109,1,109,1,109,1,110,1,110,1,110,1,110,1,111,4,111,1425,
+        8,111,11,111,12,111,1426,1,111,1,111,1,112,5,112,1432,8,112,10,112,
+        12,112,1435,9,112,1,112,1,112,1,112,1,112,3,112,1441,8,112,1,112,
+        1,112,1,113,5,113,1446,8,113,10,113,12,113,1449,9,113,1,113,1,113,
+        1,113,1,113,1,113,1,113,4,113,1457,8,113,11,113,12,113,1458,1,113,
+        1,113,1,113,1,113,1,113,1,113,1,114,4,114,1468,8,114,11,114,12,114,
+        1469,1,114,1,114,1,115,1,115,1,115,1,116,1,116,1,116,1,117,1,117,
+        1,117,1,117,1,118,1,118,5,118,1486,8,118,10,118,12,118,1489,9,118,
+        1,118,1,118,1,119,1,119,1,119,1,119,1,119,1,119,4,119,1499,8,119,
+        11,119,12,119,1500,1,120,1,120,1,121,1,121,1,122,4,122,1508,8,122,
+        11,122,12,122,1509,1,122,1,122,1,123,1,123,1,124,1,124,1,124,1,124,
         1,124,1,124,1,124,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,126,
         1,126,1,126,1,126,1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,127,
         1,127,1,127,1,127,1,128,1,128,1,128,1,128,1,128,1,129,1,129,1,129,
         1,129,1,129,1,129,1,130,1,130,1,130,1,130,1,130,1,131,1,131,1,131,
         1,131,1,131,1,131,1,132,1,132,1,132,1,132,1,133,1,133,1,133,1,133,
-        1,133,1,133,4,133,1573,8,133,11,133,12,133,1574,1,134,1,134,1,135,
-        1,135,1,135,1,135,1,136,4,136,1584,8,136,11,136,12,136,1585,1,136,
-        1,136,1,137,1,137,1,137,1,137,1,137,1,137,1,137,4,137,1597,8,137,
-        11,137,12,137,1598,1,138,1,138,1,138,1,138,1,139,4,139,1606,8,139,
-        11,139,12,139,1607,1,139,1,139,1,140,1,140,1,140,1,140,1,140,1,140,
-        1,140,4,140,1619,8,140,11,140,12,140,1620,1,141,1,141,1,141,1,141,
-        1,142,4,142,1628,8,142,11,142,12,142,1629,1,142,1,142,1,143,1,143,
-        1,143,1,144,1,144,1,144,1,145,1,145,5,145,1642,8,145,10,145,12,145,
-        1645,9,145,1,145,1,145,1,145,1,145,1,146,1,146,1,147,4,147,1654,
-        8,147,11,147,12,147,1655,1,147,1,147,1,148,1,148,1,148,1,148,1,148,
+        1,133,1,133,4,133,1577,8,133,11,133,12,133,1578,1,134,1,134,1,135,
+        1,135,1,135,1,135,1,136,4,136,1588,8,136,11,136,12,136,1589,1,136,
+        1,136,1,137,1,137,1,137,1,137,1,137,1,137,1,137,4,137,1601,8,137,
+        11,137,12,137,1602,1,138,1,138,1,138,1,138,1,139,4,139,1610,8,139,
+        11,139,12,139,1611,1,139,1,139,1,140,1,140,1,140,1,140,1,140,1,140,
+        1,140,4,140,1623,8,140,11,140,12,140,1624,1,141,1,141,1,141,1,141,
+        1,142,4,142,1632,8,142,11,142,12,142,1633,1,142,1,142,1,143,1,143,
+        1,143,1,144,1,144,1,144,1,145,1,145,5,145,1646,8,145,10,145,12,145,
+        1649,9,145,1,145,1,145,1,145,1,145,1,146,1,146,1,147,4,147,1658,
+        8,147,11,147,12,147,1659,1,147,1,147,1,148,1,148,1,148,1,148,1,148,
         1,148,1,149,1,149,1,149,1,149,1,149,1,149,1,150,1,150,1,150,1,150,
         1,150,1,150,1,150,1,150,1,150,1,151,1,151,1,152,1,152,1,152,1,153,
         1,153,1,153,1,154,1,154,1,154,1,154,1,154,1,154,1,155,1,155,1,155,
         1,155,1,156,1,156,1,156,1,156,1,156,1,156,1,156,1,156,1,156,1,157,
-        1,157,5,157,1710,8,157,10,157,12,157,1713,9,157,1,157,1,157,1,158,
-        1,158,1,158,1,158,1,159,4,159,1722,8,159,11,159,12,159,1723,1,159,
+        1,157,5,157,1714,8,157,10,157,12,157,1717,9,157,1,157,1,157,1,158,
+        1,158,1,158,1,158,1,159,4,159,1726,8,159,11,159,12,159,1727,1,159,
         1,159,1,160,1,160,1,161,1,161,1,161,1,161,1,161,1,161,1,162,1,162,
         1,163,1,163,1,163,1,163,1,163,1,163,1,163,1,163,1,163,1,164,1,164,
-        1,164,1,164,1,164,1,165,1,165,1,165,1,165,1,166,4,166,1757,8,166,
-        11,166,12,166,1758,1,166,1,166,1,167,1,167,1,167,1,167,1,167,1,167,
-        1,167,4,167,1770,8,167,11,167,12,167,1771,1,168,1,168,1,169,1,169,
-        1,169,1,169,1,170,1,170,1,170,1,170,1,171,4,171,1785,8,171,11,171,
-        12,171,1786,1,171,1,171,1,172,1,172,1,172,1,172,1,172,1,172,1,172,
-        4,172,1798,8,172,11,172,12,172,1799,1,173,1,173,1,174,1,174,1,174,
+        1,164,1,164,1,164,1,165,1,165,1,165,1,165,1,166,4,166,1761,8,166,
+        11,166,12,166,1762,1,166,1,166,1,167,1,167,1,167,1,167,1,167,1,167,
+        1,167,4,167,1774,8,167,11,167,12,167,1775,1,168,1,168,1,169,1,169,
+        1,169,1,169,1,170,1,170,1,170,1,170,1,171,4,171,1789,8,171,11,171,
+        12,171,1790,1,171,1,171,1,172,1,172,1,172,1,172,1,172,1,172,1,172,
+        4,172,1802,8,172,11,172,12,172,1803,1,173,1,173,1,174,1,174,1,174,
         1,174,1,175,1,175,1,175,1,175,1,176,1,176,1,176,1,176,1,177,4,177,
-        1817,8,177,11,177,12,177,1818,1,177,1,177,1,178,1,178,1,179,1,179,
+        1821,8,177,11,177,12,177,1822,1,177,1,177,1,178,1,178,1,179,1,179,
         1,179,1,179,1,180,1,180,1,180,1,180,1,180,1,180,1,180,1,180,1,181,
         1,181,1,181,1,181,1,181,1,182,1,182,1,182,1,182,1,182,1,183,1,183,
         1,183,1,183,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,185,
@@ -184,10 +184,10 @@ def serializedATN():
         1,196,1,196,1,196,1,197,1,197,1,197,1,197,1,198,1,198,1,198,1,198,
         1,198,1,198,1,198,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,200,
         1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,201,1,201,1,201,1,201,
-        1,201,1,201,1,201,1,201,1,201,1,202,1,202,1,203,4,203,1978,8,203,
-        11,203,12,203,1979,1,203,1,203,1,204,1,204,1,205,1,205,1,205,1,205,
-        1,206,1,206,1,206,1,206,1,206,1,206,1,206,4,206,1997,8,206,11,206,
-        12,206,1998,1,207,4,207,2002,8,207,11,207,12,207,2003,1,207,1,207,
+        1,201,1,201,1,201,1,201,1,201,1,202,1,202,1,203,4,203,1982,8,203,
+        11,203,12,203,1983,1,203,1,203,1,204,1,204,1,205,1,205,1,205,1,205,
+        1,206,1,206,1,206,1,206,1,206,1,206,1,206,4,206,2001,8,206,11,206,
+        12,206,2002,1,207,4,207,2006,8,207,11,207,12,207,2007,1,207,1,207,
         1,208,1,208,1,209,1,209,1,210,1,210,1,210,1,210,1,211,1,211,1,211,
         1,211,1,211,1,211,1,211,1,212,1,212,1,212,1,212,1,212,1,213,1,213,
         1,213,1,213,1,214,1,214,1,214,1,214,1,214,1,214,1,215,1,215,1,215,
@@ -198,8 +198,8 @@ def serializedATN():
         1,221,1,221,1,221,1,221,1,221,1,221,1,222,1,222,1,222,1,222,1,222,
         1,222,1,222,1,222,1,222,1,222,1,222,1,223,1,223,1,223,1,224,1,224,
         1,224,1,224,1,225,1,225,1,225,1,226,1,226,1,226,1,226,1,226,1,226,
-        4,226,2118,8,226,11,226,12,226,2119,1,227,4,227,2123,8,227,11,227,
-        12,227,2124,1,227,1,227,1,228,1,228,1,229,1,229,1,229,1,230,1,230,
+        4,226,2122,8,226,11,226,12,226,2123,1,227,4,227,2127,8,227,11,227,
+        12,227,2128,1,227,1,227,1,228,1,228,1,229,1,229,1,229,1,230,1,230,
         1,230,1,230,1,231,1,231,1,231,1,231,1,232,1,232,1,232,1,232,1,232,
         1,232,1,233,1,233,1,233,1,233,1,233,1,234,1,234,1,234,1,234,1,234,
         1,234,1,234,1,235,1,235,1,235,1,235,1,235,1,235,1,235,1,235,1,235,
@@ -219,826 +219,833 @@ def serializedATN():
         1,253,1,253,1,253,1,254,1,254,1,254,1,254,1,255,1,255,1,255,1,255,
         1,255,1,255,1,256,1,256,1,256,1,256,1,256,1,256,1,256,1,256,1,257,
         1,257,1,257,1,257,1,257,1,258,1,258,1,258,1,258,1,258,1,258,4,258,
-        2344,8,258,11,258,12,258,2345,1,259,4,259,2349,8,259,11,259,12,259,
-        2350,1,259,1,259,1,260,1,260,1,260,1,260,1,261,1,261,1,261,1,261,
+        2348,8,258,11,258,12,258,2349,1,259,4,259,2353,8,259,11,259,12,259,
+        2354,1,259,1,259,1,260,1,260,1,260,1,260,1,261,1,261,1,261,1,261,
         1,262,1,262,1,262,1,262,1,262,1,262,1,262,1,262,1,262,1,263,1,263,
         1,263,1,263,1,264,1,264,1,264,1,264,1,264,1,264,1,264,1,265,1,265,
         1,265,1,265,1,265,1,266,1,266,1,266,1,266,1,266,1,266,1,266,1,266,
-        1,266,3,266,2397,8,266,1,267,1,267,1,267,1,267,1,267,1,267,1,267,
+        1,266,3,266,2401,8,266,1,267,1,267,1,267,1,267,1,267,1,267,1,267,
         1,267,1,267,1,268,1,268,1,268,1,268,1,268,1,269,1,269,1,270,1,270,
         1,271,1,271,1,271,1,271,1,272,1,272,1,272,1,272,1,272,1,272,1,272,
         1,272,1,273,1,273,1,273,1,274,1,274,1,274,1,274,1,274,1,274,4,274,
-        2438,8,274,11,274,12,274,2439,1,275,4,275,2443,8,275,11,275,12,275,
-        2444,1,275,1,275,1,276,1,276,1,277,5,277,2452,8,277,10,277,12,277,
-        2455,9,277,1,277,4,277,2458,8,277,11,277,12,277,2459,1,277,1,277,
-        1,278,4,278,2465,8,278,11,278,12,278,2466,1,278,1,278,1,279,4,279,
-        2472,8,279,11,279,12,279,2473,1,280,1,280,1,280,1,280,1,281,1,281,
-        1,282,4,282,2483,8,282,11,282,12,282,2484,1,282,1,282,1,283,1,283,
+        2442,8,274,11,274,12,274,2443,1,275,4,275,2447,8,275,11,275,12,275,
+        2448,1,275,1,275,1,276,1,276,1,277,5,277,2456,8,277,10,277,12,277,
+        2459,9,277,1,277,4,277,2462,8,277,11,277,12,277,2463,1,277,1,277,
+        1,278,4,278,2469,8,278,11,278,12,278,2470,1,278,1,278,1,279,4,279,
+        2476,8,279,11,279,12,279,2477,1,280,1,280,1,280,1,280,1,281,1,281,
+        1,282,4,282,2487,8,282,11,282,12,282,2488,1,282,1,282,1,283,1,283,
         1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,283,
         1,283,1,283,1,284,1,284,1,284,1,284,1,284,1,284,1,284,1,284,1,285,
         1,285,1,285,1,285,1,285,1,285,1,285,1,286,1,286,1,286,1,286,1,286,
         1,287,1,287,1,288,1,288,1,288,1,288,1,288,1,288,1,289,1,289,1,289,
         1,289,1,289,1,290,1,290,1,290,1,290,1,290,1,290,1,290,1,291,1,291,
-        1,291,1,291,1,291,1,292,1,292,1,292,1,293,1,293,1,293,1,293,1,294,
-        1,294,1,294,1,294,1,294,4,294,2561,8,294,11,294,12,294,2562,1,295,
-        1,295,1,295,1,295,1,296,1,296,1,297,4,297,2572,8,297,11,297,12,297,
-        2573,1,297,1,297,1,298,1,298,1,298,1,298,1,298,4,298,2583,8,298,
-        11,298,12,298,2584,1,299,1,299,1,299,1,299,1,300,1,300,1,301,4,301,
-        2594,8,301,11,301,12,301,2595,1,301,1,301,1,302,1,302,1,302,1,302,
-        1,302,1,302,4,302,2606,8,302,11,302,12,302,2607,1,303,1,303,1,303,
-        1,303,1,304,1,304,8,678,928,1429,1443,1483,1643,1711,2453,0,305,
-        28,1,30,2,32,3,34,4,36,5,38,6,40,7,42,8,44,9,46,10,48,11,50,12,52,
-        13,54,14,56,15,58,16,60,17,62,18,64,19,66,20,68,21,70,22,72,23,74,
-        24,76,25,78,26,80,27,82,28,84,29,86,30,88,31,90,32,92,33,94,34,96,
-        35,98,36,100,37,102,38,104,39,106,40,108,41,110,42,112,43,114,44,
-        116,45,118,46,120,47,122,48,124,49,126,50,128,51,130,52,132,53,134,
-        54,136,55,138,56,140,57,142,0,144,0,146,0,148,0,150,0,152,0,154,
-        0,156,0,158,0,160,58,162,0,164,59,166,60,168,61,170,62,172,63,174,
-        64,176,65,178,66,180,67,182,68,184,69,186,70,188,71,190,0,192,0,
-        194,72,196,0,198,73,200,74,202,75,204,0,206,0,208,76,210,77,212,
-        0,214,78,216,79,218,80,220,81,222,82,224,83,226,84,228,85,230,86,
-        232,87,234,0,236,88,238,89,240,90,242,91,244,92,246,93,248,94,250,
-        95,252,96,254,97,256,98,258,99,260,100,262,101,264,102,266,103,268,
-        104,270,105,272,106,274,107,276,108,278,109,280,110,282,111,284,
-        112,286,113,288,114,290,115,292,116,294,117,296,118,298,119,300,
-        120,302,121,304,122,306,123,308,124,310,125,312,126,314,127,316,
-        128,318,129,320,130,322,131,324,132,326,133,328,134,330,135,332,
-        136,334,137,336,138,338,139,340,140,342,141,344,142,346,143,348,
-        144,350,145,352,146,354,147,356,148,358,149,360,150,362,151,364,
-        152,366,153,368,154,370,155,372,156,374,157,376,158,378,159,380,
-        160,382,161,384,162,386,163,388,164,390,165,392,166,394,167,396,
-        168,398,169,400,170,402,171,404,172,406,173,408,174,410,175,412,
-        176,414,177,416,178,418,179,420,180,422,181,424,182,426,183,428,
-        184,430,185,432,186,434,187,436,188,438,189,440,190,442,191,444,
-        192,446,193,448,194,450,195,452,196,454,197,456,198,458,199,460,
-        200,462,201,464,202,466,203,468,204,470,205,472,206,474,207,476,
-        208,478,209,480,210,482,211,484,212,486,213,488,214,490,215,492,
-        216,494,217,496,218,498,219,500,220,502,221,504,222,506,223,508,
-        224,510,225,512,226,514,227,516,228,518,229,520,230,522,231,524,
-        232,526,233,528,234,530,235,532,236,534,237,536,238,538,239,540,
-        240,542,241,544,242,546,243,548,244,550,245,552,246,554,247,556,
-        248,558,249,560,250,562,251,564,252,566,253,568,254,570,255,572,
-        256,574,257,576,258,578,259,580,260,582,261,584,262,586,263,588,
-        264,590,265,592,266,594,267,596,268,598,269,600,270,602,271,604,
-        272,606,273,608,274,610,275,612,276,614,277,616,278,618,279,620,
-        280,622,281,624,282,626,283,628,284,630,285,632,286,634,287,636,
-        288,28,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,
-        23,24,25,26,27,44,2,0,67,67,99,99,2,0,79,79,111,111,2,0,78,78,110,
-        110,2,0,69,69,101,101,2,0,84,84,116,116,2,0,83,83,115,115,2,0,73,
-        73,105,105,2,0,68,68,100,100,2,0,82,82,114,114,2,0,65,65,97,97,2,
-        0,85,85,117,117,2,0,80,80,112,112,2,0,76,76,108,108,2,0,66,66,98,
-        98,2,0,71,71,103,103,2,0,77,77,109,109,2,0,75,75,107,107,2,0,70,
-        70,102,102,2,0,9,9,32,32,2,0,88,88,120,120,2,0,81,81,113,113,2,0,
-        72,72,104,104,2,0,87,87,119,119,2,0,86,86,118,118,2,0,74,74,106,
-        106,2,0,65,90,97,122,3,0,45,46,95,95,126,126,5,0,33,33,36,36,38,
-        38,40,43,61,61,1,0,48,57,3,0,48,57,65,70,97,102,1,0,34,34,1,0,39,
-        39,2,0,46,46,58,58,2,0,123,123,125,125,1,0,10,10,2,0,10,10,47,47,
-        3,0,47,47,58,58,92,92,4,0,32,32,47,47,58,58,92,92,7,0,37,37,47,47,
-        58,58,64,64,92,92,123,123,125,125,2,0,89,89,121,121,6,0,44,44,47,
-        47,58,58,64,64,92,92,123,125,5,0,47,47,58,58,92,92,123,123,125,125,
-        2,0,9,10,32,32,3,0,48,57,65,90,97,122,2754,0,28,1,0,0,0,0,30,1,0,
-        0,0,0,32,1,0,0,0,0,34,1,0,0,0,0,36,1,0,0,0,0,38,1,0,0,0,0,40,1,0,
-        0,0,0,42,1,0,0,0,0,44,1,0,0,0,0,46,1,0,0,0,0,48,1,0,0,0,0,50,1,0,
-        0,0,0,52,1,0,0,0,0,54,1,0,0,0,0,56,1,0,0,0,0,58,1,0,0,0,0,60,1,0,
-        0,0,0,62,1,0,0,0,0,64,1,0,0,0,0,66,1,0,0,0,0,68,1,0,0,0,0,70,1,0,
-        0,0,0,72,1,0,0,0,0,74,1,0,0,0,0,76,1,0,0,0,0,78,1,0,0,0,0,80,1,0,
-        0,0,0,82,1,0,0,0,0,84,1,0,0,0,0,86,1,0,0,0,0,88,1,0,0,0,0,90,1,0,
-        0,0,0,92,1,0,0,0,0,94,1,0,0,0,0,96,1,0,0,0,0,98,1,0,0,0,0,100,1,
-        0,0,0,0,102,1,0,0,0,0,104,1,0,0,0,0,106,1,0,0,0,0,108,1,0,0,0,0,
-        110,1,0,0,0,0,112,1,0,0,0,0,114,1,0,0,0,0,116,1,0,0,0,0,118,1,0,
-        0,0,0,120,1,0,0,0,0,122,1,0,0,0,0,124,1,0,0,0,0,126,1,0,0,0,0,128,
-        1,0,0,0,0,130,1,0,0,0,0,132,1,0,0,0,0,134,1,0,0,0,0,136,1,0,0,0,
-        0,138,1,0,0,0,0,140,1,0,0,0,1,160,1,0,0,0,1,162,1,0,0,0,1,164,1,
-        0,0,0,1,166,1,0,0,0,1,168,1,0,0,0,1,170,1,0,0,0,1,172,1,0,0,0,1,
-        174,1,0,0,0,1,176,1,0,0,0,1,178,1,0,0,0,1,180,1,0,0,0,1,182,1,0,
-        0,0,1,184,1,0,0,0,1,186,1,0,0,0,1,188,1,0,0,0,1,194,1,0,0,0,2,196,
-        1,0,0,0,2,198,1,0,0,0,3,200,1,0,0,0,3,202,1,0,0,0,3,204,1,0,0,0,
-        3,206,1,0,0,0,3,208,1,0,0,0,3,210,1,0,0,0,3,212,1,0,0,0,4,214,1,
-        0,0,0,4,216,1,0,0,0,4,218,1,0,0,0,4,220,1,0,0,0,4,222,1,0,0,0,4,
-        224,1,0,0,0,4,226,1,0,0,0,4,228,1,0,0,0,5,230,1,0,0,0,5,232,1,0,
-        0,0,5,234,1,0,0,0,5,236,1,0,0,0,5,238,1,0,0,0,5,240,1,0,0,0,5,242,
-        1,0,0,0,6,244,1,0,0,0,6,246,1,0,0,0,6,248,1,0,0,0,6,250,1,0,0,0,
-        7,252,1,0,0,0,8,254,1,0,0,0,9,256,1,0,0,0,9,258,1,0,0,0,9,260,1,
-        0,0,0,9,262,1,0,0,0,9,264,1,0,0,0,9,266,1,0,0,0,9,268,1,0,0,0,9,
-        270,1,0,0,0,10,272,1,0,0,0,10,274,1,0,0,0,10,276,1,0,0,0,10,278,
-        1,0,0,0,10,280,1,0,0,0,10,282,1,0,0,0,10,284,1,0,0,0,10,286,1,0,
-        0,0,10,288,1,0,0,0,10,290,1,0,0,0,10,292,1,0,0,0,10,294,1,0,0,0,
-        10,296,1,0,0,0,10,298,1,0,0,0,11,300,1,0,0,0,11,302,1,0,0,0,11,304,
-        1,0,0,0,12,306,1,0,0,0,12,308,1,0,0,0,12,310,1,0,0,0,13,312,1,0,
-        0,0,13,314,1,0,0,0,13,316,1,0,0,0,13,318,1,0,0,0,14,320,1,0,0,0,
-        14,322,1,0,0,0,14,324,1,0,0,0,14,326,1,0,0,0,14,328,1,0,0,0,14,330,
-        1,0,0,0,14,332,1,0,0,0,14,334,1,0,0,0,14,336,1,0,0,0,14,338,1,0,
-        0,0,14,340,1,0,0,0,14,342,1,0,0,0,14,344,1,0,0,0,15,346,1,0,0,0,
-        15,348,1,0,0,0,15,350,1,0,0,0,15,352,1,0,0,0,15,354,1,0,0,0,15,356,
-        1,0,0,0,15,358,1,0,0,0,16,360,1,0,0,0,16,362,1,0,0,0,16,364,1,0,
-        0,0,16,366,1,0,0,0,16,368,1,0,0,0,17,370,1,0,0,0,17,372,1,0,0,0,
-        17,374,1,0,0,0,17,376,1,0,0,0,18,378,1,0,0,0,18,380,1,0,0,0,18,382,
-        1,0,0,0,18,384,1,0,0,0,18,386,1,0,0,0,19,388,1,0,0,0,19,390,1,0,
-        0,0,19,392,1,0,0,0,19,394,1,0,0,0,19,396,1,0,0,0,19,398,1,0,0,0,
-        19,400,1,0,0,0,19,402,1,0,0,0,19,404,1,0,0,0,19,406,1,0,0,0,19,408,
-        1,0,0,0,19,410,1,0,0,0,19,412,1,0,0,0,19,414,1,0,0,0,19,416,1,0,
-        0,0,19,418,1,0,0,0,19,420,1,0,0,0,19,422,1,0,0,0,19,424,1,0,0,0,
-        19,426,1,0,0,0,19,428,1,0,0,0,19,430,1,0,0,0,19,432,1,0,0,0,19,434,
-        1,0,0,0,19,436,1,0,0,0,19,438,1,0,0,0,19,440,1,0,0,0,20,442,1,0,
-        0,0,20,444,1,0,0,0,20,446,1,0,0,0,20,448,1,0,0,0,20,450,1,0,0,0,
-        20,452,1,0,0,0,20,454,1,0,0,0,20,456,1,0,0,0,20,458,1,0,0,0,20,460,
-        1,0,0,0,20,462,1,0,0,0,20,464,1,0,0,0,20,466,1,0,0,0,20,468,1,0,
-        0,0,20,470,1,0,0,0,20,472,1,0,0,0,20,474,1,0,0,0,20,476,1,0,0,0,
-        20,478,1,0,0,0,20,480,1,0,0,0,21,482,1,0,0,0,21,484,1,0,0,0,21,486,
-        1,0,0,0,21,488,1,0,0,0,21,490,1,0,0,0,21,492,1,0,0,0,21,494,1,0,
-        0,0,21,496,1,0,0,0,21,498,1,0,0,0,21,500,1,0,0,0,21,502,1,0,0,0,
-        21,504,1,0,0,0,21,506,1,0,0,0,21,508,1,0,0,0,21,510,1,0,0,0,21,512,
-        1,0,0,0,21,514,1,0,0,0,21,516,1,0,0,0,21,518,1,0,0,0,21,520,1,0,
-        0,0,21,522,1,0,0,0,21,524,1,0,0,0,21,526,1,0,0,0,21,528,1,0,0,0,
-        21,530,1,0,0,0,21,532,1,0,0,0,21,534,1,0,0,0,21,536,1,0,0,0,21,538,
-        1,0,0,0,21,540,1,0,0,0,21,542,1,0,0,0,21,544,1,0,0,0,22,546,1,0,
-        0,0,22,548,1,0,0,0,22,550,1,0,0,0,22,552,1,0,0,0,22,554,1,0,0,0,
-        22,556,1,0,0,0,22,558,1,0,0,0,22,560,1,0,0,0,22,562,1,0,0,0,22,564,
-        1,0,0,0,22,566,1,0,0,0,22,568,1,0,0,0,22,570,1,0,0,0,22,572,1,0,
-        0,0,22,574,1,0,0,0,22,576,1,0,0,0,23,578,1,0,0,0,23,580,1,0,0,0,
-        23,582,1,0,0,0,24,584,1,0,0,0,24,586,1,0,0,0,24,588,1,0,0,0,24,590,
-        1,0,0,0,25,592,1,0,0,0,25,594,1,0,0,0,25,596,1,0,0,0,25,598,1,0,
-        0,0,25,600,1,0,0,0,25,602,1,0,0,0,25,604,1,0,0,0,25,606,1,0,0,0,
-        25,608,1,0,0,0,25,610,1,0,0,0,25,612,1,0,0,0,25,614,1,0,0,0,25,616,
-        1,0,0,0,25,618,1,0,0,0,25,620,1,0,0,0,26,622,1,0,0,0,26,624,1,0,
-        0,0,26,626,1,0,0,0,26,628,1,0,0,0,27,630,1,0,0,0,27,632,1,0,0,0,
-        27,634,1,0,0,0,27,636,1,0,0,0,28,638,1,0,0,0,30,649,1,0,0,0,32,660,
-        1,0,0,0,34,672,1,0,0,0,36,687,1,0,0,0,38,696,1,0,0,0,40,705,1,0,
-        0,0,42,714,1,0,0,0,44,723,1,0,0,0,46,732,1,0,0,0,48,742,1,0,0,0,
-        50,752,1,0,0,0,52,760,1,0,0,0,54,767,1,0,0,0,56,776,1,0,0,0,58,812,
-        1,0,0,0,60,856,1,0,0,0,62,858,1,0,0,0,64,860,1,0,0,0,66,862,1,0,
-        0,0,68,864,1,0,0,0,70,866,1,0,0,0,72,868,1,0,0,0,74,870,1,0,0,0,
-        76,872,1,0,0,0,78,874,1,0,0,0,80,876,1,0,0,0,82,878,1,0,0,0,84,880,
-        1,0,0,0,86,882,1,0,0,0,88,885,1,0,0,0,90,891,1,0,0,0,92,897,1,0,
-        0,0,94,903,1,0,0,0,96,912,1,0,0,0,98,919,1,0,0,0,100,937,1,0,0,0,
-        102,944,1,0,0,0,104,954,1,0,0,0,106,963,1,0,0,0,108,971,1,0,0,0,
-        110,979,1,0,0,0,112,987,1,0,0,0,114,993,1,0,0,0,116,1000,1,0,0,0,
-        118,1007,1,0,0,0,120,1016,1,0,0,0,122,1024,1,0,0,0,124,1036,1,0,
-        0,0,126,1043,1,0,0,0,128,1050,1,0,0,0,130,1061,1,0,0,0,132,1069,
-        1,0,0,0,134,1080,1,0,0,0,136,1089,1,0,0,0,138,1094,1,0,0,0,140,1110,
-        1,0,0,0,142,1117,1,0,0,0,144,1119,1,0,0,0,146,1121,1,0,0,0,148,1125,
-        1,0,0,0,150,1127,1,0,0,0,152,1129,1,0,0,0,154,1131,1,0,0,0,156,1133,
-        1,0,0,0,158,1147,1,0,0,0,160,1165,1,0,0,0,162,1171,1,0,0,0,164,1176,
-        1,0,0,0,166,1178,1,0,0,0,168,1180,1,0,0,0,170,1182,1,0,0,0,172,1184,
-        1,0,0,0,174,1186,1,0,0,0,176,1188,1,0,0,0,178,1191,1,0,0,0,180,1193,
-        1,0,0,0,182,1195,1,0,0,0,184,1197,1,0,0,0,186,1203,1,0,0,0,188,1225,
-        1,0,0,0,190,1234,1,0,0,0,192,1251,1,0,0,0,194,1274,1,0,0,0,196,1278,
-        1,0,0,0,198,1284,1,0,0,0,200,1289,1,0,0,0,202,1295,1,0,0,0,204,1300,
-        1,0,0,0,206,1304,1,0,0,0,208,1308,1,0,0,0,210,1312,1,0,0,0,212,1314,
-        1,0,0,0,214,1319,1,0,0,0,216,1325,1,0,0,0,218,1330,1,0,0,0,220,1338,
-        1,0,0,0,222,1346,1,0,0,0,224,1354,1,0,0,0,226,1365,1,0,0,0,228,1369,
-        1,0,0,0,230,1373,1,0,0,0,232,1378,1,0,0,0,234,1384,1,0,0,0,236,1390,
-        1,0,0,0,238,1394,1,0,0,0,240,1398,1,0,0,0,242,1402,1,0,0,0,244,1406,
-        1,0,0,0,246,1410,1,0,0,0,248,1415,1,0,0,0,250,1420,1,0,0,0,252,1429,
-        1,0,0,0,254,1443,1,0,0,0,256,1463,1,0,0,0,258,1469,1,0,0,0,260,1472,
-        1,0,0,0,262,1475,1,0,0,0,264,1479,1,0,0,0,266,1494,1,0,0,0,268,1498,
-        1,0,0,0,270,1500,1,0,0,0,272,1503,1,0,0,0,274,1509,1,0,0,0,276,1511,
-        1,0,0,0,278,1518,1,0,0,0,280,1525,1,0,0,0,282,1529,1,0,0,0,284,1540,
-        1,0,0,0,286,1545,1,0,0,0,288,1551,1,0,0,0,290,1556,1,0,0,0,292,1562,
-        1,0,0,0,294,1572,1,0,0,0,296,1576,1,0,0,0,298,1578,1,0,0,0,300,1583,
-        1,0,0,0,302,1596,1,0,0,0,304,1600,1,0,0,0,306,1605,1,0,0,0,308,1618,
-        1,0,0,0,310,1622,1,0,0,0,312,1627,1,0,0,0,314,1633,1,0,0,0,316,1636,
-        1,0,0,0,318,1639,1,0,0,0,320,1650,1,0,0,0,322,1653,1,0,0,0,324,1659,
-        1,0,0,0,326,1665,1,0,0,0,328,1671,1,0,0,0,330,1680,1,0,0,0,332,1682,
-        1,0,0,0,334,1685,1,0,0,0,336,1688,1,0,0,0,338,1694,1,0,0,0,340,1698,
-        1,0,0,0,342,1707,1,0,0,0,344,1716,1,0,0,0,346,1721,1,0,0,0,348,1727,
-        1,0,0,0,350,1729,1,0,0,0,352,1735,1,0,0,0,354,1737,1,0,0,0,356,1746,
-        1,0,0,0,358,1751,1,0,0,0,360,1756,1,0,0,0,362,1769,1,0,0,0,364,1773,
-        1,0,0,0,366,1775,1,0,0,0,368,1779,1,0,0,0,370,1784,1,0,0,0,372,1797,
-        1,0,0,0,374,1801,1,0,0,0,376,1803,1,0,0,0,378,1807,1,0,0,0,380,1811,
-        1,0,0,0,382,1816,1,0,0,0,384,1822,1,0,0,0,386,1824,1,0,0,0,388,1828,
-        1,0,0,0,390,1836,1,0,0,0,392,1841,1,0,0,0,394,1846,1,0,0,0,396,1850,
-        1,0,0,0,398,1858,1,0,0,0,400,1867,1,0,0,0,402,1875,1,0,0,0,404,1886,
-        1,0,0,0,406,1891,1,0,0,0,408,1899,1,0,0,0,410,1904,1,0,0,0,412,1910,
-        1,0,0,0,414,1917,1,0,0,0,416,1923,1,0,0,0,418,1929,1,0,0,0,420,1935,
-        1,0,0,0,422,1939,1,0,0,0,424,1943,1,0,0,0,426,1950,1,0,0,0,428,1957,
-        1,0,0,0,430,1965,1,0,0,0,432,1974,1,0,0,0,434,1977,1,0,0,0,436,1983,
-        1,0,0,0,438,1985,1,0,0,0,440,1996,1,0,0,0,442,2001,1,0,0,0,444,2007,
-        1,0,0,0,446,2009,1,0,0,0,448,2011,1,0,0,0,450,2015,1,0,0,0,452,2022,
-        1,0,0,0,454,2027,1,0,0,0,456,2031,1,0,0,0,458,2037,1,0,0,0,460,2042,
-        1,0,0,0,462,2051,1,0,0,0,464,2057,1,0,0,0,466,2063,1,0,0,0,468,2072,
-        1,0,0,0,470,2083,1,0,0,0,472,2090,1,0,0,0,474,2101,1,0,0,0,476,2104,
-        1,0,0,0,478,2108,1,0,0,0,480,2117,1,0,0,0,482,2122,1,0,0,0,484,2128,
-        1,0,0,0,486,2130,1,0,0,0,488,2133,1,0,0,0,490,2137,1,0,0,0,492,2141,
-        1,0,0,0,494,2147,1,0,0,0,496,2152,1,0,0,0,498,2159,1,0,0,0,500,2168,
-        1,0,0,0,502,2179,1,0,0,0,504,2184,1,0,0,0,506,2191,1,0,0,0,508,2199,
-        1,0,0,0,510,2209,1,0,0,0,512,2214,1,0,0,0,514,2221,1,0,0,0,516,2228,
-        1,0,0,0,518,2236,1,0,0,0,520,2245,1,0,0,0,522,2254,1,0,0,0,524,2263,
-        1,0,0,0,526,2274,1,0,0,0,528,2280,1,0,0,0,530,2290,1,0,0,0,532,2299,
-        1,0,0,0,534,2304,1,0,0,0,536,2314,1,0,0,0,538,2318,1,0,0,0,540,2324,
-        1,0,0,0,542,2332,1,0,0,0,544,2343,1,0,0,0,546,2348,1,0,0,0,548,2354,
-        1,0,0,0,550,2358,1,0,0,0,552,2362,1,0,0,0,554,2371,1,0,0,0,556,2375,
-        1,0,0,0,558,2382,1,0,0,0,560,2396,1,0,0,0,562,2398,1,0,0,0,564,2407,
-        1,0,0,0,566,2412,1,0,0,0,568,2414,1,0,0,0,570,2416,1,0,0,0,572,2420,
-        1,0,0,0,574,2428,1,0,0,0,576,2437,1,0,0,0,578,2442,1,0,0,0,580,2448,
-        1,0,0,0,582,2457,1,0,0,0,584,2464,1,0,0,0,586,2471,1,0,0,0,588,2475,
-        1,0,0,0,590,2479,1,0,0,0,592,2482,1,0,0,0,594,2488,1,0,0,0,596,2503,
-        1,0,0,0,598,2511,1,0,0,0,600,2518,1,0,0,0,602,2523,1,0,0,0,604,2525,
-        1,0,0,0,606,2531,1,0,0,0,608,2536,1,0,0,0,610,2543,1,0,0,0,612,2548,
-        1,0,0,0,614,2551,1,0,0,0,616,2560,1,0,0,0,618,2564,1,0,0,0,620,2568,
-        1,0,0,0,622,2571,1,0,0,0,624,2582,1,0,0,0,626,2586,1,0,0,0,628,2590,
-        1,0,0,0,630,2593,1,0,0,0,632,2605,1,0,0,0,634,2609,1,0,0,0,636,2613,
-        1,0,0,0,638,639,5,95,0,0,639,640,7,0,0,0,640,641,7,1,0,0,641,642,
-        7,2,0,0,642,643,7,2,0,0,643,644,7,3,0,0,644,645,7,0,0,0,645,646,
-        7,4,0,0,646,647,1,0,0,0,647,648,6,0,0,0,648,29,1,0,0,0,649,650,5,
-        95,0,0,650,651,7,5,0,0,651,652,7,3,0,0,652,653,7,5,0,0,653,654,7,
-        5,0,0,654,655,7,6,0,0,655,656,7,1,0,0,656,657,7,2,0,0,657,658,1,
-        0,0,0,658,659,6,1,1,0,659,31,1,0,0,0,660,661,5,95,0,0,661,662,7,
-        7,0,0,662,663,7,6,0,0,663,664,7,5,0,0,664,665,7,0,0,0,665,666,7,
-        1,0,0,666,667,7,2,0,0,667,668,7,2,0,0,668,669,7,3,0,0,669,670,7,
-        0,0,0,670,671,7,4,0,0,671,33,1,0,0,0,672,673,5,45,0,0,673,674,5,
-        45,0,0,674,678,1,0,0,0,675,677,9,0,0,0,676,675,1,0,0,0,677,680,1,
-        0,0,0,678,679,1,0,0,0,678,676,1,0,0,0,679,683,1,0,0,0,680,678,1,
-        0,0,0,681,684,3,60,16,0,682,684,5,0,0,1,683,681,1,0,0,0,683,682,
-        1,0,0,0,684,685,1,0,0,0,685,686,6,3,2,0,686,35,1,0,0,0,687,688,7,
-        0,0,0,688,689,7,8,0,0,689,690,7,3,0,0,690,691,7,9,0,0,691,692,7,
-        4,0,0,692,693,7,3,0,0,693,694,1,0,0,0,694,695,6,4,3,0,695,37,1,0,
-        0,0,696,697,7,6,0,0,697,698,7,2,0,0,698,699,7,5,0,0,699,700,7,3,
-        0,0,700,701,7,8,0,0,701,702,7,4,0,0,702,703,1,0,0,0,703,704,6,5,
-        3,0,704,39,1,0,0,0,705,706,7,10,0,0,706,707,7,11,0,0,707,708,7,7,
-        0,0,708,709,7,9,0,0,709,710,7,4,0,0,710,711,7,3,0,0,711,712,1,0,
-        0,0,712,713,6,6,3,0,713,41,1,0,0,0,714,715,7,5,0,0,715,716,7,3,0,
-        0,716,717,7,12,0,0,717,718,7,3,0,0,718,719,7,0,0,0,719,720,7,4,0,
-        0,720,721,1,0,0,0,721,722,6,7,3,0,722,43,1,0,0,0,723,724,7,7,0,0,
-        724,725,7,3,0,0,725,726,7,12,0,0,726,727,7,3,0,0,727,728,7,4,0,0,
-        728,729,7,3,0,0,729,730,1,0,0,0,730,731,6,8,3,0,731,45,1,0,0,0,732,
-        733,7,8,0,0,733,734,7,3,0,0,734,735,7,11,0,0,735,736,7,12,0,0,736,
-        737,7,9,0,0,737,738,7,0,0,0,738,739,7,3,0,0,739,740,1,0,0,0,740,
-        741,6,9,3,0,741,47,1,0,0,0,742,743,7,7,0,0,743,744,7,3,0,0,744,745,
-        7,0,0,0,745,746,7,12,0,0,746,747,7,9,0,0,747,748,7,8,0,0,748,749,
-        7,3,0,0,749,750,1,0,0,0,750,751,6,10,4,0,751,49,1,0,0,0,752,753,
-        7,13,0,0,753,754,7,3,0,0,754,755,7,14,0,0,755,756,7,6,0,0,756,757,
-        7,2,0,0,757,758,1,0,0,0,758,759,6,11,4,0,759,51,1,0,0,0,760,761,
-        7,7,0,0,761,762,7,8,0,0,762,763,7,1,0,0,763,764,7,11,0,0,764,765,
-        1,0,0,0,765,766,6,12,3,0,766,53,1,0,0,0,767,768,7,0,0,0,768,769,
-        7,1,0,0,769,770,7,15,0,0,770,771,7,15,0,0,771,772,7,6,0,0,772,773,
-        7,4,0,0,773,774,1,0,0,0,774,775,6,13,3,0,775,55,1,0,0,0,776,777,
-        7,8,0,0,777,778,7,1,0,0,778,779,7,12,0,0,779,780,7,12,0,0,780,781,
-        7,13,0,0,781,782,7,9,0,0,782,783,7,0,0,0,783,784,7,16,0,0,784,785,
-        1,0,0,0,785,786,6,14,3,0,786,57,1,0,0,0,787,788,7,0,0,0,788,789,
-        7,8,0,0,789,790,7,3,0,0,790,791,7,9,0,0,791,792,7,4,0,0,792,813,
-        7,3,0,0,793,794,7,8,0,0,794,795,7,3,0,0,795,796,7,11,0,0,796,797,
-        7,12,0,0,797,798,7,9,0,0,798,799,7,0,0,0,799,813,7,3,0,0,800,801,
-        7,9,0,0,801,802,7,12,0,0,802,803,7,4,0,0,803,804,7,3,0,0,804,813,
-        7,8,0,0,805,807,5,32,0,0,806,805,1,0,0,0,807,808,1,0,0,0,808,806,
-        1,0,0,0,808,809,1,0,0,0,809,813,1,0,0,0,810,811,7,1,0,0,811,813,
-        7,8,0,0,812,787,1,0,0,0,812,793,1,0,0,0,812,800,1,0,0,0,812,806,
-        1,0,0,0,812,810,1,0,0,0,813,814,1,0,0,0,814,812,1,0,0,0,814,815,
-        1,0,0,0,815,852,1,0,0,0,816,817,7,11,0,0,817,818,7,8,0,0,818,819,
-        7,1,0,0,819,820,7,0,0,0,820,821,7,3,0,0,821,822,7,7,0,0,822,823,
-        7,10,0,0,823,824,7,8,0,0,824,853,7,3,0,0,825,826,7,17,0,0,826,827,
-        7,10,0,0,827,828,7,2,0,0,828,829,7,0,0,0,829,830,7,4,0,0,830,831,
-        7,6,0,0,831,832,7,1,0,0,832,853,7,2,0,0,833,834,7,0,0,0,834,835,
-        7,12,0,0,835,836,7,9,0,0,836,837,7,5,0,0,837,853,7,5,0,0,838,839,
-        7,4,0,0,839,840,7,8,0,0,840,841,7,6,0,0,841,842,7,14,0,0,842,843,
-        7,14,0,0,843,844,7,3,0,0,844,853,7,8,0,0,845,846,7,11,0,0,846,847,
-        7,9,0,0,847,848,7,0,0,0,848,849,7,16,0,0,849,850,7,9,0,0,850,851,
-        7,14,0,0,851,853,7,3,0,0,852,816,1,0,0,0,852,825,1,0,0,0,852,833,
-        1,0,0,0,852,838,1,0,0,0,852,845,1,0,0,0,853,854,1,0,0,0,854,855,
-        6,15,4,0,855,59,1,0,0,0,856,857,5,10,0,0,857,61,1,0,0,0,858,859,
-        5,44,0,0,859,63,1,0,0,0,860,861,5,59,0,0,861,65,1,0,0,0,862,863,
-        5,58,0,0,863,67,1,0,0,0,864,865,5,64,0,0,865,69,1,0,0,0,866,867,
-        5,46,0,0,867,71,1,0,0,0,868,869,5,47,0,0,869,73,1,0,0,0,870,871,
-        5,40,0,0,871,75,1,0,0,0,872,873,5,41,0,0,873,77,1,0,0,0,874,875,
-        5,91,0,0,875,79,1,0,0,0,876,877,5,93,0,0,877,81,1,0,0,0,878,879,
-        5,34,0,0,879,83,1,0,0,0,880,881,5,39,0,0,881,85,1,0,0,0,882,883,
-        5,92,0,0,883,87,1,0,0,0,884,886,7,18,0,0,885,884,1,0,0,0,886,887,
-        1,0,0,0,887,885,1,0,0,0,887,888,1,0,0,0,888,889,1,0,0,0,889,890,
-        6,30,2,0,890,89,1,0,0,0,891,892,5,95,0,0,892,893,7,3,0,0,893,894,
-        7,19,0,0,894,895,7,6,0,0,895,896,7,4,0,0,896,91,1,0,0,0,897,898,
-        5,95,0,0,898,899,7,20,0,0,899,900,7,10,0,0,900,901,7,6,0,0,901,902,
-        7,4,0,0,902,93,1,0,0,0,903,904,5,95,0,0,904,905,7,5,0,0,905,906,
-        7,12,0,0,906,907,7,3,0,0,907,908,7,3,0,0,908,909,7,11,0,0,909,910,
-        1,0,0,0,910,911,6,33,5,0,911,95,1,0,0,0,912,913,5,95,0,0,913,914,
-        7,10,0,0,914,915,7,5,0,0,915,916,7,3,0,0,916,917,1,0,0,0,917,918,
-        6,34,6,0,918,97,1,0,0,0,919,920,5,95,0,0,920,921,7,3,0,0,921,922,
-        7,0,0,0,922,923,7,21,0,0,923,924,7,1,0,0,924,928,1,0,0,0,925,927,
-        9,0,0,0,926,925,1,0,0,0,927,930,1,0,0,0,928,929,1,0,0,0,928,926,
-        1,0,0,0,929,933,1,0,0,0,930,928,1,0,0,0,931,934,3,60,16,0,932,934,
-        5,0,0,1,933,931,1,0,0,0,933,932,1,0,0,0,934,935,1,0,0,0,935,936,
-        6,35,7,0,936,99,1,0,0,0,937,938,5,62,0,0,938,939,5,32,0,0,939,940,
-        5,123,0,0,940,941,5,37,0,0,941,942,1,0,0,0,942,943,6,36,8,0,943,
-        101,1,0,0,0,944,945,5,95,0,0,945,946,7,9,0,0,946,947,7,5,0,0,947,
-        948,7,5,0,0,948,949,7,3,0,0,949,950,7,8,0,0,950,951,7,4,0,0,951,
-        952,1,0,0,0,952,953,6,37,9,0,953,103,1,0,0,0,954,955,5,95,0,0,955,
-        956,7,5,0,0,956,957,7,4,0,0,957,958,7,9,0,0,958,959,7,8,0,0,959,
-        960,7,4,0,0,960,961,1,0,0,0,961,962,6,38,10,0,962,105,1,0,0,0,963,
-        964,5,95,0,0,964,965,7,12,0,0,965,966,7,1,0,0,966,967,7,9,0,0,967,
-        968,7,7,0,0,968,969,1,0,0,0,969,970,6,39,11,0,970,107,1,0,0,0,971,
-        972,5,95,0,0,972,973,7,21,0,0,973,974,7,1,0,0,974,975,7,5,0,0,975,
-        976,7,4,0,0,976,977,1,0,0,0,977,978,6,40,12,0,978,109,1,0,0,0,979,
-        980,5,95,0,0,980,981,7,21,0,0,981,982,7,3,0,0,982,983,7,12,0,0,983,
-        984,7,11,0,0,984,985,1,0,0,0,985,986,6,41,13,0,986,111,1,0,0,0,987,
-        988,5,95,0,0,988,989,7,6,0,0,989,990,7,17,0,0,990,991,1,0,0,0,991,
-        992,6,42,14,0,992,113,1,0,0,0,993,994,5,95,0,0,994,995,7,3,0,0,995,
-        996,7,2,0,0,996,997,7,7,0,0,997,998,7,6,0,0,998,999,7,17,0,0,999,
-        115,1,0,0,0,1000,1001,5,95,0,0,1001,1002,7,5,0,0,1002,1003,7,3,0,
-        0,1003,1004,7,4,0,0,1004,1005,1,0,0,0,1005,1006,6,44,15,0,1006,117,
-        1,0,0,0,1007,1008,5,95,0,0,1008,1009,7,5,0,0,1009,1010,7,11,0,0,
-        1010,1011,7,1,0,0,1011,1012,7,1,0,0,1012,1013,7,12,0,0,1013,1014,
-        1,0,0,0,1014,1015,6,45,16,0,1015,119,1,0,0,0,1016,1017,5,95,0,0,
-        1017,1018,7,12,0,0,1018,1019,7,1,0,0,1019,1020,7,1,0,0,1020,1021,
-        7,11,0,0,1021,1022,1,0,0,0,1022,1023,6,46,17,0,1023,121,1,0,0,0,
-        1024,1025,5,95,0,0,1025,1026,7,22,0,0,1026,1027,7,21,0,0,1027,1028,
-        7,3,0,0,1028,1029,7,2,0,0,1029,1030,7,3,0,0,1030,1031,7,23,0,0,1031,
-        1032,7,3,0,0,1032,1033,7,8,0,0,1033,1034,1,0,0,0,1034,1035,6,47,
-        18,0,1035,123,1,0,0,0,1036,1037,5,95,0,0,1037,1038,7,5,0,0,1038,
-        1039,7,5,0,0,1039,1040,7,21,0,0,1040,1041,1,0,0,0,1041,1042,6,48,
-        19,0,1042,125,1,0,0,0,1043,1044,5,95,0,0,1044,1045,7,24,0,0,1045,
-        1046,7,1,0,0,1046,1047,7,13,0,0,1047,1048,1,0,0,0,1048,1049,6,49,
-        20,0,1049,127,1,0,0,0,1050,1051,5,95,0,0,1051,1052,7,0,0,0,1052,
-        1053,7,1,0,0,1053,1054,7,15,0,0,1054,1055,7,11,0,0,1055,1056,7,9,
-        0,0,1056,1057,7,8,0,0,1057,1058,7,3,0,0,1058,1059,1,0,0,0,1059,1060,
-        6,50,21,0,1060,129,1,0,0,0,1061,1062,5,95,0,0,1062,1063,7,7,0,0,
-        1063,1064,7,9,0,0,1064,1065,7,4,0,0,1065,1066,7,9,0,0,1066,1067,
-        1,0,0,0,1067,1068,6,51,22,0,1068,131,1,0,0,0,1069,1070,5,95,0,0,
-        1070,1071,7,15,0,0,1071,1072,7,1,0,0,1072,1073,7,2,0,0,1073,1074,
-        7,6,0,0,1074,1075,7,4,0,0,1075,1076,7,1,0,0,1076,1077,7,8,0,0,1077,
-        1078,1,0,0,0,1078,1079,6,52,23,0,1079,133,1,0,0,0,1080,1082,5,95,
-        0,0,1081,1083,7,25,0,0,1082,1081,1,0,0,0,1083,1084,1,0,0,0,1084,
-        1082,1,0,0,0,1084,1085,1,0,0,0,1085,1086,1,0,0,0,1086,1087,6,53,
-        24,0,1087,135,1,0,0,0,1088,1090,3,148,60,0,1089,1088,1,0,0,0,1090,
-        1091,1,0,0,0,1091,1089,1,0,0,0,1091,1092,1,0,0,0,1092,137,1,0,0,
-        0,1093,1095,3,148,60,0,1094,1093,1,0,0,0,1095,1096,1,0,0,0,1096,
-        1094,1,0,0,0,1096,1097,1,0,0,0,1097,1098,1,0,0,0,1098,1100,5,46,
-        0,0,1099,1101,3,148,60,0,1100,1099,1,0,0,0,1101,1102,1,0,0,0,1102,
-        1100,1,0,0,0,1102,1103,1,0,0,0,1103,139,1,0,0,0,1104,1111,3,154,
-        63,0,1105,1111,3,142,57,0,1106,1111,3,144,58,0,1107,1111,3,146,59,
-        0,1108,1111,3,156,64,0,1109,1111,3,158,65,0,1110,1104,1,0,0,0,1110,
-        1105,1,0,0,0,1110,1106,1,0,0,0,1110,1107,1,0,0,0,1110,1108,1,0,0,
-        0,1110,1109,1,0,0,0,1111,1112,1,0,0,0,1112,1110,1,0,0,0,1112,1113,
-        1,0,0,0,1113,141,1,0,0,0,1114,1118,3,150,61,0,1115,1118,3,148,60,
-        0,1116,1118,7,26,0,0,1117,1114,1,0,0,0,1117,1115,1,0,0,0,1117,1116,
-        1,0,0,0,1118,143,1,0,0,0,1119,1120,7,27,0,0,1120,145,1,0,0,0,1121,
-        1122,5,37,0,0,1122,1123,3,152,62,0,1123,1124,3,152,62,0,1124,147,
-        1,0,0,0,1125,1126,7,28,0,0,1126,149,1,0,0,0,1127,1128,7,25,0,0,1128,
-        151,1,0,0,0,1129,1130,7,29,0,0,1130,153,1,0,0,0,1131,1132,2,255,
-        65535,0,1132,155,1,0,0,0,1133,1142,5,34,0,0,1134,1141,8,30,0,0,1135,
-        1138,5,92,0,0,1136,1139,5,10,0,0,1137,1139,9,0,0,0,1138,1136,1,0,
-        0,0,1138,1137,1,0,0,0,1139,1141,1,0,0,0,1140,1134,1,0,0,0,1140,1135,
-        1,0,0,0,1141,1144,1,0,0,0,1142,1140,1,0,0,0,1142,1143,1,0,0,0,1143,
-        1145,1,0,0,0,1144,1142,1,0,0,0,1145,1146,5,34,0,0,1146,157,1,0,0,
-        0,1147,1159,5,39,0,0,1148,1158,8,31,0,0,1149,1155,5,92,0,0,1150,
-        1152,5,13,0,0,1151,1150,1,0,0,0,1151,1152,1,0,0,0,1152,1153,1,0,
-        0,0,1153,1156,5,10,0,0,1154,1156,9,0,0,0,1155,1151,1,0,0,0,1155,
-        1154,1,0,0,0,1156,1158,1,0,0,0,1157,1148,1,0,0,0,1157,1149,1,0,0,
-        0,1158,1161,1,0,0,0,1159,1157,1,0,0,0,1159,1160,1,0,0,0,1160,1162,
-        1,0,0,0,1161,1159,1,0,0,0,1162,1163,5,39,0,0,1163,159,1,0,0,0,1164,
-        1166,7,18,0,0,1165,1164,1,0,0,0,1166,1167,1,0,0,0,1167,1165,1,0,
-        0,0,1167,1168,1,0,0,0,1168,1169,1,0,0,0,1169,1170,6,66,2,0,1170,
-        161,1,0,0,0,1171,1172,5,10,0,0,1172,1173,1,0,0,0,1173,1174,6,67,
-        25,0,1174,1175,6,67,26,0,1175,163,1,0,0,0,1176,1177,5,64,0,0,1177,
-        165,1,0,0,0,1178,1179,5,47,0,0,1179,167,1,0,0,0,1180,1181,5,58,0,
-        0,1181,169,1,0,0,0,1182,1183,5,63,0,0,1183,171,1,0,0,0,1184,1185,
-        5,35,0,0,1185,173,1,0,0,0,1186,1187,5,124,0,0,1187,175,1,0,0,0,1188,
-        1189,5,47,0,0,1189,1190,5,47,0,0,1190,177,1,0,0,0,1191,1192,5,61,
-        0,0,1192,179,1,0,0,0,1193,1194,5,38,0,0,1194,181,1,0,0,0,1195,1196,
-        5,59,0,0,1196,183,1,0,0,0,1197,1198,7,24,0,0,1198,1199,7,7,0,0,1199,
-        1200,7,13,0,0,1200,1201,7,0,0,0,1201,185,1,0,0,0,1202,1204,3,148,
-        60,0,1203,1202,1,0,0,0,1204,1205,1,0,0,0,1205,1203,1,0,0,0,1205,
-        1206,1,0,0,0,1206,1207,1,0,0,0,1207,1209,5,46,0,0,1208,1210,3,148,
-        60,0,1209,1208,1,0,0,0,1210,1211,1,0,0,0,1211,1209,1,0,0,0,1211,
-        1212,1,0,0,0,1212,1213,1,0,0,0,1213,1215,5,46,0,0,1214,1216,3,148,
-        60,0,1215,1214,1,0,0,0,1216,1217,1,0,0,0,1217,1215,1,0,0,0,1217,
-        1218,1,0,0,0,1218,1219,1,0,0,0,1219,1221,5,46,0,0,1220,1222,3,148,
-        60,0,1221,1220,1,0,0,0,1222,1223,1,0,0,0,1223,1221,1,0,0,0,1223,
-        1224,1,0,0,0,1224,187,1,0,0,0,1225,1228,5,91,0,0,1226,1229,3,152,
-        62,0,1227,1229,7,32,0,0,1228,1226,1,0,0,0,1228,1227,1,0,0,0,1229,
-        1230,1,0,0,0,1230,1228,1,0,0,0,1230,1231,1,0,0,0,1231,1232,1,0,0,
-        0,1232,1233,5,93,0,0,1233,189,1,0,0,0,1234,1246,5,34,0,0,1235,1245,
-        8,30,0,0,1236,1242,5,92,0,0,1237,1239,5,13,0,0,1238,1237,1,0,0,0,
-        1238,1239,1,0,0,0,1239,1240,1,0,0,0,1240,1243,5,10,0,0,1241,1243,
-        9,0,0,0,1242,1238,1,0,0,0,1242,1241,1,0,0,0,1243,1245,1,0,0,0,1244,
-        1235,1,0,0,0,1244,1236,1,0,0,0,1245,1248,1,0,0,0,1246,1244,1,0,0,
-        0,1246,1247,1,0,0,0,1247,1249,1,0,0,0,1248,1246,1,0,0,0,1249,1250,
-        5,34,0,0,1250,191,1,0,0,0,1251,1263,5,39,0,0,1252,1262,8,31,0,0,
-        1253,1259,5,92,0,0,1254,1256,5,13,0,0,1255,1254,1,0,0,0,1255,1256,
-        1,0,0,0,1256,1257,1,0,0,0,1257,1260,5,10,0,0,1258,1260,9,0,0,0,1259,
-        1255,1,0,0,0,1259,1258,1,0,0,0,1260,1262,1,0,0,0,1261,1252,1,0,0,
-        0,1261,1253,1,0,0,0,1262,1265,1,0,0,0,1263,1261,1,0,0,0,1263,1264,
-        1,0,0,0,1264,1266,1,0,0,0,1265,1263,1,0,0,0,1266,1267,5,39,0,0,1267,
-        193,1,0,0,0,1268,1275,3,154,63,0,1269,1275,3,142,57,0,1270,1275,
-        3,146,59,0,1271,1275,3,190,81,0,1272,1275,3,192,82,0,1273,1275,7,
-        33,0,0,1274,1268,1,0,0,0,1274,1269,1,0,0,0,1274,1270,1,0,0,0,1274,
-        1271,1,0,0,0,1274,1272,1,0,0,0,1274,1273,1,0,0,0,1275,1276,1,0,0,
-        0,1276,1274,1,0,0,0,1276,1277,1,0,0,0,1277,195,1,0,0,0,1278,1279,
-        5,10,0,0,1279,1280,1,0,0,0,1280,1281,6,84,25,0,1281,1282,6,84,26,
-        0,1282,197,1,0,0,0,1283,1285,8,34,0,0,1284,1283,1,0,0,0,1285,1286,
-        1,0,0,0,1286,1284,1,0,0,0,1286,1287,1,0,0,0,1287,199,1,0,0,0,1288,
-        1290,7,18,0,0,1289,1288,1,0,0,0,1290,1291,1,0,0,0,1291,1289,1,0,
-        0,0,1291,1292,1,0,0,0,1292,1293,1,0,0,0,1293,1294,6,86,2,0,1294,
-        201,1,0,0,0,1295,1296,7,21,0,0,1296,1297,7,6,0,0,1297,1298,7,2,0,
-        0,1298,1299,7,4,0,0,1299,203,1,0,0,0,1300,1301,5,91,0,0,1301,1302,
-        1,0,0,0,1302,1303,6,88,27,0,1303,205,1,0,0,0,1304,1305,5,93,0,0,
-        1305,1306,1,0,0,0,1306,1307,6,89,28,0,1307,207,1,0,0,0,1308,1309,
-        5,10,0,0,1309,1310,1,0,0,0,1310,1311,6,90,26,0,1311,209,1,0,0,0,
-        1312,1313,3,140,56,0,1313,211,1,0,0,0,1314,1315,9,0,0,0,1315,1316,
-        1,0,0,0,1316,1317,6,92,29,0,1317,213,1,0,0,0,1318,1320,7,18,0,0,
-        1319,1318,1,0,0,0,1320,1321,1,0,0,0,1321,1319,1,0,0,0,1321,1322,
-        1,0,0,0,1322,1323,1,0,0,0,1323,1324,6,93,30,0,1324,215,1,0,0,0,1325,
-        1326,7,5,0,0,1326,1327,7,9,0,0,1327,1328,7,23,0,0,1328,1329,7,3,
-        0,0,1329,217,1,0,0,0,1330,1331,7,8,0,0,1331,1332,7,3,0,0,1332,1333,
-        7,12,0,0,1333,1334,7,3,0,0,1334,1335,7,9,0,0,1335,1336,7,5,0,0,1336,
-        1337,7,3,0,0,1337,219,1,0,0,0,1338,1339,7,8,0,0,1339,1340,7,3,0,
-        0,1340,1341,7,5,0,0,1341,1342,7,4,0,0,1342,1343,7,1,0,0,1343,1344,
-        7,8,0,0,1344,1345,7,3,0,0,1345,221,1,0,0,0,1346,1347,7,5,0,0,1347,
-        1348,7,9,0,0,1348,1349,7,23,0,0,1349,1350,7,3,0,0,1350,1351,7,10,
-        0,0,1351,1352,7,8,0,0,1352,1353,7,12,0,0,1353,223,1,0,0,0,1354,1355,
-        7,5,0,0,1355,1356,7,21,0,0,1356,1357,7,1,0,0,1357,1358,7,22,0,0,
-        1358,225,1,0,0,0,1359,1366,3,154,63,0,1360,1366,3,142,57,0,1361,
-        1366,3,146,59,0,1362,1366,3,190,81,0,1363,1366,3,192,82,0,1364,1366,
-        7,33,0,0,1365,1359,1,0,0,0,1365,1360,1,0,0,0,1365,1361,1,0,0,0,1365,
-        1362,1,0,0,0,1365,1363,1,0,0,0,1365,1364,1,0,0,0,1366,1367,1,0,0,
-        0,1367,1365,1,0,0,0,1367,1368,1,0,0,0,1368,227,1,0,0,0,1369,1370,
-        5,59,0,0,1370,1371,1,0,0,0,1371,1372,6,100,31,0,1372,229,1,0,0,0,
-        1373,1374,5,10,0,0,1374,1375,1,0,0,0,1375,1376,6,101,30,0,1376,231,
-        1,0,0,0,1377,1379,7,18,0,0,1378,1377,1,0,0,0,1379,1380,1,0,0,0,1380,
-        1378,1,0,0,0,1380,1381,1,0,0,0,1381,1382,1,0,0,0,1382,1383,6,102,
-        30,0,1383,233,1,0,0,0,1384,1385,5,10,0,0,1385,1386,5,47,0,0,1386,
-        1387,1,0,0,0,1387,1388,6,103,32,0,1388,1389,6,103,31,0,1389,235,
-        1,0,0,0,1390,1391,5,59,0,0,1391,1392,1,0,0,0,1392,1393,6,104,31,
-        0,1393,237,1,0,0,0,1394,1395,3,140,56,0,1395,1396,1,0,0,0,1396,1397,
-        6,105,30,0,1397,239,1,0,0,0,1398,1399,3,158,65,0,1399,1400,1,0,0,
-        0,1400,1401,6,106,30,0,1401,241,1,0,0,0,1402,1403,9,0,0,0,1403,1404,
-        1,0,0,0,1404,1405,6,107,30,0,1405,243,1,0,0,0,1406,1407,5,10,0,0,
-        1407,1408,1,0,0,0,1408,1409,6,108,30,0,1409,245,1,0,0,0,1410,1411,
-        5,10,0,0,1411,1412,5,47,0,0,1412,1413,1,0,0,0,1413,1414,6,109,31,
-        0,1414,247,1,0,0,0,1415,1416,5,47,0,0,1416,1417,1,0,0,0,1417,1418,
-        6,110,30,0,1418,249,1,0,0,0,1419,1421,8,35,0,0,1420,1419,1,0,0,0,
-        1421,1422,1,0,0,0,1422,1420,1,0,0,0,1422,1423,1,0,0,0,1423,1424,
-        1,0,0,0,1424,1425,6,111,30,0,1425,251,1,0,0,0,1426,1428,9,0,0,0,
-        1427,1426,1,0,0,0,1428,1431,1,0,0,0,1429,1430,1,0,0,0,1429,1427,
-        1,0,0,0,1430,1436,1,0,0,0,1431,1429,1,0,0,0,1432,1433,5,10,0,0,1433,
-        1434,5,37,0,0,1434,1437,5,125,0,0,1435,1437,5,0,0,1,1436,1432,1,
-        0,0,0,1436,1435,1,0,0,0,1437,1438,1,0,0,0,1438,1439,6,112,26,0,1439,
-        253,1,0,0,0,1440,1442,9,0,0,0,1441,1440,1,0,0,0,1442,1445,1,0,0,
-        0,1443,1444,1,0,0,0,1443,1441,1,0,0,0,1444,1446,1,0,0,0,1445,1443,
-        1,0,0,0,1446,1447,7,3,0,0,1447,1448,7,0,0,0,1448,1449,7,21,0,0,1449,
-        1450,7,1,0,0,1450,1452,1,0,0,0,1451,1453,7,18,0,0,1452,1451,1,0,
-        0,0,1453,1454,1,0,0,0,1454,1452,1,0,0,0,1454,1455,1,0,0,0,1455,1456,
-        1,0,0,0,1456,1457,7,1,0,0,1457,1458,7,17,0,0,1458,1459,7,17,0,0,
-        1459,1460,1,0,0,0,1460,1461,6,113,26,0,1461,255,1,0,0,0,1462,1464,
-        7,18,0,0,1463,1462,1,0,0,0,1464,1465,1,0,0,0,1465,1463,1,0,0,0,1465,
-        1466,1,0,0,0,1466,1467,1,0,0,0,1467,1468,6,114,2,0,1468,257,1,0,
-        0,0,1469,1470,5,123,0,0,1470,1471,5,37,0,0,1471,259,1,0,0,0,1472,
-        1473,5,37,0,0,1473,1474,5,125,0,0,1474,261,1,0,0,0,1475,1476,3,60,
-        16,0,1476,1477,1,0,0,0,1477,1478,6,117,26,0,1478,263,1,0,0,0,1479,
-        1483,3,258,115,0,1480,1482,9,0,0,0,1481,1480,1,0,0,0,1482,1485,1,
-        0,0,0,1483,1484,1,0,0,0,1483,1481,1,0,0,0,1484,1486,1,0,0,0,1485,
-        1483,1,0,0,0,1486,1487,3,260,116,0,1487,265,1,0,0,0,1488,1495,3,
-        154,63,0,1489,1495,3,142,57,0,1490,1495,3,146,59,0,1491,1495,3,156,
-        64,0,1492,1495,3,158,65,0,1493,1495,7,36,0,0,1494,1488,1,0,0,0,1494,
-        1489,1,0,0,0,1494,1490,1,0,0,0,1494,1491,1,0,0,0,1494,1492,1,0,0,
-        0,1494,1493,1,0,0,0,1495,1496,1,0,0,0,1496,1494,1,0,0,0,1496,1497,
-        1,0,0,0,1497,267,1,0,0,0,1498,1499,5,44,0,0,1499,269,1,0,0,0,1500,
-        1501,5,59,0,0,1501,271,1,0,0,0,1502,1504,7,18,0,0,1503,1502,1,0,
-        0,0,1504,1505,1,0,0,0,1505,1503,1,0,0,0,1505,1506,1,0,0,0,1506,1507,
-        1,0,0,0,1507,1508,6,122,2,0,1508,273,1,0,0,0,1509,1510,5,61,0,0,
-        1510,275,1,0,0,0,1511,1512,7,11,0,0,1512,1513,7,12,0,0,1513,1514,
-        7,10,0,0,1514,1515,7,14,0,0,1515,1516,7,6,0,0,1516,1517,7,2,0,0,
-        1517,277,1,0,0,0,1518,1519,7,5,0,0,1519,1520,7,0,0,0,1520,1521,7,
-        8,0,0,1521,1522,7,6,0,0,1522,1523,7,11,0,0,1523,1524,7,4,0,0,1524,
-        279,1,0,0,0,1525,1526,7,15,0,0,1526,1527,7,9,0,0,1527,1528,7,11,
-        0,0,1528,281,1,0,0,0,1529,1530,7,24,0,0,1530,1531,7,7,0,0,1531,1532,
-        7,13,0,0,1532,1533,7,0,0,0,1533,1534,7,7,0,0,1534,1535,7,8,0,0,1535,
-        1536,7,6,0,0,1536,1537,7,23,0,0,1537,1538,7,3,0,0,1538,1539,7,8,
-        0,0,1539,283,1,0,0,0,1540,1541,7,17,0,0,1541,1542,7,6,0,0,1542,1543,
-        7,12,0,0,1543,1544,7,3,0,0,1544,285,1,0,0,0,1545,1546,7,0,0,0,1546,
-        1547,7,12,0,0,1547,1548,7,9,0,0,1548,1549,7,5,0,0,1549,1550,7,5,
-        0,0,1550,287,1,0,0,0,1551,1552,7,2,0,0,1552,1553,7,9,0,0,1553,1554,
-        7,15,0,0,1554,1555,7,3,0,0,1555,289,1,0,0,0,1556,1557,7,11,0,0,1557,
-        1558,7,8,0,0,1558,1559,7,1,0,0,1559,1560,7,11,0,0,1560,1561,7,5,
-        0,0,1561,291,1,0,0,0,1562,1563,7,10,0,0,1563,1564,7,8,0,0,1564,1565,
-        7,12,0,0,1565,293,1,0,0,0,1566,1573,3,154,63,0,1567,1573,3,142,57,
-        0,1568,1573,3,146,59,0,1569,1573,3,156,64,0,1570,1573,3,158,65,0,
-        1571,1573,7,36,0,0,1572,1566,1,0,0,0,1572,1567,1,0,0,0,1572,1568,
-        1,0,0,0,1572,1569,1,0,0,0,1572,1570,1,0,0,0,1572,1571,1,0,0,0,1573,
-        1574,1,0,0,0,1574,1572,1,0,0,0,1574,1575,1,0,0,0,1575,295,1,0,0,
-        0,1576,1577,5,59,0,0,1577,297,1,0,0,0,1578,1579,3,60,16,0,1579,1580,
-        1,0,0,0,1580,1581,6,135,26,0,1581,299,1,0,0,0,1582,1584,7,18,0,0,
-        1583,1582,1,0,0,0,1584,1585,1,0,0,0,1585,1583,1,0,0,0,1585,1586,
-        1,0,0,0,1586,1587,1,0,0,0,1587,1588,6,136,2,0,1588,301,1,0,0,0,1589,
-        1597,3,154,63,0,1590,1597,3,142,57,0,1591,1597,3,144,58,0,1592,1597,
-        3,146,59,0,1593,1597,3,156,64,0,1594,1597,3,158,65,0,1595,1597,7,
-        36,0,0,1596,1589,1,0,0,0,1596,1590,1,0,0,0,1596,1591,1,0,0,0,1596,
-        1592,1,0,0,0,1596,1593,1,0,0,0,1596,1594,1,0,0,0,1596,1595,1,0,0,
-        0,1597,1598,1,0,0,0,1598,1596,1,0,0,0,1598,1599,1,0,0,0,1599,303,
-        1,0,0,0,1600,1601,3,60,16,0,1601,1602,1,0,0,0,1602,1603,6,138,26,
-        0,1603,305,1,0,0,0,1604,1606,7,18,0,0,1605,1604,1,0,0,0,1606,1607,
-        1,0,0,0,1607,1605,1,0,0,0,1607,1608,1,0,0,0,1608,1609,1,0,0,0,1609,
-        1610,6,139,2,0,1610,307,1,0,0,0,1611,1619,3,154,63,0,1612,1619,3,
-        142,57,0,1613,1619,3,144,58,0,1614,1619,3,146,59,0,1615,1619,3,156,
-        64,0,1616,1619,3,158,65,0,1617,1619,7,37,0,0,1618,1611,1,0,0,0,1618,
-        1612,1,0,0,0,1618,1613,1,0,0,0,1618,1614,1,0,0,0,1618,1615,1,0,0,
-        0,1618,1616,1,0,0,0,1618,1617,1,0,0,0,1619,1620,1,0,0,0,1620,1618,
-        1,0,0,0,1620,1621,1,0,0,0,1621,309,1,0,0,0,1622,1623,3,60,16,0,1623,
-        1624,1,0,0,0,1624,1625,6,141,26,0,1625,311,1,0,0,0,1626,1628,7,18,
-        0,0,1627,1626,1,0,0,0,1628,1629,1,0,0,0,1629,1627,1,0,0,0,1629,1630,
-        1,0,0,0,1630,1631,1,0,0,0,1631,1632,6,142,2,0,1632,313,1,0,0,0,1633,
-        1634,5,123,0,0,1634,1635,5,37,0,0,1635,315,1,0,0,0,1636,1637,5,37,
-        0,0,1637,1638,5,125,0,0,1638,317,1,0,0,0,1639,1643,3,314,143,0,1640,
-        1642,9,0,0,0,1641,1640,1,0,0,0,1642,1645,1,0,0,0,1643,1644,1,0,0,
-        0,1643,1641,1,0,0,0,1644,1646,1,0,0,0,1645,1643,1,0,0,0,1646,1647,
-        3,316,144,0,1647,1648,1,0,0,0,1648,1649,6,145,26,0,1649,319,1,0,
-        0,0,1650,1651,5,59,0,0,1651,321,1,0,0,0,1652,1654,7,18,0,0,1653,
-        1652,1,0,0,0,1654,1655,1,0,0,0,1655,1653,1,0,0,0,1655,1656,1,0,0,
-        0,1656,1657,1,0,0,0,1657,1658,6,147,2,0,1658,323,1,0,0,0,1659,1660,
-        7,13,0,0,1660,1661,7,3,0,0,1661,1662,7,14,0,0,1662,1663,7,6,0,0,
-        1663,1664,7,2,0,0,1664,325,1,0,0,0,1665,1666,7,10,0,0,1666,1667,
-        7,2,0,0,1667,1668,7,4,0,0,1668,1669,7,6,0,0,1669,1670,7,12,0,0,1670,
-        327,1,0,0,0,1671,1672,7,6,0,0,1672,1673,7,2,0,0,1673,1674,7,4,0,
-        0,1674,1675,7,3,0,0,1675,1676,7,8,0,0,1676,1677,7,23,0,0,1677,1678,
-        7,9,0,0,1678,1679,7,12,0,0,1679,329,1,0,0,0,1680,1681,3,136,54,0,
-        1681,331,1,0,0,0,1682,1683,5,123,0,0,1683,1684,5,37,0,0,1684,333,
-        1,0,0,0,1685,1686,5,37,0,0,1686,1687,5,125,0,0,1687,335,1,0,0,0,
-        1688,1689,7,13,0,0,1689,1690,7,8,0,0,1690,1691,7,3,0,0,1691,1692,
-        7,9,0,0,1692,1693,7,16,0,0,1693,337,1,0,0,0,1694,1695,7,3,0,0,1695,
-        1696,7,2,0,0,1696,1697,7,7,0,0,1697,339,1,0,0,0,1698,1699,7,0,0,
-        0,1699,1700,7,1,0,0,1700,1701,7,2,0,0,1701,1702,7,4,0,0,1702,1703,
-        7,6,0,0,1703,1704,7,2,0,0,1704,1705,7,10,0,0,1705,1706,7,3,0,0,1706,
-        341,1,0,0,0,1707,1711,3,332,152,0,1708,1710,9,0,0,0,1709,1708,1,
-        0,0,0,1710,1713,1,0,0,0,1711,1712,1,0,0,0,1711,1709,1,0,0,0,1712,
-        1714,1,0,0,0,1713,1711,1,0,0,0,1714,1715,3,334,153,0,1715,343,1,
-        0,0,0,1716,1717,3,60,16,0,1717,1718,1,0,0,0,1718,1719,6,158,26,0,
-        1719,345,1,0,0,0,1720,1722,7,18,0,0,1721,1720,1,0,0,0,1722,1723,
-        1,0,0,0,1723,1721,1,0,0,0,1723,1724,1,0,0,0,1724,1725,1,0,0,0,1725,
-        1726,6,159,2,0,1726,347,1,0,0,0,1727,1728,3,136,54,0,1728,349,1,
-        0,0,0,1729,1730,7,3,0,0,1730,1731,7,8,0,0,1731,1732,7,8,0,0,1732,
-        1733,7,1,0,0,1733,1734,7,8,0,0,1734,351,1,0,0,0,1735,1736,5,59,0,
-        0,1736,353,1,0,0,0,1737,1738,7,0,0,0,1738,1739,7,1,0,0,1739,1740,
-        7,2,0,0,1740,1741,7,4,0,0,1741,1742,7,6,0,0,1742,1743,7,2,0,0,1743,
-        1744,7,10,0,0,1744,1745,7,3,0,0,1745,355,1,0,0,0,1746,1747,7,3,0,
-        0,1747,1748,7,19,0,0,1748,1749,7,6,0,0,1749,1750,7,4,0,0,1750,357,
-        1,0,0,0,1751,1752,3,60,16,0,1752,1753,1,0,0,0,1753,1754,6,165,26,
-        0,1754,359,1,0,0,0,1755,1757,7,18,0,0,1756,1755,1,0,0,0,1757,1758,
-        1,0,0,0,1758,1756,1,0,0,0,1758,1759,1,0,0,0,1759,1760,1,0,0,0,1760,
-        1761,6,166,2,0,1761,361,1,0,0,0,1762,1770,3,154,63,0,1763,1770,3,
-        142,57,0,1764,1770,3,144,58,0,1765,1770,3,146,59,0,1766,1770,3,156,
-        64,0,1767,1770,3,158,65,0,1768,1770,7,38,0,0,1769,1762,1,0,0,0,1769,
-        1763,1,0,0,0,1769,1764,1,0,0,0,1769,1765,1,0,0,0,1769,1766,1,0,0,
-        0,1769,1767,1,0,0,0,1769,1768,1,0,0,0,1770,1771,1,0,0,0,1771,1769,
-        1,0,0,0,1771,1772,1,0,0,0,1772,363,1,0,0,0,1773,1774,5,59,0,0,1774,
-        365,1,0,0,0,1775,1776,7,1,0,0,1776,1777,7,17,0,0,1777,1778,7,17,
-        0,0,1778,367,1,0,0,0,1779,1780,3,60,16,0,1780,1781,1,0,0,0,1781,
-        1782,6,170,26,0,1782,369,1,0,0,0,1783,1785,7,18,0,0,1784,1783,1,
-        0,0,0,1785,1786,1,0,0,0,1786,1784,1,0,0,0,1786,1787,1,0,0,0,1787,
-        1788,1,0,0,0,1788,1789,6,171,2,0,1789,371,1,0,0,0,1790,1798,3,154,
-        63,0,1791,1798,3,142,57,0,1792,1798,3,144,58,0,1793,1798,3,146,59,
-        0,1794,1798,3,156,64,0,1795,1798,3,158,65,0,1796,1798,7,38,0,0,1797,
-        1790,1,0,0,0,1797,1791,1,0,0,0,1797,1792,1,0,0,0,1797,1793,1,0,0,
-        0,1797,1794,1,0,0,0,1797,1795,1,0,0,0,1797,1796,1,0,0,0,1798,1799,
-        1,0,0,0,1799,1797,1,0,0,0,1799,1800,1,0,0,0,1800,373,1,0,0,0,1801,
-        1802,5,59,0,0,1802,375,1,0,0,0,1803,1804,3,60,16,0,1804,1805,1,0,
-        0,0,1805,1806,6,174,26,0,1806,377,1,0,0,0,1807,1808,7,9,0,0,1808,
-        1809,7,11,0,0,1809,1810,7,6,0,0,1810,379,1,0,0,0,1811,1812,7,5,0,
-        0,1812,1813,7,20,0,0,1813,1814,7,12,0,0,1814,381,1,0,0,0,1815,1817,
-        7,18,0,0,1816,1815,1,0,0,0,1817,1818,1,0,0,0,1818,1816,1,0,0,0,1818,
-        1819,1,0,0,0,1819,1820,1,0,0,0,1820,1821,6,177,2,0,1821,383,1,0,
-        0,0,1822,1823,5,59,0,0,1823,385,1,0,0,0,1824,1825,3,60,16,0,1825,
-        1826,1,0,0,0,1826,1827,6,179,26,0,1827,387,1,0,0,0,1828,1829,7,0,
-        0,0,1829,1830,7,1,0,0,1830,1831,7,2,0,0,1831,1832,7,2,0,0,1832,1833,
-        7,3,0,0,1833,1834,7,0,0,0,1834,1835,7,4,0,0,1835,389,1,0,0,0,1836,
-        1837,7,22,0,0,1837,1838,7,6,0,0,1838,1839,7,4,0,0,1839,1840,7,21,
-        0,0,1840,391,1,0,0,0,1841,1842,7,10,0,0,1842,1843,7,5,0,0,1843,1844,
-        7,3,0,0,1844,1845,7,8,0,0,1845,393,1,0,0,0,1846,1847,7,5,0,0,1847,
-        1848,7,3,0,0,1848,1849,7,4,0,0,1849,395,1,0,0,0,1850,1851,7,16,0,
-        0,1851,1852,7,3,0,0,1852,1853,7,39,0,0,1853,1854,7,17,0,0,1854,1855,
-        7,6,0,0,1855,1856,7,12,0,0,1856,1857,7,3,0,0,1857,397,1,0,0,0,1858,
-        1859,7,11,0,0,1859,1860,7,9,0,0,1860,1861,7,5,0,0,1861,1862,7,5,
-        0,0,1862,1863,7,22,0,0,1863,1864,7,1,0,0,1864,1865,7,8,0,0,1865,
-        1866,7,7,0,0,1866,399,1,0,0,0,1867,1868,7,3,0,0,1868,1869,7,19,0,
-        0,1869,1870,7,3,0,0,1870,1871,7,0,0,0,1871,1872,7,10,0,0,1872,1873,
-        7,4,0,0,1873,1874,7,3,0,0,1874,401,1,0,0,0,1875,1876,7,7,0,0,1876,
-        1877,7,6,0,0,1877,1878,7,5,0,0,1878,1879,7,0,0,0,1879,1880,7,1,0,
-        0,1880,1881,7,2,0,0,1881,1882,7,2,0,0,1882,1883,7,3,0,0,1883,1884,
-        7,0,0,0,1884,1885,7,4,0,0,1885,403,1,0,0,0,1886,1887,7,5,0,0,1887,
-        1888,7,9,0,0,1888,1889,7,23,0,0,1889,1890,7,3,0,0,1890,405,1,0,0,
-        0,1891,1892,7,8,0,0,1892,1893,7,3,0,0,1893,1894,7,5,0,0,1894,1895,
-        7,4,0,0,1895,1896,7,1,0,0,1896,1897,7,8,0,0,1897,1898,7,3,0,0,1898,
-        407,1,0,0,0,1899,1900,7,5,0,0,1900,1901,7,17,0,0,1901,1902,7,4,0,
-        0,1902,1903,7,11,0,0,1903,409,1,0,0,0,1904,1905,7,0,0,0,1905,1906,
-        7,21,0,0,1906,1907,7,15,0,0,1907,1908,7,1,0,0,1908,1909,7,7,0,0,
-        1909,411,1,0,0,0,1910,1911,7,14,0,0,1911,1912,7,3,0,0,1912,1913,
-        7,4,0,0,1913,1914,7,0,0,0,1914,1915,7,22,0,0,1915,1916,7,7,0,0,1916,
-        413,1,0,0,0,1917,1918,7,0,0,0,1918,1919,7,21,0,0,1919,1920,7,7,0,
-        0,1920,1921,7,6,0,0,1921,1922,7,8,0,0,1922,415,1,0,0,0,1923,1924,
-        7,0,0,0,1924,1925,7,21,0,0,1925,1926,7,1,0,0,1926,1927,7,22,0,0,
-        1927,1928,7,2,0,0,1928,417,1,0,0,0,1929,1930,7,15,0,0,1930,1931,
-        7,16,0,0,1931,1932,7,7,0,0,1932,1933,7,6,0,0,1933,1934,7,8,0,0,1934,
-        419,1,0,0,0,1935,1936,7,14,0,0,1936,1937,7,3,0,0,1937,1938,7,4,0,
-        0,1938,421,1,0,0,0,1939,1940,7,11,0,0,1940,1941,7,10,0,0,1941,1942,
-        7,4,0,0,1942,423,1,0,0,0,1943,1944,7,8,0,0,1944,1945,7,3,0,0,1945,
-        1946,7,15,0,0,1946,1947,7,1,0,0,1947,1948,7,23,0,0,1948,1949,7,3,
-        0,0,1949,425,1,0,0,0,1950,1951,7,8,0,0,1951,1952,7,3,0,0,1952,1953,
-        7,2,0,0,1953,1954,7,9,0,0,1954,1955,7,15,0,0,1955,1956,7,3,0,0,1956,
-        427,1,0,0,0,1957,1958,7,12,0,0,1958,1959,7,6,0,0,1959,1960,7,5,0,
-        0,1960,1961,7,4,0,0,1961,1962,7,7,0,0,1962,1963,7,6,0,0,1963,1964,
-        7,8,0,0,1964,429,1,0,0,0,1965,1966,7,4,0,0,1966,1967,7,8,0,0,1967,
-        1968,7,10,0,0,1968,1969,7,2,0,0,1969,1970,7,0,0,0,1970,1971,7,9,
-        0,0,1971,1972,7,4,0,0,1972,1973,7,3,0,0,1973,431,1,0,0,0,1974,1975,
-        5,61,0,0,1975,433,1,0,0,0,1976,1978,7,18,0,0,1977,1976,1,0,0,0,1978,
-        1979,1,0,0,0,1979,1977,1,0,0,0,1979,1980,1,0,0,0,1980,1981,1,0,0,
-        0,1981,1982,6,203,2,0,1982,435,1,0,0,0,1983,1984,5,59,0,0,1984,437,
-        1,0,0,0,1985,1986,3,60,16,0,1986,1987,1,0,0,0,1987,1988,6,205,26,
-        0,1988,439,1,0,0,0,1989,1997,3,154,63,0,1990,1997,3,142,57,0,1991,
-        1997,3,144,58,0,1992,1997,3,146,59,0,1993,1997,3,156,64,0,1994,1997,
-        3,158,65,0,1995,1997,7,40,0,0,1996,1989,1,0,0,0,1996,1990,1,0,0,
-        0,1996,1991,1,0,0,0,1996,1992,1,0,0,0,1996,1993,1,0,0,0,1996,1994,
-        1,0,0,0,1996,1995,1,0,0,0,1997,1998,1,0,0,0,1998,1996,1,0,0,0,1998,
-        1999,1,0,0,0,1999,441,1,0,0,0,2000,2002,7,18,0,0,2001,2000,1,0,0,
-        0,2002,2003,1,0,0,0,2003,2001,1,0,0,0,2003,2004,1,0,0,0,2004,2005,
-        1,0,0,0,2005,2006,6,207,2,0,2006,443,1,0,0,0,2007,2008,5,59,0,0,
-        2008,445,1,0,0,0,2009,2010,5,61,0,0,2010,447,1,0,0,0,2011,2012,3,
-        60,16,0,2012,2013,1,0,0,0,2013,2014,6,210,26,0,2014,449,1,0,0,0,
-        2015,2016,7,0,0,0,2016,2017,7,8,0,0,2017,2018,7,3,0,0,2018,2019,
-        7,9,0,0,2019,2020,7,4,0,0,2020,2021,7,3,0,0,2021,451,1,0,0,0,2022,
-        2023,7,5,0,0,2023,2024,7,21,0,0,2024,2025,7,1,0,0,2025,2026,7,22,
-        0,0,2026,453,1,0,0,0,2027,2028,7,5,0,0,2028,2029,7,3,0,0,2029,2030,
-        7,4,0,0,2030,455,1,0,0,0,2031,2032,7,5,0,0,2032,2033,7,4,0,0,2033,
-        2034,7,9,0,0,2034,2035,7,8,0,0,2035,2036,7,4,0,0,2036,457,1,0,0,
-        0,2037,2038,7,22,0,0,2038,2039,7,9,0,0,2039,2040,7,6,0,0,2040,2041,
-        7,4,0,0,2041,459,1,0,0,0,2042,2043,7,5,0,0,2043,2044,7,21,0,0,2044,
-        2045,7,10,0,0,2045,2046,7,4,0,0,2046,2047,7,7,0,0,2047,2048,7,1,
-        0,0,2048,2049,7,22,0,0,2049,2050,7,2,0,0,2050,461,1,0,0,0,2051,2052,
-        7,9,0,0,2052,2053,7,13,0,0,2053,2054,7,1,0,0,2054,2055,7,8,0,0,2055,
-        2056,7,4,0,0,2056,463,1,0,0,0,2057,2058,7,4,0,0,2058,2059,7,6,0,
-        0,2059,2060,7,15,0,0,2060,2061,7,3,0,0,2061,2062,7,8,0,0,2062,465,
-        1,0,0,0,2063,2064,7,8,0,0,2064,2065,7,3,0,0,2065,2066,7,14,0,0,2066,
-        2067,7,6,0,0,2067,2068,7,5,0,0,2068,2069,7,4,0,0,2069,2070,7,3,0,
-        0,2070,2071,7,8,0,0,2071,467,1,0,0,0,2072,2073,7,7,0,0,2073,2074,
-        7,3,0,0,2074,2075,7,8,0,0,2075,2076,7,3,0,0,2076,2077,7,14,0,0,2077,
-        2078,7,6,0,0,2078,2079,7,5,0,0,2079,2080,7,4,0,0,2080,2081,7,3,0,
-        0,2081,2082,7,8,0,0,2082,469,1,0,0,0,2083,2084,7,22,0,0,2084,2085,
-        7,1,0,0,2085,2086,7,8,0,0,2086,2087,7,16,0,0,2087,2088,7,3,0,0,2088,
-        2089,7,8,0,0,2089,471,1,0,0,0,2090,2091,7,24,0,0,2091,2092,7,1,0,
-        0,2092,2093,7,13,0,0,2093,2094,7,15,0,0,2094,2095,7,9,0,0,2095,2096,
-        7,2,0,0,2096,2097,7,9,0,0,2097,2098,7,14,0,0,2098,2099,7,3,0,0,2099,
-        2100,7,8,0,0,2100,473,1,0,0,0,2101,2102,7,1,0,0,2102,2103,7,2,0,
-        0,2103,475,1,0,0,0,2104,2105,7,1,0,0,2105,2106,7,17,0,0,2106,2107,
-        7,17,0,0,2107,477,1,0,0,0,2108,2109,7,4,0,0,2109,2110,7,1,0,0,2110,
-        479,1,0,0,0,2111,2118,3,154,63,0,2112,2118,3,142,57,0,2113,2118,
-        3,146,59,0,2114,2118,3,156,64,0,2115,2118,3,158,65,0,2116,2118,7,
-        41,0,0,2117,2111,1,0,0,0,2117,2112,1,0,0,0,2117,2113,1,0,0,0,2117,
-        2114,1,0,0,0,2117,2115,1,0,0,0,2117,2116,1,0,0,0,2118,2119,1,0,0,
-        0,2119,2117,1,0,0,0,2119,2120,1,0,0,0,2120,481,1,0,0,0,2121,2123,
-        7,18,0,0,2122,2121,1,0,0,0,2123,2124,1,0,0,0,2124,2122,1,0,0,0,2124,
-        2125,1,0,0,0,2125,2126,1,0,0,0,2126,2127,6,227,2,0,2127,483,1,0,
-        0,0,2128,2129,5,59,0,0,2129,485,1,0,0,0,2130,2131,5,61,0,0,2131,
-        2132,5,62,0,0,2132,487,1,0,0,0,2133,2134,3,60,16,0,2134,2135,1,0,
-        0,0,2135,2136,6,230,26,0,2136,489,1,0,0,0,2137,2138,7,5,0,0,2138,
-        2139,7,3,0,0,2139,2140,7,4,0,0,2140,491,1,0,0,0,2141,2142,7,10,0,
-        0,2142,2143,7,2,0,0,2143,2144,7,5,0,0,2144,2145,7,3,0,0,2145,2146,
-        7,4,0,0,2146,493,1,0,0,0,2147,2148,7,15,0,0,2148,2149,7,9,0,0,2149,
-        2150,7,5,0,0,2150,2151,7,16,0,0,2151,495,1,0,0,0,2152,2153,7,2,0,
-        0,2153,2154,7,1,0,0,2154,2155,7,15,0,0,2155,2156,7,9,0,0,2156,2157,
-        7,5,0,0,2157,2158,7,16,0,0,2158,497,1,0,0,0,2159,2160,7,15,0,0,2160,
-        2161,7,9,0,0,2161,2162,7,5,0,0,2162,2163,7,16,0,0,2163,2164,7,12,
-        0,0,2164,2165,7,6,0,0,2165,2166,7,2,0,0,2166,2167,7,3,0,0,2167,499,
-        1,0,0,0,2168,2169,7,2,0,0,2169,2170,7,1,0,0,2170,2171,7,15,0,0,2171,
-        2172,7,9,0,0,2172,2173,7,5,0,0,2173,2174,7,16,0,0,2174,2175,7,12,
-        0,0,2175,2176,7,6,0,0,2176,2177,7,2,0,0,2177,2178,7,3,0,0,2178,501,
-        1,0,0,0,2179,2180,7,0,0,0,2180,2181,7,9,0,0,2181,2182,7,5,0,0,2182,
-        2183,7,3,0,0,2183,503,1,0,0,0,2184,2185,7,2,0,0,2185,2186,7,1,0,
-        0,2186,2187,7,0,0,0,2187,2188,7,9,0,0,2188,2189,7,5,0,0,2189,2190,
-        7,3,0,0,2190,505,1,0,0,0,2191,2192,7,6,0,0,2192,2193,7,14,0,0,2193,
-        2194,7,13,0,0,2194,2195,7,12,0,0,2195,2196,7,9,0,0,2196,2197,7,2,
-        0,0,2197,2198,7,16,0,0,2198,507,1,0,0,0,2199,2200,7,2,0,0,2200,2201,
-        7,1,0,0,2201,2202,7,6,0,0,2202,2203,7,14,0,0,2203,2204,7,13,0,0,
-        2204,2205,7,12,0,0,2205,2206,7,9,0,0,2206,2207,7,2,0,0,2207,2208,
-        7,16,0,0,2208,509,1,0,0,0,2209,2210,7,4,0,0,2210,2211,7,8,0,0,2211,
-        2212,7,6,0,0,2212,2213,7,15,0,0,2213,511,1,0,0,0,2214,2215,7,2,0,
-        0,2215,2216,7,1,0,0,2216,2217,7,4,0,0,2217,2218,7,8,0,0,2218,2219,
-        7,6,0,0,2219,2220,7,15,0,0,2220,513,1,0,0,0,2221,2222,7,1,0,0,2222,
-        2223,7,10,0,0,2223,2224,7,4,0,0,2224,2225,7,11,0,0,2225,2226,7,10,
-        0,0,2226,2227,7,4,0,0,2227,515,1,0,0,0,2228,2229,7,0,0,0,2229,2230,
-        7,1,0,0,2230,2231,7,2,0,0,2231,2232,7,5,0,0,2232,2233,7,1,0,0,2233,
-        2234,7,12,0,0,2234,2235,7,3,0,0,2235,517,1,0,0,0,2236,2237,7,7,0,
-        0,2237,2238,7,6,0,0,2238,2239,7,17,0,0,2239,2240,7,17,0,0,2240,2241,
-        7,17,0,0,2241,2242,7,6,0,0,2242,2243,7,12,0,0,2243,2244,7,3,0,0,
-        2244,519,1,0,0,0,2245,2246,7,21,0,0,2246,2247,7,4,0,0,2247,2248,
-        7,15,0,0,2248,2249,7,12,0,0,2249,2250,7,17,0,0,2250,2251,7,6,0,0,
-        2251,2252,7,12,0,0,2252,2253,7,3,0,0,2253,521,1,0,0,0,2254,2255,
-        7,5,0,0,2255,2256,7,16,0,0,2256,2257,7,6,0,0,2257,2258,7,11,0,0,
-        2258,2259,7,12,0,0,2259,2260,7,6,0,0,2260,2261,7,2,0,0,2261,2262,
-        7,3,0,0,2262,523,1,0,0,0,2263,2264,7,2,0,0,2264,2265,7,1,0,0,2265,
-        2266,7,5,0,0,2266,2267,7,16,0,0,2267,2268,7,6,0,0,2268,2269,7,11,
-        0,0,2269,2270,7,12,0,0,2270,2271,7,6,0,0,2271,2272,7,2,0,0,2272,
-        2273,7,3,0,0,2273,525,1,0,0,0,2274,2275,7,8,0,0,2275,2276,7,3,0,
-        0,2276,2277,7,5,0,0,2277,2278,7,3,0,0,2278,2279,7,4,0,0,2279,527,
-        1,0,0,0,2280,2281,7,9,0,0,2281,2282,7,12,0,0,2282,2283,7,14,0,0,
-        2283,2284,7,1,0,0,2284,2285,7,8,0,0,2285,2286,7,6,0,0,2286,2287,
-        7,4,0,0,2287,2288,7,21,0,0,2288,2289,7,15,0,0,2289,529,1,0,0,0,2290,
-        2291,7,3,0,0,2291,2292,7,2,0,0,2292,2293,7,0,0,0,2293,2294,7,1,0,
-        0,2294,2295,7,7,0,0,2295,2296,7,6,0,0,2296,2297,7,2,0,0,2297,2298,
-        7,14,0,0,2298,531,1,0,0,0,2299,2300,7,22,0,0,2300,2301,7,1,0,0,2301,
-        2302,7,8,0,0,2302,2303,7,16,0,0,2303,533,1,0,0,0,2304,2305,7,8,0,
-        0,2305,2306,7,3,0,0,2306,2307,7,17,0,0,2307,2308,7,3,0,0,2308,2309,
-        7,8,0,0,2309,2310,7,3,0,0,2310,2311,7,2,0,0,2311,2312,7,0,0,0,2312,
-        2313,7,3,0,0,2313,535,1,0,0,0,2314,2315,7,12,0,0,2315,2316,7,0,0,
-        0,2316,2317,7,5,0,0,2317,537,1,0,0,0,2318,2319,7,15,0,0,2319,2320,
-        7,39,0,0,2320,2321,7,3,0,0,2321,2322,7,8,0,0,2322,2323,7,5,0,0,2323,
-        539,1,0,0,0,2324,2325,7,7,0,0,2325,2326,7,6,0,0,2326,2327,7,17,0,
-        0,2327,2328,7,17,0,0,2328,2329,7,12,0,0,2329,2330,7,6,0,0,2330,2331,
-        7,13,0,0,2331,541,1,0,0,0,2332,2333,7,9,0,0,2333,2334,7,10,0,0,2334,
-        2335,7,4,0,0,2335,2336,7,1,0,0,2336,543,1,0,0,0,2337,2344,3,154,
-        63,0,2338,2344,3,142,57,0,2339,2344,3,146,59,0,2340,2344,3,156,64,
-        0,2341,2344,3,158,65,0,2342,2344,7,41,0,0,2343,2337,1,0,0,0,2343,
-        2338,1,0,0,0,2343,2339,1,0,0,0,2343,2340,1,0,0,0,2343,2341,1,0,0,
-        0,2343,2342,1,0,0,0,2344,2345,1,0,0,0,2345,2343,1,0,0,0,2345,2346,
-        1,0,0,0,2346,545,1,0,0,0,2347,2349,7,42,0,0,2348,2347,1,0,0,0,2349,
-        2350,1,0,0,0,2350,2348,1,0,0,0,2350,2351,1,0,0,0,2351,2352,1,0,0,
-        0,2352,2353,6,259,2,0,2353,547,1,0,0,0,2354,2355,5,59,0,0,2355,2356,
-        1,0,0,0,2356,2357,6,260,26,0,2357,549,1,0,0,0,2358,2359,7,5,0,0,
-        2359,2360,7,3,0,0,2360,2361,7,4,0,0,2361,551,1,0,0,0,2362,2363,7,
-        5,0,0,2363,2364,7,3,0,0,2364,2365,7,3,0,0,2365,2366,7,7,0,0,2366,
-        2367,7,17,0,0,2367,2368,7,6,0,0,2368,2369,7,12,0,0,2369,2370,7,3,
-        0,0,2370,553,1,0,0,0,2371,2372,7,7,0,0,2372,2373,7,6,0,0,2373,2374,
-        7,8,0,0,2374,555,1,0,0,0,2375,2376,7,0,0,0,2376,2377,7,8,0,0,2377,
-        2378,7,3,0,0,2378,2379,7,9,0,0,2379,2380,7,4,0,0,2380,2381,7,3,0,
-        0,2381,557,1,0,0,0,2382,2383,7,17,0,0,2383,2384,7,6,0,0,2384,2385,
-        7,12,0,0,2385,2386,7,3,0,0,2386,559,1,0,0,0,2387,2388,7,17,0,0,2388,
-        2397,7,5,0,0,2389,2390,7,15,0,0,2390,2391,7,3,0,0,2391,2397,7,15,
-        0,0,2392,2393,7,21,0,0,2393,2394,7,7,0,0,2394,2395,7,17,0,0,2395,
-        2397,7,5,0,0,2396,2387,1,0,0,0,2396,2389,1,0,0,0,2396,2392,1,0,0,
-        0,2397,561,1,0,0,0,2398,2399,7,21,0,0,2399,2400,7,7,0,0,2400,2401,
-        7,17,0,0,2401,2402,7,5,0,0,2402,2403,7,10,0,0,2403,2404,7,5,0,0,
-        2404,2405,7,3,0,0,2405,2406,7,8,0,0,2406,563,1,0,0,0,2407,2408,7,
-        8,0,0,2408,2409,7,1,0,0,2409,2410,7,22,0,0,2410,2411,7,5,0,0,2411,
-        565,1,0,0,0,2412,2413,3,136,54,0,2413,567,1,0,0,0,2414,2415,5,44,
-        0,0,2415,569,1,0,0,0,2416,2417,5,40,0,0,2417,2418,1,0,0,0,2418,2419,
-        6,271,33,0,2419,571,1,0,0,0,2420,2421,7,0,0,0,2421,2422,7,1,0,0,
-        2422,2423,7,2,0,0,2423,2424,7,23,0,0,2424,2425,7,3,0,0,2425,2426,
-        7,8,0,0,2426,2427,7,4,0,0,2427,573,1,0,0,0,2428,2429,7,4,0,0,2429,
-        2430,7,1,0,0,2430,575,1,0,0,0,2431,2438,3,154,63,0,2432,2438,3,142,
-        57,0,2433,2438,3,146,59,0,2434,2438,3,156,64,0,2435,2438,3,158,65,
-        0,2436,2438,7,41,0,0,2437,2431,1,0,0,0,2437,2432,1,0,0,0,2437,2433,
-        1,0,0,0,2437,2434,1,0,0,0,2437,2435,1,0,0,0,2437,2436,1,0,0,0,2438,
-        2439,1,0,0,0,2439,2437,1,0,0,0,2439,2440,1,0,0,0,2440,577,1,0,0,
-        0,2441,2443,7,42,0,0,2442,2441,1,0,0,0,2443,2444,1,0,0,0,2444,2442,
-        1,0,0,0,2444,2445,1,0,0,0,2445,2446,1,0,0,0,2446,2447,6,275,2,0,
-        2447,579,1,0,0,0,2448,2449,5,41,0,0,2449,581,1,0,0,0,2450,2452,9,
-        0,0,0,2451,2450,1,0,0,0,2452,2455,1,0,0,0,2453,2454,1,0,0,0,2453,
-        2451,1,0,0,0,2454,2456,1,0,0,0,2455,2453,1,0,0,0,2456,2458,3,580,
-        276,0,2457,2453,1,0,0,0,2458,2459,1,0,0,0,2459,2457,1,0,0,0,2459,
-        2460,1,0,0,0,2460,2461,1,0,0,0,2461,2462,6,277,26,0,2462,583,1,0,
-        0,0,2463,2465,7,18,0,0,2464,2463,1,0,0,0,2465,2466,1,0,0,0,2466,
-        2464,1,0,0,0,2466,2467,1,0,0,0,2467,2468,1,0,0,0,2468,2469,6,278,
-        2,0,2469,585,1,0,0,0,2470,2472,7,43,0,0,2471,2470,1,0,0,0,2472,2473,
-        1,0,0,0,2473,2471,1,0,0,0,2473,2474,1,0,0,0,2474,587,1,0,0,0,2475,
-        2476,3,60,16,0,2476,2477,1,0,0,0,2477,2478,6,280,26,0,2478,589,1,
-        0,0,0,2479,2480,5,59,0,0,2480,591,1,0,0,0,2481,2483,7,18,0,0,2482,
-        2481,1,0,0,0,2483,2484,1,0,0,0,2484,2482,1,0,0,0,2484,2485,1,0,0,
-        0,2485,2486,1,0,0,0,2486,2487,6,282,2,0,2487,593,1,0,0,0,2488,2489,
-        7,15,0,0,2489,2490,7,1,0,0,2490,2491,7,2,0,0,2491,2492,7,6,0,0,2492,
-        2493,7,4,0,0,2493,2494,7,1,0,0,2494,2495,7,8,0,0,2495,2496,7,15,
-        0,0,2496,2497,7,9,0,0,2497,2498,7,2,0,0,2498,2499,7,9,0,0,2499,2500,
-        7,14,0,0,2500,2501,7,3,0,0,2501,2502,7,8,0,0,2502,595,1,0,0,0,2503,
-        2504,7,22,0,0,2504,2505,7,1,0,0,2505,2506,7,8,0,0,2506,2507,7,16,
-        0,0,2507,2508,7,3,0,0,2508,2509,7,8,0,0,2509,2510,7,5,0,0,2510,597,
-        1,0,0,0,2511,2512,7,0,0,0,2512,2513,7,8,0,0,2513,2514,7,3,0,0,2514,
-        2515,7,9,0,0,2515,2516,7,4,0,0,2516,2517,7,3,0,0,2517,599,1,0,0,
-        0,2518,2519,7,4,0,0,2519,2520,7,9,0,0,2520,2521,7,5,0,0,2521,2522,
-        7,16,0,0,2522,601,1,0,0,0,2523,2524,5,61,0,0,2524,603,1,0,0,0,2525,
-        2526,7,5,0,0,2526,2527,7,4,0,0,2527,2528,7,9,0,0,2528,2529,7,8,0,
-        0,2529,2530,7,4,0,0,2530,605,1,0,0,0,2531,2532,7,5,0,0,2532,2533,
-        7,4,0,0,2533,2534,7,1,0,0,2534,2535,7,11,0,0,2535,607,1,0,0,0,2536,
-        2537,7,8,0,0,2537,2538,7,3,0,0,2538,2539,7,11,0,0,2539,2540,7,1,
-        0,0,2540,2541,7,8,0,0,2541,2542,7,4,0,0,2542,609,1,0,0,0,2543,2544,
-        7,12,0,0,2544,2545,7,6,0,0,2545,2546,7,5,0,0,2546,2547,7,4,0,0,2547,
-        611,1,0,0,0,2548,2549,7,1,0,0,2549,2550,7,2,0,0,2550,613,1,0,0,0,
-        2551,2552,7,1,0,0,2552,2553,7,17,0,0,2553,2554,7,17,0,0,2554,615,
-        1,0,0,0,2555,2561,3,154,63,0,2556,2561,3,142,57,0,2557,2561,3,146,
-        59,0,2558,2561,3,156,64,0,2559,2561,3,158,65,0,2560,2555,1,0,0,0,
-        2560,2556,1,0,0,0,2560,2557,1,0,0,0,2560,2558,1,0,0,0,2560,2559,
-        1,0,0,0,2561,2562,1,0,0,0,2562,2560,1,0,0,0,2562,2563,1,0,0,0,2563,
-        617,1,0,0,0,2564,2565,3,60,16,0,2565,2566,1,0,0,0,2566,2567,6,295,
-        26,0,2567,619,1,0,0,0,2568,2569,5,59,0,0,2569,621,1,0,0,0,2570,2572,
-        7,18,0,0,2571,2570,1,0,0,0,2572,2573,1,0,0,0,2573,2571,1,0,0,0,2573,
-        2574,1,0,0,0,2574,2575,1,0,0,0,2575,2576,6,297,2,0,2576,623,1,0,
-        0,0,2577,2583,3,154,63,0,2578,2583,3,142,57,0,2579,2583,3,146,59,
-        0,2580,2583,3,156,64,0,2581,2583,3,158,65,0,2582,2577,1,0,0,0,2582,
-        2578,1,0,0,0,2582,2579,1,0,0,0,2582,2580,1,0,0,0,2582,2581,1,0,0,
-        0,2583,2584,1,0,0,0,2584,2582,1,0,0,0,2584,2585,1,0,0,0,2585,625,
-        1,0,0,0,2586,2587,3,60,16,0,2587,2588,1,0,0,0,2588,2589,6,299,26,
-        0,2589,627,1,0,0,0,2590,2591,5,59,0,0,2591,629,1,0,0,0,2592,2594,
-        7,18,0,0,2593,2592,1,0,0,0,2594,2595,1,0,0,0,2595,2593,1,0,0,0,2595,
-        2596,1,0,0,0,2596,2597,1,0,0,0,2597,2598,6,301,2,0,2598,631,1,0,
-        0,0,2599,2606,3,154,63,0,2600,2606,3,142,57,0,2601,2606,3,146,59,
-        0,2602,2606,3,156,64,0,2603,2606,3,158,65,0,2604,2606,7,41,0,0,2605,
-        2599,1,0,0,0,2605,2600,1,0,0,0,2605,2601,1,0,0,0,2605,2602,1,0,0,
-        0,2605,2603,1,0,0,0,2605,2604,1,0,0,0,2606,2607,1,0,0,0,2607,2605,
-        1,0,0,0,2607,2608,1,0,0,0,2608,633,1,0,0,0,2609,2610,3,60,16,0,2610,
-        2611,1,0,0,0,2611,2612,6,303,26,0,2612,635,1,0,0,0,2613,2614,5,59,
-        0,0,2614,637,1,0,0,0,131,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,
-        17,18,19,20,21,22,23,24,25,26,27,678,683,808,812,814,852,887,928,
-        933,1084,1091,1096,1102,1110,1112,1117,1138,1140,1142,1151,1155,
-        1157,1159,1167,1205,1211,1217,1223,1228,1230,1238,1242,1244,1246,
-        1255,1259,1261,1263,1274,1276,1286,1291,1321,1365,1367,1380,1422,
-        1429,1436,1443,1454,1465,1483,1494,1496,1505,1572,1574,1585,1596,
-        1598,1607,1618,1620,1629,1643,1655,1711,1723,1758,1769,1771,1786,
-        1797,1799,1818,1979,1996,1998,2003,2117,2119,2124,2343,2345,2350,
-        2396,2437,2439,2444,2453,2459,2466,2473,2484,2560,2562,2573,2582,
-        2584,2595,2605,2607,34,5,1,0,5,4,0,0,1,0,2,5,0,2,6,0,5,27,0,5,18,
+        1,291,1,291,1,291,1,292,1,292,1,292,1,292,1,292,1,292,1,292,1,292,
+        1,293,1,293,1,293,1,293,1,293,1,293,1,293,1,294,1,294,1,294,1,295,
+        1,295,1,295,1,295,1,296,1,296,1,296,1,296,1,296,4,296,2580,8,296,
+        11,296,12,296,2581,1,297,1,297,1,297,1,297,1,298,1,298,1,299,4,299,
+        2591,8,299,11,299,12,299,2592,1,299,1,299,1,300,1,300,1,300,1,300,
+        1,300,4,300,2602,8,300,11,300,12,300,2603,1,301,1,301,1,301,1,301,
+        1,302,1,302,1,303,4,303,2613,8,303,11,303,12,303,2614,1,303,1,303,
+        1,304,1,304,1,304,1,304,1,304,1,304,4,304,2625,8,304,11,304,12,304,
+        2626,1,305,1,305,1,305,1,305,1,306,1,306,8,682,932,1433,1447,1487,
+        1647,1715,2457,0,307,28,1,30,2,32,3,34,4,36,5,38,6,40,7,42,8,44,
+        9,46,10,48,11,50,12,52,13,54,14,56,15,58,16,60,17,62,18,64,19,66,
+        20,68,21,70,22,72,23,74,24,76,25,78,26,80,27,82,28,84,29,86,30,88,
+        31,90,32,92,33,94,34,96,35,98,36,100,37,102,38,104,39,106,40,108,
+        41,110,42,112,43,114,44,116,45,118,46,120,47,122,48,124,49,126,50,
+        128,51,130,52,132,53,134,54,136,55,138,56,140,57,142,0,144,0,146,
+        0,148,0,150,0,152,0,154,0,156,0,158,0,160,58,162,0,164,59,166,60,
+        168,61,170,62,172,63,174,64,176,65,178,66,180,67,182,68,184,69,186,
+        70,188,71,190,0,192,0,194,72,196,0,198,73,200,74,202,75,204,0,206,
+        0,208,76,210,77,212,0,214,78,216,79,218,80,220,81,222,82,224,83,
+        226,84,228,85,230,86,232,87,234,0,236,88,238,89,240,90,242,91,244,
+        92,246,93,248,94,250,95,252,96,254,97,256,98,258,99,260,100,262,
+        101,264,102,266,103,268,104,270,105,272,106,274,107,276,108,278,
+        109,280,110,282,111,284,112,286,113,288,114,290,115,292,116,294,
+        117,296,118,298,119,300,120,302,121,304,122,306,123,308,124,310,
+        125,312,126,314,127,316,128,318,129,320,130,322,131,324,132,326,
+        133,328,134,330,135,332,136,334,137,336,138,338,139,340,140,342,
+        141,344,142,346,143,348,144,350,145,352,146,354,147,356,148,358,
+        149,360,150,362,151,364,152,366,153,368,154,370,155,372,156,374,
+        157,376,158,378,159,380,160,382,161,384,162,386,163,388,164,390,
+        165,392,166,394,167,396,168,398,169,400,170,402,171,404,172,406,
+        173,408,174,410,175,412,176,414,177,416,178,418,179,420,180,422,
+        181,424,182,426,183,428,184,430,185,432,186,434,187,436,188,438,
+        189,440,190,442,191,444,192,446,193,448,194,450,195,452,196,454,
+        197,456,198,458,199,460,200,462,201,464,202,466,203,468,204,470,
+        205,472,206,474,207,476,208,478,209,480,210,482,211,484,212,486,
+        213,488,214,490,215,492,216,494,217,496,218,498,219,500,220,502,
+        221,504,222,506,223,508,224,510,225,512,226,514,227,516,228,518,
+        229,520,230,522,231,524,232,526,233,528,234,530,235,532,236,534,
+        237,536,238,538,239,540,240,542,241,544,242,546,243,548,244,550,
+        245,552,246,554,247,556,248,558,249,560,250,562,251,564,252,566,
+        253,568,254,570,255,572,256,574,257,576,258,578,259,580,260,582,
+        261,584,262,586,263,588,264,590,265,592,266,594,267,596,268,598,
+        269,600,270,602,271,604,272,606,273,608,274,610,275,612,276,614,
+        277,616,278,618,279,620,280,622,281,624,282,626,283,628,284,630,
+        285,632,286,634,287,636,288,638,289,640,290,28,0,1,2,3,4,5,6,7,8,
+        9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,44,2,0,67,
+        67,99,99,2,0,79,79,111,111,2,0,78,78,110,110,2,0,69,69,101,101,2,
+        0,84,84,116,116,2,0,83,83,115,115,2,0,73,73,105,105,2,0,68,68,100,
+        100,2,0,82,82,114,114,2,0,65,65,97,97,2,0,85,85,117,117,2,0,80,80,
+        112,112,2,0,76,76,108,108,2,0,66,66,98,98,2,0,71,71,103,103,2,0,
+        77,77,109,109,2,0,75,75,107,107,2,0,70,70,102,102,2,0,9,9,32,32,
+        2,0,88,88,120,120,2,0,81,81,113,113,2,0,72,72,104,104,2,0,87,87,
+        119,119,2,0,86,86,118,118,2,0,74,74,106,106,2,0,65,90,97,122,3,0,
+        45,46,95,95,126,126,5,0,33,33,36,36,38,38,40,43,61,61,1,0,48,57,
+        3,0,48,57,65,70,97,102,1,0,34,34,1,0,39,39,2,0,46,46,58,58,2,0,123,
+        123,125,125,1,0,10,10,2,0,10,10,47,47,3,0,47,47,58,58,92,92,4,0,
+        32,32,47,47,58,58,92,92,7,0,37,37,47,47,58,58,64,64,92,92,123,123,
+        125,125,2,0,89,89,121,121,6,0,44,44,47,47,58,58,64,64,92,92,123,
+        125,5,0,47,47,58,58,92,92,123,123,125,125,2,0,9,10,32,32,3,0,48,
+        57,65,90,97,122,2773,0,28,1,0,0,0,0,30,1,0,0,0,0,32,1,0,0,0,0,34,
+        1,0,0,0,0,36,1,0,0,0,0,38,1,0,0,0,0,40,1,0,0,0,0,42,1,0,0,0,0,44,
+        1,0,0,0,0,46,1,0,0,0,0,48,1,0,0,0,0,50,1,0,0,0,0,52,1,0,0,0,0,54,
+        1,0,0,0,0,56,1,0,0,0,0,58,1,0,0,0,0,60,1,0,0,0,0,62,1,0,0,0,0,64,
+        1,0,0,0,0,66,1,0,0,0,0,68,1,0,0,0,0,70,1,0,0,0,0,72,1,0,0,0,0,74,
+        1,0,0,0,0,76,1,0,0,0,0,78,1,0,0,0,0,80,1,0,0,0,0,82,1,0,0,0,0,84,
+        1,0,0,0,0,86,1,0,0,0,0,88,1,0,0,0,0,90,1,0,0,0,0,92,1,0,0,0,0,94,
+        1,0,0,0,0,96,1,0,0,0,0,98,1,0,0,0,0,100,1,0,0,0,0,102,1,0,0,0,0,
+        104,1,0,0,0,0,106,1,0,0,0,0,108,1,0,0,0,0,110,1,0,0,0,0,112,1,0,
+        0,0,0,114,1,0,0,0,0,116,1,0,0,0,0,118,1,0,0,0,0,120,1,0,0,0,0,122,
+        1,0,0,0,0,124,1,0,0,0,0,126,1,0,0,0,0,128,1,0,0,0,0,130,1,0,0,0,
+        0,132,1,0,0,0,0,134,1,0,0,0,0,136,1,0,0,0,0,138,1,0,0,0,0,140,1,
+        0,0,0,1,160,1,0,0,0,1,162,1,0,0,0,1,164,1,0,0,0,1,166,1,0,0,0,1,
+        168,1,0,0,0,1,170,1,0,0,0,1,172,1,0,0,0,1,174,1,0,0,0,1,176,1,0,
+        0,0,1,178,1,0,0,0,1,180,1,0,0,0,1,182,1,0,0,0,1,184,1,0,0,0,1,186,
+        1,0,0,0,1,188,1,0,0,0,1,194,1,0,0,0,2,196,1,0,0,0,2,198,1,0,0,0,
+        3,200,1,0,0,0,3,202,1,0,0,0,3,204,1,0,0,0,3,206,1,0,0,0,3,208,1,
+        0,0,0,3,210,1,0,0,0,3,212,1,0,0,0,4,214,1,0,0,0,4,216,1,0,0,0,4,
+        218,1,0,0,0,4,220,1,0,0,0,4,222,1,0,0,0,4,224,1,0,0,0,4,226,1,0,
+        0,0,4,228,1,0,0,0,5,230,1,0,0,0,5,232,1,0,0,0,5,234,1,0,0,0,5,236,
+        1,0,0,0,5,238,1,0,0,0,5,240,1,0,0,0,5,242,1,0,0,0,6,244,1,0,0,0,
+        6,246,1,0,0,0,6,248,1,0,0,0,6,250,1,0,0,0,7,252,1,0,0,0,8,254,1,
+        0,0,0,9,256,1,0,0,0,9,258,1,0,0,0,9,260,1,0,0,0,9,262,1,0,0,0,9,
+        264,1,0,0,0,9,266,1,0,0,0,9,268,1,0,0,0,9,270,1,0,0,0,10,272,1,0,
+        0,0,10,274,1,0,0,0,10,276,1,0,0,0,10,278,1,0,0,0,10,280,1,0,0,0,
+        10,282,1,0,0,0,10,284,1,0,0,0,10,286,1,0,0,0,10,288,1,0,0,0,10,290,
+        1,0,0,0,10,292,1,0,0,0,10,294,1,0,0,0,10,296,1,0,0,0,10,298,1,0,
+        0,0,11,300,1,0,0,0,11,302,1,0,0,0,11,304,1,0,0,0,12,306,1,0,0,0,
+        12,308,1,0,0,0,12,310,1,0,0,0,13,312,1,0,0,0,13,314,1,0,0,0,13,316,
+        1,0,0,0,13,318,1,0,0,0,14,320,1,0,0,0,14,322,1,0,0,0,14,324,1,0,
+        0,0,14,326,1,0,0,0,14,328,1,0,0,0,14,330,1,0,0,0,14,332,1,0,0,0,
+        14,334,1,0,0,0,14,336,1,0,0,0,14,338,1,0,0,0,14,340,1,0,0,0,14,342,
+        1,0,0,0,14,344,1,0,0,0,15,346,1,0,0,0,15,348,1,0,0,0,15,350,1,0,
+        0,0,15,352,1,0,0,0,15,354,1,0,0,0,15,356,1,0,0,0,15,358,1,0,0,0,
+        16,360,1,0,0,0,16,362,1,0,0,0,16,364,1,0,0,0,16,366,1,0,0,0,16,368,
+        1,0,0,0,17,370,1,0,0,0,17,372,1,0,0,0,17,374,1,0,0,0,17,376,1,0,
+        0,0,18,378,1,0,0,0,18,380,1,0,0,0,18,382,1,0,0,0,18,384,1,0,0,0,
+        18,386,1,0,0,0,19,388,1,0,0,0,19,390,1,0,0,0,19,392,1,0,0,0,19,394,
+        1,0,0,0,19,396,1,0,0,0,19,398,1,0,0,0,19,400,1,0,0,0,19,402,1,0,
+        0,0,19,404,1,0,0,0,19,406,1,0,0,0,19,408,1,0,0,0,19,410,1,0,0,0,
+        19,412,1,0,0,0,19,414,1,0,0,0,19,416,1,0,0,0,19,418,1,0,0,0,19,420,
+        1,0,0,0,19,422,1,0,0,0,19,424,1,0,0,0,19,426,1,0,0,0,19,428,1,0,
+        0,0,19,430,1,0,0,0,19,432,1,0,0,0,19,434,1,0,0,0,19,436,1,0,0,0,
+        19,438,1,0,0,0,19,440,1,0,0,0,20,442,1,0,0,0,20,444,1,0,0,0,20,446,
+        1,0,0,0,20,448,1,0,0,0,20,450,1,0,0,0,20,452,1,0,0,0,20,454,1,0,
+        0,0,20,456,1,0,0,0,20,458,1,0,0,0,20,460,1,0,0,0,20,462,1,0,0,0,
+        20,464,1,0,0,0,20,466,1,0,0,0,20,468,1,0,0,0,20,470,1,0,0,0,20,472,
+        1,0,0,0,20,474,1,0,0,0,20,476,1,0,0,0,20,478,1,0,0,0,20,480,1,0,
+        0,0,21,482,1,0,0,0,21,484,1,0,0,0,21,486,1,0,0,0,21,488,1,0,0,0,
+        21,490,1,0,0,0,21,492,1,0,0,0,21,494,1,0,0,0,21,496,1,0,0,0,21,498,
+        1,0,0,0,21,500,1,0,0,0,21,502,1,0,0,0,21,504,1,0,0,0,21,506,1,0,
+        0,0,21,508,1,0,0,0,21,510,1,0,0,0,21,512,1,0,0,0,21,514,1,0,0,0,
+        21,516,1,0,0,0,21,518,1,0,0,0,21,520,1,0,0,0,21,522,1,0,0,0,21,524,
+        1,0,0,0,21,526,1,0,0,0,21,528,1,0,0,0,21,530,1,0,0,0,21,532,1,0,
+        0,0,21,534,1,0,0,0,21,536,1,0,0,0,21,538,1,0,0,0,21,540,1,0,0,0,
+        21,542,1,0,0,0,21,544,1,0,0,0,22,546,1,0,0,0,22,548,1,0,0,0,22,550,
+        1,0,0,0,22,552,1,0,0,0,22,554,1,0,0,0,22,556,1,0,0,0,22,558,1,0,
+        0,0,22,560,1,0,0,0,22,562,1,0,0,0,22,564,1,0,0,0,22,566,1,0,0,0,
+        22,568,1,0,0,0,22,570,1,0,0,0,22,572,1,0,0,0,22,574,1,0,0,0,22,576,
+        1,0,0,0,23,578,1,0,0,0,23,580,1,0,0,0,23,582,1,0,0,0,24,584,1,0,
+        0,0,24,586,1,0,0,0,24,588,1,0,0,0,24,590,1,0,0,0,25,592,1,0,0,0,
+        25,594,1,0,0,0,25,596,1,0,0,0,25,598,1,0,0,0,25,600,1,0,0,0,25,602,
+        1,0,0,0,25,604,1,0,0,0,25,606,1,0,0,0,25,608,1,0,0,0,25,610,1,0,
+        0,0,25,612,1,0,0,0,25,614,1,0,0,0,25,616,1,0,0,0,25,618,1,0,0,0,
+        25,620,1,0,0,0,25,622,1,0,0,0,25,624,1,0,0,0,26,626,1,0,0,0,26,628,
+        1,0,0,0,26,630,1,0,0,0,26,632,1,0,0,0,27,634,1,0,0,0,27,636,1,0,
+        0,0,27,638,1,0,0,0,27,640,1,0,0,0,28,642,1,0,0,0,30,653,1,0,0,0,
+        32,664,1,0,0,0,34,676,1,0,0,0,36,691,1,0,0,0,38,700,1,0,0,0,40,709,
+        1,0,0,0,42,718,1,0,0,0,44,727,1,0,0,0,46,736,1,0,0,0,48,746,1,0,
+        0,0,50,756,1,0,0,0,52,764,1,0,0,0,54,771,1,0,0,0,56,780,1,0,0,0,
+        58,816,1,0,0,0,60,860,1,0,0,0,62,862,1,0,0,0,64,864,1,0,0,0,66,866,
+        1,0,0,0,68,868,1,0,0,0,70,870,1,0,0,0,72,872,1,0,0,0,74,874,1,0,
+        0,0,76,876,1,0,0,0,78,878,1,0,0,0,80,880,1,0,0,0,82,882,1,0,0,0,
+        84,884,1,0,0,0,86,886,1,0,0,0,88,889,1,0,0,0,90,895,1,0,0,0,92,901,
+        1,0,0,0,94,907,1,0,0,0,96,916,1,0,0,0,98,923,1,0,0,0,100,941,1,0,
+        0,0,102,948,1,0,0,0,104,958,1,0,0,0,106,967,1,0,0,0,108,975,1,0,
+        0,0,110,983,1,0,0,0,112,991,1,0,0,0,114,997,1,0,0,0,116,1004,1,0,
+        0,0,118,1011,1,0,0,0,120,1020,1,0,0,0,122,1028,1,0,0,0,124,1040,
+        1,0,0,0,126,1047,1,0,0,0,128,1054,1,0,0,0,130,1065,1,0,0,0,132,1073,
+        1,0,0,0,134,1084,1,0,0,0,136,1093,1,0,0,0,138,1098,1,0,0,0,140,1114,
+        1,0,0,0,142,1121,1,0,0,0,144,1123,1,0,0,0,146,1125,1,0,0,0,148,1129,
+        1,0,0,0,150,1131,1,0,0,0,152,1133,1,0,0,0,154,1135,1,0,0,0,156,1137,
+        1,0,0,0,158,1151,1,0,0,0,160,1169,1,0,0,0,162,1175,1,0,0,0,164,1180,
+        1,0,0,0,166,1182,1,0,0,0,168,1184,1,0,0,0,170,1186,1,0,0,0,172,1188,
+        1,0,0,0,174,1190,1,0,0,0,176,1192,1,0,0,0,178,1195,1,0,0,0,180,1197,
+        1,0,0,0,182,1199,1,0,0,0,184,1201,1,0,0,0,186,1207,1,0,0,0,188,1229,
+        1,0,0,0,190,1238,1,0,0,0,192,1255,1,0,0,0,194,1278,1,0,0,0,196,1282,
+        1,0,0,0,198,1288,1,0,0,0,200,1293,1,0,0,0,202,1299,1,0,0,0,204,1304,
+        1,0,0,0,206,1308,1,0,0,0,208,1312,1,0,0,0,210,1316,1,0,0,0,212,1318,
+        1,0,0,0,214,1323,1,0,0,0,216,1329,1,0,0,0,218,1334,1,0,0,0,220,1342,
+        1,0,0,0,222,1350,1,0,0,0,224,1358,1,0,0,0,226,1369,1,0,0,0,228,1373,
+        1,0,0,0,230,1377,1,0,0,0,232,1382,1,0,0,0,234,1388,1,0,0,0,236,1394,
+        1,0,0,0,238,1398,1,0,0,0,240,1402,1,0,0,0,242,1406,1,0,0,0,244,1410,
+        1,0,0,0,246,1414,1,0,0,0,248,1419,1,0,0,0,250,1424,1,0,0,0,252,1433,
+        1,0,0,0,254,1447,1,0,0,0,256,1467,1,0,0,0,258,1473,1,0,0,0,260,1476,
+        1,0,0,0,262,1479,1,0,0,0,264,1483,1,0,0,0,266,1498,1,0,0,0,268,1502,
+        1,0,0,0,270,1504,1,0,0,0,272,1507,1,0,0,0,274,1513,1,0,0,0,276,1515,
+        1,0,0,0,278,1522,1,0,0,0,280,1529,1,0,0,0,282,1533,1,0,0,0,284,1544,
+        1,0,0,0,286,1549,1,0,0,0,288,1555,1,0,0,0,290,1560,1,0,0,0,292,1566,
+        1,0,0,0,294,1576,1,0,0,0,296,1580,1,0,0,0,298,1582,1,0,0,0,300,1587,
+        1,0,0,0,302,1600,1,0,0,0,304,1604,1,0,0,0,306,1609,1,0,0,0,308,1622,
+        1,0,0,0,310,1626,1,0,0,0,312,1631,1,0,0,0,314,1637,1,0,0,0,316,1640,
+        1,0,0,0,318,1643,1,0,0,0,320,1654,1,0,0,0,322,1657,1,0,0,0,324,1663,
+        1,0,0,0,326,1669,1,0,0,0,328,1675,1,0,0,0,330,1684,1,0,0,0,332,1686,
+        1,0,0,0,334,1689,1,0,0,0,336,1692,1,0,0,0,338,1698,1,0,0,0,340,1702,
+        1,0,0,0,342,1711,1,0,0,0,344,1720,1,0,0,0,346,1725,1,0,0,0,348,1731,
+        1,0,0,0,350,1733,1,0,0,0,352,1739,1,0,0,0,354,1741,1,0,0,0,356,1750,
+        1,0,0,0,358,1755,1,0,0,0,360,1760,1,0,0,0,362,1773,1,0,0,0,364,1777,
+        1,0,0,0,366,1779,1,0,0,0,368,1783,1,0,0,0,370,1788,1,0,0,0,372,1801,
+        1,0,0,0,374,1805,1,0,0,0,376,1807,1,0,0,0,378,1811,1,0,0,0,380,1815,
+        1,0,0,0,382,1820,1,0,0,0,384,1826,1,0,0,0,386,1828,1,0,0,0,388,1832,
+        1,0,0,0,390,1840,1,0,0,0,392,1845,1,0,0,0,394,1850,1,0,0,0,396,1854,
+        1,0,0,0,398,1862,1,0,0,0,400,1871,1,0,0,0,402,1879,1,0,0,0,404,1890,
+        1,0,0,0,406,1895,1,0,0,0,408,1903,1,0,0,0,410,1908,1,0,0,0,412,1914,
+        1,0,0,0,414,1921,1,0,0,0,416,1927,1,0,0,0,418,1933,1,0,0,0,420,1939,
+        1,0,0,0,422,1943,1,0,0,0,424,1947,1,0,0,0,426,1954,1,0,0,0,428,1961,
+        1,0,0,0,430,1969,1,0,0,0,432,1978,1,0,0,0,434,1981,1,0,0,0,436,1987,
+        1,0,0,0,438,1989,1,0,0,0,440,2000,1,0,0,0,442,2005,1,0,0,0,444,2011,
+        1,0,0,0,446,2013,1,0,0,0,448,2015,1,0,0,0,450,2019,1,0,0,0,452,2026,
+        1,0,0,0,454,2031,1,0,0,0,456,2035,1,0,0,0,458,2041,1,0,0,0,460,2046,
+        1,0,0,0,462,2055,1,0,0,0,464,2061,1,0,0,0,466,2067,1,0,0,0,468,2076,
+        1,0,0,0,470,2087,1,0,0,0,472,2094,1,0,0,0,474,2105,1,0,0,0,476,2108,
+        1,0,0,0,478,2112,1,0,0,0,480,2121,1,0,0,0,482,2126,1,0,0,0,484,2132,
+        1,0,0,0,486,2134,1,0,0,0,488,2137,1,0,0,0,490,2141,1,0,0,0,492,2145,
+        1,0,0,0,494,2151,1,0,0,0,496,2156,1,0,0,0,498,2163,1,0,0,0,500,2172,
+        1,0,0,0,502,2183,1,0,0,0,504,2188,1,0,0,0,506,2195,1,0,0,0,508,2203,
+        1,0,0,0,510,2213,1,0,0,0,512,2218,1,0,0,0,514,2225,1,0,0,0,516,2232,
+        1,0,0,0,518,2240,1,0,0,0,520,2249,1,0,0,0,522,2258,1,0,0,0,524,2267,
+        1,0,0,0,526,2278,1,0,0,0,528,2284,1,0,0,0,530,2294,1,0,0,0,532,2303,
+        1,0,0,0,534,2308,1,0,0,0,536,2318,1,0,0,0,538,2322,1,0,0,0,540,2328,
+        1,0,0,0,542,2336,1,0,0,0,544,2347,1,0,0,0,546,2352,1,0,0,0,548,2358,
+        1,0,0,0,550,2362,1,0,0,0,552,2366,1,0,0,0,554,2375,1,0,0,0,556,2379,
+        1,0,0,0,558,2386,1,0,0,0,560,2400,1,0,0,0,562,2402,1,0,0,0,564,2411,
+        1,0,0,0,566,2416,1,0,0,0,568,2418,1,0,0,0,570,2420,1,0,0,0,572,2424,
+        1,0,0,0,574,2432,1,0,0,0,576,2441,1,0,0,0,578,2446,1,0,0,0,580,2452,
+        1,0,0,0,582,2461,1,0,0,0,584,2468,1,0,0,0,586,2475,1,0,0,0,588,2479,
+        1,0,0,0,590,2483,1,0,0,0,592,2486,1,0,0,0,594,2492,1,0,0,0,596,2507,
+        1,0,0,0,598,2515,1,0,0,0,600,2522,1,0,0,0,602,2527,1,0,0,0,604,2529,
+        1,0,0,0,606,2535,1,0,0,0,608,2540,1,0,0,0,610,2547,1,0,0,0,612,2552,
+        1,0,0,0,614,2560,1,0,0,0,616,2567,1,0,0,0,618,2570,1,0,0,0,620,2579,
+        1,0,0,0,622,2583,1,0,0,0,624,2587,1,0,0,0,626,2590,1,0,0,0,628,2601,
+        1,0,0,0,630,2605,1,0,0,0,632,2609,1,0,0,0,634,2612,1,0,0,0,636,2624,
+        1,0,0,0,638,2628,1,0,0,0,640,2632,1,0,0,0,642,643,5,95,0,0,643,644,
+        7,0,0,0,644,645,7,1,0,0,645,646,7,2,0,0,646,647,7,2,0,0,647,648,
+        7,3,0,0,648,649,7,0,0,0,649,650,7,4,0,0,650,651,1,0,0,0,651,652,
+        6,0,0,0,652,29,1,0,0,0,653,654,5,95,0,0,654,655,7,5,0,0,655,656,
+        7,3,0,0,656,657,7,5,0,0,657,658,7,5,0,0,658,659,7,6,0,0,659,660,
+        7,1,0,0,660,661,7,2,0,0,661,662,1,0,0,0,662,663,6,1,1,0,663,31,1,
+        0,0,0,664,665,5,95,0,0,665,666,7,7,0,0,666,667,7,6,0,0,667,668,7,
+        5,0,0,668,669,7,0,0,0,669,670,7,1,0,0,670,671,7,2,0,0,671,672,7,
+        2,0,0,672,673,7,3,0,0,673,674,7,0,0,0,674,675,7,4,0,0,675,33,1,0,
+        0,0,676,677,5,45,0,0,677,678,5,45,0,0,678,682,1,0,0,0,679,681,9,
+        0,0,0,680,679,1,0,0,0,681,684,1,0,0,0,682,683,1,0,0,0,682,680,1,
+        0,0,0,683,687,1,0,0,0,684,682,1,0,0,0,685,688,3,60,16,0,686,688,
+        5,0,0,1,687,685,1,0,0,0,687,686,1,0,0,0,688,689,1,0,0,0,689,690,
+        6,3,2,0,690,35,1,0,0,0,691,692,7,0,0,0,692,693,7,8,0,0,693,694,7,
+        3,0,0,694,695,7,9,0,0,695,696,7,4,0,0,696,697,7,3,0,0,697,698,1,
+        0,0,0,698,699,6,4,3,0,699,37,1,0,0,0,700,701,7,6,0,0,701,702,7,2,
+        0,0,702,703,7,5,0,0,703,704,7,3,0,0,704,705,7,8,0,0,705,706,7,4,
+        0,0,706,707,1,0,0,0,707,708,6,5,3,0,708,39,1,0,0,0,709,710,7,10,
+        0,0,710,711,7,11,0,0,711,712,7,7,0,0,712,713,7,9,0,0,713,714,7,4,
+        0,0,714,715,7,3,0,0,715,716,1,0,0,0,716,717,6,6,3,0,717,41,1,0,0,
+        0,718,719,7,5,0,0,719,720,7,3,0,0,720,721,7,12,0,0,721,722,7,3,0,
+        0,722,723,7,0,0,0,723,724,7,4,0,0,724,725,1,0,0,0,725,726,6,7,3,
+        0,726,43,1,0,0,0,727,728,7,7,0,0,728,729,7,3,0,0,729,730,7,12,0,
+        0,730,731,7,3,0,0,731,732,7,4,0,0,732,733,7,3,0,0,733,734,1,0,0,
+        0,734,735,6,8,3,0,735,45,1,0,0,0,736,737,7,8,0,0,737,738,7,3,0,0,
+        738,739,7,11,0,0,739,740,7,12,0,0,740,741,7,9,0,0,741,742,7,0,0,
+        0,742,743,7,3,0,0,743,744,1,0,0,0,744,745,6,9,3,0,745,47,1,0,0,0,
+        746,747,7,7,0,0,747,748,7,3,0,0,748,749,7,0,0,0,749,750,7,12,0,0,
+        750,751,7,9,0,0,751,752,7,8,0,0,752,753,7,3,0,0,753,754,1,0,0,0,
+        754,755,6,10,4,0,755,49,1,0,0,0,756,757,7,13,0,0,757,758,7,3,0,0,
+        758,759,7,14,0,0,759,760,7,6,0,0,760,761,7,2,0,0,761,762,1,0,0,0,
+        762,763,6,11,4,0,763,51,1,0,0,0,764,765,7,7,0,0,765,766,7,8,0,0,
+        766,767,7,1,0,0,767,768,7,11,0,0,768,769,1,0,0,0,769,770,6,12,3,
+        0,770,53,1,0,0,0,771,772,7,0,0,0,772,773,7,1,0,0,773,774,7,15,0,
+        0,774,775,7,15,0,0,775,776,7,6,0,0,776,777,7,4,0,0,777,778,1,0,0,
+        0,778,779,6,13,3,0,779,55,1,0,0,0,780,781,7,8,0,0,781,782,7,1,0,
+        0,782,783,7,12,0,0,783,784,7,12,0,0,784,785,7,13,0,0,785,786,7,9,
+        0,0,786,787,7,0,0,0,787,788,7,16,0,0,788,789,1,0,0,0,789,790,6,14,
+        3,0,790,57,1,0,0,0,791,792,7,0,0,0,792,793,7,8,0,0,793,794,7,3,0,
+        0,794,795,7,9,0,0,795,796,7,4,0,0,796,817,7,3,0,0,797,798,7,8,0,
+        0,798,799,7,3,0,0,799,800,7,11,0,0,800,801,7,12,0,0,801,802,7,9,
+        0,0,802,803,7,0,0,0,803,817,7,3,0,0,804,805,7,9,0,0,805,806,7,12,
+        0,0,806,807,7,4,0,0,807,808,7,3,0,0,808,817,7,8,0,0,809,811,5,32,
+        0,0,810,809,1,0,0,0,811,812,1,0,0,0,812,810,1,0,0,0,812,813,1,0,
+        0,0,813,817,1,0,0,0,814,815,7,1,0,0,815,817,7,8,0,0,816,791,1,0,
+        0,0,816,797,1,0,0,0,816,804,1,0,0,0,816,810,1,0,0,0,816,814,1,0,
+        0,0,817,818,1,0,0,0,818,816,1,0,0,0,818,819,1,0,0,0,819,856,1,0,
+        0,0,820,821,7,11,0,0,821,822,7,8,0,0,822,823,7,1,0,0,823,824,7,0,
+        0,0,824,825,7,3,0,0,825,826,7,7,0,0,826,827,7,10,0,0,827,828,7,8,
+        0,0,828,857,7,3,0,0,829,830,7,17,0,0,830,831,7,10,0,0,831,832,7,
+        2,0,0,832,833,7,0,0,0,833,834,7,4,0,0,834,835,7,6,0,0,835,836,7,
+        1,0,0,836,857,7,2,0,0,837,838,7,0,0,0,838,839,7,12,0,0,839,840,7,
+        9,0,0,840,841,7,5,0,0,841,857,7,5,0,0,842,843,7,4,0,0,843,844,7,
+        8,0,0,844,845,7,6,0,0,845,846,7,14,0,0,846,847,7,14,0,0,847,848,
+        7,3,0,0,848,857,7,8,0,0,849,850,7,11,0,0,850,851,7,9,0,0,851,852,
+        7,0,0,0,852,853,7,16,0,0,853,854,7,9,0,0,854,855,7,14,0,0,855,857,
+        7,3,0,0,856,820,1,0,0,0,856,829,1,0,0,0,856,837,1,0,0,0,856,842,
+        1,0,0,0,856,849,1,0,0,0,857,858,1,0,0,0,858,859,6,15,4,0,859,59,
+        1,0,0,0,860,861,5,10,0,0,861,61,1,0,0,0,862,863,5,44,0,0,863,63,
+        1,0,0,0,864,865,5,59,0,0,865,65,1,0,0,0,866,867,5,58,0,0,867,67,
+        1,0,0,0,868,869,5,64,0,0,869,69,1,0,0,0,870,871,5,46,0,0,871,71,
+        1,0,0,0,872,873,5,47,0,0,873,73,1,0,0,0,874,875,5,40,0,0,875,75,
+        1,0,0,0,876,877,5,41,0,0,877,77,1,0,0,0,878,879,5,91,0,0,879,79,
+        1,0,0,0,880,881,5,93,0,0,881,81,1,0,0,0,882,883,5,34,0,0,883,83,
+        1,0,0,0,884,885,5,39,0,0,885,85,1,0,0,0,886,887,5,92,0,0,887,87,
+        1,0,0,0,888,890,7,18,0,0,889,888,1,0,0,0,890,891,1,0,0,0,891,889,
+        1,0,0,0,891,892,1,0,0,0,892,893,1,0,0,0,893,894,6,30,2,0,894,89,
+        1,0,0,0,895,896,5,95,0,0,896,897,7,3,0,0,897,898,7,19,0,0,898,899,
+        7,6,0,0,899,900,7,4,0,0,900,91,1,0,0,0,901,902,5,95,0,0,902,903,
+        7,20,0,0,903,904,7,10,0,0,904,905,7,6,0,0,905,906,7,4,0,0,906,93,
+        1,0,0,0,907,908,5,95,0,0,908,909,7,5,0,0,909,910,7,12,0,0,910,911,
+        7,3,0,0,911,912,7,3,0,0,912,913,7,11,0,0,913,914,1,0,0,0,914,915,
+        6,33,5,0,915,95,1,0,0,0,916,917,5,95,0,0,917,918,7,10,0,0,918,919,
+        7,5,0,0,919,920,7,3,0,0,920,921,1,0,0,0,921,922,6,34,6,0,922,97,
+        1,0,0,0,923,924,5,95,0,0,924,925,7,3,0,0,925,926,7,0,0,0,926,927,
+        7,21,0,0,927,928,7,1,0,0,928,932,1,0,0,0,929,931,9,0,0,0,930,929,
+        1,0,0,0,931,934,1,0,0,0,932,933,1,0,0,0,932,930,1,0,0,0,933,937,
+        1,0,0,0,934,932,1,0,0,0,935,938,3,60,16,0,936,938,5,0,0,1,937,935,
+        1,0,0,0,937,936,1,0,0,0,938,939,1,0,0,0,939,940,6,35,7,0,940,99,
+        1,0,0,0,941,942,5,62,0,0,942,943,5,32,0,0,943,944,5,123,0,0,944,
+        945,5,37,0,0,945,946,1,0,0,0,946,947,6,36,8,0,947,101,1,0,0,0,948,
+        949,5,95,0,0,949,950,7,9,0,0,950,951,7,5,0,0,951,952,7,5,0,0,952,
+        953,7,3,0,0,953,954,7,8,0,0,954,955,7,4,0,0,955,956,1,0,0,0,956,
+        957,6,37,9,0,957,103,1,0,0,0,958,959,5,95,0,0,959,960,7,5,0,0,960,
+        961,7,4,0,0,961,962,7,9,0,0,962,963,7,8,0,0,963,964,7,4,0,0,964,
+        965,1,0,0,0,965,966,6,38,10,0,966,105,1,0,0,0,967,968,5,95,0,0,968,
+        969,7,12,0,0,969,970,7,1,0,0,970,971,7,9,0,0,971,972,7,7,0,0,972,
+        973,1,0,0,0,973,974,6,39,11,0,974,107,1,0,0,0,975,976,5,95,0,0,976,
+        977,7,21,0,0,977,978,7,1,0,0,978,979,7,5,0,0,979,980,7,4,0,0,980,
+        981,1,0,0,0,981,982,6,40,12,0,982,109,1,0,0,0,983,984,5,95,0,0,984,
+        985,7,21,0,0,985,986,7,3,0,0,986,987,7,12,0,0,987,988,7,11,0,0,988,
+        989,1,0,0,0,989,990,6,41,13,0,990,111,1,0,0,0,991,992,5,95,0,0,992,
+        993,7,6,0,0,993,994,7,17,0,0,994,995,1,0,0,0,995,996,6,42,14,0,996,
+        113,1,0,0,0,997,998,5,95,0,0,998,999,7,3,0,0,999,1000,7,2,0,0,1000,
+        1001,7,7,0,0,1001,1002,7,6,0,0,1002,1003,7,17,0,0,1003,115,1,0,0,
+        0,1004,1005,5,95,0,0,1005,1006,7,5,0,0,1006,1007,7,3,0,0,1007,1008,
+        7,4,0,0,1008,1009,1,0,0,0,1009,1010,6,44,15,0,1010,117,1,0,0,0,1011,
+        1012,5,95,0,0,1012,1013,7,5,0,0,1013,1014,7,11,0,0,1014,1015,7,1,
+        0,0,1015,1016,7,1,0,0,1016,1017,7,12,0,0,1017,1018,1,0,0,0,1018,
+        1019,6,45,16,0,1019,119,1,0,0,0,1020,1021,5,95,0,0,1021,1022,7,12,
+        0,0,1022,1023,7,1,0,0,1023,1024,7,1,0,0,1024,1025,7,11,0,0,1025,
+        1026,1,0,0,0,1026,1027,6,46,17,0,1027,121,1,0,0,0,1028,1029,5,95,
+        0,0,1029,1030,7,22,0,0,1030,1031,7,21,0,0,1031,1032,7,3,0,0,1032,
+        1033,7,2,0,0,1033,1034,7,3,0,0,1034,1035,7,23,0,0,1035,1036,7,3,
+        0,0,1036,1037,7,8,0,0,1037,1038,1,0,0,0,1038,1039,6,47,18,0,1039,
+        123,1,0,0,0,1040,1041,5,95,0,0,1041,1042,7,5,0,0,1042,1043,7,5,0,
+        0,1043,1044,7,21,0,0,1044,1045,1,0,0,0,1045,1046,6,48,19,0,1046,
+        125,1,0,0,0,1047,1048,5,95,0,0,1048,1049,7,24,0,0,1049,1050,7,1,
+        0,0,1050,1051,7,13,0,0,1051,1052,1,0,0,0,1052,1053,6,49,20,0,1053,
+        127,1,0,0,0,1054,1055,5,95,0,0,1055,1056,7,0,0,0,1056,1057,7,1,0,
+        0,1057,1058,7,15,0,0,1058,1059,7,11,0,0,1059,1060,7,9,0,0,1060,1061,
+        7,8,0,0,1061,1062,7,3,0,0,1062,1063,1,0,0,0,1063,1064,6,50,21,0,
+        1064,129,1,0,0,0,1065,1066,5,95,0,0,1066,1067,7,7,0,0,1067,1068,
+        7,9,0,0,1068,1069,7,4,0,0,1069,1070,7,9,0,0,1070,1071,1,0,0,0,1071,
+        1072,6,51,22,0,1072,131,1,0,0,0,1073,1074,5,95,0,0,1074,1075,7,15,
+        0,0,1075,1076,7,1,0,0,1076,1077,7,2,0,0,1077,1078,7,6,0,0,1078,1079,
+        7,4,0,0,1079,1080,7,1,0,0,1080,1081,7,8,0,0,1081,1082,1,0,0,0,1082,
+        1083,6,52,23,0,1083,133,1,0,0,0,1084,1086,5,95,0,0,1085,1087,7,25,
+        0,0,1086,1085,1,0,0,0,1087,1088,1,0,0,0,1088,1086,1,0,0,0,1088,1089,
+        1,0,0,0,1089,1090,1,0,0,0,1090,1091,6,53,24,0,1091,135,1,0,0,0,1092,
+        1094,3,148,60,0,1093,1092,1,0,0,0,1094,1095,1,0,0,0,1095,1093,1,
+        0,0,0,1095,1096,1,0,0,0,1096,137,1,0,0,0,1097,1099,3,148,60,0,1098,
+        1097,1,0,0,0,1099,1100,1,0,0,0,1100,1098,1,0,0,0,1100,1101,1,0,0,
+        0,1101,1102,1,0,0,0,1102,1104,5,46,0,0,1103,1105,3,148,60,0,1104,
+        1103,1,0,0,0,1105,1106,1,0,0,0,1106,1104,1,0,0,0,1106,1107,1,0,0,
+        0,1107,139,1,0,0,0,1108,1115,3,154,63,0,1109,1115,3,142,57,0,1110,
+        1115,3,144,58,0,1111,1115,3,146,59,0,1112,1115,3,156,64,0,1113,1115,
+        3,158,65,0,1114,1108,1,0,0,0,1114,1109,1,0,0,0,1114,1110,1,0,0,0,
+        1114,1111,1,0,0,0,1114,1112,1,0,0,0,1114,1113,1,0,0,0,1115,1116,
+        1,0,0,0,1116,1114,1,0,0,0,1116,1117,1,0,0,0,1117,141,1,0,0,0,1118,
+        1122,3,150,61,0,1119,1122,3,148,60,0,1120,1122,7,26,0,0,1121,1118,
+        1,0,0,0,1121,1119,1,0,0,0,1121,1120,1,0,0,0,1122,143,1,0,0,0,1123,
+        1124,7,27,0,0,1124,145,1,0,0,0,1125,1126,5,37,0,0,1126,1127,3,152,
+        62,0,1127,1128,3,152,62,0,1128,147,1,0,0,0,1129,1130,7,28,0,0,1130,
+        149,1,0,0,0,1131,1132,7,25,0,0,1132,151,1,0,0,0,1133,1134,7,29,0,
+        0,1134,153,1,0,0,0,1135,1136,2,255,65535,0,1136,155,1,0,0,0,1137,
+        1146,5,34,0,0,1138,1145,8,30,0,0,1139,1142,5,92,0,0,1140,1143,5,
+        10,0,0,1141,1143,9,0,0,0,1142,1140,1,0,0,0,1142,1141,1,0,0,0,1143,
+        1145,1,0,0,0,1144,1138,1,0,0,0,1144,1139,1,0,0,0,1145,1148,1,0,0,
+        0,1146,1144,1,0,0,0,1146,1147,1,0,0,0,1147,1149,1,0,0,0,1148,1146,
+        1,0,0,0,1149,1150,5,34,0,0,1150,157,1,0,0,0,1151,1163,5,39,0,0,1152,
+        1162,8,31,0,0,1153,1159,5,92,0,0,1154,1156,5,13,0,0,1155,1154,1,
+        0,0,0,1155,1156,1,0,0,0,1156,1157,1,0,0,0,1157,1160,5,10,0,0,1158,
+        1160,9,0,0,0,1159,1155,1,0,0,0,1159,1158,1,0,0,0,1160,1162,1,0,0,
+        0,1161,1152,1,0,0,0,1161,1153,1,0,0,0,1162,1165,1,0,0,0,1163,1161,
+        1,0,0,0,1163,1164,1,0,0,0,1164,1166,1,0,0,0,1165,1163,1,0,0,0,1166,
+        1167,5,39,0,0,1167,159,1,0,0,0,1168,1170,7,18,0,0,1169,1168,1,0,
+        0,0,1170,1171,1,0,0,0,1171,1169,1,0,0,0,1171,1172,1,0,0,0,1172,1173,
+        1,0,0,0,1173,1174,6,66,2,0,1174,161,1,0,0,0,1175,1176,5,10,0,0,1176,
+        1177,1,0,0,0,1177,1178,6,67,25,0,1178,1179,6,67,26,0,1179,163,1,
+        0,0,0,1180,1181,5,64,0,0,1181,165,1,0,0,0,1182,1183,5,47,0,0,1183,
+        167,1,0,0,0,1184,1185,5,58,0,0,1185,169,1,0,0,0,1186,1187,5,63,0,
+        0,1187,171,1,0,0,0,1188,1189,5,35,0,0,1189,173,1,0,0,0,1190,1191,
+        5,124,0,0,1191,175,1,0,0,0,1192,1193,5,47,0,0,1193,1194,5,47,0,0,
+        1194,177,1,0,0,0,1195,1196,5,61,0,0,1196,179,1,0,0,0,1197,1198,5,
+        38,0,0,1198,181,1,0,0,0,1199,1200,5,59,0,0,1200,183,1,0,0,0,1201,
+        1202,7,24,0,0,1202,1203,7,7,0,0,1203,1204,7,13,0,0,1204,1205,7,0,
+        0,0,1205,185,1,0,0,0,1206,1208,3,148,60,0,1207,1206,1,0,0,0,1208,
+        1209,1,0,0,0,1209,1207,1,0,0,0,1209,1210,1,0,0,0,1210,1211,1,0,0,
+        0,1211,1213,5,46,0,0,1212,1214,3,148,60,0,1213,1212,1,0,0,0,1214,
+        1215,1,0,0,0,1215,1213,1,0,0,0,1215,1216,1,0,0,0,1216,1217,1,0,0,
+        0,1217,1219,5,46,0,0,1218,1220,3,148,60,0,1219,1218,1,0,0,0,1220,
+        1221,1,0,0,0,1221,1219,1,0,0,0,1221,1222,1,0,0,0,1222,1223,1,0,0,
+        0,1223,1225,5,46,0,0,1224,1226,3,148,60,0,1225,1224,1,0,0,0,1226,
+        1227,1,0,0,0,1227,1225,1,0,0,0,1227,1228,1,0,0,0,1228,187,1,0,0,
+        0,1229,1232,5,91,0,0,1230,1233,3,152,62,0,1231,1233,7,32,0,0,1232,
+        1230,1,0,0,0,1232,1231,1,0,0,0,1233,1234,1,0,0,0,1234,1232,1,0,0,
+        0,1234,1235,1,0,0,0,1235,1236,1,0,0,0,1236,1237,5,93,0,0,1237,189,
+        1,0,0,0,1238,1250,5,34,0,0,1239,1249,8,30,0,0,1240,1246,5,92,0,0,
+        1241,1243,5,13,0,0,1242,1241,1,0,0,0,1242,1243,1,0,0,0,1243,1244,
+        1,0,0,0,1244,1247,5,10,0,0,1245,1247,9,0,0,0,1246,1242,1,0,0,0,1246,
+        1245,1,0,0,0,1247,1249,1,0,0,0,1248,1239,1,0,0,0,1248,1240,1,0,0,
+        0,1249,1252,1,0,0,0,1250,1248,1,0,0,0,1250,1251,1,0,0,0,1251,1253,
+        1,0,0,0,1252,1250,1,0,0,0,1253,1254,5,34,0,0,1254,191,1,0,0,0,1255,
+        1267,5,39,0,0,1256,1266,8,31,0,0,1257,1263,5,92,0,0,1258,1260,5,
+        13,0,0,1259,1258,1,0,0,0,1259,1260,1,0,0,0,1260,1261,1,0,0,0,1261,
+        1264,5,10,0,0,1262,1264,9,0,0,0,1263,1259,1,0,0,0,1263,1262,1,0,
+        0,0,1264,1266,1,0,0,0,1265,1256,1,0,0,0,1265,1257,1,0,0,0,1266,1269,
+        1,0,0,0,1267,1265,1,0,0,0,1267,1268,1,0,0,0,1268,1270,1,0,0,0,1269,
+        1267,1,0,0,0,1270,1271,5,39,0,0,1271,193,1,0,0,0,1272,1279,3,154,
+        63,0,1273,1279,3,142,57,0,1274,1279,3,146,59,0,1275,1279,3,190,81,
+        0,1276,1279,3,192,82,0,1277,1279,7,33,0,0,1278,1272,1,0,0,0,1278,
+        1273,1,0,0,0,1278,1274,1,0,0,0,1278,1275,1,0,0,0,1278,1276,1,0,0,
+        0,1278,1277,1,0,0,0,1279,1280,1,0,0,0,1280,1278,1,0,0,0,1280,1281,
+        1,0,0,0,1281,195,1,0,0,0,1282,1283,5,10,0,0,1283,1284,1,0,0,0,1284,
+        1285,6,84,25,0,1285,1286,6,84,26,0,1286,197,1,0,0,0,1287,1289,8,
+        34,0,0,1288,1287,1,0,0,0,1289,1290,1,0,0,0,1290,1288,1,0,0,0,1290,
+        1291,1,0,0,0,1291,199,1,0,0,0,1292,1294,7,18,0,0,1293,1292,1,0,0,
+        0,1294,1295,1,0,0,0,1295,1293,1,0,0,0,1295,1296,1,0,0,0,1296,1297,
+        1,0,0,0,1297,1298,6,86,2,0,1298,201,1,0,0,0,1299,1300,7,21,0,0,1300,
+        1301,7,6,0,0,1301,1302,7,2,0,0,1302,1303,7,4,0,0,1303,203,1,0,0,
+        0,1304,1305,5,91,0,0,1305,1306,1,0,0,0,1306,1307,6,88,27,0,1307,
+        205,1,0,0,0,1308,1309,5,93,0,0,1309,1310,1,0,0,0,1310,1311,6,89,
+        28,0,1311,207,1,0,0,0,1312,1313,5,10,0,0,1313,1314,1,0,0,0,1314,
+        1315,6,90,26,0,1315,209,1,0,0,0,1316,1317,3,140,56,0,1317,211,1,
+        0,0,0,1318,1319,9,0,0,0,1319,1320,1,0,0,0,1320,1321,6,92,29,0,1321,
+        213,1,0,0,0,1322,1324,7,18,0,0,1323,1322,1,0,0,0,1324,1325,1,0,0,
+        0,1325,1323,1,0,0,0,1325,1326,1,0,0,0,1326,1327,1,0,0,0,1327,1328,
+        6,93,30,0,1328,215,1,0,0,0,1329,1330,7,5,0,0,1330,1331,7,9,0,0,1331,
+        1332,7,23,0,0,1332,1333,7,3,0,0,1333,217,1,0,0,0,1334,1335,7,8,0,
+        0,1335,1336,7,3,0,0,1336,1337,7,12,0,0,1337,1338,7,3,0,0,1338,1339,
+        7,9,0,0,1339,1340,7,5,0,0,1340,1341,7,3,0,0,1341,219,1,0,0,0,1342,
+        1343,7,8,0,0,1343,1344,7,3,0,0,1344,1345,7,5,0,0,1345,1346,7,4,0,
+        0,1346,1347,7,1,0,0,1347,1348,7,8,0,0,1348,1349,7,3,0,0,1349,221,
+        1,0,0,0,1350,1351,7,5,0,0,1351,1352,7,9,0,0,1352,1353,7,23,0,0,1353,
+        1354,7,3,0,0,1354,1355,7,10,0,0,1355,1356,7,8,0,0,1356,1357,7,12,
+        0,0,1357,223,1,0,0,0,1358,1359,7,5,0,0,1359,1360,7,21,0,0,1360,1361,
+        7,1,0,0,1361,1362,7,22,0,0,1362,225,1,0,0,0,1363,1370,3,154,63,0,
+        1364,1370,3,142,57,0,1365,1370,3,146,59,0,1366,1370,3,190,81,0,1367,
+        1370,3,192,82,0,1368,1370,7,33,0,0,1369,1363,1,0,0,0,1369,1364,1,
+        0,0,0,1369,1365,1,0,0,0,1369,1366,1,0,0,0,1369,1367,1,0,0,0,1369,
+        1368,1,0,0,0,1370,1371,1,0,0,0,1371,1369,1,0,0,0,1371,1372,1,0,0,
+        0,1372,227,1,0,0,0,1373,1374,5,59,0,0,1374,1375,1,0,0,0,1375,1376,
+        6,100,31,0,1376,229,1,0,0,0,1377,1378,5,10,0,0,1378,1379,1,0,0,0,
+        1379,1380,6,101,30,0,1380,231,1,0,0,0,1381,1383,7,18,0,0,1382,1381,
+        1,0,0,0,1383,1384,1,0,0,0,1384,1382,1,0,0,0,1384,1385,1,0,0,0,1385,
+        1386,1,0,0,0,1386,1387,6,102,30,0,1387,233,1,0,0,0,1388,1389,5,10,
+        0,0,1389,1390,5,47,0,0,1390,1391,1,0,0,0,1391,1392,6,103,32,0,1392,
+        1393,6,103,31,0,1393,235,1,0,0,0,1394,1395,5,59,0,0,1395,1396,1,
+        0,0,0,1396,1397,6,104,31,0,1397,237,1,0,0,0,1398,1399,3,140,56,0,
+        1399,1400,1,0,0,0,1400,1401,6,105,30,0,1401,239,1,0,0,0,1402,1403,
+        3,158,65,0,1403,1404,1,0,0,0,1404,1405,6,106,30,0,1405,241,1,0,0,
+        0,1406,1407,9,0,0,0,1407,1408,1,0,0,0,1408,1409,6,107,30,0,1409,
+        243,1,0,0,0,1410,1411,5,10,0,0,1411,1412,1,0,0,0,1412,1413,6,108,
+        30,0,1413,245,1,0,0,0,1414,1415,5,10,0,0,1415,1416,5,47,0,0,1416,
+        1417,1,0,0,0,1417,1418,6,109,31,0,1418,247,1,0,0,0,1419,1420,5,47,
+        0,0,1420,1421,1,0,0,0,1421,1422,6,110,30,0,1422,249,1,0,0,0,1423,
+        1425,8,35,0,0,1424,1423,1,0,0,0,1425,1426,1,0,0,0,1426,1424,1,0,
+        0,0,1426,1427,1,0,0,0,1427,1428,1,0,0,0,1428,1429,6,111,30,0,1429,
+        251,1,0,0,0,1430,1432,9,0,0,0,1431,1430,1,0,0,0,1432,1435,1,0,0,
+        0,1433,1434,1,0,0,0,1433,1431,1,0,0,0,1434,1440,1,0,0,0,1435,1433,
+        1,0,0,0,1436,1437,5,10,0,0,1437,1438,5,37,0,0,1438,1441,5,125,0,
+        0,1439,1441,5,0,0,1,1440,1436,1,0,0,0,1440,1439,1,0,0,0,1441,1442,
+        1,0,0,0,1442,1443,6,112,26,0,1443,253,1,0,0,0,1444,1446,9,0,0,0,
+        1445,1444,1,0,0,0,1446,1449,1,0,0,0,1447,1448,1,0,0,0,1447,1445,
+        1,0,0,0,1448,1450,1,0,0,0,1449,1447,1,0,0,0,1450,1451,7,3,0,0,1451,
+        1452,7,0,0,0,1452,1453,7,21,0,0,1453,1454,7,1,0,0,1454,1456,1,0,
+        0,0,1455,1457,7,18,0,0,1456,1455,1,0,0,0,1457,1458,1,0,0,0,1458,
+        1456,1,0,0,0,1458,1459,1,0,0,0,1459,1460,1,0,0,0,1460,1461,7,1,0,
+        0,1461,1462,7,17,0,0,1462,1463,7,17,0,0,1463,1464,1,0,0,0,1464,1465,
+        6,113,26,0,1465,255,1,0,0,0,1466,1468,7,18,0,0,1467,1466,1,0,0,0,
+        1468,1469,1,0,0,0,1469,1467,1,0,0,0,1469,1470,1,0,0,0,1470,1471,
+        1,0,0,0,1471,1472,6,114,2,0,1472,257,1,0,0,0,1473,1474,5,123,0,0,
+        1474,1475,5,37,0,0,1475,259,1,0,0,0,1476,1477,5,37,0,0,1477,1478,
+        5,125,0,0,1478,261,1,0,0,0,1479,1480,3,60,16,0,1480,1481,1,0,0,0,
+        1481,1482,6,117,26,0,1482,263,1,0,0,0,1483,1487,3,258,115,0,1484,
+        1486,9,0,0,0,1485,1484,1,0,0,0,1486,1489,1,0,0,0,1487,1488,1,0,0,
+        0,1487,1485,1,0,0,0,1488,1490,1,0,0,0,1489,1487,1,0,0,0,1490,1491,
+        3,260,116,0,1491,265,1,0,0,0,1492,1499,3,154,63,0,1493,1499,3,142,
+        57,0,1494,1499,3,146,59,0,1495,1499,3,156,64,0,1496,1499,3,158,65,
+        0,1497,1499,7,36,0,0,1498,1492,1,0,0,0,1498,1493,1,0,0,0,1498,1494,
+        1,0,0,0,1498,1495,1,0,0,0,1498,1496,1,0,0,0,1498,1497,1,0,0,0,1499,
+        1500,1,0,0,0,1500,1498,1,0,0,0,1500,1501,1,0,0,0,1501,267,1,0,0,
+        0,1502,1503,5,44,0,0,1503,269,1,0,0,0,1504,1505,5,59,0,0,1505,271,
+        1,0,0,0,1506,1508,7,18,0,0,1507,1506,1,0,0,0,1508,1509,1,0,0,0,1509,
+        1507,1,0,0,0,1509,1510,1,0,0,0,1510,1511,1,0,0,0,1511,1512,6,122,
+        2,0,1512,273,1,0,0,0,1513,1514,5,61,0,0,1514,275,1,0,0,0,1515,1516,
+        7,11,0,0,1516,1517,7,12,0,0,1517,1518,7,10,0,0,1518,1519,7,14,0,
+        0,1519,1520,7,6,0,0,1520,1521,7,2,0,0,1521,277,1,0,0,0,1522,1523,
+        7,5,0,0,1523,1524,7,0,0,0,1524,1525,7,8,0,0,1525,1526,7,6,0,0,1526,
+        1527,7,11,0,0,1527,1528,7,4,0,0,1528,279,1,0,0,0,1529,1530,7,15,
+        0,0,1530,1531,7,9,0,0,1531,1532,7,11,0,0,1532,281,1,0,0,0,1533,1534,
+        7,24,0,0,1534,1535,7,7,0,0,1535,1536,7,13,0,0,1536,1537,7,0,0,0,
+        1537,1538,7,7,0,0,1538,1539,7,8,0,0,1539,1540,7,6,0,0,1540,1541,
+        7,23,0,0,1541,1542,7,3,0,0,1542,1543,7,8,0,0,1543,283,1,0,0,0,1544,
+        1545,7,17,0,0,1545,1546,7,6,0,0,1546,1547,7,12,0,0,1547,1548,7,3,
+        0,0,1548,285,1,0,0,0,1549,1550,7,0,0,0,1550,1551,7,12,0,0,1551,1552,
+        7,9,0,0,1552,1553,7,5,0,0,1553,1554,7,5,0,0,1554,287,1,0,0,0,1555,
+        1556,7,2,0,0,1556,1557,7,9,0,0,1557,1558,7,15,0,0,1558,1559,7,3,
+        0,0,1559,289,1,0,0,0,1560,1561,7,11,0,0,1561,1562,7,8,0,0,1562,1563,
+        7,1,0,0,1563,1564,7,11,0,0,1564,1565,7,5,0,0,1565,291,1,0,0,0,1566,
+        1567,7,10,0,0,1567,1568,7,8,0,0,1568,1569,7,12,0,0,1569,293,1,0,
+        0,0,1570,1577,3,154,63,0,1571,1577,3,142,57,0,1572,1577,3,146,59,
+        0,1573,1577,3,156,64,0,1574,1577,3,158,65,0,1575,1577,7,36,0,0,1576,
+        1570,1,0,0,0,1576,1571,1,0,0,0,1576,1572,1,0,0,0,1576,1573,1,0,0,
+        0,1576,1574,1,0,0,0,1576,1575,1,0,0,0,1577,1578,1,0,0,0,1578,1576,
+        1,0,0,0,1578,1579,1,0,0,0,1579,295,1,0,0,0,1580,1581,5,59,0,0,1581,
+        297,1,0,0,0,1582,1583,3,60,16,0,1583,1584,1,0,0,0,1584,1585,6,135,
+        26,0,1585,299,1,0,0,0,1586,1588,7,18,0,0,1587,1586,1,0,0,0,1588,
+        1589,1,0,0,0,1589,1587,1,0,0,0,1589,1590,1,0,0,0,1590,1591,1,0,0,
+        0,1591,1592,6,136,2,0,1592,301,1,0,0,0,1593,1601,3,154,63,0,1594,
+        1601,3,142,57,0,1595,1601,3,144,58,0,1596,1601,3,146,59,0,1597,1601,
+        3,156,64,0,1598,1601,3,158,65,0,1599,1601,7,36,0,0,1600,1593,1,0,
+        0,0,1600,1594,1,0,0,0,1600,1595,1,0,0,0,1600,1596,1,0,0,0,1600,1597,
+        1,0,0,0,1600,1598,1,0,0,0,1600,1599,1,0,0,0,1601,1602,1,0,0,0,1602,
+        1600,1,0,0,0,1602,1603,1,0,0,0,1603,303,1,0,0,0,1604,1605,3,60,16,
+        0,1605,1606,1,0,0,0,1606,1607,6,138,26,0,1607,305,1,0,0,0,1608,1610,
+        7,18,0,0,1609,1608,1,0,0,0,1610,1611,1,0,0,0,1611,1609,1,0,0,0,1611,
+        1612,1,0,0,0,1612,1613,1,0,0,0,1613,1614,6,139,2,0,1614,307,1,0,
+        0,0,1615,1623,3,154,63,0,1616,1623,3,142,57,0,1617,1623,3,144,58,
+        0,1618,1623,3,146,59,0,1619,1623,3,156,64,0,1620,1623,3,158,65,0,
+        1621,1623,7,37,0,0,1622,1615,1,0,0,0,1622,1616,1,0,0,0,1622,1617,
+        1,0,0,0,1622,1618,1,0,0,0,1622,1619,1,0,0,0,1622,1620,1,0,0,0,1622,
+        1621,1,0,0,0,1623,1624,1,0,0,0,1624,1622,1,0,0,0,1624,1625,1,0,0,
+        0,1625,309,1,0,0,0,1626,1627,3,60,16,0,1627,1628,1,0,0,0,1628,1629,
+        6,141,26,0,1629,311,1,0,0,0,1630,1632,7,18,0,0,1631,1630,1,0,0,0,
+        1632,1633,1,0,0,0,1633,1631,1,0,0,0,1633,1634,1,0,0,0,1634,1635,
+        1,0,0,0,1635,1636,6,142,2,0,1636,313,1,0,0,0,1637,1638,5,123,0,0,
+        1638,1639,5,37,0,0,1639,315,1,0,0,0,1640,1641,5,37,0,0,1641,1642,
+        5,125,0,0,1642,317,1,0,0,0,1643,1647,3,314,143,0,1644,1646,9,0,0,
+        0,1645,1644,1,0,0,0,1646,1649,1,0,0,0,1647,1648,1,0,0,0,1647,1645,
+        1,0,0,0,1648,1650,1,0,0,0,1649,1647,1,0,0,0,1650,1651,3,316,144,
+        0,1651,1652,1,0,0,0,1652,1653,6,145,26,0,1653,319,1,0,0,0,1654,1655,
+        5,59,0,0,1655,321,1,0,0,0,1656,1658,7,18,0,0,1657,1656,1,0,0,0,1658,
+        1659,1,0,0,0,1659,1657,1,0,0,0,1659,1660,1,0,0,0,1660,1661,1,0,0,
+        0,1661,1662,6,147,2,0,1662,323,1,0,0,0,1663,1664,7,13,0,0,1664,1665,
+        7,3,0,0,1665,1666,7,14,0,0,1666,1667,7,6,0,0,1667,1668,7,2,0,0,1668,
+        325,1,0,0,0,1669,1670,7,10,0,0,1670,1671,7,2,0,0,1671,1672,7,4,0,
+        0,1672,1673,7,6,0,0,1673,1674,7,12,0,0,1674,327,1,0,0,0,1675,1676,
+        7,6,0,0,1676,1677,7,2,0,0,1677,1678,7,4,0,0,1678,1679,7,3,0,0,1679,
+        1680,7,8,0,0,1680,1681,7,23,0,0,1681,1682,7,9,0,0,1682,1683,7,12,
+        0,0,1683,329,1,0,0,0,1684,1685,3,136,54,0,1685,331,1,0,0,0,1686,
+        1687,5,123,0,0,1687,1688,5,37,0,0,1688,333,1,0,0,0,1689,1690,5,37,
+        0,0,1690,1691,5,125,0,0,1691,335,1,0,0,0,1692,1693,7,13,0,0,1693,
+        1694,7,8,0,0,1694,1695,7,3,0,0,1695,1696,7,9,0,0,1696,1697,7,16,
+        0,0,1697,337,1,0,0,0,1698,1699,7,3,0,0,1699,1700,7,2,0,0,1700,1701,
+        7,7,0,0,1701,339,1,0,0,0,1702,1703,7,0,0,0,1703,1704,7,1,0,0,1704,
+        1705,7,2,0,0,1705,1706,7,4,0,0,1706,1707,7,6,0,0,1707,1708,7,2,0,
+        0,1708,1709,7,10,0,0,1709,1710,7,3,0,0,1710,341,1,0,0,0,1711,1715,
+        3,332,152,0,1712,1714,9,0,0,0,1713,1712,1,0,0,0,1714,1717,1,0,0,
+        0,1715,1716,1,0,0,0,1715,1713,1,0,0,0,1716,1718,1,0,0,0,1717,1715,
+        1,0,0,0,1718,1719,3,334,153,0,1719,343,1,0,0,0,1720,1721,3,60,16,
+        0,1721,1722,1,0,0,0,1722,1723,6,158,26,0,1723,345,1,0,0,0,1724,1726,
+        7,18,0,0,1725,1724,1,0,0,0,1726,1727,1,0,0,0,1727,1725,1,0,0,0,1727,
+        1728,1,0,0,0,1728,1729,1,0,0,0,1729,1730,6,159,2,0,1730,347,1,0,
+        0,0,1731,1732,3,136,54,0,1732,349,1,0,0,0,1733,1734,7,3,0,0,1734,
+        1735,7,8,0,0,1735,1736,7,8,0,0,1736,1737,7,1,0,0,1737,1738,7,8,0,
+        0,1738,351,1,0,0,0,1739,1740,5,59,0,0,1740,353,1,0,0,0,1741,1742,
+        7,0,0,0,1742,1743,7,1,0,0,1743,1744,7,2,0,0,1744,1745,7,4,0,0,1745,
+        1746,7,6,0,0,1746,1747,7,2,0,0,1747,1748,7,10,0,0,1748,1749,7,3,
+        0,0,1749,355,1,0,0,0,1750,1751,7,3,0,0,1751,1752,7,19,0,0,1752,1753,
+        7,6,0,0,1753,1754,7,4,0,0,1754,357,1,0,0,0,1755,1756,3,60,16,0,1756,
+        1757,1,0,0,0,1757,1758,6,165,26,0,1758,359,1,0,0,0,1759,1761,7,18,
+        0,0,1760,1759,1,0,0,0,1761,1762,1,0,0,0,1762,1760,1,0,0,0,1762,1763,
+        1,0,0,0,1763,1764,1,0,0,0,1764,1765,6,166,2,0,1765,361,1,0,0,0,1766,
+        1774,3,154,63,0,1767,1774,3,142,57,0,1768,1774,3,144,58,0,1769,1774,
+        3,146,59,0,1770,1774,3,156,64,0,1771,1774,3,158,65,0,1772,1774,7,
+        38,0,0,1773,1766,1,0,0,0,1773,1767,1,0,0,0,1773,1768,1,0,0,0,1773,
+        1769,1,0,0,0,1773,1770,1,0,0,0,1773,1771,1,0,0,0,1773,1772,1,0,0,
+        0,1774,1775,1,0,0,0,1775,1773,1,0,0,0,1775,1776,1,0,0,0,1776,363,
+        1,0,0,0,1777,1778,5,59,0,0,1778,365,1,0,0,0,1779,1780,7,1,0,0,1780,
+        1781,7,17,0,0,1781,1782,7,17,0,0,1782,367,1,0,0,0,1783,1784,3,60,
+        16,0,1784,1785,1,0,0,0,1785,1786,6,170,26,0,1786,369,1,0,0,0,1787,
+        1789,7,18,0,0,1788,1787,1,0,0,0,1789,1790,1,0,0,0,1790,1788,1,0,
+        0,0,1790,1791,1,0,0,0,1791,1792,1,0,0,0,1792,1793,6,171,2,0,1793,
+        371,1,0,0,0,1794,1802,3,154,63,0,1795,1802,3,142,57,0,1796,1802,
+        3,144,58,0,1797,1802,3,146,59,0,1798,1802,3,156,64,0,1799,1802,3,
+        158,65,0,1800,1802,7,38,0,0,1801,1794,1,0,0,0,1801,1795,1,0,0,0,
+        1801,1796,1,0,0,0,1801,1797,1,0,0,0,1801,1798,1,0,0,0,1801,1799,
+        1,0,0,0,1801,1800,1,0,0,0,1802,1803,1,0,0,0,1803,1801,1,0,0,0,1803,
+        1804,1,0,0,0,1804,373,1,0,0,0,1805,1806,5,59,0,0,1806,375,1,0,0,
+        0,1807,1808,3,60,16,0,1808,1809,1,0,0,0,1809,1810,6,174,26,0,1810,
+        377,1,0,0,0,1811,1812,7,9,0,0,1812,1813,7,11,0,0,1813,1814,7,6,0,
+        0,1814,379,1,0,0,0,1815,1816,7,5,0,0,1816,1817,7,20,0,0,1817,1818,
+        7,12,0,0,1818,381,1,0,0,0,1819,1821,7,18,0,0,1820,1819,1,0,0,0,1821,
+        1822,1,0,0,0,1822,1820,1,0,0,0,1822,1823,1,0,0,0,1823,1824,1,0,0,
+        0,1824,1825,6,177,2,0,1825,383,1,0,0,0,1826,1827,5,59,0,0,1827,385,
+        1,0,0,0,1828,1829,3,60,16,0,1829,1830,1,0,0,0,1830,1831,6,179,26,
+        0,1831,387,1,0,0,0,1832,1833,7,0,0,0,1833,1834,7,1,0,0,1834,1835,
+        7,2,0,0,1835,1836,7,2,0,0,1836,1837,7,3,0,0,1837,1838,7,0,0,0,1838,
+        1839,7,4,0,0,1839,389,1,0,0,0,1840,1841,7,22,0,0,1841,1842,7,6,0,
+        0,1842,1843,7,4,0,0,1843,1844,7,21,0,0,1844,391,1,0,0,0,1845,1846,
+        7,10,0,0,1846,1847,7,5,0,0,1847,1848,7,3,0,0,1848,1849,7,8,0,0,1849,
+        393,1,0,0,0,1850,1851,7,5,0,0,1851,1852,7,3,0,0,1852,1853,7,4,0,
+        0,1853,395,1,0,0,0,1854,1855,7,16,0,0,1855,1856,7,3,0,0,1856,1857,
+        7,39,0,0,1857,1858,7,17,0,0,1858,1859,7,6,0,0,1859,1860,7,12,0,0,
+        1860,1861,7,3,0,0,1861,397,1,0,0,0,1862,1863,7,11,0,0,1863,1864,
+        7,9,0,0,1864,1865,7,5,0,0,1865,1866,7,5,0,0,1866,1867,7,22,0,0,1867,
+        1868,7,1,0,0,1868,1869,7,8,0,0,1869,1870,7,7,0,0,1870,399,1,0,0,
+        0,1871,1872,7,3,0,0,1872,1873,7,19,0,0,1873,1874,7,3,0,0,1874,1875,
+        7,0,0,0,1875,1876,7,10,0,0,1876,1877,7,4,0,0,1877,1878,7,3,0,0,1878,
+        401,1,0,0,0,1879,1880,7,7,0,0,1880,1881,7,6,0,0,1881,1882,7,5,0,
+        0,1882,1883,7,0,0,0,1883,1884,7,1,0,0,1884,1885,7,2,0,0,1885,1886,
+        7,2,0,0,1886,1887,7,3,0,0,1887,1888,7,0,0,0,1888,1889,7,4,0,0,1889,
+        403,1,0,0,0,1890,1891,7,5,0,0,1891,1892,7,9,0,0,1892,1893,7,23,0,
+        0,1893,1894,7,3,0,0,1894,405,1,0,0,0,1895,1896,7,8,0,0,1896,1897,
+        7,3,0,0,1897,1898,7,5,0,0,1898,1899,7,4,0,0,1899,1900,7,1,0,0,1900,
+        1901,7,8,0,0,1901,1902,7,3,0,0,1902,407,1,0,0,0,1903,1904,7,5,0,
+        0,1904,1905,7,17,0,0,1905,1906,7,4,0,0,1906,1907,7,11,0,0,1907,409,
+        1,0,0,0,1908,1909,7,0,0,0,1909,1910,7,21,0,0,1910,1911,7,15,0,0,
+        1911,1912,7,1,0,0,1912,1913,7,7,0,0,1913,411,1,0,0,0,1914,1915,7,
+        14,0,0,1915,1916,7,3,0,0,1916,1917,7,4,0,0,1917,1918,7,0,0,0,1918,
+        1919,7,22,0,0,1919,1920,7,7,0,0,1920,413,1,0,0,0,1921,1922,7,0,0,
+        0,1922,1923,7,21,0,0,1923,1924,7,7,0,0,1924,1925,7,6,0,0,1925,1926,
+        7,8,0,0,1926,415,1,0,0,0,1927,1928,7,0,0,0,1928,1929,7,21,0,0,1929,
+        1930,7,1,0,0,1930,1931,7,22,0,0,1931,1932,7,2,0,0,1932,417,1,0,0,
+        0,1933,1934,7,15,0,0,1934,1935,7,16,0,0,1935,1936,7,7,0,0,1936,1937,
+        7,6,0,0,1937,1938,7,8,0,0,1938,419,1,0,0,0,1939,1940,7,14,0,0,1940,
+        1941,7,3,0,0,1941,1942,7,4,0,0,1942,421,1,0,0,0,1943,1944,7,11,0,
+        0,1944,1945,7,10,0,0,1945,1946,7,4,0,0,1946,423,1,0,0,0,1947,1948,
+        7,8,0,0,1948,1949,7,3,0,0,1949,1950,7,15,0,0,1950,1951,7,1,0,0,1951,
+        1952,7,23,0,0,1952,1953,7,3,0,0,1953,425,1,0,0,0,1954,1955,7,8,0,
+        0,1955,1956,7,3,0,0,1956,1957,7,2,0,0,1957,1958,7,9,0,0,1958,1959,
+        7,15,0,0,1959,1960,7,3,0,0,1960,427,1,0,0,0,1961,1962,7,12,0,0,1962,
+        1963,7,6,0,0,1963,1964,7,5,0,0,1964,1965,7,4,0,0,1965,1966,7,7,0,
+        0,1966,1967,7,6,0,0,1967,1968,7,8,0,0,1968,429,1,0,0,0,1969,1970,
+        7,4,0,0,1970,1971,7,8,0,0,1971,1972,7,10,0,0,1972,1973,7,2,0,0,1973,
+        1974,7,0,0,0,1974,1975,7,9,0,0,1975,1976,7,4,0,0,1976,1977,7,3,0,
+        0,1977,431,1,0,0,0,1978,1979,5,61,0,0,1979,433,1,0,0,0,1980,1982,
+        7,18,0,0,1981,1980,1,0,0,0,1982,1983,1,0,0,0,1983,1981,1,0,0,0,1983,
+        1984,1,0,0,0,1984,1985,1,0,0,0,1985,1986,6,203,2,0,1986,435,1,0,
+        0,0,1987,1988,5,59,0,0,1988,437,1,0,0,0,1989,1990,3,60,16,0,1990,
+        1991,1,0,0,0,1991,1992,6,205,26,0,1992,439,1,0,0,0,1993,2001,3,154,
+        63,0,1994,2001,3,142,57,0,1995,2001,3,144,58,0,1996,2001,3,146,59,
+        0,1997,2001,3,156,64,0,1998,2001,3,158,65,0,1999,2001,7,40,0,0,2000,
+        1993,1,0,0,0,2000,1994,1,0,0,0,2000,1995,1,0,0,0,2000,1996,1,0,0,
+        0,2000,1997,1,0,0,0,2000,1998,1,0,0,0,2000,1999,1,0,0,0,2001,2002,
+        1,0,0,0,2002,2000,1,0,0,0,2002,2003,1,0,0,0,2003,441,1,0,0,0,2004,
+        2006,7,18,0,0,2005,2004,1,0,0,0,2006,2007,1,0,0,0,2007,2005,1,0,
+        0,0,2007,2008,1,0,0,0,2008,2009,1,0,0,0,2009,2010,6,207,2,0,2010,
+        443,1,0,0,0,2011,2012,5,59,0,0,2012,445,1,0,0,0,2013,2014,5,61,0,
+        0,2014,447,1,0,0,0,2015,2016,3,60,16,0,2016,2017,1,0,0,0,2017,2018,
+        6,210,26,0,2018,449,1,0,0,0,2019,2020,7,0,0,0,2020,2021,7,8,0,0,
+        2021,2022,7,3,0,0,2022,2023,7,9,0,0,2023,2024,7,4,0,0,2024,2025,
+        7,3,0,0,2025,451,1,0,0,0,2026,2027,7,5,0,0,2027,2028,7,21,0,0,2028,
+        2029,7,1,0,0,2029,2030,7,22,0,0,2030,453,1,0,0,0,2031,2032,7,5,0,
+        0,2032,2033,7,3,0,0,2033,2034,7,4,0,0,2034,455,1,0,0,0,2035,2036,
+        7,5,0,0,2036,2037,7,4,0,0,2037,2038,7,9,0,0,2038,2039,7,8,0,0,2039,
+        2040,7,4,0,0,2040,457,1,0,0,0,2041,2042,7,22,0,0,2042,2043,7,9,0,
+        0,2043,2044,7,6,0,0,2044,2045,7,4,0,0,2045,459,1,0,0,0,2046,2047,
+        7,5,0,0,2047,2048,7,21,0,0,2048,2049,7,10,0,0,2049,2050,7,4,0,0,
+        2050,2051,7,7,0,0,2051,2052,7,1,0,0,2052,2053,7,22,0,0,2053,2054,
+        7,2,0,0,2054,461,1,0,0,0,2055,2056,7,9,0,0,2056,2057,7,13,0,0,2057,
+        2058,7,1,0,0,2058,2059,7,8,0,0,2059,2060,7,4,0,0,2060,463,1,0,0,
+        0,2061,2062,7,4,0,0,2062,2063,7,6,0,0,2063,2064,7,15,0,0,2064,2065,
+        7,3,0,0,2065,2066,7,8,0,0,2066,465,1,0,0,0,2067,2068,7,8,0,0,2068,
+        2069,7,3,0,0,2069,2070,7,14,0,0,2070,2071,7,6,0,0,2071,2072,7,5,
+        0,0,2072,2073,7,4,0,0,2073,2074,7,3,0,0,2074,2075,7,8,0,0,2075,467,
+        1,0,0,0,2076,2077,7,7,0,0,2077,2078,7,3,0,0,2078,2079,7,8,0,0,2079,
+        2080,7,3,0,0,2080,2081,7,14,0,0,2081,2082,7,6,0,0,2082,2083,7,5,
+        0,0,2083,2084,7,4,0,0,2084,2085,7,3,0,0,2085,2086,7,8,0,0,2086,469,
+        1,0,0,0,2087,2088,7,22,0,0,2088,2089,7,1,0,0,2089,2090,7,8,0,0,2090,
+        2091,7,16,0,0,2091,2092,7,3,0,0,2092,2093,7,8,0,0,2093,471,1,0,0,
+        0,2094,2095,7,24,0,0,2095,2096,7,1,0,0,2096,2097,7,13,0,0,2097,2098,
+        7,15,0,0,2098,2099,7,9,0,0,2099,2100,7,2,0,0,2100,2101,7,9,0,0,2101,
+        2102,7,14,0,0,2102,2103,7,3,0,0,2103,2104,7,8,0,0,2104,473,1,0,0,
+        0,2105,2106,7,1,0,0,2106,2107,7,2,0,0,2107,475,1,0,0,0,2108,2109,
+        7,1,0,0,2109,2110,7,17,0,0,2110,2111,7,17,0,0,2111,477,1,0,0,0,2112,
+        2113,7,4,0,0,2113,2114,7,1,0,0,2114,479,1,0,0,0,2115,2122,3,154,
+        63,0,2116,2122,3,142,57,0,2117,2122,3,146,59,0,2118,2122,3,156,64,
+        0,2119,2122,3,158,65,0,2120,2122,7,41,0,0,2121,2115,1,0,0,0,2121,
+        2116,1,0,0,0,2121,2117,1,0,0,0,2121,2118,1,0,0,0,2121,2119,1,0,0,
+        0,2121,2120,1,0,0,0,2122,2123,1,0,0,0,2123,2121,1,0,0,0,2123,2124,
+        1,0,0,0,2124,481,1,0,0,0,2125,2127,7,18,0,0,2126,2125,1,0,0,0,2127,
+        2128,1,0,0,0,2128,2126,1,0,0,0,2128,2129,1,0,0,0,2129,2130,1,0,0,
+        0,2130,2131,6,227,2,0,2131,483,1,0,0,0,2132,2133,5,59,0,0,2133,485,
+        1,0,0,0,2134,2135,5,61,0,0,2135,2136,5,62,0,0,2136,487,1,0,0,0,2137,
+        2138,3,60,16,0,2138,2139,1,0,0,0,2139,2140,6,230,26,0,2140,489,1,
+        0,0,0,2141,2142,7,5,0,0,2142,2143,7,3,0,0,2143,2144,7,4,0,0,2144,
+        491,1,0,0,0,2145,2146,7,10,0,0,2146,2147,7,2,0,0,2147,2148,7,5,0,
+        0,2148,2149,7,3,0,0,2149,2150,7,4,0,0,2150,493,1,0,0,0,2151,2152,
+        7,15,0,0,2152,2153,7,9,0,0,2153,2154,7,5,0,0,2154,2155,7,16,0,0,
+        2155,495,1,0,0,0,2156,2157,7,2,0,0,2157,2158,7,1,0,0,2158,2159,7,
+        15,0,0,2159,2160,7,9,0,0,2160,2161,7,5,0,0,2161,2162,7,16,0,0,2162,
+        497,1,0,0,0,2163,2164,7,15,0,0,2164,2165,7,9,0,0,2165,2166,7,5,0,
+        0,2166,2167,7,16,0,0,2167,2168,7,12,0,0,2168,2169,7,6,0,0,2169,2170,
+        7,2,0,0,2170,2171,7,3,0,0,2171,499,1,0,0,0,2172,2173,7,2,0,0,2173,
+        2174,7,1,0,0,2174,2175,7,15,0,0,2175,2176,7,9,0,0,2176,2177,7,5,
+        0,0,2177,2178,7,16,0,0,2178,2179,7,12,0,0,2179,2180,7,6,0,0,2180,
+        2181,7,2,0,0,2181,2182,7,3,0,0,2182,501,1,0,0,0,2183,2184,7,0,0,
+        0,2184,2185,7,9,0,0,2185,2186,7,5,0,0,2186,2187,7,3,0,0,2187,503,
+        1,0,0,0,2188,2189,7,2,0,0,2189,2190,7,1,0,0,2190,2191,7,0,0,0,2191,
+        2192,7,9,0,0,2192,2193,7,5,0,0,2193,2194,7,3,0,0,2194,505,1,0,0,
+        0,2195,2196,7,6,0,0,2196,2197,7,14,0,0,2197,2198,7,13,0,0,2198,2199,
+        7,12,0,0,2199,2200,7,9,0,0,2200,2201,7,2,0,0,2201,2202,7,16,0,0,
+        2202,507,1,0,0,0,2203,2204,7,2,0,0,2204,2205,7,1,0,0,2205,2206,7,
+        6,0,0,2206,2207,7,14,0,0,2207,2208,7,13,0,0,2208,2209,7,12,0,0,2209,
+        2210,7,9,0,0,2210,2211,7,2,0,0,2211,2212,7,16,0,0,2212,509,1,0,0,
+        0,2213,2214,7,4,0,0,2214,2215,7,8,0,0,2215,2216,7,6,0,0,2216,2217,
+        7,15,0,0,2217,511,1,0,0,0,2218,2219,7,2,0,0,2219,2220,7,1,0,0,2220,
+        2221,7,4,0,0,2221,2222,7,8,0,0,2222,2223,7,6,0,0,2223,2224,7,15,
+        0,0,2224,513,1,0,0,0,2225,2226,7,1,0,0,2226,2227,7,10,0,0,2227,2228,
+        7,4,0,0,2228,2229,7,11,0,0,2229,2230,7,10,0,0,2230,2231,7,4,0,0,
+        2231,515,1,0,0,0,2232,2233,7,0,0,0,2233,2234,7,1,0,0,2234,2235,7,
+        2,0,0,2235,2236,7,5,0,0,2236,2237,7,1,0,0,2237,2238,7,12,0,0,2238,
+        2239,7,3,0,0,2239,517,1,0,0,0,2240,2241,7,7,0,0,2241,2242,7,6,0,
+        0,2242,2243,7,17,0,0,2243,2244,7,17,0,0,2244,2245,7,17,0,0,2245,
+        2246,7,6,0,0,2246,2247,7,12,0,0,2247,2248,7,3,0,0,2248,519,1,0,0,
+        0,2249,2250,7,21,0,0,2250,2251,7,4,0,0,2251,2252,7,15,0,0,2252,2253,
+        7,12,0,0,2253,2254,7,17,0,0,2254,2255,7,6,0,0,2255,2256,7,12,0,0,
+        2256,2257,7,3,0,0,2257,521,1,0,0,0,2258,2259,7,5,0,0,2259,2260,7,
+        16,0,0,2260,2261,7,6,0,0,2261,2262,7,11,0,0,2262,2263,7,12,0,0,2263,
+        2264,7,6,0,0,2264,2265,7,2,0,0,2265,2266,7,3,0,0,2266,523,1,0,0,
+        0,2267,2268,7,2,0,0,2268,2269,7,1,0,0,2269,2270,7,5,0,0,2270,2271,
+        7,16,0,0,2271,2272,7,6,0,0,2272,2273,7,11,0,0,2273,2274,7,12,0,0,
+        2274,2275,7,6,0,0,2275,2276,7,2,0,0,2276,2277,7,3,0,0,2277,525,1,
+        0,0,0,2278,2279,7,8,0,0,2279,2280,7,3,0,0,2280,2281,7,5,0,0,2281,
+        2282,7,3,0,0,2282,2283,7,4,0,0,2283,527,1,0,0,0,2284,2285,7,9,0,
+        0,2285,2286,7,12,0,0,2286,2287,7,14,0,0,2287,2288,7,1,0,0,2288,2289,
+        7,8,0,0,2289,2290,7,6,0,0,2290,2291,7,4,0,0,2291,2292,7,21,0,0,2292,
+        2293,7,15,0,0,2293,529,1,0,0,0,2294,2295,7,3,0,0,2295,2296,7,2,0,
+        0,2296,2297,7,0,0,0,2297,2298,7,1,0,0,2298,2299,7,7,0,0,2299,2300,
+        7,6,0,0,2300,2301,7,2,0,0,2301,2302,7,14,0,0,2302,531,1,0,0,0,2303,
+        2304,7,22,0,0,2304,2305,7,1,0,0,2305,2306,7,8,0,0,2306,2307,7,16,
+        0,0,2307,533,1,0,0,0,2308,2309,7,8,0,0,2309,2310,7,3,0,0,2310,2311,
+        7,17,0,0,2311,2312,7,3,0,0,2312,2313,7,8,0,0,2313,2314,7,3,0,0,2314,
+        2315,7,2,0,0,2315,2316,7,0,0,0,2316,2317,7,3,0,0,2317,535,1,0,0,
+        0,2318,2319,7,12,0,0,2319,2320,7,0,0,0,2320,2321,7,5,0,0,2321,537,
+        1,0,0,0,2322,2323,7,15,0,0,2323,2324,7,39,0,0,2324,2325,7,3,0,0,
+        2325,2326,7,8,0,0,2326,2327,7,5,0,0,2327,539,1,0,0,0,2328,2329,7,
+        7,0,0,2329,2330,7,6,0,0,2330,2331,7,17,0,0,2331,2332,7,17,0,0,2332,
+        2333,7,12,0,0,2333,2334,7,6,0,0,2334,2335,7,13,0,0,2335,541,1,0,
+        0,0,2336,2337,7,9,0,0,2337,2338,7,10,0,0,2338,2339,7,4,0,0,2339,
+        2340,7,1,0,0,2340,543,1,0,0,0,2341,2348,3,154,63,0,2342,2348,3,142,
+        57,0,2343,2348,3,146,59,0,2344,2348,3,156,64,0,2345,2348,3,158,65,
+        0,2346,2348,7,41,0,0,2347,2341,1,0,0,0,2347,2342,1,0,0,0,2347,2343,
+        1,0,0,0,2347,2344,1,0,0,0,2347,2345,1,0,0,0,2347,2346,1,0,0,0,2348,
+        2349,1,0,0,0,2349,2347,1,0,0,0,2349,2350,1,0,0,0,2350,545,1,0,0,
+        0,2351,2353,7,42,0,0,2352,2351,1,0,0,0,2353,2354,1,0,0,0,2354,2352,
+        1,0,0,0,2354,2355,1,0,0,0,2355,2356,1,0,0,0,2356,2357,6,259,2,0,
+        2357,547,1,0,0,0,2358,2359,5,59,0,0,2359,2360,1,0,0,0,2360,2361,
+        6,260,26,0,2361,549,1,0,0,0,2362,2363,7,5,0,0,2363,2364,7,3,0,0,
+        2364,2365,7,4,0,0,2365,551,1,0,0,0,2366,2367,7,5,0,0,2367,2368,7,
+        3,0,0,2368,2369,7,3,0,0,2369,2370,7,7,0,0,2370,2371,7,17,0,0,2371,
+        2372,7,6,0,0,2372,2373,7,12,0,0,2373,2374,7,3,0,0,2374,553,1,0,0,
+        0,2375,2376,7,7,0,0,2376,2377,7,6,0,0,2377,2378,7,8,0,0,2378,555,
+        1,0,0,0,2379,2380,7,0,0,0,2380,2381,7,8,0,0,2381,2382,7,3,0,0,2382,
+        2383,7,9,0,0,2383,2384,7,4,0,0,2384,2385,7,3,0,0,2385,557,1,0,0,
+        0,2386,2387,7,17,0,0,2387,2388,7,6,0,0,2388,2389,7,12,0,0,2389,2390,
+        7,3,0,0,2390,559,1,0,0,0,2391,2392,7,17,0,0,2392,2401,7,5,0,0,2393,
+        2394,7,15,0,0,2394,2395,7,3,0,0,2395,2401,7,15,0,0,2396,2397,7,21,
+        0,0,2397,2398,7,7,0,0,2398,2399,7,17,0,0,2399,2401,7,5,0,0,2400,
+        2391,1,0,0,0,2400,2393,1,0,0,0,2400,2396,1,0,0,0,2401,561,1,0,0,
+        0,2402,2403,7,21,0,0,2403,2404,7,7,0,0,2404,2405,7,17,0,0,2405,2406,
+        7,5,0,0,2406,2407,7,10,0,0,2407,2408,7,5,0,0,2408,2409,7,3,0,0,2409,
+        2410,7,8,0,0,2410,563,1,0,0,0,2411,2412,7,8,0,0,2412,2413,7,1,0,
+        0,2413,2414,7,22,0,0,2414,2415,7,5,0,0,2415,565,1,0,0,0,2416,2417,
+        3,136,54,0,2417,567,1,0,0,0,2418,2419,5,44,0,0,2419,569,1,0,0,0,
+        2420,2421,5,40,0,0,2421,2422,1,0,0,0,2422,2423,6,271,33,0,2423,571,
+        1,0,0,0,2424,2425,7,0,0,0,2425,2426,7,1,0,0,2426,2427,7,2,0,0,2427,
+        2428,7,23,0,0,2428,2429,7,3,0,0,2429,2430,7,8,0,0,2430,2431,7,4,
+        0,0,2431,573,1,0,0,0,2432,2433,7,4,0,0,2433,2434,7,1,0,0,2434,575,
+        1,0,0,0,2435,2442,3,154,63,0,2436,2442,3,142,57,0,2437,2442,3,146,
+        59,0,2438,2442,3,156,64,0,2439,2442,3,158,65,0,2440,2442,7,41,0,
+        0,2441,2435,1,0,0,0,2441,2436,1,0,0,0,2441,2437,1,0,0,0,2441,2438,
+        1,0,0,0,2441,2439,1,0,0,0,2441,2440,1,0,0,0,2442,2443,1,0,0,0,2443,
+        2441,1,0,0,0,2443,2444,1,0,0,0,2444,577,1,0,0,0,2445,2447,7,42,0,
+        0,2446,2445,1,0,0,0,2447,2448,1,0,0,0,2448,2446,1,0,0,0,2448,2449,
+        1,0,0,0,2449,2450,1,0,0,0,2450,2451,6,275,2,0,2451,579,1,0,0,0,2452,
+        2453,5,41,0,0,2453,581,1,0,0,0,2454,2456,9,0,0,0,2455,2454,1,0,0,
+        0,2456,2459,1,0,0,0,2457,2458,1,0,0,0,2457,2455,1,0,0,0,2458,2460,
+        1,0,0,0,2459,2457,1,0,0,0,2460,2462,3,580,276,0,2461,2457,1,0,0,
+        0,2462,2463,1,0,0,0,2463,2461,1,0,0,0,2463,2464,1,0,0,0,2464,2465,
+        1,0,0,0,2465,2466,6,277,26,0,2466,583,1,0,0,0,2467,2469,7,18,0,0,
+        2468,2467,1,0,0,0,2469,2470,1,0,0,0,2470,2468,1,0,0,0,2470,2471,
+        1,0,0,0,2471,2472,1,0,0,0,2472,2473,6,278,2,0,2473,585,1,0,0,0,2474,
+        2476,7,43,0,0,2475,2474,1,0,0,0,2476,2477,1,0,0,0,2477,2475,1,0,
+        0,0,2477,2478,1,0,0,0,2478,587,1,0,0,0,2479,2480,3,60,16,0,2480,
+        2481,1,0,0,0,2481,2482,6,280,26,0,2482,589,1,0,0,0,2483,2484,5,59,
+        0,0,2484,591,1,0,0,0,2485,2487,7,18,0,0,2486,2485,1,0,0,0,2487,2488,
+        1,0,0,0,2488,2486,1,0,0,0,2488,2489,1,0,0,0,2489,2490,1,0,0,0,2490,
+        2491,6,282,2,0,2491,593,1,0,0,0,2492,2493,7,15,0,0,2493,2494,7,1,
+        0,0,2494,2495,7,2,0,0,2495,2496,7,6,0,0,2496,2497,7,4,0,0,2497,2498,
+        7,1,0,0,2498,2499,7,8,0,0,2499,2500,7,15,0,0,2500,2501,7,9,0,0,2501,
+        2502,7,2,0,0,2502,2503,7,9,0,0,2503,2504,7,14,0,0,2504,2505,7,3,
+        0,0,2505,2506,7,8,0,0,2506,595,1,0,0,0,2507,2508,7,22,0,0,2508,2509,
+        7,1,0,0,2509,2510,7,8,0,0,2510,2511,7,16,0,0,2511,2512,7,3,0,0,2512,
+        2513,7,8,0,0,2513,2514,7,5,0,0,2514,597,1,0,0,0,2515,2516,7,0,0,
+        0,2516,2517,7,8,0,0,2517,2518,7,3,0,0,2518,2519,7,9,0,0,2519,2520,
+        7,4,0,0,2520,2521,7,3,0,0,2521,599,1,0,0,0,2522,2523,7,4,0,0,2523,
+        2524,7,9,0,0,2524,2525,7,5,0,0,2525,2526,7,16,0,0,2526,601,1,0,0,
+        0,2527,2528,5,61,0,0,2528,603,1,0,0,0,2529,2530,7,5,0,0,2530,2531,
+        7,4,0,0,2531,2532,7,9,0,0,2532,2533,7,8,0,0,2533,2534,7,4,0,0,2534,
+        605,1,0,0,0,2535,2536,7,5,0,0,2536,2537,7,4,0,0,2537,2538,7,1,0,
+        0,2538,2539,7,11,0,0,2539,607,1,0,0,0,2540,2541,7,8,0,0,2541,2542,
+        7,3,0,0,2542,2543,7,11,0,0,2543,2544,7,1,0,0,2544,2545,7,8,0,0,2545,
+        2546,7,4,0,0,2546,609,1,0,0,0,2547,2548,7,12,0,0,2548,2549,7,6,0,
+        0,2549,2550,7,5,0,0,2550,2551,7,4,0,0,2551,611,1,0,0,0,2552,2553,
+        7,5,0,0,2553,2554,7,10,0,0,2554,2555,7,15,0,0,2555,2556,7,15,0,0,
+        2556,2557,7,9,0,0,2557,2558,7,8,0,0,2558,2559,7,39,0,0,2559,613,
+        1,0,0,0,2560,2561,7,3,0,0,2561,2562,7,19,0,0,2562,2563,7,11,0,0,
+        2563,2564,7,1,0,0,2564,2565,7,8,0,0,2565,2566,7,4,0,0,2566,615,1,
+        0,0,0,2567,2568,7,1,0,0,2568,2569,7,2,0,0,2569,617,1,0,0,0,2570,
+        2571,7,1,0,0,2571,2572,7,17,0,0,2572,2573,7,17,0,0,2573,619,1,0,
+        0,0,2574,2580,3,154,63,0,2575,2580,3,142,57,0,2576,2580,3,146,59,
+        0,2577,2580,3,156,64,0,2578,2580,3,158,65,0,2579,2574,1,0,0,0,2579,
+        2575,1,0,0,0,2579,2576,1,0,0,0,2579,2577,1,0,0,0,2579,2578,1,0,0,
+        0,2580,2581,1,0,0,0,2581,2579,1,0,0,0,2581,2582,1,0,0,0,2582,621,
+        1,0,0,0,2583,2584,3,60,16,0,2584,2585,1,0,0,0,2585,2586,6,297,26,
+        0,2586,623,1,0,0,0,2587,2588,5,59,0,0,2588,625,1,0,0,0,2589,2591,
+        7,18,0,0,2590,2589,1,0,0,0,2591,2592,1,0,0,0,2592,2590,1,0,0,0,2592,
+        2593,1,0,0,0,2593,2594,1,0,0,0,2594,2595,6,299,2,0,2595,627,1,0,
+        0,0,2596,2602,3,154,63,0,2597,2602,3,142,57,0,2598,2602,3,146,59,
+        0,2599,2602,3,156,64,0,2600,2602,3,158,65,0,2601,2596,1,0,0,0,2601,
+        2597,1,0,0,0,2601,2598,1,0,0,0,2601,2599,1,0,0,0,2601,2600,1,0,0,
+        0,2602,2603,1,0,0,0,2603,2601,1,0,0,0,2603,2604,1,0,0,0,2604,629,
+        1,0,0,0,2605,2606,3,60,16,0,2606,2607,1,0,0,0,2607,2608,6,301,26,
+        0,2608,631,1,0,0,0,2609,2610,5,59,0,0,2610,633,1,0,0,0,2611,2613,
+        7,18,0,0,2612,2611,1,0,0,0,2613,2614,1,0,0,0,2614,2612,1,0,0,0,2614,
+        2615,1,0,0,0,2615,2616,1,0,0,0,2616,2617,6,303,2,0,2617,635,1,0,
+        0,0,2618,2625,3,154,63,0,2619,2625,3,142,57,0,2620,2625,3,146,59,
+        0,2621,2625,3,156,64,0,2622,2625,3,158,65,0,2623,2625,7,41,0,0,2624,
+        2618,1,0,0,0,2624,2619,1,0,0,0,2624,2620,1,0,0,0,2624,2621,1,0,0,
+        0,2624,2622,1,0,0,0,2624,2623,1,0,0,0,2625,2626,1,0,0,0,2626,2624,
+        1,0,0,0,2626,2627,1,0,0,0,2627,637,1,0,0,0,2628,2629,3,60,16,0,2629,
+        2630,1,0,0,0,2630,2631,6,305,26,0,2631,639,1,0,0,0,2632,2633,5,59,
+        0,0,2633,641,1,0,0,0,131,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,
+        17,18,19,20,21,22,23,24,25,26,27,682,687,812,816,818,856,891,932,
+        937,1088,1095,1100,1106,1114,1116,1121,1142,1144,1146,1155,1159,
+        1161,1163,1171,1209,1215,1221,1227,1232,1234,1242,1246,1248,1250,
+        1259,1263,1265,1267,1278,1280,1290,1295,1325,1369,1371,1384,1426,
+        1433,1440,1447,1458,1469,1487,1498,1500,1509,1576,1578,1589,1600,
+        1602,1611,1622,1624,1633,1647,1659,1715,1727,1762,1773,1775,1790,
+        1801,1803,1822,1983,2000,2002,2007,2121,2123,2128,2347,2349,2354,
+        2400,2441,2443,2448,2457,2463,2470,2477,2488,2579,2581,2592,2601,
+        2603,2614,2624,2626,34,5,1,0,5,4,0,0,1,0,2,5,0,2,6,0,5,27,0,5,18,
         0,5,8,0,5,7,0,5,9,0,5,11,0,5,10,0,5,12,0,5,24,0,5,13,0,5,17,0,5,
         16,0,5,14,0,5,15,0,5,19,0,5,20,0,5,21,0,5,22,0,5,25,0,5,26,0,7,17,
         0,4,0,0,7,26,0,7,27,0,7,77,0,0,2,0,2,0,0,7,88,0,5,23,0
@@ -1355,19 +1362,21 @@ class SQLLexer(Lexer):
     MONITOR_STOP = 273
     MONITOR_REPORT = 274
     MONITOR_LIST = 275
-    MONITOR_ON = 276
-    MONITOR_OFF = 277
-    MONITOR_EXPRESSION = 278
-    MONITOR_CRLF = 279
-    MONITOR_SEMICOLON = 280
-    PLUGIN_SPACE = 281
-    PLUGIN_EXPRESSION = 282
-    PLUGIN_CRLF = 283
-    PLUGIN_SEMICOLON = 284
-    SLEEP_SPACE = 285
-    SLEEP_EXPRESSION = 286
-    SLEEP_CRLF = 287
-    SLEEP_SEMICOLON = 288
+    MONITOR_SUMMARY = 276
+    MONITOR_EXPORT = 277
+    MONITOR_ON = 278
+    MONITOR_OFF = 279
+    MONITOR_EXPRESSION = 280
+    MONITOR_CRLF = 281
+    MONITOR_SEMICOLON = 282
+    PLUGIN_SPACE = 283
+    PLUGIN_EXPRESSION = 284
+    PLUGIN_CRLF = 285
+    PLUGIN_SEMICOLON = 286
+    SLEEP_SPACE = 287
+    SLEEP_EXPRESSION = 288
+    SLEEP_CRLF = 289
+    SLEEP_SEMICOLON = 290
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN", u"SQLSTATEMENT_CHANNEL" ]
 
@@ -1402,7 +1411,7 @@ class SQLLexer(Lexer):
             "'ALGORITHM'", "'ENCODING'", "'WORK'", "'REFERENCE'", "'LCS'", 
             "'MYERS'", "'DIFFLIB'", "'AUTO'", "'SEEDFILE'", "'DIR'", "'HDFSUSER'", 
             "'ROWS'", "'CONVERT'", "'MONITORMANAGER'", "'WORKERS'", "'TASK'", 
-            "'STOP'", "'REPORT'", "'LIST'" ]
+            "'STOP'", "'REPORT'", "'LIST'", "'SUMMARY'", "'EXPORT'" ]
 
     symbolicNames = [ "<INVALID>",
             "CONNECT", "SESSION", "DISCONNECT", "MINUS_MINUS_COMMENT", "SQL_CREATE", 
@@ -1464,10 +1473,11 @@ class SQLLexer(Lexer):
             "DATACOLUMN_CONTENT", "HELP_SPACE", "HELP_COMMAND", "HELP_CRLF", 
             "HELP_SEMICOLON", "MONITOR_SPACE", "MONITOR_MANAGER", "MONITOR_WORKERS", 
             "MONITOR_CREATE", "MONITOR_TASK", "MONITOR_EQUAL", "MONITOR_START", 
-            "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", "MONITOR_ON", 
-            "MONITOR_OFF", "MONITOR_EXPRESSION", "MONITOR_CRLF", "MONITOR_SEMICOLON", 
-            "PLUGIN_SPACE", "PLUGIN_EXPRESSION", "PLUGIN_CRLF", "PLUGIN_SEMICOLON", 
-            "SLEEP_SPACE", "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
+            "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", "MONITOR_SUMMARY", 
+            "MONITOR_EXPORT", "MONITOR_ON", "MONITOR_OFF", "MONITOR_EXPRESSION", 
+            "MONITOR_CRLF", "MONITOR_SEMICOLON", "PLUGIN_SPACE", "PLUGIN_EXPRESSION", 
+            "PLUGIN_CRLF", "PLUGIN_SEMICOLON", "SLEEP_SPACE", "SLEEP_EXPRESSION", 
+            "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
 
     ruleNames = [ "CONNECT", "SESSION", "DISCONNECT", "MINUS_MINUS_COMMENT", 
                   "SQL_CREATE", "SQL_INSERT", "SQL_UPDATE", "SQL_SELECT", 
@@ -1540,10 +1550,10 @@ class SQLLexer(Lexer):
                   "HELP_SEMICOLON", "MONITOR_SPACE", "MONITOR_MANAGER", 
                   "MONITOR_WORKERS", "MONITOR_CREATE", "MONITOR_TASK", "MONITOR_EQUAL", 
                   "MONITOR_START", "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", 
-                  "MONITOR_ON", "MONITOR_OFF", "MONITOR_EXPRESSION", "MONITOR_CRLF", 
-                  "MONITOR_SEMICOLON", "PLUGIN_SPACE", "PLUGIN_EXPRESSION", 
-                  "PLUGIN_CRLF", "PLUGIN_SEMICOLON", "SLEEP_SPACE", "SLEEP_EXPRESSION", 
-                  "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
+                  "MONITOR_SUMMARY", "MONITOR_EXPORT", "MONITOR_ON", "MONITOR_OFF", 
+                  "MONITOR_EXPRESSION", "MONITOR_CRLF", "MONITOR_SEMICOLON", 
+                  "PLUGIN_SPACE", "PLUGIN_EXPRESSION", "PLUGIN_CRLF", "PLUGIN_SEMICOLON", 
+                  "SLEEP_SPACE", "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
 
     grammarFileName = "SQLLexer.g4"
 
@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,1,288,787,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
+        4,1,290,815,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
         7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,
         13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,
         20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,
@@ -18,315 +18,326 @@ def serializedATN():
         33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,
         39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,
         46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,52,7,
-        52,2,53,7,53,2,54,7,54,2,55,7,55,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,
-        1,1,3,1,122,8,1,1,2,1,2,3,2,126,8,2,1,2,3,2,129,8,2,1,3,1,3,1,3,
-        1,3,1,4,1,4,1,4,3,4,138,8,4,3,4,140,8,4,1,4,1,4,1,4,1,4,1,4,1,4,
-        1,4,3,4,149,8,4,1,4,1,4,1,4,1,4,3,4,155,8,4,3,4,157,8,4,1,4,1,4,
-        3,4,161,8,4,3,4,163,8,4,3,4,165,8,4,1,4,1,4,3,4,169,8,4,1,5,1,5,
-        1,5,3,5,174,8,5,1,6,1,6,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,
-        11,1,12,1,12,1,13,1,13,1,13,3,13,193,8,13,1,14,1,14,1,15,1,15,1,
-        16,1,16,1,17,1,17,1,17,1,17,1,18,1,18,1,18,4,18,208,8,18,11,18,12,
-        18,209,3,18,212,8,18,1,19,1,19,1,19,5,19,217,8,19,10,19,12,19,220,
-        9,19,1,19,3,19,223,8,19,1,20,1,20,1,20,3,20,228,8,20,1,20,3,20,231,
-        8,20,1,20,3,20,234,8,20,1,21,4,21,237,8,21,11,21,12,21,238,1,22,
-        1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,3,22,251,8,22,1,23,
-        1,23,1,23,3,23,256,8,23,1,24,1,24,1,24,3,24,261,8,24,1,25,1,25,1,
-        25,3,25,266,8,25,1,26,1,26,1,26,3,26,271,8,26,1,27,1,27,1,27,3,27,
-        276,8,27,1,28,1,28,1,28,3,28,281,8,28,1,29,1,29,1,29,3,29,286,8,
-        29,1,30,1,30,1,30,3,30,291,8,30,1,31,1,31,1,31,3,31,296,8,31,1,32,
-        1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,
-        1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,321,8,32,1,33,
-        1,33,3,33,325,8,33,1,33,3,33,328,8,33,1,33,3,33,331,8,33,1,34,1,
-        34,3,34,335,8,34,1,34,3,34,338,8,34,1,34,3,34,341,8,34,1,35,1,35,
-        1,35,3,35,346,8,35,1,35,3,35,349,8,35,1,36,1,36,1,36,3,36,354,8,
-        36,1,36,3,36,357,8,36,1,37,1,37,4,37,361,8,37,11,37,12,37,362,1,
-        37,3,37,366,8,37,1,37,3,37,369,8,37,1,38,1,38,1,38,1,38,1,38,1,38,
+        52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,1,0,1,0,1,0,1,1,1,1,1,
+        1,1,1,1,1,1,1,3,1,124,8,1,1,2,1,2,3,2,128,8,2,1,2,3,2,131,8,2,1,
+        3,1,3,1,3,1,3,1,4,1,4,1,4,3,4,140,8,4,3,4,142,8,4,1,4,1,4,1,4,1,
+        4,1,4,1,4,1,4,3,4,151,8,4,1,4,1,4,1,4,1,4,3,4,157,8,4,3,4,159,8,
+        4,1,4,1,4,3,4,163,8,4,3,4,165,8,4,3,4,167,8,4,1,4,1,4,3,4,171,8,
+        4,1,5,1,5,1,5,3,5,176,8,5,1,6,1,6,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,
+        10,1,11,1,11,1,12,1,12,1,13,1,13,1,13,3,13,195,8,13,1,14,1,14,1,
+        15,1,15,1,16,1,16,1,17,1,17,1,17,1,17,1,18,1,18,1,18,4,18,210,8,
+        18,11,18,12,18,211,3,18,214,8,18,1,19,1,19,1,19,5,19,219,8,19,10,
+        19,12,19,222,9,19,1,19,3,19,225,8,19,1,20,1,20,1,20,3,20,230,8,20,
+        1,20,3,20,233,8,20,1,20,3,20,236,8,20,1,21,4,21,239,8,21,11,21,12,
+        21,240,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,3,22,253,
+        8,22,1,23,1,23,1,23,3,23,258,8,23,1,24,1,24,1,24,3,24,263,8,24,1,
+        25,1,25,1,25,3,25,268,8,25,1,26,1,26,1,26,3,26,273,8,26,1,27,1,27,
+        1,27,3,27,278,8,27,1,28,1,28,1,28,3,28,283,8,28,1,29,1,29,1,29,3,
+        29,288,8,29,1,30,1,30,1,30,3,30,293,8,30,1,31,1,31,1,31,3,31,298,
+        8,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,
+        1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,323,
+        8,32,1,33,1,33,3,33,327,8,33,1,33,3,33,330,8,33,1,33,3,33,333,8,
+        33,1,34,1,34,3,34,337,8,34,1,34,3,34,340,8,34,1,34,3,34,343,8,34,
+        1,35,1,35,1,35,3,35,348,8,35,1,35,3,35,351,8,35,1,36,1,36,1,36,3,
+        36,356,8,36,1,36,3,36,359,8,36,1,37,1,37,4,37,363,8,37,11,37,12,
+        37,364,1,37,3,37,368,8,37,1,37,3,37,371,8,37,1,38,1,38,1,38,1,38,
         1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
-        1,38,1,38,1,38,1,38,5,38,394,8,38,10,38,12,38,397,9,38,3,38,399,
-        8,38,1,38,3,38,402,8,38,1,38,3,38,405,8,38,1,39,1,39,1,39,3,39,410,
-        8,39,1,39,3,39,413,8,39,1,39,3,39,416,8,39,1,39,3,39,419,8,39,1,
-        40,1,40,1,40,3,40,424,8,40,1,40,3,40,427,8,40,1,41,1,41,1,41,1,41,
-        1,41,1,41,1,41,1,41,3,41,437,8,41,1,41,1,41,1,41,1,41,3,41,443,8,
-        41,1,41,3,41,446,8,41,1,41,3,41,449,8,41,1,42,1,42,1,42,3,42,454,
-        8,42,1,42,3,42,457,8,42,1,43,1,43,3,43,461,8,43,1,43,3,43,464,8,
-        43,1,44,1,44,1,44,1,44,1,44,3,44,471,8,44,1,44,3,44,474,8,44,1,44,
-        3,44,477,8,44,1,45,1,45,1,45,3,45,482,8,45,1,45,3,45,485,8,45,1,
-        46,1,46,1,46,3,46,490,8,46,1,47,1,47,1,47,3,47,495,8,47,1,48,1,48,
-        5,48,499,8,48,10,48,12,48,502,9,48,1,48,3,48,505,8,48,1,48,3,48,
-        508,8,48,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,
-        1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,3,49,529,8,49,1,49,1,49,
-        4,49,533,8,49,11,49,12,49,534,1,49,1,49,1,49,1,49,1,49,1,49,1,49,
+        1,38,1,38,1,38,1,38,1,38,1,38,5,38,396,8,38,10,38,12,38,399,9,38,
+        3,38,401,8,38,1,38,3,38,404,8,38,1,38,3,38,407,8,38,1,39,1,39,1,
+        39,3,39,412,8,39,1,39,3,39,415,8,39,1,39,3,39,418,8,39,1,39,3,39,
+        421,8,39,1,40,1,40,1,40,3,40,426,8,40,1,40,3,40,429,8,40,1,41,1,
+        41,1,41,1,41,1,41,1,41,1,41,1,41,3,41,439,8,41,1,41,1,41,1,41,1,
+        41,3,41,445,8,41,1,41,3,41,448,8,41,1,41,3,41,451,8,41,1,42,1,42,
+        1,42,3,42,456,8,42,1,42,3,42,459,8,42,1,43,1,43,3,43,463,8,43,1,
+        43,3,43,466,8,43,1,44,1,44,1,44,1,44,1,44,3,44,473,8,44,1,44,3,44,
+        476,8,44,1,44,3,44,479,8,44,1,45,1,45,1,45,3,45,484,8,45,1,45,3,
+        45,487,8,45,1,46,1,46,1,46,3,46,492,8,46,1,47,1,47,1,47,3,47,497,
+        8,47,1,48,1,48,5,48,501,8,48,10,48,12,48,504,9,48,1,48,3,48,507,
+        8,48,1,48,3,48,510,8,48,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,
+        1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,3,49,531,
+        8,49,1,49,1,49,4,49,535,8,49,11,49,12,49,536,1,49,1,49,1,49,1,49,
         1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,
         1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,
-        1,49,1,49,3,49,572,8,49,3,49,574,8,49,1,49,3,49,577,8,49,1,49,3,
-        49,580,8,49,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,3,50,590,8,50,
-        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,
-        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,4,50,613,8,50,11,50,12,50,
-        614,1,50,1,50,1,50,1,50,1,50,5,50,622,8,50,10,50,12,50,625,9,50,
-        3,50,627,8,50,1,50,3,50,630,8,50,1,50,3,50,633,8,50,1,51,1,51,1,
-        51,1,51,5,51,639,8,51,10,51,12,51,642,9,51,1,51,1,51,1,51,1,51,1,
-        51,1,51,1,51,1,51,1,51,1,51,1,51,5,51,655,8,51,10,51,12,51,658,9,
-        51,1,51,1,51,1,51,4,51,663,8,51,11,51,12,51,664,1,51,1,51,1,51,1,
-        51,1,51,1,51,1,51,3,51,674,8,51,1,51,3,51,677,8,51,1,51,3,51,680,
-        8,51,1,52,1,52,1,52,1,52,1,52,1,52,3,52,688,8,52,1,52,1,52,1,52,
-        1,52,3,52,694,8,52,1,52,1,52,1,52,1,52,1,52,1,52,3,52,702,8,52,1,
-        52,1,52,3,52,706,8,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,
-        52,1,52,3,52,718,8,52,3,52,720,8,52,1,52,3,52,723,8,52,1,53,1,53,
-        3,53,727,8,53,1,53,3,53,730,8,53,1,53,3,53,733,8,53,1,54,1,54,1,
-        54,1,54,1,54,3,54,740,8,54,1,54,1,54,1,54,1,54,1,54,3,54,747,8,54,
-        1,54,1,54,1,54,4,54,752,8,54,11,54,12,54,753,1,54,1,54,1,54,1,54,
-        1,54,1,54,1,54,1,54,1,54,1,54,1,54,3,54,767,8,54,1,54,3,54,770,8,
-        54,1,54,3,54,773,8,54,1,55,1,55,4,55,777,8,55,11,55,12,55,778,1,
-        55,3,55,782,8,55,1,55,3,55,785,8,55,1,55,0,0,56,0,2,4,6,8,10,12,
-        14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,
-        58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,90,92,94,96,98,100,
-        102,104,106,108,110,0,14,1,0,60,61,1,0,70,72,1,0,79,83,3,0,20,20,
-        22,30,57,57,1,0,11,12,1,0,159,160,2,0,151,151,153,153,1,1,17,17,
-        1,0,207,208,2,0,217,218,221,226,1,0,231,232,1,0,228,230,1,0,238,
-        241,1,0,236,237,922,0,112,1,0,0,0,2,121,1,0,0,0,4,125,1,0,0,0,6,
-        130,1,0,0,0,8,134,1,0,0,0,10,170,1,0,0,0,12,175,1,0,0,0,14,177,1,
-        0,0,0,16,179,1,0,0,0,18,181,1,0,0,0,20,183,1,0,0,0,22,185,1,0,0,
-        0,24,187,1,0,0,0,26,189,1,0,0,0,28,194,1,0,0,0,30,196,1,0,0,0,32,
-        198,1,0,0,0,34,200,1,0,0,0,36,204,1,0,0,0,38,213,1,0,0,0,40,224,
-        1,0,0,0,42,236,1,0,0,0,44,250,1,0,0,0,46,252,1,0,0,0,48,257,1,0,
-        0,0,50,262,1,0,0,0,52,267,1,0,0,0,54,272,1,0,0,0,56,277,1,0,0,0,
-        58,282,1,0,0,0,60,287,1,0,0,0,62,292,1,0,0,0,64,320,1,0,0,0,66,322,
-        1,0,0,0,68,332,1,0,0,0,70,342,1,0,0,0,72,350,1,0,0,0,74,358,1,0,
-        0,0,76,370,1,0,0,0,78,406,1,0,0,0,80,420,1,0,0,0,82,428,1,0,0,0,
-        84,450,1,0,0,0,86,458,1,0,0,0,88,465,1,0,0,0,90,478,1,0,0,0,92,486,
-        1,0,0,0,94,491,1,0,0,0,96,496,1,0,0,0,98,509,1,0,0,0,100,581,1,0,
-        0,0,102,634,1,0,0,0,104,681,1,0,0,0,106,724,1,0,0,0,108,734,1,0,
-        0,0,110,774,1,0,0,0,112,113,3,2,1,0,113,114,5,0,0,1,114,1,1,0,0,
-        0,115,122,3,64,32,0,116,122,3,38,19,0,117,122,3,40,20,0,118,122,
-        3,4,2,0,119,122,3,44,22,0,120,122,5,0,0,1,121,115,1,0,0,0,121,116,
-        1,0,0,0,121,117,1,0,0,0,121,118,1,0,0,0,121,119,1,0,0,0,121,120,
-        1,0,0,0,122,3,1,0,0,0,123,126,3,8,4,0,124,126,3,6,3,0,125,123,1,
-        0,0,0,125,124,1,0,0,0,126,128,1,0,0,0,127,129,5,68,0,0,128,127,1,
-        0,0,0,128,129,1,0,0,0,129,5,1,0,0,0,130,131,5,1,0,0,131,132,5,60,
-        0,0,132,133,3,28,14,0,133,7,1,0,0,0,134,139,5,1,0,0,135,137,3,10,
-        5,0,136,138,5,59,0,0,137,136,1,0,0,0,137,138,1,0,0,0,138,140,1,0,
-        0,0,139,135,1,0,0,0,139,140,1,0,0,0,140,164,1,0,0,0,141,142,3,12,
-        6,0,142,143,5,61,0,0,143,144,3,14,7,0,144,148,5,61,0,0,145,146,3,
-        16,8,0,146,147,5,61,0,0,147,149,1,0,0,0,148,145,1,0,0,0,148,149,
-        1,0,0,0,149,150,1,0,0,0,150,156,5,65,0,0,151,154,3,18,9,0,152,153,
-        5,61,0,0,153,155,3,24,12,0,154,152,1,0,0,0,154,155,1,0,0,0,155,157,
-        1,0,0,0,156,151,1,0,0,0,156,157,1,0,0,0,157,162,1,0,0,0,158,160,
-        7,0,0,0,159,161,3,26,13,0,160,159,1,0,0,0,160,161,1,0,0,0,161,163,
-        1,0,0,0,162,158,1,0,0,0,162,163,1,0,0,0,163,165,1,0,0,0,164,141,
-        1,0,0,0,164,165,1,0,0,0,165,168,1,0,0,0,166,167,5,62,0,0,167,169,
-        3,36,18,0,168,166,1,0,0,0,168,169,1,0,0,0,169,9,1,0,0,0,170,173,
-        3,20,10,0,171,172,5,60,0,0,172,174,3,22,11,0,173,171,1,0,0,0,173,
-        174,1,0,0,0,174,11,1,0,0,0,175,176,5,69,0,0,176,13,1,0,0,0,177,178,
-        5,72,0,0,178,15,1,0,0,0,179,180,5,72,0,0,180,17,1,0,0,0,181,182,
-        7,1,0,0,182,19,1,0,0,0,183,184,5,72,0,0,184,21,1,0,0,0,185,186,5,
-        72,0,0,186,23,1,0,0,0,187,188,5,72,0,0,188,25,1,0,0,0,189,192,5,
-        72,0,0,190,191,5,61,0,0,191,193,5,72,0,0,192,190,1,0,0,0,192,193,
-        1,0,0,0,193,27,1,0,0,0,194,195,5,72,0,0,195,29,1,0,0,0,196,197,5,
-        72,0,0,197,31,1,0,0,0,198,199,5,72,0,0,199,33,1,0,0,0,200,201,3,
-        30,15,0,201,202,5,66,0,0,202,203,3,32,16,0,203,35,1,0,0,0,204,211,
-        3,34,17,0,205,206,5,67,0,0,206,208,3,34,17,0,207,205,1,0,0,0,208,
-        209,1,0,0,0,209,207,1,0,0,0,209,210,1,0,0,0,210,212,1,0,0,0,211,
-        207,1,0,0,0,211,212,1,0,0,0,212,37,1,0,0,0,213,218,5,3,0,0,214,217,
-        3,42,21,0,215,217,5,55,0,0,216,214,1,0,0,0,216,215,1,0,0,0,217,220,
-        1,0,0,0,218,216,1,0,0,0,218,219,1,0,0,0,219,222,1,0,0,0,220,218,
-        1,0,0,0,221,223,5,17,0,0,222,221,1,0,0,0,222,223,1,0,0,0,223,39,
-        1,0,0,0,224,225,5,2,0,0,225,227,7,2,0,0,226,228,5,84,0,0,227,226,
-        1,0,0,0,227,228,1,0,0,0,228,230,1,0,0,0,229,231,5,85,0,0,230,229,
-        1,0,0,0,230,231,1,0,0,0,231,233,1,0,0,0,232,234,5,17,0,0,233,232,
-        1,0,0,0,233,234,1,0,0,0,234,41,1,0,0,0,235,237,7,3,0,0,236,235,1,
-        0,0,0,237,238,1,0,0,0,238,236,1,0,0,0,238,239,1,0,0,0,239,43,1,0,
-        0,0,240,251,3,46,23,0,241,251,3,48,24,0,242,251,3,50,25,0,243,251,
-        3,52,26,0,244,251,3,54,27,0,245,251,3,56,28,0,246,251,3,60,30,0,
-        247,251,3,58,29,0,248,251,3,62,31,0,249,251,5,17,0,0,250,240,1,0,
-        0,0,250,241,1,0,0,0,250,242,1,0,0,0,250,243,1,0,0,0,250,244,1,0,
-        0,0,250,245,1,0,0,0,250,246,1,0,0,0,250,247,1,0,0,0,250,248,1,0,
-        0,0,250,249,1,0,0,0,251,45,1,0,0,0,252,253,5,5,0,0,253,255,5,88,
-        0,0,254,256,5,17,0,0,255,254,1,0,0,0,255,256,1,0,0,0,256,47,1,0,
-        0,0,257,258,5,10,0,0,258,260,5,88,0,0,259,261,5,17,0,0,260,259,1,
-        0,0,0,260,261,1,0,0,0,261,49,1,0,0,0,262,263,5,6,0,0,263,265,5,88,
-        0,0,264,266,5,17,0,0,265,264,1,0,0,0,265,266,1,0,0,0,266,51,1,0,
-        0,0,267,268,5,7,0,0,268,270,5,88,0,0,269,271,5,17,0,0,270,269,1,
-        0,0,0,270,271,1,0,0,0,271,53,1,0,0,0,272,273,5,9,0,0,273,275,5,88,
-        0,0,274,276,5,17,0,0,275,274,1,0,0,0,275,276,1,0,0,0,276,55,1,0,
-        0,0,277,278,5,8,0,0,278,280,5,88,0,0,279,281,5,17,0,0,280,279,1,
-        0,0,0,280,281,1,0,0,0,281,57,1,0,0,0,282,283,5,13,0,0,283,285,5,
-        88,0,0,284,286,5,17,0,0,285,284,1,0,0,0,285,286,1,0,0,0,286,59,1,
-        0,0,0,287,288,7,4,0,0,288,290,5,93,0,0,289,291,5,17,0,0,290,289,
-        1,0,0,0,290,291,1,0,0,0,291,61,1,0,0,0,292,293,5,16,0,0,293,295,
-        5,93,0,0,294,296,5,17,0,0,295,294,1,0,0,0,295,296,1,0,0,0,296,63,
-        1,0,0,0,297,321,3,78,39,0,298,321,3,76,38,0,299,321,3,80,40,0,300,
-        321,3,74,37,0,301,321,3,82,41,0,302,321,3,84,42,0,303,321,3,86,43,
-        0,304,321,3,88,44,0,305,321,3,96,48,0,306,321,3,70,35,0,307,321,
-        3,66,33,0,308,321,3,68,34,0,309,321,3,72,36,0,310,321,3,90,45,0,
-        311,321,3,94,47,0,312,321,3,92,46,0,313,321,3,98,49,0,314,321,3,
-        100,50,0,315,321,3,102,51,0,316,321,3,104,52,0,317,321,3,106,53,
-        0,318,321,3,108,54,0,319,321,3,110,55,0,320,297,1,0,0,0,320,298,
-        1,0,0,0,320,299,1,0,0,0,320,300,1,0,0,0,320,301,1,0,0,0,320,302,
-        1,0,0,0,320,303,1,0,0,0,320,304,1,0,0,0,320,305,1,0,0,0,320,306,
-        1,0,0,0,320,307,1,0,0,0,320,308,1,0,0,0,320,309,1,0,0,0,320,310,
-        1,0,0,0,320,311,1,0,0,0,320,312,1,0,0,0,320,313,1,0,0,0,320,314,
-        1,0,0,0,320,315,1,0,0,0,320,316,1,0,0,0,320,317,1,0,0,0,320,318,
-        1,0,0,0,320,319,1,0,0,0,321,65,1,0,0,0,322,324,5,32,0,0,323,325,
-        5,55,0,0,324,323,1,0,0,0,324,325,1,0,0,0,325,327,1,0,0,0,326,328,
-        5,19,0,0,327,326,1,0,0,0,327,328,1,0,0,0,328,330,1,0,0,0,329,331,
-        5,17,0,0,330,329,1,0,0,0,330,331,1,0,0,0,331,67,1,0,0,0,332,334,
-        5,33,0,0,333,335,5,55,0,0,334,333,1,0,0,0,334,335,1,0,0,0,335,337,
-        1,0,0,0,336,338,5,19,0,0,337,336,1,0,0,0,337,338,1,0,0,0,338,340,
-        1,0,0,0,339,341,5,17,0,0,340,339,1,0,0,0,340,341,1,0,0,0,341,69,
-        1,0,0,0,342,343,5,35,0,0,343,345,7,5,0,0,344,346,5,162,0,0,345,344,
-        1,0,0,0,345,346,1,0,0,0,346,348,1,0,0,0,347,349,5,17,0,0,348,347,
-        1,0,0,0,348,349,1,0,0,0,349,71,1,0,0,0,350,351,5,34,0,0,351,353,
-        5,286,0,0,352,354,5,288,0,0,353,352,1,0,0,0,353,354,1,0,0,0,354,
-        356,1,0,0,0,355,357,5,17,0,0,356,355,1,0,0,0,356,357,1,0,0,0,357,
-        73,1,0,0,0,358,360,5,39,0,0,359,361,5,121,0,0,360,359,1,0,0,0,361,
-        362,1,0,0,0,362,360,1,0,0,0,362,363,1,0,0,0,363,365,1,0,0,0,364,
-        366,5,19,0,0,365,364,1,0,0,0,365,366,1,0,0,0,366,368,1,0,0,0,367,
-        369,5,17,0,0,368,367,1,0,0,0,368,369,1,0,0,0,369,75,1,0,0,0,370,
-        398,5,40,0,0,371,372,5,108,0,0,372,399,5,117,0,0,373,374,5,109,0,
-        0,374,399,5,117,0,0,375,376,5,110,0,0,376,399,5,117,0,0,377,395,
-        5,111,0,0,378,379,5,113,0,0,379,380,5,107,0,0,380,394,5,117,0,0,
-        381,382,5,112,0,0,382,383,5,107,0,0,383,394,5,117,0,0,384,385,5,
-        114,0,0,385,386,5,107,0,0,386,394,5,117,0,0,387,388,5,115,0,0,388,
-        389,5,107,0,0,389,394,5,117,0,0,390,391,5,116,0,0,391,392,5,107,
-        0,0,392,394,5,117,0,0,393,378,1,0,0,0,393,381,1,0,0,0,393,384,1,
-        0,0,0,393,387,1,0,0,0,393,390,1,0,0,0,394,397,1,0,0,0,395,393,1,
-        0,0,0,395,396,1,0,0,0,396,399,1,0,0,0,397,395,1,0,0,0,398,371,1,
-        0,0,0,398,373,1,0,0,0,398,375,1,0,0,0,398,377,1,0,0,0,399,401,1,
-        0,0,0,400,402,5,118,0,0,401,400,1,0,0,0,401,402,1,0,0,0,402,404,
-        1,0,0,0,403,405,5,119,0,0,404,403,1,0,0,0,404,405,1,0,0,0,405,77,
-        1,0,0,0,406,407,5,38,0,0,407,412,5,102,0,0,408,410,5,104,0,0,409,
-        408,1,0,0,0,409,410,1,0,0,0,410,411,1,0,0,0,411,413,5,103,0,0,412,
-        409,1,0,0,0,412,413,1,0,0,0,413,415,1,0,0,0,414,416,5,105,0,0,415,
-        414,1,0,0,0,415,416,1,0,0,0,416,418,1,0,0,0,417,419,5,17,0,0,418,
-        417,1,0,0,0,418,419,1,0,0,0,419,79,1,0,0,0,420,421,5,41,0,0,421,
-        423,5,124,0,0,422,424,5,19,0,0,423,422,1,0,0,0,423,424,1,0,0,0,424,
-        426,1,0,0,0,425,427,5,17,0,0,426,425,1,0,0,0,426,427,1,0,0,0,427,
-        81,1,0,0,0,428,442,5,47,0,0,429,443,5,138,0,0,430,443,5,139,0,0,
-        431,443,5,140,0,0,432,433,5,132,0,0,433,434,5,133,0,0,434,443,5,
-        141,0,0,435,437,5,135,0,0,436,435,1,0,0,0,436,437,1,0,0,0,437,438,
-        1,0,0,0,438,439,5,133,0,0,439,440,5,141,0,0,440,441,5,134,0,0,441,
-        443,5,135,0,0,442,429,1,0,0,0,442,430,1,0,0,0,442,431,1,0,0,0,442,
-        432,1,0,0,0,442,436,1,0,0,0,443,445,1,0,0,0,444,446,5,130,0,0,445,
-        444,1,0,0,0,445,446,1,0,0,0,446,448,1,0,0,0,447,449,5,17,0,0,448,
-        447,1,0,0,0,448,449,1,0,0,0,449,83,1,0,0,0,450,451,5,43,0,0,451,
-        453,5,129,0,0,452,454,5,19,0,0,453,452,1,0,0,0,453,454,1,0,0,0,454,
-        456,1,0,0,0,455,457,5,17,0,0,456,455,1,0,0,0,456,457,1,0,0,0,457,
-        85,1,0,0,0,458,460,5,44,0,0,459,461,5,19,0,0,460,459,1,0,0,0,460,
-        461,1,0,0,0,461,463,1,0,0,0,462,464,5,17,0,0,463,462,1,0,0,0,463,
-        464,1,0,0,0,464,87,1,0,0,0,465,466,5,48,0,0,466,470,5,145,0,0,467,
-        471,5,147,0,0,468,469,5,148,0,0,469,471,5,144,0,0,470,467,1,0,0,
-        0,470,468,1,0,0,0,471,473,1,0,0,0,472,474,5,146,0,0,473,472,1,0,
-        0,0,473,474,1,0,0,0,474,476,1,0,0,0,475,477,5,17,0,0,476,475,1,0,
-        0,0,476,477,1,0,0,0,477,89,1,0,0,0,478,479,5,46,0,0,479,481,7,6,
-        0,0,480,482,5,152,0,0,481,480,1,0,0,0,481,482,1,0,0,0,482,484,1,
-        0,0,0,483,485,5,154,0,0,484,483,1,0,0,0,484,485,1,0,0,0,485,91,1,
-        0,0,0,486,487,5,36,0,0,487,489,5,97,0,0,488,490,7,7,0,0,489,488,
-        1,0,0,0,489,490,1,0,0,0,490,93,1,0,0,0,491,492,5,37,0,0,492,494,
-        5,96,0,0,493,495,5,17,0,0,494,493,1,0,0,0,494,495,1,0,0,0,495,95,
-        1,0,0,0,496,500,5,45,0,0,497,499,5,156,0,0,498,497,1,0,0,0,499,502,
-        1,0,0,0,500,498,1,0,0,0,500,501,1,0,0,0,501,504,1,0,0,0,502,500,
-        1,0,0,0,503,505,5,157,0,0,504,503,1,0,0,0,504,505,1,0,0,0,505,507,
-        1,0,0,0,506,508,5,17,0,0,507,506,1,0,0,0,507,508,1,0,0,0,508,97,
-        1,0,0,0,509,573,5,49,0,0,510,511,5,164,0,0,511,512,5,190,0,0,512,
-        513,5,165,0,0,513,514,5,166,0,0,514,515,5,190,0,0,515,516,5,168,
-        0,0,516,574,5,190,0,0,517,518,5,167,0,0,518,519,5,190,0,0,519,520,
-        5,186,0,0,520,574,5,190,0,0,521,522,5,164,0,0,522,523,5,190,0,0,
-        523,524,5,165,0,0,524,525,5,166,0,0,525,528,5,190,0,0,526,527,5,
-        169,0,0,527,529,5,190,0,0,528,526,1,0,0,0,528,529,1,0,0,0,529,574,
-        1,0,0,0,530,532,5,170,0,0,531,533,5,190,0,0,532,531,1,0,0,0,533,
-        534,1,0,0,0,534,532,1,0,0,0,534,535,1,0,0,0,535,574,1,0,0,0,536,
-        574,5,171,0,0,537,538,5,172,0,0,538,574,5,190,0,0,539,540,5,173,
-        0,0,540,574,5,190,0,0,541,571,5,174,0,0,542,543,5,175,0,0,543,544,
-        5,190,0,0,544,572,5,55,0,0,545,572,5,176,0,0,546,547,5,177,0,0,547,
-        572,5,190,0,0,548,549,5,178,0,0,549,550,5,190,0,0,550,551,5,55,0,
-        0,551,572,5,55,0,0,552,553,5,179,0,0,553,554,5,190,0,0,554,572,5,
-        55,0,0,555,556,5,180,0,0,556,557,5,190,0,0,557,572,5,190,0,0,558,
-        559,5,181,0,0,559,560,5,190,0,0,560,572,5,190,0,0,561,562,5,182,
-        0,0,562,572,5,190,0,0,563,564,5,183,0,0,564,565,5,190,0,0,565,572,
-        5,190,0,0,566,567,5,184,0,0,567,572,5,190,0,0,568,569,5,185,0,0,
-        569,570,5,190,0,0,570,572,5,55,0,0,571,542,1,0,0,0,571,545,1,0,0,
-        0,571,546,1,0,0,0,571,548,1,0,0,0,571,552,1,0,0,0,571,555,1,0,0,
-        0,571,558,1,0,0,0,571,561,1,0,0,0,571,563,1,0,0,0,571,566,1,0,0,
-        0,571,568,1,0,0,0,572,574,1,0,0,0,573,510,1,0,0,0,573,517,1,0,0,
-        0,573,521,1,0,0,0,573,530,1,0,0,0,573,536,1,0,0,0,573,537,1,0,0,
-        0,573,539,1,0,0,0,573,541,1,0,0,0,574,576,1,0,0,0,575,577,5,188,
-        0,0,576,575,1,0,0,0,576,577,1,0,0,0,577,579,1,0,0,0,578,580,5,17,
-        0,0,579,578,1,0,0,0,579,580,1,0,0,0,580,99,1,0,0,0,581,626,5,50,
-        0,0,582,583,5,206,0,0,583,627,7,8,0,0,584,585,5,199,0,0,585,589,
-        5,210,0,0,586,587,5,210,0,0,587,588,5,193,0,0,588,590,5,210,0,0,
-        589,586,1,0,0,0,589,590,1,0,0,0,590,627,1,0,0,0,591,592,5,196,0,
-        0,592,627,5,210,0,0,593,594,5,201,0,0,594,627,5,210,0,0,595,596,
-        5,200,0,0,596,627,5,210,0,0,597,598,5,202,0,0,598,627,5,210,0,0,
-        599,600,5,198,0,0,600,627,5,210,0,0,601,602,5,204,0,0,602,627,5,
-        205,0,0,603,604,5,203,0,0,604,605,5,205,0,0,605,606,5,209,0,0,606,
-        627,5,210,0,0,607,608,5,197,0,0,608,612,5,210,0,0,609,610,5,210,
-        0,0,610,611,5,193,0,0,611,613,5,210,0,0,612,609,1,0,0,0,613,614,
-        1,0,0,0,614,612,1,0,0,0,614,615,1,0,0,0,615,627,1,0,0,0,616,617,
-        5,195,0,0,617,623,5,210,0,0,618,619,5,210,0,0,619,620,5,193,0,0,
-        620,622,5,210,0,0,621,618,1,0,0,0,622,625,1,0,0,0,623,621,1,0,0,
-        0,623,624,1,0,0,0,624,627,1,0,0,0,625,623,1,0,0,0,626,582,1,0,0,
-        0,626,584,1,0,0,0,626,591,1,0,0,0,626,593,1,0,0,0,626,595,1,0,0,
-        0,626,597,1,0,0,0,626,599,1,0,0,0,626,601,1,0,0,0,626,603,1,0,0,
-        0,626,607,1,0,0,0,626,616,1,0,0,0,627,629,1,0,0,0,628,630,5,192,
-        0,0,629,628,1,0,0,0,629,630,1,0,0,0,630,632,1,0,0,0,631,633,5,17,
-        0,0,632,631,1,0,0,0,632,633,1,0,0,0,633,101,1,0,0,0,634,673,5,51,
-        0,0,635,636,5,242,0,0,636,640,5,242,0,0,637,639,7,9,0,0,638,637,
-        1,0,0,0,639,642,1,0,0,0,640,638,1,0,0,0,640,641,1,0,0,0,641,674,
-        1,0,0,0,642,640,1,0,0,0,643,644,7,10,0,0,644,674,5,242,0,0,645,646,
-        5,219,0,0,646,647,5,242,0,0,647,648,5,213,0,0,648,674,5,242,0,0,
-        649,650,5,220,0,0,650,674,5,242,0,0,651,674,5,233,0,0,652,656,5,
-        215,0,0,653,655,7,9,0,0,654,653,1,0,0,0,655,658,1,0,0,0,656,654,
-        1,0,0,0,656,657,1,0,0,0,657,674,1,0,0,0,658,656,1,0,0,0,659,660,
-        5,215,0,0,660,662,5,227,0,0,661,663,7,11,0,0,662,661,1,0,0,0,663,
-        664,1,0,0,0,664,662,1,0,0,0,664,665,1,0,0,0,665,674,1,0,0,0,666,
-        667,5,215,0,0,667,668,5,234,0,0,668,674,7,12,0,0,669,670,5,215,0,
-        0,670,671,7,13,0,0,671,672,5,235,0,0,672,674,5,242,0,0,673,635,1,
-        0,0,0,673,643,1,0,0,0,673,645,1,0,0,0,673,649,1,0,0,0,673,651,1,
-        0,0,0,673,652,1,0,0,0,673,659,1,0,0,0,673,666,1,0,0,0,673,669,1,
-        0,0,0,674,676,1,0,0,0,675,677,5,212,0,0,676,675,1,0,0,0,676,677,
-        1,0,0,0,677,679,1,0,0,0,678,680,5,17,0,0,679,678,1,0,0,0,679,680,
-        1,0,0,0,680,103,1,0,0,0,681,719,5,52,0,0,682,683,5,245,0,0,683,684,
-        5,246,0,0,684,685,5,247,0,0,685,687,5,258,0,0,686,688,5,244,0,0,
-        687,686,1,0,0,0,687,688,1,0,0,0,688,720,1,0,0,0,689,690,5,245,0,
-        0,690,691,5,251,0,0,691,693,5,258,0,0,692,694,5,244,0,0,693,692,
-        1,0,0,0,693,694,1,0,0,0,694,720,1,0,0,0,695,696,5,248,0,0,696,697,
-        5,250,0,0,697,698,5,249,0,0,698,699,5,258,0,0,699,701,5,255,0,0,
-        700,702,5,261,0,0,701,700,1,0,0,0,701,702,1,0,0,0,702,705,1,0,0,
-        0,703,704,5,252,0,0,704,706,5,253,0,0,705,703,1,0,0,0,705,706,1,
-        0,0,0,706,707,1,0,0,0,707,720,5,244,0,0,708,709,5,256,0,0,709,710,
-        5,250,0,0,710,711,5,249,0,0,711,712,5,258,0,0,712,713,5,257,0,0,
-        713,714,5,250,0,0,714,715,5,249,0,0,715,717,5,258,0,0,716,718,5,
-        244,0,0,717,716,1,0,0,0,717,718,1,0,0,0,718,720,1,0,0,0,719,682,
-        1,0,0,0,719,689,1,0,0,0,719,695,1,0,0,0,719,708,1,0,0,0,720,722,
-        1,0,0,0,721,723,5,17,0,0,722,721,1,0,0,0,722,723,1,0,0,0,723,105,
-        1,0,0,0,724,726,5,42,0,0,725,727,5,263,0,0,726,725,1,0,0,0,726,727,
-        1,0,0,0,727,729,1,0,0,0,728,730,5,265,0,0,729,728,1,0,0,0,729,730,
-        1,0,0,0,730,732,1,0,0,0,731,733,5,17,0,0,732,731,1,0,0,0,732,733,
-        1,0,0,0,733,107,1,0,0,0,734,766,5,53,0,0,735,736,5,267,0,0,736,739,
-        5,276,0,0,737,738,5,268,0,0,738,740,5,278,0,0,739,737,1,0,0,0,739,
-        740,1,0,0,0,740,767,1,0,0,0,741,742,5,267,0,0,742,767,5,277,0,0,
-        743,744,5,269,0,0,744,746,5,270,0,0,745,747,5,278,0,0,746,745,1,
-        0,0,0,746,747,1,0,0,0,747,751,1,0,0,0,748,749,5,278,0,0,749,750,
-        5,271,0,0,750,752,5,278,0,0,751,748,1,0,0,0,752,753,1,0,0,0,753,
-        751,1,0,0,0,753,754,1,0,0,0,754,767,1,0,0,0,755,756,5,272,0,0,756,
-        757,5,270,0,0,757,767,5,278,0,0,758,759,5,273,0,0,759,760,5,270,
-        0,0,760,767,5,278,0,0,761,762,5,274,0,0,762,763,5,270,0,0,763,767,
-        5,278,0,0,764,765,5,275,0,0,765,767,5,270,0,0,766,735,1,0,0,0,766,
-        741,1,0,0,0,766,743,1,0,0,0,766,755,1,0,0,0,766,758,1,0,0,0,766,
-        761,1,0,0,0,766,764,1,0,0,0,767,769,1,0,0,0,768,770,5,280,0,0,769,
-        768,1,0,0,0,769,770,1,0,0,0,770,772,1,0,0,0,771,773,5,279,0,0,772,
-        771,1,0,0,0,772,773,1,0,0,0,773,109,1,0,0,0,774,776,5,54,0,0,775,
-        777,5,282,0,0,776,775,1,0,0,0,777,778,1,0,0,0,778,776,1,0,0,0,778,
-        779,1,0,0,0,779,781,1,0,0,0,780,782,5,284,0,0,781,780,1,0,0,0,781,
-        782,1,0,0,0,782,784,1,0,0,0,783,785,5,283,0,0,784,783,1,0,0,0,784,
-        785,1,0,0,0,785,111,1,0,0,0,113,121,125,128,137,139,148,154,156,
-        160,162,164,168,173,192,209,211,216,218,222,227,230,233,238,250,
-        255,260,265,270,275,280,285,290,295,320,324,327,330,334,337,340,
-        345,348,353,356,362,365,368,393,395,398,401,404,409,412,415,418,
-        423,426,436,442,445,448,453,456,460,463,470,473,476,481,484,489,
-        494,500,504,507,528,534,571,573,576,579,589,614,623,626,629,632,
-        640,656,664,673,676,679,687,693,701,705,717,719,722,726,729,732,
-        739,746,753,766,769,772,778,781,784
+        1,49,1,49,1,49,1,49,1,49,3,49,574,8,49,3,49,576,8,49,1,49,3,49,579,
+        8,49,1,49,3,49,582,8,49,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,
+        3,50,592,8,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,
+        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,4,50,615,
+        8,50,11,50,12,50,616,1,50,1,50,1,50,1,50,1,50,5,50,624,8,50,10,50,
+        12,50,627,9,50,3,50,629,8,50,1,50,3,50,632,8,50,1,50,3,50,635,8,
+        50,1,51,1,51,1,51,1,51,5,51,641,8,51,10,51,12,51,644,9,51,1,51,1,
+        51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,5,51,657,8,51,10,
+        51,12,51,660,9,51,1,51,1,51,1,51,4,51,665,8,51,11,51,12,51,666,1,
+        51,1,51,1,51,1,51,1,51,1,51,1,51,3,51,676,8,51,1,51,3,51,679,8,51,
+        1,51,3,51,682,8,51,1,52,1,52,1,52,1,52,1,52,1,52,3,52,690,8,52,1,
+        52,1,52,1,52,1,52,3,52,696,8,52,1,52,1,52,1,52,1,52,1,52,1,52,3,
+        52,704,8,52,1,52,1,52,3,52,708,8,52,1,52,1,52,1,52,1,52,1,52,1,52,
+        1,52,1,52,1,52,1,52,3,52,720,8,52,3,52,722,8,52,1,52,3,52,725,8,
+        52,1,53,1,53,3,53,729,8,53,1,53,3,53,732,8,53,1,53,3,53,735,8,53,
+        1,54,1,54,1,54,1,54,1,54,3,54,742,8,54,1,54,1,54,1,54,1,54,1,54,
+        3,54,749,8,54,1,54,1,54,1,54,1,54,4,54,755,8,54,11,54,12,54,756,
+        1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,
+        1,54,1,54,1,54,5,54,775,8,54,10,54,12,54,778,9,54,1,54,1,54,1,54,
+        1,54,1,54,1,54,1,54,4,54,787,8,54,11,54,12,54,788,1,54,1,54,3,54,
+        793,8,54,1,54,3,54,796,8,54,1,54,3,54,799,8,54,1,55,1,55,1,56,1,
+        56,4,56,805,8,56,11,56,12,56,806,1,56,3,56,810,8,56,1,56,3,56,813,
+        8,56,1,56,0,0,57,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,
+        36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,
+        80,82,84,86,88,90,92,94,96,98,100,102,104,106,108,110,112,0,15,1,
+        0,60,61,1,0,70,72,1,0,79,83,3,0,20,20,22,30,57,57,1,0,11,12,1,0,
+        159,160,2,0,151,151,153,153,1,1,17,17,1,0,207,208,2,0,217,218,221,
+        226,1,0,231,232,1,0,228,230,1,0,238,241,1,0,236,237,2,0,276,277,
+        280,280,953,0,114,1,0,0,0,2,123,1,0,0,0,4,127,1,0,0,0,6,132,1,0,
+        0,0,8,136,1,0,0,0,10,172,1,0,0,0,12,177,1,0,0,0,14,179,1,0,0,0,16,
+        181,1,0,0,0,18,183,1,0,0,0,20,185,1,0,0,0,22,187,1,0,0,0,24,189,
+        1,0,0,0,26,191,1,0,0,0,28,196,1,0,0,0,30,198,1,0,0,0,32,200,1,0,
+        0,0,34,202,1,0,0,0,36,206,1,0,0,0,38,215,1,0,0,0,40,226,1,0,0,0,
+        42,238,1,0,0,0,44,252,1,0,0,0,46,254,1,0,0,0,48,259,1,0,0,0,50,264,
+        1,0,0,0,52,269,1,0,0,0,54,274,1,0,0,0,56,279,1,0,0,0,58,284,1,0,
+        0,0,60,289,1,0,0,0,62,294,1,0,0,0,64,322,1,0,0,0,66,324,1,0,0,0,
+        68,334,1,0,0,0,70,344,1,0,0,0,72,352,1,0,0,0,74,360,1,0,0,0,76,372,
+        1,0,0,0,78,408,1,0,0,0,80,422,1,0,0,0,82,430,1,0,0,0,84,452,1,0,
+        0,0,86,460,1,0,0,0,88,467,1,0,0,0,90,480,1,0,0,0,92,488,1,0,0,0,
+        94,493,1,0,0,0,96,498,1,0,0,0,98,511,1,0,0,0,100,583,1,0,0,0,102,
+        636,1,0,0,0,104,683,1,0,0,0,106,726,1,0,0,0,108,736,1,0,0,0,110,
+        800,1,0,0,0,112,802,1,0,0,0,114,115,3,2,1,0,115,116,5,0,0,1,116,
+        1,1,0,0,0,117,124,3,64,32,0,118,124,3,38,19,0,119,124,3,40,20,0,
+        120,124,3,4,2,0,121,124,3,44,22,0,122,124,5,0,0,1,123,117,1,0,0,
+        0,123,118,1,0,0,0,123,119,1,0,0,0,123,120,1,0,0,0,123,121,1,0,0,
+        0,123,122,1,0,0,0,124,3,1,0,0,0,125,128,3,8,4,0,126,128,3,6,3,0,
+        127,125,1,0,0,0,127,126,1,0,0,0,128,130,1,0,0,0,129,131,5,68,0,0,
+        130,129,1,0,0,0,130,131,1,0,0,0,131,5,1,0,0,0,132,133,5,1,0,0,133,
+        134,5,60,0,0,134,135,3,28,14,0,135,7,1,0,0,0,136,141,5,1,0,0,137,
+        139,3,10,5,0,138,140,5,59,0,0,139,138,1,0,0,0,139,140,1,0,0,0,140,
+        142,1,0,0,0,141,137,1,0,0,0,141,142,1,0,0,0,142,166,1,0,0,0,143,
+        144,3,12,6,0,144,145,5,61,0,0,145,146,3,14,7,0,146,150,5,61,0,0,
+        147,148,3,16,8,0,148,149,5,61,0,0,149,151,1,0,0,0,150,147,1,0,0,
+        0,150,151,1,0,0,0,151,152,1,0,0,0,152,158,5,65,0,0,153,156,3,18,
+        9,0,154,155,5,61,0,0,155,157,3,24,12,0,156,154,1,0,0,0,156,157,1,
+        0,0,0,157,159,1,0,0,0,158,153,1,0,0,0,158,159,1,0,0,0,159,164,1,
+        0,0,0,160,162,7,0,0,0,161,163,3,26,13,0,162,161,1,0,0,0,162,163,
+        1,0,0,0,163,165,1,0,0,0,164,160,1,0,0,0,164,165,1,0,0,0,165,167,
+        1,0,0,0,166,143,1,0,0,0,166,167,1,0,0,0,167,170,1,0,0,0,168,169,
+        5,62,0,0,169,171,3,36,18,0,170,168,1,0,0,0,170,171,1,0,0,0,171,9,
+        1,0,0,0,172,175,3,20,10,0,173,174,5,60,0,0,174,176,3,22,11,0,175,
+        173,1,0,0,0,175,176,1,0,0,0,176,11,1,0,0,0,177,178,5,69,0,0,178,
+        13,1,0,0,0,179,180,5,72,0,0,180,15,1,0,0,0,181,182,5,72,0,0,182,
+        17,1,0,0,0,183,184,7,1,0,0,184,19,1,0,0,0,185,186,5,72,0,0,186,21,
+        1,0,0,0,187,188,5,72,0,0,188,23,1,0,0,0,189,190,5,72,0,0,190,25,
+        1,0,0,0,191,194,5,72,0,0,192,193,5,61,0,0,193,195,5,72,0,0,194,192,
+        1,0,0,0,194,195,1,0,0,0,195,27,1,0,0,0,196,197,5,72,0,0,197,29,1,
+        0,0,0,198,199,5,72,0,0,199,31,1,0,0,0,200,201,5,72,0,0,201,33,1,
+        0,0,0,202,203,3,30,15,0,203,204,5,66,0,0,204,205,3,32,16,0,205,35,
+        1,0,0,0,206,213,3,34,17,0,207,208,5,67,0,0,208,210,3,34,17,0,209,
+        207,1,0,0,0,210,211,1,0,0,0,211,209,1,0,0,0,211,212,1,0,0,0,212,
+        214,1,0,0,0,213,209,1,0,0,0,213,214,1,0,0,0,214,37,1,0,0,0,215,220,
+        5,3,0,0,216,219,3,42,21,0,217,219,5,55,0,0,218,216,1,0,0,0,218,217,
+        1,0,0,0,219,222,1,0,0,0,220,218,1,0,0,0,220,221,1,0,0,0,221,224,
+        1,0,0,0,222,220,1,0,0,0,223,225,5,17,0,0,224,223,1,0,0,0,224,225,
+        1,0,0,0,225,39,1,0,0,0,226,227,5,2,0,0,227,229,7,2,0,0,228,230,5,
+        84,0,0,229,228,1,0,0,0,229,230,1,0,0,0,230,232,1,0,0,0,231,233,5,
+        85,0,0,232,231,1,0,0,0,232,233,1,0,0,0,233,235,1,0,0,0,234,236,5,
+        17,0,0,235,234,1,0,0,0,235,236,1,0,0,0,236,41,1,0,0,0,237,239,7,
+        3,0,0,238,237,1,0,0,0,239,240,1,0,0,0,240,238,1,0,0,0,240,241,1,
+        0,0,0,241,43,1,0,0,0,242,253,3,46,23,0,243,253,3,48,24,0,244,253,
+        3,50,25,0,245,253,3,52,26,0,246,253,3,54,27,0,247,253,3,56,28,0,
+        248,253,3,60,30,0,249,253,3,58,29,0,250,253,3,62,31,0,251,253,5,
+        17,0,0,252,242,1,0,0,0,252,243,1,0,0,0,252,244,1,0,0,0,252,245,1,
+        0,0,0,252,246,1,0,0,0,252,247,1,0,0,0,252,248,1,0,0,0,252,249,1,
+        0,0,0,252,250,1,0,0,0,252,251,1,0,0,0,253,45,1,0,0,0,254,255,5,5,
+        0,0,255,257,5,88,0,0,256,258,5,17,0,0,257,256,1,0,0,0,257,258,1,
+        0,0,0,258,47,1,0,0,0,259,260,5,10,0,0,260,262,5,88,0,0,261,263,5,
+        17,0,0,262,261,1,0,0,0,262,263,1,0,0,0,263,49,1,0,0,0,264,265,5,
+        6,0,0,265,267,5,88,0,0,266,268,5,17,0,0,267,266,1,0,0,0,267,268,
+        1,0,0,0,268,51,1,0,0,0,269,270,5,7,0,0,270,272,5,88,0,0,271,273,
+        5,17,0,0,272,271,1,0,0,0,272,273,1,0,0,0,273,53,1,0,0,0,274,275,
+        5,9,0,0,275,277,5,88,0,0,276,278,5,17,0,0,277,276,1,0,0,0,277,278,
+        1,0,0,0,278,55,1,0,0,0,279,280,5,8,0,0,280,282,5,88,0,0,281,283,
+        5,17,0,0,282,281,1,0,0,0,282,283,1,0,0,0,283,57,1,0,0,0,284,285,
+        5,13,0,0,285,287,5,88,0,0,286,288,5,17,0,0,287,286,1,0,0,0,287,288,
+        1,0,0,0,288,59,1,0,0,0,289,290,7,4,0,0,290,292,5,93,0,0,291,293,
+        5,17,0,0,292,291,1,0,0,0,292,293,1,0,0,0,293,61,1,0,0,0,294,295,
+        5,16,0,0,295,297,5,93,0,0,296,298,5,17,0,0,297,296,1,0,0,0,297,298,
+        1,0,0,0,298,63,1,0,0,0,299,323,3,78,39,0,300,323,3,76,38,0,301,323,
+        3,80,40,0,302,323,3,74,37,0,303,323,3,82,41,0,304,323,3,84,42,0,
+        305,323,3,86,43,0,306,323,3,88,44,0,307,323,3,96,48,0,308,323,3,
+        70,35,0,309,323,3,66,33,0,310,323,3,68,34,0,311,323,3,72,36,0,312,
+        323,3,90,45,0,313,323,3,94,47,0,314,323,3,92,46,0,315,323,3,98,49,
+        0,316,323,3,100,50,0,317,323,3,102,51,0,318,323,3,104,52,0,319,323,
+        3,106,53,0,320,323,3,108,54,0,321,323,3,112,56,0,322,299,1,0,0,0,
+        322,300,1,0,0,0,322,301,1,0,0,0,322,302,1,0,0,0,322,303,1,0,0,0,
+        322,304,1,0,0,0,322,305,1,0,0,0,322,306,1,0,0,0,322,307,1,0,0,0,
+        322,308,1,0,0,0,322,309,1,0,0,0,322,310,1,0,0,0,322,311,1,0,0,0,
+        322,312,1,0,0,0,322,313,1,0,0,0,322,314,1,0,0,0,322,315,1,0,0,0,
+        322,316,1,0,0,0,322,317,1,0,0,0,322,318,1,0,0,0,322,319,1,0,0,0,
+        322,320,1,0,0,0,322,321,1,0,0,0,323,65,1,0,0,0,324,326,5,32,0,0,
+        325,327,5,55,0,0,326,325,1,0,0,0,326,327,1,0,0,0,327,329,1,0,0,0,
+        328,330,5,19,0,0,329,328,1,0,0,0,329,330,1,0,0,0,330,332,1,0,0,0,
+        331,333,5,17,0,0,332,331,1,0,0,0,332,333,1,0,0,0,333,67,1,0,0,0,
+        334,336,5,33,0,0,335,337,5,55,0,0,336,335,1,0,0,0,336,337,1,0,0,
+        0,337,339,1,0,0,0,338,340,5,19,0,0,339,338,1,0,0,0,339,340,1,0,0,
+        0,340,342,1,0,0,0,341,343,5,17,0,0,342,341,1,0,0,0,342,343,1,0,0,
+        0,343,69,1,0,0,0,344,345,5,35,0,0,345,347,7,5,0,0,346,348,5,162,
+        0,0,347,346,1,0,0,0,347,348,1,0,0,0,348,350,1,0,0,0,349,351,5,17,
+        0,0,350,349,1,0,0,0,350,351,1,0,0,0,351,71,1,0,0,0,352,353,5,34,
+        0,0,353,355,5,288,0,0,354,356,5,290,0,0,355,354,1,0,0,0,355,356,
+        1,0,0,0,356,358,1,0,0,0,357,359,5,17,0,0,358,357,1,0,0,0,358,359,
+        1,0,0,0,359,73,1,0,0,0,360,362,5,39,0,0,361,363,5,121,0,0,362,361,
+        1,0,0,0,363,364,1,0,0,0,364,362,1,0,0,0,364,365,1,0,0,0,365,367,
+        1,0,0,0,366,368,5,19,0,0,367,366,1,0,0,0,367,368,1,0,0,0,368,370,
+        1,0,0,0,369,371,5,17,0,0,370,369,1,0,0,0,370,371,1,0,0,0,371,75,
+        1,0,0,0,372,400,5,40,0,0,373,374,5,108,0,0,374,401,5,117,0,0,375,
+        376,5,109,0,0,376,401,5,117,0,0,377,378,5,110,0,0,378,401,5,117,
+        0,0,379,397,5,111,0,0,380,381,5,113,0,0,381,382,5,107,0,0,382,396,
+        5,117,0,0,383,384,5,112,0,0,384,385,5,107,0,0,385,396,5,117,0,0,
+        386,387,5,114,0,0,387,388,5,107,0,0,388,396,5,117,0,0,389,390,5,
+        115,0,0,390,391,5,107,0,0,391,396,5,117,0,0,392,393,5,116,0,0,393,
+        394,5,107,0,0,394,396,5,117,0,0,395,380,1,0,0,0,395,383,1,0,0,0,
+        395,386,1,0,0,0,395,389,1,0,0,0,395,392,1,0,0,0,396,399,1,0,0,0,
+        397,395,1,0,0,0,397,398,1,0,0,0,398,401,1,0,0,0,399,397,1,0,0,0,
+        400,373,1,0,0,0,400,375,1,0,0,0,400,377,1,0,0,0,400,379,1,0,0,0,
+        401,403,1,0,0,0,402,404,5,118,0,0,403,402,1,0,0,0,403,404,1,0,0,
+        0,404,406,1,0,0,0,405,407,5,119,0,0,406,405,1,0,0,0,406,407,1,0,
+        0,0,407,77,1,0,0,0,408,409,5,38,0,0,409,414,5,102,0,0,410,412,5,
+        104,0,0,411,410,1,0,0,0,411,412,1,0,0,0,412,413,1,0,0,0,413,415,
+        5,103,0,0,414,411,1,0,0,0,414,415,1,0,0,0,415,417,1,0,0,0,416,418,
+        5,105,0,0,417,416,1,0,0,0,417,418,1,0,0,0,418,420,1,0,0,0,419,421,
+        5,17,0,0,420,419,1,0,0,0,420,421,1,0,0,0,421,79,1,0,0,0,422,423,
+        5,41,0,0,423,425,5,124,0,0,424,426,5,19,0,0,425,424,1,0,0,0,425,
+        426,1,0,0,0,426,428,1,0,0,0,427,429,5,17,0,0,428,427,1,0,0,0,428,
+        429,1,0,0,0,429,81,1,0,0,0,430,444,5,47,0,0,431,445,5,138,0,0,432,
+        445,5,139,0,0,433,445,5,140,0,0,434,435,5,132,0,0,435,436,5,133,
+        0,0,436,445,5,141,0,0,437,439,5,135,0,0,438,437,1,0,0,0,438,439,
+        1,0,0,0,439,440,1,0,0,0,440,441,5,133,0,0,441,442,5,141,0,0,442,
+        443,5,134,0,0,443,445,5,135,0,0,444,431,1,0,0,0,444,432,1,0,0,0,
+        444,433,1,0,0,0,444,434,1,0,0,0,444,438,1,0,0,0,445,447,1,0,0,0,
+        446,448,5,130,0,0,447,446,1,0,0,0,447,448,1,0,0,0,448,450,1,0,0,
+        0,449,451,5,17,0,0,450,449,1,0,0,0,450,451,1,0,0,0,451,83,1,0,0,
+        0,452,453,5,43,0,0,453,455,5,129,0,0,454,456,5,19,0,0,455,454,1,
+        0,0,0,455,456,1,0,0,0,456,458,1,0,0,0,457,459,5,17,0,0,458,457,1,
+        0,0,0,458,459,1,0,0,0,459,85,1,0,0,0,460,462,5,44,0,0,461,463,5,
+        19,0,0,462,461,1,0,0,0,462,463,1,0,0,0,463,465,1,0,0,0,464,466,5,
+        17,0,0,465,464,1,0,0,0,465,466,1,0,0,0,466,87,1,0,0,0,467,468,5,
+        48,0,0,468,472,5,145,0,0,469,473,5,147,0,0,470,471,5,148,0,0,471,
+        473,5,144,0,0,472,469,1,0,0,0,472,470,1,0,0,0,473,475,1,0,0,0,474,
+        476,5,146,0,0,475,474,1,0,0,0,475,476,1,0,0,0,476,478,1,0,0,0,477,
+        479,5,17,0,0,478,477,1,0,0,0,478,479,1,0,0,0,479,89,1,0,0,0,480,
+        481,5,46,0,0,481,483,7,6,0,0,482,484,5,152,0,0,483,482,1,0,0,0,483,
+        484,1,0,0,0,484,486,1,0,0,0,485,487,5,154,0,0,486,485,1,0,0,0,486,
+        487,1,0,0,0,487,91,1,0,0,0,488,489,5,36,0,0,489,491,5,97,0,0,490,
+        492,7,7,0,0,491,490,1,0,0,0,491,492,1,0,0,0,492,93,1,0,0,0,493,494,
+        5,37,0,0,494,496,5,96,0,0,495,497,5,17,0,0,496,495,1,0,0,0,496,497,
+        1,0,0,0,497,95,1,0,0,0,498,502,5,45,0,0,499,501,5,156,0,0,500,499,
+        1,0,0,0,501,504,1,0,0,0,502,500,1,0,0,0,502,503,1,0,0,0,503,506,
+        1,0,0,0,504,502,1,0,0,0,505,507,5,157,0,0,506,505,1,0,0,0,506,507,
+        1,0,0,0,507,509,1,0,0,0,508,510,5,17,0,0,509,508,1,0,0,0,509,510,
+        1,0,0,0,510,97,1,0,0,0,511,575,5,49,0,0,512,513,5,164,0,0,513,514,
+        5,190,0,0,514,515,5,165,0,0,515,516,5,166,0,0,516,517,5,190,0,0,
+        517,518,5,168,0,0,518,576,5,190,0,0,519,520,5,167,0,0,520,521,5,
+        190,0,0,521,522,5,186,0,0,522,576,5,190,0,0,523,524,5,164,0,0,524,
+        525,5,190,0,0,525,526,5,165,0,0,526,527,5,166,0,0,527,530,5,190,
+        0,0,528,529,5,169,0,0,529,531,5,190,0,0,530,528,1,0,0,0,530,531,
+        1,0,0,0,531,576,1,0,0,0,532,534,5,170,0,0,533,535,5,190,0,0,534,
+        533,1,0,0,0,535,536,1,0,0,0,536,534,1,0,0,0,536,537,1,0,0,0,537,
+        576,1,0,0,0,538,576,5,171,0,0,539,540,5,172,0,0,540,576,5,190,0,
+        0,541,542,5,173,0,0,542,576,5,190,0,0,543,573,5,174,0,0,544,545,
+        5,175,0,0,545,546,5,190,0,0,546,574,5,55,0,0,547,574,5,176,0,0,548,
+        549,5,177,0,0,549,574,5,190,0,0,550,551,5,178,0,0,551,552,5,190,
+        0,0,552,553,5,55,0,0,553,574,5,55,0,0,554,555,5,179,0,0,555,556,
+        5,190,0,0,556,574,5,55,0,0,557,558,5,180,0,0,558,559,5,190,0,0,559,
+        574,5,190,0,0,560,561,5,181,0,0,561,562,5,190,0,0,562,574,5,190,
+        0,0,563,564,5,182,0,0,564,574,5,190,0,0,565,566,5,183,0,0,566,567,
+        5,190,0,0,567,574,5,190,0,0,568,569,5,184,0,0,569,574,5,190,0,0,
+        570,571,5,185,0,0,571,572,5,190,0,0,572,574,5,55,0,0,573,544,1,0,
+        0,0,573,547,1,0,0,0,573,548,1,0,0,0,573,550,1,0,0,0,573,554,1,0,
+        0,0,573,557,1,0,0,0,573,560,1,0,0,0,573,563,1,0,0,0,573,565,1,0,
+        0,0,573,568,1,0,0,0,573,570,1,0,0,0,574,576,1,0,0,0,575,512,1,0,
+        0,0,575,519,1,0,0,0,575,523,1,0,0,0,575,532,1,0,0,0,575,538,1,0,
+        0,0,575,539,1,0,0,0,575,541,1,0,0,0,575,543,1,0,0,0,576,578,1,0,
+        0,0,577,579,5,188,0,0,578,577,1,0,0,0,578,579,1,0,0,0,579,581,1,
+        0,0,0,580,582,5,17,0,0,581,580,1,0,0,0,581,582,1,0,0,0,582,99,1,
+        0,0,0,583,628,5,50,0,0,584,585,5,206,0,0,585,629,7,8,0,0,586,587,
+        5,199,0,0,587,591,5,210,0,0,588,589,5,210,0,0,589,590,5,193,0,0,
+        590,592,5,210,0,0,591,588,1,0,0,0,591,592,1,0,0,0,592,629,1,0,0,
+        0,593,594,5,196,0,0,594,629,5,210,0,0,595,596,5,201,0,0,596,629,
+        5,210,0,0,597,598,5,200,0,0,598,629,5,210,0,0,599,600,5,202,0,0,
+        600,629,5,210,0,0,601,602,5,198,0,0,602,629,5,210,0,0,603,604,5,
+        204,0,0,604,629,5,205,0,0,605,606,5,203,0,0,606,607,5,205,0,0,607,
+        608,5,209,0,0,608,629,5,210,0,0,609,610,5,197,0,0,610,614,5,210,
+        0,0,611,612,5,210,0,0,612,613,5,193,0,0,613,615,5,210,0,0,614,611,
+        1,0,0,0,615,616,1,0,0,0,616,614,1,0,0,0,616,617,1,0,0,0,617,629,
+        1,0,0,0,618,619,5,195,0,0,619,625,5,210,0,0,620,621,5,210,0,0,621,
+        622,5,193,0,0,622,624,5,210,0,0,623,620,1,0,0,0,624,627,1,0,0,0,
+        625,623,1,0,0,0,625,626,1,0,0,0,626,629,1,0,0,0,627,625,1,0,0,0,
+        628,584,1,0,0,0,628,586,1,0,0,0,628,593,1,0,0,0,628,595,1,0,0,0,
+        628,597,1,0,0,0,628,599,1,0,0,0,628,601,1,0,0,0,628,603,1,0,0,0,
+        628,605,1,0,0,0,628,609,1,0,0,0,628,618,1,0,0,0,629,631,1,0,0,0,
+        630,632,5,192,0,0,631,630,1,0,0,0,631,632,1,0,0,0,632,634,1,0,0,
+        0,633,635,5,17,0,0,634,633,1,0,0,0,634,635,1,0,0,0,635,101,1,0,0,
+        0,636,675,5,51,0,0,637,638,5,242,0,0,638,642,5,242,0,0,639,641,7,
+        9,0,0,640,639,1,0,0,0,641,644,1,0,0,0,642,640,1,0,0,0,642,643,1,
+        0,0,0,643,676,1,0,0,0,644,642,1,0,0,0,645,646,7,10,0,0,646,676,5,
+        242,0,0,647,648,5,219,0,0,648,649,5,242,0,0,649,650,5,213,0,0,650,
+        676,5,242,0,0,651,652,5,220,0,0,652,676,5,242,0,0,653,676,5,233,
+        0,0,654,658,5,215,0,0,655,657,7,9,0,0,656,655,1,0,0,0,657,660,1,
+        0,0,0,658,656,1,0,0,0,658,659,1,0,0,0,659,676,1,0,0,0,660,658,1,
+        0,0,0,661,662,5,215,0,0,662,664,5,227,0,0,663,665,7,11,0,0,664,663,
+        1,0,0,0,665,666,1,0,0,0,666,664,1,0,0,0,666,667,1,0,0,0,667,676,
+        1,0,0,0,668,669,5,215,0,0,669,670,5,234,0,0,670,676,7,12,0,0,671,
+        672,5,215,0,0,672,673,7,13,0,0,673,674,5,235,0,0,674,676,5,242,0,
+        0,675,637,1,0,0,0,675,645,1,0,0,0,675,647,1,0,0,0,675,651,1,0,0,
+        0,675,653,1,0,0,0,675,654,1,0,0,0,675,661,1,0,0,0,675,668,1,0,0,
+        0,675,671,1,0,0,0,676,678,1,0,0,0,677,679,5,212,0,0,678,677,1,0,
+        0,0,678,679,1,0,0,0,679,681,1,0,0,0,680,682,5,17,0,0,681,680,1,0,
+        0,0,681,682,1,0,0,0,682,103,1,0,0,0,683,721,5,52,0,0,684,685,5,245,
+        0,0,685,686,5,246,0,0,686,687,5,247,0,0,687,689,5,258,0,0,688,690,
+        5,244,0,0,689,688,1,0,0,0,689,690,1,0,0,0,690,722,1,0,0,0,691,692,
+        5,245,0,0,692,693,5,251,0,0,693,695,5,258,0,0,694,696,5,244,0,0,
+        695,694,1,0,0,0,695,696,1,0,0,0,696,722,1,0,0,0,697,698,5,248,0,
+        0,698,699,5,250,0,0,699,700,5,249,0,0,700,701,5,258,0,0,701,703,
+        5,255,0,0,702,704,5,261,0,0,703,702,1,0,0,0,703,704,1,0,0,0,704,
+        707,1,0,0,0,705,706,5,252,0,0,706,708,5,253,0,0,707,705,1,0,0,0,
+        707,708,1,0,0,0,708,709,1,0,0,0,709,722,5,244,0,0,710,711,5,256,
+        0,0,711,712,5,250,0,0,712,713,5,249,0,0,713,714,5,258,0,0,714,715,
+        5,257,0,0,715,716,5,250,0,0,716,717,5,249,0,0,717,719,5,258,0,0,
+        718,720,5,244,0,0,719,718,1,0,0,0,719,720,1,0,0,0,720,722,1,0,0,
+        0,721,684,1,0,0,0,721,691,1,0,0,0,721,697,1,0,0,0,721,710,1,0,0,
+        0,722,724,1,0,0,0,723,725,5,17,0,0,724,723,1,0,0,0,724,725,1,0,0,
+        0,725,105,1,0,0,0,726,728,5,42,0,0,727,729,5,263,0,0,728,727,1,0,
+        0,0,728,729,1,0,0,0,729,731,1,0,0,0,730,732,5,265,0,0,731,730,1,
+        0,0,0,731,732,1,0,0,0,732,734,1,0,0,0,733,735,5,17,0,0,734,733,1,
+        0,0,0,734,735,1,0,0,0,735,107,1,0,0,0,736,792,5,53,0,0,737,738,5,
+        267,0,0,738,741,5,278,0,0,739,740,5,268,0,0,740,742,3,110,55,0,741,
+        739,1,0,0,0,741,742,1,0,0,0,742,793,1,0,0,0,743,744,5,267,0,0,744,
+        793,5,279,0,0,745,746,5,269,0,0,746,748,5,270,0,0,747,749,3,110,
+        55,0,748,747,1,0,0,0,748,749,1,0,0,0,749,754,1,0,0,0,750,751,3,110,
+        55,0,751,752,5,271,0,0,752,753,3,110,55,0,753,755,1,0,0,0,754,750,
+        1,0,0,0,755,756,1,0,0,0,756,754,1,0,0,0,756,757,1,0,0,0,757,793,
+        1,0,0,0,758,759,5,272,0,0,759,760,5,270,0,0,760,793,3,110,55,0,761,
+        762,5,273,0,0,762,763,5,270,0,0,763,793,3,110,55,0,764,765,5,274,
+        0,0,765,766,5,270,0,0,766,793,3,110,55,0,767,768,5,276,0,0,768,769,
+        5,270,0,0,769,776,3,110,55,0,770,771,3,110,55,0,771,772,5,271,0,
+        0,772,773,3,110,55,0,773,775,1,0,0,0,774,770,1,0,0,0,775,778,1,0,
+        0,0,776,774,1,0,0,0,776,777,1,0,0,0,777,793,1,0,0,0,778,776,1,0,
+        0,0,779,780,5,277,0,0,780,781,5,270,0,0,781,786,3,110,55,0,782,783,
+        3,110,55,0,783,784,5,271,0,0,784,785,3,110,55,0,785,787,1,0,0,0,
+        786,782,1,0,0,0,787,788,1,0,0,0,788,786,1,0,0,0,788,789,1,0,0,0,
+        789,793,1,0,0,0,790,791,5,275,0,0,791,793,5,270,0,0,792,737,1,0,
+        0,0,792,743,1,0,0,0,792,745,1,0,0,0,792,758,1,0,0,0,792,761,1,0,
+        0,0,792,764,1,0,0,0,792,767,1,0,0,0,792,779,1,0,0,0,792,790,1,0,
+        0,0,793,795,1,0,0,0,794,796,5,282,0,0,795,794,1,0,0,0,795,796,1,
+        0,0,0,796,798,1,0,0,0,797,799,5,281,0,0,798,797,1,0,0,0,798,799,
+        1,0,0,0,799,109,1,0,0,0,800,801,7,14,0,0,801,111,1,0,0,0,802,804,
+        5,54,0,0,803,805,5,284,0,0,804,803,1,0,0,0,805,806,1,0,0,0,806,804,
+        1,0,0,0,806,807,1,0,0,0,807,809,1,0,0,0,808,810,5,286,0,0,809,808,
+        1,0,0,0,809,810,1,0,0,0,810,812,1,0,0,0,811,813,5,285,0,0,812,811,
+        1,0,0,0,812,813,1,0,0,0,813,113,1,0,0,0,115,123,127,130,139,141,
+        150,156,158,162,164,166,170,175,194,211,213,218,220,224,229,232,
+        235,240,252,257,262,267,272,277,282,287,292,297,322,326,329,332,
+        336,339,342,347,350,355,358,364,367,370,395,397,400,403,406,411,
+        414,417,420,425,428,438,444,447,450,455,458,462,465,472,475,478,
+        483,486,491,496,502,506,509,530,536,573,575,578,581,591,616,625,
+        628,631,634,642,658,666,675,678,681,689,695,703,707,719,721,724,
+        728,731,734,741,748,756,776,788,792,795,798,806,809,812
     ]
 
 class SQLParser ( Parser ):
@@ -400,7 +411,7 @@ class SQLParser ( Parser ):
                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                      "<INVALID>", "<INVALID>", "'MONITORMANAGER'", "'WORKERS'", 
                      "<INVALID>", "'TASK'", "<INVALID>", "<INVALID>", "'STOP'", 
-                     "'REPORT'", "'LIST'" ]
+                     "'REPORT'", "'LIST'", "'SUMMARY'", "'EXPORT'" ]
 
     symbolicNames = [ "<INVALID>", "CONNECT", "SESSION", "DISCONNECT", "MINUS_MINUS_COMMENT", 
                       "SQL_CREATE", "SQL_INSERT", "SQL_UPDATE", "SQL_SELECT", 
@@ -473,10 +484,11 @@ class SQLParser ( Parser ):
                       "MONITOR_MANAGER", "MONITOR_WORKERS", "MONITOR_CREATE", 
                       "MONITOR_TASK", "MONITOR_EQUAL", "MONITOR_START", 
                       "MONITOR_STOP", "MONITOR_REPORT", "MONITOR_LIST", 
-                      "MONITOR_ON", "MONITOR_OFF", "MONITOR_EXPRESSION", 
-                      "MONITOR_CRLF", "MONITOR_SEMICOLON", "PLUGIN_SPACE", 
-                      "PLUGIN_EXPRESSION", "PLUGIN_CRLF", "PLUGIN_SEMICOLON", 
-                      "SLEEP_SPACE", "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
+                      "MONITOR_SUMMARY", "MONITOR_EXPORT", "MONITOR_ON", 
+                      "MONITOR_OFF", "MONITOR_EXPRESSION", "MONITOR_CRLF", 
+                      "MONITOR_SEMICOLON", "PLUGIN_SPACE", "PLUGIN_EXPRESSION", 
+                      "PLUGIN_CRLF", "PLUGIN_SEMICOLON", "SLEEP_SPACE", 
+                      "SLEEP_EXPRESSION", "SLEEP_CRLF", "SLEEP_SEMICOLON" ]
 
     RULE_prog = 0
     RULE_command = 1
@@ -533,7 +545,8 @@ class SQLParser ( Parser ):
     RULE_data = 52
     RULE_help = 53
     RULE_monitor = 54
-    RULE_plugin = 55
+    RULE_monitorExpression = 55
+    RULE_plugin = 56
 
     ruleNames =  [ "prog", "command", "connect", "connectlocal", "connectjdbc", 
                    "connectUserInfo", "connectDriver", "connectDriverSchema", 
@@ -546,7 +559,7 @@ class SQLParser ( Parser ):
                    "baseCommand", "exit", "quit", "use", "sleep", "start", 
                    "load", "assert", "host", "loop", "if", "endif", "whenever", 
                    "spool", "echo", "script", "set", "ssh", "job", "compare", 
-                   "data", "help", "monitor", "plugin" ]
+                   "data", "help", "monitor", "monitorExpression", "plugin" ]
 
     EOF = Token.EOF
     CONNECT=1
@@ -824,19 +837,21 @@ class SQLParser ( Parser ):
     MONITOR_STOP=273
     MONITOR_REPORT=274
     MONITOR_LIST=275
-    MONITOR_ON=276
-    MONITOR_OFF=277
-    MONITOR_EXPRESSION=278
-    MONITOR_CRLF=279
-    MONITOR_SEMICOLON=280
-    PLUGIN_SPACE=281
-    PLUGIN_EXPRESSION=282
-    PLUGIN_CRLF=283
-    PLUGIN_SEMICOLON=284
-    SLEEP_SPACE=285
-    SLEEP_EXPRESSION=286
-    SLEEP_CRLF=287
-    SLEEP_SEMICOLON=288
+    MONITOR_SUMMARY=276
+    MONITOR_EXPORT=277
+    MONITOR_ON=278
+    MONITOR_OFF=279
+    MONITOR_EXPRESSION=280
+    MONITOR_CRLF=281
+    MONITOR_SEMICOLON=282
+    PLUGIN_SPACE=283
+    PLUGIN_EXPRESSION=284
+    PLUGIN_CRLF=285
+    PLUGIN_SEMICOLON=286
+    SLEEP_SPACE=287
+    SLEEP_EXPRESSION=288
+    SLEEP_CRLF=289
+    SLEEP_SEMICOLON=290
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -879,9 +894,9 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 0, self.RULE_prog)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 112
+            self.state = 114
             self.command()
-            self.state = 113
+            self.state = 115
             self.match(SQLParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -939,37 +954,37 @@ class SQLParser ( Parser ):
         localctx = SQLParser.CommandContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_command)
         try:
-            self.state = 121
+            self.state = 123
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 115
+                self.state = 117
                 self.baseCommand()
                 pass
             elif token in [3]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 116
+                self.state = 118
                 self.disconnect()
                 pass
             elif token in [2]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 117
+                self.state = 119
                 self.session()
                 pass
             elif token in [1]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 118
+                self.state = 120
                 self.connect()
                 pass
             elif token in [5, 6, 7, 8, 9, 10, 11, 12, 13, 16, 17]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 119
+                self.state = 121
                 self.sql()
                 pass
             elif token in [-1]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 120
+                self.state = 122
                 self.match(SQLParser.EOF)
                 pass
             else:
@@ -1021,25 +1036,25 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 125
+            self.state = 127
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
             if la_ == 1:
-                self.state = 123
+                self.state = 125
                 self.connectjdbc()
                 pass
 
             elif la_ == 2:
-                self.state = 124
+                self.state = 126
                 self.connectlocal()
                 pass
 
 
-            self.state = 128
+            self.state = 130
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==68:
-                self.state = 127
+                self.state = 129
                 self.match(SQLParser.CONNECT_SEMICOLON)
 
 
@@ -1087,11 +1102,11 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 6, self.RULE_connectlocal)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 130
+            self.state = 132
             self.match(SQLParser.CONNECT)
-            self.state = 131
+            self.state = 133
             self.match(SQLParser.CONNECT_SLASH)
-            self.state = 132
+            self.state = 134
             self.connectlocalService()
         except RecognitionException as re:
             localctx.exception = re
@@ -1181,82 +1196,82 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 134
+            self.state = 136
             self.match(SQLParser.CONNECT)
-            self.state = 139
+            self.state = 141
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==72:
-                self.state = 135
-                self.connectUserInfo()
                 self.state = 137
+                self.connectUserInfo()
+                self.state = 139
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==59:
-                    self.state = 136
+                    self.state = 138
                     self.match(SQLParser.CONNECT_AT)
 
 
 
 
-            self.state = 164
+            self.state = 166
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==69:
-                self.state = 141
+                self.state = 143
                 self.connectDriver()
-                self.state = 142
+                self.state = 144
                 self.match(SQLParser.CONNECT_COLON)
-                self.state = 143
+                self.state = 145
                 self.connectDriverSchema()
-                self.state = 144
+                self.state = 146
                 self.match(SQLParser.CONNECT_COLON)
-                self.state = 148
+                self.state = 150
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==72:
-                    self.state = 145
+                    self.state = 147
                     self.connectDriverType()
-                    self.state = 146
+                    self.state = 148
                     self.match(SQLParser.CONNECT_COLON)
 
 
-                self.state = 150
+                self.state = 152
                 self.match(SQLParser.CONNECT_DASH)
-                self.state = 156
+                self.state = 158
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if (((_la - 70)) & ~0x3f) == 0 and ((1 << (_la - 70)) & 7) != 0:
-                    self.state = 151
+                    self.state = 153
                     self.connectHost()
-                    self.state = 154
+                    self.state = 156
                     self._errHandler.sync(self)
                     la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
                     if la_ == 1:
-                        self.state = 152
+                        self.state = 154
                         self.match(SQLParser.CONNECT_COLON)
-                        self.state = 153
+                        self.state = 155
                         self.connectPort()
 
 
 
 
-                self.state = 162
+                self.state = 164
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==60 or _la==61:
-                    self.state = 158
+                    self.state = 160
                     _la = self._input.LA(1)
                     if not(_la==60 or _la==61):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 160
+                    self.state = 162
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if _la==72:
-                        self.state = 159
+                        self.state = 161
                         self.connectService()
 
 
@@ -1264,13 +1279,13 @@ class SQLParser ( Parser ):
 
 
 
-            self.state = 168
+            self.state = 170
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==62:
-                self.state = 166
+                self.state = 168
                 self.match(SQLParser.CONNECT_QUESTION)
-                self.state = 167
+                self.state = 169
                 self.connectParameters()
 
 
@@ -1320,15 +1335,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 170
+            self.state = 172
             self.connectUser()
-            self.state = 173
+            self.state = 175
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==60:
-                self.state = 171
+                self.state = 173
                 self.match(SQLParser.CONNECT_SLASH)
-                self.state = 172
+                self.state = 174
                 self.connectPassword()
 
 
@@ -1369,7 +1384,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_connectDriver)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 175
+            self.state = 177
             self.match(SQLParser.JDBC)
         except RecognitionException as re:
             localctx.exception = re
@@ -1408,7 +1423,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 14, self.RULE_connectDriverSchema)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 177
+            self.state = 179
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1447,7 +1462,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_connectDriverType)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 179
+            self.state = 181
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1493,7 +1508,7 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 181
+            self.state = 183
             _la = self._input.LA(1)
             if not((((_la - 70)) & ~0x3f) == 0 and ((1 << (_la - 70)) & 7) != 0):
                 self._errHandler.recoverInline(self)
@@ -1537,7 +1552,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 20, self.RULE_connectUser)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 183
+            self.state = 185
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1576,7 +1591,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_connectPassword)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 185
+            self.state = 187
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1615,7 +1630,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 24, self.RULE_connectPort)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 187
+            self.state = 189
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1661,15 +1676,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 189
+            self.state = 191
             self.match(SQLParser.CONNECT_STRING)
-            self.state = 192
+            self.state = 194
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==61:
-                self.state = 190
+                self.state = 192
                 self.match(SQLParser.CONNECT_COLON)
-                self.state = 191
+                self.state = 193
                 self.match(SQLParser.CONNECT_STRING)
 
 
@@ -1710,7 +1725,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 28, self.RULE_connectlocalService)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 194
+            self.state = 196
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1749,7 +1764,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 30, self.RULE_connectParameterName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 196
+            self.state = 198
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1788,7 +1803,7 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 32, self.RULE_connectParameterValue)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 198
+            self.state = 200
             self.match(SQLParser.CONNECT_STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1835,11 +1850,11 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 34, self.RULE_connectParameter)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 200
+            self.state = 202
             self.connectParameterName()
-            self.state = 201
+            self.state = 203
             self.match(SQLParser.CONNECT_EQUAL)
-            self.state = 202
+            self.state = 204
             self.connectParameterValue()
         except RecognitionException as re:
             localctx.exception = re
@@ -1889,21 +1904,21 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 204
+            self.state = 206
             self.connectParameter()
-            self.state = 211
+            self.state = 213
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==67:
-                self.state = 207 
+                self.state = 209 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 205
+                    self.state = 207
                     self.match(SQLParser.CONNECT_PARA_AND)
-                    self.state = 206
+                    self.state = 208
                     self.connectParameter()
-                    self.state = 209 
+                    self.state = 211 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not (_la==67):
@@ -1965,35 +1980,35 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 213
+            self.state = 215
             self.match(SQLParser.DISCONNECT)
-            self.state = 218
+            self.state = 220
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((_la) & ~0x3f) == 0 and ((1 << _la) & 180143987239157760) != 0:
-                self.state = 216
+                self.state = 218
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [20, 22, 23, 24, 25, 26, 27, 28, 29, 30, 57]:
-                    self.state = 214
+                    self.state = 216
                     self.expression()
                     pass
                 elif token in [55]:
-                    self.state = 215
+                    self.state = 217
                     self.match(SQLParser.INT)
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 220
+                self.state = 222
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 222
+            self.state = 224
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 221
+                self.state = 223
                 self.match(SQLParser.CRLF)
 
 
@@ -2059,36 +2074,36 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 224
+            self.state = 226
             self.match(SQLParser.SESSION)
-            self.state = 225
+            self.state = 227
             _la = self._input.LA(1)
             if not((((_la - 79)) & ~0x3f) == 0 and ((1 << (_la - 79)) & 31) != 0):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 227
+            self.state = 229
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==84:
-                self.state = 226
+                self.state = 228
                 self.match(SQLParser.SESSION_NAME)
 
 
-            self.state = 230
+            self.state = 232
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==85:
-                self.state = 229
+                self.state = 231
                 self.match(SQLParser.SESSION_END)
 
 
-            self.state = 233
+            self.state = 235
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 232
+                self.state = 234
                 self.match(SQLParser.CRLF)
 
 
@@ -2193,12 +2208,12 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 236 
+            self.state = 238 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 235
+                    self.state = 237
                     _la = self._input.LA(1)
                     if not(((_la) & ~0x3f) == 0 and ((1 << _la) & 144115190220193792) != 0):
                         self._errHandler.recoverInline(self)
@@ -2208,7 +2223,7 @@ class SQLParser ( Parser ):
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 238 
+                self.state = 240 
                 self._errHandler.sync(self)
                 _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
 
@@ -2284,57 +2299,57 @@ class SQLParser ( Parser ):
         localctx = SQLParser.SqlContext(self, self._ctx, self.state)
         self.enterRule(localctx, 44, self.RULE_sql)
         try:
-            self.state = 250
+            self.state = 252
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [5]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 240
+                self.state = 242
                 self.sqlCreate()
                 pass
             elif token in [10]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 241
+                self.state = 243
                 self.sqlReplace()
                 pass
             elif token in [6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 242
+                self.state = 244
                 self.sqlInsert()
                 pass
             elif token in [7]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 243
+                self.state = 245
                 self.sqlUpdate()
                 pass
             elif token in [9]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 244
+                self.state = 246
                 self.sqlDelete()
                 pass
             elif token in [8]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 245
+                self.state = 247
                 self.sqlSelect()
                 pass
             elif token in [11, 12]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 246
+                self.state = 248
                 self.sqlDeclare()
                 pass
             elif token in [13]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 247
+                self.state = 249
                 self.sqlDrop()
                 pass
             elif token in [16]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 248
+                self.state = 250
                 self.sqlCreateProcedure()
                 pass
             elif token in [17]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 249
+                self.state = 251
                 self.match(SQLParser.CRLF)
                 pass
             else:
@@ -2384,15 +2399,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 252
+            self.state = 254
             self.match(SQLParser.SQL_CREATE)
-            self.state = 253
-            self.match(SQLParser.SQL_END)
             self.state = 255
+            self.match(SQLParser.SQL_END)
+            self.state = 257
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 254
+                self.state = 256
                 self.match(SQLParser.CRLF)
 
 
@@ -2440,15 +2455,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 257
+            self.state = 259
             self.match(SQLParser.SQL_REPLACE)
-            self.state = 258
-            self.match(SQLParser.SQL_END)
             self.state = 260
+            self.match(SQLParser.SQL_END)
+            self.state = 262
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 259
+                self.state = 261
                 self.match(SQLParser.CRLF)
 
 
@@ -2496,15 +2511,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 262
+            self.state = 264
             self.match(SQLParser.SQL_INSERT)
-            self.state = 263
-            self.match(SQLParser.SQL_END)
             self.state = 265
+            self.match(SQLParser.SQL_END)
+            self.state = 267
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 264
+                self.state = 266
                 self.match(SQLParser.CRLF)
 
 
@@ -2552,15 +2567,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 267
+            self.state = 269
             self.match(SQLParser.SQL_UPDATE)
-            self.state = 268
-            self.match(SQLParser.SQL_END)
             self.state = 270
+            self.match(SQLParser.SQL_END)
+            self.state = 272
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 269
+                self.state = 271
                 self.match(SQLParser.CRLF)
 
 
@@ -2608,15 +2623,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 272
+            self.state = 274
             self.match(SQLParser.SQL_DELETE)
-            self.state = 273
-            self.match(SQLParser.SQL_END)
             self.state = 275
+            self.match(SQLParser.SQL_END)
+            self.state = 277
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 274
+                self.state = 276
                 self.match(SQLParser.CRLF)
 
 
@@ -2664,15 +2679,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 277
+            self.state = 279
             self.match(SQLParser.SQL_SELECT)
-            self.state = 278
-            self.match(SQLParser.SQL_END)
             self.state = 280
+            self.match(SQLParser.SQL_END)
+            self.state = 282
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 279
+                self.state = 281
                 self.match(SQLParser.CRLF)
 
 
@@ -2720,15 +2735,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 282
+            self.state = 284
             self.match(SQLParser.SQL_DROP)
-            self.state = 283
-            self.match(SQLParser.SQL_END)
             self.state = 285
+            self.match(SQLParser.SQL_END)
+            self.state = 287
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 284
+                self.state = 286
                 self.match(SQLParser.CRLF)
 
 
@@ -2779,20 +2794,20 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 287
+            self.state = 289
             _la = self._input.LA(1)
             if not(_la==11 or _la==12):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 288
-            self.match(SQLParser.SQL_SLASH)
             self.state = 290
+            self.match(SQLParser.SQL_SLASH)
+            self.state = 292
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 289
+                self.state = 291
                 self.match(SQLParser.CRLF)
 
 
@@ -2840,15 +2855,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 292
+            self.state = 294
             self.match(SQLParser.SQL_CREATE_PROCEDURE)
-            self.state = 293
-            self.match(SQLParser.SQL_SLASH)
             self.state = 295
+            self.match(SQLParser.SQL_SLASH)
+            self.state = 297
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 294
+                self.state = 296
                 self.match(SQLParser.CRLF)
 
 
@@ -2977,122 +2992,122 @@ class SQLParser ( Parser ):
         localctx = SQLParser.BaseCommandContext(self, self._ctx, self.state)
         self.enterRule(localctx, 64, self.RULE_baseCommand)
         try:
-            self.state = 320
+            self.state = 322
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [38]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 297
+                self.state = 299
                 self.assert_()
                 pass
             elif token in [40]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 298
+                self.state = 300
                 self.load()
                 pass
             elif token in [41]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 299
+                self.state = 301
                 self.host()
                 pass
             elif token in [39]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 300
+                self.state = 302
                 self.start()
                 pass
             elif token in [47]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 301
+                self.state = 303
                 self.loop()
                 pass
             elif token in [43]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 302
+                self.state = 304
                 self.if_()
                 pass
             elif token in [44]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 303
+                self.state = 305
                 self.endif()
                 pass
             elif token in [48]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 304
+                self.state = 306
                 self.whenever()
                 pass
             elif token in [45]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 305
+                self.state = 307
                 self.set_()
                 pass
             elif token in [35]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 306
+                self.state = 308
                 self.use()
                 pass
             elif token in [32]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 307
+                self.state = 309
                 self.exit()
                 pass
             elif token in [33]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 308
+                self.state = 310
                 self.quit()
                 pass
             elif token in [34]:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 309
+                self.state = 311
                 self.sleep()
                 pass
             elif token in [46]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 310
+                self.state = 312
                 self.spool()
                 pass
             elif token in [37]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 311
+                self.state = 313
                 self.script()
                 pass
             elif token in [36]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 312
+                self.state = 314
                 self.echo()
                 pass
             elif token in [49]:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 313
+                self.state = 315
                 self.ssh()
                 pass
             elif token in [50]:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 314
+                self.state = 316
                 self.job()
                 pass
             elif token in [51]:
                 self.enterOuterAlt(localctx, 19)
-                self.state = 315
+                self.state = 317
                 self.compare()
                 pass
             elif token in [52]:
                 self.enterOuterAlt(localctx, 20)
-                self.state = 316
+                self.state = 318
                 self.data()
                 pass
             elif token in [42]:
                 self.enterOuterAlt(localctx, 21)
-                self.state = 317
+                self.state = 319
                 self.help_()
                 pass
             elif token in [53]:
                 self.enterOuterAlt(localctx, 22)
-                self.state = 318
+                self.state = 320
                 self.monitor()
                 pass
             elif token in [54]:
                 self.enterOuterAlt(localctx, 23)
-                self.state = 319
+                self.state = 321
                 self.plugin()
                 pass
             else:
@@ -3145,29 +3160,29 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 322
-            self.match(SQLParser.EXIT)
             self.state = 324
+            self.match(SQLParser.EXIT)
+            self.state = 326
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==55:
-                self.state = 323
+                self.state = 325
                 self.match(SQLParser.INT)
 
 
-            self.state = 327
+            self.state = 329
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==19:
-                self.state = 326
+                self.state = 328
                 self.match(SQLParser.SEMICOLON)
 
 
-            self.state = 330
+            self.state = 332
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 329
+                self.state = 331
                 self.match(SQLParser.CRLF)
 
 
@@ -3218,29 +3233,29 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 332
-            self.match(SQLParser.QUIT)
             self.state = 334
+            self.match(SQLParser.QUIT)
+            self.state = 336
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==55:
-                self.state = 333
+                self.state = 335
                 self.match(SQLParser.INT)
 
 
-            self.state = 337
+            self.state = 339
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==19:
-                self.state = 336
+                self.state = 338
                 self.match(SQLParser.SEMICOLON)
 
 
-            self.state = 340
+            self.state = 342
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 339
+                self.state = 341
                 self.match(SQLParser.CRLF)
 
 
@@ -3294,28 +3309,28 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 342
+            self.state = 344
             self.match(SQLParser.USE)
-            self.state = 343
+            self.state = 345
             _la = self._input.LA(1)
             if not(_la==159 or _la==160):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 345
+            self.state = 347
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==162:
-                self.state = 344
+                self.state = 346
                 self.match(SQLParser.USE_SEMICOLON)
 
 
-            self.state = 348
+            self.state = 350
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 347
+                self.state = 349
                 self.match(SQLParser.CRLF)
 
 
@@ -3366,23 +3381,23 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 350
+            self.state = 352
             self.match(SQLParser.SLEEP)
-            self.state = 351
-            self.match(SQLParser.SLEEP_EXPRESSION)
             self.state = 353
+            self.match(SQLParser.SLEEP_EXPRESSION)
+            self.state = 355
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==288:
-                self.state = 352
+            if _la==290:
+                self.state = 354
                 self.match(SQLParser.SLEEP_SEMICOLON)
 
 
-            self.state = 356
+            self.state = 358
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 355
+                self.state = 357
                 self.match(SQLParser.CRLF)
 
 
@@ -3436,33 +3451,33 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 358
+            self.state = 360
             self.match(SQLParser.START)
-            self.state = 360 
+            self.state = 362 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 359
+                self.state = 361
                 self.match(SQLParser.START_EXPRESSION)
-                self.state = 362 
+                self.state = 364 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if not (_la==121):
                     break
 
-            self.state = 365
+            self.state = 367
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==19:
-                self.state = 364
+                self.state = 366
                 self.match(SQLParser.SEMICOLON)
 
 
-            self.state = 368
+            self.state = 370
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 367
+                self.state = 369
                 self.match(SQLParser.CRLF)
 
 
@@ -3564,83 +3579,83 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 370
+            self.state = 372
             self.match(SQLParser.LOAD)
-            self.state = 398
+            self.state = 400
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [108]:
-                self.state = 371
+                self.state = 373
                 self.match(SQLParser.LOAD_PLUGIN)
-                self.state = 372
+                self.state = 374
                 self.match(SQLParser.LOAD_EXPRESSION)
                 pass
             elif token in [109]:
-                self.state = 373
+                self.state = 375
                 self.match(SQLParser.LOAD_SCRIPT)
-                self.state = 374
+                self.state = 376
                 self.match(SQLParser.LOAD_EXPRESSION)
                 pass
             elif token in [110]:
-                self.state = 375
+                self.state = 377
                 self.match(SQLParser.LOAD_MAP)
-                self.state = 376
+                self.state = 378
                 self.match(SQLParser.LOAD_EXPRESSION)
                 pass
             elif token in [111]:
-                self.state = 377
+                self.state = 379
                 self.match(SQLParser.LOAD_JDBCDRIVER)
-                self.state = 395
+                self.state = 397
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la - 112)) & ~0x3f) == 0 and ((1 << (_la - 112)) & 31) != 0:
-                    self.state = 393
+                    self.state = 395
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [113]:
-                        self.state = 378
+                        self.state = 380
                         self.match(SQLParser.LOAD_JDBCCLASS)
-                        self.state = 379
+                        self.state = 381
                         self.match(SQLParser.LOAD_EQUAL)
-                        self.state = 380
+                        self.state = 382
                         self.match(SQLParser.LOAD_EXPRESSION)
                         pass
                     elif token in [112]:
-                        self.state = 381
+                        self.state = 383
                         self.match(SQLParser.LOAD_JDBCFILE)
-                        self.state = 382
+                        self.state = 384
                         self.match(SQLParser.LOAD_EQUAL)
-                        self.state = 383
+                        self.state = 385
                         self.match(SQLParser.LOAD_EXPRESSION)
                         pass
                     elif token in [114]:
-                        self.state = 384
+                        self.state = 386
                         self.match(SQLParser.LOAD_JDBCNAME)
-                        self.state = 385
+                        self.state = 387
                         self.match(SQLParser.LOAD_EQUAL)
-                        self.state = 386
+                        self.state = 388
                         self.match(SQLParser.LOAD_EXPRESSION)
                         pass
                     elif token in [115]:
-                        self.state = 387
+                        self.state = 389
                         self.match(SQLParser.LOAD_JDBCPROP)
-                        self.state = 388
+                        self.state = 390
                         self.match(SQLParser.LOAD_EQUAL)
-                        self.state = 389
+                        self.state = 391
                         self.match(SQLParser.LOAD_EXPRESSION)
                         pass
                     elif token in [116]:
-                        self.state = 390
+                        self.state = 392
                         self.match(SQLParser.LOAD_JDBCURL)
-                        self.state = 391
+                        self.state = 393
                         self.match(SQLParser.LOAD_EQUAL)
-                        self.state = 392
+                        self.state = 394
                         self.match(SQLParser.LOAD_EXPRESSION)
                         pass
                     else:
                         raise NoViableAltException(self)
 
-                    self.state = 397
+                    self.state = 399
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -3648,19 +3663,19 @@ class SQLParser ( Parser ):
             else:
                 raise NoViableAltException(self)
 
-            self.state = 401
+            self.state = 403
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==118:
-                self.state = 400
+                self.state = 402
                 self.match(SQLParser.LOAD_SEMICOLON)
 
 
-            self.state = 404
+            self.state = 406
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==119:
-                self.state = 403
+                self.state = 405
                 self.match(SQLParser.LOAD_CRLF)
 
 
@@ -3717,39 +3732,39 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 406
+            self.state = 408
             self.match(SQLParser.ASSERT)
-            self.state = 407
+            self.state = 409
             self.match(SQLParser.ASSERT_EXPRESSION)
-            self.state = 412
+            self.state = 414
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==103 or _la==104:
-                self.state = 409
+                self.state = 411
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==104:
-                    self.state = 408
+                    self.state = 410
                     self.match(SQLParser.ASSERT_COMMA)
 
 
-                self.state = 411
+                self.state = 413
                 self.match(SQLParser.ASSERT_NAME)
 
 
-            self.state = 415
+            self.state = 417
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==105:
-                self.state = 414
+                self.state = 416
                 self.match(SQLParser.ASSERT_SEMICOLON)
 
 
-            self.state = 418
+            self.state = 420
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 417
+                self.state = 419
                 self.match(SQLParser.CRLF)
 
 
@@ -3800,23 +3815,23 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 420
+            self.state = 422
             self.match(SQLParser.HOST)
-            self.state = 421
-            self.match(SQLParser.HOST_EXPRESSION)
             self.state = 423
+            self.match(SQLParser.HOST_EXPRESSION)
+            self.state = 425
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==19:
-                self.state = 422
+                self.state = 424
                 self.match(SQLParser.SEMICOLON)
 
 
-            self.state = 426
+            self.state = 428
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 425
+                self.state = 427
                 self.match(SQLParser.CRLF)
 
 
@@ -3891,65 +3906,65 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 428
+            self.state = 430
             self.match(SQLParser.LOOP)
-            self.state = 442
+            self.state = 444
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [138]:
-                self.state = 429
+                self.state = 431
                 self.match(SQLParser.LOOP_BREAK)
                 pass
             elif token in [139]:
-                self.state = 430
+                self.state = 432
                 self.match(SQLParser.LOOP_END)
                 pass
             elif token in [140]:
-                self.state = 431
+                self.state = 433
                 self.match(SQLParser.LOOP_CONTINUE)
                 pass
             elif token in [132]:
-                self.state = 432
+                self.state = 434
                 self.match(SQLParser.LOOP_BEGIN)
-                self.state = 433
+                self.state = 435
                 self.match(SQLParser.LOOP_UNTIL)
-                self.state = 434
+                self.state = 436
                 self.match(SQLParser.LOOP_EXPRESSION)
                 pass
             elif token in [133, 135]:
-                self.state = 436
+                self.state = 438
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==135:
-                    self.state = 435
+                    self.state = 437
                     self.match(SQLParser.LOOP_INT)
 
 
-                self.state = 438
+                self.state = 440
                 self.match(SQLParser.LOOP_UNTIL)
-                self.state = 439
+                self.state = 441
                 self.match(SQLParser.LOOP_EXPRESSION)
-                self.state = 440
+                self.state = 442
                 self.match(SQLParser.LOOP_INTERVAL)
-                self.state = 441
+                self.state = 443
                 self.match(SQLParser.LOOP_INT)
                 pass
             else:
                 raise NoViableAltException(self)
 
-            self.state = 445
+            self.state = 447
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==130:
-                self.state = 444
+                self.state = 446
                 self.match(SQLParser.LOOP_SEMICOLON)
 
 
-            self.state = 448
+            self.state = 450
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 447
+                self.state = 449
                 self.match(SQLParser.CRLF)
 
 
@@ -4000,23 +4015,23 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 450
+            self.state = 452
             self.match(SQLParser.IF)
-            self.state = 451
-            self.match(SQLParser.IF_EXPRESSION)
             self.state = 453
+            self.match(SQLParser.IF_EXPRESSION)
+            self.state = 455
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==19:
-                self.state = 452
+                self.state = 454
                 self.match(SQLParser.SEMICOLON)
 
 
-            self.state = 456
+            self.state = 458
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 455
+                self.state = 457
                 self.match(SQLParser.CRLF)
 
 
@@ -4064,21 +4079,21 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 458
-            self.match(SQLParser.ENDIF)
             self.state = 460
+            self.match(SQLParser.ENDIF)
+            self.state = 462
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==19:
-                self.state = 459
+                self.state = 461
                 self.match(SQLParser.SEMICOLON)
 
 
-            self.state = 463
+            self.state = 465
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 462
+                self.state = 464
                 self.match(SQLParser.CRLF)
 
 
@@ -4138,39 +4153,39 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 465
+            self.state = 467
             self.match(SQLParser.WHENEVER)
-            self.state = 466
+            self.state = 468
             self.match(SQLParser.WHENEVER_ERROR)
-            self.state = 470
+            self.state = 472
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [147]:
-                self.state = 467
+                self.state = 469
                 self.match(SQLParser.WHENEVER_CONTINUE)
                 pass
             elif token in [148]:
-                self.state = 468
+                self.state = 470
                 self.match(SQLParser.WHENEVER_EXIT)
-                self.state = 469
+                self.state = 471
                 self.match(SQLParser.WHENEVER_EXITCODE)
                 pass
             else:
                 raise NoViableAltException(self)
 
-            self.state = 473
+            self.state = 475
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==146:
-                self.state = 472
+                self.state = 474
                 self.match(SQLParser.WHENEVER_SEMICOLON)
 
 
-            self.state = 476
+            self.state = 478
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 475
+                self.state = 477
                 self.match(SQLParser.CRLF)
 
 
@@ -4224,28 +4239,28 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 478
+            self.state = 480
             self.match(SQLParser.SPOOL)
-            self.state = 479
+            self.state = 481
             _la = self._input.LA(1)
             if not(_la==151 or _la==153):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 481
+            self.state = 483
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==152:
-                self.state = 480
+                self.state = 482
                 self.match(SQLParser.SPOOL_SEMICOLON)
 
 
-            self.state = 484
+            self.state = 486
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==154:
-                self.state = 483
+                self.state = 485
                 self.match(SQLParser.SPOOL_CRLF)
 
 
@@ -4296,15 +4311,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 486
+            self.state = 488
             self.match(SQLParser.ECHO)
-            self.state = 487
-            self.match(SQLParser.EchoBlock)
             self.state = 489
-            self._errHandler.sync(self)
+            self.match(SQLParser.EchoBlock)
+            self.state = 491
+            self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,71,self._ctx)
             if la_ == 1:
-                self.state = 488
+                self.state = 490
                 _la = self._input.LA(1)
                 if not(_la==-1 or _la==17):
                     self._errHandler.recoverInline(self)
@@ -4357,15 +4372,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 491
+            self.state = 493
             self.match(SQLParser.SCRIPT)
-            self.state = 492
-            self.match(SQLParser.ScriptBlock)
             self.state = 494
+            self.match(SQLParser.ScriptBlock)
+            self.state = 496
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 493
+                self.state = 495
                 self.match(SQLParser.CRLF)
 
 
@@ -4419,31 +4434,31 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 496
+            self.state = 498
             self.match(SQLParser.SET)
-            self.state = 500
+            self.state = 502
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==156:
-                self.state = 497
+                self.state = 499
                 self.match(SQLParser.SET_EXPRESSION)
-                self.state = 502
+                self.state = 504
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 504
+            self.state = 506
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==157:
-                self.state = 503
+                self.state = 505
                 self.match(SQLParser.SET_SEMICOLON)
 
 
-            self.state = 507
+            self.state = 509
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 506
+                self.state = 508
                 self.match(SQLParser.CRLF)
 
 
@@ -4572,72 +4587,72 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 509
+            self.state = 511
             self.match(SQLParser.SSH)
-            self.state = 573
+            self.state = 575
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,79,self._ctx)
             if la_ == 1:
-                self.state = 510
+                self.state = 512
                 self.match(SQLParser.SSH_CONNECT)
-                self.state = 511
+                self.state = 513
                 self.match(SQLParser.SSH_EXPRESSION)
-                self.state = 512
+                self.state = 514
                 self.match(SQLParser.SSH_WITH)
-                self.state = 513
+                self.state = 515
                 self.match(SQLParser.SSH_USER)
-                self.state = 514
+                self.state = 516
                 self.match(SQLParser.SSH_EXPRESSION)
-                self.state = 515
+                self.state = 517
                 self.match(SQLParser.SSH_KEYFILE)
-                self.state = 516
+                self.state = 518
                 self.match(SQLParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 2:
-                self.state = 517
+                self.state = 519
                 self.match(SQLParser.SSH_SET)
-                self.state = 518
+                self.state = 520
                 self.match(SQLParser.SSH_EXPRESSION)
-                self.state = 519
+                self.state = 521
                 self.match(SQLParser.SSH_EQUAL)
-                self.state = 520
+                self.state = 522
                 self.match(SQLParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 3:
-                self.state = 521
+                self.state = 523
                 self.match(SQLParser.SSH_CONNECT)
-                self.state = 522
+                self.state = 524
                 self.match(SQLParser.SSH_EXPRESSION)
-                self.state = 523
+                self.state = 525
                 self.match(SQLParser.SSH_WITH)
-                self.state = 524
+                self.state = 526
                 self.match(SQLParser.SSH_USER)
-                self.state = 525
+                self.state = 527
                 self.match(SQLParser.SSH_EXPRESSION)
-                self.state = 528
+                self.state = 530
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==169:
-                    self.state = 526
+                    self.state = 528
                     self.match(SQLParser.SSH_PASSWORD)
-                    self.state = 527
+                    self.state = 529
                     self.match(SQLParser.SSH_EXPRESSION)
 
 
                 pass
 
             elif la_ == 4:
-                self.state = 530
+                self.state = 532
                 self.match(SQLParser.SSH_EXECUTE)
-                self.state = 532 
+                self.state = 534 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 531
+                    self.state = 533
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 534 
+                    self.state = 536 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not (_la==190):
@@ -4646,108 +4661,108 @@ class SQLParser ( Parser ):
                 pass
 
             elif la_ == 5:
-                self.state = 536
+                self.state = 538
                 self.match(SQLParser.SSH_DISCONNECT)
                 pass
 
             elif la_ == 6:
-                self.state = 537
+                self.state = 539
                 self.match(SQLParser.SSH_SAVE)
-                self.state = 538
+                self.state = 540
                 self.match(SQLParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 7:
-                self.state = 539
+                self.state = 541
                 self.match(SQLParser.SSH_RESTORE)
-                self.state = 540
+                self.state = 542
                 self.match(SQLParser.SSH_EXPRESSION)
                 pass
 
             elif la_ == 8:
-                self.state = 541
+                self.state = 543
                 self.match(SQLParser.SFTP)
-                self.state = 571
+                self.state = 573
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [175]:
-                    self.state = 542
+                    self.state = 544
                     self.match(SQLParser.SFTP_CHMOD)
-                    self.state = 543
+                    self.state = 545
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 544
+                    self.state = 546
                     self.match(SQLParser.INT)
                     pass
                 elif token in [176]:
-                    self.state = 545
+                    self.state = 547
                     self.match(SQLParser.SFTP_GETCWD)
                     pass
                 elif token in [177]:
-                    self.state = 546
+                    self.state = 548
                     self.match(SQLParser.SFTP_CHDIR)
-                    self.state = 547
+                    self.state = 549
                     self.match(SQLParser.SSH_EXPRESSION)
                     pass
                 elif token in [178]:
-                    self.state = 548
+                    self.state = 550
                     self.match(SQLParser.SFTP_CHOWN)
-                    self.state = 549
+                    self.state = 551
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 550
+                    self.state = 552
                     self.match(SQLParser.INT)
-                    self.state = 551
+                    self.state = 553
                     self.match(SQLParser.INT)
                     pass
                 elif token in [179]:
-                    self.state = 552
+                    self.state = 554
                     self.match(SQLParser.SFTP_MKDIR)
-                    self.state = 553
+                    self.state = 555
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 554
+                    self.state = 556
                     self.match(SQLParser.INT)
                     pass
                 elif token in [180]:
-                    self.state = 555
+                    self.state = 557
                     self.match(SQLParser.SFTP_GET)
-                    self.state = 556
+                    self.state = 558
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 557
+                    self.state = 559
                     self.match(SQLParser.SSH_EXPRESSION)
                     pass
                 elif token in [181]:
-                    self.state = 558
+                    self.state = 560
                     self.match(SQLParser.SFTP_PUT)
-                    self.state = 559
+                    self.state = 561
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 560
+                    self.state = 562
                     self.match(SQLParser.SSH_EXPRESSION)
                     pass
                 elif token in [182]:
-                    self.state = 561
+                    self.state = 563
                     self.match(SQLParser.SFTP_REMOVE)
-                    self.state = 562
+                    self.state = 564
                     self.match(SQLParser.SSH_EXPRESSION)
                     pass
                 elif token in [183]:
-                    self.state = 563
+                    self.state = 565
                     self.match(SQLParser.SFTP_RENAME)
-                    self.state = 564
+                    self.state = 566
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 565
+                    self.state = 567
                     self.match(SQLParser.SSH_EXPRESSION)
                     pass
                 elif token in [184]:
-                    self.state = 566
+                    self.state = 568
                     self.match(SQLParser.SFTP_LISTDIR)
-                    self.state = 567
+                    self.state = 569
                     self.match(SQLParser.SSH_EXPRESSION)
                     pass
                 elif token in [185]:
-                    self.state = 568
+                    self.state = 570
                     self.match(SQLParser.SFTP_TRUNCATE)
-                    self.state = 569
+                    self.state = 571
                     self.match(SQLParser.SSH_EXPRESSION)
-                    self.state = 570
+                    self.state = 572
                     self.match(SQLParser.INT)
                     pass
                 else:
@@ -4756,19 +4771,19 @@ class SQLParser ( Parser ):
                 pass
 
 
-            self.state = 576
+            self.state = 578
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==188:
-                self.state = 575
+                self.state = 577
                 self.match(SQLParser.SSH_SEMICOLON)
 
 
-            self.state = 579
+            self.state = 581
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 578
+                self.state = 580
                 self.match(SQLParser.CRLF)
 
 
@@ -4873,15 +4888,15 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 581
+            self.state = 583
             self.match(SQLParser.JOB)
-            self.state = 626
+            self.state = 628
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [206]:
-                self.state = 582
+                self.state = 584
                 self.match(SQLParser.JOB_MANGER)
-                self.state = 583
+                self.state = 585
                 _la = self._input.LA(1)
                 if not(_la==207 or _la==208):
                     self._errHandler.recoverInline(self)
@@ -4890,85 +4905,85 @@ class SQLParser ( Parser ):
                     self.consume()
                 pass
             elif token in [199]:
-                self.state = 584
+                self.state = 586
                 self.match(SQLParser.JOB_WAIT)
-                self.state = 585
+                self.state = 587
                 self.match(SQLParser.JOB_EXPRESSION)
-                self.state = 589
+                self.state = 591
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==210:
-                    self.state = 586
+                    self.state = 588
                     self.match(SQLParser.JOB_EXPRESSION)
-                    self.state = 587
+                    self.state = 589
                     self.match(SQLParser.JOB_EQUAL)
-                    self.state = 588
+                    self.state = 590
                     self.match(SQLParser.JOB_EXPRESSION)
 
 
                 pass
             elif token in [196]:
-                self.state = 591
+                self.state = 593
                 self.match(SQLParser.JOB_SHOW)
-                self.state = 592
+                self.state = 594
                 self.match(SQLParser.JOB_EXPRESSION)
                 pass
             elif token in [201]:
-                self.state = 593
+                self.state = 595
                 self.match(SQLParser.JOB_ABORT)
-                self.state = 594
+                self.state = 596
                 self.match(SQLParser.JOB_EXPRESSION)
                 pass
             elif token in [200]:
-                self.state = 595
+                self.state = 597
                 self.match(SQLParser.JOB_SHUTDOWN)
-                self.state = 596
+                self.state = 598
                 self.match(SQLParser.JOB_EXPRESSION)
                 pass
             elif token in [202]:
-                self.state = 597
+                self.state = 599
                 self.match(SQLParser.JOB_TIMER)
-                self.state = 598
+                self.state = 600
                 self.match(SQLParser.JOB_EXPRESSION)
                 pass
             elif token in [198]:
-                self.state = 599
+                self.state = 601
                 self.match(SQLParser.JOB_START)
-                self.state = 600
+                self.state = 602
                 self.match(SQLParser.JOB_EXPRESSION)
                 pass
             elif token in [204]:
-                self.state = 601
+                self.state = 603
                 self.match(SQLParser.JOB_DEREGISTER)
-                self.state = 602
+                self.state = 604
                 self.match(SQLParser.JOB_WORKER)
                 pass
             elif token in [203]:
-                self.state = 603
+                self.state = 605
                 self.match(SQLParser.JOB_REGISTER)
-                self.state = 604
+                self.state = 606
                 self.match(SQLParser.JOB_WORKER)
-                self.state = 605
+                self.state = 607
                 self.match(SQLParser.JOB_TO)
-                self.state = 606
+                self.state = 608
                 self.match(SQLParser.JOB_EXPRESSION)
                 pass
             elif token in [197]:
-                self.state = 607
+                self.state = 609
                 self.match(SQLParser.JOB_SET)
-                self.state = 608
+                self.state = 610
                 self.match(SQLParser.JOB_EXPRESSION)
-                self.state = 612 
+                self.state = 614 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 609
+                    self.state = 611
                     self.match(SQLParser.JOB_EXPRESSION)
-                    self.state = 610
+                    self.state = 612
                     self.match(SQLParser.JOB_EQUAL)
-                    self.state = 611
+                    self.state = 613
                     self.match(SQLParser.JOB_EXPRESSION)
-                    self.state = 614 
+                    self.state = 616 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not (_la==210):
@@ -4976,21 +4991,21 @@ class SQLParser ( Parser ):
 
                 pass
             elif token in [195]:
-                self.state = 616
+                self.state = 618
                 self.match(SQLParser.JOB_CREATE)
-                self.state = 617
+                self.state = 619
                 self.match(SQLParser.JOB_EXPRESSION)
-                self.state = 623
+                self.state = 625
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==210:
-                    self.state = 618
+                    self.state = 620
                     self.match(SQLParser.JOB_EXPRESSION)
-                    self.state = 619
+                    self.state = 621
                     self.match(SQLParser.JOB_EQUAL)
-                    self.state = 620
+                    self.state = 622
                     self.match(SQLParser.JOB_EXPRESSION)
-                    self.state = 625
+                    self.state = 627
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -4998,19 +5013,19 @@ class SQLParser ( Parser ):
             else:
                 raise NoViableAltException(self)
 
-            self.state = 629
+            self.state = 631
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==192:
-                self.state = 628
+                self.state = 630
                 self.match(SQLParser.JOB_SEMICOLON)
 
 
-            self.state = 632
+            self.state = 634
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 631
+                self.state = 633
                 self.match(SQLParser.CRLF)
 
 
@@ -5178,105 +5193,105 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 634
+            self.state = 636
             self.match(SQLParser.COMPARE)
-            self.state = 673
+            self.state = 675
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,91,self._ctx)
             if la_ == 1:
-                self.state = 635
+                self.state = 637
                 self.match(SQLParser.COMPARE_EXPRESSION)
-                self.state = 636
+                self.state = 638
                 self.match(SQLParser.COMPARE_EXPRESSION)
-                self.state = 640
+                self.state = 642
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la - 217)) & ~0x3f) == 0 and ((1 << (_la - 217)) & 1011) != 0:
-                    self.state = 637
+                    self.state = 639
                     _la = self._input.LA(1)
                     if not((((_la - 217)) & ~0x3f) == 0 and ((1 << (_la - 217)) & 1011) != 0):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 642
+                    self.state = 644
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
 
             elif la_ == 2:
-                self.state = 643
+                self.state = 645
                 _la = self._input.LA(1)
                 if not(_la==231 or _la==232):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 644
+                self.state = 646
                 self.match(SQLParser.COMPARE_EXPRESSION)
                 pass
 
             elif la_ == 3:
-                self.state = 645
+                self.state = 647
                 self.match(SQLParser.COMPARE_MASKLINE)
-                self.state = 646
+                self.state = 648
                 self.match(SQLParser.COMPARE_EXPRESSION)
-                self.state = 647
+                self.state = 649
                 self.match(SQLParser.COMPARE_EQUAL)
-                self.state = 648
+                self.state = 650
                 self.match(SQLParser.COMPARE_EXPRESSION)
                 pass
 
             elif la_ == 4:
-                self.state = 649
+                self.state = 651
                 self.match(SQLParser.COMPARE_NOMASKLINE)
-                self.state = 650
+                self.state = 652
                 self.match(SQLParser.COMPARE_EXPRESSION)
                 pass
 
             elif la_ == 5:
-                self.state = 651
+                self.state = 653
                 self.match(SQLParser.COMPARE_RESET)
                 pass
 
             elif la_ == 6:
-                self.state = 652
+                self.state = 654
                 self.match(SQLParser.COMPARE_SET)
-                self.state = 656
+                self.state = 658
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la - 217)) & ~0x3f) == 0 and ((1 << (_la - 217)) & 1011) != 0:
-                    self.state = 653
+                    self.state = 655
                     _la = self._input.LA(1)
                     if not((((_la - 217)) & ~0x3f) == 0 and ((1 << (_la - 217)) & 1011) != 0):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 658
+                    self.state = 660
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
 
             elif la_ == 7:
-                self.state = 659
+                self.state = 661
                 self.match(SQLParser.COMPARE_SET)
-                self.state = 660
+                self.state = 662
                 self.match(SQLParser.COMPARE_OUTPUT)
-                self.state = 662 
+                self.state = 664 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 661
+                    self.state = 663
                     _la = self._input.LA(1)
                     if not((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & 7) != 0):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 664 
+                    self.state = 666 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & 7) != 0):
@@ -5285,11 +5300,11 @@ class SQLParser ( Parser ):
                 pass
 
             elif la_ == 8:
-                self.state = 666
+                self.state = 668
                 self.match(SQLParser.COMPARE_SET)
-                self.state = 667
+                self.state = 669
                 self.match(SQLParser.COMPARE_ALGORITHM)
-                self.state = 668
+                self.state = 670
                 _la = self._input.LA(1)
                 if not((((_la - 238)) & ~0x3f) == 0 and ((1 << (_la - 238)) & 15) != 0):
                     self._errHandler.recoverInline(self)
@@ -5299,35 +5314,35 @@ class SQLParser ( Parser ):
                 pass
 
             elif la_ == 9:
-                self.state = 669
+                self.state = 671
                 self.match(SQLParser.COMPARE_SET)
-                self.state = 670
+                self.state = 672
                 _la = self._input.LA(1)
                 if not(_la==236 or _la==237):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 671
+                self.state = 673
                 self.match(SQLParser.COMPARE_ENCODING)
-                self.state = 672
+                self.state = 674
                 self.match(SQLParser.COMPARE_EXPRESSION)
                 pass
 
 
-            self.state = 676
+            self.state = 678
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==212:
-                self.state = 675
+                self.state = 677
                 self.match(SQLParser.COMPARE_SEMICOLON)
 
 
-            self.state = 679
+            self.state = 681
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 678
+                self.state = 680
                 self.match(SQLParser.CRLF)
 
 
@@ -5426,113 +5441,113 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 681
+            self.state = 683
             self.match(SQLParser.DATA)
-            self.state = 719
+            self.state = 721
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,99,self._ctx)
             if la_ == 1:
-                self.state = 682
+                self.state = 684
                 self.match(SQLParser.DATA_SET)
-                self.state = 683
+                self.state = 685
                 self.match(SQLParser.DATA_SEEDFILE)
-                self.state = 684
+                self.state = 686
                 self.match(SQLParser.DATA_DIR)
-                self.state = 685
-                self.match(SQLParser.DATA_EXPRESSION)
                 self.state = 687
+                self.match(SQLParser.DATA_EXPRESSION)
+                self.state = 689
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==244:
-                    self.state = 686
+                    self.state = 688
                     self.match(SQLParser.DATA_SEMICOLON)
 
 
                 pass
 
             elif la_ == 2:
-                self.state = 689
+                self.state = 691
                 self.match(SQLParser.DATA_SET)
-                self.state = 690
+                self.state = 692
                 self.match(SQLParser.DATA_HDFSUSER)
-                self.state = 691
-                self.match(SQLParser.DATA_EXPRESSION)
                 self.state = 693
+                self.match(SQLParser.DATA_EXPRESSION)
+                self.state = 695
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==244:
-                    self.state = 692
+                    self.state = 694
                     self.match(SQLParser.DATA_SEMICOLON)
 
 
                 pass
 
             elif la_ == 3:
-                self.state = 695
+                self.state = 697
                 self.match(SQLParser.DATA_CREATE)
-                self.state = 696
+                self.state = 698
                 self.match(SQLParser.DATA_FILETYPE)
-                self.state = 697
+                self.state = 699
                 self.match(SQLParser.DATA_FILE)
-                self.state = 698
+                self.state = 700
                 self.match(SQLParser.DATA_EXPRESSION)
-                self.state = 699
-                self.match(SQLParser.DATACOLUMN_OPEN)
                 self.state = 701
+                self.match(SQLParser.DATACOLUMN_OPEN)
+                self.state = 703
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==261:
-                    self.state = 700
+                    self.state = 702
                     self.match(SQLParser.DATACOLUMN_CONTENT)
 
 
-                self.state = 705
+                self.state = 707
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==252:
-                    self.state = 703
+                    self.state = 705
                     self.match(SQLParser.DATA_ROWS)
-                    self.state = 704
+                    self.state = 706
                     self.match(SQLParser.DATA_INT)
 
 
-                self.state = 707
+                self.state = 709
                 self.match(SQLParser.DATA_SEMICOLON)
                 pass
 
             elif la_ == 4:
-                self.state = 708
+                self.state = 710
                 self.match(SQLParser.DATA_CONVERT)
-                self.state = 709
+                self.state = 711
                 self.match(SQLParser.DATA_FILETYPE)
-                self.state = 710
+                self.state = 712
                 self.match(SQLParser.DATA_FILE)
-                self.state = 711
+                self.state = 713
                 self.match(SQLParser.DATA_EXPRESSION)
-                self.state = 712
+                self.state = 714
                 self.match(SQLParser.DATA_TO)
-                self.state = 713
+                self.state = 715
                 self.match(SQLParser.DATA_FILETYPE)
-                self.state = 714
+                self.state = 716
                 self.match(SQLParser.DATA_FILE)
-                self.state = 715
-                self.match(SQLParser.DATA_EXPRESSION)
                 self.state = 717
+                self.match(SQLParser.DATA_EXPRESSION)
+                self.state = 719
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==244:
-                    self.state = 716
+                    self.state = 718
                     self.match(SQLParser.DATA_SEMICOLON)
 
 
                 pass
 
 
-            self.state = 722
+            self.state = 724
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 721
+                self.state = 723
                 self.match(SQLParser.CRLF)
 
 
@@ -5583,29 +5598,29 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 724
-            self.match(SQLParser.HELP)
             self.state = 726
+            self.match(SQLParser.HELP)
+            self.state = 728
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==263:
-                self.state = 725
+                self.state = 727
                 self.match(SQLParser.HELP_COMMAND)
 
 
-            self.state = 729
+            self.state = 731
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==265:
-                self.state = 728
+                self.state = 730
                 self.match(SQLParser.HELP_SEMICOLON)
 
 
-            self.state = 732
+            self.state = 734
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==17:
-                self.state = 731
+                self.state = 733
                 self.match(SQLParser.CRLF)
 
 
@@ -5652,11 +5667,12 @@ class SQLParser ( Parser ):
         def MONITOR_START(self):
             return self.getToken(SQLParser.MONITOR_START, 0)
 
-        def MONITOR_EXPRESSION(self, i:int=None):
+        def monitorExpression(self, i:int=None):
             if i is None:
-                return self.getTokens(SQLParser.MONITOR_EXPRESSION)
+                return self.getTypedRuleContexts(SQLParser.MonitorExpressionContext)
             else:
-                return self.getToken(SQLParser.MONITOR_EXPRESSION, i)
+                return self.getTypedRuleContext(SQLParser.MonitorExpressionContext,i)
+
 
         def MONITOR_STOP(self):
             return self.getToken(SQLParser.MONITOR_STOP, 0)
@@ -5664,6 +5680,12 @@ class SQLParser ( Parser ):
         def MONITOR_REPORT(self):
             return self.getToken(SQLParser.MONITOR_REPORT, 0)
 
+        def MONITOR_SUMMARY(self):
+            return self.getToken(SQLParser.MONITOR_SUMMARY, 0)
+
+        def MONITOR_EXPORT(self):
+            return self.getToken(SQLParser.MONITOR_EXPORT, 0)
+
         def MONITOR_LIST(self):
             return self.getToken(SQLParser.MONITOR_LIST, 0)
 
@@ -5695,115 +5717,163 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 734
+            self.state = 736
             self.match(SQLParser.MONITOR)
-            self.state = 766
+            self.state = 792
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,107,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,109,self._ctx)
             if la_ == 1:
-                self.state = 735
+                self.state = 737
                 self.match(SQLParser.MONITOR_MANAGER)
-                self.state = 736
+                self.state = 738
                 self.match(SQLParser.MONITOR_ON)
-                self.state = 739
+                self.state = 741
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==268:
-                    self.state = 737
+                    self.state = 739
                     self.match(SQLParser.MONITOR_WORKERS)
-                    self.state = 738
-                    self.match(SQLParser.MONITOR_EXPRESSION)
+                    self.state = 740
+                    self.monitorExpression()
 
 
                 pass
 
             elif la_ == 2:
-                self.state = 741
+                self.state = 743
                 self.match(SQLParser.MONITOR_MANAGER)
-                self.state = 742
+                self.state = 744
                 self.match(SQLParser.MONITOR_OFF)
                 pass
 
             elif la_ == 3:
-                self.state = 743
+                self.state = 745
                 self.match(SQLParser.MONITOR_CREATE)
-                self.state = 744
+                self.state = 746
                 self.match(SQLParser.MONITOR_TASK)
 
-                self.state = 746
+                self.state = 748
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,105,self._ctx)
                 if la_ == 1:
-                    self.state = 745
-                    self.match(SQLParser.MONITOR_EXPRESSION)
+                    self.state = 747
+                    self.monitorExpression()
 
 
-                self.state = 751 
+                self.state = 754 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 748
-                    self.match(SQLParser.MONITOR_EXPRESSION)
-                    self.state = 749
-                    self.match(SQLParser.MONITOR_EQUAL)
                     self.state = 750
-                    self.match(SQLParser.MONITOR_EXPRESSION)
-                    self.state = 753 
+                    self.monitorExpression()
+                    self.state = 751
+                    self.match(SQLParser.MONITOR_EQUAL)
+                    self.state = 752
+                    self.monitorExpression()
+                    self.state = 756 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if not (_la==278):
+                    if not ((((_la - 276)) & ~0x3f) == 0 and ((1 << (_la - 276)) & 19) != 0):
                         break
 
                 pass
 
             elif la_ == 4:
-                self.state = 755
+                self.state = 758
                 self.match(SQLParser.MONITOR_START)
-                self.state = 756
+                self.state = 759
                 self.match(SQLParser.MONITOR_TASK)
-                self.state = 757
-                self.match(SQLParser.MONITOR_EXPRESSION)
+                self.state = 760
+                self.monitorExpression()
                 pass
 
             elif la_ == 5:
-                self.state = 758
+                self.state = 761
                 self.match(SQLParser.MONITOR_STOP)
-                self.state = 759
+                self.state = 762
                 self.match(SQLParser.MONITOR_TASK)
-                self.state = 760
-                self.match(SQLParser.MONITOR_EXPRESSION)
+                self.state = 763
+                self.monitorExpression()
                 pass
 
             elif la_ == 6:
-                self.state = 761
+                self.state = 764
                 self.match(SQLParser.MONITOR_REPORT)
-                self.state = 762
+                self.state = 765
                 self.match(SQLParser.MONITOR_TASK)
-                self.state = 763
-                self.match(SQLParser.MONITOR_EXPRESSION)
+                self.state = 766
+                self.monitorExpression()
                 pass
 
             elif la_ == 7:
-                self.state = 764
+                self.state = 767
+                self.match(SQLParser.MONITOR_SUMMARY)
+                self.state = 768
+                self.match(SQLParser.MONITOR_TASK)
+                self.state = 769
+                self.monitorExpression()
+                self.state = 776
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la - 276)) & ~0x3f) == 0 and ((1 << (_la - 276)) & 19) != 0:
+                    self.state = 770
+                    self.monitorExpression()
+                    self.state = 771
+                    self.match(SQLParser.MONITOR_EQUAL)
+                    self.state = 772
+                    self.monitorExpression()
+                    self.state = 778
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+
+            elif la_ == 8:
+                self.state = 779
+                self.match(SQLParser.MONITOR_EXPORT)
+                self.state = 780
+                self.match(SQLParser.MONITOR_TASK)
+                self.state = 781
+                self.monitorExpression()
+                self.state = 786 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 782
+                    self.monitorExpression()
+                    self.state = 783
+                    self.match(SQLParser.MONITOR_EQUAL)
+                    self.state = 784
+                    self.monitorExpression()
+                    self.state = 788 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la - 276)) & ~0x3f) == 0 and ((1 << (_la - 276)) & 19) != 0):
+                        break
+
+                pass
+
+            elif la_ == 9:
+                self.state = 790
                 self.match(SQLParser.MONITOR_LIST)
-                self.state = 765
+                self.state = 791
                 self.match(SQLParser.MONITOR_TASK)
                 pass
 
 
-            self.state = 769
+            self.state = 795
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==280:
-                self.state = 768
+            if _la==282:
+                self.state = 794
                 self.match(SQLParser.MONITOR_SEMICOLON)
 
 
-            self.state = 772
+            self.state = 798
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==279:
-                self.state = 771
+            if _la==281:
+                self.state = 797
                 self.match(SQLParser.MONITOR_CRLF)
 
 
@@ -5816,6 +5886,57 @@ class SQLParser ( Parser ):
         return localctx
 
 
+    class MonitorExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MONITOR_EXPRESSION(self):
+            return self.getToken(SQLParser.MONITOR_EXPRESSION, 0)
+
+        def MONITOR_SUMMARY(self):
+            return self.getToken(SQLParser.MONITOR_SUMMARY, 0)
+
+        def MONITOR_EXPORT(self):
+            return self.getToken(SQLParser.MONITOR_EXPORT, 0)
+
+        def getRuleIndex(self):
+            return SQLParser.RULE_monitorExpression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMonitorExpression" ):
+                return visitor.visitMonitorExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def monitorExpression(self):
+
+        localctx = SQLParser.MonitorExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 110, self.RULE_monitorExpression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 800
+            _la = self._input.LA(1)
+            if not((((_la - 276)) & ~0x3f) == 0 and ((1 << (_la - 276)) & 19) != 0):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class PluginContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -5853,37 +5974,37 @@ class SQLParser ( Parser ):
     def plugin(self):
 
         localctx = SQLParser.PluginContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 110, self.RULE_plugin)
+        self.enterRule(localctx, 112, self.RULE_plugin)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 774
+            self.state = 802
             self.match(SQLParser.PLUGIN)
-            self.state = 776 
+            self.state = 804 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 775
+                self.state = 803
                 self.match(SQLParser.PLUGIN_EXPRESSION)
-                self.state = 778 
+                self.state = 806 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==282):
+                if not (_la==284):
                     break
 
-            self.state = 781
+            self.state = 809
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==284:
-                self.state = 780
+            if _la==286:
+                self.state = 808
                 self.match(SQLParser.PLUGIN_SEMICOLON)
 
 
-            self.state = 784
+            self.state = 812
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==283:
-                self.state = 783
+            if _la==285:
+                self.state = 811
                 self.match(SQLParser.PLUGIN_CRLF)
 
 
@@ -284,6 +284,11 @@ class SQLParserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLParser#monitorExpression.
+    def visitMonitorExpression(self, ctx:SQLParser.MonitorExpressionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLParser#plugin.
     def visitPlugin(self, ctx:SQLParser.PluginContext):
         return self.visitChildren(ctx)
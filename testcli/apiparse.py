@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import json
+import threading
 from json import JSONDecodeError
 
 from antlr4 import InputStream
@@ -8,6 +9,25 @@ from antlr4.error.ErrorListener import ErrorListener
 from .antlrgen.APILexer import APILexer
 from .antlrgen.APIParser import APIParser
 from .apivisitor import APIVisitor
+from .globalvar import globalParserOption
+
+# 可以复用的词法和语法解析器，每个线程各自保留一组
+apiParserPool = threading.local()
+
+# 用来预热解析器的典型语句
+apiWarmUpStatements = [
+    "### get\nGET http://127.0.0.1:8080/health?requestId=1 HTTP/1.1\nAccept: application/json\n\n###",
+    "### post\n// @hint\nPOST http://127.0.0.1:8080/post HTTP/1.1\nContent-Type: application/json\n\n"
+    "{\n  \"id\": 1,\n  \"name\": \"abc\"\n}\n###",
+    "### multipart\nPOST http://127.0.0.1:8080/upload HTTP/1.1\nContent-Type: multipart/form-data; boundary=WebAppBoundary\n\n"
+    "--WebAppBoundary\nContent-Disposition: form-data; name=\"element-name\"\nContent-Type: text/plain\n\nName\n"
+    "--WebAppBoundary--\n###",
+    "> {%\nx = 1\n%}",
+    "_set api_timeout 5",
+    "_session show",
+    "_use sql",
+    "-- [Hint] scenario:test",
+]
 
 
 class APIClientErrorListener(ErrorListener):
@@ -127,13 +147,25 @@ def APIAnalyze(apiCommandPlainText: str, defaultNameSpace: str = "API"):
 
     # 调用Antlr进行语法解析，并自定义错误监听
     stream = InputStream(apiCommandPlainText)
-    lexer = APILexer(stream)
+    if globalParserOption["pool"]:
+        # 复用当前线程中已有的解析器，重新设置输入后解析器的状态会被完全重置
+        if not hasattr(apiParserPool, "lexer"):
+            apiParserPool.lexer = APILexer(stream)
+            apiParserPool.parser = APIParser(CommonTokenStream(apiParserPool.lexer))
+        lexer = apiParserPool.lexer
+        lexer.inputStream = stream
+    else:
+        lexer = APILexer(stream)
     lexer.removeErrorListeners()
     lexer_listener = APIClientErrorListener()
     lexer.addErrorListener(lexer_listener)
 
     token = CommonTokenStream(lexer)
-    parser = APIParser(token)
+    if globalParserOption["pool"]:
+        parser = apiParserPool.parser
+        parser.setTokenStream(token)
+    else:
+        parser = APIParser(token)
     parser.removeErrorListeners()
     parser_listener = APIClientErrorListener()
     parser.addErrorListener(parser_listener)
@@ -167,3 +199,11 @@ def APIAnalyze(apiCommandPlainText: str, defaultNameSpace: str = "API"):
             errorMsg = parseErrorMsg
 
     return isFinished, parsedObjects, errorCode, errorMsg
+
+
+def APIWarmUp():
+    """
+        预热API解析器，构造DFA缓存
+    """
+    for statement in apiWarmUpStatements:
+        APIAnalyze(statement)
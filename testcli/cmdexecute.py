@@ -45,7 +45,15 @@ from .common import rewriteConnectRequest
 from .common import parseSQLHints
 from .common import parseAPIHints
 from .common import sortresult
+from .common import SORT_SPILLROWS
+from .common import LogHintTransformer
 from .common import splitSqlCommand
+from .common import getStatementKind
+from .common import isStatementMayEnd
+from .parsecache import getParseCacheDirectory
+from .parsecache import getParseCacheKey
+from .parsecache import loadParseCache
+from .parsecache import saveParseCache
 from .testcliexception import TestCliException
 from .globalvar import lastCommandResult
 
@@ -114,7 +122,7 @@ class CmdExecute(object):
         解析命令语句
         传入参数：
              statement         需要解析的语句
-             nameSpace         当前语句所在的命名空间
+             nameSpace         当前语句所在的命名空间（不再使用，解析总是从当前的NAMESPACE选项开始）
         返回结果：
             返回结果为一个三元组
             ret_CommandSplitResults                 解析后的结果，用list表示的json数组，即parsedObject[]
@@ -129,6 +137,7 @@ class CmdExecute(object):
 
         currentStatement = None
         currentStatementWithComments = None
+        currentStatementKind = None
         currentHints = []
         statementLines = statement.split('\n')
         for nPos in range(0, len(statementLines)):
@@ -136,13 +145,27 @@ class CmdExecute(object):
             # 将上次没有结束的行和当前行放在一起, 再次看是否已经结束
             if currentStatement is None:
                 currentStatement = statementLine
+                # 根据语句首行预判语句类型
+                currentStatementKind = getStatementKind(statementLine, self.testOptions.get("NAMESPACE"))
+                isFirstLine = True
             else:
                 currentStatement = currentStatement + '\n' + statementLine
+                isFirstLine = False
             if currentStatementWithComments is None:
                 currentStatementWithComments = statementLine
             else:
                 currentStatementWithComments = currentStatementWithComments + '\n' + statementLine
 
+            # 对于已经预判类型的语句，在没有遇到可能的结束符之前，语句一定没有结束，不需要反复调用解析器
+            # 一旦遇到了可能的结束符，随后的每一行都交给解析器判断，以保证和逐行解析的结果完全一致
+            # 所以只有结束符之前的部分不再重复解析，结束符之后还有很多行的语句，解析代价仍然和行数的平方相关
+            if currentStatementKind is not None and nPos != (len(statementLines) - 1):
+                if isStatementMayEnd(currentStatementKind, statementLine,
+                                     self.testOptions.get("NAMESPACE"), isFirstLine):
+                    currentStatementKind = None
+                else:
+                    continue
+
             # 调用解析器解析语句
             if self.testOptions.get("NAMESPACE") == "SQL":
                 (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
@@ -151,7 +174,7 @@ class CmdExecute(object):
                 (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
                     = APIAnalyze(currentStatement)
             else:
-                raise TestCliException("Non-support NAMESPACE [" + str(nameSpace) + "]")
+                raise TestCliException("Non-support NAMESPACE [" + str(self.testOptions.get("NAMESPACE")) + "]")
 
             # 如果发生了语句解析错误，且错误信息是缺少EOF，则是认为语句没有结束导致，不是正常的错误
             if ret_errorCode != 0:
@@ -323,6 +346,7 @@ class CmdExecute(object):
         传入参数：
              result            命令执行结果
              commandHints      命令提示信息
+             hintTransformer   根据命令提示信息编译的LogHintTransformer，多段返回中重复使用。没有提供的时候临时编译
         返回结果：             
             处理result中的Rows对象. 没有单独的返回，将直接重写传入的result内容.
             目前处理的提示包括：
@@ -331,7 +355,8 @@ class CmdExecute(object):
                  LogMask        对返回结果集进行掩码
     """
     @staticmethod
-    def processCommandHint_Rows(result, commandHints: dict):
+    def processCommandHint_Rows(result, commandHints: dict, sortSpillRows: int = SORT_SPILLROWS,
+                                hintTransformer: LogHintTransformer = None):
         if result is None:
             return
 
@@ -341,94 +366,21 @@ class CmdExecute(object):
             if "Order" in commandHints.keys():
                 if "TESTCLI_DEBUG" in os.environ:
                     print("[DEBUG] Will sort this result accoring to [Order] hint ...")
-                # 不能用sorted函数，需要考虑None出现在列表中特定元素的问题
+                # 不能直接用sorted函数，需要考虑None出现在列表中特定元素的问题
                 # l =  [(-32767,), (32767,), (None,), (0,)]
-                sortresult(rows)
-
-            # 如果Hint中存在LogFilter，则结果集中过滤指定的输出信息
-            if "LogFilter" in commandHints.keys():
-                for logFilter in commandHints["LogFilter"]:
-                    if logFilter.strip().startswith("'") and logFilter.strip().endswith("'"):
-                        logFilter = logFilter.strip()
-                    if logFilter.strip().startswith("'") and logFilter.strip().endswith("'"):
-                        logFilter = logFilter.strip()
-                    for item in rows[::-1]:
-                        # 将所有列用空格分隔来合并为一行
-                        combinedRow = ""
-                        for cell in item:
-                            if combinedRow == "":
-                                combinedRow = str(cell)
-                            else:
-                                combinedRow = combinedRow + " " + str(cell)
-                        if re.match(pattern=logFilter, string=combinedRow, flags=re.IGNORECASE):
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] Will apply filter: [" + combinedRow +
-                                      "] with " + logFilter + ". Matched.")
-                            rows.remove(item)
-                            continue
-                        else:
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] Will apply filter: [" + combinedRow +
-                                      "] with " + logFilter + ". Not matched.")
-
-            # 如果Hint中存在LogMask,则掩码指定的输出信息
-            if "LogMask" in commandHints.keys():
-                for i in range(0, len(rows)):
-                    rowResult = list(rows[i])
-                    bDataChanged = False
-                    for j in range(0, len(rowResult)):
-                        if rowResult[j] is None:
-                            continue
-                        output = str(rowResult[j])
-                        for sqlMaskListString in commandHints["LogMask"]:
-                            sqlMaskList = sqlMaskListString.split("=>")
-                            if len(sqlMaskList) == 2:
-                                sqlMaskPattern = str(sqlMaskList[0])
-                                sqlMaskTarget = str(sqlMaskList[1])
-                                if sqlMaskPattern.strip().startswith("'") and sqlMaskPattern.strip().endswith("'"):
-                                    sqlMaskPattern = sqlMaskPattern.strip()
-                                if sqlMaskTarget.strip().startswith("'") and sqlMaskTarget.strip().endswith("'"):
-                                    sqlMaskTarget = sqlMaskTarget.strip()
-                                if sqlMaskPattern.strip().startswith('"') and sqlMaskPattern.strip().endswith('"'):
-                                    sqlMaskPattern = sqlMaskPattern.strip()
-                                if sqlMaskTarget.strip().startswith('"') and sqlMaskTarget.strip().endswith('"'):
-                                    sqlMaskTarget = sqlMaskTarget.strip()
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print("[DEBUG] Will apply mask:" + output +
-                                          " with " + sqlMaskPattern + "=>" + sqlMaskTarget)
-                                try:
-                                    beforeReplace = str(rowResult[j])
-                                    nIterCount = 0
-                                    while True:
-                                        # 循环多次替代，一直到没有可替代为止
-                                        afterReplace = re.sub(sqlMaskPattern, sqlMaskTarget,
-                                                              beforeReplace, re.IGNORECASE)
-                                        if afterReplace == beforeReplace or nIterCount > 99:
-                                            newOutput = afterReplace
-                                            break
-                                        beforeReplace = afterReplace
-                                        nIterCount = nIterCount + 1
-                                    if newOutput != output:
-                                        bDataChanged = True
-                                        rowResult[j] = newOutput
-                                    output = newOutput
-                                except re.error:
-                                    if "TESTCLI_DEBUG" in os.environ:
-                                        print('[DEBUG] traceback.print_exc():\n%s'
-                                              % traceback.print_exc())
-                                        print('[DEBUG] traceback.format_exc():\n%s'
-                                              % traceback.format_exc())
-                            else:
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print("[DEBUG] LogMask Hint Error: " + commandHints["LogMask"])
-                    if bDataChanged:
-                        rows[i] = tuple(rowResult)
+                sortresult(rows, spillRows=sortSpillRows)
+
+            # 如果Hint中存在LogFilter或者LogMask，则对结果集进行过滤和掩码
+            if hintTransformer is None:
+                hintTransformer = LogHintTransformer(commandHints)
+            result["rows"] = hintTransformer.transformRows(rows)
 
     """
         根据提示信息改写返回结果中的状态信息
         传入参数：
              result            命令执行结果
              commandHints      命令提示信息
+             hintTransformer   根据命令提示信息编译的LogHintTransformer，多段返回中重复使用。没有提供的时候临时编译
         返回结果：             
             处理result中的Status对象. 没有单独的返回，将直接重写传入的result内容.
             目前处理的提示包括：
@@ -436,78 +388,22 @@ class CmdExecute(object):
                  LogMask        对返回状态信息，错误提示进行掩码（状态信息，错误提示如果包含多行，则逐行掩码）
     """
     @staticmethod
-    def processCommandHint_Status(result, commandHints: dict):
+    def processCommandHint_Status(result, commandHints: dict, hintTransformer: LogHintTransformer = None):
         if result is None:
             return
 
-        # 处理状态消息中的信息
         if "status" in result.keys() and result["status"] is not None:
-            status = result["status"]
-            statusLineList = status.splitlines(keepends=False)
-            # 如果Hint中存在LogFilter，则结果集中过滤指定的输出信息
-            if "LogFilter" in commandHints.keys():
-                for logFilter in commandHints["LogFilter"]:
-                    # 从后往前删除，以避免漏掉一些东西
-                    for line in statusLineList[::-1]:
-                        try:
-                            if re.match(pattern=logFilter, string=line, flags=re.IGNORECASE):
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print("[DEBUG] Apply filter: [" + line + "] with " + logFilter + ". Matched.")
-                                statusLineList.remove(line)
-                                continue
-                            else:
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print("[DEBUG] Apply filter: [" + line + "] with " + logFilter + ". Not match.")
-                        except re.error as rex:
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] Filter error : [" + line + "] with " + logFilter + ". " + str(rex))
-                result["status"] = "\n".join(statusLineList)
-            # 如果Hint中存在LogMask,则掩码指定的输出信息
-            if "LogMask" in commandHints.keys():
-                for i in range(0, len(statusLineList)):
-                    line = statusLineList[i]
-                    for sqlMaskListString in commandHints["LogMask"]:
-                        sqlMaskList = sqlMaskListString.split("=>")
-                        if len(sqlMaskList) == 2:
-                            sqlMaskPattern = sqlMaskList[0]
-                            sqlMaskTarget = sqlMaskList[1]
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] Will apply mask:" + line +
-                                      " with " + sqlMaskPattern + "=>" + sqlMaskTarget)
-                            try:
-                                beforeReplace = line
-                                nIterCount = 0
-                                bDataChanged = False
-                                while True:
-                                    # 循环多次替代，一直到没有可替代为止
-                                    afterReplace = re.sub(sqlMaskPattern, sqlMaskTarget,
-                                                          beforeReplace, re.IGNORECASE)
-                                    if afterReplace == beforeReplace or nIterCount > 99:
-                                        newLine = afterReplace
-                                        break
-                                    beforeReplace = afterReplace
-                                    nIterCount = nIterCount + 1
-                                if newLine != line:
-                                    bDataChanged = True
-                                    line = newLine
-                                if bDataChanged:
-                                    statusLineList[i] = newLine
-                            except re.error:
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print('[DEBUG] traceback.print_exc():\n%s'
-                                          % traceback.print_exc())
-                                    print('[DEBUG] traceback.format_exc():\n%s'
-                                          % traceback.format_exc())
-                        else:
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] LogMask Hint Error: " + commandHints["LogMask"])
-                result["status"] = "\n".join(statusLineList)
+            # 如果Hint中存在LogFilter或者LogMask，则逐行过滤和掩码
+            if hintTransformer is None:
+                hintTransformer = LogHintTransformer(commandHints)
+            result["status"] = hintTransformer.transformText(result["status"])
 
     """
         根据提示信息改写返回结果中的错误信息
         传入参数：
              result            命令执行结果
              commandHints      命令提示信息
+             hintTransformer   根据命令提示信息编译的LogHintTransformer，多段返回中重复使用。没有提供的时候临时编译
         返回结果：             
             处理result中的Message对象. 没有单独的返回，将直接重写传入的result内容.
             目前处理的提示包括：
@@ -515,71 +411,15 @@ class CmdExecute(object):
                  LogMask        对错误提示进行掩码，如果存在多行，则逐行过滤
     """
     @staticmethod
-    def processCommandHint_Message(result, commandHints: dict):
+    def processCommandHint_Message(result, commandHints: dict, hintTransformer: LogHintTransformer = None):
         if result is None:
             return
 
         if "message" in result.keys() and result["message"] is not None:
-            message = result["message"]
-            messageLineList = message.splitlines(keepends=False)
-            # 如果Hint中存在LogFilter，则结果集中过滤指定的输出信息
-            if "LogFilter" in commandHints.keys():
-                for logFilter in commandHints["LogFilter"]:
-                    for line in messageLineList[::-1]:
-                        try:
-                            if re.match(pattern=logFilter, string=line, flags=re.IGNORECASE):
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print("[DEBUG] Apply filter: [" + line + "] with " + logFilter + ". Matched.")
-                                messageLineList.remove(line)
-                                continue
-                            else:
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print("[DEBUG] Apply filter: [" + line + "] with " + logFilter + ". Not match.")
-                        except re.error as rex:
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] Filter error : [" + line + "] with " + logFilter + ". " + str(rex))
-                result["message"] = "\n".join(messageLineList)
-
-            # 如果Hint中存在LogMask,则掩码指定的输出信息
-            if "LogMask" in commandHints.keys():
-                for i in range(0, len(messageLineList)):
-                    line = messageLineList[i]
-                    for sqlMaskListString in commandHints["LogMask"]:
-                        sqlMaskList = sqlMaskListString.split("=>")
-                        if len(sqlMaskList) == 2:
-                            sqlMaskPattern = sqlMaskList[0]
-                            sqlMaskTarget = sqlMaskList[1]
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] Will apply mask:" + line +
-                                      " with " + sqlMaskPattern + "=>" + sqlMaskTarget)
-                            try:
-                                beforeReplace = line
-                                nIterCount = 0
-                                bDataChanged = False
-                                while True:
-                                    # 循环多次替代，一直到没有可替代为止
-                                    afterReplace = re.sub(sqlMaskPattern, sqlMaskTarget,
-                                                          beforeReplace, re.IGNORECASE)
-                                    if afterReplace == beforeReplace or nIterCount > 99:
-                                        newLine = afterReplace
-                                        break
-                                    beforeReplace = afterReplace
-                                    nIterCount = nIterCount + 1
-                                if newLine != line:
-                                    bDataChanged = True
-                                    line = newLine
-                                if bDataChanged:
-                                    messageLineList[i] = newLine
-                            except re.error:
-                                if "TESTCLI_DEBUG" in os.environ:
-                                    print('[DEBUG] traceback.print_exc():\n%s'
-                                          % traceback.print_exc())
-                                    print('[DEBUG] traceback.format_exc():\n%s'
-                                          % traceback.format_exc())
-                        else:
-                            if "TESTCLI_DEBUG" in os.environ:
-                                print("[DEBUG] LogMask Hint Error: " + commandHints["LogMask"])
-                result["message"] = "\n".join(messageLineList)
+            # 如果Hint中存在LogFilter或者LogMask，则逐行过滤和掩码
+            if hintTransformer is None:
+                hintTransformer = LogHintTransformer(commandHints)
+            result["message"] = hintTransformer.transformText(result["message"])
 
     """
         根据提示信息改写返回结果中的Content信息
@@ -723,8 +563,20 @@ class CmdExecute(object):
             defaultNameSpace = self.testOptions.get("NAMESPACE")
 
             # 开始解析语句
-            ret_CommandSplitResults, ret_CommandSplitResultsWithComments, ret_CommandHints = \
-                self.parseStatement(statement=statement, nameSpace=nameSpace)
+            # 对于脚本文件，如果打开了解析缓存，则优先使用之前的解析结果
+            parseCacheDirectory = None
+            parseCacheKey = None
+            parseResult = None
+            if commandScriptFile != "Console" and self.testOptions.get("SCRIPT_PARSECACHE").upper() == "ON":
+                parseCacheDirectory = getParseCacheDirectory(self.cliHandler.ProcessPwd)
+                # parseStatement总是从当前的NAMESPACE选项开始解析，缓存的键值也要使用这个命名空间
+                parseCacheKey = getParseCacheKey(statement, defaultNameSpace)
+                parseResult = loadParseCache(parseCacheDirectory, parseCacheKey)
+            if parseResult is None:
+                parseResult = self.parseStatement(statement=statement, nameSpace=nameSpace)
+                if parseCacheKey is not None:
+                    saveParseCache(parseCacheDirectory, parseCacheKey, parseResult)
+            ret_CommandSplitResults, ret_CommandSplitResultsWithComments, ret_CommandHints = parseResult
 
             # 解析过程中设置的NAMESPACE，解析后要还原，好保证执行的正确
             self.testOptions.set("NAMESPACE", defaultNameSpace)
@@ -889,6 +741,9 @@ class CmdExecute(object):
                     if len(rewrotedCommandHintValueList) != 0:
                         commandHintList[commandHintKey] = commandHintNewValue
 
+            # LogFilter和LogMask对每个语句只编译一次，多段返回的结果中重复使用
+            logHintTransformer = LogHintTransformer(commandHintList)
+
             # 处理ScenarioId和ScenarioName, 他们总是成对出现
             if "ScenarioId" in commandHintList:
                 scenarioId = str(commandHintList["ScenarioId"])
@@ -1061,9 +916,14 @@ class CmdExecute(object):
                             sqlIter = sqlIter + 1
 
                             # 处理命令行的提示信息
-                            self.processCommandHint_Rows(result=result, commandHints=commandHintList)
-                            self.processCommandHint_Status(result=result, commandHints=commandHintList)
-                            self.processCommandHint_Message(result=result, commandHints=commandHintList)
+                            self.processCommandHint_Rows(
+                                result=result, commandHints=commandHintList,
+                                sortSpillRows=int(self.testOptions.get("SORT_SPILLROWS")),
+                                hintTransformer=logHintTransformer)
+                            self.processCommandHint_Status(
+                                result=result, commandHints=commandHintList, hintTransformer=logHintTransformer)
+                            self.processCommandHint_Message(
+                                result=result, commandHints=commandHintList, hintTransformer=logHintTransformer)
 
                             # 保留上一次的执行结果
                             if result["type"] == "result":
@@ -1246,8 +1106,10 @@ class CmdExecute(object):
 
                         # 处理命令行的提示信息
                         self.processCommandHint_Contents(result=result, commandHints=commandHintList)
-                        self.processCommandHint_Status(result=result, commandHints=commandHintList)
-                        self.processCommandHint_Message(result=result, commandHints=commandHintList)
+                        self.processCommandHint_Status(
+                            result=result, commandHints=commandHintList, hintTransformer=logHintTransformer)
+                        self.processCommandHint_Message(
+                            result=result, commandHints=commandHintList, hintTransformer=logHintTransformer)
 
                         # 保留上一次的处理结果
                         if result["type"] == "result":
@@ -1387,7 +1249,8 @@ class CmdExecute(object):
                             requestObject=parseObject,
                     ):
                         # 处理命令行的提示信息
-                        self.processCommandHint_Status(result=result, commandHints=commandHintList)
+                        self.processCommandHint_Status(
+                            result=result, commandHints=commandHintList, hintTransformer=logHintTransformer)
                         if "status" in result.keys() and result["status"] is not None:
                             consoleOutput.append(result["status"])
                         lastCommandResult["status"] = "\n".join(consoleOutput)
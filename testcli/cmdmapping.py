@@ -10,6 +10,10 @@ class CmdMapping(object):
     # Mapping_Contents = [ filename_pattern, match_roles[] ]
     # match_roles = [ Key, Value]
     commandMappingList = {}
+    # 映射结果的缓存，{(脚本文件名, 原始内容): 映射结果}，重新加载映射文件后清空
+    rewriteWordCache = {}
+    # 映射文件的版本，每次加载映射文件后增加，用于判断依赖映射结果的缓存是否失效
+    mappingVersion = 0
 
     def loadCommandMappings(self, commandScriptFileName, commandMappings):
         commandMappings = shlex.shlex(commandMappings)
@@ -110,6 +114,8 @@ class CmdMapping(object):
 
             # 每个文件的配置都加载到MappingList中
             self.commandMappingList[commandMappingBaseName] = m_szFileMatchRules
+            self.rewriteWordCache.clear()
+            CmdMapping.mappingVersion = CmdMapping.mappingVersion + 1
 
     def RewriteWord(self, commandScriptFileName, word):
         # 检查是否存在command mapping文件
@@ -123,6 +129,10 @@ class CmdMapping(object):
             # 用户从Console上启动，没有脚本文件名
             commandScriptFileName = "Console"
 
+        cacheKey = (commandScriptFileName, word)
+        if cacheKey in self.rewriteWordCache:
+            return self.rewriteWordCache[cacheKey]
+
         # 检查文件名是否匹配
         # 如果一个字符串在多个匹配规则中出现，可能被多次匹配。后一次匹配的依据是前一次匹配的结果
         for mappingFiles in self.commandMappingList.values():                   # 所有的Command Mapping信息
@@ -149,4 +159,5 @@ class CmdMapping(object):
                     raise TestCliException("[WARNING] Invalid regex pattern in filePattern match. "
                                            "[" + str(mappingFile["filePattern"]) +
                                            "]:[" + commandScriptFileName + "]  " + repr(ex))
+        self.rewriteWordCache[cacheKey] = word
         return word
@@ -4,8 +4,9 @@ import copy
 import re
 import json
 import os
-import ssl
 from json import JSONDecodeError
+from .apiSession import getApiSessionPool
+from .apiSession import newApiPool
 
 
 def executeAPISet(cls, apiSetRequest):
@@ -68,16 +69,18 @@ def executeAPIStatement(cls, apiRequest, apiHints):
         # 如果保存的会话中设置了代理，则按照会话中设置的来
         http_proxy = str(http_proxy).strip()
 
-    if https_verify == "OFF":
-        if http_proxy != "":
-            httpHandler = urllib3.ProxyManager(proxy_url=http_proxy, cert_reqs=ssl.CERT_NONE)
-        else:
-            httpHandler = urllib3.PoolManager(cert_reqs=ssl.CERT_NONE)
+    if str(cls.testOptions.get("API_KEEPALIVE")).upper() == "ON":
+        # 使用会话中保持的连接池
+        httpHandler = getApiSessionPool(
+            cls=cls.cliHandler,
+            httpsVerify=https_verify,
+            httpProxy=http_proxy,
+            poolSize=int(cls.testOptions.get("API_POOLSIZE")))
+        releaseHttpHandler = False
     else:
-        if http_proxy != "":
-            httpHandler = urllib3.ProxyManager(proxy_url=http_proxy, cert_reqs=ssl.CERT_REQUIRED)
-        else:
-            httpHandler = urllib3.PoolManager(cert_reqs=ssl.CERT_REQUIRED)
+        # 每次请求使用新的连接，请求结束后关闭
+        httpHandler = newApiPool(httpsVerify=https_verify, httpProxy=http_proxy)
+        releaseHttpHandler = True
 
     httpMethod = apiRequest["httpMethod"]
     httpRequestTarget = apiRequest["httpRequestTarget"]
@@ -303,3 +306,6 @@ def executeAPIStatement(cls, apiRequest, apiHints):
             "message": "Testcli-0000: " + str(ex)
         }
         return
+    finally:
+        if releaseHttpHandler:
+            httpHandler.clear()
@@ -1,5 +1,41 @@
 # -*- coding: utf-8 -*-
 import copy
+import ssl
+import urllib3
+
+
+def getApiSessionPool(cls, httpsVerify: str, httpProxy: str, poolSize: int):
+    """
+        返回当前API会话的HTTP连接池
+        连接池属于会话，在会话中复用已经建立的连接（Keep-Alive）和TLS会话，避免每次请求都重新握手
+        同一个会话中，代理和证书校验设置不同的请求使用不同的连接池
+    """
+    sessionPools = cls.api_saved_pool.setdefault(cls.httpSessionName, {})
+    poolKey = (httpProxy, httpsVerify, poolSize)
+    if poolKey not in sessionPools:
+        sessionPools[poolKey] = newApiPool(httpsVerify=httpsVerify, httpProxy=httpProxy, poolSize=poolSize)
+    return sessionPools[poolKey]
+
+
+def newApiPool(httpsVerify: str, httpProxy: str, poolSize: int = 1):
+    if httpsVerify == "OFF":
+        certReqs = ssl.CERT_NONE
+    else:
+        certReqs = ssl.CERT_REQUIRED
+    if httpProxy != "":
+        return urllib3.ProxyManager(proxy_url=httpProxy, cert_reqs=certReqs, maxsize=poolSize)
+    else:
+        return urllib3.PoolManager(cert_reqs=certReqs, maxsize=poolSize)
+
+
+def releaseApiSessionPool(cls, sessionName: str):
+    """
+        关闭会话的所有HTTP连接
+    """
+    if sessionName in cls.api_saved_pool:
+        for httpHandler in cls.api_saved_pool[sessionName].values():
+            httpHandler.clear()
+        del cls.api_saved_pool[sessionName]
 
 
 # API会话管理
@@ -56,6 +92,7 @@ def apiSessionManage(cls, action: str, sessionName: str = None):
         )
         cls.httpSessionName = sessionName
     if action.strip().lower() == 'release':
+        releaseApiSessionPool(cls, cls.httpSessionName)
         if cls.api_saved_conn[cls.httpSessionName] != "DEFAULT":
             del cls.api_saved_conn[cls.httpSessionName]
             cls.httpSessionName = "DEFAULT"
@@ -1,7 +1,67 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict
 from ..globalvar import globalEmbeddScriptScope
 from ..globalvar import lastCommandResult
 
+# 编译缓存中默认最多保留的代码对象个数
+COMPILED_CODE_CACHESIZE = 1024
+
+
+class CompiledCodeCache(object):
+    """
+        按照源代码缓存编译后的代码对象，LRU淘汰
+        循环中的断言，LOOP UNTIL条件，语句中的变量，内嵌脚本不需要每次都重新编译
+    """
+    def __init__(self, maxSize: int = COMPILED_CODE_CACHESIZE):
+        self.maxSize = maxSize
+        self.codeObjects = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str, mode: str):
+        """
+            返回源代码编译后的代码对象
+            mode为eval或者exec，和内置的eval，exec函数处理字符串的方式保持一致
+        """
+        cacheKey = (mode, source)
+        codeObject = self.codeObjects.get(cacheKey)
+        if codeObject is not None:
+            self.hits = self.hits + 1
+            self.codeObjects.move_to_end(cacheKey)
+            return codeObject
+        self.misses = self.misses + 1
+        if mode == "eval":
+            # 内置的eval函数会忽略字符串开头的空格和TAB
+            codeObject = compile(source.lstrip(" \t"), "<string>", mode)
+        else:
+            codeObject = compile(source, "<string>", mode)
+        self.codeObjects[cacheKey] = codeObject
+        while len(self.codeObjects) > self.maxSize:
+            self.codeObjects.popitem(last=False)
+        return codeObject
+
+    def resize(self, maxSize: int):
+        self.maxSize = maxSize
+        while len(self.codeObjects) > self.maxSize:
+            self.codeObjects.popitem(last=False)
+
+    def clear(self):
+        self.codeObjects.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def getStats(self):
+        return {
+            "size": len(self.codeObjects),
+            "maxSize": self.maxSize,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# 表达式和内嵌脚本的编译缓存
+compiledCodeCache = CompiledCodeCache()
+
 
 def assertExpression(cls, expression: str, assertName: str):
     try:
@@ -51,4 +111,4 @@ def evalExpression(cls, expression: str):
     globalEmbeddScriptScope["sessionContext"] = sessionContext
     globalEmbeddScriptScope["lastCommandResult"] = lastCommandResult
 
-    return eval(expression, globalEmbeddScriptScope)
+    return eval(compiledCodeCache.get(expression, "eval"), globalEmbeddScriptScope)
@@ -33,6 +33,91 @@ class DiffException(Exception):
         self.message = message
 
 
+class CompareLineFilter:
+    """
+        比对前的行过滤：去掉回车换行、去掉首尾空格、忽略SkipLine、忽略空行、MaskLine替换
+        所有的规则在构造的时候编译一次，随后对文件内容只遍历一次，同时生成过滤后的内容和对应的原始行号
+    """
+    # 包含以下内容的正则表达式合并后语义可能发生变化（反向引用和条件分支的组号、全局标志），不能参与合并
+    UncombinablePattern = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+    def __init__(self,
+                 skipLines: list = None,
+                 maskLines: dict = None,
+                 ignoreEmptyLine: bool = False,
+                 ignoreTailOrHeadBlank: bool = False):
+        self.ignoreEmptyLine = ignoreEmptyLine
+        self.ignoreTailOrHeadBlank = ignoreTailOrHeadBlank
+
+        # SkipLine的匹配规则和compare_string相同：忽略大小写的完全相等，或者对每个正则表达式忽略大小写的match，且匹配的内容就是整行
+        # 注意这不等同于fullmatch，例如"a|ab"匹配"ab"的时候，match只得到"a"，这一行不会被忽略
+        # 文本完全相等的判断用集合完成。所有正则表达式合并后的fullmatch作为预先过滤，不能完全匹配合并表达式的行一定不会被忽略，
+        # 只有通过了预先过滤的行才逐个正则表达式判断
+        self.skipLiterals = set()
+        self.skipPatterns = []
+        self.skipPrefilter = None
+        combinablePatterns = []
+        hasUncombinablePattern = False
+        if skipLines is not None:
+            for pattern in skipLines:
+                self.skipLiterals.add(pattern.upper())
+                try:
+                    self.skipPatterns.append(re.compile(pattern, re.IGNORECASE))
+                except re.error:
+                    # 不是合法的正则表达式，只做文本比较
+                    continue
+                if self.UncombinablePattern.search(pattern) is None:
+                    combinablePatterns.append(pattern)
+                else:
+                    hasUncombinablePattern = True
+        if len(combinablePatterns) != 0 and not hasUncombinablePattern:
+            try:
+                self.skipPrefilter = re.compile(
+                    "|".join(["(?:" + pattern + ")" for pattern in combinablePatterns]), re.IGNORECASE)
+            except re.error:
+                # 合并失败（比如命名组重复），不做预先过滤
+                self.skipPrefilter = None
+
+        # MaskLine按照定义的顺序依次替换，正则表达式非法的时候抛出re.error
+        self.maskPatterns = []
+        if maskLines is not None:
+            for maskPattern, maskTarget in maskLines.items():
+                self.maskPatterns.append((re.compile(maskPattern, re.IGNORECASE), maskTarget))
+
+    def isSkipLine(self, line: str):
+        if line.upper() in self.skipLiterals:
+            return True
+        if self.skipPrefilter is not None and self.skipPrefilter.fullmatch(line) is None:
+            return False
+        for skipPattern in self.skipPatterns:
+            matchObj = skipPattern.match(line)
+            if matchObj is not None and matchObj.group() == line:
+                return True
+        return False
+
+    def filterLines(self, lines: list):
+        """
+            返回过滤后的内容，以及每一行在原始文件中的行号（从1开始）
+        """
+        filteredLines = []
+        lineno = []
+        checkSkip = len(self.skipLiterals) != 0
+        for nPos, line in enumerate(lines):
+            if line.endswith('\n'):
+                line = line[:-1]
+            if self.ignoreTailOrHeadBlank:
+                line = line.strip()
+            if checkSkip and self.isSkipLine(line):
+                continue
+            if self.ignoreEmptyLine and len(line.strip()) == 0:
+                continue
+            for maskPattern, maskTarget in self.maskPatterns:
+                line = maskPattern.sub(maskTarget, line)
+            filteredLines.append(line)
+            lineno.append(nPos + 1)
+        return filteredLines, lineno
+
+
 class POSIXCompare:
     CompiledRegexPattern = {}
     ErrorRegexPattern = []
@@ -180,6 +265,182 @@ class POSIXCompare:
 
         return compareResult, compareDiffResult
 
+    # 正则表达式中的特殊字符，不包含这些字符的字符串作为正则表达式时只能匹配其自身
+    RegexMetaChars = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+    def compareMyersLinear(self,
+                           a_lines,
+                           b_lines,
+                           a_lineno,
+                           b_lineno,
+                           p_compare_maskEnabled=False,
+                           p_compare_ignoreCase=False):
+        # 线性空间的Myers算法(分治查找middle snake)，用于大文件的比对
+        # compareMyers需要为每一条对角线保存完整的历史记录，内存占用随差异数量平方增长
+        # 这里每次只保留两条frontier数组，内存占用和文件行数线性相关
+
+        # 首先将所有的行映射为整数，随后的比较过程中只比较整数
+        # 忽略大小写的时候，按照大写后的内容映射
+        lineIds = {}
+        a_ids = []
+        b_ids = []
+        for line in a_lines:
+            a_ids.append(lineIds.setdefault(line.upper() if p_compare_ignoreCase else line, len(lineIds)))
+        for line in b_lines:
+            b_ids.append(lineIds.setdefault(line.upper() if p_compare_ignoreCase else line, len(lineIds)))
+
+        # 启用正则比较的时候，参考文件中包含正则特殊字符的行可能会匹配其他内容
+        # 这些行需要用正则来判断，判断的结果按照行的整数标识缓存
+        regexLines = {}
+        if p_compare_maskEnabled:
+            for nPos in range(0, len(b_lines)):
+                if b_ids[nPos] not in regexLines and self.RegexMetaChars.search(b_lines[nPos]) is not None:
+                    regexLines[b_ids[nPos]] = b_lines[nPos]
+        if len(regexLines) == 0:
+            def isEqual(x, y):
+                return a_ids[x] == b_ids[y]
+        else:
+            regexMatchCache = {}
+
+            def isEqual(x, y):
+                a_id = a_ids[x]
+                b_id = b_ids[y]
+                if a_id == b_id:
+                    return True
+                if b_id not in regexLines:
+                    return False
+                matchKey = (a_id, b_id)
+                if matchKey not in regexMatchCache:
+                    regexMatchCache[matchKey] = self.compare_string(
+                        a_lines[x], regexLines[b_id],
+                        p_compare_maskEnabled=True,
+                        p_compare_ignoreCase=p_compare_ignoreCase)
+                return regexMatchCache[matchKey]
+
+        # 比对结果， 每个元素为 (标记, 行位置)
+        history = []
+        # 待处理的区间，用栈来代替递归，避免大文件时递归过深
+        # ("DIFF", a开始, a结束, b开始, b结束) 需要比对的区间
+        # ("KEEP", a开始, a结束, b开始)        已经确认相同的区间
+        tasks = [("DIFF", 0, len(a_lines), 0, len(b_lines))]
+        while len(tasks) != 0:
+            task = tasks.pop()
+            if task[0] == "KEEP":
+                for x in range(task[1], task[2]):
+                    history.append((" ", x))
+                continue
+            a_start, a_end, b_start, b_end = task[1:]
+
+            # 去掉区间头部相同的内容
+            while a_start < a_end and b_start < b_end and isEqual(a_start, b_start):
+                history.append((" ", a_start))
+                a_start += 1
+                b_start += 1
+            # 去掉区间尾部相同的内容，这部分内容需要在区间处理完成后再输出
+            a_tail = a_end
+            b_tail = b_end
+            while a_tail > a_start and b_tail > b_start and isEqual(a_tail - 1, b_tail - 1):
+                a_tail -= 1
+                b_tail -= 1
+            if a_tail != a_end:
+                tasks.append(("KEEP", a_tail, a_end, b_tail))
+            a_end = a_tail
+            b_end = b_tail
+
+            if a_start == a_end:
+                for y in range(b_start, b_end):
+                    history.append(("+", y))
+                continue
+            if b_start == b_end:
+                for x in range(a_start, a_end):
+                    history.append(("-", x))
+                continue
+
+            # 查找两个方向路径的交汇点，以此将区间分为两部分
+            split = self.__bisectMyers(isEqual, a_start, a_end, b_start, b_end)
+            if split is None or split == (a_start, b_start) or split == (a_end, b_end):
+                # 没有任何相同的内容
+                for x in range(a_start, a_end):
+                    history.append(("-", x))
+                for y in range(b_start, b_end):
+                    history.append(("+", y))
+                continue
+            tasks.append(("DIFF", split[0], a_end, split[1], b_end))
+            tasks.append(("DIFF", a_start, split[0], b_start, split[1]))
+
+        compareResult = True
+        compareDiffResult = []
+        for tag, nPos in history:
+            if tag == " ":
+                compareDiffResult.append(" {:>{}} ".format(a_lineno[nPos], 6) + a_lines[nPos])
+            elif tag == "+":
+                compareResult = False
+                compareDiffResult.append("+{:>{}} ".format(b_lineno[nPos], 6) + b_lines[nPos])
+            else:
+                compareResult = False
+                compareDiffResult.append("-{:>{}} ".format(a_lineno[nPos], 6) + a_lines[nPos])
+        return compareResult, compareDiffResult
+
+    @staticmethod
+    def __bisectMyers(isEqual, a_start, a_end, b_start, b_end):
+        # 从区间的头部和尾部同时进行Myers搜索，返回两个方向路径交汇的位置
+        # 区间的头尾内容已经确认不相同
+        # frontier用字典记录，key为对角线编号，内存占用只和差异数量相关，和区间大小无关
+        n = a_end - a_start
+        m = b_end - b_start
+        maxD = (n + m + 1) // 2
+        v1 = {1: 0}
+        v2 = {1: 0}
+        delta = n - m
+        # 差异数为奇数的时候，在正向搜索中检查交汇，否则在反向搜索中检查
+        front = (delta % 2 != 0)
+        # 超出区间范围的对角线不再需要搜索
+        k1start = 0
+        k1end = 0
+        k2start = 0
+        k2end = 0
+        for d in range(0, maxD + 1):
+            # 正向搜索
+            for k1 in range(-d + k1start, d + 1 - k1end, 2):
+                if k1 == -d or (k1 != d and v1[k1 - 1] < v1[k1 + 1]):
+                    x1 = v1[k1 + 1]
+                else:
+                    x1 = v1[k1 - 1] + 1
+                y1 = x1 - k1
+                while x1 < n and y1 < m and isEqual(a_start + x1, b_start + y1):
+                    x1 += 1
+                    y1 += 1
+                v1[k1] = x1
+                if x1 > n:
+                    k1end += 2
+                elif y1 > m:
+                    k1start += 2
+                elif front:
+                    x2 = v2.get(delta - k1)
+                    if x2 is not None and x1 >= n - x2:
+                        return a_start + x1, b_start + y1
+
+            # 反向搜索
+            for k2 in range(-d + k2start, d + 1 - k2end, 2):
+                if k2 == -d or (k2 != d and v2[k2 - 1] < v2[k2 + 1]):
+                    x2 = v2[k2 + 1]
+                else:
+                    x2 = v2[k2 - 1] + 1
+                y2 = x2 - k2
+                while x2 < n and y2 < m and isEqual(a_end - 1 - x2, b_end - 1 - y2):
+                    x2 += 1
+                    y2 += 1
+                v2[k2] = x2
+                if x2 > n:
+                    k2end += 2
+                elif y2 > m:
+                    k2start += 2
+                elif not front:
+                    x1 = v1.get(delta - k2)
+                    if x1 is not None and x1 >= n - x2:
+                        return a_start + x1, b_start + x1 - (delta - k2)
+        return None
+
     def compareLCS(self,
                    x,
                    y,
@@ -289,112 +550,40 @@ class POSIXCompare:
                      CompareIgnoreCase: bool = False,
                      CompareIgnoreTailOrHeadBlank: bool = False,
                      compareAlgorithm: str = 'AUTO',
-                     compareAlgorithmDiffLibThresHold: int = 1000):
+                     compareLinearThreshold: int = 1000):
 
-        # 将比较文件加载到数组
+        # 原始内容用来在最后输出打印，显示的是原始文件信息，而不是修正后的信息
         fileRawContent = lines1
         refFileRawContent = lines2
-        workFileContent = lines1
-        refFileContent = lines2
-
-        # linno用来记录行号，在最后输出打印的时候，显示的是原始文件信息，而不是修正后的信息
-        lineno1 = []
-        lineno2 = []
-        for m_nPos in range(0, len(workFileContent)):
-            lineno1.append(m_nPos + 1)
-        for m_nPos in range(0, len(refFileContent)):
-            lineno2.append(m_nPos + 1)
-
-        # 去掉filecontent中的回车换行
-        for m_nPos in range(0, len(workFileContent)):
-            if workFileContent[m_nPos].endswith('\n'):
-                workFileContent[m_nPos] = workFileContent[m_nPos][:-1]
-        for m_nPos in range(0, len(refFileContent)):
-            if refFileContent[m_nPos].endswith('\n'):
-                refFileContent[m_nPos] = refFileContent[m_nPos][:-1]
-
-        # 去掉fileconent中的首尾空格
-        if CompareIgnoreTailOrHeadBlank:
-            for m_nPos in range(0, len(workFileContent)):
-                workFileContent[m_nPos] = workFileContent[m_nPos].lstrip().rstrip()
-            for m_nPos in range(0, len(refFileContent)):
-                refFileContent[m_nPos] = refFileContent[m_nPos].lstrip().rstrip()
-
-        # 去除在SkipLine里头的所有内容
-        if skipLines is not None:
-            m_nPos = 0
-            while m_nPos < len(workFileContent):
-                bMatch = False
-                for pattern in skipLines:
-                    if self.compare_string(workFileContent[m_nPos], pattern,
-                                           p_compare_maskEnabled=True,
-                                           p_compare_ignoreCase=True):
-                        workFileContent.pop(m_nPos)
-                        lineno1.pop(m_nPos)
-                        bMatch = True
-                        break
-                if not bMatch:
-                    m_nPos = m_nPos + 1
-
-            m_nPos = 0
-            while m_nPos < len(refFileContent):
-                bMatch = False
-                for pattern in skipLines:
-                    if self.compare_string(refFileContent[m_nPos], pattern,
-                                           p_compare_maskEnabled=True,
-                                           p_compare_ignoreCase=True):
-                        refFileContent.pop(m_nPos)
-                        lineno2.pop(m_nPos)
-                        bMatch = True
-                        break
-                if not bMatch:
-                    m_nPos = m_nPos + 1
-
-        # 去除所有的空行
-        if ignoreEmptyLine:
-            m_nPos = 0
-            while m_nPos < len(workFileContent):
-                if len(workFileContent[m_nPos].strip()) == 0:
-                    workFileContent.pop(m_nPos)
-                    lineno1.pop(m_nPos)
-                else:
-                    m_nPos = m_nPos + 1
-            m_nPos = 0
-            while m_nPos < len(refFileContent):
-                if len(refFileContent[m_nPos].strip()) == 0:
-                    refFileContent.pop(m_nPos)
-                    lineno2.pop(m_nPos)
-                else:
-                    m_nPos = m_nPos + 1
 
-        # 处理MaskLine中的信息，对ref, Work文件进行替换
-        if maskLines is not None:
-            m_nPos = 0
-            while m_nPos < len(refFileContent):
-                for m_SQLMaskPattern, m_SQLMaskTarget in maskLines.items():
-                    if re.search(m_SQLMaskPattern, refFileContent[m_nPos], re.IGNORECASE) is not None:
-                        refFileContent[m_nPos] = \
-                            re.sub(m_SQLMaskPattern, m_SQLMaskTarget, refFileContent[m_nPos], flags=re.IGNORECASE)
-                m_nPos = m_nPos + 1
-            m_nPos = 0
-            while m_nPos < len(workFileContent):
-                for m_SQLMaskPattern, m_SQLMaskTarget in maskLines.items():
-                    if re.search(m_SQLMaskPattern, workFileContent[m_nPos], re.IGNORECASE) is not None:
-                        workFileContent[m_nPos] = \
-                            re.sub(m_SQLMaskPattern, m_SQLMaskTarget, workFileContent[m_nPos], flags=re.IGNORECASE)
-                m_nPos = m_nPos + 1
+        # 去掉回车换行、首尾空格，去除SkipLine和空行，处理MaskLine
+        # linno用来记录行号
+        compareFilter = CompareLineFilter(
+            skipLines=skipLines,
+            maskLines=maskLines,
+            ignoreEmptyLine=ignoreEmptyLine,
+            ignoreTailOrHeadBlank=CompareIgnoreTailOrHeadBlank)
+        workFileContent, lineno1 = compareFilter.filterLines(fileRawContent)
+        refFileContent, lineno2 = compareFilter.filterLines(refFileRawContent)
 
         # 输出两个信息
         # 1：  Compare的结果是否存在dif，True/False
         # 2:   Compare的Dif列表. 注意：LCS算法是一个翻转的列表. MYERS算法里头是一个正序列表
         useCompareAlgorithm = compareAlgorithm.upper()
         if useCompareAlgorithm == "AUTO":
-            if len(lineno1) > compareAlgorithmDiffLibThresHold or len(lineno2) > compareAlgorithmDiffLibThresHold:
-                useCompareAlgorithm = "DIFFLIB"
-            else:
-                useCompareAlgorithm = "MYERS"
+            useCompareAlgorithm = "MYERS"
         if useCompareAlgorithm == "MYERS":
-            (compareResult, compareResultList) = \
+            if len(lineno1) > compareLinearThreshold or len(lineno2) > compareLinearThreshold:
+                # 文件较大的时候，使用线性空间的Myers算法，避免保存每条路径的完整历史
+                (compareResult, compareResultList) = \
+                    self.compareMyersLinear(
+                        workFileContent, refFileContent,
+                        lineno1, lineno2,
+                        p_compare_maskEnabled=CompareWithMask,
+                        p_compare_ignoreCase=CompareIgnoreCase
+                    )
+            else:
+                (compareResult, compareResultList) = \
                     self.compareMyers(
                         workFileContent, refFileContent,
                         lineno1, lineno2,
@@ -482,7 +671,7 @@ class POSIXCompare:
                            CompareWorkEncoding: str = 'UTF-8',
                            CompareRefEncoding: str = 'UTF-8',
                            compareAlgorithm: str = 'AUTO',
-                           compareAlgorithmDiffLibThresHold: int = 1000,
+                           compareLinearThreshold: int = 1000,
                            ):
         if not os.path.isfile(file1):
             raise DiffException('ERROR: File %s does not exist!' % file1)
@@ -505,7 +694,7 @@ class POSIXCompare:
             CompareIgnoreCase=CompareIgnoreCase,
             CompareIgnoreTailOrHeadBlank=CompareIgnoreTailOrHeadBlank,
             compareAlgorithm=compareAlgorithm,
-            compareAlgorithmDiffLibThresHold=compareAlgorithmDiffLibThresHold,
+            compareLinearThreshold=compareLinearThreshold,
         )
         # 关闭打开的文件
         if filefp1:
@@ -673,7 +862,7 @@ def executeCompareRequest(cls, requestObject, commandScriptFile: str):
                     maskLines=compareMaskLines,
                     CompareWorkEncoding=currentCompareOption["workEncoding"],
                     CompareRefEncoding=currentCompareOption["refEncoding"],
-                    compareAlgorithmDiffLibThresHold=cls.testOptions.get("COMPARE_DIFFLIB_THRESHOLD")
+                    compareLinearThreshold=int(cls.testOptions.get("COMPARE_LINEAR_THRESHOLD"))
                 )
             if compareResult:
                 yield {
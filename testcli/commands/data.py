@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import mmap
+import array
+import struct
+import tempfile
 import time
 import datetime
 import random
+import shutil
+import itertools
 import traceback
+import multiprocessing
 from hdfs.client import Client, InsecureClient
 from ..testcliexception import TestCliException
 
@@ -12,8 +19,46 @@ from ..testcliexception import TestCliException
 seedFileDir = ""
 # 定义种子文件的缓存
 seedDataCache = {}
+# 种子文件变化检查的版本，每个_DATA语句开始时增加，同一个语句中每个种子文件只检查一次是否发生变化
+seedStoreCheckVersion = 0
 # 定义HDFS的默认用户
 hdfsConnectedUser = None
+# 是否使用了指定的随机数种子，指定种子的情况下，随机字符串也从random中生成，保证结果可以重现
+dataRandomSeeded = False
+# 自增序列的偏移量，并行生成数据时，每个分片从各自的起始行开始计算序列
+identityOffset = {}
+# 自增时间戳以current_timestamp开始的时候，所有分片使用同一个开始时间
+identityCurrentTimestamp = None
+# 每次批量生成的行数
+DATA_BATCH_ROWS = 100000
+# 并行生成数据时，每个分片最少的行数
+DATA_SHARD_MINROWS = 10000
+# 合并分片文件时的缓冲区大小
+DATA_MERGE_BUFFERSIZE = 16 * 1024 * 1024
+# 文件转换时每次读写的数据块大小
+DATA_COPY_BUFFERSIZE = 8 * 1024 * 1024
+
+
+def setDataRandomSeed(seed):
+    """
+        设置随机数种子，种子为None的时候恢复为系统随机
+    """
+    global dataRandomSeeded
+    if seed is None:
+        random.seed()
+        dataRandomSeeded = False
+    else:
+        random.seed(seed)
+        dataRandomSeeded = True
+
+
+def randomBytes(n: int):
+    if dataRandomSeeded:
+        if n <= 0:
+            return bytearray()
+        return bytearray(random.getrandbits(8 * n).to_bytes(n, "little"))
+    else:
+        return bytearray(os.urandom(n))
 
 
 # 返回随机的Boolean类型
@@ -99,7 +144,7 @@ def random_digits(p_arg):
     n = int(p_arg[0])
     seed = '0123456789'.encode()
     len_lc = len(seed)
-    ba = bytearray(os.urandom(n))
+    ba = randomBytes(n)
     for i, b in enumerate(ba):
         ba[i] = seed[b % len_lc]
     return ba.decode('ascii')
@@ -109,7 +154,7 @@ def random_ascii_uppercase(p_arg):
     n = int(p_arg[0])
     seed = 'ABCDEFGHIJKLMNOPRRSTUVWXYZ'.encode()
     len_lc = len(seed)
-    ba = bytearray(os.urandom(n))
+    ba = randomBytes(n)
     for i, b in enumerate(ba):
         ba[i] = seed[b % len_lc]
     return ba.decode('ascii')
@@ -119,7 +164,7 @@ def random_ascii_lowercase(p_arg):
     n = int(p_arg[0])
     seed = 'abcdefghijklmnopqrstuvwxyz'.encode()
     len_lc = len(seed)
-    ba = bytearray(os.urandom(n))
+    ba = randomBytes(n)
     for i, b in enumerate(ba):
         ba[i] = seed[b % len_lc]
     return ba.decode('ascii')
@@ -129,7 +174,7 @@ def random_ascii_letters(p_arg):
     n = int(p_arg[0])
     seed = 'ABCDEFGHIJKLMNOPRRSTUVWXYZabcdefghijklmnopqrstuvwxyz'.encode()
     len_lc = len(seed)
-    ba = bytearray(os.urandom(n))
+    ba = randomBytes(n)
     for i, b in enumerate(ba):
         ba[i] = seed[b % len_lc]
     return ba.decode('ascii')
@@ -139,7 +184,7 @@ def random_ascii_letters_and_digits(p_arg):
     n = int(p_arg[0])
     seed = 'ABCDEFGHIJKLMNOPRRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'.encode()
     len_lc = len(seed)
-    ba = bytearray(os.urandom(n))
+    ba = randomBytes(n)
     for i, b in enumerate(ba):
         ba[i] = seed[b % len_lc]
     return ba.decode('ascii')
@@ -156,7 +201,7 @@ def identity(p_arg):
     if not hasattr(identity, 'x'):
         identity.x = {}
     if identity_name not in identity.x.keys():
-        identity.x[identity_name] = start
+        identity.x[identity_name] = start + identityOffset.get(identity_name, 0)
     else:
         identity.x[identity_name] = identity.x[identity_name] + 1
     return str(identity.x[identity_name])
@@ -186,30 +231,187 @@ def identity_timestamp(p_arg):
         identity_timestamp.x = {}
     if identity_name not in identity_timestamp.x.keys():
         if ptime == "current_timestamp":
-            identity_timestamp.x[identity_name] = datetime.datetime.now()
-        else:
-            identity_timestamp.x[identity_name] = datetime.datetime.strptime(ptime, frmt)
-    else:
-        # 判断步长单位，默认是毫秒，可以是s,ms
-        if step.endswith("s"):
-            if step.endswith("ms"):
-                # end with ms 毫秒
-                identity_timestamp.x[identity_name] = (identity_timestamp.x[identity_name] +
-                                                       datetime.timedelta(milliseconds=float(step[:-2])))
-            elif step.endswith("us"):
-                # end with us 微妙
-                identity_timestamp.x[identity_name] = (identity_timestamp.x[identity_name] +
-                                                       datetime.timedelta(microseconds=float(step[:-2])))
+            if identityCurrentTimestamp is None:
+                identity_timestamp.x[identity_name] = datetime.datetime.now()
             else:
-                # end with s 秒
-                identity_timestamp.x[identity_name] = (identity_timestamp.x[identity_name] +
-                                                       datetime.timedelta(seconds=float(step[:-1])))
+                identity_timestamp.x[identity_name] = identityCurrentTimestamp
         else:
+            identity_timestamp.x[identity_name] = datetime.datetime.strptime(ptime, frmt)
+        if identityOffset.get(identity_name, 0) != 0:
             identity_timestamp.x[identity_name] = (identity_timestamp.x[identity_name] +
-                                                   datetime.timedelta(milliseconds=float(step)))
+                                                   get_identity_timestamp_step(step) * identityOffset[identity_name])
+    else:
+        identity_timestamp.x[identity_name] = identity_timestamp.x[identity_name] + get_identity_timestamp_step(step)
     return identity_timestamp.x[identity_name].strftime(frmt)
 
 
+# 返回自增时间戳的步长
+def get_identity_timestamp_step(step: str):
+    # 判断步长单位，默认是毫秒，可以是s,ms
+    if step.endswith("s"):
+        if step.endswith("ms"):
+            # end with ms 毫秒
+            return datetime.timedelta(milliseconds=float(step[:-2]))
+        elif step.endswith("us"):
+            # end with us 微妙
+            return datetime.timedelta(microseconds=float(step[:-2]))
+        else:
+            # end with s 秒
+            return datetime.timedelta(seconds=float(step[:-1]))
+    else:
+        return datetime.timedelta(milliseconds=float(step))
+
+
+# 重置identity的序列号，保证下次从开头开始
+def reset_identity():
+    global identityOffset
+    global identityCurrentTimestamp
+
+    if hasattr(identity, 'x'):
+        delattr(identity, 'x')
+    if hasattr(identity_timestamp, 'x'):
+        delattr(identity_timestamp, 'x')
+    identityOffset = {}
+    identityCurrentTimestamp = None
+
+
+# 设置自增序列的偏移量，使得序列从第rowStart行（从0开始）的值开始计算
+def set_identity_offset(p_row_struct, rowStart: int, currentTimestamp=None):
+    global identityOffset
+    global identityCurrentTimestamp
+
+    reset_identity()
+    # 一行中同一个序列可能被调用多次，偏移量为调用次数乘以行数
+    for col in p_row_struct:
+        if isinstance(col, list) and col[0] in [identity, identity_timestamp]:
+            identityName = str(col[1][0])
+            identityOffset[identityName] = identityOffset.get(identityName, 0) + rowStart
+    identityCurrentTimestamp = currentTimestamp
+
+
+class SeedStore:
+    """
+        种子文件的存储
+        种子文件通过mmap映射到内存，随机读取时根据行偏移量的索引直接定位到对应的行
+        多个进程使用同一个种子文件的时候，共享操作系统的页缓存，不需要各自保存一份文件内容
+        行偏移量索引保存在种子文件旁边的<种子文件>.idx中，同样通过mmap读取，文件发生变化后重新生成
+        和文本方式读取文件一致，\r\n、\r、\n都作为行的结束符
+    """
+    # 索引文件的格式：文件头（标识，种子文件修改时间，种子文件大小，行数） + (行数+1)个8字节的行偏移量
+    indexMagic = b"TCSEEDI2"
+    indexHeader = struct.Struct("<8sqqq")
+    lineSeparatorPattern = re.compile(rb"\r\n|\r|\n")
+
+    def __init__(self, fileName: str):
+        self.fileName = fileName
+        self.fileHandle = None
+        self.fileMap = None
+        self.indexMap = None
+        self.offsets = None
+        self.lineCount = 0
+        self.checkedVersion = seedStoreCheckVersion
+        fileStat = os.stat(fileName)
+        self.mtime = fileStat.st_mtime_ns
+        self.size = fileStat.st_size
+        if self.size == 0:
+            # 空文件无法映射
+            return
+        self.fileHandle = open(fileName, mode="rb")
+        self.fileMap = mmap.mmap(self.fileHandle.fileno(), 0, access=mmap.ACCESS_READ)
+        if not self.loadIndex():
+            self.buildIndex()
+
+    def loadIndex(self):
+        indexFileName = self.fileName + ".idx"
+        try:
+            with open(indexFileName, mode="rb") as f:
+                indexMap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if len(indexMap) < self.indexHeader.size:
+            indexMap.close()
+            return False
+        magic, mtime, size, lineCount = self.indexHeader.unpack_from(indexMap, 0)
+        if magic != self.indexMagic or mtime != self.mtime or size != self.size or \
+                len(indexMap) != self.indexHeader.size + (lineCount + 1) * 8:
+            # 索引已经失效
+            indexMap.close()
+            return False
+        self.indexMap = indexMap
+        self.offsets = memoryview(indexMap)[self.indexHeader.size:].cast("Q")
+        self.lineCount = lineCount
+        return True
+
+    def buildIndex(self):
+        offsets = array.array("Q", [0])
+        if self.fileMap.find(b"\r") == -1:
+            # 没有\r的文件直接查找\n，比正则表达式快
+            pos = self.fileMap.find(b"\n")
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = self.fileMap.find(b"\n", pos + 1)
+        else:
+            for matchObj in self.lineSeparatorPattern.finditer(self.fileMap):
+                offsets.append(matchObj.end())
+        if offsets[-1] != self.size:
+            # 最后一行没有换行符
+            offsets.append(self.size)
+        self.offsets = offsets
+        self.lineCount = len(offsets) - 1
+
+        # 保存索引，供其他进程使用。种子目录可能没有写权限，保存失败不影响使用
+        indexFileName = self.fileName + ".idx"
+        try:
+            fd, tempFile = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(indexFileName)),
+                                            prefix=os.path.basename(indexFileName), suffix=".tmp")
+            try:
+                with os.fdopen(fd, mode="wb") as f:
+                    f.write(self.indexHeader.pack(self.indexMagic, self.mtime, self.size, self.lineCount))
+                    f.write(offsets.tobytes())
+                os.replace(tempFile, indexFileName)
+            except Exception:
+                if os.path.exists(tempFile):
+                    os.remove(tempFile)
+                raise
+        except Exception:
+            if "TESTCLI_DEBUG" in os.environ:
+                print("[DEBUG] Save seed index failed. [" + str(indexFileName) + "]")
+
+    def isChanged(self):
+        try:
+            fileStat = os.stat(self.fileName)
+        except OSError:
+            return True
+        return fileStat.st_mtime_ns != self.mtime or fileStat.st_size != self.size
+
+    def getLine(self, lineNo: int):
+        line = self.fileMap[self.offsets[lineNo]:self.offsets[lineNo + 1]]
+        if line.endswith(b"\n"):
+            line = line[:-1]
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        return line.decode("utf-8")
+
+    def getRandomLines(self, n: int):
+        # 一次抽取所有的随机行号
+        return [self.getLine(lineNo) for lineNo in random.choices(range(self.lineCount), k=n)]
+
+    def close(self):
+        # 索引的memoryview需要先释放，否则mmap无法关闭
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+        self.offsets = None
+        if self.indexMap is not None:
+            self.indexMap.close()
+            self.indexMap = None
+        if self.fileMap is not None:
+            self.fileMap.close()
+            self.fileMap = None
+        if self.fileHandle is not None:
+            self.fileHandle.close()
+            self.fileHandle = None
+
+
 # 缓存seed文件
 def loadSeedCache(seedName: str):
     global seedFileDir
@@ -234,17 +436,37 @@ def loadSeedCache(seedName: str):
         raise TestCliException("Invalid seed [" + str(seedName) + "]. Seed file does not exist!")
 
     # 加载文件
-    with open(fpName, mode='r', encoding="utf-8") as f:
-        seedLines = f.readlines()
-    for pos in range(0, len(seedLines)):
-        if seedLines[pos].endswith("\n"):
-            seedLines[pos] = seedLines[pos][:-1]  # 去掉回车换行
-    seedDataCache[seedName] = seedLines
+    if seedName in seedDataCache:
+        seedDataCache[seedName].close()
+    seedDataCache[seedName] = SeedStore(fpName)
+
+
+def getSeedStore(seedName: str):
+    """
+        返回种子文件的存储，种子文件还没有加载或者已经发生变化的时候，重新加载
+        是否发生变化需要读取文件的状态，每个_DATA语句中只检查一次，不在逐行生成数据的时候反复检查
+    """
+    # 空的种子文件可能是刚刚创建，总是重新加载
+    seedStore = seedDataCache.get(seedName)
+    if seedStore is None or seedStore.lineCount == 0 or \
+            (seedStore.checkedVersion != seedStoreCheckVersion and seedStore.isChanged()):
+        loadSeedCache(seedName)
+        seedStore = seedDataCache[seedName]
+    seedStore.checkedVersion = seedStoreCheckVersion
+    if seedStore.lineCount == 0:
+        raise TestCliException("Seed cache is zero. [" + str(seedName) + "].")
+    return seedStore
+
+
+def newSeedStoreCheck():
+    """
+        开始新的_DATA语句，随后第一次使用种子文件的时候重新检查文件是否发生变化
+    """
+    global seedStoreCheckVersion
+    seedStoreCheckVersion = seedStoreCheckVersion + 1
 
 
 def random_from_seed(p_arg):
-    global seedDataCache
-
     seed_name = str(p_arg[0])
     if len(p_arg) == 3:
         # 从指定位置开始截取数据内容
@@ -258,26 +480,13 @@ def random_from_seed(p_arg):
         start_pos = 0
         max_length = -1
 
-    # 如果还没有加载种子，就先尝试加载
-    if seed_name not in seedDataCache:
-        loadSeedCache(seed_name)
-
     # 在种子中查找需要的内容
-    if seed_name in seedDataCache:
-        n = len(seedDataCache[seed_name])
-        if n == 0:
-            # 空的Seed文件，可能是由于Seed文件刚刚创建，则尝试重新加载数据
-            loadSeedCache(seed_name)
-            n = len(seedDataCache[seed_name])
-            if n == 0:
-                raise TestCliException("Seed cache is zero. [" + str(p_arg[0]) + "].")
-        random_lines = seedDataCache[seed_name][random.randint(0, n - 1)]
-        if max_length == -1:
-            return random_lines[start_pos:]
-        else:
-            return random_lines[start_pos:start_pos + max_length]
+    seedStore = getSeedStore(seed_name)
+    random_lines = seedStore.getLine(random.randint(0, seedStore.lineCount - 1))
+    if max_length == -1:
+        return random_lines[start_pos:]
     else:
-        raise TestCliException("Unknown seed [" + str(p_arg[0]) + "].  Please create it first.")
+        return random_lines[start_pos:start_pos + max_length]
 
 
 # 将传递的SQL字符串转换成一个带有函数指针的数组
@@ -703,6 +912,156 @@ def get_final_string(p_row_struct):
     return m_Result
 
 
+# 随机字符串函数对应的字符集
+randomStringCharset = {
+    "random_digits": '0123456789',
+    "random_ascii_uppercase": 'ABCDEFGHIJKLMNOPRRSTUVWXYZ',
+    "random_ascii_lowercase": 'abcdefghijklmnopqrstuvwxyz',
+    "random_ascii_letters": 'ABCDEFGHIJKLMNOPRRSTUVWXYZabcdefghijklmnopqrstuvwxyz',
+    "random_ascii_letters_and_digits": 'ABCDEFGHIJKLMNOPRRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789',
+}
+
+
+class RowTemplate:
+    """
+        编译后的行模板
+        parse_formula_str的解析结果在这里编译一次，每一列对应一个批量生成函数，参数在编译时已经完成转换
+        生成数据时按列批量生成N行的内容，最后用join拼接成行
+    """
+    def __init__(self, p_row_struct):
+        # 每一列的定义为 (类型, 内容)
+        #   LITERAL     内容为固定的字符串
+        #   FUNCTION    内容为批量生成函数，参数为行数，返回该列N行的内容
+        #   VALUE       内容为引用的列名
+        self.columns = []
+        # 需要被引用的列名，以及该列在columns中的位置
+        self.namedColumns = {}
+        for col in p_row_struct:
+            if isinstance(col, list):
+                if col[2] == "VALUE":
+                    self.columns.append(("VALUE", self.namedColumns[col[1].upper()]))
+                else:
+                    if col[2] != "__NO_NAME__":
+                        self.namedColumns[col[2]] = len(self.columns)
+                    self.columns.append(("FUNCTION", self.compileColumn(col[0], col[1])))
+            elif col != "":
+                self.columns.append(("LITERAL", col))
+
+    @staticmethod
+    def compileColumn(func, args):
+        funcName = getattr(func, "__name__", None)
+        if funcName in randomStringCharset:
+            return RowTemplate.compileRandomString(randomStringCharset[funcName], int(args[0]))
+        if func is random_from_seed:
+            return RowTemplate.compileRandomFromSeed(args)
+        if func is identity:
+            return RowTemplate.compileIdentity(args)
+        if func is random_boolean:
+            return lambda n: random.choices(["0", "1"], k=n)
+        if func in [random_date, random_time, random_timestamp]:
+            return RowTemplate.compileRandomTime(func, args)
+        if func is str:
+            return lambda n: [args] * n
+
+        # 其他函数逐行调用
+        return lambda n: [func(args) for _ in range(n)]
+
+    @staticmethod
+    def compileRandomString(charset: str, length: int):
+        # 每个随机字节按照取模的方式映射到字符集中，这里预先生成映射表，一次转换所有行的内容
+        charsetBytes = charset.encode()
+        translateTable = bytes([charsetBytes[b % len(charsetBytes)] for b in range(0, 256)])
+
+        def generate(n):
+            if length <= 0:
+                return [""] * n
+            content = randomBytes(n * length).translate(translateTable).decode('ascii')
+            return [content[pos:pos + length] for pos in range(0, n * length, length)]
+        return generate
+
+    @staticmethod
+    def compileRandomFromSeed(args):
+        seedName = str(args[0])
+        if len(args) == 3:
+            startPos = int(args[1])
+            maxLength = int(args[2])
+        elif len(args) == 2:
+            startPos = 0
+            maxLength = int(args[1])
+        else:
+            startPos = 0
+            maxLength = -1
+        # 检查种子文件是否存在
+        getSeedStore(seedName)
+
+        def generate(n):
+            seedLines = getSeedStore(seedName).getRandomLines(n)
+            if maxLength == -1:
+                return [seedLine[startPos:] for seedLine in seedLines]
+            return [seedLine[startPos:startPos + maxLength] for seedLine in seedLines]
+        return generate
+
+    @staticmethod
+    def compileIdentity(args):
+        identityName = str(args[0])
+        start = int(args[1])
+
+        def generate(n):
+            if not hasattr(identity, 'x'):
+                identity.x = {}
+            if identityName not in identity.x.keys():
+                firstValue = start + identityOffset.get(identityName, 0)
+            else:
+                firstValue = identity.x[identityName] + 1
+            identity.x[identityName] = firstValue + n - 1
+            return [str(value) for value in range(firstValue, firstValue + n)]
+        return generate
+
+    @staticmethod
+    def compileRandomTime(func, args):
+        if func is random_time:
+            if len(args) > 2:
+                frmt = "%Y-%m-%d " + str(args[2])
+            else:
+                frmt = "%Y-%m-%d %H:%M:%S"
+            timePrefix = "2000-01-01 "
+        else:
+            if len(args) > 2:
+                frmt = str(args[2])
+            elif func is random_date:
+                frmt = "%Y-%m-%d"
+            else:
+                frmt = "%Y-%m-%d %H:%M:%S"
+            timePrefix = ""
+        try:
+            stime = datetime.datetime.strptime(timePrefix + str(args[0]), frmt)
+            etime = datetime.datetime.strptime(timePrefix + str(args[1]), frmt)
+        except ValueError:
+            if func is random_date:
+                raise TestCliException("Invalid date format [" + str(frmt) + "] for [" + str(args[0]) + "]")
+            raise TestCliException("Invalid timestamp format [" + str(frmt) + "] for [" + str(args[0]) + "]")
+        delta = etime - stime
+        if func is random_time:
+            return lambda n: [(random.random() * delta + stime).strftime(frmt)[11:] for _ in range(n)]
+        return lambda n: [(random.random() * delta + stime).strftime(frmt) for _ in range(n)]
+
+    def generateRows(self, n: int):
+        """
+            批量生成N行数据，返回的每一行都不包含换行符
+        """
+        columnValues = []
+        for columnType, columnContent in self.columns:
+            if columnType == "LITERAL":
+                columnValues.append(itertools.repeat(columnContent, n))
+            elif columnType == "FUNCTION":
+                columnValues.append(columnContent(n))
+            else:
+                columnValues.append(columnValues[columnContent])
+        if len(columnValues) == 0:
+            return [""] * n
+        return ["".join(row) for row in zip(*columnValues)]
+
+
 class FileHandler:
     def __init__(self):
         self.fp = None
@@ -713,14 +1072,27 @@ class FileHandler:
     def read(self, nByte: int):
         return self.fp.read(nByte)
 
+    def readChunks(self, chunkSize: int):
+        while True:
+            chunk = self.fp.read(chunkSize)
+            if not chunk:
+                break
+            yield chunk
+
     def write(self, content: bytes):
         self.fp.write(content)
 
     def writeLines(self, buf: list):
         self.fp.writelines(buf)
 
+    def writeStream(self, chunks):
+        for chunk in chunks:
+            self.fp.write(chunk)
+
     def close(self):
-        self.fp.close()
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
 
 
 class MemHandler:
@@ -735,25 +1107,49 @@ class MemHandler:
     def read(self, nByte: int):
         return self.fp.read(nByte)
 
+    def readChunks(self, chunkSize: int):
+        while True:
+            chunk = self.fp.read(chunkSize)
+            if not chunk:
+                break
+            yield chunk
+
     def write(self, content: bytes):
         self.fp.write(content)
 
     def writeLines(self, buf: list):
         self.fp.writelines(buf)
 
+    def writeStream(self, chunks):
+        for chunk in chunks:
+            self.fp.write(chunk)
+
     def close(self):
-        self.fp.close()
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
 
 
 class HdfsHandler:
+    """
+        HDFS文件的读写
+        每次打开文件后只使用一个WebHDFS的读会话或者写会话，不会为每一批数据单独发起请求
+        writeStream把数据块的生成器直接作为请求体，以分块传输的方式上传，数据边生成边发送
+        write/writeLines共用一个打开的写会话，关闭文件的时候结束
+    """
     def __init__(self):
         self.hdfsHandler = None
         self.hdfsFileName = None
+        self.encoding = None
         self.isFirstWrite = True
+        self.writerContext = None
+        self.readerContext = None
+        self.reader = None
 
     def open(self, fileName: str, mode: str, encoding: str):
-        if mode or encoding:
+        if mode:
             pass
+        self.encoding = encoding if encoding else "UTF-8"
         # HDFS 文件格式： http://node:port/xx/yy/cc.dat
         # 注意这里的node和port都是webfs端口，不是rpc端口
         protocal = fileName.split("://")[0]
@@ -765,34 +1161,83 @@ class HdfsHandler:
         else:
             self.hdfsHandler = InsecureClient(url=webFSURL, user=hdfsConnectedUser, root=hdfsFSDir)
 
+    def encodeChunks(self, chunks):
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode(self.encoding)
+            if chunk:
+                yield chunk
+
     def read(self, nByte: int):
-        with self.hdfsHandler.read(self.hdfsFileName) as reader:
-            return reader.read(nByte)
+        # 读会话在第一次读取的时候打开，之后的读取从上次的位置继续
+        if self.readerContext is None:
+            self.readerContext = self.hdfsHandler.read(self.hdfsFileName)
+            self.reader = self.readerContext.__enter__()
+        return self.reader.read(nByte)
+
+    def readChunks(self, chunkSize: int):
+        with self.hdfsHandler.read(self.hdfsFileName, chunk_size=chunkSize) as reader:
+            for chunk in reader:
+                yield chunk
+
+    def getWriter(self):
+        if self.writerContext is None:
+            if self.isFirstWrite:
+                self.writerContext = self.hdfsHandler.write(hdfs_path=self.hdfsFileName, overwrite=True)
+                self.isFirstWrite = False
+            else:
+                self.writerContext = self.hdfsHandler.write(hdfs_path=self.hdfsFileName, append=True)
+            self.writerContext.__enter__()
+        return self.writerContext
 
     def write(self, content: bytes):
-        if self.isFirstWrite:
-            with self.hdfsHandler.write(hdfs_path=self.hdfsFileName, overwrite=True) as output:
-                output.write(content)
-            self.isFirstWrite = False
-        else:
-            with self.hdfsHandler.write(hdfs_path=self.hdfsFileName, append=True) as output:
-                output.write(content)
+        for chunk in self.encodeChunks([content]):
+            self.getWriter().write(chunk)
 
     def writeLines(self, buf: list):
+        for chunk in self.encodeChunks(buf):
+            self.getWriter().write(chunk)
+
+    def writeStream(self, chunks):
+        if self.writerContext is not None:
+            self.writeLines(chunks)
+            return
         if self.isFirstWrite:
-            with self.hdfsHandler.write(hdfs_path=self.hdfsFileName, overwrite=True) as output:
-                for line in buf:
-                    output.write(line.encode())
+            self.hdfsHandler.write(hdfs_path=self.hdfsFileName, data=self.encodeChunks(chunks), overwrite=True)
             self.isFirstWrite = False
         else:
-            with self.hdfsHandler.write(hdfs_path=self.hdfsFileName, append=True) as output:
-                for line in buf:
-                    output.write(line.encode())
+            self.hdfsHandler.write(hdfs_path=self.hdfsFileName, data=self.encodeChunks(chunks), append=True)
 
     def close(self):
-        self.hdfsHandler = None
-        self.hdfsFileName = None
-        self.isFirstWrite = True
+        try:
+            if self.writerContext is not None:
+                self.writerContext.__exit__(None, None, None)
+            if self.readerContext is not None:
+                self.readerContext.__exit__(None, None, None)
+        finally:
+            self.writerContext = None
+            self.readerContext = None
+            self.reader = None
+            self.hdfsHandler = None
+            self.hdfsFileName = None
+            self.isFirstWrite = True
+
+
+def copyLocalFile(srcFileName: str, dstFileName: str):
+    """
+        本地文件之间的复制，在内核中完成数据的复制，不经过用户态的缓冲区
+        优先使用copy_file_range，不支持的时候由shutil.copyfile完成（Linux下会使用sendfile）
+    """
+    if hasattr(os, "copy_file_range"):
+        with open(srcFileName, mode="rb") as srcFp, open(dstFileName, mode="wb") as dstFp:
+            try:
+                while os.copy_file_range(srcFp.fileno(), dstFp.fileno(), DATA_COPY_BUFFERSIZE) > 0:
+                    pass
+                return
+            except OSError:
+                # 文件系统不支持的时候，从头重新复制
+                pass
+    shutil.copyfile(srcFileName, dstFileName)
 
 
 fsImplemention = {
@@ -802,32 +1247,110 @@ fsImplemention = {
 }
 
 
-def createFile(p_filetype: str, p_filename, p_formula_str, p_rows, p_encoding='UTF-8'):
+def createFileShard(shardRequest: dict):
+    """
+        在子进程中生成一个分片的数据文件，返回错误信息，成功的时候返回None
+    """
+    global seedFileDir
+
+    try:
+        seedFileDir = shardRequest["seedFileDir"]
+        setDataRandomSeed(shardRequest["seed"])
+        m_row_struct = parse_formula_str(shardRequest["formula"])
+        set_identity_offset(m_row_struct,
+                            rowStart=shardRequest["rowStart"],
+                            currentTimestamp=shardRequest["currentTimestamp"])
+        rowTemplate = RowTemplate(m_row_struct)
+        with open(file=shardRequest["fileName"], mode='w', encoding=shardRequest["encoding"]) as fp:
+            for batchStart in range(shardRequest["rowStart"], shardRequest["rowEnd"], DATA_BATCH_ROWS):
+                batchRows = min(DATA_BATCH_ROWS, shardRequest["rowEnd"] - batchStart)
+                fp.write("\n".join(rowTemplate.generateRows(batchRows)) + "\n")
+        reset_identity()
+        return None
+    except TestCliException as e:
+        return e.message
+    except Exception as e:
+        return repr(e)
+
+
+def createFileParallel(p_filename, p_formula_str, p_rows, p_encoding, p_parallel, p_merge, p_seed):
+    """
+        多进程生成数据文件
+        行的范围按照进程数量拆分成多个分片，每个分片写入各自的文件(<文件名>.partNNNN)，最后按顺序合并
+        自增序列按照分片的起始行计算偏移，保证结果和单进程生成的相同
+        指定随机数种子的时候，每个分片使用<种子>:<分片号>作为各自的种子，结果可以重现
+    """
+    nShards = min(p_parallel, (p_rows + DATA_SHARD_MINROWS - 1) // DATA_SHARD_MINROWS)
+    currentTimestamp = datetime.datetime.now()
+    shardRequests = []
+    for nShard in range(0, nShards):
+        shardRequests.append(
+            {
+                "fileName": p_filename + ".part%04d" % nShard,
+                "formula": p_formula_str,
+                "rowStart": p_rows * nShard // nShards,
+                "rowEnd": p_rows * (nShard + 1) // nShards,
+                "encoding": p_encoding,
+                "seed": None if p_seed is None else str(p_seed) + ":" + str(nShard),
+                "seedFileDir": seedFileDir,
+                "currentTimestamp": currentTimestamp,
+            }
+        )
+    processContext = multiprocessing.get_context("spawn")
+    with processContext.Pool(processes=nShards) as pool:
+        shardErrors = pool.map(createFileShard, shardRequests)
+    partFiles = [shardRequest["fileName"] for shardRequest in shardRequests]
+    for shardError in shardErrors:
+        if shardError is not None:
+            for partFile in partFiles:
+                if os.path.exists(partFile):
+                    os.remove(partFile)
+            raise TestCliException(shardError)
+    if not p_merge:
+        return partFiles
+
+    # 合并分片文件
+    with open(file=p_filename, mode='wb') as fp:
+        for partFile in partFiles:
+            with open(file=partFile, mode='rb') as partFp:
+                shutil.copyfileobj(partFp, fp, DATA_MERGE_BUFFERSIZE)
+            os.remove(partFile)
+    return [p_filename, ]
+
+
+def createFile(p_filetype: str, p_filename, p_formula_str, p_rows, p_encoding='UTF-8',
+               p_parallel: int = 1, p_merge: bool = True, p_seed=None):
+    """
+        生成数据文件，返回生成的文件列表
+        p_parallel大于1的时候，对于本地文件(FS)使用多进程并行生成
+    """
     try:
         if p_filetype.upper() not in fsImplemention.keys():
             raise TestCliException("Unknown target file type [" + str(p_filetype) + "]")
+        if p_filetype.upper() == "FS" and p_parallel > 1 and p_rows >= 2 * DATA_SHARD_MINROWS:
+            return createFileParallel(p_filename=p_filename, p_formula_str=p_formula_str, p_rows=p_rows,
+                                      p_encoding=p_encoding, p_parallel=p_parallel,
+                                      p_merge=p_merge, p_seed=p_seed)
+
+        setDataRandomSeed(p_seed)
         fsHandler = fsImplemention[p_filetype.upper()]()
         fsHandler.open(fileName=p_filename, mode='w', encoding=p_encoding)
 
-        m_row_struct = parse_formula_str(p_formula_str)
+        rowTemplate = RowTemplate(parse_formula_str(p_formula_str))
         if p_rows == 1:
-            fsHandler.write(get_final_string(m_row_struct))
+            fsHandler.writeStream([rowTemplate.generateRows(1)[0]])
         else:
-            buf = []
-            for i in range(0, p_rows):
-                buf.append(get_final_string(m_row_struct) + '\n')
-                if len(buf) == 100000:  # 为了提高IO效率，每10W条写入文件一次
-                    fsHandler.writeLines(buf)
-                    buf = []
-            if len(buf) != 0:
-                fsHandler.writeLines(buf)
+            # 为了提高IO效率，每次批量生成10W条，写入文件一次
+            # 所有的批次以生成器的方式写入，对于HDFS只使用一个写会话
+            fsHandler.writeStream(
+                "\n".join(rowTemplate.generateRows(min(DATA_BATCH_ROWS, p_rows - batchStart))) + "\n"
+                for batchStart in range(0, p_rows, DATA_BATCH_ROWS)
+            )
         fsHandler.close()
 
         # 重置identity的序列号，保证下次从开头开始
-        if hasattr(identity, 'x'):
-            delattr(identity, 'x')
-        if hasattr(identity_timestamp, 'x'):
-            delattr(identity_timestamp, 'x')
+        reset_identity()
+        return [p_filename, ]
     except TestCliException as e:
         raise TestCliException(e.message)
     except Exception as e:
@@ -835,25 +1358,29 @@ def createFile(p_filetype: str, p_filename, p_formula_str, p_rows, p_encoding='U
             print('traceback.print_exc():\n%s' % traceback.print_exc())
             print('traceback.format_exc():\n%s' % traceback.format_exc())
         raise TestCliException(repr(e))
+    finally:
+        if p_seed is not None:
+            setDataRandomSeed(None)
 
 
 def convertFile(srcFileType: str, srcFileName: str, dstFileType: str, dstFileName: str):
-    blockSize = 8192
-
+    srcHandler = None
+    dstHandler = None
     try:
         if srcFileType.upper() not in fsImplemention.keys():
-            raise TestCliException("Unknown target file type [" + str(srcFileType) + "]")
+            raise TestCliException("Unknown source file type [" + str(srcFileType) + "]")
+        if dstFileType.upper() not in fsImplemention.keys():
+            raise TestCliException("Unknown target file type [" + str(dstFileType) + "]")
+        if srcFileType.upper() == "FS" and dstFileType.upper() == "FS":
+            copyLocalFile(srcFileName, dstFileName)
+            return
+
+        # 以大数据块的方式从源文件读取，并以流的方式写入目标文件
         srcHandler = fsImplemention[srcFileType.upper()]()
         srcHandler.open(fileName=srcFileName, mode='rb', encoding=None)
         dstHandler = fsImplemention[dstFileType.upper()]()
         dstHandler.open(fileName=dstFileName, mode='wb', encoding=None)
-        while True:
-            readContents = srcHandler.read(blockSize)
-            dstHandler.write(readContents)
-            if len(readContents) <= blockSize:
-                break
-        srcHandler.close()
-        dstHandler.close()
+        dstHandler.writeStream(srcHandler.readChunks(DATA_COPY_BUFFERSIZE))
     except TestCliException as e:
         raise TestCliException(e.message)
     except Exception as e:
@@ -861,12 +1388,19 @@ def convertFile(srcFileType: str, srcFileName: str, dstFileType: str, dstFileNam
             print('traceback.print_exc():\n%s' % traceback.print_exc())
             print('traceback.format_exc():\n%s' % traceback.format_exc())
         raise TestCliException(repr(e))
+    finally:
+        if srcHandler is not None:
+            srcHandler.close()
+        if dstHandler is not None:
+            dstHandler.close()
 
 
 def executeDataRequest(cls, requestObject):
     global seedFileDir
     global hdfsConnectedUser
 
+    newSeedStoreCheck()
+
     if requestObject["action"] == "set":
         if requestObject["option"] == "seedDir":
             # 设置种子文件的目录
@@ -899,20 +1433,31 @@ def executeDataRequest(cls, requestObject):
         if rowCount > 1:
             # 如果需要的数据不是一行，则描述信息中的回车换行符号均无意义
             columnExpression = columnExpression.replace('\r', '').replace('\n', '')
+        dataSeed = str(cls.testOptions.get("DATA_SEED"))
+        if dataSeed == "":
+            dataSeed = None
         try:
-            createFile(p_filetype=fileType,
-                       p_filename=targetFile,
-                       p_formula_str=columnExpression,
-                       p_rows=rowCount,
-                       p_encoding=cls.testOptions.get("RESULT_ENCODING")
-                       )
+            createdFiles = createFile(p_filetype=fileType,
+                                      p_filename=targetFile,
+                                      p_formula_str=columnExpression,
+                                      p_rows=rowCount,
+                                      p_encoding=cls.testOptions.get("RESULT_ENCODING"),
+                                      p_parallel=int(cls.testOptions.get("DATA_PARALLEL")),
+                                      p_merge=(str(cls.testOptions.get("DATA_PARALLEL_MERGE")).upper() == "ON"),
+                                      p_seed=dataSeed
+                                      )
+            if len(createdFiles) == 1:
+                status = "File [" + str(targetFile) + "] created successful. " + str(rowCount) + " rows generated."
+            else:
+                status = "File [" + ",".join(createdFiles) + "] created successful. " + \
+                         str(rowCount) + " rows generated."
             yield {
                 "type": "result",
                 "title": None,
                 "rows": None,
                 "headers": None,
                 "columnTypes": None,
-                "status": "File [" + str(targetFile) + "] created successful. " + str(rowCount) + " rows generated."
+                "status": status
             }
         except TestCliException as te:
             yield {
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from ..globalvar import globalEmbeddScriptScope
 from ..globalvar import lastCommandResult
+from ..commands.assertExpression import compiledCodeCache
 
 
 # 执行Python脚本
@@ -18,7 +19,7 @@ def executeEmbeddScript(cls, block: str):
     globalEmbeddScriptScope["sessionContext"] = sessionContext
     globalEmbeddScriptScope["lastCommandResult"] = lastCommandResult
     try:
-        exec(block, globalEmbeddScriptScope)
+        exec(compiledCodeCache.get(block, "exec"), globalEmbeddScriptScope)
     except Exception as se:
         yield {
             "type": "error",
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+import functools
+import importlib.machinery
 import importlib.util
+import inspect
 import os
 import re
 from ..testcliexception import TestCliException
@@ -26,6 +29,33 @@ scriptFunction = {}
 plugins = {}
 
 
+# 已经导入的脚本模块
+# { 脚本文件全名: (文件修改时间, 文件大小, module) }
+scriptFileCache = {}
+
+
+def importScriptFile(scriptFile: str):
+    """
+        导入脚本文件，返回导入后的模块
+        同一个文件只导入一次，文件发生变化后重新导入
+        编译后的字节码按照Python的规则保存在__pycache__中，文件没有变化的时候直接加载字节码
+    """
+    scriptFileStat = os.stat(scriptFile)
+    if scriptFile in scriptFileCache:
+        mtime, size, module = scriptFileCache[scriptFile]
+        if mtime == scriptFileStat.st_mtime_ns and size == scriptFileStat.st_size:
+            return module
+
+    moduleName = os.path.splitext(os.path.basename(scriptFile))[0]
+    # 指定SourceFileLoader，文件不是.py后缀的时候也可以导入
+    loader = importlib.machinery.SourceFileLoader(moduleName, scriptFile)
+    spec = importlib.util.spec_from_file_location(name=moduleName, location=scriptFile, loader=loader)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    scriptFileCache[scriptFile] = (scriptFileStat.st_mtime_ns, scriptFileStat.st_size, module)
+    return module
+
+
 # 加载额外的Python脚本
 # 用来扩展当前的内嵌语法
 def loadScript(cls, scriptFile: str):
@@ -41,56 +71,60 @@ def loadScript(cls, scriptFile: str):
                 "message": "Script file [" + os.path.abspath(scriptFile) + "] does not exist!",
             }
             return
-    scriptFileHandler = open(file=scriptFile, mode="r", encoding=cls.testOptions.get("SCRIPT_ENCODING"))
-    scriptContents = scriptFileHandler.readlines()
+
+    # 脚本只导入一次，随后从模块中获得定义的类和函数
+    try:
+        module = importScriptFile(os.path.abspath(scriptFile))
+    except Exception as ex:
+        yield {
+            "type": "error",
+            "message": "Load script file [" + os.path.abspath(scriptFile) + "] error! " + repr(ex),
+        }
+        return
+
+    # 只导入脚本中定义的公开类和可调用对象，不包括脚本从其他模块导入的内容
+    # 可调用对象包括普通函数，被装饰的函数（例如functools.lru_cache），functools.partial对象，以及定义了__call__的类的实例
+    scriptClasses = []
+    scriptFunctions = []
+    for name, member in list(vars(module).items()):
+        if name.startswith("_") or inspect.ismodule(member):
+            continue
+        memberOwner = member
+        while isinstance(memberOwner, functools.partial):
+            # partial对象的__module__总是functools，按照被包装的函数判断
+            memberOwner = memberOwner.func
+        if getattr(memberOwner, "__module__", None) != module.__name__:
+            continue
+        if inspect.isclass(member):
+            scriptClasses.append((name, member))
+        elif callable(member):
+            scriptFunctions.append((name, member))
 
     # 导入script的外部模块
-    for scriptContext in scriptContents:
-        matchObj = re.match(r"^class(\s+)(.*?)(\s+)?[(|:]", scriptContext)
-        if matchObj:
-            className = str(matchObj.group(2)).strip()
-            # 动态导入class
-            spec_class = importlib.util.spec_from_file_location(
-                name=className,
-                location=os.path.abspath(scriptFile)
-            )
-            module_class = importlib.util.module_from_spec(spec_class)
-            spec_class.loader.exec_module(module_class)
-            scriptClass = getattr(module_class, className)
-            scriptModule[className] = scriptClass
-            globalEmbeddScriptScope[className] = scriptModule[className]
-            yield {
-                "type": "result",
-                "title": None,
-                "rows": None,
-                "headers": None,
-                "columnTypes": None,
-                "status": 'Module [' + str(className) + '] loaded successful.'
-            }
+    for className, scriptClass in scriptClasses:
+        scriptModule[className] = scriptClass
+        globalEmbeddScriptScope[className] = scriptModule[className]
+        yield {
+            "type": "result",
+            "title": None,
+            "rows": None,
+            "headers": None,
+            "columnTypes": None,
+            "status": 'Module [' + str(className) + '] loaded successful.'
+        }
 
     # 导入script的函数
-    for scriptContext in scriptContents:
-        matchObj = re.match(r"^def(\s+)(.*?)(\s+)?[(|:]", scriptContext)
-        if matchObj:
-            funcName = str(matchObj.group(2)).strip()
-            # 动态导入Function
-            spec_function = importlib.util.spec_from_file_location(
-                name=funcName,
-                location=os.path.abspath(scriptFile)
-            )
-            module_function = importlib.util.module_from_spec(spec_function)
-            spec_function.loader.exec_module(module_function)
-            scriptFunc = getattr(module_function, funcName)
-            scriptFunction[funcName] = scriptFunc
-            globalEmbeddScriptScope[funcName] = scriptFunction[funcName]
-            yield {
-                "type": "result",
-                "title": None,
-                "rows": None,
-                "headers": None,
-                "columnTypes": None,
-                "status": 'Function [' + str(funcName) + '] loaded successful.'
-            }
+    for funcName, scriptFunc in scriptFunctions:
+        scriptFunction[funcName] = scriptFunc
+        globalEmbeddScriptScope[funcName] = scriptFunction[funcName]
+        yield {
+            "type": "result",
+            "title": None,
+            "rows": None,
+            "headers": None,
+            "columnTypes": None,
+            "status": 'Function [' + str(funcName) + '] loaded successful.'
+        }
     yield {
         "type": "result",
         "title": None,
@@ -1,20 +1,29 @@
 # -*- coding: utf-8 -*-
-import queue
 import time
+import heapq
+import queue
 import psutil
 import threading
-import sqlite3
 import copy
 import re
+import os
 import sys
+import csv
+import json
+import math
+import array
 from queue import Queue
+from ..xlogwriter import XLOG_INSERT_PERFLOG
 
 # 默认启动的监控线程数量
 defaultWorkerCount = 3
 
-# 默认的监控频度
+# 默认的监控频度（秒）
 defaultMonitorFreq = 30
 
+# 最小的监控频度（秒）
+minMonitorFreq = 0.01
+
 # 所有采集线程
 workerThreads = []
 
@@ -25,95 +34,390 @@ threadRunningFlag = False
 monitorTasks = {}
 monitorTaskQueue = Queue()
 
-# 所有的监控结果列表
-monitorResults = []
+# 任务的调度堆，元素为(下次采集时间, 任务ID)，时间为time.monotonic()的时间
+monitorScheduleHeap = []
+# 调度堆的条件变量，任务启动或者管理器停止的时候唤醒调度线程
+monitorScheduleCondition = threading.Condition()
+
+# 网络、磁盘计数器的上一次采样结果，用于计算两次采样之间的速度
+monitorCounters = {}
+monitorCountersLock = threading.Lock()
+
+# 每个监控对象在内存中最多保留的采样数量，写满后覆盖最早的采样
+defaultMonitorBufferSize = 86400
+
+# 网卡、磁盘、进程连续这么多个采集周期没有出现的时候，不再保留其采样
+monitorSeriesExpireIntervals = 10
+
+# 所有的监控结果，每个(任务ID, 监控项, 监控对象)对应一个MonitorSeries
+monitorSeries = {}
+monitorSeriesLock = threading.Lock()
 
 # 当前任务ID序号，总是自增1
 currentTaskId = 0
 
 
-# 任务调度分配, 扫描monitorTasks，把需要进行监控检查的项目放入到
+def getMonitorFreq(param: dict):
+    """
+        返回任务的采集间隔（秒），FREQ可以是秒数（允许小数），也可以是带ms后缀的毫秒数
+    """
+    if "FREQ" not in param.keys():
+        return defaultMonitorFreq
+    freq = str(param["FREQ"]).strip().lower()
+    if freq.endswith("ms"):
+        interVal = float(freq[:-2]) / 1000
+    elif freq.endswith("s"):
+        interVal = float(freq[:-1])
+    else:
+        interVal = float(freq)
+    return max(interVal, minMonitorFreq)
+
+
+def scheduleMonitorTask(taskId):
+    """
+        任务启动后，立即进行第一次采集
+    """
+    with monitorScheduleCondition:
+        heapq.heappush(monitorScheduleHeap, (time.monotonic(), taskId))
+        monitorScheduleCondition.notify()
+
+
+# 任务调度分配, 按照每个任务的下次采集时间，在到期的时候把任务放入到采集队列中
 class MonitorScheduler(threading.Thread):
     def __init__(self):
         threading.Thread.__init__(self)
 
-    def run(self):
-        global monitorTasks
-        global monitorTaskQueue
+    def dispatchTask(self, taskId, deadline):
+        monitorTask = monitorTasks.get(taskId)
+        if monitorTask is None or monitorTask["status"] != "RUNNING":
+            # 任务已经结束，不再调度
+            return
+        if "TAG" not in monitorTask["param"].keys():
+            # TAG是必须的参数，不可忽略
+            monitorTask.update(
+                {
+                    "status": "FAILED",
+                    "description": "Missed parameter TAG in task description.",
+                })
+            return
+        try:
+            interVal = getMonitorFreq(monitorTask["param"])
+        except ValueError:
+            monitorTask.update(
+                {
+                    "status": "FAILED",
+                    "description": "Invalid parameter FREQ [" + str(monitorTask["param"]["FREQ"]) + "].",
+                })
+            return
+        try:
+            bufferSize = int(monitorTask["param"].get("BUFFERSIZE", defaultMonitorBufferSize))
+            if bufferSize <= 0:
+                raise ValueError
+        except ValueError:
+            monitorTask.update(
+                {
+                    "status": "FAILED",
+                    "description": "Invalid parameter BUFFERSIZE [" + str(monitorTask["param"]["BUFFERSIZE"]) + "].",
+                })
+            return
+        monitorTaskQueue.put(
+            {
+                "param": copy.copy(monitorTask["param"]),
+                "taskId": taskId,
+                "taskName": monitorTask["taskName"],
+                "freq": interVal,
+                "bufferSize": bufferSize,
+            }
+        )
+        monitorTask.update({"last": time.time()})
+        if monitorTask["param"]["TAG"] in ["cpu_count", "cpu_count_physical"]:
+            # 一次性作业，没有必要重复多次检查
+            monitorTask.update(
+                {
+                    "status": "STOPPED"
+                }
+            )
+            return
+        # 按照固定的频率计算下次采集时间，如果已经错过，则从当前时间开始计算
+        nextDeadline = deadline + interVal
+        currentTime = time.monotonic()
+        if nextDeadline <= currentTime:
+            nextDeadline = currentTime + interVal
+        heapq.heappush(monitorScheduleHeap, (nextDeadline, taskId))
 
-        while True:
-            # 如果已经不需要继续运行，则直接退出
-            if not threadRunningFlag:
-                break
-            # 遍历所有列表，如果需要进行性能监控，则将监控任务放入到队列中
-            for taskId, monitorTask in monitorTasks.items():
-                if monitorTask["status"] in ["SUBMITTED", "STOPPED", "FAILED"]:
-                    # 任务已经结束或者尚未启动，不考虑
+    def run(self):
+        with monitorScheduleCondition:
+            while threadRunningFlag:
+                if len(monitorScheduleHeap) == 0:
+                    # 没有需要调度的任务，等待任务启动
+                    monitorScheduleCondition.wait()
                     continue
-                if "TAG" not in monitorTask["param"].keys():
-                    # TAG是必须的参数，不可忽略
-                    monitorTasks[taskId].update(
-                        {
-                            "status": "FAILED",
-                            "description": "Missed parameter TAG in task description.",
-                        })
+                deadline, taskId = monitorScheduleHeap[0]
+                waitTime = deadline - time.monotonic()
+                if waitTime > 0:
+                    # 等待到最近的一个任务到期，期间有新任务启动的时候会被提前唤醒
+                    monitorScheduleCondition.wait(timeout=waitTime)
                     continue
-                if monitorTask["last"] is not None:
-                    # 判断期限是否已经到达，需要进行下一次采集
-                    if "FREQ" not in monitorTask["param"].keys():
-                        interVal = defaultMonitorFreq
-                    else:
-                        interVal = int(monitorTask["param"]["FREQ"])
-                    if time.time() <= monitorTask["last"] + int(interVal):
-                        # 时间还不到，继续等待
-                        continue
-                monitorTaskQueue.put(
-                    {
-                        "param": copy.copy(monitorTask["param"]),
-                        "taskId": taskId,
-                        "taskName": monitorTask["taskName"],
-                    }
-                )
-                monitorTasks[taskId].update({"last": time.time()})
-                if monitorTask["param"]["TAG"] in ["cpu_count", "cpu_count_physical"]:
-                    # 一次性作业，没有必要重复多次检查
-                    monitorTasks[taskId].update(
-                        {
-                            "status": "STOPPED"
-                        }
-                    )
-            # 每次检查完成后都休息一会，避免CPU过于繁忙
-            time.sleep(3)
+                heapq.heappop(monitorScheduleHeap)
+                self.dispatchTask(taskId, deadline)
 
 
 # 调度线程
-schedulerThread = MonitorScheduler()
+schedulerThread = None
+
+
+def sampleIoCounters(counterKey, readCounters, freq):
+    """
+        读取网络、磁盘的计数器，返回(上一次的计数器, 本次的计数器, 两次之间的秒数)
+        速度根据和上一次采样的差值计算，采集线程不需要等待
+        第一次采集的时候没有上一次的结果，等待一个采集周期（最长1秒）后再读取一次
+    """
+    with monitorCountersLock:
+        lastSample = monitorCounters.get(counterKey)
+    if lastSample is None:
+        lastSample = (time.monotonic(), readCounters())
+        time.sleep(min(freq, 1))
+    currentSample = (time.monotonic(), readCounters())
+    with monitorCountersLock:
+        monitorCounters[counterKey] = currentSample
+    return lastSample[1], currentSample[1], max(currentSample[0] - lastSample[0], 1e-6)
+
+
+class MonitorSeries:
+    """
+        一个监控对象的采样结果
+        采样时间和每个数值字段分别保存在数组中（环形缓冲区），数组随采样逐步增长，达到bufferSize后覆盖最早的采样，
+        内存占用不随运行时间增长，也不会为只采集了少量数据的监控对象预先分配全部空间
+        数值字段保存采集到的原始数值；文本字段（如网卡名称、进程命令行）只保留最后一次采样的内容
+    """
+    def __init__(self, taskId, taskName: str, monitorItem: str, seriesName: str, fields: list, bufferSize: int):
+        self.taskId = taskId
+        self.taskName = taskName
+        self.monitorItem = monitorItem
+        self.seriesName = seriesName
+        self.fields = list(fields)
+        self.bufferSize = bufferSize
+        self.timestamps = array.array("d")
+        self.columns = {field: array.array("d") for field in self.fields}
+        self.labels = {}
+        self.nextPos = 0
+        self.count = 0
+        self.lastTime = None
+
+    def append(self, timestamp: float, values: dict, labels: dict):
+        # 第一次采样中没有出现的字段被忽略，缺失的字段记为NaN
+        if len(self.timestamps) < self.bufferSize:
+            # 缓冲区还没有写满，此时nextPos总是指向数组的末尾
+            self.timestamps.append(timestamp)
+            for field, column in self.columns.items():
+                column.append(values.get(field, math.nan))
+        else:
+            self.timestamps[self.nextPos] = timestamp
+            for field, column in self.columns.items():
+                column[self.nextPos] = values.get(field, math.nan)
+        self.labels = labels
+        self.lastTime = timestamp
+        self.nextPos = (self.nextPos + 1) % self.bufferSize
+        self.count = min(self.count + 1, self.bufferSize)
+
+    def getPositions(self, startTime=None):
+        # 按照时间顺序返回所有采样在数组中的位置，startTime不为None的时候，只返回之后的采样
+        firstPos = (self.nextPos - self.count) % self.bufferSize
+        positions = [(firstPos + nPos) % self.bufferSize for nPos in range(0, self.count)]
+        if startTime is not None:
+            positions = [nPos for nPos in positions if self.timestamps[nPos] >= startTime]
+        return positions
+
+    def getRows(self, startTime=None):
+        # 返回[(采样时间, {字段: 数值}), ...]
+        return [
+            (self.timestamps[nPos], {field: self.columns[field][nPos] for field in self.fields})
+            for nPos in self.getPositions(startTime)
+        ]
+
+    def getColumns(self, startTime=None):
+        # 返回按列组织的采样结果，{"timestamp": [...], 字段: [...]}
+        positions = self.getPositions(startTime)
+        columns = {"timestamp": [self.timestamps[nPos] for nPos in positions]}
+        for field in self.fields:
+            columns[field] = [self.columns[field][nPos] for nPos in positions]
+        return columns
+
+    def summary(self, startTime=None):
+        # 返回每个字段的统计信息，{字段: {count, min, max, avg, p50, p90, p99}}
+        positions = self.getPositions(startTime)
+        fieldSummary = {}
+        for field in self.fields:
+            values = sorted(
+                value for value in (self.columns[field][nPos] for nPos in positions) if not math.isnan(value))
+            if len(values) == 0:
+                continue
+            fieldSummary[field] = {
+                "count": len(values),
+                "min": values[0],
+                "max": values[-1],
+                "avg": sum(values) / len(values),
+                "p50": getPercentile(values, 50),
+                "p90": getPercentile(values, 90),
+                "p99": getPercentile(values, 99),
+            }
+        return fieldSummary
+
+
+def getPercentile(sortedValues: list, percent: float):
+    """
+        返回已排序数据的百分位数，两个数据之间按照线性插值计算
+    """
+    position = (len(sortedValues) - 1) * percent / 100
+    lowerPos = int(math.floor(position))
+    upperPos = min(lowerPos + 1, len(sortedValues) - 1)
+    return sortedValues[lowerPos] + (sortedValues[upperPos] - sortedValues[lowerPos]) * (position - lowerPos)
+
+
+def appendMonitorSample(taskId, taskName: str, monitorItem: str, monitorTime: float, monitorValue: dict,
+                        bufferSize: int = defaultMonitorBufferSize):
+    """
+        保存一次采样的结果，数值类型的内容保存到环形缓冲区中，其他内容作为监控对象的标签
+    """
+    values = {}
+    labels = {}
+    for key, value in monitorValue.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[key] = value
+        else:
+            labels[key] = value
+    # 网卡、磁盘、进程按照各自的名称区分监控对象
+    if "nicName" in labels:
+        seriesName = str(labels["nicName"])
+    elif "diskName" in labels:
+        seriesName = str(labels["diskName"])
+    elif "pid" in values:
+        seriesName = str(values["pid"])
+    else:
+        seriesName = monitorItem
+    seriesKey = (taskId, monitorItem, seriesName)
+    with monitorSeriesLock:
+        if seriesKey not in monitorSeries:
+            monitorSeries[seriesKey] = MonitorSeries(
+                taskId=taskId, taskName=taskName, monitorItem=monitorItem, seriesName=seriesName,
+                fields=values.keys(), bufferSize=bufferSize)
+        monitorSeries[seriesKey].append(monitorTime, values, labels)
+
+
+def expireMonitorSeries(taskId, expireTime: float):
+    """
+        删除任务中最后一次采样早于expireTime的监控对象（进程已经退出，网卡、磁盘已经移除等），返回删除的数量
+        对应的网络、磁盘计数器也一起删除
+    """
+    with monitorSeriesLock:
+        expiredKeys = [
+            seriesKey for seriesKey, series in monitorSeries.items()
+            if series.taskId == taskId and series.lastTime < expireTime
+        ]
+        for seriesKey in expiredKeys:
+            del monitorSeries[seriesKey]
+    with monitorCountersLock:
+        for _, _, seriesName in expiredKeys:
+            monitorCounters.pop((taskId, seriesName), None)
+    return len(expiredKeys)
+
+
+def releaseMonitorTask(taskId):
+    """
+        任务停止后，删除任务的网络、磁盘计数器，以及已经过期的监控对象
+        仍然有效的采样继续保留，停止后依然可以通过REPORT/SUMMARY/EXPORT查看
+    """
+    monitorTask = monitorTasks.get(taskId)
+    if monitorTask is not None and monitorTask["param"].get("TAG") in ["network", "disk", "process"]:
+        try:
+            interVal = getMonitorFreq(monitorTask["param"])
+        except ValueError:
+            interVal = defaultMonitorFreq
+        expireMonitorSeries(taskId, time.time() - interVal * monitorSeriesExpireIntervals)
+    with monitorCountersLock:
+        for counterKey in [counterKey for counterKey in monitorCounters.keys() if counterKey[0] == taskId]:
+            del monitorCounters[counterKey]
 
 
-def bytes2human(n):
-    symbols = ('K', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y')
-    prefix = {}
-    for i, s in enumerate(symbols):
-        prefix[s] = 1 << (i + 1) * 10
-    for s in reversed(symbols):
-        if n >= prefix[s]:
-            value = float(n) / prefix[s]
-            return '%.1f%s' % (value, s)
-    return "%sB" % n
+def getMonitorSeries(taskName: str):
+    """
+        返回任务对应的所有监控对象，taskName为ALL的时候返回全部
+    """
+    with monitorSeriesLock:
+        seriesList = list(monitorSeries.values())
+    if str(taskName).upper() != "ALL":
+        seriesList = [series for series in seriesList if series.taskName == taskName]
+    return seriesList
+
+
+def getMonitorSummary(taskName: str, window=None):
+    """
+        返回监控结果的统计信息，window为统计最近多少秒内的采样，None表示统计所有的采样
+        返回[(taskName, item, name, field, count, min, max, avg, p50, p90, p99), ...]
+    """
+    startTime = None
+    if window is not None:
+        startTime = time.time() - float(window)
+    rows = []
+    for series in getMonitorSeries(taskName):
+        with monitorSeriesLock:
+            fieldSummary = series.summary(startTime)
+        for field, statis in fieldSummary.items():
+            rows.append(
+                (series.taskName, series.monitorItem, series.seriesName, field, statis["count"],
+                 statis["min"], statis["max"], statis["avg"], statis["p50"], statis["p90"], statis["p99"])
+            )
+    return rows
+
+
+def exportMonitorSeries(taskName: str, exportDir: str, exportFormat: str = "CSV"):
+    """
+        导出监控结果，每个监控对象导出为一个文件：<taskName>_<item>_<name>.csv|.json
+        CSV文件每行一个采样，第一列为采样时间(unix时间戳)，之后每列为一个字段
+        JSON文件按列保存，{"timestamp": [...], 字段: [...]}，同时包含监控对象的标签
+        返回[(文件名, 采样数量), ...]
+    """
+    exportFormat = exportFormat.upper()
+    if exportFormat not in ["CSV", "JSON"]:
+        raise ValueError("Invalid export format [" + exportFormat + "].")
+    os.makedirs(exportDir, exist_ok=True)
+    exportFiles = []
+    for series in getMonitorSeries(taskName):
+        with monitorSeriesLock:
+            columns = series.getColumns()
+            labels = dict(series.labels)
+        fileName = re.sub(r"[^\w.-]", "_", "_".join([series.taskName, series.monitorItem, series.seriesName]))
+        fileName = os.path.join(exportDir, fileName + "." + exportFormat.lower())
+        if exportFormat == "CSV":
+            with open(fileName, mode="w", encoding="utf-8", newline="") as fp:
+                csvWriter = csv.writer(fp)
+                csvWriter.writerow(list(columns.keys()))
+                csvWriter.writerows(zip(*columns.values()))
+        else:
+            for field, values in columns.items():
+                columns[field] = [None if math.isnan(value) else value for value in values]
+            with open(fileName, mode="w", encoding="utf-8") as fp:
+                json.dump(
+                    {
+                        "taskName": series.taskName,
+                        "item": series.monitorItem,
+                        "name": series.seriesName,
+                        "labels": labels,
+                        "columns": columns,
+                    }, fp, ensure_ascii=False, default=str)
+        exportFiles.append((fileName, len(columns["timestamp"])))
+    return exportFiles
 
 
 # 监控数据采集器
 class MonitorWorker(threading.Thread):
-    def __init__(self, threadID, xlogFile):
+    def __init__(self, threadID, xlogWriter):
         threading.Thread.__init__(self)
         self.threadID = threadID
         self.runningTasks = []
-        self.xlogFileHandle = None
-        if xlogFile is not None:
-            self.xlogFileHandle = sqlite3.connect(
-                database=xlogFile,
-                check_same_thread=False,
-            )
+        # 所有采集线程共用一个xlog的异步写入线程
+        self.xlogWriter = xlogWriter
+        self.bufferSize = defaultMonitorBufferSize
 
     def appendTestResult(
             self,
@@ -123,55 +427,49 @@ class MonitorWorker(threading.Thread):
             monitorItem,
             monitorValue
     ):
-        if self.xlogFileHandle is not None:
-            cursor = self.xlogFileHandle.cursor()
-            data = (
-                monitorTime,
-                taskId,
-                taskName,
-                monitorItem,
-                str(monitorValue)
-            )
-            cursor.execute(
-                "Insert Into TestCli_PerfLog(MonitorTime,TaskId,TaskName,MonitorItem,MonitorValue) "
-                "Values(?,?,?,?,?)",
-                data
+        # 采集结果可能是一个字典，也可能是只包含一个字典的列表
+        if isinstance(monitorValue, list):
+            monitorValues = monitorValue
+        else:
+            monitorValues = [monitorValue]
+        if self.xlogWriter is not None:
+            for value in monitorValues:
+                data = (
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(monitorTime)),
+                    taskId,
+                    taskName,
+                    monitorItem,
+                    json.dumps(value, ensure_ascii=False, default=str)
+                )
+                self.xlogWriter.append(XLOG_INSERT_PERFLOG, data)
+        for value in monitorValues:
+            appendMonitorSample(
+                taskId=taskId,
+                taskName=taskName,
+                monitorItem=monitorItem,
+                monitorTime=monitorTime,
+                monitorValue=value,
+                bufferSize=self.bufferSize,
             )
-            cursor.close()
-            self.xlogFileHandle.commit()
-        monitorResults.append(
-            {
-                "monitorTime": monitorTime,
-                "taskId": taskId,
-                "taskName": taskName,
-                "item": monitorItem,
-                "value": monitorValue
-            }
-        )
 
     def run(self):
-        global monitorResults
         global monitorTaskQueue
         global monitorTasks
 
         while True:
-            # 如果已经不需要继续运行，则直接退出
-            if not threadRunningFlag:
+            # 等待采集任务，收到None的时候退出
+            task = monitorTaskQueue.get()
+            if task is None:
                 break
 
-            try:
-                task = monitorTaskQueue.get_nowait()
-            except queue.Empty:
-                # 队列中不存在内容，直接跳过
-                time.sleep(3)
-                continue
-
             param = dict(task["param"])
+            self.bufferSize = task["bufferSize"]
             taskId = task["taskId"]
             taskName = task["taskName"]
+            sampleStartTime = time.time()
             if param["TAG"] == "cpu_count":
                 self.appendTestResult(
-                    monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                    monitorTime=time.time(),
                     taskId=taskId,
                     taskName=taskName,
                     monitorItem="cpu_count",
@@ -180,7 +478,7 @@ class MonitorWorker(threading.Thread):
                 continue
             elif param["TAG"] == "cpu_count_physical":
                 self.appendTestResult(
-                    monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                    monitorTime=time.time(),
                     taskId=taskId,
                     taskName=taskName,
                     monitorItem="cpu_count_physical",
@@ -217,7 +515,7 @@ class MonitorWorker(threading.Thread):
                         "steal": cpu_times.steal
                     }
                 self.appendTestResult(
-                    monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                    monitorTime=time.time(),
                     taskId=taskId,
                     taskName=taskName,
                     monitorItem="cpu_time",
@@ -230,7 +528,7 @@ class MonitorWorker(threading.Thread):
                     "ratio": cpu_percent,
                 }
                 self.appendTestResult(
-                    monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                    monitorTime=time.time(),
                     taskId=taskId,
                     taskName=taskName,
                     monitorItem="cpu_percent",
@@ -240,13 +538,13 @@ class MonitorWorker(threading.Thread):
             elif param["TAG"] == "memory":
                 memoryStatis = psutil.virtual_memory()
                 monitorValues = [{
-                    "available": bytes2human(memoryStatis.available),
-                    "free": bytes2human(memoryStatis.free),
-                    "total": bytes2human(memoryStatis.total),
+                    "available": memoryStatis.available,
+                    "free": memoryStatis.free,
+                    "total": memoryStatis.total,
                     "percent": memoryStatis.percent,
                 }]
                 self.appendTestResult(
-                    monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                    monitorTime=time.time(),
                     taskId=taskId,
                     taskName=taskName,
                     monitorItem="memory",
@@ -262,47 +560,48 @@ class MonitorWorker(threading.Thread):
                     networkStatis = dict(psutil.net_io_counters(pernic=True))
                     for nicName in networkStatis.keys():
                         if re.match(pattern=nicFilter, string=nicName, flags=re.IGNORECASE):
-                            networkStatis1 = networkStatis[nicName]
-                            time.sleep(1)
-                            networkStatis = psutil.net_io_counters(pernic=True)
-                            networkStatis2 = networkStatis[nicName]
+                            networkStatis1, networkStatis2, elapsed = sampleIoCounters(
+                                counterKey=(taskId, nicName),
+                                readCounters=lambda: psutil.net_io_counters(pernic=True)[nicName],
+                                freq=task["freq"])
                             monitorValues = [
                                 {
                                     "nicName": nicName,
-                                    "bytes_sent": bytes2human(networkStatis2.bytes_sent),
-                                    "bytes_recv": bytes2human(networkStatis2.bytes_recv),
-                                    "errin": bytes2human(networkStatis2.errin),
-                                    "errout": bytes2human(networkStatis2.errout),
-                                    "dropin": bytes2human(networkStatis2.dropin),
-                                    "dropout": bytes2human(networkStatis2.dropout),
-                                    "netin": bytes2human(networkStatis2.bytes_recv - networkStatis1.bytes_recv),
-                                    "netout": bytes2human(networkStatis2.bytes_sent - networkStatis1.bytes_sent),
+                                    "bytes_sent": networkStatis2.bytes_sent,
+                                    "bytes_recv": networkStatis2.bytes_recv,
+                                    "errin": networkStatis2.errin,
+                                    "errout": networkStatis2.errout,
+                                    "dropin": networkStatis2.dropin,
+                                    "dropout": networkStatis2.dropout,
+                                    "netin": (networkStatis2.bytes_recv - networkStatis1.bytes_recv) / elapsed,
+                                    "netout": (networkStatis2.bytes_sent - networkStatis1.bytes_sent) / elapsed,
                                 }
                             ]
                             self.appendTestResult(
-                                monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                                monitorTime=time.time(),
                                 taskId=taskId,
                                 taskName=taskName,
                                 monitorItem="network",
                                 monitorValue=monitorValues
                             )
                 else:
-                    networkStatis1 = psutil.net_io_counters()
-                    time.sleep(1)
-                    networkStatis2 = psutil.net_io_counters()
+                    networkStatis1, networkStatis2, elapsed = sampleIoCounters(
+                        counterKey=(taskId, "GLOBAL"),
+                        readCounters=psutil.net_io_counters,
+                        freq=task["freq"])
                     monitorValues = [{
                         "nicName": "GLOBAL",
-                        "bytes_sent": bytes2human(networkStatis2.bytes_sent),
-                        "bytes_recv": bytes2human(networkStatis2.bytes_recv),
-                        "errin": bytes2human(networkStatis2.errin),
-                        "errout": bytes2human(networkStatis2.errout),
-                        "dropin": bytes2human(networkStatis2.dropin),
-                        "dropout": bytes2human(networkStatis2.dropout),
-                        "netin": bytes2human(networkStatis2.bytes_recv - networkStatis1.bytes_recv),
-                        "netout": bytes2human(networkStatis2.bytes_sent - networkStatis1.bytes_sent),
+                        "bytes_sent": networkStatis2.bytes_sent,
+                        "bytes_recv": networkStatis2.bytes_recv,
+                        "errin": networkStatis2.errin,
+                        "errout": networkStatis2.errout,
+                        "dropin": networkStatis2.dropin,
+                        "dropout": networkStatis2.dropout,
+                        "netin": (networkStatis2.bytes_recv - networkStatis1.bytes_recv) / elapsed,
+                        "netout": (networkStatis2.bytes_sent - networkStatis1.bytes_sent) / elapsed,
                     }]
                     self.appendTestResult(
-                        monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                        monitorTime=time.time(),
                         taskId=taskId,
                         taskName=taskName,
                         monitorItem="network",
@@ -318,44 +617,46 @@ class MonitorWorker(threading.Thread):
                     diskStatis = dict(psutil.disk_io_counters(perdisk=True))
                     for diskName in diskStatis.keys():
                         if re.match(pattern=diskFilter, string=diskName, flags=re.IGNORECASE):
-                            diskStatis1 = diskStatis[diskName]
-                            time.sleep(1)
-                            diskStatis2 = psutil.disk_io_counters(perdisk=True)[diskName]
+                            diskStatis1, diskStatis2, elapsed = sampleIoCounters(
+                                counterKey=(taskId, diskName),
+                                readCounters=lambda: psutil.disk_io_counters(perdisk=True)[diskName],
+                                freq=task["freq"])
                             monitorValues = [{
                                 "diskName": diskName,
                                 "read_count": diskStatis2.read_count,
                                 "write_count": diskStatis2.write_count,
-                                "read_bytes": bytes2human(diskStatis2.read_bytes),
-                                "write_bytes": bytes2human(diskStatis2.write_bytes),
-                                "read_time": str(diskStatis2.read_time) + "ms",
-                                "write_time": str(diskStatis2.write_time) + "ms",
-                                "read_speed": bytes2human(diskStatis2.read_bytes - diskStatis1.read_bytes) + "/s",
-                                "write_speed": bytes2human(diskStatis2.write_bytes - diskStatis1.write_bytes) + "/s",
+                                "read_bytes": diskStatis2.read_bytes,
+                                "write_bytes": diskStatis2.write_bytes,
+                                "read_time": diskStatis2.read_time,
+                                "write_time": diskStatis2.write_time,
+                                "read_speed": (diskStatis2.read_bytes - diskStatis1.read_bytes) / elapsed,
+                                "write_speed": (diskStatis2.write_bytes - diskStatis1.write_bytes) / elapsed,
                             }]
                             self.appendTestResult(
-                                monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                                monitorTime=time.time(),
                                 taskId=taskId,
                                 taskName=taskName,
                                 monitorItem="disk",
                                 monitorValue=monitorValues
                             )
                 else:
-                    diskStatis1 = psutil.disk_io_counters()
-                    time.sleep(1)
-                    diskStatis2 = psutil.disk_io_counters()
+                    diskStatis1, diskStatis2, elapsed = sampleIoCounters(
+                        counterKey=(taskId, "GLOBAL"),
+                        readCounters=psutil.disk_io_counters,
+                        freq=task["freq"])
                     monitorValues = [{
                         "diskName": "GLOBAL",
                         "read_count": diskStatis2.read_count,
                         "write_count": diskStatis2.write_count,
-                        "read_bytes": bytes2human(diskStatis2.read_bytes),
-                        "write_bytes": bytes2human(diskStatis2.write_bytes),
-                        "read_time": str(diskStatis2.read_time) + "ms",
-                        "write_time": str(diskStatis2.write_time) + "ms",
-                        "read_speed": bytes2human(diskStatis2.read_bytes - diskStatis1.read_bytes) + "/s",
-                        "write_speed": bytes2human(diskStatis2.write_bytes - diskStatis1.write_bytes) + "/s",
+                        "read_bytes": diskStatis2.read_bytes,
+                        "write_bytes": diskStatis2.write_bytes,
+                        "read_time": diskStatis2.read_time,
+                        "write_time": diskStatis2.write_time,
+                        "read_speed": (diskStatis2.read_bytes - diskStatis1.read_bytes) / elapsed,
+                        "write_speed": (diskStatis2.write_bytes - diskStatis1.write_bytes) / elapsed,
                     }]
                     self.appendTestResult(
-                        monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                        monitorTime=time.time(),
                         taskId=taskId,
                         taskName=taskName,
                         monitorItem="disk",
@@ -453,12 +754,12 @@ class MonitorWorker(threading.Thread):
                             "cpu_percent": proc.cpu_percent(),
                             "cpu_times_user": proc.cpu_times().user,
                             "cpu_times_sys": proc.cpu_times().system,
-                            "mem_rss": bytes2human(proc.memory_info().rss),
-                            "mem_vms": bytes2human(proc.memory_info().vms),
+                            "mem_rss": proc.memory_info().rss,
+                            "mem_vms": proc.memory_info().vms,
                             "mem_percent": proc.memory_percent(),
                         }]
                         self.appendTestResult(
-                            monitorTime=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())),
+                            monitorTime=time.time(),
                             taskId=taskId,
                             taskName=taskName,
                             monitorItem="process",
@@ -486,6 +787,11 @@ class MonitorWorker(threading.Thread):
                     taskLock.release()
                 continue
 
+            # 网卡、磁盘、进程按照名称区分监控对象，本次采集中出现的对象都已经更新了采样时间
+            # 连续多个采集周期没有出现的对象（进程已经退出等）不再保留，避免监控对象的数量不断增长
+            if param["TAG"] in ["network", "disk", "process"]:
+                expireMonitorSeries(taskId, sampleStartTime - task["freq"] * monitorSeriesExpireIntervals)
+
     def addTask(self, task):
         self.runningTasks.append(task)
 
@@ -496,17 +802,28 @@ def stopMonitorManager():
     global workerThreads
     global monitorTaskQueue
 
-    # 退出所有工作线程
-    threadRunningFlag = False
+    # 退出调度线程
+    with monitorScheduleCondition:
+        threadRunningFlag = False
+        monitorScheduleCondition.notify_all()
+    if schedulerThread is not None and schedulerThread.is_alive():
+        schedulerThread.join(timeout=5)
+    schedulerThread = None
+
+    # 清空任务队列，并通知所有采集线程退出
+    try:
+        while True:
+            monitorTaskQueue.get_nowait()
+    except queue.Empty:
+        pass
+    for worker in workerThreads:
+        monitorTaskQueue.put(None)
     for worker in workerThreads:
         if worker.is_alive():
             worker.join(timeout=5)
-    # 退出采集线程
-    if schedulerThread.is_alive():
-        schedulerThread.join(timeout=5)
-
-    # 清空任务队列
-    monitorTaskQueue.empty()
+    workerThreads = []
+    with monitorCountersLock:
+        monitorCounters.clear()
 
 
 def executeMonitorRequest(cls, requestObject):
@@ -523,8 +840,10 @@ def executeMonitorRequest(cls, requestObject):
         # 标记线程运行
         threadRunningFlag = True
 
-        # 启动调度进程
-        schedulerThread.start()
+        # 启动调度进程，已经启动的时候不重复启动
+        if schedulerThread is None or not schedulerThread.is_alive():
+            schedulerThread = MonitorScheduler()
+            schedulerThread.start()
 
         # 启动采集进程
         if requestObject["workerThreads"] is None:
@@ -532,7 +851,7 @@ def executeMonitorRequest(cls, requestObject):
         else:
             workerCount = int(requestObject["workerThreads"])
         for nPos in range(0, workerCount):
-            worker = MonitorWorker(nPos, cls.xlogFileFullPath)
+            worker = MonitorWorker(nPos, cls.xlogWriter)
             worker.start()
             workerThreads.append(worker)
         yield {
@@ -597,6 +916,7 @@ def executeMonitorRequest(cls, requestObject):
             for taskId, monitorTask in monitorTasks.items():
                 if monitorTask["status"] == "SUBMITTED":
                     monitorTasks[taskId]["status"] = "RUNNING"
+                    scheduleMonitorTask(taskId)
                     startedTasks = startedTasks + 1
             yield {
                 "type": "result",
@@ -615,6 +935,7 @@ def executeMonitorRequest(cls, requestObject):
                     continue
                 if monitorTask["status"] == "SUBMITTED":
                     monitorTasks[taskId]["status"] = "RUNNING"
+                    scheduleMonitorTask(taskId)
                     startedTasks = startedTasks + 1
             yield {
                 "type": "result",
@@ -631,6 +952,7 @@ def executeMonitorRequest(cls, requestObject):
             for taskId, monitorTask in monitorTasks.items():
                 if monitorTask["status"] in ["RUNNING", "SUBMITTED"]:
                     monitorTasks[taskId]["status"] = "STOPPED"
+                    releaseMonitorTask(taskId)
                     stoppedTasks = stoppedTasks + 1
             yield {
                 "type": "result",
@@ -649,6 +971,7 @@ def executeMonitorRequest(cls, requestObject):
                     continue
                 if monitorTask["status"] in ["RUNNING", "SUBMITTED"]:
                     monitorTasks[taskId]["status"] = "STOPPED"
+                    releaseMonitorTask(taskId)
                     stoppedTasks = stoppedTasks + 1
             yield {
                 "type": "result",
@@ -686,42 +1009,75 @@ def executeMonitorRequest(cls, requestObject):
             "status": status
         }
     if requestObject["action"] == "reportTask":
-        if str(requestObject["taskName"]).upper() == "ALL":
-            headers = ["timeStamp", "item", "value"]
-            rows = []
-            for monitorResult in monitorResults:
-                row = (
-                    monitorResult["monitorTime"],
-                    monitorResult["item"],
-                    monitorResult["value"],
-                )
-                rows.append(row)
+        headers = ["timeStamp", "item", "value"]
+        sampleRows = []
+        for series in getMonitorSeries(str(requestObject["taskName"])):
+            with monitorSeriesLock:
+                seriesRows = series.getRows()
+                labels = dict(series.labels)
+            for timestamp, values in seriesRows:
+                value = dict(labels)
+                for field, fieldValue in values.items():
+                    # 数组中统一保存为浮点数，整数的内容还原为整数显示
+                    if not math.isnan(fieldValue) and fieldValue.is_integer():
+                        fieldValue = int(fieldValue)
+                    value[field] = fieldValue
+                sampleRows.append((timestamp, series.monitorItem, value))
+        sampleRows.sort(key=lambda sampleRow: sampleRow[0])
+        rows = [
+            (time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)), monitorItem, value)
+            for timestamp, monitorItem, value in sampleRows
+        ]
+        yield {
+            "type": "result",
+            "title": None,
+            "rows": rows,
+            "headers": headers,
+            "columnTypes": None,
+            "status": "Total [" + str(len(rows)) + "] rows are collected."
+        }
+    if requestObject["action"] == "summaryTask":
+        try:
+            window = requestObject["param"].get("WINDOW")
+            rows = getMonitorSummary(str(requestObject["taskName"]), window=window)
+        except ValueError:
             yield {
-                "type": "result",
-                "title": None,
-                "rows": rows,
-                "headers": headers,
-                "columnTypes": None,
-                "status": "Total [" + str(len(rows)) + "] rows are collected."
+                "type": "error",
+                "message": "Invalid parameter WINDOW [" + str(requestObject["param"].get("WINDOW")) + "].",
             }
-        else:
-            taskName = str(requestObject["taskName"])
-            headers = ["timeStamp", "item", "value"]
-            rows = []
-            for monitorResult in monitorResults:
-                if monitorResult["taskName"] != taskName:
-                    continue
-                row = (
-                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(monitorResult["monitorTime"])),
-                    monitorResult["item"],
-                    monitorResult["value"],
-                )
-                rows.append(row)
+            return
+        yield {
+            "type": "result",
+            "title": None,
+            "rows": rows,
+            "headers": ["taskName", "item", "name", "field", "count", "min", "max", "avg", "p50", "p90", "p99"],
+            "columnTypes": None,
+            "status": "Total [" + str(len(rows)) + "] rows selected."
+        }
+    if requestObject["action"] == "exportTask":
+        if "DIR" not in requestObject["param"].keys():
             yield {
-                "type": "result",
-                "title": None,
-                "rows": rows,
-                "headers": headers,
-                "columnTypes": None,
-                "status": "Total [" + str(len(rows)) + "] rows are collected."
+                "type": "error",
+                "message": "Missed parameter DIR in export command.",
+            }
+            return
+        try:
+            exportFiles = exportMonitorSeries(
+                str(requestObject["taskName"]),
+                exportDir=requestObject["param"]["DIR"],
+                exportFormat=requestObject["param"].get("FORMAT", "CSV"),
+            )
+        except (ValueError, OSError) as ex:
+            yield {
+                "type": "error",
+                "message": "Export monitor result failed. " + str(ex),
             }
+            return
+        yield {
+            "type": "result",
+            "title": None,
+            "rows": exportFiles,
+            "headers": ["fileName", "rows"],
+            "columnTypes": None,
+            "status": "Total [" + str(len(exportFiles)) + "] files exported."
+        }
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 import os
 from ..commands.compare import compareDefaultOption
+from ..commands.assertExpression import compiledCodeCache
+from ..globalvar import globalParserOption
+from ..sqlparse import SQLWarmUp
+from ..apiparse import APIWarmUp
 from ..testcliexception import TestCliException
 
 
@@ -31,6 +35,10 @@ def setOptions(cls, options):
         }
         return
 
+    # COMPARE_DIFFLIB_THRESHOLD是以前版本的名称，现在只作为COMPARE_LINEAR_THRESHOLD的别名保留
+    if optionName.upper() == "COMPARE_DIFFLIB_THRESHOLD":
+        optionName = "COMPARE_LINEAR_THRESHOLD"
+
     if optionName.upper() == "JOBMANAGER":
         # JOBMANAGER无法通过SET命令来设置
         yield {
@@ -54,9 +62,40 @@ def setOptions(cls, options):
         }
         return
 
+    # 查看或者清空表达式的编译缓存
+    if optionName.upper() == "EXPRESSION_CACHE":
+        if str(optionValue).strip().upper() == "STATS":
+            cacheStats = compiledCodeCache.getStats()
+            yield {
+                "type": "result",
+                "title": "Expression Cache: ",
+                "rows": [[cacheStats["size"], cacheStats["maxSize"], cacheStats["hits"], cacheStats["misses"]]],
+                "headers": ["Size", "MaxSize", "Hits", "Misses"],
+                "columnTypes": None,
+                "status": None
+            }
+        elif str(optionValue).strip().upper() == "CLEAR":
+            compiledCodeCache.clear()
+            yield {
+                "type": "result",
+                "title": None,
+                "rows": None,
+                "headers": None,
+                "columnTypes": None,
+                "status": "Expression cache cleared."
+            }
+        else:
+            yield {
+                "type": "error",
+                "message": "Available option are ['STATS', 'CLEAR']."
+            }
+        return
+
     # 以下参数只能为ON或者OFF
     if optionName.upper() in ["DEBUG", "TIMING", "TIME", "ECHO", "PAGE", "TERMOUT", "FEEDBACK",
-                              "OUTPUT_SORT_ARRAY", "OUTPUT_CSV_HEADER", "SILENT"]:
+                              "OUTPUT_SORT_ARRAY", "OUTPUT_CSV_HEADER", "SILENT", "SCRIPT_PARSECACHE",
+                              "PARSER_POOL", "PARSER_WARMUP", "API_KEEPALIVE",
+                              "DATA_PARALLEL_MERGE"]:
         if optionValue.upper() not in ['ON', 'OFF']:
             yield {
                 "type": "error",
@@ -65,7 +104,9 @@ def setOptions(cls, options):
             return
 
     # 以下参数只能为整形
-    if optionName.upper() in ["SQL_FETCHSIZE", "LOB_LENGTH", "SQLCONN_RETRYTIMES"]:
+    if optionName.upper() in ["SQL_FETCHSIZE", "LOB_LENGTH", "SQLCONN_RETRYTIMES", "API_POOLSIZE",
+                              "DATA_PARALLEL", "SORT_SPILLROWS", "EXPRESSION_CACHESIZE",
+                              "COMPARE_LINEAR_THRESHOLD"]:
         try:
             optionValue = int(str(optionValue))
             if optionValue <= 0:
@@ -96,6 +137,20 @@ def setOptions(cls, options):
             }
             return
 
+    # 表达式编译缓存的大小
+    if optionName.upper() == "EXPRESSION_CACHESIZE":
+        compiledCodeCache.resize(optionValue)
+
+    # 结果集的读取方式
+    if optionName.upper() == "SQL_FETCHMODE":
+        optionValue = str(optionValue).strip().upper()
+        if optionValue not in ["BULK", "ROW"]:
+            yield {
+                "type": "error",
+                "message": "Available option are ['BULK', 'ROW']."
+            }
+            return
+
     # 处理Compare算法选项
     if optionName.upper() == "COMPARE_DEFAULT_METHOD":
         # 设置Compare的默认算法
@@ -108,6 +163,19 @@ def setOptions(cls, options):
             return
         compareDefaultOption["algorithm"] = str(optionValue)
 
+    # 是否复用解析器对象
+    if optionName.upper() == "PARSER_POOL":
+        optionValue = optionValue.upper()
+        globalParserOption["pool"] = (optionValue == "ON")
+
+    # 预热解析器，随后启动的后台JOB进程也会在启动时预热
+    if optionName.upper() == "PARSER_WARMUP":
+        optionValue = optionValue.upper()
+        if optionValue == "ON":
+            SQLWarmUp()
+            APIWarmUp()
+        cls.JobHandler.setProcessContextInfo("parserWarmUp", optionValue)
+
     # 处理DEBUG选项
     if optionName.upper() == "DEBUG":
         if optionValue.upper() == 'ON':
@@ -10,10 +10,188 @@ from ..sqlclijdbc import SQLCliJDBCException
 from ..sqlclijdbc import SQLCliJDBCLargeObject
 
 
-def getcommandResult(cls, rowcount):
+def _platformDateFormat(columnFormat):
+    # Windows和Mac平台上不支持%04Y的写法
+    if platform.system().lower() in ['windows', 'darwin']:
+        return columnFormat.replace("%04Y", "%Y")
+    else:
+        return columnFormat.replace("%Y", "%04Y")
+
+
+def compileColumnFormatter(testOptions, columnType=None):
+    """
+        根据字段类型和当前的运行选项生成该字段的格式化函数
+        选项的读取和平台的判断只在这里做一次，返回的函数在处理每个单元格的时候只需要根据数据类型查表
+    """
+    floatFormat = testOptions.get("FLOAT_FORMAT")
+    decimalFormat = testOptions.get("DECIMAL_FORMAT")
+    dateFormat = _platformDateFormat(testOptions.get("DATE_FORMAT"))
+    if columnType in ["TIMESTAMP_WITH_TIMEZONE",
+                      "TIME_WITH_TIMEZONE",
+                      "TIMESTAMP_WITH_LOCAL_TIME_ZONE"]:
+        datetimeFormat = _platformDateFormat(testOptions.get("DATETIME-TZ_FORMAT"))
+    else:
+        datetimeFormat = _platformDateFormat(testOptions.get("DATETIME_FORMAT"))
+    timeFormat = testOptions.get("TIME_FORMAT")
+    lobLength = int(testOptions.get("LOB_LENGTH"))
+
+    def format_asis(p_column):
+        return p_column
+
+    def format_float(p_column):
+        return floatFormat % p_column
+
+    def format_decimal(p_column):
+        return decimalFormat % p_column
+
+    def format_date(p_column):
+        return p_column.strftime(dateFormat)
+
+    def format_datetime(p_column):
+        return p_column.strftime(datetimeFormat)
+
+    def format_time(p_column):
+        return p_column.strftime(timeFormat)
+
+    def format_blob(p_column):
+        bColumnFullOutput = True
+        if len(p_column) > lobLength:
+            bColumnFullOutput = False
+            p_column = p_column[:lobLength]
+        # 转换为16进制，并反算成ASCII
+        p_column = binascii.b2a_hex(p_column).decode()
+        if not bColumnFullOutput:
+            # 用...的方式提醒输出没有结束，只是由于格式控制导致不显示
+            return "0x" + p_column + "..."
+        else:
+            return "0x" + p_column
+
+    def format_binary(p_column):
+        # 转换为16进制，并反算成ASCII
+        return "0x" + binascii.b2a_hex(p_column).decode()
+
+    def format_largeobject(p_column):
+        trimedLength = lobLength
+        if trimedLength < 4:
+            trimedLength = 4
+        if trimedLength > p_column.getObjectLength():
+            if p_column.getColumnTypeName().upper().find("CLOB") != -1:
+                dataValue = p_column.getData(1, p_column.getObjectLength())
+                return dataValue
+            elif p_column.getColumnTypeName().upper().find("BLOB") != -1:
+                dataValue = p_column.getData(1, p_column.getObjectLength())
+                if dataValue is not None:
+                    dataValue = binascii.b2a_hex(dataValue)
+                    dataValue = dataValue.decode()
+                    return "0x" + dataValue
+                else:
+                    return None
+        else:
+            if p_column.getColumnTypeName().upper().find("CLOB") != -1:
+                dataValue = "Len:" + str(p_column.getObjectLength()) + ";" + \
+                            "Content:[" + \
+                            p_column.getData(1, trimedLength - 3) + "..." + \
+                            p_column.getData(p_column.getObjectLength() - 2, 3) + \
+                            "]"
+                return dataValue
+            elif p_column.getColumnTypeName().upper().find("BLOB") != -1:
+                dataValue = "Len:" + str(p_column.getObjectLength()) + ";" + \
+                            "Content:0x[" + \
+                            binascii.b2a_hex(p_column.getData(1, trimedLength - 3)).decode() + "..." + \
+                            binascii.b2a_hex(p_column.getData(p_column.getObjectLength() - 2, 3)).decode() + \
+                            "]"
+                return dataValue
+
+    formatters = {
+        float: format_float,
+        bool: format_asis,
+        str: format_asis,
+        int: format_asis,
+        list: format_asis,
+        datetime.date: format_date,
+        datetime.datetime: format_datetime,
+        datetime.time: format_time,
+        bytearray: format_blob if columnType == "BLOB" else format_binary,
+        decimal.Decimal: format_decimal if decimalFormat != "" else format_asis,
+        SQLCliJDBCLargeObject: format_largeobject,
+        type(None): format_asis,
+    }
+
+    def format_column(p_column):
+        try:
+            formatter = formatters[type(p_column)]
+        except KeyError:
+            # 其他类型直接返回
+            raise SQLCliJDBCException("TestCli-0000: Unknown column type [" +
+                                      str(columnType) + ":" + str(type(p_column)) +
+                                      "] in format_column")
+        return formatter(p_column)
+
+    return format_column
+
+
+def _compileCollectionFormatter(testOptions, prefix, suffix, sortElements):
+    # STRUCT和ARRAY类型的格式化，其中的元素按照元素自身的数据类型来格式化
+    format_element = compileColumnFormatter(testOptions)
+
+    def format_collection(p_column):
+        if p_column is None:
+            return None
+        if sortElements:
+            # 保证Array的输出每次都一样顺序
+            # 需要注意可能有NULL值导致字符数组无法排序的情况, column是一个一维数组
+            p_column.sort(key=lambda x: (x is None, x))
+        elements = []
+        for element in p_column:
+            if type(element) == str:
+                elements.append("'" + str(element) + "'")
+            elif type(element) == datetime.date:
+                elements.append("DATE '" + format_element(element) + "'")
+            elif type(element) == datetime.datetime:
+                elements.append("TIMESTAMP '" + format_element(element) + "'")
+            elif isinstance(element, type(None)):
+                elements.append("<null>")
+            else:
+                elements.append(str(format_element(element)))
+        return prefix + ",".join(elements) + suffix
+
+    return format_collection
+
+
+def compileColumnFormatters(testOptions, columnTypes):
+    """
+        生成结果集中每一列的格式化函数，每个结果集只需要生成一次
+    """
+    columnFormatters = []
+    for columnType in columnTypes:
+        if columnType == "STRUCT":
+            columnFormatters.append(
+                _compileCollectionFormatter(testOptions, "STRUCTURE(", ")", sortElements=False))
+        elif columnType == "ARRAY":
+            columnFormatters.append(
+                _compileCollectionFormatter(testOptions, "ARRAY[", "]",
+                                            sortElements=testOptions.get('OUTPUT_SORT_ARRAY') == "ON"))
+        else:
+            columnFormatters.append(compileColumnFormatter(testOptions, columnType))
+    return columnFormatters
+
+
+def formatColumns(columns, columnFormatters):
+    """
+        对按列组织的数据逐列格式化，返回按行组织的生成器
+    """
+    return zip(*[map(columnFormatter, column) for columnFormatter, column in zip(columnFormatters, columns)])
+
+
+def getcommandResult(cls, rowcount, columnFormatters=None):
     """
         获取当前游标的数据库运行结果集，并完成格式化
 
+        传入参数：
+            rowcount          之前已经获取的记录行数
+            columnFormatters  结果集每一列的格式化函数，参考compileColumnFormatters
+                              如果没有提供，则根据当前的结果集生成
+
         返回的内容：
             title           输出内容的标题信息
             result          结果数据集，用一个二维的元组信息表示，((1,2),(3,4),(5,6),...)
@@ -34,200 +212,30 @@ def getcommandResult(cls, rowcount):
     fetchStatus = True
     cursor = cls.sqlCursor
 
-    def format_column(p_column, p_columntype):
-        if type(p_column) == float:
-            return cls.testOptions.get("FLOAT_FORMAT") % p_column
-        elif type(p_column) in (bool, str, int):
-            return p_column
-        elif type(p_column) == list:
-            return p_column
-        elif type(p_column) == datetime.date:
-            columnFormat = cls.testOptions.get("DATE_FORMAT")
-            if platform.system().lower() in ['windows', 'darwin']:
-                columnFormat = columnFormat.replace("%04Y", "%Y")
-            else:
-                columnFormat = columnFormat.replace("%Y", "%04Y")
-            return p_column.strftime(columnFormat)
-        elif type(p_column) == datetime.datetime:
-            if p_columntype in ["TIMESTAMP_WITH_TIMEZONE",
-                                "TIME_WITH_TIMEZONE",
-                                "TIMESTAMP_WITH_LOCAL_TIME_ZONE"]:
-                columnFormat = cls.testOptions.get("DATETIME-TZ_FORMAT")
-            else:
-                columnFormat = cls.testOptions.get("DATETIME_FORMAT")
-            if platform.system().lower() in ['windows', 'darwin']:
-                columnFormat = columnFormat.replace("%04Y", "%Y")
-            else:
-                columnFormat = columnFormat.replace("%Y", "%04Y")
-            return p_column.strftime(columnFormat)
-        elif type(p_column) == datetime.time:
-            return p_column.strftime(cls.testOptions.get("TIME_FORMAT"))
-        elif type(p_column) == bytearray:
-            if p_columntype == "BLOB":
-                columnTrimedLength = int(cls.testOptions.get("LOB_LENGTH"))
-                bColumnFullOutput = True
-                if len(p_column) > columnTrimedLength:
-                    bColumnFullOutput = False
-                    p_column = p_column[:columnTrimedLength]
-                # 转换为16进制，并反算成ASCII
-                p_column = binascii.b2a_hex(p_column)
-                p_column = p_column.decode()
-                if not bColumnFullOutput:
-                    # 用...的方式提醒输出没有结束，只是由于格式控制导致不显示
-                    return "0x" + p_column + "..."
-                else:
-                    return "0x" + p_column
-            else:
-                # 转换为16进制，并反算成ASCII
-                p_column = binascii.b2a_hex(p_column)
-                p_column = p_column.decode()
-                return "0x" + p_column
-        elif type(p_column) == decimal.Decimal:
-            if cls.testOptions.get("DECIMAL_FORMAT") != "":
-                return cls.testOptions.get("DECIMAL_FORMAT") % p_column
-            else:
-                return p_column
-        elif type(p_column) == SQLCliJDBCLargeObject:
-            trimedLength = int(cls.testOptions.get("LOB_LENGTH"))
-            if trimedLength < 4:
-                trimedLength = 4
-            if trimedLength > p_column.getObjectLength():
-                if p_column.getColumnTypeName().upper().find("CLOB") != -1:
-                    dataValue = p_column.getData(1, p_column.getObjectLength())
-                    return dataValue
-                elif p_column.getColumnTypeName().upper().find("BLOB") != -1:
-                    dataValue = p_column.getData(1, p_column.getObjectLength())
-                    if dataValue is not None:
-                        dataValue = binascii.b2a_hex(dataValue)
-                        dataValue = dataValue.decode()
-                        return "0x" + dataValue
-                    else:
-                        return None
-            else:
-                if p_column.getColumnTypeName().upper().find("CLOB") != -1:
-                    dataValue = "Len:" + str(p_column.getObjectLength()) + ";" + \
-                                "Content:[" + \
-                                p_column.getData(1, trimedLength - 3) + "..." + \
-                                p_column.getData(p_column.getObjectLength() - 2, 3) + \
-                                "]"
-                    return dataValue
-                elif p_column.getColumnTypeName().upper().find("BLOB") != -1:
-                    dataValue = "Len:" + str(p_column.getObjectLength()) + ";" + \
-                                "Content:0x[" + \
-                                binascii.b2a_hex(p_column.getData(1, trimedLength - 3)).decode() + "..." + \
-                                binascii.b2a_hex(p_column.getData(p_column.getObjectLength() - 2, 3)).decode() + \
-                                "]"
-                    return dataValue
-        elif isinstance(p_column, type(None)):
-            return p_column
-        else:
-            # 其他类型直接返回
-            raise SQLCliJDBCException("TestCli-0000: Unknown column type [" +
-                                      str(p_columntype) + ":" + str(type(p_column)) +
-                                      "] in format_column")
-
     # cursor.description is not None for queries that return result sets,
     # e.g. SELECT.
-    result = []
     columnTypes = []
     if cursor.description is not None:
         headers = [x[0] for x in cursor.description]
         columnTypes = [x[1] for x in cursor.description]
+        if columnFormatters is None:
+            columnFormatters = compileColumnFormatters(cls.testOptions, columnTypes)
         if cursor.warnings is not None:
             status = "{0} row{1} selected with warnings."
         else:
             status = "{0} row{1} selected."
         arraySize = int(cls.testOptions.get("SQL_FETCHSIZE"))
-        rowset = cursor.fetchmany(arraySize)
-        for row in rowset:
-            collatedRow = []
-            for nColumnPos in range(0, len(row)):
-                column = row[nColumnPos]
-                columntype = columnTypes[nColumnPos]
-                # 对于空值直接返回
-                if column is None:
-                    collatedRow.append(None)
-                    continue
-
-                # 处理各种数据类型
-                if columnTypes[nColumnPos] == "STRUCT":
-                    columnValue = "STRUCTURE("
-                    for pos in range(0, len(column)):
-                        m_ColumnType = str(type(column[pos]))
-                        if pos == 0:
-                            if type(column[pos]) == str:
-                                columnValue = columnValue + "'" + str(column[pos]) + "'"
-                            elif type(column[pos]) == datetime.date:
-                                columnValue = columnValue + "DATE '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif type(column[pos]) == datetime.datetime:
-                                columnValue = columnValue + "TIMESTAMP '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif isinstance(column[pos], type(None)):
-                                columnValue = columnValue + "<null>"
-                            else:
-                                columnValue = columnValue + \
-                                              str(format_column(column[pos], m_ColumnType))
-                        else:
-                            if type(column[pos]) == str:
-                                columnValue = columnValue + ",'" + str(column[pos]) + "'"
-                            elif type(column[pos]) == datetime.date:
-                                columnValue = columnValue + ",DATE '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif type(column[pos]) == datetime.datetime:
-                                columnValue = columnValue + ",TIMESTAMP '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif isinstance(column[pos], type(None)):
-                                columnValue = columnValue + ",<null>"
-                            else:
-                                columnValue = columnValue + "," + \
-                                              str(format_column(column[pos], m_ColumnType))
-                    columnValue = columnValue + ")"
-                    collatedRow.append(columnValue)
-                elif columnTypes[nColumnPos] == "ARRAY":
-                    columnValue = "ARRAY["
-                    if cls.testOptions.get('OUTPUT_SORT_ARRAY') == "ON":
-                        # 保证Array的输出每次都一样顺序
-                        # 需要注意可能有NULL值导致字符数组无法排序的情况, column是一个一维数组
-                        column.sort(key=lambda x: (x is None, x))
-                    for pos in range(0, len(column)):
-                        m_ColumnType = str(type(column[pos]))
-                        if pos == 0:
-                            if type(column[pos]) == str:
-                                columnValue = columnValue + "'" + str(column[pos]) + "'"
-                            elif type(column[pos]) == datetime.date:
-                                columnValue = columnValue + "DATE '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif type(column[pos]) == datetime.datetime:
-                                columnValue = columnValue + "TIMESTAMP '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif isinstance(column[pos], type(None)):
-                                columnValue = columnValue + "<null>"
-                            else:
-                                columnValue = columnValue + \
-                                              str(format_column(column[pos], m_ColumnType))
-                        else:
-                            if type(column[pos]) == str:
-                                columnValue = columnValue + ",'" + str(column[pos]) + "'"
-                            elif type(column[pos]) == datetime.date:
-                                columnValue = columnValue + ",DATE '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif type(column[pos]) == datetime.datetime:
-                                columnValue = columnValue + ",TIMESTAMP '" + \
-                                              format_column(column[pos], m_ColumnType) + "'"
-                            elif isinstance(column[pos], type(None)):
-                                columnValue = columnValue + ",<null>"
-                            else:
-                                columnValue = columnValue + "," + \
-                                              str(format_column(column[pos], m_ColumnType))
-                    columnValue = columnValue + "]"
-                    collatedRow.append(columnValue)
-                else:
-                    collatedRow.append(format_column(column, columntype))
-            collatedRow = tuple(collatedRow)
-            result.append(collatedRow)
-        rowcount = rowcount + len(rowset)
-        if len(rowset) < arraySize:
+        if cls.testOptions.get("SQL_FETCHMODE") == "ROW":
+            rowset = cursor.fetchmany(arraySize)
+            fetchedRowCount = len(rowset)
+            columns = list(zip(*rowset))
+        else:
+            # 批量读取模式下返回的是按列组织的数据
+            columns = cursor.fetchmanycolumns(arraySize)
+            fetchedRowCount = len(columns[0]) if len(columns) != 0 else 0
+        result = list(formatColumns(columns, columnFormatters))
+        rowcount = rowcount + fetchedRowCount
+        if fetchedRowCount < arraySize:
             # 已经没有什么可以取的了, 游标结束
             fetchStatus = False
     else:
@@ -301,12 +309,20 @@ def executeSQLStatement(cls, sql: str, sqlHints):
             rowcount = 0
             sqlStatus = 0
             rowPos = 0    # 多段返回的结果集中，当前返回部分在多段结果集中的开始位置
+            # 结果集的格式化函数只生成一次，在多段返回中重复使用
+            columnFormatters = None
+            if cls.sqlCursor.description is not None:
+                columnFormatters = compileColumnFormatters(
+                    testOptions=cls.testOptions,
+                    columnTypes=[x[1] for x in cls.sqlCursor.description]
+                )
             while True:
                 (title, result, headers, columnTypes, status,
                  fetchStatus, fetchedRowCount, sqlWarnings) = \
                     getcommandResult(
                         cls=cls,
-                        rowcount=rowcount
+                        rowcount=rowcount,
+                        columnFormatters=columnFormatters
                     )
                 rowcount = fetchedRowCount
                 if "TESTCLI_DEBUG" in os.environ:
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-import time
+import os
+import socket
 import paramiko
 import io
 import copy
@@ -8,6 +9,11 @@ from ..common import rewriteStatement
 sshSession = {}
 sshCurrentSessionName = "NONAME"
 
+# 每次从SSH通道读取的最大字节数
+SSH_RECV_CHUNKSIZE = 65536
+# 等待SSH通道数据的超时时间（秒），超时后继续等待，避免在通道上无限期阻塞
+SSH_RECV_TIMEOUT = 1.0
+
 
 class SshContext:
     def __init__(self):
@@ -17,7 +23,8 @@ class SshContext:
         self.pwd = None
         self.key = None
         self.options = {
-            "encoding": None
+            "encoding": None,
+            "outputFile": None
         }
         self.sshTransport = None
         self.sftpHandler = None
@@ -127,6 +134,47 @@ def rewriteSshRequest(cls, requestObject, commandScriptFile: str):
         return requestObject, [rewrotedCommand, ]
 
 
+def recvSshChannel(channel):
+    """
+        按块读取SSH通道中的输出，直到远程命令关闭输出
+        读取操作阻塞在通道上等待数据，而不是轮询休眠，这样输出到达后可以立即处理
+    """
+    channel.settimeout(SSH_RECV_TIMEOUT)
+    while True:
+        try:
+            chunk = channel.recv(SSH_RECV_CHUNKSIZE)
+        except socket.timeout:
+            # 暂时没有输出，继续等待
+            continue
+        if len(chunk) == 0:
+            # 远程命令的输出已经结束
+            break
+        yield chunk
+
+
+def recvSshChannelLines(channel):
+    """
+        按行返回SSH通道中的输出（不包含换行符）
+        收到的数据放在一个可复用的缓冲区中，每收到一块数据后切分出所有完整的行，剩余部分留待下一块数据
+    """
+    buffer = bytearray()
+    for chunk in recvSshChannel(channel):
+        buffer.extend(chunk)
+        lineStart = 0
+        while True:
+            lineEnd = buffer.find(b'\n', lineStart)
+            if lineEnd == -1:
+                break
+            yield bytes(buffer[lineStart:lineEnd])
+            lineStart = lineEnd + 1
+        if lineStart != 0:
+            del buffer[:lineStart]
+
+    # 处理回显的最后一行没有回车换行的情况
+    if len(buffer) != 0:
+        yield bytes(buffer)
+
+
 def executeSshRequest(cls, requestObject):
     global sshSession
     global sshCurrentSessionName
@@ -211,67 +259,34 @@ def executeSshRequest(cls, requestObject):
                 # 执行远程的命令
                 channel.exec_command(command=str(command).encode(encoding=sshEncoding, errors="ignore"))
 
-                consoleOutputBytes = bytes()
-                while True:
-                    if channel.exit_status_ready():
-                        # 程序已经运行结束
-                        break
-                    else:
-                        # 记录收到的标准输出信息
-                        while True:
-                            if channel.recv_ready():
-                                readByte = channel.recv(1)
-                                if readByte == bytes('\n', 'ascii'):
-                                    yield {
-                                        "type": "result",
-                                        "title": None,
-                                        "rows": None,
-                                        "headers": None,
-                                        "columnTypes": None,
-                                        "status": consoleOutputBytes.decode(encoding=sshEncoding, errors="ignore")
-                                    }
-                                    consoleOutputBytes = bytes()
-                                else:
-                                    consoleOutputBytes = consoleOutputBytes + readByte
-                            else:
-                                break
-
-                    # 避免后台长时作业时CPU过度占用
-                    time.sleep(0.5)
-
-                # 要等待最后完成
-                while not channel.eof_received:
-                    time.sleep(0.5)
-
-                # 可能包含再最后一批的消息里头
-                while True:
-                    if channel.recv_ready():
-                        readByte = channel.recv(1)
-                        if readByte == bytes('\n', 'ascii'):
-                            yield {
-                                "type": "result",
-                                "title": None,
-                                "rows": None,
-                                "headers": None,
-                                "columnTypes": None,
-                                "status": consoleOutputBytes.decode(encoding=sshEncoding, errors="ignore")
-                            }
-                            consoleOutputBytes = bytes()
-                        else:
-                            consoleOutputBytes = consoleOutputBytes + readByte
-                    else:
-                        break
-
-                # 处理回显的最后一行没有回车换行的情况
-                if len(consoleOutputBytes) != 0:
+                outputFile = sshContext.getOption('outputFile')
+                if outputFile is not None:
+                    # 命令输出直接追加写入到本地文件中，不再逐行返回结果
+                    outputBytes = 0
+                    with open(file=outputFile, mode="ab") as fp:
+                        for chunk in recvSshChannel(channel):
+                            fp.write(chunk)
+                            outputBytes = outputBytes + len(chunk)
                     yield {
                         "type": "result",
                         "title": None,
                         "rows": None,
                         "headers": None,
                         "columnTypes": None,
-                        "status": consoleOutputBytes.decode(encoding=sshEncoding, errors="ignore")
+                        "status": "< Command output " + str(outputBytes) + " bytes saved to [" +
+                                  os.path.abspath(outputFile) + "]"
                     }
+                else:
+                    # 记录收到的标准输出信息
+                    for consoleOutputBytes in recvSshChannelLines(channel):
+                        yield {
+                            "type": "result",
+                            "title": None,
+                            "rows": None,
+                            "headers": None,
+                            "columnTypes": None,
+                            "status": consoleOutputBytes.decode(encoding=sshEncoding, errors="ignore")
+                        }
 
                 # 获得命令的返回状态
                 ret = channel.recv_exit_status()
@@ -325,6 +340,21 @@ def executeSshRequest(cls, requestObject):
                     }
                 )
                 sshSession[sshCurrentSessionName].setOptions(sshOptions)
+            elif str(requestObject["option"]).lower() == "outputfile":
+                # 设置命令输出的本地文件，设置为NONE的时候恢复输出到控制台
+                outputFile = str(requestObject["value"])
+                if (outputFile.startswith('"') and outputFile.endswith('"')) or \
+                        (outputFile.startswith("'") and outputFile.endswith("'")):
+                    outputFile = outputFile[1:-1]
+                if outputFile.upper() == "NONE":
+                    outputFile = None
+                sshOptions = sshSession[sshCurrentSessionName].getOptions()
+                sshOptions.update(
+                    {
+                        "outputFile": outputFile
+                    }
+                )
+                sshSession[sshCurrentSessionName].setOptions(sshOptions)
             else:
                 yield {
                     "type": "error",
@@ -1,20 +1,29 @@
 # -*- coding: utf-8 -*-
+import builtins
 import copy
+import keyword
 import os
 import re
+import heapq
+import pickle
+import tempfile
+import traceback
 from .sqlparse import SQLFormatWithPrefix
 from .sqlparse import SQLAnalyze
 from .apiparse import APIRequestObjectFormatWithPrefix
 from .commands.assertExpression import evalExpression
+from .globalvar import globalEmbeddScriptScope
 from .testcliexception import TestCliException
 
 
-def sortresult(result):
-    """
-        数组排序
+# [Order]排序时内存中最多同时排序的行数，超过后分批排序并写入临时文件，最后合并
+SORT_SPILLROWS = 1000000
+
 
-        不能用sorted函数，需要考虑None出现在列表中特定元素的问题
-        排序遵循空值最大原则
+def exchangeSortResult(result):
+    """
+        原有的交换排序，时间复杂度为O(n^2)
+        当排序规则不能构成全序关系的时候（例如同一列中类型不同的数据无法统一比较），使用该算法保证结果不变
     """
     for i in range(len(result) - 1, 0, -1):
         for j in range(i - 1, -1, -1):
@@ -48,85 +57,473 @@ def sortresult(result):
                 result[j], result[i] = result[i], result[j]
 
 
-def rewriteStatement(cls, statement: str, commandScriptFile: str):
-    # 随后尝试被替换内容是否为当前应用变量，环境变量
-    while True:
-        # 替换脚本中的变量信息
-        # 替换： 一： 系统的环境变量,即{{env}}
-        # 替换： 二:  系统内嵌脚本中的变量{{eval}}
-        match_obj = re.search(r"{{(.*?)}}", statement, re.IGNORECASE | re.DOTALL)
-        if match_obj:
-            beforeRewriteStatement = statement
-            searchResult = str(match_obj.group(0))
-            varName = str(match_obj.group(1)).strip()
-
-            # 先尝试在MAPPING文件中进行查找替换
-            mappingResult = cls.cmdMappingHandler.RewriteWord(commandScriptFile, varName)
-            if varName != mappingResult:
-                statement = statement.replace(searchResult, str(mappingResult))
-
-            # 尝试本地变量
+def getSortKeyBuilder(result):
+    """
+        根据每一列的数据生成排序键的构造函数
+        每一列对应排序键中的(是否为空, 值)，空值排在最后
+        只有一种数据类型的列直接比较值
+        有多种数据类型的列，只有当每种类型内部的大小顺序和字符串顺序一致的时候，才能统一按照字符串比较
+        排序规则不能构成全序关系，或者相等的值输出不同（例如Decimal('1.0')和Decimal('1.00')）的时候返回None
+    """
+    # 列中的值可能无法计算哈希（例如bytearray，list），这里用列表而不是集合来收集
+    columnValues = [{} for _ in range(len(result[0]))]
+    for row in result:
+        for columnValueMap, cell in zip(columnValues, row):
+            if cell is not None:
+                columnValueMap.setdefault(type(cell), []).append(cell)
+
+    stringColumns = []
+    for columnValueMap in columnValues:
+        columnTypes = list(columnValueMap.keys())
+        for columnType in columnTypes:
+            for otherType in columnTypes:
+                if columnType is not otherType and issubclass(columnType, otherType):
+                    # 存在继承关系的类型之间比较结果不对称
+                    return None
+        isStringColumn = len(columnTypes) > 1
+        columnStrValues = set()
+        for values in columnValueMap.values():
             try:
-                evalResult = evalExpression(cls, varName)
-                if varName != evalResult:
-                    statement = statement.replace(searchResult, str(evalResult))
-            except NameError:
-                # 非本地变量
-                pass
-            except Exception as ex:
-                if "TESTCLI_DEBUG" in os.environ:
-                    raise TestCliException("evalExpression Error [" + varName + "]: [" + repr(ex) + "].")
+                values.sort()
+                for pos in range(0, len(values)):
+                    if values[pos] != values[pos]:
+                        # NaN和任何值都无法比较
+                        return None
+                    if pos == 0:
+                        continue
+                    if values[pos - 1] == values[pos]:
+                        # 相等的值之间的先后顺序无法通过排序键确定，输出不同的时候结果会和原有的算法不一致
+                        if str(values[pos - 1]) != str(values[pos]):
+                            return None
+                        continue
+                    if not values[pos - 1] < values[pos]:
+                        return None
+                    if isStringColumn and str(values[pos - 1]) >= str(values[pos]):
+                        return None
+            except TypeError:
+                # 同一类型的值之间也无法比较，例如包含了不同类型元素的list
+                return None
+            if isStringColumn:
+                # 不同类型的值按照字符串比较相等的时候，先后顺序同样无法确定
+                typeStrValues = set([str(value) for value in values])
+                if not columnStrValues.isdisjoint(typeStrValues):
+                    return None
+                columnStrValues.update(typeStrValues)
+        stringColumns.append(isStringColumn)
+
+    if not any(stringColumns):
+        def buildSortKey(row):
+            return tuple([(cell is None, cell) for cell in row])
+    else:
+        def buildSortKey(row):
+            return tuple([(cell is None, str(cell) if isString and cell is not None else cell)
+                          for cell, isString in zip(row, stringColumns)])
+    return buildSortKey
 
-            # 尝试环境变量
-            if varName in os.environ:
-                statement = statement.replace(searchResult, os.environ[varName])
 
-            if statement == beforeRewriteStatement:
-                # 循环替换再也没有发生变化
+def spillSortResult(result, buildSortKey, spillRows: int):
+    """
+        分批排序后写入临时文件，再将所有批次合并回result
+        数据无法序列化的时候返回False，此时result没有被修改
+    """
+    def readSpillFile(fp):
+        fp.seek(0)
+        unpickler = pickle.Unpickler(fp)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
                 break
-        else:
-            # 没有任何可以替换的了
-            break
 
-    # 随后尝试被替换内容是否为当前应用变量，环境变量
-    while True:
-        # 替换脚本中的变量信息
-        # 替换： 一： 系统的环境变量,即${env}
-        # 替换： 二:  系统内嵌脚本中的变量${eval}
-        match_obj = re.search(r"\${(.*?)}", statement, re.IGNORECASE | re.DOTALL)
-        if match_obj:
-            beforeRewriteStatement = statement
-            searchResult = str(match_obj.group(0))
-            varName = str(match_obj.group(1)).strip()
+    spillFiles = []
+    try:
+        try:
+            for startPos in range(0, len(result), spillRows):
+                chunk = sorted(result[startPos:startPos + spillRows], key=buildSortKey)
+                spillFile = tempfile.TemporaryFile(prefix="testcli_sort")
+                spillFiles.append(spillFile)
+                pickler = pickle.Pickler(spillFile, protocol=pickle.HIGHEST_PROTOCOL)
+                for row in chunk:
+                    pickler.dump(row)
+                    # 行之间没有引用关系，不需要保留序列化过程中的对象表
+                    pickler.clear_memo()
+                del chunk
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        # 所有的批次都已经写入文件后，释放原有的数据再合并
+        del result[:]
+        result.extend(heapq.merge(*[readSpillFile(spillFile) for spillFile in spillFiles], key=buildSortKey))
+        return True
+    finally:
+        for spillFile in spillFiles:
+            spillFile.close()
+
+
+def sortresult(result, spillRows: int = SORT_SPILLROWS):
+    """
+        数组排序
 
-            # 先尝试在MAPPING文件中进行查找替换
-            mappingResult = cls.cmdMappingHandler.RewriteWord(commandScriptFile, varName)
-            if varName != mappingResult:
-                statement = statement.replace(searchResult, str(mappingResult))
+        排序遵循空值最大原则，同一列中类型不同的值按照字符串比较
+        每一行预先生成排序键，排序的时间复杂度为O(nlogn)
+        行数超过spillRows的时候，分批排序并写入临时文件，最后合并，减少排序过程中的内存占用
+        各行的列数不同，或者排序规则不能构成全序关系的时候，使用原有的交换排序，保证结果不变
+    """
+    if len(result) <= 1:
+        return
+    columnCount = len(result[0])
+    for row in result:
+        if len(row) != columnCount:
+            exchangeSortResult(result)
+            return
+    buildSortKey = getSortKeyBuilder(result)
+    if buildSortKey is None:
+        exchangeSortResult(result)
+        return
+    if spillRows is not None and len(result) > spillRows:
+        if spillSortResult(result, buildSortKey, spillRows):
+            return
+    result.sort(key=buildSortKey)
+
+
+class LogHintTransformer(object):
+    """
+        根据LogFilter和LogMask提示生成的结果转换器
+        每个语句只编译一次，多段返回的结果集，状态信息，错误信息都重复使用同一个转换器
 
-            # 尝试本地变量
+        LogFilter     符合正则表达式的行将被过滤（忽略大小写，从行首开始匹配）
+                      结果集中将所有列用空格分隔来合并为一行后再匹配
+        LogMask       <pattern>=><target>，符合正则表达式的内容将被替换，一直替换到没有可替代的内容为止
+                      对结果集掩码的时候，用引号括起来的pattern和target会去掉引号外的空格，状态信息和错误信息则不会
+    """
+    # 掩码时最多的替换轮数，以及每轮最多替换的次数
+    maxMaskIterations = 100
+    maxMaskReplacesPerIteration = 2
+
+    def __init__(self, commandHints: dict):
+        self.debugMode = "TESTCLI_DEBUG" in os.environ
+        self.hasLogHints = "LogFilter" in commandHints or "LogMask" in commandHints
+        self.logFilters = []
+        # 结果集的掩码去掉引号外的空格，状态信息和错误信息的掩码保持原样，和原有的处理方式一致
+        self.logMasks = []
+        self.textLogMasks = []
+
+        for logFilter in commandHints.get("LogFilter", []):
             try:
-                evalResult = evalExpression(cls, varName)
-                if varName != evalResult:
-                    statement = statement.replace(searchResult, str(evalResult))
-            except NameError:
-                # 非本地变量
-                pass
-            except Exception as ex:
-                if "TESTCLI_DEBUG" in os.environ:
-                    raise TestCliException("evalExpression Error 2[" + varName + "]: [" + repr(ex) + "].")
+                self.logFilters.append((logFilter, re.compile(logFilter, re.IGNORECASE)))
+            except re.error as rex:
+                if self.debugMode:
+                    print("[DEBUG] Filter error : [" + logFilter + "]. " + str(rex))
+
+        for sqlMaskListString in commandHints.get("LogMask", []):
+            sqlMaskList = sqlMaskListString.split("=>")
+            if len(sqlMaskList) != 2:
+                if self.debugMode:
+                    print("[DEBUG] LogMask Hint Error: " + sqlMaskListString)
+                continue
+            sqlMaskPattern, sqlMaskTarget = sqlMaskList
+            textLogMask = self.compileMask(sqlMaskPattern, sqlMaskTarget)
+            if textLogMask is not None:
+                self.textLogMasks.append(textLogMask)
+            # 用引号括起来的内容，去掉引号外的空格
+            for quoteChar in ["'", '"']:
+                if sqlMaskPattern.strip().startswith(quoteChar) and sqlMaskPattern.strip().endswith(quoteChar):
+                    sqlMaskPattern = sqlMaskPattern.strip()
+                if sqlMaskTarget.strip().startswith(quoteChar) and sqlMaskTarget.strip().endswith(quoteChar):
+                    sqlMaskTarget = sqlMaskTarget.strip()
+            logMask = self.compileMask(sqlMaskPattern, sqlMaskTarget)
+            if logMask is not None:
+                self.logMasks.append(logMask)
+
+    def compileMask(self, sqlMaskPattern: str, sqlMaskTarget: str):
+        # 正则表达式非法的时候返回None，这个掩码被忽略
+        try:
+            return [sqlMaskPattern, sqlMaskTarget, re.compile(sqlMaskPattern)]
+        except re.error:
+            if self.debugMode:
+                print('[DEBUG] traceback.format_exc():\n%s' % traceback.format_exc())
+            return None
+
+    def isFiltered(self, line: str):
+        for logFilter, logFilterPattern in self.logFilters:
+            if logFilterPattern.match(line):
+                if self.debugMode:
+                    print("[DEBUG] Apply filter: [" + line + "] with " + logFilter + ". Matched.")
+                return True
+            if self.debugMode:
+                print("[DEBUG] Apply filter: [" + line + "] with " + logFilter + ". Not match.")
+        return False
+
+    def mask(self, line: str, logMasks: list = None):
+        """
+            对一行内容掩码，logMasks没有指定的时候使用结果集的掩码
+        """
+        if logMasks is None:
+            logMasks = self.logMasks
+        for logMask in logMasks:
+            sqlMaskPattern, sqlMaskTarget, sqlMaskCompiledPattern = logMask
+            if sqlMaskCompiledPattern is None or sqlMaskCompiledPattern.search(line) is None:
+                continue
+            if self.debugMode:
+                print("[DEBUG] Will apply mask:" + line + " with " + sqlMaskPattern + "=>" + sqlMaskTarget)
+            try:
+                # 每轮最多替换两处，循环多次替代，一直到没有可替代为止
+                # 替换后的内容可能和随后的内容组成新的匹配（或者匹配和前后内容有关），不能一次替换全部内容
+                # 轮数受到限制，避免替换后的内容仍然符合条件而无限增长
+                newLine = line
+                for nIterCount in range(0, self.maxMaskIterations + 1):
+                    afterReplace = sqlMaskCompiledPattern.sub(
+                        sqlMaskTarget, newLine, self.maxMaskReplacesPerIteration)
+                    if afterReplace == newLine:
+                        break
+                    newLine = afterReplace
+                line = newLine
+            except re.error:
+                # 替换内容有错误，随后不再使用这个掩码
+                logMask[2] = None
+                if self.debugMode:
+                    print('[DEBUG] traceback.format_exc():\n%s' % traceback.format_exc())
+        return line
+
+    @staticmethod
+    def combineRow(row):
+        # 将所有列用空格分隔来合并为一行，行首的空字符串不计入分隔
+        combinedRow = ""
+        for cell in row:
+            if combinedRow == "":
+                combinedRow = str(cell)
+            else:
+                combinedRow = combinedRow + " " + str(cell)
+        return combinedRow
+
+    def transformRows(self, rows):
+        """
+            对结果集逐行过滤和掩码，返回新的结果集
+            过滤总是针对掩码之前的内容
+        """
+        if len(self.logFilters) == 0 and len(self.logMasks) == 0:
+            return rows
+        newRows = []
+        for row in rows:
+            if len(self.logFilters) != 0 and self.isFiltered(self.combineRow(row)):
+                continue
+            if len(self.logMasks) != 0:
+                maskedRow = None
+                for cellPos, cell in enumerate(row):
+                    if cell is None:
+                        continue
+                    output = str(cell)
+                    newOutput = self.mask(output)
+                    if newOutput != output:
+                        if maskedRow is None:
+                            maskedRow = list(row)
+                        maskedRow[cellPos] = newOutput
+                if maskedRow is not None:
+                    row = tuple(maskedRow)
+            newRows.append(row)
+        return newRows
+
+    def transformText(self, text: str):
+        """
+            对多行文本逐行过滤和掩码
+        """
+        if not self.hasLogHints:
+            return text
+        newLines = []
+        for line in text.splitlines(keepends=False):
+            if len(self.logFilters) != 0 and self.isFiltered(line):
+                continue
+            newLines.append(self.mask(line, self.textLogMasks))
+        return "\n".join(newLines)
 
-            # 尝试环境变量
-            if varName in os.environ:
-                statement = statement.replace(searchResult, os.environ[varName])
 
-            if statement == beforeRewriteStatement:
-                # 循环替换再也没有发生变化
-                break
+# 语句中变量的写法，{{var}}和${var}依次替换. 每种写法对应变量的起始标识，匹配规则和eval出错时的提示信息
+statementVariablePatterns = [
+    ("{{", re.compile(r"{{(.*?)}}", re.IGNORECASE | re.DOTALL), "evalExpression Error ["),
+    ("${", re.compile(r"\${(.*?)}", re.IGNORECASE | re.DOTALL), "evalExpression Error 2["),
+]
+# 编译后的语句模板缓存，循环中的语句不需要重复查找变量的位置
+statementTemplateCache = {}
+statementTemplateCacheSize = 4096
+# 语句中每个变量找到值的方式，{(脚本文件名, 变量名): (MAPPING文件版本, 查找方式, MAPPING中的值)}
+statementVariableBindings = {}
+
+
+class StatementTemplate(object):
+    """
+        语句模板，记录语句中所有变量的位置
+        literals          变量之间的文本内容，比placeholders多一个
+        placeholders      变量列表，每个元素为(变量的原始文本, 变量名)
+        placeholderEnds   每个变量在原语句中的结束位置
+        renderable        变量的原始文本只出现在变量位置上的时候，才可以按照模板一次拼接
+    """
+    __slots__ = ("statement", "literals", "placeholders", "placeholderEnds", "renderable")
+
+    def __init__(self, statement: str, variablePattern):
+        self.statement = statement
+        self.literals = []
+        self.placeholders = []
+        self.placeholderEnds = []
+        startPos = 0
+        for match_obj in variablePattern.finditer(statement):
+            self.literals.append(statement[startPos:match_obj.start()])
+            self.placeholders.append((match_obj.group(0), match_obj.group(1).strip()))
+            self.placeholderEnds.append(match_obj.end())
+            startPos = match_obj.end()
+        self.literals.append(statement[startPos:])
+        searchResults = [placeholder[0] for placeholder in self.placeholders]
+        self.renderable = all(
+            statement.count(searchResult) == searchResults.count(searchResult) for searchResult in set(searchResults))
+
+
+def compileStatementTemplate(statement: str, patternIndex: int):
+    cacheKey = (patternIndex, statement)
+    template = statementTemplateCache.get(cacheKey)
+    if template is None:
+        if len(statementTemplateCache) >= statementTemplateCacheSize:
+            statementTemplateCache.clear()
+        template = StatementTemplate(statement, statementVariablePatterns[patternIndex][1])
+        statementTemplateCache[cacheKey] = template
+    return template
+
+
+def isUndefinedVariableName(varName: str):
+    """
+        变量名是一个简单的名字，并且在内嵌脚本的命名空间中没有定义，此时eval一定会失败
+    """
+    return varName.isidentifier() and not keyword.iskeyword(varName) and \
+        varName not in globalEmbeddScriptScope and not hasattr(builtins, varName)
+
+
+def resolveStatementVariable(cls, varName: str, commandScriptFile: str, evalErrorPrefix: str):
+    """
+        依次在MAPPING文件，本地变量，环境变量中查找变量的值，返回第一个找到的值
+        没有找到的时候返回None
+
+        每个变量记录上一次找到值的方式，随后直接按照记录的方式查找
+            MAPPING     MAPPING文件中定义的变量，值不会变化，直接使用记录的值. 重新加载MAPPING文件后失效
+            EVAL        本地变量，每次都需要重新计算
+            ENV         环境变量或者没有找到. 之后定义了同名的本地变量的时候失效
+    """
+    bindingKey = (commandScriptFile, varName)
+    mappingVersion = getattr(cls.cmdMappingHandler, "mappingVersion", None)
+    binding = statementVariableBindings.get(bindingKey)
+    if binding is None or binding[0] != mappingVersion:
+        # 先尝试在MAPPING文件中进行查找替换
+        mappingResult = cls.cmdMappingHandler.RewriteWord(commandScriptFile, varName)
+        if varName != mappingResult:
+            binding = (mappingVersion, "MAPPING", str(mappingResult))
         else:
+            binding = (mappingVersion, "EVAL", None)
+        if len(statementVariableBindings) >= statementTemplateCacheSize:
+            statementVariableBindings.clear()
+        statementVariableBindings[bindingKey] = binding
+    if binding[1] == "MAPPING":
+        return binding[2]
+
+    # 尝试本地变量. 已经确认不是本地变量，并且随后也没有定义的时候，不再计算
+    if binding[1] != "ENV" or not isUndefinedVariableName(varName):
+        try:
+            evalResult = evalExpression(cls, varName)
+            if binding[1] != "EVAL":
+                statementVariableBindings[bindingKey] = (mappingVersion, "EVAL", None)
+            if varName != evalResult:
+                return str(evalResult)
+        except NameError:
+            # 非本地变量
+            if isUndefinedVariableName(varName):
+                statementVariableBindings[bindingKey] = (mappingVersion, "ENV", None)
+        except Exception as ex:
+            if "TESTCLI_DEBUG" in os.environ:
+                raise TestCliException(evalErrorPrefix + varName + "]: [" + repr(ex) + "].")
+
+    # 尝试环境变量
+    if varName in os.environ:
+        return os.environ[varName]
+    return None
+
+
+def rewriteStatementIteratively(cls, statement: str, commandScriptFile: str, patternIndex: int):
+    """
+        每次替换语句中的第一个变量，一直到语句不再发生变化
+        用于变量的值中仍然包含变量的嵌套替换
+    """
+    _, variablePattern, evalErrorPrefix = statementVariablePatterns[patternIndex]
+    while True:
+        match_obj = variablePattern.search(statement)
+        if match_obj is None:
             # 没有任何可以替换的了
             break
+        searchResult = str(match_obj.group(0))
+        varName = str(match_obj.group(1)).strip()
+        varValue = resolveStatementVariable(cls, varName, commandScriptFile, evalErrorPrefix)
+        if varValue is None or varValue == searchResult:
+            # 循环替换再也没有发生变化
+            break
+        statement = statement.replace(searchResult, varValue)
+    return statement
+
+
+def renderStatementTemplate(cls, template: StatementTemplate, commandScriptFile: str, patternIndex: int):
+    """
+        按照模板依次替换变量后一次拼接
+        返回(替换后的语句, 是否还需要继续循环替换)
 
+        和循环替换的规则保持一致：
+            同一个变量的所有出现位置使用同一个值
+            遇到没有找到值的变量，不再替换随后的变量
+            变量的值中包含变量标识符的时候，剩余部分交给循环替换处理
+    """
+    evalErrorPrefix = statementVariablePatterns[patternIndex][2]
+    resolvedValues = {}
+    output = []
+    for pos, (searchResult, varName) in enumerate(template.placeholders):
+        output.append(template.literals[pos])
+        if searchResult in resolvedValues:
+            output.append(resolvedValues[searchResult])
+            continue
+        varValue = resolveStatementVariable(cls, varName, commandScriptFile, evalErrorPrefix)
+        if varValue is None or varValue == searchResult:
+            # 当前变量无法替换，剩余部分保持原样，只替换已经找到值的变量
+            remainStatement = template.statement[template.placeholderEnds[pos]:]
+            for resolvedSearchResult, resolvedValue in resolvedValues.items():
+                remainStatement = remainStatement.replace(resolvedSearchResult, resolvedValue)
+            output.append(searchResult)
+            output.append(remainStatement)
+            return "".join(output), False
+        resolvedValues[searchResult] = varValue
+        if "{" in varValue or "}" in varValue or "$" in varValue:
+            # 变量的值中可能还有变量，或者和随后的内容组成新的变量
+            remainStatement = template.statement[template.placeholderEnds[pos]:]
+            for resolvedSearchResult, resolvedValue in resolvedValues.items():
+                remainStatement = remainStatement.replace(resolvedSearchResult, resolvedValue)
+            output.append(varValue)
+            output.append(remainStatement)
+            return "".join(output), True
+        output.append(varValue)
+    output.append(template.literals[-1])
+    return "".join(output), False
+
+
+def rewriteStatement(cls, statement: str, commandScriptFile: str):
+    """
+        替换语句中的变量信息
+        替换： 一： 系统的环境变量,即{{env}}或者${env}
+        替换： 二:  系统内嵌脚本中的变量{{eval}}或者${eval}
+        MAPPING文件中定义的内容优先，随后是本地变量，最后是环境变量
+
+        语句第一次出现的时候编译为模板，随后按照模板直接拼接
+    """
+    for patternIndex, (variableMarker, _, _) in enumerate(statementVariablePatterns):
+        if variableMarker not in statement:
+            continue
+        template = compileStatementTemplate(statement, patternIndex)
+        if len(template.placeholders) == 0:
+            continue
+        if template.renderable:
+            statement, needIterate = renderStatementTemplate(cls, template, commandScriptFile, patternIndex)
+            if not needIterate:
+                continue
+        statement = rewriteStatementIteratively(cls, statement, commandScriptFile, patternIndex)
     return statement
 
 
@@ -173,14 +570,14 @@ def rewriteConnectRequest(cls, connectRequestObject, commandScriptFile: str):
     # 保留原脚本
     rawConnectRequestObject = copy.copy(connectRequestObject)
 
-    for keyword in ["username", "password", "driver", "driverSchema", "driverType", "host", "port", "service"]:
-        if keyword in connectRequestObject:
-            oldType = type(connectRequestObject[keyword])
+    for keywordName in ["username", "password", "driver", "driverSchema", "driverType", "host", "port", "service"]:
+        if keywordName in connectRequestObject:
+            oldType = type(connectRequestObject[keywordName])
             newValue = rewriteStatement(
-                cls=cls, statement=str(connectRequestObject[keyword]),
+                cls=cls, statement=str(connectRequestObject[keywordName]),
                 commandScriptFile=commandScriptFile)
             newValue = oldType(newValue)
-            connectRequestObject[keyword] = newValue
+            connectRequestObject[keywordName] = newValue
 
     # 语句发生了变化
     if rawConnectRequestObject != connectRequestObject:
@@ -445,6 +842,68 @@ def parseAPIHints(commandHints: list):
 
     return commandHintList
 
+
+# 语句预分析使用的正则表达式，与SQLLexer/APILexer/BaseLexer中语句起始的词法规则保持一致
+# 这里并不是完整的词法分析，只是根据语句的首行判断类型，在第一次出现可能的结束符之前跳过解析器
+# 之后的每一行（包括分号出现在字符串、注释中的情况）仍然逐行交给解析器，这部分的解析代价依然和行数的平方相关
+# 关键字后必须跟随空白，否则词法分析中的String规则会匹配到更长的内容，此时不做预判
+_statementKindPatterns = [
+    ("PROCEDURE",
+     re.compile(r"^((create|replace|alter| +|or)+(procedure|function|class|trigger|package)|declare|begin)(?=[ \t]|$)",
+                re.IGNORECASE)),
+    ("SQL",
+     re.compile(r"^(create|insert|update|select|delete|replace|drop|commit|rollback)(?=[ \t]|$)", re.IGNORECASE)),
+    ("SCRIPT", re.compile(r"^> \{%")),
+    ("ECHO", re.compile(r"^_echo", re.IGNORECASE)),
+]
+_apiStatementKindPattern = re.compile(r"^###")
+_echoEndPattern = re.compile(r"echo[ \t]+off", re.IGNORECASE)
+
+
+def getStatementKind(statementLine: str, nameSpace: str):
+    """
+        根据语句的首行，预判语句的类型
+        返回：
+            SQL/PROCEDURE/SCRIPT/ECHO/API 之一
+            None 表示无法预判，需要逐行交给解析器处理
+    """
+    statementLine = statementLine.lstrip()
+    if nameSpace == "API":
+        if _apiStatementKindPattern.match(statementLine):
+            return "API"
+        # API命名空间下没有SQL语句
+        patterns = _statementKindPatterns[2:]
+    else:
+        patterns = _statementKindPatterns
+    for statementKind, pattern in patterns:
+        if pattern.match(statementLine):
+            return statementKind
+    return None
+
+
+def isStatementMayEnd(statementKind: str, statementLine: str, nameSpace: str, isFirstLine: bool = False):
+    """
+        判断已知类型的语句在当前行是否可能结束
+        这里只做保守的判断，只要当前行出现了可能的结束符，就返回True，交给解析器做最终的判断
+        注意：引号和注释并不能屏蔽结束符（解析器对未闭合的字符串同样按照结束符处理），所以这里不做判断
+    """
+    if nameSpace != "API":
+        # SQL命名空间下，顶行的/都可能导致语句结束
+        if statementLine.lstrip().startswith('/'):
+            return True
+        # 存储过程只能以顶行的/结束，其他语句遇到分号都可能结束
+        if statementKind != "PROCEDURE" and statementLine.find(';') != -1:
+            return True
+    if statementKind == "API":
+        # 首行的###是请求的开始标志
+        return not isFirstLine and statementLine.find('###') != -1
+    if statementKind == "SCRIPT":
+        return statementLine.find('%}') != -1
+    if statementKind == "ECHO":
+        return _echoEndPattern.search(statementLine) is not None
+    return False
+
+
 def isClosedBracket(s):
     # 首先去除SQL中的''和""信息 (重复的''表示单引号，重复的""表示双引号，是普通字符)
     s = s.replace("‘'", '').replace('“"', '')
@@ -463,6 +922,7 @@ def isClosedBracket(s):
             continue
     return bClosedBracket
 
+
 def splitSqlCommand(sqlCommand: str):
     """
         将单行语句中包含的多行语句分解
@@ -484,8 +944,26 @@ def splitSqlCommand(sqlCommand: str):
     # 有可能存在多个语句
     splitSqlCommandList = []
     currentSql = ""
+    currentSqlKind = None
+    currentLineStart = 0
     for c in sqlCommand:
+        if currentSql == "":
+            currentSqlKind = None
+            currentLineStart = 0
         currentSql = currentSql + c
+        if c == '\n':
+            currentLine = currentSql[currentLineStart:-1]
+            isFirstLine = (currentLineStart == 0)
+            currentLineStart = len(currentSql)
+            if isFirstLine:
+                # 根据语句首行预判语句类型
+                currentSqlKind = getStatementKind(currentLine, "SQL")
+            if currentSqlKind is not None:
+                if isStatementMayEnd(currentSqlKind, currentLine, "SQL", isFirstLine):
+                    currentSqlKind = None
+                else:
+                    # 已经预判类型的语句，在没有遇到可能的结束符之前，不会在换行处结束
+                    continue
         # 只有遇到换行符或者分号，才有必要进行分析
         if c in delimiters:
             if not isClosedBracket(currentSql):
@@ -9,3 +9,11 @@ lastCommandResult = {}
 
 # 全局内存文件文件句柄，用于数据的导入导出
 globalMemFsHandler = fs.open_fs("mem://")
+
+# Antlr解析器的运行选项
+#   pool        是否复用词法和语法解析器对象
+globalParserOption = {"pool": True}
+
+# 进程启动时内嵌脚本命名空间中的内容，Worker进程被多次复用的时候，每次运行前恢复到这个状态
+globalEmbeddScriptScopeInitial = {}
+globalEmbeddScriptScopeInitial.update(globalEmbeddScriptScope)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+    JOB聚合点(_JOB TIMER)的同步服务
+
+    聚合点服务运行在JobManager所在的主进程中，Worker进程通过TCP连接到服务上等待：
+        Worker到达聚合点后，发送WAIT消息，然后阻塞在连接上
+        同一组（相同的TAG，或者没有TAG时同一个JOB）中最后一个Worker到达后，服务立即向所有等待的连接发送RELEASE消息
+        Worker收到RELEASE后，回复DONE消息，带上自己被释放的时间，用于统计释放的时间差
+    消息格式为一行一个JSON，所有的时间都是unix时间戳（秒，浮点数）
+    同一台机器上运行的Worker使用相同的时钟，到达时间、释放时间可以直接比较
+"""
+import json
+import time
+import socket
+import threading
+from socketserver import ThreadingMixIn, TCPServer, StreamRequestHandler
+
+# 保留的聚合点历史记录数量
+JOBBARRIER_HISTORYSIZE = 10000
+
+
+class JobBarrierRequestHandler(StreamRequestHandler):
+    def handle(self):
+        # 释放消息很小，不能等待Nagle算法合并
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line.decode("utf-8"))
+        if request.get("op") != "WAIT":
+            return
+        barrierKey = (request["group"], request["timer"])
+        self.server.arrive(barrierKey, request, self)
+
+        # 等待Worker回复DONE，或者Worker在释放前断开连接
+        line = self.rfile.readline()
+        if not line:
+            self.server.leave(barrierKey, self)
+            return
+        reply = json.loads(line.decode("utf-8"))
+        if reply.get("op") == "DONE":
+            self.server.recordRelease(self, reply.get("released"))
+
+    def sendMessage(self, message: bytes):
+        try:
+            self.request.sendall(message)
+        except OSError:
+            # Worker已经退出
+            pass
+
+
+class JobBarrierServer(ThreadingMixIn, TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    # 并发的Worker数量可能很多，需要足够的连接队列
+    request_queue_size = 1024
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.barrierLock = threading.Lock()
+        # 正在等待的聚合点, (group, timer) -> {"parties":..., "arrived": [handler, ...]}
+        self.barriers = {}
+        # 每个等待连接的统计信息, handler -> 统计记录
+        self.barrierRecords = {}
+        # 已经释放的聚合点统计
+        self.barrierHistory = []
+        super().__init__((host, port), JobBarrierRequestHandler)
+
+    @property
+    def url(self):
+        return "%s:%d" % (self.server_address[0], self.server_address[1])
+
+    def arrive(self, barrierKey, request, handler):
+        arrivalTime = time.time()
+        with self.barrierLock:
+            barrier = self.barriers.get(barrierKey)
+            if barrier is None:
+                barrier = {
+                    "group": barrierKey[0],
+                    "timer": barrierKey[1],
+                    "parties": 0,
+                    "arrived": [],
+                    "workers": [],
+                }
+                self.barriers[barrierKey] = barrier
+            # 各个Worker计算的总数可能因为时间差略有不同，以最大的为准
+            barrier["parties"] = max(barrier["parties"], int(request.get("parties", 1)))
+            record = {
+                "worker": request.get("worker"),
+                "arrival": request.get("arrival", arrivalTime),
+                "release": None,
+            }
+            barrier["arrived"].append(handler)
+            barrier["workers"].append(record)
+            self.barrierRecords[handler] = record
+            if len(barrier["arrived"]) < barrier["parties"]:
+                return
+            # 所有的Worker都已经到达，释放当前聚合点，同名的聚合点可以再次使用
+            self.barriers.pop(barrierKey)
+            barrier["releaseTime"] = time.time()
+            self.barrierHistory.append(barrier)
+            if len(self.barrierHistory) > JOBBARRIER_HISTORYSIZE:
+                self.barrierHistory.pop(0)
+        message = (json.dumps({"op": "RELEASE", "released": barrier["releaseTime"]}) + "\n").encode("utf-8")
+        for waitHandler in barrier.pop("arrived"):
+            waitHandler.sendMessage(message)
+
+    def leave(self, barrierKey, handler):
+        # Worker在释放之前断开，不再计入到达的数量
+        with self.barrierLock:
+            record = self.barrierRecords.pop(handler, None)
+            barrier = self.barriers.get(barrierKey)
+            if barrier is not None and handler in barrier["arrived"]:
+                barrier["arrived"].remove(handler)
+                barrier["workers"].remove(record)
+                if len(barrier["arrived"]) == 0:
+                    self.barriers.pop(barrierKey)
+
+    def recordRelease(self, handler, releaseTime):
+        with self.barrierLock:
+            record = self.barrierRecords.pop(handler, None)
+            if record is not None:
+                record["release"] = releaseTime
+
+    def getStatistics(self, groupName: str = None):
+        """
+            返回已经释放的聚合点统计，按照释放的先后顺序排列
+            每一行为：group, timer, parties, 第一个到达时间, 最后一个到达时间, 释放时间, 到达时间差, 释放时间差
+            时间差的单位为毫秒，释放时间差为Worker实际收到释放消息的最早和最晚时间之差
+        """
+        rows = []
+        with self.barrierLock:
+            for barrier in self.barrierHistory:
+                if groupName is not None and barrier["group"] != groupName:
+                    continue
+                arrivals = [record["arrival"] for record in barrier["workers"]]
+                releases = [record["release"] for record in barrier["workers"] if record["release"] is not None]
+                if len(releases) == 0:
+                    releaseSkew = None
+                else:
+                    releaseSkew = round((max(releases) - min(releases)) * 1000, 3)
+                rows.append([
+                    barrier["group"],
+                    barrier["timer"],
+                    barrier["parties"],
+                    min(arrivals),
+                    max(arrivals),
+                    barrier["releaseTime"],
+                    round((max(arrivals) - min(arrivals)) * 1000, 3),
+                    releaseSkew,
+                ])
+        return rows
+
+    def getWorkerStatistics(self, groupName: str = None):
+        """
+            返回每个Worker在各个聚合点上的到达时间和释放时间
+            每一行为：group, timer, worker, 到达时间, 释放时间
+        """
+        rows = []
+        with self.barrierLock:
+            for barrier in self.barrierHistory:
+                if groupName is not None and barrier["group"] != groupName:
+                    continue
+                for record in barrier["workers"]:
+                    rows.append([barrier["group"], barrier["timer"], record["worker"],
+                                 record["arrival"], record["release"]])
+        return rows
+
+
+def startJobBarrierServer(host: str = "127.0.0.1", port: int = 0):
+    """
+        在后台线程中启动聚合点服务，port为0的时候使用随机端口，通过返回对象的url属性获得服务地址
+    """
+    server = JobBarrierServer(host=host, port=port)
+    serverThread = threading.Thread(target=server.serve_forever, daemon=True)
+    serverThread.name = "JobBarrierServer"
+    serverThread.start()
+    return server
+
+
+def stopJobBarrierServer(server: JobBarrierServer):
+    server.shutdown()
+    server.server_close()
+
+
+def waitJobBarrier(barrierURL: str, groupName: str, timerPoint: str,
+                   workerName: str, parties: int, timeout: float = None):
+    """
+        等待同组的parties个Worker都到达timerPoint
+        返回(到达时间, 释放时间)
+    """
+    host, port = barrierURL.rsplit(":", 1)
+    with socket.create_connection((host, int(port))) as barrierSocket:
+        barrierSocket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        barrierSocket.settimeout(timeout)
+        arrivalTime = time.time()
+        request = {
+            "op": "WAIT",
+            "group": groupName,
+            "timer": timerPoint,
+            "worker": workerName,
+            "parties": parties,
+            "arrival": arrivalTime,
+        }
+        barrierSocket.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        barrierFile = barrierSocket.makefile(mode="rb")
+        line = barrierFile.readline()
+        releaseTime = time.time()
+        barrierFile.close()
+        if not line:
+            raise ConnectionError("Job barrier server [" + barrierURL + "] closed the connection.")
+        barrierSocket.sendall((json.dumps({"op": "DONE", "released": releaseTime}) + "\n").encode("utf-8"))
+    return arrivalTime, releaseTime
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+    脚本解析结果的磁盘缓存
+
+    同一个脚本在回归测试中会被反复执行，每次执行都需要经过Antlr重新解析，而解析结果只和以下内容相关：
+        脚本内容、解析时的命名空间、语法定义（解析器的版本）、以及CONNECT语句引用的环境变量
+    这里将parseStatement的解析结果按照上述内容的哈希值保存在工作目录下，下次遇到相同的脚本直接读取
+    缓存文件需要反序列化，所以每个用户使用各自的子目录，只读取当前用户所有、其他用户不可写入的目录
+"""
+import os
+import getpass
+import hashlib
+import pickle
+import zlib
+import tempfile
+from .__init__ import __version__
+
+# 缓存文件所在的子目录名称
+PARSECACHE_DIRNAME = "testcli_parsecache"
+# 每个用户最多保留的缓存文件个数，超过后按照最后使用时间淘汰
+PARSECACHE_MAXFILES = 4096
+
+# 影响解析结果的文件，任何一个文件发生变化，都认为语法版本已经变化
+_grammarFiles = [
+    os.path.join("antlrgen", "SQLLexer.interp"),
+    os.path.join("antlrgen", "SQLParser.interp"),
+    os.path.join("antlrgen", "APILexer.interp"),
+    os.path.join("antlrgen", "APIParser.interp"),
+    "sqlvisitor.py",
+    "apivisitor.py",
+    "cmdexecute.py",
+    "common.py",
+]
+_grammarVersion = None
+
+
+def getGrammarVersion():
+    """
+        返回当前语法版本的标识，进程内只计算一次
+    """
+    global _grammarVersion
+    if _grammarVersion is None:
+        grammarHash = hashlib.sha1(__version__.encode("utf-8"))
+        for grammarFile in _grammarFiles:
+            grammarFile = os.path.join(os.path.dirname(__file__), grammarFile)
+            if os.path.isfile(grammarFile):
+                with open(grammarFile, mode="rb") as f:
+                    grammarHash.update(f.read())
+        _grammarVersion = grammarHash.hexdigest()
+    return _grammarVersion
+
+
+def getParseCacheDirectory(workDirectory: str):
+    """
+        缓存文件放在工作目录下当前用户的子目录中。在回归测试中，工作目录由T_WORK指定
+    """
+    if "T_WORK" in os.environ:
+        workDirectory = os.environ["T_WORK"]
+    if workDirectory is None:
+        workDirectory = os.getcwd()
+    try:
+        userName = getpass.getuser()
+    except Exception:
+        userName = "default"
+    return os.path.join(workDirectory, PARSECACHE_DIRNAME, userName)
+
+
+def isTrustedCacheDirectory(cacheDirectory: str):
+    """
+        缓存目录必须属于当前用户，而且其他用户不能写入，否则可能读取到他人伪造的缓存文件
+        不支持文件所有者的平台（Windows）上不做检查
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        dirStat = os.stat(cacheDirectory)
+    except OSError:
+        return False
+    return dirStat.st_uid == os.getuid() and (dirStat.st_mode & 0o022) == 0
+
+
+def getParseCacheKey(statement: str, nameSpace: str):
+    """
+        根据脚本内容、命名空间、语法版本生成缓存的键值
+        CONNECT语句在解析时会引用环境变量中的连接信息，所以这些环境变量也需要加入键值
+    """
+    keyHash = hashlib.sha256()
+    keyHash.update(getGrammarVersion().encode("utf-8"))
+    keyHash.update(b"\0" + str(nameSpace).encode("utf-8"))
+    for envName in ["SQLCLI_CONNECTION_URL", "TESTCLI_CONNECTION_URL"]:
+        keyHash.update(b"\0" + str(os.environ.get(envName)).encode("utf-8"))
+    keyHash.update(b"\0" + statement.encode("utf-8", errors="surrogatepass"))
+    return keyHash.hexdigest()
+
+
+def loadParseCache(cacheDirectory: str, cacheKey: str):
+    """
+        读取缓存的解析结果，缓存不存在或者损坏的时候返回None
+        读取后更新文件的修改时间，作为淘汰时的最后使用时间
+    """
+    cacheFile = os.path.join(cacheDirectory, cacheKey[:2], cacheKey)
+    if not os.path.isfile(cacheFile):
+        return None
+    if not isTrustedCacheDirectory(cacheDirectory):
+        if "TESTCLI_DEBUG" in os.environ:
+            print("[DEBUG] Ignore untrusted parse cache. [" + str(cacheDirectory) + "]")
+        return None
+    try:
+        with open(cacheFile, mode="rb") as f:
+            parseResult = pickle.loads(zlib.decompress(f.read()))
+    except Exception:
+        # 缓存文件可能在写入过程中被中断，忽略这种错误，重新解析即可
+        return None
+    try:
+        os.utime(cacheFile)
+    except OSError:
+        pass
+    return parseResult
+
+
+def pruneParseCache(cacheDirectory: str, maxFiles: int = PARSECACHE_MAXFILES):
+    """
+        缓存文件超过maxFiles个的时候，按照最后使用时间删除最早的文件，保留maxFiles的一半
+        多个进程可能同时淘汰，文件已经被删除的错误可以忽略
+    """
+    cacheFiles = []
+    for cacheSubDirectory in os.scandir(cacheDirectory):
+        if not cacheSubDirectory.is_dir():
+            continue
+        for cacheFile in os.scandir(cacheSubDirectory.path):
+            try:
+                cacheFiles.append((cacheFile.stat().st_mtime, cacheFile.path))
+            except OSError:
+                pass
+    if len(cacheFiles) <= maxFiles:
+        return 0
+    cacheFiles.sort()
+    nRemoved = 0
+    for _, cacheFile in cacheFiles[:len(cacheFiles) - maxFiles // 2]:
+        try:
+            os.remove(cacheFile)
+            nRemoved = nRemoved + 1
+        except OSError:
+            pass
+    return nRemoved
+
+
+def saveParseCache(cacheDirectory: str, cacheKey: str, parseResult, maxFiles: int = PARSECACHE_MAXFILES):
+    """
+        保存解析结果到缓存
+        多个进程可能同时写入同一个缓存文件，这里先写入临时文件再改名，保证读取到的文件总是完整的
+        只有没有命中缓存的时候才会写入，写入后检查缓存文件的总数，超过上限的时候淘汰
+    """
+    cacheSubDirectory = os.path.join(cacheDirectory, cacheKey[:2])
+    try:
+        os.makedirs(cacheDirectory, mode=0o700, exist_ok=True)
+        if not isTrustedCacheDirectory(cacheDirectory):
+            if "TESTCLI_DEBUG" in os.environ:
+                print("[DEBUG] Skip untrusted parse cache. [" + str(cacheDirectory) + "]")
+            return
+        os.makedirs(cacheSubDirectory, exist_ok=True)
+        fd, tempFile = tempfile.mkstemp(dir=cacheSubDirectory, prefix=cacheKey, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="wb") as f:
+                f.write(zlib.compress(pickle.dumps(parseResult, protocol=pickle.HIGHEST_PROTOCOL)))
+            os.replace(tempFile, os.path.join(cacheSubDirectory, cacheKey))
+        except Exception:
+            if os.path.exists(tempFile):
+                os.remove(tempFile)
+            raise
+        pruneParseCache(cacheDirectory, maxFiles)
+    except Exception:
+        # 缓存写入失败不影响脚本的执行
+        if "TESTCLI_DEBUG" in os.environ:
+            print("[DEBUG] Save parse cache failed. [" + str(cacheSubDirectory) + "]")
@@ -12,6 +12,7 @@ from difflib import SequenceMatcher
 from robot.errors import ExecutionFailed
 from robot.running.context import EXECUTION_CONTEXTS
 from collections import namedtuple
+from testcli.commands.compare import CompareLineFilter
 
 
 class DiffException(Exception):
@@ -322,115 +323,31 @@ class POSIXCompare:
         fileRawContent = open(file1, mode='r', encoding=CompareWorkEncoding).readlines()
         refFileRawContent = open(file2, mode='r', encoding=CompareRefEncoding).readlines()
 
-        workFileContent = open(file1, mode='r', encoding=CompareWorkEncoding).readlines()
-        refFileContent = open(file2, mode='r', encoding=CompareRefEncoding).readlines()
-
-        # lineno用来记录行号，在最后输出打印的时候，显示的是原始文件信息，而不是修正后的信息
-        lineno1 = []
-        lineno2 = []
-        for m_nPos in range(0, len(workFileContent)):
-            lineno1.append(m_nPos + 1)
-        for m_nPos in range(0, len(refFileContent)):
-            lineno2.append(m_nPos + 1)
-
-        # 去掉fileContent中的回车换行
-        for m_nPos in range(0, len(workFileContent)):
-            if workFileContent[m_nPos].endswith('\n'):
-                workFileContent[m_nPos] = workFileContent[m_nPos][:-1]
-        for m_nPos in range(0, len(refFileContent)):
-            if refFileContent[m_nPos].endswith('\n'):
-                refFileContent[m_nPos] = refFileContent[m_nPos][:-1]
-
-        # 去掉fileContent中的首尾空格
-        if CompareIgnoreTailOrHeadBlank:
-            for m_nPos in range(0, len(workFileContent)):
-                workFileContent[m_nPos] = workFileContent[m_nPos].lstrip().rstrip()
-            for m_nPos in range(0, len(refFileContent)):
-                refFileContent[m_nPos] = refFileContent[m_nPos].lstrip().rstrip()
-
-        # 去除在SkipLine里头的所有内容
-        if skipLines is not None:
-            m_nPos = 0
-            while m_nPos < len(workFileContent):
-                bMatch = False
-                for pattern in skipLines:
-                    if self.compare_string(workFileContent[m_nPos], pattern,
-                                           p_compare_maskEnabled=True,
-                                           p_compare_ignoreCase=True):
-                        workFileContent.pop(m_nPos)
-                        lineno1.pop(m_nPos)
-                        bMatch = True
-                        break
-                if not bMatch:
-                    m_nPos = m_nPos + 1
-
-            m_nPos = 0
-            while m_nPos < len(refFileContent):
-                bMatch = False
-                for pattern in skipLines:
-                    if self.compare_string(refFileContent[m_nPos], pattern,
-                                           p_compare_maskEnabled=True,
-                                           p_compare_ignoreCase=True):
-                        refFileContent.pop(m_nPos)
-                        lineno2.pop(m_nPos)
-                        bMatch = True
-                        break
-                if not bMatch:
-                    m_nPos = m_nPos + 1
-
-        # 去除所有的空行
-        if ignoreEmptyLine:
-            m_nPos = 0
-            while m_nPos < len(workFileContent):
-                if len(workFileContent[m_nPos].strip()) == 0:
-                    workFileContent.pop(m_nPos)
-                    lineno1.pop(m_nPos)
-                else:
-                    m_nPos = m_nPos + 1
-            m_nPos = 0
-            while m_nPos < len(refFileContent):
-                if len(refFileContent[m_nPos].strip()) == 0:
-                    refFileContent.pop(m_nPos)
-                    lineno2.pop(m_nPos)
+        # MaskLine的格式为 pattern=>target，格式或者正则表达式不正确的规则直接忽略
+        maskPatterns = {}
+        if maskLines is not None:
+            for pattern in maskLines:
+                m_SQLMask = pattern.split("=>")
+                if len(m_SQLMask) == 2:
+                    m_SQLMaskPattern = m_SQLMask[0]
+                    m_SQLMaskTarget = m_SQLMask[1]
+                    try:
+                        re.compile(m_SQLMaskPattern, re.IGNORECASE)
+                        maskPatterns[m_SQLMaskPattern] = m_SQLMaskTarget
+                    except re.error as rex:
+                        print("LogMask Hint Error, rex =>: [" + str(m_SQLMaskPattern) + "::" + str(rex) + "]")
                 else:
-                    m_nPos = m_nPos + 1
+                    print("LogMask Hint Error, missed =>: [" + pattern + "]")
 
-        # 处理MaskLine中的信息，对ref, Work文件进行替换
-        if maskLines is not None:
-            m_nPos = 0
-            while m_nPos < len(refFileContent):
-                for pattern in maskLines:
-                    m_SQLMask = pattern.split("=>")
-                    if len(m_SQLMask) == 2:
-                        m_SQLMaskPattern = m_SQLMask[0]
-                        m_SQLMaskTarget = m_SQLMask[1]
-                        try:
-                            if re.search(m_SQLMaskPattern, refFileContent[m_nPos], re.IGNORECASE) is not None:
-                                refFileContent[m_nPos] = \
-                                    re.sub(m_SQLMaskPattern, m_SQLMaskTarget, refFileContent[m_nPos],
-                                           flags=re.IGNORECASE)
-                        except re.error as rex:
-                            print("LogMask Hint Error, rex =>: [" + str(m_SQLMaskPattern) + "::" + str(rex) + "]")
-                    else:
-                        print("LogMask Hint Error, missed =>: [" + pattern + "]")
-                m_nPos = m_nPos + 1
-            m_nPos = 0
-            while m_nPos < len(workFileContent):
-                for pattern in maskLines:
-                    m_SQLMask = pattern.split("=>")
-                    if len(m_SQLMask) == 2:
-                        m_SQLMaskPattern = m_SQLMask[0]
-                        m_SQLMaskTarget = m_SQLMask[1]
-                        try:
-                            if re.search(m_SQLMaskPattern, workFileContent[m_nPos], re.IGNORECASE) is not None:
-                                workFileContent[m_nPos] = \
-                                    re.sub(m_SQLMaskPattern, m_SQLMaskTarget, workFileContent[m_nPos],
-                                           flags=re.IGNORECASE)
-                        except re.error as rex:
-                            print("LogMask Hint Error, rex =>: [" + str(m_SQLMaskPattern) + "::" + str(rex) + "]")
-                    else:
-                        print("LogMask Hint Error, missed =>: [" + pattern + "]")
-                m_nPos = m_nPos + 1
+        # 去掉回车换行、首尾空格，去除SkipLine和空行，处理MaskLine
+        # lineno用来记录行号，在最后输出打印的时候，显示的是原始文件信息，而不是修正后的信息
+        compareFilter = CompareLineFilter(
+            skipLines=skipLines,
+            maskLines=maskPatterns,
+            ignoreEmptyLine=ignoreEmptyLine,
+            ignoreTailOrHeadBlank=CompareIgnoreTailOrHeadBlank)
+        workFileContent, lineno1 = compareFilter.filterLines(fileRawContent)
+        refFileContent, lineno2 = compareFilter.filterLines(refFileRawContent)
 
         # 输出两个信息
         # 1：  Compare的结果是否存在dif，True/False
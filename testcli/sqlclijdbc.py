@@ -468,6 +468,8 @@ class Cursor(object):
     _stmt = None
     _rs = None
     _description = None
+    _converterPlan = None
+    _fetchSize = None
     warnings = None
 
     # 默认的fetchmany返回记录数，100
@@ -536,6 +538,8 @@ class Cursor(object):
         self._prep = None
         self._meta = None
         self._description = None
+        self._converterPlan = None
+        self._fetchSize = None
 
     def _set_stmt_parms(self, prep_stmt, parameters):
         if self:
@@ -578,6 +582,7 @@ class Cursor(object):
         self._rs = self._stmt.getResultSet()
         if self._rs is not None:
             self._meta = self._rs.getMetaData()
+            self._buildConverterPlan()
             self.rowcount = self._stmt.getUpdateCount()
         else:
             self._meta = None
@@ -619,6 +624,7 @@ class Cursor(object):
         self._rs = self._prep.getResultSet()
         if self._rs is not None:
             self._meta = self._rs.getMetaData()
+            self._buildConverterPlan()
         else:
             self._meta = None
         if is_rs:
@@ -645,57 +651,88 @@ class Cursor(object):
         self.rowcount = sum(update_counts)
         self._close_last()
 
+    def _planColumnConverter(self, col, columnDataType=None):
+        # 根据结果集的元数据信息确定某一列的数据转换函数
+        # columnDataType仅对GEOMETRY/GEOGRAPHY这类需要根据实际数据类型判断的列有意义
+        sqltype = self._meta.getColumnType(col)
+        columnClassName = self._meta.getColumnClassName(col)
+        columnTypeName = self._meta.getColumnTypeName(col)
+
+        if columnClassName is None:
+            # NULL值
+            converter = _DEFAULT_CONVERTERS["VARCHAR"]
+        elif columnClassName in 'org.postgresql.util.PGmoney':
+            converter = _DEFAULT_CONVERTERS["VARCHAR"]
+        elif columnClassName in ['oracle.sql.TIMESTAMPTZ']:
+            converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_TIMEZONE"]
+        elif columnClassName in ['dm.jdbc.driver.DmdbTimestamp']:
+            converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_TIMEZONE"]
+        elif columnClassName in ['oracle.sql.TIMESTAMPLTZ']:
+            converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_LOCAL_TIME_ZONE"]
+        elif columnClassName.upper().find("BFILE") != -1:
+            converter = _DEFAULT_CONVERTERS["BFILE"]
+        elif columnTypeName in ['YEAR']:              # mysql数据类型
+            converter = _DEFAULT_CONVERTERS["YEAR"]
+        elif columnTypeName in ['timestamptz']:       # PG数据类型
+            converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_TIMEZONE"]
+        elif columnClassName in ['java.sql.SQLXML']:       # SQLXML
+            converter = _DEFAULT_CONVERTERS["VARCHAR"]
+        elif str(columnDataType).find("'byte[]'") != -1 and \
+                columnTypeName.upper() in ['GEOMETRY', 'GEOGRAPHY']:
+            converter = _DEFAULT_CONVERTERS["BINARY"]
+        else:
+            if sqltype in self._converters.keys():
+                converter = self._converters.get(sqltype)
+            else:
+                converter = _unknownSqlTypeConverter
+                if "TESTCLI_DEBUG" in os.environ:
+                    warnings.warn("Unknown JDBC convert with constant value " + str(sqltype) +
+                                  ":" + str(columnClassName))
+        if "TESTCLI_DEBUG" in os.environ:
+            print("[DEBUG] JDBC SQLType=[" + str(converter.__name__) + "] for col [" + str(col) + "]. " +
+                  "sqltype=[" + str(sqltype) + ":" + str(columnClassName) + ":" + str(columnTypeName) + "]")
+
+        # GEOMETRY/GEOGRAPHY的转换函数取决于getObject返回的实际类型，需要在每行数据上检查
+        # 其他列的转换函数只和元数据有关，在整个结果集中保持不变
+        if columnTypeName is not None and columnTypeName.upper() in ['GEOMETRY', 'GEOGRAPHY']:
+            dynamicType = True
+        else:
+            dynamicType = False
+
+        # 批量读取模式下，对于基本数据类型直接使用JDBC的类型化接口读取，减少JPype的调用次数
+        # 只有在通用转换函数下才能替换，其他转换函数有各自的特殊处理
+        bulkReader = None
+        if converter is _java_to_py and not dynamicType:
+            bulkReader = _BULK_READERS.get(columnClassName)
+        return [converter, columnClassName, dynamicType, columnDataType, bulkReader]
+
+    def _buildConverterPlan(self):
+        # 每个结果集只计算一次列的转换函数，避免每行每列重复通过JPype访问元数据
+        self._converterPlan = []
+        if self._meta is None:
+            return
+        for col in range(1, self._meta.getColumnCount() + 1):
+            self._converterPlan.append(self._planColumnConverter(col))
+
     def fetchone(self):
         if not self._rs:
             raise Error()
         if not self._rs.next():
             return None
+        if self._converterPlan is None:
+            self._buildConverterPlan()
         row = []
-        for col in range(1, self._meta.getColumnCount() + 1):
-            sqltype = self._meta.getColumnType(col)
-            columnClassName = self._meta.getColumnClassName(col)
-            columnTypeName = self._meta.getColumnTypeName(col)
-            if columnTypeName != "LONG":
-                # Oracle的LONG类型不支持getObject函数
-                columnDataType = type(self._rs.getObject(col))
-            else:
-                columnDataType = str
-
-            if columnClassName is None:
-                # NULL值
-                converter = _DEFAULT_CONVERTERS["VARCHAR"]
-            elif columnClassName in 'org.postgresql.util.PGmoney':
-                converter = _DEFAULT_CONVERTERS["VARCHAR"]
-            elif columnClassName in ['oracle.sql.TIMESTAMPTZ']:
-                converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_TIMEZONE"]
-            elif columnClassName in ['dm.jdbc.driver.DmdbTimestamp']:
-                converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_TIMEZONE"]
-            elif columnClassName in ['oracle.sql.TIMESTAMPLTZ']:
-                converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_LOCAL_TIME_ZONE"]
-            elif columnClassName.upper().find("BFILE") != -1:
-                converter = _DEFAULT_CONVERTERS["BFILE"]
-            elif columnTypeName in ['YEAR']:              # mysql数据类型
-                converter = _DEFAULT_CONVERTERS["YEAR"]
-            elif columnTypeName in ['timestamptz']:       # PG数据类型
-                converter = _DEFAULT_CONVERTERS["TIMESTAMP_WITH_TIMEZONE"]
-            elif columnClassName in ['java.sql.SQLXML']:       # SQLXML
-                converter = _DEFAULT_CONVERTERS["VARCHAR"]
-            elif str(columnDataType).find("'byte[]'") != -1 and \
-                    columnTypeName.upper() in ['GEOMETRY', 'GEOGRAPHY']:
-                converter = _DEFAULT_CONVERTERS["BINARY"]
-            else:
-                if sqltype in self._converters.keys():
-                    converter = self._converters.get(sqltype)
-                else:
-                    converter = _unknownSqlTypeConverter
-                    if "TESTCLI_DEBUG" in os.environ:
-                        warnings.warn("Unknown JDBC convert with constant value " + str(sqltype) +
-                                      ":" + self._meta.getColumnClassName(col))
-            if "TESTCLI_DEBUG" in os.environ:
-                print("[DEBUG] JDBC SQLType=[" + str(converter.__name__) + "] for col [" + str(col) + "]. " +
-                      "sqltype=[" + str(sqltype) + ":" + str(columnClassName) + ":" + columnTypeName + "]")
-            v = converter(self._connection.jconn, self._rs, col, columnClassName)
-            row.append(v)
+        jconn = self._connection.jconn
+        rs = self._rs
+        col = 0
+        for columnPlan in self._converterPlan:
+            col = col + 1
+            if columnPlan[2]:
+                # 列的实际数据类型发生了变化（比如第一行是NULL），需要重新确定转换函数
+                columnDataType = type(rs.getObject(col))
+                if columnDataType != columnPlan[3]:
+                    columnPlan[:] = self._planColumnConverter(col, columnDataType)
+            row.append(columnPlan[0](jconn, rs, col, columnPlan[1]))
         return tuple(row)
 
     def fetchmany(self, size=None):
@@ -717,6 +754,42 @@ class Cursor(object):
             self._rs.setFetchSize(0)
         return rows
 
+    def fetchmanycolumns(self, size=None):
+        """
+            批量读取结果集，返回按列组织的数据
+            返回的内容为一个二维数组，第一维为列，第二维为行。 如[[1, 2, 3], ['a', 'b', 'c']]
+            对于简单类型的列，直接使用getString/getInt等类型化接口，不再对每个单元格调用getObject
+        """
+        if not self._rs:
+            raise Error()
+        if size is None:
+            size = self.arraysize
+        if self._fetchSize != size:
+            self._rs.setFetchSize(size)
+            self._fetchSize = size
+        if self._converterPlan is None:
+            self._buildConverterPlan()
+        plan = self._converterPlan
+        jconn = self._connection.jconn
+        rs = self._rs
+        rsNext = rs.next
+        columns = [[] for _ in plan]
+        readers = [(col, plan[col - 1], columns[col - 1].append) for col in range(1, len(plan) + 1)]
+        fetchedRows = 0
+        while fetchedRows < size and rsNext():
+            fetchedRows = fetchedRows + 1
+            for col, columnPlan, append in readers:
+                if columnPlan[4] is not None:
+                    append(columnPlan[4](rs, col))
+                    continue
+                if columnPlan[2]:
+                    # 列的实际数据类型发生了变化，需要重新确定转换函数
+                    columnDataType = type(rs.getObject(col))
+                    if columnDataType != columnPlan[3]:
+                        columnPlan[:] = self._planColumnConverter(col, columnDataType)
+                append(columnPlan[0](jconn, rs, col, columnPlan[1]))
+        return columns
+
     def fetchall(self):
         rows = []
         while True:
@@ -1134,6 +1207,59 @@ def _java_to_py_array(conn, rs, col, p_objColumnSQLType=None):
             "] in _java_to_py_array")
 
 
+def _read_string(rs, col):
+    # convertStrings开启的情况下，getString直接返回Python的字符串
+    return rs.getString(col)
+
+
+def _read_int(rs, col):
+    java_val = rs.getInt(col)
+    if java_val == 0 and rs.wasNull():
+        return None
+    return int(java_val)
+
+
+def _read_long(rs, col):
+    java_val = rs.getLong(col)
+    if java_val == 0 and rs.wasNull():
+        return None
+    return decimal.Decimal(int(java_val))
+
+
+def _read_bigdecimal(rs, col):
+    java_val = rs.getBigDecimal(col)
+    if java_val is None:
+        return None
+    return decimal.Decimal(java_val.toPlainString())
+
+
+def _read_float(rs, col):
+    java_val = rs.getFloat(col)
+    if java_val == 0 and rs.wasNull():
+        return None
+    return float(java_val)
+
+
+def _read_boolean(rs, col):
+    java_val = rs.getBoolean(col)
+    if not java_val and rs.wasNull():
+        return None
+    return bool(java_val)
+
+
+# 批量读取模式下可以直接使用类型化接口读取的Java类，和_javaobj_to_pyobj的转换结果保持一致
+_BULK_READERS = {
+    "java.lang.String":                 _read_string,
+    "java.lang.Integer":                _read_int,
+    "java.lang.Short":                  _read_int,
+    "java.lang.Byte":                   _read_int,
+    "java.lang.Long":                   _read_long,
+    "java.math.BigDecimal":             _read_bigdecimal,
+    "java.lang.Float":                  _read_float,
+    "java.lang.Boolean":                _read_boolean,
+}
+
+
 def _init_types(types_map):
     global _jdbc_name_to_const
     _jdbc_name_to_const = types_map
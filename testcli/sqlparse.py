@@ -1,10 +1,61 @@
 # -*- coding: utf-8 -*-
+import threading
 from antlr4 import InputStream
 from antlr4 import CommonTokenStream
 from antlr4.error.ErrorListener import ErrorListener
 from .antlrgen.SQLLexer import SQLLexer
 from .antlrgen.SQLParser import SQLParser
 from .sqlvisitor import SQLVisitor
+from .globalvar import globalParserOption
+
+# 可以复用的词法和语法解析器，每个线程各自保留一组
+# Antlr的ATN和DFA缓存本身是类级别共享的，这里复用的是解析器对象，避免每次解析都重新构造
+sqlParserPool = threading.local()
+
+# 用来预热解析器的典型语句，覆盖了主要的语法分支
+# 新进程中前几次解析需要构造DFA缓存，会明显慢于随后的解析，预热可以提前完成大部分DFA缓存的构造
+sqlWarmUpStatements = [
+    "_connect /mem",
+    "_connect user/password@jdbc:h2:tcp://127.0.0.1:9092/mem:db",
+    "_disconnect",
+    "_session show;",
+    "_set echo on",
+    "_use api",
+    "create table aaa (id int, name varchar(20));",
+    "insert into aaa values(10, 'abc');",
+    "select * from aaa where id = 10;",
+    "SELECT ID, Name, 'abcdefghijklmnopqrstuvwxyz', \"ABCDEFGHIJKLMNOPQRSTUVWXYZ\", 0123456789, 1.5e-3,\n"
+    "    !#$%&()*+,-./:<=>?@[\\]^_`{|}~ FROM dual -- comment\n  /* comment */ WHERE 1=1;",
+    "_set output_format csv\n",
+    "_SET ECHO OFF;",
+    "update aaa set id = 20;",
+    "delete from aaa;",
+    "drop table aaa;",
+    "create or replace procedure p1 as\nbegin\n  null;\nend;\n/",
+    "declare\n  x int;\nbegin\n  x := 1;\nend;\n/",
+    "> {%\nx = 1\n%}",
+    "_assert {% x == 1 %}",
+    "_if {% 3==2 %}",
+    "_endif",
+    "_loop begin until {% i==3 %}",
+    "_loop end",
+    "_sleep 1;",
+    "_start test.sql 1 2",
+    "_load plugin test.py;",
+    "_whenever error continue;",
+    "_job show all;",
+    "_job create jobtest loop=4 parallel=2;",
+    "_compare set;",
+    "_compare a.log b.log;",
+    "_monitor monitormanager on workers 3;",
+    "_host date",
+    "_spool test.log",
+    "_spool off",
+    "_echo test.txt\nhello\necho off",
+    "_help",
+    "-- [Hint] order",
+    "_exit 0",
+]
 
 
 class SQLClientErrorListener(ErrorListener):
@@ -75,13 +126,25 @@ def SQLAnalyze(sqlCommandPlainText, defaultNameSpace="SQL"):
 
     # 调用Antlr进行语法解析，并自定义错误监听
     stream = InputStream(sqlCommandPlainText)
-    lexer = SQLLexer(stream)
+    if globalParserOption["pool"]:
+        # 复用当前线程中已有的解析器，重新设置输入后解析器的状态会被完全重置
+        if not hasattr(sqlParserPool, "lexer"):
+            sqlParserPool.lexer = SQLLexer(stream)
+            sqlParserPool.parser = SQLParser(CommonTokenStream(sqlParserPool.lexer))
+        lexer = sqlParserPool.lexer
+        lexer.inputStream = stream
+    else:
+        lexer = SQLLexer(stream)
     lexer.removeErrorListeners()
     lexer_listener = SQLClientErrorListener()
     lexer.addErrorListener(lexer_listener)
 
     token = CommonTokenStream(lexer)
-    parser = SQLParser(token)
+    if globalParserOption["pool"]:
+        parser = sqlParserPool.parser
+        parser.setTokenStream(token)
+    else:
+        parser = SQLParser(token)
     parser.removeErrorListeners()
     parser_listener = SQLClientErrorListener()
     parser.addErrorListener(parser_listener)
@@ -110,3 +173,11 @@ def SQLAnalyze(sqlCommandPlainText, defaultNameSpace="SQL"):
         else:
             errorMsg = parseErrorMsg
     return isFinished, parsedObjects, errorCode, errorMsg
+
+
+def SQLWarmUp():
+    """
+        预热SQL解析器，构造DFA缓存
+    """
+    for statement in sqlWarmUpStatements:
+        SQLAnalyze(statement)
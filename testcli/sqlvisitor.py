@@ -1554,11 +1554,18 @@ class SQLVisitor(SQLParserVisitor):
     def visitMonitor(self, ctx: SQLParser.MonitorContext):
         parsedObject = {'name': 'MONITOR'}
 
+        # 任务名称和参数。语句不完整的时候（错误信息由解析器给出），这里可能没有任何内容
+        expressions = [str(expression.getText()).strip() for expression in ctx.monitorExpression()]
+        if len(expressions) != 0:
+            taskName = expressions[0]
+        else:
+            taskName = None
+
         if ctx.MONITOR_MANAGER() is not None:
             if ctx.MONITOR_ON() is not None:
                 parsedObject.update({'action': 'startManager'})
-                if ctx.MONITOR_WORKERS() is not None:
-                    workerThreads = int(ctx.MONITOR_EXPRESSION()[0].getText())
+                if ctx.MONITOR_WORKERS() is not None and len(expressions) != 0:
+                    workerThreads = int(expressions[0])
                 else:
                     workerThreads = None
                 parsedObject.update({'workerThreads': workerThreads})
@@ -1569,42 +1576,54 @@ class SQLVisitor(SQLParserVisitor):
             nPos = 0
             param = {}
             paramKey = None
-            if len(ctx.MONITOR_EXPRESSION()) % 2 == 0:
+            if len(expressions) % 2 == 0:
                 # 省略了taskName
                 parsedObject.update({"taskName": "NO-NAME"})
-                for expression in ctx.MONITOR_EXPRESSION():
+                for expression in expressions:
                     if paramKey is None:
-                        paramKey = str(expression.getText()).strip()
+                        paramKey = expression
                     else:
-                        paramValue = str(expression.getText()).strip()
+                        paramValue = expression
                         param[paramKey.upper()] = paramValue
                         paramKey = None
                     nPos = nPos + 1
             else:
-                for expression in ctx.MONITOR_EXPRESSION():
+                for expression in expressions:
                     if nPos == 0:
-                        parsedObject.update({"taskName": expression.getText().strip()})
+                        parsedObject.update({"taskName": expression})
                     else:
                         if paramKey is None:
-                            paramKey = str(expression.getText()).strip()
+                            paramKey = expression
                         else:
-                            paramValue = str(expression.getText()).strip()
+                            paramValue = expression
                             param[paramKey.upper()] = paramValue
                             paramKey = None
                     nPos = nPos + 1
             parsedObject.update({"param": param})
         if ctx.MONITOR_START() is not None:
             parsedObject.update({"action": "startTask"})
-            taskName = str(ctx.MONITOR_EXPRESSION()[0].getText()).strip()
             parsedObject.update({"taskName": taskName})
         if ctx.MONITOR_STOP() is not None:
             parsedObject.update({"action": "stopTask"})
-            taskName = str(ctx.MONITOR_EXPRESSION()[0].getText()).strip()
             parsedObject.update({"taskName": taskName})
         if ctx.MONITOR_REPORT() is not None:
             parsedObject.update({"action": "reportTask"})
-            taskName = str(ctx.MONITOR_EXPRESSION()[0].getText()).strip()
             parsedObject.update({"taskName": taskName})
+        if ctx.MONITOR_SUMMARY() is not None or ctx.MONITOR_EXPORT() is not None:
+            if ctx.MONITOR_SUMMARY() is not None:
+                parsedObject.update({"action": "summaryTask"})
+            else:
+                parsedObject.update({"action": "exportTask"})
+            parsedObject.update({"taskName": taskName})
+            param = {}
+            for nPos in range(1, len(expressions) - 1, 2):
+                paramValue = expressions[nPos + 1]
+                if paramValue.startswith("'") and paramValue.endswith("'"):
+                    paramValue = paramValue[1:-1]
+                elif paramValue.startswith('"') and paramValue.endswith('"'):
+                    paramValue = paramValue[1:-1]
+                param[expressions[nPos].upper()] = paramValue
+            parsedObject.update({"param": param})
         if ctx.MONITOR_LIST() is not None:
             parsedObject.update({"action": "listTask"})
 
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+    数据文件生成的性能测试
+    以典型的数据公式为例，分别统计：
+        逐行解释执行(get_final_string)的生成速度
+        编译后的行模板(RowTemplate)批量生成的速度
+        _DATA CREATE生成文件的速度（单进程/多进程）
+
+    运行方式：
+        python -m testcli.test.benchdata [rows] [parallel]
+"""
+import os
+import sys
+import time
+import tempfile
+
+benchFormulas = [
+    ("identity", "{identity(1)},{identity(100)}"),
+    ("random_string",
+     "{random_ascii_letters(10)},{random_ascii_lowercase(5)},{random_ascii_uppercase(5)},"
+     "{random_digits(8)},{random_ascii_letters_and_digits(12)}"),
+    ("random_time",
+     "{random_date(2020-01-01,2021-01-01)},{random_timestamp(2020-01-01 00:00:00,2021-01-01 00:00:00)},"
+     "{random_time(01:00:00,02:00:00)},{random_boolean()}"),
+    ("mixed",
+     "{identity(1)},'{c1:random_ascii_letters(10)}','{value(:c1)}',{random_digits(6)},"
+     "{random_date(2020-01-01,2021-01-01)}"),
+]
+
+
+def benchFormula(formula, rows):
+    from ..commands.data import parse_formula_str
+    from ..commands.data import get_final_string
+    from ..commands.data import RowTemplate
+    from ..commands.data import reset_identity
+
+    rowStruct = parse_formula_str(formula)
+    startTime = time.time()
+    for i in range(0, rows):
+        get_final_string(rowStruct)
+    interpretElapsed = time.time() - startTime
+    reset_identity()
+
+    startTime = time.time()
+    RowTemplate(rowStruct).generateRows(rows)
+    compiledElapsed = time.time() - startTime
+    reset_identity()
+    return interpretElapsed, compiledElapsed
+
+
+def benchCreateFile(formula, rows, parallel):
+    from ..commands.data import createFile
+
+    targetFile = os.path.join(tempfile.gettempdir(), "testcli_benchdata.txt")
+    startTime = time.time()
+    createFile("FS", targetFile, formula, rows, p_parallel=parallel)
+    elapsed = time.time() - startTime
+    os.remove(targetFile)
+    return elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    parallel = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    for formulaName, formula in benchFormulas:
+        interpretElapsed, compiledElapsed = benchFormula(formula, rows)
+        print("%-14s interpret %8.0f rows/sec, compiled %8.0f rows/sec, speedup %.1fx." %
+              (formulaName, rows / interpretElapsed, rows / compiledElapsed, interpretElapsed / compiledElapsed))
+
+    formula = benchFormulas[-1][1]
+    for nParallel in sorted({1, parallel}):
+        elapsed = benchCreateFile(formula, rows, nParallel)
+        print("CREATE FILE    parallel %-3d %d rows in %.2f seconds, %.0f rows/sec." %
+              (nParallel, rows, elapsed, rows / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+    HDFS数据文件读写的性能测试
+    使用本地的WebHDFS模拟服务(testwebhdfsserver)，不需要真实的HDFS集群，分别统计：
+        每一批数据单独发起写请求和只使用一个写会话流式写入的速度
+        FS/MEM/HDFS之间文件转换的速度
+
+    运行方式：
+        python -m testcli.test.benchhdfs [megabytes]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+
+def benchWrite(client, hdfsFileName, chunks, streaming):
+    startTime = time.time()
+    if streaming:
+        client.write(hdfs_path=hdfsFileName, data=iter(chunks), overwrite=True)
+    else:
+        # 每一批数据发起一次写请求(CREATE + APPEND...)
+        for nChunk, chunk in enumerate(chunks):
+            if nChunk == 0:
+                client.write(hdfs_path=hdfsFileName, data=chunk, overwrite=True)
+            else:
+                client.write(hdfs_path=hdfsFileName, data=chunk, append=True)
+    return time.time() - startTime
+
+
+def benchConvert(srcFileType, srcFileName, dstFileType, dstFileName):
+    from ..commands.data import convertFile
+
+    startTime = time.time()
+    convertFile(srcFileType=srcFileType, srcFileName=srcFileName,
+                dstFileType=dstFileType, dstFileName=dstFileName)
+    return time.time() - startTime
+
+
+def main():
+    from hdfs.client import Client
+    from ..test.testwebhdfsserver import startWebHdfsServer
+    from ..test.testwebhdfsserver import stopWebHdfsServer
+
+    megaBytes = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    webHdfsServer = startWebHdfsServer()
+    workDir = tempfile.mkdtemp(prefix="testcli_benchhdfs")
+    try:
+        # 按照数据生成的批次大小（10W行，约4M）切分测试数据
+        chunk = (("%039d\n" % 0) * (4 * 1024 * 1024 // 40)).encode()
+        chunks = [chunk] * max(1, megaBytes * 1024 * 1024 // len(chunk))
+        totalBytes = len(chunk) * len(chunks)
+        client = Client(url=webHdfsServer.url, root="/")
+        for streaming in [False, True]:
+            elapsed = benchWrite(client, "/bench/write.dat", chunks, streaming)
+            print("WRITE   %-16s %d MB in %.2f seconds, %.1f MB/sec." %
+                  ("single session" if streaming else "request per batch",
+                   totalBytes // 1024 // 1024, elapsed, totalBytes / 1024 / 1024 / elapsed))
+
+        localFile = os.path.join(workDir, "local.dat")
+        with open(localFile, mode="wb") as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+        hdfsFile = webHdfsServer.url + "/bench/convert.dat"
+        for srcFileType, srcFileName, dstFileType, dstFileName in [
+            ("FS", localFile, "FS", os.path.join(workDir, "copy.dat")),
+            ("FS", localFile, "MEM", "bench.dat"),
+            ("MEM", "bench.dat", "FS", os.path.join(workDir, "mem.dat")),
+            ("FS", localFile, "HDFS", hdfsFile),
+            ("HDFS", hdfsFile, "FS", os.path.join(workDir, "hdfs.dat")),
+        ]:
+            elapsed = benchConvert(srcFileType, srcFileName, dstFileType, dstFileName)
+            print("CONVERT %-4s -> %-4s     %d MB in %.2f seconds, %.1f MB/sec." %
+                  (srcFileType, dstFileType, totalBytes // 1024 // 1024, elapsed, totalBytes / 1024 / 1024 / elapsed))
+    finally:
+        stopWebHdfsServer(webHdfsServer)
+        shutil.rmtree(workDir)
+        shutil.rmtree(webHdfsServer.rootDir)
+
+
+if __name__ == '__main__':
+    main()
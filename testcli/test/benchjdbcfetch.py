@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+    JDBC结果集读取的性能测试
+    在H2内存数据库中构造测试数据，分别用逐行读取(fetchmany)和批量读取(fetchmanycolumns)的方式读取，并输出每秒读取的行数
+
+    运行方式：
+        python -m testcli.test.benchjdbcfetch [rows] [fetchsize]
+"""
+import os
+import sys
+import time
+from ..sqlclijdbc import connect as jdbcconnect
+
+
+def prepareData(conn, rows):
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS BENCH_FETCH")
+    cursor.execute("CREATE TABLE BENCH_FETCH(ID INT, NAME VARCHAR(64), AMOUNT BIGINT, "
+                   "PRICE DECIMAL(12, 2), UPDATED TIMESTAMP)")
+    cursor.execute("INSERT INTO BENCH_FETCH "
+                   "SELECT X, 'NAME-' || X, X * 1000, X / 3, DATEADD(SECOND, X, TIMESTAMP '2020-01-01 00:00:00') "
+                   "FROM SYSTEM_RANGE(1, " + str(rows) + ")")
+    cursor.close()
+
+
+def benchFetch(conn, fetchMode, fetchSize):
+    cursor = conn.cursor()
+    startTime = time.time()
+    cursor.execute("SELECT * FROM BENCH_FETCH")
+    fetchedRows = 0
+    while True:
+        if fetchMode == "ROW":
+            rowCount = len(cursor.fetchmany(fetchSize))
+        else:
+            rowCount = len(cursor.fetchmanycolumns(fetchSize)[0])
+        fetchedRows = fetchedRows + rowCount
+        if rowCount < fetchSize:
+            break
+    elapsed = time.time() - startTime
+    cursor.close()
+    return fetchedRows, elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    fetchSize = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    h2JarFile = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "jlib", "h2-2.2.224.jar"))
+    conn = jdbcconnect(
+        jclassname="org.h2.Driver",
+        url="jdbc:h2:mem:benchfetch",
+        driverArgs={'user': 'sa', 'password': 'sa'},
+        jars=h2JarFile)
+    prepareData(conn, rows)
+
+    for fetchMode in ["ROW", "BULK"]:
+        fetchedRows, elapsed = benchFetch(conn, fetchMode, fetchSize)
+        print("%-5s fetched %d rows in %.2f seconds, %.0f rows/sec." %
+              (fetchMode, fetchedRows, elapsed, fetchedRows / elapsed))
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
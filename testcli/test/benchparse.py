@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+    语句解析的性能测试
+    以测试目录下的脚本作为典型语句集合，分别统计：
+        新进程中首次解析（未预热/预热后）的耗时
+        复用解析器(PARSER_POOL ON)和每次新建解析器(PARSER_POOL OFF)的解析速度
+
+    运行方式：
+        python -m testcli.test.benchparse [loops]
+"""
+import os
+import sys
+import glob
+import time
+import multiprocessing
+
+
+def loadCorpus():
+    from ..cmdexecute import CmdExecute
+    from ..testoption import TestOptions
+
+    corpus = []
+    testDirectory = os.path.dirname(__file__)
+    for nameSpace, pattern in [("SQL", "*.sql"), ("API", "*.api")]:
+        for scriptFile in sorted(glob.glob(os.path.join(testDirectory, pattern))):
+            with open(scriptFile, mode="r", encoding="utf-8") as f:
+                script = f.read().strip()
+            cmdExecuteHandler = CmdExecute()
+            cmdExecuteHandler.testOptions = TestOptions()
+            cmdExecuteHandler.testOptions.set("NAMESPACE", nameSpace)
+            parseResults, parseResultsWithComments, parseHints = \
+                cmdExecuteHandler.parseStatement(statement=script, nameSpace=nameSpace)
+            for parseResult, statement in zip(parseResults, parseResultsWithComments):
+                if parseResult is not None and parseResult["name"] != "USE":
+                    corpus.append((nameSpace, statement))
+    return corpus
+
+
+def parseCorpus(corpus):
+    from ..sqlparse import SQLAnalyze
+    from ..apiparse import APIAnalyze
+
+    startTime = time.time()
+    for nameSpace, statement in corpus:
+        if nameSpace == "SQL":
+            SQLAnalyze(statement)
+        else:
+            APIAnalyze(statement)
+    return time.time() - startTime
+
+
+def benchColdStart(corpus, warmUp, resultQueue):
+    # 在全新的进程中运行，统计首次解析的耗时
+    from ..sqlparse import SQLWarmUp
+    from ..apiparse import APIWarmUp
+
+    warmUpElapsed = 0
+    if warmUp:
+        startTime = time.time()
+        SQLWarmUp()
+        APIWarmUp()
+        warmUpElapsed = time.time() - startTime
+    resultQueue.put((warmUpElapsed, parseCorpus(corpus), parseCorpus(corpus)))
+
+
+def main():
+    from ..globalvar import globalParserOption
+
+    loops = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    corpus = loadCorpus()
+    print("Corpus: %d statements." % len(corpus))
+
+    # 新进程中的首次解析
+    processContext = multiprocessing.get_context("spawn")
+    for warmUp in [False, True]:
+        resultQueue = processContext.Queue()
+        process = processContext.Process(target=benchColdStart, args=(corpus, warmUp, resultQueue))
+        process.start()
+        warmUpElapsed, firstElapsed, secondElapsed = resultQueue.get()
+        process.join()
+        print("WARMUP %-3s warmup %.3f seconds, first pass %.3f seconds, second pass %.3f seconds." %
+              ("ON" if warmUp else "OFF", warmUpElapsed, firstElapsed, secondElapsed))
+
+    # 复用解析器和每次新建解析器的比较，两种方式交替运行，避免机器负载的波动影响比较结果
+    parseCorpus(corpus)
+    elapsed = {False: 0, True: 0}
+    for nLoop in range(0, loops):
+        for parserPool in [False, True]:
+            globalParserOption["pool"] = parserPool
+            elapsed[parserPool] = elapsed[parserPool] + parseCorpus(corpus)
+    globalParserOption["pool"] = True
+    for parserPool in [False, True]:
+        print("POOL   %-3s parsed %d statements in %.2f seconds, %.0f statements/sec." %
+              ("ON" if parserPool else "OFF", len(corpus) * loops,
+               elapsed[parserPool], len(corpus) * loops / elapsed[parserPool]))
+
+
+if __name__ == '__main__':
+    main()
@@ -46,6 +46,27 @@ class TestSynatx(unittest.TestCase):
         self.assertEqual(0, ret_errorCode)
         self.assertEqual(None, ret_errorMsg)
 
+    def test_SQLAnalyze_ParserPool(self):
+        from ..globalvar import globalParserOption
+
+        # 复用解析器和每次新建解析器的解析结果应该完全相同，包括解析出错后的下一次解析
+        statements = [
+            "select * from aaa;",
+            "select * from aaa",
+            "_connect user/password@jdbc:db:tcp://10.15.1.19:6231/xdb",
+            "_loop begin until {% i==3",
+            "create procedure p1 as\nbegin\n  null;\nend;\n/",
+            "_set echo on",
+        ]
+        results = {}
+        for parserPool in [False, True]:
+            globalParserOption["pool"] = parserPool
+            results[parserPool] = [SQLAnalyze(statement) for statement in statements]
+            results[parserPool].append(
+                APIAnalyze("### aaa\nGET http://127.0.0.1:8080/health HTTP/1.1\n\n###"))
+        globalParserOption["pool"] = True
+        self.assertEqual(results[False], results[True])
+
     def test_SQLAnalyze_Connect(self):
         # connect with server url
         (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
@@ -856,6 +877,37 @@ class TestSynatx(unittest.TestCase):
             },
             ret_CommandSplitResult)
 
+    def test_SshRecvChannelLines(self):
+        import socket
+        from ..commands.ssh import recvSshChannelLines
+
+        class ChannelStub:
+            # 按照预设的数据块返回内容，中间模拟一次读取超时
+            def __init__(self, chunks):
+                self.chunks = list(chunks)
+
+            def settimeout(self, timeout):
+                pass
+
+            def recv(self, nbytes):
+                if len(self.chunks) == 0:
+                    return b''
+                chunk = self.chunks.pop(0)
+                if chunk is None:
+                    raise socket.timeout()
+                return chunk
+
+        channel = ChannelStub([b'line1\nli', None, b'ne2\n\nline', b'4\nlast'])
+        self.assertEqual([b'line1', b'line2', b'', b'line4', b'last'], list(recvSshChannelLines(channel)))
+
+        (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
+            = SQLAnalyze("_SSH set outputFile = /tmp/ssh_output.log")
+        self.assertEqual(None, ret_errorMsg)
+        self.assertEqual(0, ret_errorCode)
+        self.assertTrue(isFinished)
+        self.assertEqual({'action': 'set', 'name': 'SSH', 'option': 'outputFile', 'value': '/tmp/ssh_output.log'},
+                         ret_CommandSplitResult)
+
     def test_SQLAnalyze_Job(self):
         (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
             = SQLAnalyze("_JOB JOBMANAGER ON")
@@ -1121,6 +1173,501 @@ class TestSynatx(unittest.TestCase):
             {'action': 'set', 'compareOptions': {'refEncoding': 'GBK'}, 'name': 'COMPARE'},
             ret_CommandSplitResult)
 
+    def test_CompareMyersLinear(self):
+        import random
+
+        # 线性空间的Myers算法和原有Myers算法得到的差异行数应该完全相同
+        randomGenerator = random.Random(20221018)
+        compareHandler = POSIXCompare()
+        for nLoop in range(0, 50):
+            workContent = [randomGenerator.choice(["aa", "bb", "CC", "1234"]) for _ in range(0, 60)]
+            refContent = [randomGenerator.choice(["aa", "BB", "cc", "\\d+"]) for _ in range(0, 60)]
+            lineno1 = list(range(1, len(workContent) + 1))
+            lineno2 = list(range(1, len(refContent) + 1))
+            for maskEnabled, ignoreCase in [(False, False), (True, True)]:
+                POSIXCompare.CompiledRegexPattern.clear()
+                compareResult1, compareResultList1 = compareHandler.compareMyers(
+                    workContent, refContent, lineno1, lineno2,
+                    p_compare_maskEnabled=maskEnabled, p_compare_ignoreCase=ignoreCase)
+                compareResult2, compareResultList2 = compareHandler.compareMyersLinear(
+                    workContent, refContent, lineno1, lineno2,
+                    p_compare_maskEnabled=maskEnabled, p_compare_ignoreCase=ignoreCase)
+                self.assertEqual(compareResult1, compareResult2)
+                self.assertEqual(
+                    len([line for line in compareResultList1 if line[0] in "+-"]),
+                    len([line for line in compareResultList2 if line[0] in "+-"]))
+
+        # 大文件比对
+        workContent = [str(i) for i in range(0, 200000)]
+        refContent = list(workContent)
+        refContent[100000] = "changed"
+        lineno = list(range(1, len(workContent) + 1))
+        compareResult, compareResultList = compareHandler.compareMyersLinear(
+            workContent, refContent, lineno, lineno)
+        self.assertFalse(compareResult)
+        self.assertEqual(["-100001 100000", "+100001 changed"], [line for line in compareResultList if line[0] in "+-"])
+
+    def test_CompareLinearThresholdOption(self):
+        from ..commands.setOptions import setOptions
+        from ..testoption import TestOptions
+
+        class FakeCls:
+            testOptions = TestOptions()
+
+        # 原来的选项名称作为别名保留，设置的是新的选项
+        self.assertIsNone(FakeCls.testOptions.get("COMPARE_DIFFLIB_THRESHOLD"))
+        results = list(setOptions(FakeCls, {"optionName": "COMPARE_DIFFLIB_THRESHOLD", "optionValue": "500"}))
+        self.assertEqual("result", results[-1]["type"])
+        self.assertEqual("500", FakeCls.testOptions.get("COMPARE_LINEAR_THRESHOLD"))
+
+        results = list(setOptions(FakeCls, {"optionName": "COMPARE_LINEAR_THRESHOLD", "optionValue": "abc"}))
+        self.assertEqual("error", results[-1]["type"])
+        self.assertEqual("500", FakeCls.testOptions.get("COMPARE_LINEAR_THRESHOLD"))
+
+    def test_CompareLineFilter(self):
+        from ..commands.compare import CompareLineFilter
+
+        compareFilter = CompareLineFilter(
+            skipLines=["elapsed: .*", "RUNNING", "(abc)\\1", "["],
+            maskLines={"id=\\d+": "id=###", "time": "TIME"},
+            ignoreEmptyLine=True,
+            ignoreTailOrHeadBlank=True)
+        filteredLines, lineno = compareFilter.filterLines(
+            ["select 1;\n", "Elapsed: 12 ms\n", "  running  \n", "\n", "abcabc\n", "[\n", "id=123 time=1\n"])
+        self.assertEqual(["select 1;", "id=### TIME=1"], filteredLines)
+        self.assertEqual([1, 7], lineno)
+
+        # 和原有的规则一致：match匹配到的内容必须是整行，能够fullmatch但是match只匹配到部分内容的行不被忽略
+        for skipLines, line, isSkipLine in [
+            (["Elapsed:.*?"], "Elapsed: 12 ms", False),
+            (["Elapsed:.*"], "Elapsed: 12 ms", True),
+            (["a|ab"], "ab", False),
+            (["ab|a"], "ab", True),
+            (["RUN|RUNNING"], "running", False),
+            (["RUN|RUNNING", "xyz"], "run", True),
+            (["RUN|RUNNING", "(x)\\1"], "running", False),
+            (["RUN|RUNNING"], "run|running", True),
+        ]:
+            self.assertEqual(isSkipLine, CompareLineFilter(skipLines=skipLines).isSkipLine(line))
+            self.assertEqual(isSkipLine, any([
+                POSIXCompare().compare_string(line, skipLine, p_compare_maskEnabled=True, p_compare_ignoreCase=True)
+                for skipLine in skipLines]))
+
+        # 被忽略的行在比对结果中显示原始文件的内容
+        compareHandler = POSIXCompare()
+        compareResult, compareResultList = compareHandler.compare_text(
+            ["aaa\n", "Elapsed: 12 ms\n", "bbb\n", "ccc\n"],
+            ["aaa\n", "bbb\n", "ddd\n"],
+            skipLines=["Elapsed: .*"])
+        self.assertFalse(compareResult)
+        self.assertEqual(
+            ["      1 aaa", "S     2 Elapsed: 12 ms", "      3 bbb", "-     4 ccc", "+     3 ddd"],
+            compareResultList)
+
+    def test_ParseStatementKind(self):
+        from unittest import mock
+        from .. import cmdexecute
+        from .. import common
+        from ..cmdexecute import CmdExecute
+        from ..common import splitSqlCommand
+        from ..testoption import TestOptions
+
+        def parseStatement(statement, nameSpace):
+            cmdExecuteHandler = CmdExecute()
+            cmdExecuteHandler.testOptions = TestOptions()
+            cmdExecuteHandler.testOptions.set("NAMESPACE", nameSpace)
+            return cmdExecuteHandler.parseStatement(statement)
+
+        sqlStatements = [
+            # 存储过程，中间的分号和注释不会结束语句
+            "create or replace procedure p1\nas\nbegin\n  -- comment;\n  null;\n  /* a;\n  b */\nend;\n/\n"
+            "select 1 from dual;\n",
+            "declare\n  x int;\nbegin\n  x := 1;\nend;\n/\nbegin\n  null;\nend;\n/",
+            # 字符串和注释中的分号
+            "select 'a;b'\n  from dual\n  where c = ';';\n-- [Hint] Order\nselect\n  1 -- x;\nfrom dual;",
+            "insert into t values ('a\n;\nb');\nselect /* ; */ 2\nfrom dual\n;\n\n",
+            # 没有结束的语句
+            "select 1\nfrom dual\nwhere 1=1",
+            "update t\nset a=1 /* not closed ;",
+            # ECHO和内嵌脚本
+            "_echo abc.txt\nline1;\n/\nline2\n_echo off\nselect 1 from dual;",
+            "> {%\nx = 1;\ny = 2\n%}\n_SLEEP 0;",
+            "_ECHO a.txt\nEcho Off text\n_echo off\n_sleep 1",
+            "selectx 1\nfrom dual;\ncreate\ntable t(a int);\ncommit;",
+        ]
+        apiStatements = [
+            "### 请求1\nGET http://127.0.0.1/a\n\n###\nPOST http://127.0.0.1/b\nContent-Type: application/json\n\n"
+            "{\"a\": \"###\"}\n###\n",
+            "> {%\nx = 1\n%}\n_echo a.txt\n###\n_echo off\n",
+        ]
+        for nameSpace, statements in [("SQL", sqlStatements), ("API", apiStatements)]:
+            for statement in statements:
+                # 预判语句类型的结果应该和逐行解析的结果完全相同
+                with mock.patch.object(cmdexecute, "getStatementKind", return_value=None):
+                    expected = parseStatement(statement, nameSpace)
+                self.assertEqual(expected, parseStatement(statement, nameSpace), statement)
+
+        for statement in sqlStatements:
+            with mock.patch.object(common, "getStatementKind", return_value=None):
+                expected = splitSqlCommand(statement)
+            self.assertEqual(expected, splitSqlCommand(statement), statement)
+
+    def test_CompileColumnFormatters(self):
+        import datetime
+        import decimal
+        from ..commands.sqlExecute import compileColumnFormatters, formatColumns
+        from ..sqlclijdbc import SQLCliJDBCException, SQLCliJDBCLargeObject
+        from ..testoption import TestOptions
+
+        class FakeClob:
+            def __init__(self, content):
+                self.content = content
+
+            def getSubString(self, startPos, length):
+                return self.content[startPos - 1:startPos - 1 + length]
+
+        testOptions = TestOptions()
+        testOptions.set("LOB_LENGTH", "6")
+        testOptions.set("DECIMAL_FORMAT", "%0.3f")
+        largeObject = SQLCliJDBCLargeObject()
+        largeObject.setObject(FakeClob("0123456789ABC"))
+        largeObject.setObjectLength(13)
+        largeObject.setColumnTypeName("CLOB")
+
+        columnTypes = ["VARCHAR", "DOUBLE", "DECIMAL", "DATE", "TIMESTAMP", "TIMESTAMP_WITH_TIMEZONE", "TIME",
+                       "BLOB", "BINARY", "STRUCT", "ARRAY", "CLOB", "INTEGER", "BOOLEAN"]
+        row = ("abc", 1.0 / 3, decimal.Decimal("12.34567"), datetime.date(2020, 1, 2),
+               datetime.datetime(2020, 1, 2, 3, 4, 5, 678),
+               datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=8))),
+               datetime.time(1, 2, 3, 4),
+               bytearray(b"\x01\x02\x03\x04\x05\x06\x07\x08"), bytearray(b"\xff\x00"),
+               ["a", 1, 2.5, datetime.date(2020, 1, 2), datetime.datetime(2020, 1, 2, 3, 4, 5), None,
+                decimal.Decimal("1.5")],
+               ["b", None, "a"], largeObject, 42, True)
+        nullRow = tuple(None for _ in columnTypes)
+
+        # 预先生成的格式化函数和逐个单元格判断类型的格式化结果相同
+        columnFormatters = compileColumnFormatters(testOptions, columnTypes)
+        self.assertEqual(
+            [
+                ("abc", "0.3333333", "12.346", "2020-01-02", "2020-01-02 03:04:05.000678",
+                 "2020-01-02 03:04:05 +0800", "01:02:03.000004", "0x010203040506...", "0xff00",
+                 "STRUCTURE('a',1,2.5,DATE '2020-01-02',TIMESTAMP '2020-01-02 03:04:05.000000',<null>,1.500)",
+                 "ARRAY['a','b',<null>]", "Len:13;Content:[012...ABC]", 42, True),
+                nullRow
+            ],
+            list(formatColumns(list(zip(row, nullRow)), columnFormatters)))
+
+        # 选项在生成格式化函数的时候读取
+        testOptions.set("FLOAT_FORMAT", "%.2f")
+        testOptions.set("OUTPUT_SORT_ARRAY", "OFF")
+        columnFormatters = compileColumnFormatters(testOptions, ["DOUBLE", "ARRAY"])
+        self.assertEqual([("0.33", "ARRAY['b',<null>,'a']")],
+                         list(formatColumns([[1.0 / 3], [["b", None, "a"]]], columnFormatters)))
+
+        # 不认识的数据类型
+        columnFormatters = compileColumnFormatters(testOptions, ["OTHER"])
+        with self.assertRaises(SQLCliJDBCException):
+            list(formatColumns([[object()]], columnFormatters))
+
+    def test_SortResult(self):
+        import random
+        from decimal import Decimal
+        from ..common import sortresult
+
+        # 原有的交换排序算法，用于验证新的排序结果完全一致
+        def exchangeSort(result):
+            for i in range(len(result) - 1, 0, -1):
+                for j in range(i - 1, -1, -1):
+                    bNeedExchange = False
+                    for k in range(0, len(result[i])):
+                        if result[i][k] is None and result[j][k] is None:
+                            continue
+                        if result[i][k] is None and result[j][k] is not None:
+                            break
+                        if result[j][k] is None and result[i][k] is not None:
+                            bNeedExchange = True
+                            break
+                        if not isinstance(result[i][k], type(result[j][k])):
+                            if str(result[i][k]) < str(result[j][k]):
+                                bNeedExchange = True
+                                break
+                            if str(result[i][k]) > str(result[j][k]):
+                                break
+                        else:
+                            if result[i][k] < result[j][k]:
+                                bNeedExchange = True
+                                break
+                            if result[i][k] > result[j][k]:
+                                break
+                    if bNeedExchange:
+                        result[j], result[i] = result[i], result[j]
+
+        def formatRows(result):
+            return "\n".join(["|".join([str(cell) for cell in row]) for row in result])
+
+        rows = [(-32767,), (32767,), (None,), (0,)]
+        sortresult(rows)
+        self.assertEqual([(-32767,), (0,), (32767,), (None,)], rows)
+
+        randomGenerator = random.Random(20261018)
+        cellChoices = [
+            lambda: None,
+            lambda: randomGenerator.randint(-20, 20),
+            lambda: "s" + str(randomGenerator.randint(0, 20)),
+            lambda: randomGenerator.choice(["a", "B", "10", "9"]),
+        ]
+        for nRound in range(0, 50):
+            # 同类型的列和混合类型的列
+            columnKinds = [randomGenerator.choice([[0, 1], [0, 2], [0, 1, 3], [1]]) for _ in range(3)]
+            rows = [
+                tuple([cellChoices[randomGenerator.choice(kinds)]() for kinds in columnKinds])
+                for _ in range(randomGenerator.randint(0, 200))
+            ]
+            expectedRows = list(rows)
+            exchangeSort(expectedRows)
+            sortedRows = list(rows)
+            sortresult(sortedRows)
+            self.assertEqual(formatRows(expectedRows), formatRows(sortedRows))
+            # 分批写入临时文件后合并的结果也要完全一致
+            spilledRows = list(rows)
+            sortresult(spilledRows, spillRows=7)
+            self.assertEqual(formatRows(expectedRows), formatRows(spilledRows))
+
+        # 各行的列数不同的时候和原有算法的处理一致
+        rows = [(3, 1), (2,), (1, 1)]
+        sortresult(rows)
+        self.assertEqual([(3, 1), (2,), (1, 1)], rows)
+
+        # 无法计算哈希的值（BINARY返回bytearray，ARRAY返回list）同样可以排序
+        rows = [(1, bytearray(b'b'), [2, 1]), (0, bytearray(b'a'), None), (2, None, [1])]
+        sortresult(rows)
+        self.assertEqual([(0, bytearray(b'a'), None), (1, bytearray(b'b'), [2, 1]), (2, None, [1])], rows)
+        rows = [(bytearray(b'b'),), (None,), (bytearray(b'a'),)]
+        sortresult(rows)
+        self.assertEqual([(bytearray(b'a'),), (bytearray(b'b'),), (None,)], rows)
+        rows = [([2],), ([1, 2],), (None,), ([1],)]
+        sortresult(rows)
+        self.assertEqual([([1],), ([1, 2],), ([2],), (None,)], rows)
+
+        # 比较相等但是输出不同的值，先后顺序和原有算法完全一致
+        for rows in [
+            [(Decimal('1.00'),), (Decimal('2'),), (Decimal('1.0'),), (None,), (Decimal('1.00'),)],
+            [(0.0, 'a'), (-0.0, 'b'), (1.5, 'c'), (0.0, 'd'), (-0.0, 'e')],
+            [(1,), ('1',), (2,), ('1',), (1,)],
+        ]:
+            expectedRows = list(rows)
+            exchangeSort(expectedRows)
+            sortedRows = list(rows)
+            sortresult(sortedRows)
+            self.assertEqual(formatRows(expectedRows), formatRows(sortedRows))
+            spilledRows = list(rows)
+            sortresult(spilledRows, spillRows=2)
+            self.assertEqual(formatRows(expectedRows), formatRows(spilledRows))
+
+    def test_LogHintTransformer(self):
+        from ..common import LogHintTransformer
+        from ..cmdexecute import CmdExecute
+
+        hintTransformer = LogHintTransformer(
+            {"LogFilter": [".*error.*", "["], "LogMask": ["id=\\d+=>id=##", "张.*=>王五", "x=>xx", "bad"]})
+        # 错误的正则表达式和格式不正确的掩码被忽略
+        self.assertEqual(1, len(hintTransformer.logFilters))
+        self.assertEqual(3, len(hintTransformer.logMasks))
+
+        rows = [("id=1", "张三"), ("ERROR", None), ("", "id=22 id=333"), ("abc", 1)]
+        self.assertEqual(
+            [("id=##", "王五"), ("", "id=## id=##"), ("abc", 1)],
+            hintTransformer.transformRows(rows))
+        # 没有被掩码的行保持原有的对象
+        self.assertIs(rows[3], hintTransformer.transformRows(rows)[2])
+
+        # 替换后仍然符合条件的掩码，替换次数受到限制
+        self.assertEqual("x" * 202, hintTransformer.mask("x"))
+
+        # 每轮最多替换两处，匹配和前后内容有关，或者替换后和随后内容组成新匹配的时候，结果和一次全部替换不同
+        self.assertEqual("cca", LogHintTransformer({"LogMask": ["(?<!c)a=>c"]}).mask("aaa"))
+        self.assertEqual("bb", LogHintTransformer({"LogMask": ["b?a=>b"]}).mask("aaa"))
+
+        self.assertEqual(
+            "id=##\nok",
+            hintTransformer.transformText("id=12\nsome error here\nok"))
+
+        # 结果集的掩码去掉引号外的空格，状态信息和错误信息的掩码保持原样
+        commandHints = {"LogMask": ["'abc' => 'X'"]}
+        hintTransformer = LogHintTransformer(commandHints)
+        self.assertEqual([("xx 'X' yy",)], hintTransformer.transformRows([("xx 'abc' yy",)]))
+        self.assertEqual("xx  'X'yy", hintTransformer.transformText("xx 'abc' yy"))
+        self.assertEqual("m 'abc'", hintTransformer.transformText("m 'abc'"))
+        result = {"rows": [("m 'abc'",)], "status": "xx 'abc' yy", "message": "m 'abc'"}
+        CmdExecute.processCommandHint_Rows(result, commandHints)
+        CmdExecute.processCommandHint_Status(result, commandHints)
+        CmdExecute.processCommandHint_Message(result, commandHints)
+        self.assertEqual([("m 'X'",)], result["rows"])
+        self.assertEqual("xx  'X'yy", result["status"])
+        self.assertEqual("m 'abc'", result["message"])
+
+        # 多段返回的结果集使用同一个转换器
+        commandHints = {"LogFilter": ["^2$"]}
+        hintTransformer = LogHintTransformer(commandHints)
+        for batch in [[(1,), (2,)], [(2,), (3,)]]:
+            result = {"rows": batch, "status": "2", "message": None}
+            CmdExecute.processCommandHint_Rows(result, commandHints, hintTransformer=hintTransformer)
+            CmdExecute.processCommandHint_Status(result, commandHints, hintTransformer=hintTransformer)
+            self.assertNotIn((2,), result["rows"])
+            self.assertEqual("", result["status"])
+
+    def test_RewriteStatementTemplate(self):
+        import types
+        from ..common import rewriteStatement
+        from ..common import compileStatementTemplate
+        from ..common import statementVariableBindings
+        from ..cmdmapping import CmdMapping
+        from ..globalvar import globalEmbeddScriptScope
+
+        cls = types.SimpleNamespace(cmdMappingHandler=CmdMapping(), db_conn=None)
+        globalEmbeddScriptScope["rewriteVarA"] = 1
+        globalEmbeddScriptScope["rewriteVarB"] = "b"
+        globalEmbeddScriptScope["rewriteVarNested"] = "{{rewriteVarA}}"
+        os.environ["TESTCLI_REWRITEENV"] = "env"
+        try:
+            statement = "select {{rewriteVarA}}, '${rewriteVarB}', {{ TESTCLI_REWRITEENV }} from t where c={{rewriteVarA}}"
+            template = compileStatementTemplate(statement, 0)
+            self.assertTrue(template.renderable)
+            self.assertEqual(3, len(template.placeholders))
+            self.assertEqual("select 1, 'b', env from t where c=1", rewriteStatement(cls, statement, None))
+
+            # 模板被缓存，变量的值发生变化后重新计算
+            self.assertIs(template, compileStatementTemplate(statement, 0))
+            globalEmbeddScriptScope["rewriteVarA"] = 2
+            self.assertEqual("select 2, 'b', env from t where c=2", rewriteStatement(cls, statement, None))
+
+            # 嵌套的变量继续替换
+            self.assertEqual("x=2", rewriteStatement(cls, "x={{rewriteVarNested}}", None))
+
+            # 遇到无法替换的变量后，随后的其他变量不再替换
+            self.assertEqual(
+                "2 {{rewriteVarUnknown}} {{rewriteVarB}} 2",
+                rewriteStatement(cls, "{{rewriteVarA}} {{rewriteVarUnknown}} {{rewriteVarB}} {{rewriteVarA}}", None))
+
+            # 记录变量找到值的方式，随后定义了同名的本地变量，本地变量优先
+            self.assertEqual("env", rewriteStatement(cls, "{{TESTCLI_REWRITEENV}}", None))
+            self.assertEqual("ENV", statementVariableBindings[(None, "TESTCLI_REWRITEENV")][1])
+            globalEmbeddScriptScope["TESTCLI_REWRITEENV"] = "local"
+            self.assertEqual("local", rewriteStatement(cls, "{{TESTCLI_REWRITEENV}}", None))
+            self.assertEqual("EVAL", statementVariableBindings[(None, "TESTCLI_REWRITEENV")][1])
+
+            # 重新加载MAPPING文件后，重新判断变量是否在MAPPING文件中定义
+            mappingVersion = CmdMapping.mappingVersion
+            CmdMapping.mappingVersion = mappingVersion + 1
+            self.assertEqual("local", rewriteStatement(cls, "{{TESTCLI_REWRITEENV}}", None))
+            self.assertEqual(mappingVersion + 1, statementVariableBindings[(None, "TESTCLI_REWRITEENV")][0])
+        finally:
+            for varName in ["rewriteVarA", "rewriteVarB", "rewriteVarNested", "TESTCLI_REWRITEENV"]:
+                globalEmbeddScriptScope.pop(varName, None)
+            del os.environ["TESTCLI_REWRITEENV"]
+
+    def test_CompiledCodeCache(self):
+        import types
+        from ..commands.assertExpression import CompiledCodeCache
+        from ..commands.assertExpression import compiledCodeCache
+        from ..commands.assertExpression import evalExpression
+
+        codeCache = CompiledCodeCache(maxSize=2)
+        codeObject = codeCache.get("1 + 1", "eval")
+        self.assertIs(codeObject, codeCache.get("1 + 1", "eval"))
+        self.assertEqual(2, eval(codeObject))
+        # 和内置的eval一样，忽略表达式开头的空格
+        self.assertEqual(3, eval(codeCache.get("  1 + 2", "eval")))
+        self.assertEqual({"size": 2, "maxSize": 2, "hits": 1, "misses": 2}, codeCache.getStats())
+
+        # 超过缓存数量后淘汰最久没有使用的内容
+        codeCache.get("1 + 1", "eval")
+        codeCache.get("x = 1", "exec")
+        self.assertIn(("eval", "1 + 1"), codeCache.codeObjects)
+        self.assertNotIn(("eval", "  1 + 2"), codeCache.codeObjects)
+        codeCache.resize(1)
+        self.assertEqual([("exec", "x = 1")], list(codeCache.codeObjects.keys()))
+        with self.assertRaises(SyntaxError):
+            codeCache.get("1 +", "eval")
+        self.assertEqual(1, codeCache.getStats()["size"])
+        codeCache.clear()
+        self.assertEqual({"size": 0, "maxSize": 1, "hits": 0, "misses": 0}, codeCache.getStats())
+
+        # evalExpression使用全局的编译缓存
+        cls = types.SimpleNamespace(db_conn=None)
+        hits = compiledCodeCache.hits
+        for nLoop in range(0, 3):
+            self.assertEqual(nLoop, evalExpression(cls, str(nLoop) + " * (1 + 0)"))
+        self.assertEqual(4, evalExpression(cls, "2 * 2"))
+        self.assertEqual(4, evalExpression(cls, "2 * 2"))
+        self.assertEqual(hits + 1, compiledCodeCache.hits)
+
+    def test_LoadScriptImportOnce(self):
+        from ..commands.load import loadScript
+        from ..globalvar import globalEmbeddScriptScope
+
+        workDir = tempfile.mkdtemp()
+        scriptFile = os.path.join(workDir, "testloadscriptonce.py")
+        with open(scriptFile, mode="w", encoding="utf-8") as f:
+            f.write("import os\n"
+                    "from os.path import join\n"
+                    "loadCount = [1]\n"
+                    "class LoadOnceClass:\n"
+                    "    pass\n"
+                    "def loadOnceFunc1():\n"
+                    "    return loadCount\n"
+                    "def loadOnceFunc2():\n"
+                    "    return 2\n"
+                    "def _loadOncePrivate():\n"
+                    "    return 3\n"
+                    "import functools\n"
+                    "from functools import lru_cache, partial\n"
+                    "@functools.lru_cache(maxsize=None)\n"
+                    "def loadOnceCached(x):\n"
+                    "    return x * 2\n"
+                    "loadOncePartial = functools.partial(loadOnceFunc2)\n"
+                    "class LoadOnceCallable:\n"
+                    "    def __call__(self):\n"
+                    "        return 4\n"
+                    "loadOnceInstance = LoadOnceCallable()\n"
+                    "loadOnceJoin = partial(join, 'a')\n")
+
+        # 只导入脚本中定义的公开类和可调用对象，包括被装饰的函数、partial对象和可调用的实例
+        statusList = [commandResult["status"] for commandResult in loadScript(cls=None, scriptFile=scriptFile)]
+        self.assertEqual(
+            ["Module [LoadOnceClass] loaded successful.",
+             "Module [LoadOnceCallable] loaded successful.",
+             "Function [loadOnceFunc1] loaded successful.",
+             "Function [loadOnceFunc2] loaded successful.",
+             "Function [loadOnceCached] loaded successful.",
+             "Function [loadOncePartial] loaded successful.",
+             "Function [loadOnceInstance] loaded successful.",
+             "Script file loaded successful."],
+            statusList)
+        self.assertNotIn("_loadOncePrivate", globalEmbeddScriptScope)
+        self.assertEqual(6, globalEmbeddScriptScope["loadOnceCached"](3))
+        self.assertEqual(2, globalEmbeddScriptScope["loadOncePartial"]())
+        self.assertEqual(4, globalEmbeddScriptScope["loadOnceInstance"]())
+        loadCount = globalEmbeddScriptScope["loadOnceFunc1"]()
+
+        # 文件没有变化的时候不再重新执行脚本
+        list(loadScript(cls=None, scriptFile=scriptFile))
+        self.assertIs(loadCount, globalEmbeddScriptScope["loadOnceFunc1"]())
+
+        # 文件发生变化后重新导入
+        with open(scriptFile, mode="a", encoding="utf-8") as f:
+            f.write("def loadOnceFunc3():\n"
+                    "    return 3\n")
+        statusList = [commandResult["status"] for commandResult in loadScript(cls=None, scriptFile=scriptFile)]
+        self.assertIn("Function [loadOnceFunc3] loaded successful.", statusList)
+        self.assertIsNot(loadCount, globalEmbeddScriptScope["loadOnceFunc1"]())
+
+        for name in ["LoadOnceClass", "LoadOnceCallable", "loadOnceFunc1", "loadOnceFunc2", "loadOnceFunc3",
+                     "loadOnceCached", "loadOncePartial", "loadOnceInstance"]:
+            del globalEmbeddScriptScope[name]
+        shutil.rmtree(workDir)
+
     def test_SQLAnalyze_Data(self):
         (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
             = SQLAnalyze("_DATA SET SEEDFILE DIR d:\\temp\\aa.txt")
@@ -1172,6 +1719,179 @@ class TestSynatx(unittest.TestCase):
              },
             ret_CommandSplitResult)
 
+    def test_DataCreateParallel(self):
+        from ..commands.data import createFile
+
+        formula = "{identity(10)},{ts:identity_timestamp(2020-01-01 00:00:00,%Y-%m-%d %H:%M:%S,1s)},{random_digits(5)}"
+        serialFile = os.path.join(tempfile.gettempdir(), "testdataserial.txt")
+        parallelFile = os.path.join(tempfile.gettempdir(), "testdataparallel.txt")
+
+        # 并行生成的自增序列和单进程生成的完全相同
+        createFile("FS", serialFile, formula, 20001)
+        self.assertEqual([parallelFile],
+                         createFile("FS", parallelFile, formula, 20001, p_parallel=2, p_seed="testcli"))
+        with open(serialFile) as f:
+            serialRows = [row.split(",")[:2] for row in f.readlines()]
+        with open(parallelFile) as f:
+            parallelContent = f.read()
+        self.assertEqual(serialRows, [row.split(",")[:2] for row in parallelContent.splitlines()])
+        self.assertEqual(["20010", "2020-01-01 05:33:20"], serialRows[-1])
+
+        # 指定随机数种子的时候，结果可以重现
+        partFiles = createFile("FS", parallelFile, formula, 20001, p_parallel=2, p_merge=False, p_seed="testcli")
+        self.assertEqual([parallelFile + ".part0000", parallelFile + ".part0001"], partFiles)
+        mergedContent = ""
+        for partFile in partFiles:
+            with open(partFile) as f:
+                mergedContent = mergedContent + f.read()
+            os.remove(partFile)
+        self.assertEqual(parallelContent, mergedContent)
+
+    def test_DataRowTemplate(self):
+        from ..commands.data import RowTemplate
+        from ..commands.data import get_final_string
+        from ..commands.data import parse_formula_str
+        from ..commands.data import setDataRandomSeed
+        from ..commands.data import set_identity_offset
+        from ..commands.data import reset_identity
+
+        seedDir = tempfile.mkdtemp()
+        seedFile = os.path.join(seedDir, "testrowtemplate.seed")
+        seedLines = ["line-" + str(i) for i in range(0, 10)]
+        with open(seedFile, mode="w", encoding="utf-8") as f:
+            f.write("\n".join(seedLines) + "\n")
+        formula = "ID={identity(10)},{id2:identity(5)},{value(:id2)}," \
+                  "TS={ts:identity_timestamp(2020-01-01 00:00:00,%Y-%m-%d %H:%M:%S,500ms)},{value(:ts)}," \
+                  "{c:random_ascii_letters(5)}={value(:c)},{s:random_from_seed(" + seedFile + ",1,4)}|{value(:s)},K:v"
+        rowStruct = parse_formula_str(formula)
+
+        def generateRows(rowStart, rows, useTemplate):
+            setDataRandomSeed("testcli")
+            set_identity_offset(rowStruct, rowStart)
+            if useTemplate:
+                return RowTemplate(rowStruct).generateRows(rows)
+            return [get_final_string(rowStruct) for _ in range(0, rows)]
+
+        try:
+            # 每行时间戳增加500毫秒，50行分别对应首行和末行的时间
+            expectedTimestamps = {
+                0: ("2020-01-01 00:00:00", "2020-01-01 00:00:24"),
+                100: ("2020-01-01 00:00:50", "2020-01-01 00:01:14"),
+            }
+            for rowStart in [0, 100]:
+                templateRows = [row.split(",") for row in generateRows(rowStart, 50, True)]
+                finalStringRows = [row.split(",") for row in generateRows(rowStart, 50, False)]
+
+                # 字面值、自增序列、自增时间戳以及对它们的引用，两种方式生成的内容完全相同
+                self.assertEqual([row[:5] for row in finalStringRows], [row[:5] for row in templateRows])
+                self.assertEqual(["ID=" + str(10 + rowStart), str(5 + rowStart), str(5 + rowStart)],
+                                 templateRows[0][:3])
+                self.assertEqual("TS=" + expectedTimestamps[rowStart][0], templateRows[0][3])
+                self.assertEqual(expectedTimestamps[rowStart][1], templateRows[-1][4])
+
+                # 随机的内容和对它的引用在同一行中相同，种子文件的内容按照指定的位置和长度截取
+                for rows in [templateRows, finalStringRows]:
+                    for row in rows:
+                        self.assertEqual(7, len(row))
+                        randomLetters, referencedLetters = row[5].split("=")
+                        self.assertEqual(5, len(randomLetters))
+                        self.assertEqual(randomLetters, referencedLetters)
+                        self.assertEqual(row[6][:4] + "|" + row[6][:4] + "v", row[6])
+                        self.assertIn(row[6][:4], [seedLine[1:5] for seedLine in seedLines])
+
+                # 指定随机数种子的时候，行模板生成的结果可以重现
+                self.assertEqual(templateRows, [row.split(",") for row in generateRows(rowStart, 50, True)])
+        finally:
+            reset_identity()
+            shutil.rmtree(seedDir)
+
+    def test_DataSeedStore(self):
+        from ..commands.data import SeedStore
+        from ..commands.data import getSeedStore
+        from ..commands.data import random_from_seed
+        from ..commands.data import newSeedStoreCheck
+
+        seedDir = tempfile.mkdtemp()
+        seedFile = os.path.join(seedDir, "testseed.seed")
+        with open(seedFile, mode="w", encoding="utf-8", newline="") as f:
+            f.write("abc\r\n中文def\nxyz")
+
+        # 按行偏移量读取，兼容\r\n和没有换行符的最后一行
+        newSeedStoreCheck()
+        seedStore = getSeedStore(seedFile)
+        self.assertEqual(3, seedStore.lineCount)
+        self.assertEqual(["abc", "中文def", "xyz"], [seedStore.getLine(i) for i in range(3)])
+        self.assertTrue(os.path.exists(seedFile + ".idx"))
+
+        # 再次打开的时候直接使用保存的索引
+        seedStore2 = SeedStore(seedFile)
+        self.assertIsNotNone(seedStore2.indexMap)
+        self.assertEqual([0, 5, 15, 18], list(seedStore2.offsets))
+        seedStore2.close()
+
+        # 和文本方式读取文件一致，单独的\r也是行的结束符
+        crSeedFile = os.path.join(seedDir, "testseedcr.seed")
+        with open(crSeedFile, mode="w", encoding="utf-8", newline="") as f:
+            f.write("a\rb\r\nc\n\rd\r")
+        with open(crSeedFile, mode="r", encoding="utf-8") as f:
+            expectedLines = [line[:-1] if line.endswith("\n") else line for line in f.readlines()]
+        crSeedStore = getSeedStore(crSeedFile)
+        self.assertEqual(["a", "b", "c", "", "d"], expectedLines)
+        self.assertEqual(expectedLines, [crSeedStore.getLine(i) for i in range(crSeedStore.lineCount)])
+
+        # 同一个语句中不再检查种子文件是否发生变化，新的语句开始后重新加载
+        with open(seedFile, mode="w", encoding="utf-8") as f:
+            f.write("only\n")
+        os.utime(seedFile, ns=(seedStore.mtime + 10**9, seedStore.mtime + 10**9))
+        self.assertIs(seedStore, getSeedStore(seedFile))
+        newSeedStoreCheck()
+        self.assertEqual("only", random_from_seed([seedFile]))
+        self.assertEqual("nl", random_from_seed([seedFile, 1, 2]))
+
+        # 空文件
+        with open(seedFile, mode="w", encoding="utf-8") as f:
+            f.write("")
+        newSeedStoreCheck()
+        with self.assertRaisesRegex(Exception, "Seed cache is zero"):
+            random_from_seed([seedFile])
+
+        # 空的种子文件在同一个语句中写入内容后，也可以立即使用
+        with open(seedFile, mode="w", encoding="utf-8") as f:
+            f.write("again\n")
+        self.assertEqual("again", random_from_seed([seedFile]))
+        for seedName in [seedFile, crSeedFile]:
+            getSeedStore(seedName).close()
+        shutil.rmtree(seedDir)
+
+    def test_DataHdfsStreaming(self):
+        from ..commands.data import createFile
+        from ..commands.data import convertFile
+        from ..test.testwebhdfsserver import startWebHdfsServer
+        from ..test.testwebhdfsserver import stopWebHdfsServer
+
+        webHdfsServer = startWebHdfsServer()
+        workDir = tempfile.mkdtemp()
+        try:
+            # 多个批次的数据在一个写会话中完成
+            createFile("HDFS", webHdfsServer.url + "/data/hdfs.txt", "{identity(1)},{random_digits(5)}", 200001)
+            with open(os.path.join(webHdfsServer.rootDir, "data", "hdfs.txt")) as f:
+                hdfsContent = f.read()
+            self.assertEqual([str(i) for i in range(1, 200002)],
+                             [row.split(",")[0] for row in hdfsContent.splitlines()])
+
+            # 文件转换不再只复制第一个数据块
+            localFile = os.path.join(workDir, "local.txt")
+            convertFile("HDFS", webHdfsServer.url + "/data/hdfs.txt", "FS", localFile)
+            convertFile("FS", localFile, "FS", localFile + ".copy")
+            convertFile("FS", localFile + ".copy", "HDFS", webHdfsServer.url + "/data/hdfs2.txt")
+            for fileName in [localFile, localFile + ".copy", os.path.join(webHdfsServer.rootDir, "data", "hdfs2.txt")]:
+                with open(fileName) as f:
+                    self.assertEqual(hdfsContent, f.read())
+        finally:
+            stopWebHdfsServer(webHdfsServer)
+            shutil.rmtree(workDir)
+            shutil.rmtree(webHdfsServer.rootDir)
+
     def test_SQLAnalyze_Monitor(self):
         (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = SQLAnalyze("_MONITOR MONITORMANAGER ON")
         self.assertEqual(None, ret_errorMsg)
@@ -1274,6 +1994,70 @@ class TestSynatx(unittest.TestCase):
             },
             ret_CommandSplitResult)
 
+        (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = \
+            SQLAnalyze("_MONITOR SUMMARY TASK task1 WINDOW=60")
+        self.assertEqual(None, ret_errorMsg)
+        self.assertEqual(0, ret_errorCode)
+        self.assertTrue(isFinished)
+        self.assertEqual(
+            {
+                'action': 'summaryTask',
+                'name': 'MONITOR',
+                'taskName': 'task1',
+                'param': {'WINDOW': '60'}
+            },
+            ret_CommandSplitResult)
+
+        (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = \
+            SQLAnalyze("_MONITOR EXPORT TASK ALL DIR='/tmp/monitor' FORMAT=JSON")
+        self.assertEqual(None, ret_errorMsg)
+        self.assertEqual(0, ret_errorCode)
+        self.assertTrue(isFinished)
+        self.assertEqual(
+            {
+                'action': 'exportTask',
+                'name': 'MONITOR',
+                'taskName': 'ALL',
+                'param': {'DIR': '/tmp/monitor', 'FORMAT': 'JSON'}
+            },
+            ret_CommandSplitResult)
+
+        # SUMMARY和EXPORT仍然可以作为任务名称和参数使用
+        (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = \
+            SQLAnalyze("_MONITOR CREATE TASK summary TAG=cpu_percent")
+        self.assertEqual(None, ret_errorMsg)
+        self.assertEqual(0, ret_errorCode)
+        self.assertTrue(isFinished)
+        self.assertEqual(
+            {
+                'action': 'createTask',
+                'name': 'MONITOR',
+                'taskName': 'summary',
+                'param': {'TAG': 'cpu_percent'}
+            },
+            ret_CommandSplitResult)
+        for action, statement in [
+            ("startTask", "_MONITOR START TASK summary"),
+            ("reportTask", "_MONITOR REPORT TASK summary"),
+            ("stopTask", "_MONITOR STOP TASK export"),
+        ]:
+            (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = SQLAnalyze(statement)
+            self.assertEqual(None, ret_errorMsg)
+            self.assertEqual(0, ret_errorCode)
+            self.assertEqual(action, ret_CommandSplitResult["action"])
+            self.assertEqual(statement.split()[-1], ret_CommandSplitResult["taskName"])
+        (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = \
+            SQLAnalyze("_MONITOR EXPORT TASK export DIR=summary")
+        self.assertEqual(0, ret_errorCode)
+        self.assertEqual('export', ret_CommandSplitResult["taskName"])
+        self.assertEqual({'DIR': 'summary'}, ret_CommandSplitResult["param"])
+
+        # 缺少任务名称的时候返回解析错误，而不是异常
+        (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) = \
+            SQLAnalyze("_MONITOR REPORT TASK")
+        self.assertNotEqual(0, ret_errorCode)
+        self.assertEqual('reportTask', ret_CommandSplitResult["action"])
+
     def test_SQLAnalyze_Plugin(self):
         (isFinished, ret_CommandSplitResult, ret_errorCode, ret_errorMsg) \
             = SQLAnalyze("_myplugin xxx yyyy")
@@ -1392,6 +2176,109 @@ class TestSynatx(unittest.TestCase):
                     print(line)
         self.assertTrue(compareResult)
 
+    def test_JDBCConverterPlan(self):
+        h2JarFile = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "jlib", "h2-2.2.224.jar"))
+        conn = jdbcconnect(jclassname="org.h2.Driver",
+                           url="jdbc:h2:mem:testconverterplan;TRACE_LEVEL_SYSTEM_OUT=0;TRACE_LEVEL_FILE=0",
+                           driverArgs={'user': 'sa', 'password': 'sa'},
+                           jars=[h2JarFile, ])
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE TEST_PLAN(ID INT, NAME VARCHAR(20), AMOUNT DECIMAL(10, 2), "
+                       "PRICE DOUBLE, FLAG BOOLEAN, BIRTHDAY DATE, UPDATED TIMESTAMP, DATA VARBINARY(10))")
+        cursor.execute("INSERT INTO TEST_PLAN VALUES "
+                       "(1, NULL, NULL, NULL, NULL, NULL, NULL, NULL), "
+                       "(2, 'abc', 12.34, 1.5, TRUE, DATE '2020-01-02', TIMESTAMP '2020-01-02 03:04:05.678', X'0102'), "
+                       "(3, 'def', -1, -2.25, FALSE, DATE '1999-12-31', TIMESTAMP '1999-12-31 23:59:59', X'ff')")
+
+        # 每个结果集只确定一次每一列的转换函数
+        planCalls = []
+        planColumnConverter = cursor._planColumnConverter
+
+        def countPlanColumnConverter(col, columnDataType=None):
+            planCalls.append(col)
+            return planColumnConverter(col, columnDataType)
+
+        cursor._planColumnConverter = countPlanColumnConverter
+        cursor.execute("SELECT * FROM TEST_PLAN ORDER BY ID")
+        plannedRows = cursor.fetchall()
+        self.assertEqual(list(range(1, 9)), planCalls)
+
+        # 和每行都重新根据元数据确定转换函数的结果相同，第一行的NULL不影响随后的行
+        cursor.execute("SELECT * FROM TEST_PLAN ORDER BY ID")
+        rows = []
+        while True:
+            cursor._converterPlan = None
+            row = cursor.fetchone()
+            if row is None:
+                break
+            rows.append(row)
+        self.assertEqual(rows, plannedRows)
+        self.assertEqual([[type(value) for value in row] for row in rows],
+                         [[type(value) for value in row] for row in plannedRows])
+        self.assertEqual((2, 'abc'), plannedRows[1][:2])
+        cursor.close()
+        conn.close()
+
+    def test_JDBCFetchMode(self):
+        from ..sqlclijdbc import SQLCliJDBCLargeObject
+
+        h2JarFile = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "jlib", "h2-2.2.224.jar"))
+        conn = jdbcconnect(jclassname="org.h2.Driver",
+                           url="jdbc:h2:mem:testfetchmode;TRACE_LEVEL_SYSTEM_OUT=0;TRACE_LEVEL_FILE=0",
+                           driverArgs={'user': 'sa', 'password': 'sa'},
+                           jars=[h2JarFile, ])
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE TEST_FETCHMODE(C_INT INT, C_SMALLINT SMALLINT, C_TINYINT TINYINT, "
+                       "C_BIGINT BIGINT, C_VARCHAR VARCHAR(20), C_CHAR CHAR(5), C_DECIMAL DECIMAL(20, 4), "
+                       "C_REAL REAL, C_DOUBLE DOUBLE, C_BOOLEAN BOOLEAN, C_DATE DATE, C_TIME TIME, "
+                       "C_TIMESTAMP TIMESTAMP, C_VARBINARY VARBINARY(10), C_CLOB CLOB, C_BLOB BLOB, "
+                       "C_ARRAY INT ARRAY)")
+        cursor.execute("INSERT INTO TEST_FETCHMODE "
+                       "SELECT X, X - 100, MOD(X, 100), X * 10000000000, 'NAME-' || X, 'C' || MOD(X, 10), "
+                       "X / 3.0, X / 4.0, X / 7.0, MOD(X, 2) = 0, DATEADD(DAY, X, DATE '2020-01-01'), "
+                       "TIME '01:02:03', DATEADD(SECOND, X, TIMESTAMP '2020-01-01 00:00:00.123'), X'0102ff', "
+                       "'CLOB-' || X, X'0a0b', ARRAY[X, NULL] FROM SYSTEM_RANGE(1, 25)")
+        cursor.execute("INSERT INTO TEST_FETCHMODE VALUES "
+                       "(NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, "
+                       "NULL, NULL), "
+                       "(-2147483648, -32768, -128, -9223372036854775808, '', '', -0.0001, 0, 0, FALSE, "
+                       "DATE '1900-01-01', TIME '00:00:00', TIMESTAMP '2099-12-31 23:59:59.999999', X'', '', X'', "
+                       "ARRAY[])")
+
+        def normalize(value):
+            # 大对象按照内容比较
+            if isinstance(value, SQLCliJDBCLargeObject):
+                return "LOB", value.getColumnTypeName(), value.getObjectLength(), \
+                    value.getData(1, value.getObjectLength())
+            return value
+
+        # 逐行读取，每次读取10行
+        cursor.execute("SELECT * FROM TEST_FETCHMODE ORDER BY C_INT NULLS FIRST")
+        rowModeRows = []
+        while True:
+            rowset = cursor.fetchmany(10)
+            rowModeRows.extend([tuple(normalize(value) for value in row) for row in rowset])
+            if len(rowset) < 10:
+                break
+
+        # 批量读取，返回按列组织的数据
+        cursor.execute("SELECT * FROM TEST_FETCHMODE ORDER BY C_INT NULLS FIRST")
+        bulkModeRows = []
+        while True:
+            columns = cursor.fetchmanycolumns(10)
+            self.assertEqual(17, len(columns))
+            bulkModeRows.extend([tuple(normalize(value) for value in row) for row in zip(*columns)])
+            if len(columns[0]) < 10:
+                break
+        cursor.close()
+        conn.close()
+
+        # 两种方式读取的数据和数据类型都应该完全相同
+        self.assertEqual(27, len(rowModeRows))
+        self.assertEqual(rowModeRows, bulkModeRows)
+        self.assertEqual([[type(value) for value in row] for row in rowModeRows],
+                         [[type(value) for value in row] for row in bulkModeRows])
+
     def test_SQLExecuteWithSQLCLI_CONNECTION_URL(self):
         from ..testcli import TestCli
 
@@ -1696,6 +2583,176 @@ class TestSynatx(unittest.TestCase):
             msg=msg
         )
 
+    def test_JobManagerAgentEvents(self):
+        import threading
+        import multiprocessing
+        from ..testclijobmanager import JOB, JOBManager, Workers
+
+        # 只有设置了超时、启动间隔、think_time的时候才需要定时唤醒Agent
+        job = JOB()
+        job.setParallel(2)
+        job.setLoop(2)
+        self.assertIsNone(job.getAgentDeadline())
+        job.setTimeOut(10)
+        worker = Workers()
+        worker.ProcessID = 100
+        worker.start_time = 1000
+        job.workers[0] = worker
+        self.assertEqual(1011, job.getAgentDeadline())
+        job.setStarterInterval(5)
+        job.setStarterLastActiveTime(1003)
+        job.setStartedJobs(1)
+        job.setActiveJobs(1)
+        self.assertEqual(1008, job.getAgentDeadline())
+        job.setStartedJobs(4)
+        self.assertEqual(1011, job.getAgentDeadline())
+
+        # 任务状态变化后，等待中的线程和Agent都会立即被唤醒
+        jobManager = JOBManager()
+        jobManager.agentWakeupReader, jobManager.agentWakeupWriter = multiprocessing.Pipe(duplex=False)
+        lastVersion = jobManager.jobStatusVersion
+        threading.Timer(0.2, jobManager.notifyJobStatusChanged).start()
+        startTime = time.time()
+        self.assertNotEqual(lastVersion, jobManager.waitJobStatusChanged(lastVersion, 10))
+        self.assertLess(time.time() - startTime, 5)
+        jobManager.notifyJobStatusChanged()
+        self.assertTrue(jobManager.agentWakeupReader.poll())
+        jobManager.clearAgentWakeup()
+        self.assertFalse(jobManager.agentWakeupReader.poll())
+
+    def test_JobWorkerProcess(self):
+        from ..testclijobmanager import JOBManager, WorkerProcess
+
+        workDir = tempfile.mkdtemp()
+        scriptFile = os.path.join(workDir, "testworkerprocess.sql")
+        with open(scriptFile, mode="w", encoding="utf-8") as f:
+            f.write("_SLEEP 0;\n")
+
+        # 同一个进程依次运行多个脚本
+        workerProcess = WorkerProcess(target=JOBManager.runSQLCliPool)
+        try:
+            for nLoop in range(0, 3):
+                self.assertTrue(workerProcess.isIdle())
+                workerProcess.submit({
+                    "script": scriptFile,
+                    "logon": None,
+                    "logfilename": os.path.join(workDir, "testworkerprocess" + str(nLoop) + ".log"),
+                    "commandMap": None,
+                    "nologo": True,
+                    "workername": "worker#0-" + str(nLoop),
+                    "xlog": "",
+                    "parserWarmUp": "OFF",
+                })
+                workerProcess.join(timeout=120)
+                self.assertFalse(workerProcess.is_alive())
+                self.assertEqual(0, workerProcess.exitcode)
+                self.assertTrue(os.path.exists(os.path.join(workDir, "testworkerprocess" + str(nLoop) + ".log")))
+
+            # 强制终止后进程不能再使用
+            workerProcess.terminate()
+            workerProcess.process.join()
+            self.assertFalse(workerProcess.isIdle())
+            self.assertIsNone(workerProcess.exitcode)
+        finally:
+            workerProcess.close()
+        self.assertFalse(workerProcess.process.is_alive())
+        shutil.rmtree(workDir)
+
+    def test_JobWorkerProcessReset(self):
+        from ..testclijobmanager import JOBManager, WorkerProcess
+
+        workDir = tempfile.mkdtemp()
+        # 第一次运行中修改比对选项、DEBUG选项，定义内嵌脚本中的变量
+        setupScriptFile = os.path.join(workDir, "testworkersetup.sql")
+        with open(setupScriptFile, mode="w", encoding="utf-8") as f:
+            f.write('_COMPARE SKIPLINE "aa*bb";\n')
+            f.write('_SET DEBUG ON\n')
+            f.write('> {%\nleakedVariable = 1\n%}\n')
+            f.write('> {%\nglobalMemFsHandler.makedirs("leakeddir")\n'
+                    'globalMemFsHandler.writetext("leakeddir/leakedfile.txt", "1")\n'
+                    'globalMemFsHandler.writetext("leakedfile.txt", "1")\n%}\n')
+        # 第二次运行在同一个进程中，所有的状态都应该恢复为默认
+        checkScriptFile = os.path.join(workDir, "testworkercheck.sql")
+        with open(checkScriptFile, mode="w", encoding="utf-8") as f:
+            f.write('_WHENEVER ERROR EXIT 3\n')
+            f.write('> {%\nimport os\nfrom testcli.commands import compare\n%}\n')
+            f.write('_ASSERT {% "leakedVariable" not in globals() %}\n')
+            f.write('_ASSERT {% len(compare.compareSkipLines) == 0 %}\n')
+            f.write('_ASSERT {% "TESTCLI_DEBUG" not in os.environ %}\n')
+            f.write('_ASSERT {% len(globalMemFsHandler.listdir("/")) == 0 %}\n')
+
+        workerProcess = WorkerProcess(target=JOBManager.runSQLCliPool)
+        try:
+            for nLoop, scriptFile in enumerate([setupScriptFile, checkScriptFile]):
+                workerProcess.submit({
+                    "script": scriptFile,
+                    "logon": None,
+                    "logfilename": os.path.join(workDir, "testworkerreset" + str(nLoop) + ".log"),
+                    "commandMap": None,
+                    "nologo": True,
+                    "workername": "worker#0-" + str(nLoop),
+                    "xlog": "",
+                    "parserWarmUp": "OFF",
+                })
+                workerProcess.join(timeout=120)
+                self.assertEqual(0, workerProcess.exitcode)
+        finally:
+            workerProcess.close()
+        shutil.rmtree(workDir)
+
+    def test_JobBarrier(self):
+        import threading
+        from ..jobbarrier import startJobBarrierServer, stopJobBarrierServer, waitJobBarrier
+
+        barrierServer = startJobBarrierServer()
+        try:
+            # 两个分组各自同步，互不影响
+            results = {}
+
+            def worker(groupName, workerName, parties):
+                results[workerName] = waitJobBarrier(barrierServer.url, groupName, "point1",
+                                                     workerName, parties, timeout=30)
+
+            workerThreads = []
+            for nWorker in range(0, 20):
+                workerThreads.append(threading.Thread(target=worker, args=("TAG:A", "A" + str(nWorker), 20)))
+            for nWorker in range(0, 3):
+                workerThreads.append(threading.Thread(target=worker, args=("JOB:1", "B" + str(nWorker), 3)))
+            for workerThread in workerThreads:
+                workerThread.start()
+            for workerThread in workerThreads:
+                workerThread.join(timeout=30)
+            self.assertEqual(23, len(results))
+
+            # 所有Worker都在最后一个Worker到达之后被释放
+            lastArrival = max(results["A" + str(nWorker)][0] for nWorker in range(0, 20))
+            for nWorker in range(0, 20):
+                self.assertGreaterEqual(results["A" + str(nWorker)][1], lastArrival)
+
+            # 释放后可以查询到达时间和释放时间
+            statistics = barrierServer.getStatistics("TAG:A")
+            self.assertEqual(1, len(statistics))
+            self.assertEqual(["TAG:A", "point1", 20], statistics[0][:3])
+            for nRetry in range(0, 50):
+                if len([row for row in barrierServer.getWorkerStatistics() if row[4] is not None]) == 23:
+                    break
+                time.sleep(0.1)
+            self.assertEqual(23, len([row for row in barrierServer.getWorkerStatistics() if row[4] is not None]))
+            self.assertEqual(2, len(barrierServer.getStatistics()))
+
+            # 同名的聚合点释放后可以再次使用
+            results.clear()
+            workerThreads = [threading.Thread(target=worker, args=("JOB:1", "C" + str(nWorker), 2))
+                             for nWorker in range(0, 2)]
+            for workerThread in workerThreads:
+                workerThread.start()
+            for workerThread in workerThreads:
+                workerThread.join(timeout=30)
+            self.assertEqual(2, len(results))
+            self.assertEqual(2, len(barrierServer.getStatistics("JOB:1")))
+        finally:
+            stopJobBarrierServer(barrierServer)
+
     def test_APIAnalyze_MultiPart(self):
         scriptFile = "testapisynatx-multipart.api"
 
@@ -1951,6 +3008,32 @@ class TestSynatx(unittest.TestCase):
                     print(line)
         self.assertTrue(compareResult)
 
+    def test_APIExecute_KeepAlive(self):
+        from ..testcli import TestCli
+
+        scriptFile = "testapiget.api"
+        fullScriptFile = os.path.abspath(os.path.join(os.path.dirname(__file__), "", scriptFile))
+        fullLogFile = os.path.abspath(os.path.join(tempfile.gettempdir(), "testapikeepalive.log"))
+
+        # 同一个会话中的多次请求复用同一个连接
+        testcli = TestCli(
+            logfilename=fullLogFile,
+            headlessMode=True,
+            script=fullScriptFile
+        )
+        retValue = testcli.run_cli()
+        self.assertEqual(0, retValue)
+        sessionPools = testcli.api_saved_pool["DEFAULT"]
+        self.assertEqual(1, len(sessionPools))
+        httpHandler = list(sessionPools.values())[0]
+        self.assertEqual(1, httpHandler.connection_from_url("http://127.0.0.1:8000").num_connections)
+
+        # 会话释放后，连接池被关闭
+        from ..commands.apiSession import apiSessionManage
+        for _ in apiSessionManage(cls=testcli, action="release"):
+            pass
+        self.assertNotIn("DEFAULT", testcli.api_saved_pool)
+
     def test_APIExecute_APITimeout(self):
         from ..testcli import TestCli
 
@@ -2311,6 +3394,108 @@ class TestSynatx(unittest.TestCase):
                     print(line)
         self.assertTrue(compareResult)
 
+    def test_sqlparsecache(self):
+        from ..testcli import TestCli
+        from ..parsecache import PARSECACHE_DIRNAME
+
+        scriptFile = "testautocommit.sql"
+
+        scriptBaseFile = os.path.splitext(scriptFile)[0]
+        fullScriptFile = os.path.abspath(os.path.join(os.path.dirname(__file__), "", scriptFile))
+        fullRefFile = os.path.abspath(os.path.join(os.path.dirname(__file__), "", scriptBaseFile + ".ref"))
+        fullLogFile = os.path.abspath(os.path.join(tempfile.gettempdir(), scriptBaseFile + ".log"))
+
+        # 解析缓存放在T_WORK指定的工作目录下
+        workDirectory = tempfile.mkdtemp()
+        oldWorkDirectory = os.environ.get("T_WORK")
+        os.environ["T_WORK"] = workDirectory
+        try:
+            # 运行两次，第一次生成缓存，第二次使用缓存，两次的结果都应该和参考文件一致
+            for nLoop in range(0, 2):
+                testcli = TestCli(
+                    logfilename=fullLogFile,
+                    headlessMode=True,
+                    script=fullScriptFile
+                )
+                testcli.testOptions.set("SCRIPT_PARSECACHE", "ON")
+                retValue = testcli.run_cli()
+                self.assertEqual(0, retValue)
+
+                cacheFiles = []
+                for root, dirs, files in os.walk(os.path.join(workDirectory, PARSECACHE_DIRNAME)):
+                    cacheFiles.extend(files)
+                self.assertEqual(1, len(cacheFiles))
+
+                compareHandler = POSIXCompare()
+                compareResult, compareReport = compareHandler.compare_text_files(
+                    file1=fullLogFile,
+                    file2=fullRefFile,
+                    CompareIgnoreTailOrHeadBlank=True
+                )
+                if not compareResult:
+                    for line in compareReport:
+                        if line.startswith("-") or line.startswith("+"):
+                            print(line)
+                self.assertTrue(compareResult)
+        finally:
+            if oldWorkDirectory is None:
+                del os.environ["T_WORK"]
+            else:
+                os.environ["T_WORK"] = oldWorkDirectory
+            shutil.rmtree(workDirectory, ignore_errors=True)
+
+    def test_ParseCacheStore(self):
+        import getpass
+        from ..parsecache import PARSECACHE_DIRNAME
+        from ..parsecache import getParseCacheDirectory
+        from ..parsecache import getParseCacheKey
+        from ..parsecache import loadParseCache
+        from ..parsecache import saveParseCache
+
+        workDirectory = tempfile.mkdtemp()
+        oldWorkDirectory = os.environ.get("T_WORK")
+        if oldWorkDirectory is not None:
+            del os.environ["T_WORK"]
+        try:
+            # 每个用户使用各自的缓存目录
+            cacheDirectory = getParseCacheDirectory(workDirectory)
+            self.assertEqual(os.path.join(workDirectory, PARSECACHE_DIRNAME, getpass.getuser()), cacheDirectory)
+
+            # 同样的语句在不同的命名空间下使用不同的缓存
+            self.assertNotEqual(getParseCacheKey("select 1;", "SQL"), getParseCacheKey("select 1;", "API"))
+
+            parseResult = ([{"name": "SELECT"}], ["select 1;"], [{}])
+            cacheKey = getParseCacheKey("select 1;", "SQL")
+            saveParseCache(cacheDirectory, cacheKey, parseResult)
+            self.assertEqual(parseResult, loadParseCache(cacheDirectory, cacheKey))
+
+            # 其他用户可以写入的缓存目录不被信任，不读取其中的内容
+            if hasattr(os, "getuid"):
+                os.chmod(cacheDirectory, 0o777)
+                self.assertIsNone(loadParseCache(cacheDirectory, cacheKey))
+                os.chmod(cacheDirectory, 0o700)
+                self.assertEqual(parseResult, loadParseCache(cacheDirectory, cacheKey))
+
+            # 缓存文件超过上限后，按照最后使用时间淘汰，刚刚读取过的文件被保留
+            cacheKeys = [getParseCacheKey("select " + str(nPos) + " from dual;", "SQL") for nPos in range(0, 10)]
+            for nPos, nCacheKey in enumerate(cacheKeys):
+                saveParseCache(cacheDirectory, nCacheKey, parseResult, maxFiles=100)
+                cacheFile = os.path.join(cacheDirectory, nCacheKey[:2], nCacheKey)
+                os.utime(cacheFile, (1000 + nPos, 1000 + nPos))
+            loadParseCache(cacheDirectory, cacheKeys[0])
+            saveParseCache(cacheDirectory, cacheKey, parseResult, maxFiles=8)
+            self.assertEqual(parseResult, loadParseCache(cacheDirectory, cacheKeys[0]))
+            self.assertEqual(parseResult, loadParseCache(cacheDirectory, cacheKey))
+            self.assertIsNone(loadParseCache(cacheDirectory, cacheKeys[1]))
+            cacheFiles = []
+            for root, dirs, files in os.walk(cacheDirectory):
+                cacheFiles.extend(files)
+            self.assertEqual(4, len(cacheFiles))
+        finally:
+            if oldWorkDirectory is not None:
+                os.environ["T_WORK"] = oldWorkDirectory
+            shutil.rmtree(workDirectory, ignore_errors=True)
+
     def test_monitor(self):
         from ..testcli import TestCli
 
@@ -2344,6 +3529,157 @@ class TestSynatx(unittest.TestCase):
                     print(line)
         self.assertTrue(compareResult)
 
+    def test_monitorscheduler(self):
+        from ..testoption import TestOptions
+        from ..commands import monitor
+
+        class MonitorCli:
+            testOptions = TestOptions()
+            xlogWriter = None
+
+        def executeRequest(requestObject):
+            return list(monitor.executeMonitorRequest(MonitorCli(), requestObject))
+
+        # 管理器停止后可以再次启动
+        for nRound in range(0, 2):
+            taskName = "schedulertask" + str(nRound)
+            executeRequest({"action": "startManager", "workerThreads": 2})
+            executeRequest({"action": "createTask", "taskName": taskName,
+                            "param": {"TAG": "cpu_percent", "FREQ": "100ms"}})
+            executeRequest({"action": "createTask", "taskName": taskName,
+                            "param": {"TAG": "cpu_count"}})
+            executeRequest({"action": "startTask", "taskName": taskName})
+            time.sleep(1)
+            executeRequest({"action": "stopManager"})
+
+            # 每100毫秒采集一次，一次性的任务只采集一次
+            samples = {series.monitorItem: series.count for series in monitor.getMonitorSeries(taskName)}
+            self.assertGreaterEqual(samples["cpu_percent"], 6)
+            self.assertLessEqual(samples["cpu_percent"], 12)
+            self.assertEqual(1, samples["cpu_count"])
+            self.assertIsNone(monitor.schedulerThread)
+            self.assertEqual([], monitor.workerThreads)
+
+        self.assertEqual(0.1, monitor.getMonitorFreq({"FREQ": "100ms"}))
+        self.assertEqual(2.5, monitor.getMonitorFreq({"FREQ": "2.5"}))
+        self.assertEqual(monitor.defaultMonitorFreq, monitor.getMonitorFreq({}))
+
+    def test_monitorseries(self):
+        import csv
+        from ..commands import monitor
+
+        # 环形缓冲区写满后覆盖最早的采样，数值保持原始精度
+        for nSample in range(0, 8):
+            monitor.appendMonitorSample(
+                taskId="seriestest", taskName="seriestask", monitorItem="memory", monitorTime=1000.0 + nSample,
+                monitorValue={"total": 17179869184 + nSample, "percent": 10.5 * nSample}, bufferSize=5)
+            monitor.appendMonitorSample(
+                taskId="seriestest", taskName="seriestask", monitorItem="network", monitorTime=1000.0 + nSample,
+                monitorValue={"nicName": "eth0", "netin": float(nSample)}, bufferSize=5)
+        memorySeries = [series for series in monitor.getMonitorSeries("seriestask")
+                        if series.monitorItem == "memory"][0]
+        self.assertEqual([1003.0, 1004.0, 1005.0, 1006.0, 1007.0],
+                         [timestamp for timestamp, values in memorySeries.getRows()])
+        self.assertEqual(17179869191, memorySeries.getRows()[-1][1]["total"])
+
+        # 统计信息
+        summary = {(row[1], row[2], row[3]): row[4:] for row in monitor.getMonitorSummary("seriestask")}
+        self.assertEqual((5, 3.0, 7.0, 5.0, 5.0, 6.6, 6.96), summary[("network", "eth0", "netin")])
+        self.assertEqual((5, 31.5, 73.5, 52.5), summary[("memory", "memory", "percent")][:4])
+
+        # 导出为CSV和按列组织的JSON文件
+        exportDir = tempfile.mkdtemp()
+        exportFiles = dict(monitor.exportMonitorSeries("seriestask", exportDir))
+        csvFile = os.path.join(exportDir, "seriestask_network_eth0.csv")
+        self.assertEqual(5, exportFiles[csvFile])
+        with open(csvFile, newline="") as f:
+            csvRows = list(csv.reader(f))
+        self.assertEqual([["timestamp", "netin"], ["1003.0", "3.0"]], csvRows[:2])
+        monitor.exportMonitorSeries("seriestask", exportDir, "JSON")
+        with open(os.path.join(exportDir, "seriestask_network_eth0.json")) as f:
+            jsonContent = json.load(f)
+        self.assertEqual({"nicName": "eth0"}, jsonContent["labels"])
+        self.assertEqual([3.0, 4.0, 5.0, 6.0, 7.0], jsonContent["columns"]["netin"])
+        shutil.rmtree(exportDir)
+
+    def test_monitorseriesexpire(self):
+        from ..commands import monitor
+
+        # 缓冲区随采样逐步增长，不会预先分配全部的空间
+        series = monitor.MonitorSeries(
+            taskId="growtest", taskName="growtask", monitorItem="memory", seriesName="memory",
+            fields=["total", "percent"], bufferSize=monitor.defaultMonitorBufferSize)
+        self.assertEqual(0, len(series.timestamps))
+        for nSample in range(0, 3):
+            series.append(1000.0 + nSample, {"total": 100, "percent": 1.5}, {})
+        self.assertEqual(3, len(series.timestamps))
+        self.assertEqual(3, len(series.columns["percent"]))
+        self.assertLess(series.timestamps.buffer_info()[1], 1024)
+
+        # 写满后不再增长
+        series = monitor.MonitorSeries(
+            taskId="growtest", taskName="growtask", monitorItem="memory", seriesName="memory",
+            fields=["total"], bufferSize=4)
+        for nSample in range(0, 10):
+            series.append(1000.0 + nSample, {"total": nSample}, {})
+        self.assertEqual(4, len(series.timestamps))
+        self.assertEqual([6.0, 7.0, 8.0, 9.0], series.getColumns()["total"])
+
+        # 进程退出后，其采样在若干个周期后被删除，仍在运行的进程不受影响
+        for nSample in range(0, 20):
+            monitor.appendMonitorSample(
+                taskId="expiretest", taskName="expiretask", monitorItem="process", monitorTime=1000.0 + nSample,
+                monitorValue={"pid": 100, "threads": 4})
+            if nSample < 5:
+                monitor.appendMonitorSample(
+                    taskId="expiretest", taskName="expiretask", monitorItem="process", monitorTime=1000.0 + nSample,
+                    monitorValue={"pid": 200, "threads": 8})
+        self.assertEqual(
+            ["100", "200"], sorted(series.seriesName for series in monitor.getMonitorSeries("expiretask")))
+        self.assertEqual(0, monitor.expireMonitorSeries("expiretest", 1004.0))
+        self.assertEqual(1, monitor.expireMonitorSeries("expiretest", 1018.0))
+        self.assertEqual(["100"], [series.seriesName for series in monitor.getMonitorSeries("expiretask")])
+
+    def test_xlogwriter(self):
+        import sqlite3
+        from ..testcli import TestCli
+        from ..xlogwriter import XlogWriter
+        from ..xlogwriter import XLOG_INSERT_PERFLOG
+
+        workDir = tempfile.mkdtemp()
+        xlogFile = os.path.join(workDir, "testxlog.db")
+        scriptFile = os.path.join(workDir, "testxlog.sql")
+        with open(scriptFile, mode="w", encoding="utf-8") as f:
+            f.write("_SLEEP 0;\n_SLEEP 0;\n")
+
+        # 运行结束的时候，所有的语句都已经写入xlog
+        testcli = TestCli(
+            logfilename=os.path.join(workDir, "testxlog.log"),
+            headlessMode=True,
+            script=scriptFile,
+            xlog=xlogFile,
+            xlogoverwrite=True,
+        )
+        self.assertEqual(0, testcli.run_cli())
+        xlogHandle = sqlite3.connect(xlogFile)
+        self.assertEqual("wal", xlogHandle.execute("PRAGMA journal_mode").fetchone()[0])
+        self.assertEqual(2, xlogHandle.execute(
+            "SELECT Count(*) FROM TestCli_Xlog WHERE Command LIKE '%SLEEP%'").fetchone()[0])
+
+        # 达到批量大小或者调用flush的时候提交，关闭时写入剩余的记录
+        xlogWriter = XlogWriter(xlogFile, batchRows=100, flushInterval=60)
+        for nRow in range(0, 150):
+            xlogWriter.append(XLOG_INSERT_PERFLOG, ("2023-01-01 00:00:00", 1, "task", "item", str(nRow)))
+        xlogWriter.flush()
+        self.assertEqual(150, xlogHandle.execute("SELECT Count(*) FROM TestCli_PerfLog").fetchone()[0])
+        xlogWriter.append(XLOG_INSERT_PERFLOG, ("2023-01-01 00:00:00", 1, "task", "item", "last"))
+        xlogWriter.close()
+        xlogWriter.append(XLOG_INSERT_PERFLOG, ("2023-01-01 00:00:00", 1, "task", "item", "closed"))
+        self.assertEqual(["last"], [row[0] for row in xlogHandle.execute(
+            "SELECT MonitorValue FROM TestCli_PerfLog WHERE MonitorValue In ('last', 'closed')").fetchall()])
+        xlogHandle.close()
+        shutil.rmtree(workDir)
+
     def test_robotdemo(self):
         def on_rm_error(func, path, exc_info):
             if func or exc_info:
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+    本地的WebHDFS模拟服务
+    用本地目录模拟HDFS的文件系统，支持数据生成和文件转换需要用到的操作：
+        CREATE/APPEND  按照WebHDFS的协议，先返回307重定向到数据节点地址，再接收文件内容（支持分块传输）
+        OPEN           读取文件内容
+        GETFILESTATUS  查询文件信息
+        DELETE         删除文件
+    用于离线运行HDFS相关的测试和性能测试，不需要真实的HDFS集群
+
+    运行方式：
+        python -m testcli.test.testwebhdfsserver [rootDir] [port]
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+# 每次读写的数据块大小
+WEBHDFS_BUFFERSIZE = 1024 * 1024
+
+
+class WebHdfsRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    webHdfsPrefix = "/webhdfs/v1"
+
+    def log_message(self, format, *args):
+        # 不输出访问日志
+        pass
+
+    def parseRequest(self):
+        urlParts = urlparse(self.path)
+        params = {k.lower(): v[0] for k, v in parse_qs(urlParts.query).items()}
+        hdfsPath = unquote(urlParts.path)
+        if hdfsPath.startswith(self.webHdfsPrefix):
+            hdfsPath = hdfsPath[len(self.webHdfsPrefix):]
+        localPath = os.path.join(self.server.rootDir, hdfsPath.lstrip("/"))
+        return params.get("op", "").upper(), params, localPath
+
+    def sendJson(self, status: int, content):
+        body = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def sendError(self, status: int, exception: str, message: str):
+        self.sendJson(status, {"RemoteException": {"exception": exception, "message": message}})
+
+    def sendRedirect(self):
+        # 第一步请求不带数据，重定向到"数据节点"，这里仍然是本服务
+        location = "http://%s:%d%s&datanode=true" % (self.server.server_address[0],
+                                                      self.server.server_address[1], self.path)
+        self.send_response(307)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def readBody(self):
+        # 请求体可能是分块传输，也可能是固定长度
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                chunkSize = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if chunkSize == 0:
+                    # 跳过结尾的空行
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                while chunkSize > 0:
+                    chunk = self.rfile.read(min(chunkSize, WEBHDFS_BUFFERSIZE))
+                    chunkSize = chunkSize - len(chunk)
+                    yield chunk
+                self.rfile.readline()
+        else:
+            contentLength = int(self.headers.get("Content-Length", "0"))
+            while contentLength > 0:
+                chunk = self.rfile.read(min(contentLength, WEBHDFS_BUFFERSIZE))
+                if not chunk:
+                    break
+                contentLength = contentLength - len(chunk)
+                yield chunk
+
+    def receiveFile(self, localPath: str, mode: str, status: int):
+        os.makedirs(os.path.dirname(localPath), exist_ok=True)
+        with open(localPath, mode=mode) as fp:
+            for chunk in self.readBody():
+                fp.write(chunk)
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_PUT(self):
+        op, params, localPath = self.parseRequest()
+        if op != "CREATE":
+            self.sendError(400, "IllegalArgumentException", "Unsupported operation [" + op + "].")
+            return
+        if "datanode" not in params:
+            if os.path.exists(localPath) and params.get("overwrite", "false").lower() != "true":
+                self.sendError(403, "FileAlreadyExistsException", localPath + " already exists.")
+                return
+            self.sendRedirect()
+            return
+        self.receiveFile(localPath, mode="wb", status=201)
+
+    def do_POST(self):
+        op, params, localPath = self.parseRequest()
+        if op != "APPEND":
+            self.sendError(400, "IllegalArgumentException", "Unsupported operation [" + op + "].")
+            return
+        if not os.path.isfile(localPath):
+            self.sendError(404, "FileNotFoundException", "File does not exist: " + localPath)
+            return
+        if "datanode" not in params:
+            self.sendRedirect()
+            return
+        self.receiveFile(localPath, mode="ab", status=200)
+
+    def do_GET(self):
+        op, params, localPath = self.parseRequest()
+        if not os.path.exists(localPath):
+            self.sendError(404, "FileNotFoundException", "File does not exist: " + localPath)
+            return
+        if op == "GETFILESTATUS":
+            self.sendJson(200, {
+                "FileStatus": {
+                    "length": os.path.getsize(localPath) if os.path.isfile(localPath) else 0,
+                    "type": "FILE" if os.path.isfile(localPath) else "DIRECTORY",
+                    "modificationTime": int(os.path.getmtime(localPath) * 1000),
+                }
+            })
+            return
+        if op != "OPEN":
+            self.sendError(400, "IllegalArgumentException", "Unsupported operation [" + op + "].")
+            return
+        offset = int(params.get("offset", "0"))
+        fileSize = os.path.getsize(localPath)
+        length = fileSize - offset
+        if "length" in params:
+            length = min(length, int(params["length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(max(length, 0)))
+        self.end_headers()
+        with open(localPath, mode="rb") as fp:
+            fp.seek(offset)
+            while length > 0:
+                chunk = fp.read(min(length, WEBHDFS_BUFFERSIZE))
+                if not chunk:
+                    break
+                length = length - len(chunk)
+                self.wfile.write(chunk)
+
+    def do_DELETE(self):
+        op, params, localPath = self.parseRequest()
+        isDeleted = os.path.exists(localPath)
+        if os.path.isdir(localPath):
+            shutil.rmtree(localPath)
+        elif isDeleted:
+            os.remove(localPath)
+        self.sendJson(200, {"boolean": isDeleted})
+
+
+class WebHdfsServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, rootDir: str, host: str = "127.0.0.1", port: int = 0):
+        self.rootDir = rootDir
+        super().__init__((host, port), WebHdfsRequestHandler)
+
+    @property
+    def url(self):
+        return "http://%s:%d" % (self.server_address[0], self.server_address[1])
+
+
+def startWebHdfsServer(rootDir: str = None, host: str = "127.0.0.1", port: int = 0):
+    """
+        在后台线程中启动模拟服务，port为0的时候使用随机端口，通过返回对象的url属性获得服务地址
+    """
+    if rootDir is None:
+        rootDir = tempfile.mkdtemp(prefix="testcli_webhdfs")
+    server = WebHdfsServer(rootDir=rootDir, host=host, port=port)
+    serverThread = threading.Thread(target=server.serve_forever, daemon=True)
+    serverThread.start()
+    return server
+
+
+def stopWebHdfsServer(server: WebHdfsServer):
+    server.shutdown()
+    server.server_close()
+
+
+# 主程序
+if __name__ == '__main__':
+    webHdfsServer = WebHdfsServer(rootDir=sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp(),
+                                  port=int(sys.argv[2]) if len(sys.argv) > 2 else 50070)
+    print("WebHDFS stand-in server listening on " + webHdfsServer.url + ", root [" + webHdfsServer.rootDir + "].")
+    webHdfsServer.serve_forever()
@@ -5,7 +5,6 @@ import sys
 import traceback
 import re
 import time
-import sqlite3
 import setproctitle
 import click
 import configparser
@@ -25,6 +24,10 @@ from .testcliexception import TestCliException
 from .testclijobmanager import TestCliMeta
 from .testclijobmanager import JOBManager
 from .testoption import TestOptions
+from .xlogwriter import XlogWriter
+from .xlogwriter import XLOG_INSERT_COMMAND
+from .xlogwriter import openXlogDatabase
+from .xlogwriter import removeXlogDatabase
 from .globalvar import lastCommandResult
 from .__init__ import __version__
 from .sqlparse import SQLAnalyze
@@ -35,6 +38,7 @@ from .commands.compare import compareSkipLines
 from .commands.compare import compareOption
 from .commands.compare import compareDefaultOption
 from .commands.monitor import stopMonitorManager
+from .commands.apiSession import releaseApiSessionPool
 
 OFLAG_LOGFILE = 1
 OFLAG_LOGGER = 2
@@ -91,6 +95,7 @@ class TestCli(object):
 
         self.db_saved_conn = {}                         # 数据库Session对象，可能存在多个Session，并存在切换需要
         self.api_saved_conn = {}                        # HTTP请求Session对象，可能存在多个Session，并存在切换需要
+        self.api_saved_pool = {}                        # HTTP请求Session对应的连接池，请求之间复用连接
 
         self.plugin = {}                                # 程序的外挂插件
         self.cmdMappingHandler = CmdMapping()           # 函数句柄，处理SQLMapping信息
@@ -108,6 +113,7 @@ class TestCli(object):
         self.xlogFile = None                            # xlog文件名
         self.xlogFileFullPath = None                    # xlog文件名-绝对路径
         self.xlogFileHandle = None                      # xlog文件句柄
+        self.xlogWriter = None                          # xlog的异步写入线程
         self.breakWithError = breakWithError            # 是否在遇到错误的时候退出
         self.breakErrorCode = breakErrorCode            # 遇到错误的退出代码
 
@@ -241,6 +247,7 @@ class TestCli(object):
         self.JobHandler.setProcessContextInfo("xlog", xlog)
         self.JobHandler.setProcessContextInfo("logfilename", self.logfilename)
         self.JobHandler.setProcessContextInfo("script", self.commandScript)
+        self.JobHandler.setProcessContextInfo("parserWarmUp", self.testOptions.get("PARSER_WARMUP"))
 
         # 设置其他的变量
         self.cmdExecuteHandler.cliHandler = self
@@ -383,13 +390,9 @@ class TestCli(object):
             # 创建文件，并写入文件头信息
             if self.xlogOverwrite:
                 # 如果打开了覆盖模式，则删除之前的历史文件
-                if os.path.exists(self.xlogFile):
-                    os.remove(self.xlogFile)
+                removeXlogDatabase(self.xlogFile)
             self.xlogFileFullPath = os.path.abspath(self.xlogFile)
-            self.xlogFileHandle = sqlite3.connect(
-                database=self.xlogFile,
-                check_same_thread=False,
-            )
+            self.xlogFileHandle = openXlogDatabase(self.xlogFile)
             cursor = self.xlogFileHandle.cursor()
             cursor.execute("CREATE TABLE IF NOT EXISTS TestCli_Xlog "
                            "("
@@ -420,6 +423,9 @@ class TestCli(object):
                            "  MonitorValue    TEXT"
                            ")")
             cursor.close()
+            self.xlogFileHandle.commit()
+            # 日志记录由后台线程批量写入
+            self.xlogWriter = XlogWriter(self.xlogFileFullPath)
 
         # 加载已经被隐式包含的数据库驱动，文件放置在testcli\jlib下
         # 首先尝试TESTCLI_JLIBDIR下的内容，其次查看安装目录下的东西
@@ -549,10 +555,16 @@ class TestCli(object):
             self.MetaHandler.ShutdownServer()
             self.MetaHandler = None
 
-        # 关闭xlog的文件句柄
+        # 关闭xlog的文件句柄，关闭前写入所有尚未写入的日志
+        if self.xlogWriter is not None:
+            self.xlogWriter.close()
         if self.xlogFileHandle is not None:
             self.xlogFileHandle.close()
 
+        # 关闭HTTP连接池
+        for httpSessionName in list(self.api_saved_pool.keys()):
+            releaseApiSessionPool(self, httpSessionName)
+
         # 还原sys.stdout和sys.stderr
         if self.__sysstdout_origin is not None:
             sys.stdout = self.__sysstdout_origin
@@ -864,6 +876,7 @@ class TestCli(object):
         # 取消进程共享服务的注册信息
         self.JobHandler.unregisterjob()
         self.JobHandler.unregisterAgent()
+        self.JobHandler.stopBarrierServer()
 
         # 关闭Meta服务
         if self.MetaHandler is not None:
@@ -967,6 +980,8 @@ class TestCli(object):
             # 生成xdb文件, 里头包含的信息有：
             # ScenarioId, ScenarioName, Elapsed, Status, MessageShort
             if self.xlogFileHandle is not None:
+                # 读取前等待所有的日志写入完成
+                self.xlogWriter.flush()
                 cursor = self.xlogFileHandle.cursor()
                 cursor.execute(
                     "SELECT     ScenarioId,ScenarioName,SuiteName,CaseName,"
@@ -1042,7 +1057,10 @@ class TestCli(object):
             self.logfile.close()
             self.logfile = None
 
-        # 关闭扩展日志的句柄
+        # 关闭扩展日志的句柄，关闭前写入所有尚未写入的日志
+        if self.xlogWriter is not None:
+            self.xlogWriter.close()
+            self.xlogWriter = None
         if self.xlogFileHandle is not None:
             self.xlogFileHandle.close()
             self.xlogFileHandle = None
@@ -1329,10 +1347,10 @@ class TestCli(object):
         # 线程名称         processName
 
         # 如果没有打开性能日志记录文件，直接跳过
-        if self.xlogFileHandle is None:
+        if self.xlogWriter is None:
             return
 
-        # 多进程，多线程写入，考虑锁冲突
+        # 记录放入队列后由后台线程批量写入，不等待写入完成
         try:
             # 对于多线程运行，这里的processName格式为JOB_NAME#副本数-完成次数
             # 对于单线程运行，这里的processName格式为固定的MAIN
@@ -1343,7 +1361,6 @@ class TestCli(object):
                 script = "Console"
             else:
                 script = str(os.path.basename(self.executeScript))
-            cursor = self.xlogFileHandle.cursor()
             data = (
                 script,
                 time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(commandResult["startedTime"])),
@@ -1360,14 +1377,6 @@ class TestCli(object):
                 str(commandResult["scenarioId"]),
                 str(commandResult["scenarioName"])
             )
-            cursor.execute(
-                "Insert Into TestCli_Xlog(Script,Started,Elapsed,RawCommand,"
-                "CommandType,Command,CommandStatus,ErrorCode,WorkerName,SuiteName,CaseName,"
-                "TestRunId, ScenarioId, ScenarioName) "
-                "Values(?,?,?,?,  ?,?,?,?,?,?,?,  ?,?,?)",
-                data
-            )
-            cursor.close()
-            self.xlogFileHandle.commit()
+            self.xlogWriter.append(XLOG_INSERT_COMMAND, data)
         except Exception as ex:
             print("Internal error:: xlog file [" + str(self.xlogFile) + "] write not complete. " + repr(ex))
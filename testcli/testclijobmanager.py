@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import multiprocessing
+import multiprocessing.connection
 import threading
 import time
 import os
@@ -13,7 +14,11 @@ import jpype
 import socket
 from .testcliexception import TestCliException
 from .sqlclijdbc import connect as jdbcconnect
+from .jobbarrier import startJobBarrierServer, stopJobBarrierServer, waitJobBarrier
 
+# Agent没有收到任何事件时最长的等待时间（秒）
+# 正常情况下Agent由进程退出、任务状态变化或者定时任务（超时、启动间隔等）唤醒，这里只是兜底
+JOBMANAGER_AGENT_MAXWAIT = 30
 
 # 并发作业处理
 '''
@@ -60,6 +65,10 @@ class TestCliMeta(object):
                     print('traceback.print_exc():\n%s' % traceback.print_exc())
                     print('traceback.format_exc():\n%s' % traceback.format_exc())
             self.MetaServer = None
+        elif self.dbConn is not None:
+            # 作为Worker连接到Meta服务，只需要断开连接。预先启动的Worker进程会多次运行脚本，不能遗留连接
+            self.dbConn.close()
+            self.dbConn = None
 
     def StartAsServer(self):
         try:
@@ -113,7 +122,8 @@ class TestCliMeta(object):
                     "    ParentProcessID Integer,\n" \
                     "    ProcessPath     VARCHAR(500),\n" \
                     "    StartTime       TimeStamp,\n" \
-                    "    EndTime         TimeStamp\n" \
+                    "    EndTime         TimeStamp,\n" \
+                    "    BarrierURL      VARCHAR(500)\n" \
                     ")"
             m_db_cursor.execute(m_SQL)
             m_SQL = "CREATE TABLE IF Not Exists TESTCLI_JOBS\n" \
@@ -249,6 +259,81 @@ class Workers:
         self.Timer_Point = []          # 进程当前已经到达的聚合点
 
 
+# 预先启动的Worker进程
+# 进程启动后等待主进程通过管道发送需要运行的脚本，一个脚本运行结束后可以继续运行下一个
+class WorkerProcess:
+    def __init__(self, target):
+        # jpype无法运行在fork机制下的子进程中，linux默认为fork机制，所以这里要强制为spawn
+        # fork模式下，子进程会继承父进程的一些信息
+        # spawn模式下，子进程为全新进程
+        m_ProcessManagerContext = multiprocessing.get_context("spawn")
+        self.conn, m_ChildConn = m_ProcessManagerContext.Pipe()
+        self.process = m_ProcessManagerContext.Process(target=target, args=(m_ChildConn,))
+        self.process.start()
+        m_ChildConn.close()
+        self.pid = self.process.pid
+        self.isRunning = False                  # 当前是否有脚本正在运行
+        self.exitcode = None                    # 上一次脚本运行的退出状态，被强制终止的时候为None
+
+    # 发送一个需要运行的脚本
+    def submit(self, p_args):
+        self.exitcode = None
+        self.isRunning = True
+        self.conn.send(p_args)
+
+    # 当前运行的脚本是否还没有结束
+    def is_alive(self):
+        if not self.isRunning:
+            return False
+        try:
+            if self.conn.poll():
+                self.exitcode = self.conn.recv()
+                self.isRunning = False
+                return False
+        except (EOFError, OSError):
+            # 进程已经退出，管道已经关闭
+            pass
+        if not self.process.is_alive():
+            self.exitcode = self.process.exitcode
+            self.isRunning = False
+            return False
+        return True
+
+    # 等待当前运行的脚本结束，随后exitcode为脚本的退出状态
+    def join(self, timeout=None):
+        if self.isRunning:
+            multiprocessing.connection.wait(self.getWaitHandles(), timeout=timeout)
+        self.is_alive()
+
+    # 进程是否可以接收新的脚本
+    def isIdle(self):
+        return not self.is_alive() and self.process.is_alive()
+
+    # 等待脚本运行结束的时候需要监听的句柄，脚本结束或者进程退出时可读
+    def getWaitHandles(self):
+        return [self.conn, self.process.sentinel]
+
+    # 强制终止当前运行的脚本，进程随之退出
+    def terminate(self):
+        self.process.terminate()
+        self.isRunning = False
+        self.exitcode = None
+
+    # 通知进程退出
+    def close(self):
+        if self.process.is_alive():
+            if not self.isRunning:
+                try:
+                    self.conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                self.process.join(timeout=10)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
 # 任务信息
 class JOB:
     def __init__(self):
@@ -396,6 +481,15 @@ class JOB:
     def getStarterLastActiveTime(self):
         return self.starter_last_active_time
 
+    # 返回上一次Starter工作的时间，unix的时间戳，没有启动过的时候返回None
+    # Meta中保存的是TimeStamp类型，读取回来的是字符串
+    def getStarterLastActiveTimeStamp(self):
+        if self.starter_last_active_time is None:
+            return None
+        if isinstance(self.starter_last_active_time, str):
+            return int(time.mktime(time.strptime(self.starter_last_active_time[:19], "%Y-%m-%d %H:%M:%S")))
+        return int(self.starter_last_active_time)
+
     # 设置正在执行的脚本名称
     def setScript(self, p_Script):
         self.script = p_Script
@@ -515,12 +609,15 @@ class JOB:
         if self.started_jobs >= self.loop * self.parallel:
             # 如果到目前位置，已经启动的进程数量超过了总数要求，直接退出
             return []
-        if self.starter_interval != 0 and self.started_jobs < self.parallel:
+        if self.starter_interval != 0 and self.started_jobs < self.parallel and \
+                self.starter_last_active_time is not None:
             # 如果上一个批次启动时间到现在还不到限制时间要求，则不再启动
-            if self.starter_last_active_time + self.starter_interval > currenttime:
+            if self.getStarterLastActiveTimeStamp() + self.starter_interval > currenttime:
                 # 还不到可以启动进程的时间, 返回空列表
                 return []
 
+        # 本次最多可以启动的进程数量，既不能超过并发度，也不能超过剩余需要完成的次数
+        maxStarterCount = min(self.parallel - self.active_jobs, self.loop * self.parallel - self.started_jobs)
         # 循环判断每个JOB信息，考虑think_time以及starter_interval
         for nPos in range(0, self.parallel):
             if nPos in self.workers.keys():
@@ -531,7 +628,7 @@ class JOB:
                         if self.workers[nPos].end_time + self.think_time > currenttime:
                             # 还不满足ThinkTime的限制要求，跳过
                             continue
-                    if len(idleWorkerHandlerList) >= (self.parallel - self.active_jobs):
+                    if len(idleWorkerHandlerList) >= maxStarterCount:
                         # 如果已经要启动的进程已经满足最大进程数限制，则不再考虑新进程
                         break
                     else:
@@ -541,16 +638,38 @@ class JOB:
                     continue
             else:
                 # 不存在该Worker信息, 不需要考虑thinktime, 可以启动
-                if len(idleWorkerHandlerList) >= (self.parallel - self.active_jobs):
+                if len(idleWorkerHandlerList) >= maxStarterCount:
                     # 如果已经要启动的进程已经满足最大进程数限制，则不再考虑新进程
                     break
                 else:
                     idleWorkerHandlerList.append(nPos)
         # 更新批次启动时间的时间
         if self.starter_interval != 0:
-            self.starter_last_active_time = currenttime
+            self.starter_last_active_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(currenttime))
         return idleWorkerHandlerList
 
+    # 返回下一次需要Agent处理的时间点，unix的时间戳
+    # 包括：Starter下一批次的启动时间，Worker的think_time到期时间，Worker的超时时间
+    # 没有需要定时处理的内容时返回None
+    def getAgentDeadline(self):
+        deadlines = []
+        if self.active_jobs < self.parallel and self.started_jobs < self.loop * self.parallel:
+            if self.starter_interval != 0 and self.started_jobs < self.parallel and \
+                    self.starter_last_active_time is not None:
+                deadlines.append(self.getStarterLastActiveTimeStamp() + self.starter_interval)
+            if self.think_time != 0:
+                for worker in self.workers.values():
+                    if worker.ProcessID == 0 and worker.end_time is not None:
+                        deadlines.append(int(worker.end_time) + self.think_time)
+        if self.timeout != 0:
+            for worker in self.workers.values():
+                if worker.ProcessID != 0 and worker.start_time is not None:
+                    # 超时的判断条件是start_time + timeout < currenttime
+                    deadlines.append(int(worker.start_time) + self.timeout + 1)
+        if len(deadlines) == 0:
+            return None
+        return min(deadlines)
+
     # 启动作业任务
     def StartWorker(self, p_MetaConn, p_WorkerHandlerID: int, p_ProcessID: int):
         m_CurrentTime = int(time.mktime(datetime.datetime.now().timetuple()))
@@ -621,6 +740,9 @@ class JOBManager(object):
         # 进程句柄信息
         self.processHandlerInfo = {}
 
+        # 预先启动的Worker进程, (JOB_ID, WorkerHandler_ID) -> WorkerProcess
+        self.workerPool = {}
+
         # 当前清理进程的状态, NOT-STARTED, RUNNING, WAITINGFOR_STOP, STOPPED
         # 如果WorkerStatus==WAITINGFOR_STOP 则Worker主动停止
         self.WorkerStatus = "NOT-STARTED"
@@ -640,6 +762,25 @@ class JOBManager(object):
         # 是否为手动注册的Worker
         self.isManualRegister = False
 
+        # Agent线程
+        self.agentThread = None
+
+        # Agent的唤醒通道，任务状态发生变化后通知Agent立即处理，而不是等待下一次轮询
+        # 通道中最多只保留一个未处理的唤醒消息
+        self.agentWakeupReader = None
+        self.agentWakeupWriter = None
+        self.agentWakeupPending = False
+        self.agentWakeupLock = threading.Lock()
+
+        # 任务状态的变化通知，每次保存JOB信息后版本号加一，waitjob据此等待
+        self.jobStatusVersion = 0
+        self.jobStatusCondition = threading.Condition()
+
+        # 聚合点服务，只在JobManager所在的进程中运行
+        self.barrierServer = None
+        # 聚合点服务的地址，Worker进程从Meta中获得
+        self.barrierURL = None
+
     # 设置Meta的连接信息
     def setMetaConn(self, p_conn):
         self.MetaConn = p_conn
@@ -838,27 +979,74 @@ class JOBManager(object):
             m_db_cursor.close()
             return m_Job
 
-    # 根据JobName返回指定的JOB信息
+    # 返回所有的JOB信息
     def getAllJobs(self):
-        # 返回指定的Job信息，如果找不到，返回None
-        m_SQL = "SELECT Job_ID FROM TESTCLI_JOBS ORDER BY Job_ID"
+        # JOB信息和Worker信息各查询一次，不再按照JOB逐个查询
+        m_SQL = "SELECT Job_ID,Job_Name,Starter_Interval, " \
+                "       Starter_Last_Active_Time, Parallel, Loop, " \
+                "       Started_JOBS, Failed_JOBS,Finished_JOBS,Active_JOBS,Error_Message, " \
+                "       Script, Script_FullName, Think_Time, Timeout, " \
+                "       Submit_Time, Start_Time, End_Time, " \
+                "       Blowout_Threshold_Count, Status, JOB_TAG " \
+                "FROM TESTCLI_JOBS ORDER BY Job_ID"
         m_db_cursor = self.MetaConn.cursor()
         m_db_cursor.execute(m_SQL)
         m_rs = m_db_cursor.fetchall()
+        m_db_cursor.close()
         if m_rs is None:
-            m_db_cursor.close()
             return []
-        else:
-            m_JOBList = []
+        m_JOBList = []
+        m_JOBDict = {}
+        for m_row in m_rs:
+            m_Job = JOB()
+            m_Job.setJobID(m_row[0])
+            m_Job.setJobName(m_row[1])
+            m_Job.setStarterInterval(m_row[2])
+            m_Job.setStarterLastActiveTime(m_row[3])
+            m_Job.setParallel(m_row[4])
+            m_Job.setLoop(m_row[5])
+            m_Job.setStartedJobs(m_row[6])
+            m_Job.setFailedJobs(m_row[7])
+            m_Job.setFinishedJobs(m_row[8])
+            m_Job.setActiveJobs(m_row[9])
+            m_Job.setErrorMessage(m_row[10])
+            m_Job.setScript(m_row[11])
+            m_Job.setScriptFullName(m_row[12])
+            m_Job.setThinkTime(m_row[13])
+            m_Job.setTimeOut(m_row[14])
+            m_Job.setSubmitTime(m_row[15])
+            m_Job.setStartTime(m_row[16])
+            m_Job.setEndTime(m_row[17])
+            m_Job.setBlowoutThresHoldCount(m_row[18])
+            m_Job.setStatus(m_row[19])
+            m_Job.setTag(m_row[20])
+            m_JOBList.append(m_Job)
+            m_JOBDict[m_Job.getJobID()] = m_Job
+
+        # 获取Worker信息
+        m_SQL = "SELECT JOB_ID,WorkerHandler_ID,ProcessID,start_time,end_time,exit_code, Finished_Status,Timer_Point " \
+                "FROM   TESTCLI_WORKERS"
+        m_db_cursor = self.MetaConn.cursor()
+        m_db_cursor.execute(m_SQL)
+        m_rs = m_db_cursor.fetchall()
+        m_db_cursor.close()
+        if m_rs is not None:
             for m_row in m_rs:
-                m_Job = self.getJobByID(m_row[0])
-                m_JOBList.append(m_Job)
-            m_db_cursor.close()
-            return m_JOBList
+                if m_row[0] not in m_JOBDict:
+                    continue
+                m_Worker = Workers()
+                m_Worker.WorkerHandler_ID = m_row[1]
+                m_Worker.ProcessID = m_row[2]
+                m_Worker.start_time = m_row[3]
+                m_Worker.end_time = m_row[4]
+                m_Worker.exit_code = m_row[5]
+                m_Worker.Finished_Status = m_row[6]
+                m_Worker.Timer_Point = m_row[7]
+                m_JOBDict[m_row[0]].setWorker(m_Worker)
+        return m_JOBList
 
     @staticmethod
-    def runSQLCli(p_args):
-        import sys
+    def runSQLCliScript(p_args, p_WarmUp=True):
         from .testcli import TestCli
 
         # 运行子进程的时候，不需要启动JOBManager
@@ -872,7 +1060,141 @@ class JOBManager(object):
             workerName=p_args["workername"],
             xlog=p_args["xlog"]
         )
-        sys.exit(sqlcliHandler.run_cli())
+        # 子进程是全新启动的进程，如果主进程要求预热解析器，则在执行脚本前完成预热
+        if p_args["parserWarmUp"] == "ON":
+            if p_WarmUp:
+                from .sqlparse import SQLWarmUp
+                from .apiparse import APIWarmUp
+                SQLWarmUp()
+                APIWarmUp()
+            sqlcliHandler.testOptions.set("PARSER_WARMUP", "ON")
+            sqlcliHandler.JobHandler.setProcessContextInfo("parserWarmUp", "ON")
+        return sqlcliHandler.run_cli()
+
+    # Worker进程被多次复用的时候，每次运行脚本前把进程范围的全局状态恢复到进程刚启动时的状态
+    # 避免上一次运行中的_COMPARE SKIPLINE、_SET DEBUG ON、内嵌脚本中的变量等影响到下一次运行
+    @staticmethod
+    def resetSQLCliState():
+        from . import globalvar
+        from . import common
+        from .commands import compare
+        from .commands import data
+        from .commands import load
+        from .commands import monitor
+        from .commands import ssh
+        from .commands.assertExpression import compiledCodeCache, COMPILED_CODE_CACHESIZE
+
+        # 内嵌脚本的命名空间，删除运行中新增的内容，恢复被覆盖的内容
+        for m_Key in list(globalvar.globalEmbeddScriptScope.keys()):
+            if m_Key not in globalvar.globalEmbeddScriptScopeInitial:
+                del globalvar.globalEmbeddScriptScope[m_Key]
+        globalvar.globalEmbeddScriptScope.update(globalvar.globalEmbeddScriptScopeInitial)
+        globalvar.lastCommandResult.clear()
+        globalvar.globalParserOption["pool"] = True
+        # 内存文件系统中上一次运行生成的文件
+        # 内嵌脚本的命名空间中同样引用了这个文件系统，这里只清空内容，不替换对象
+        for m_FileName in globalvar.globalMemFsHandler.listdir("/"):
+            if globalvar.globalMemFsHandler.isdir(m_FileName):
+                globalvar.globalMemFsHandler.removetree(m_FileName)
+            else:
+                globalvar.globalMemFsHandler.remove(m_FileName)
+        if 'TESTCLI_DEBUG' in os.environ:
+            del os.environ['TESTCLI_DEBUG']
+
+        # 变量的查找方式可能依赖于上一次运行中定义的变量
+        common.statementVariableBindings.clear()
+        compiledCodeCache.resize(COMPILED_CODE_CACHESIZE)
+
+        # 比对选项
+        compare.compareDefaultOption["algorithm"] = "auto"
+        compare.compareOption.clear()
+        compare.compareOption.update(compare.compareDefaultOption)
+        compare.compareMaskLines.clear()
+        compare.compareSkipLines.clear()
+
+        # 数据生成
+        data.seedFileDir = ""
+        data.seedDataCache.clear()
+        data.hdfsConnectedUser = None
+        data.setDataRandomSeed(None)
+        data.reset_identity()
+
+        # 加载的脚本和插件
+        load.scriptModule.clear()
+        load.scriptFunction.clear()
+        load.plugins.clear()
+        load.scriptFileCache.clear()
+
+        # 监控任务和采集结果，监控管理器在上一次运行退出时已经停止
+        with monitor.monitorSeriesLock:
+            monitor.monitorSeries.clear()
+        monitor.monitorTasks.clear()
+        monitor.currentTaskId = 0
+
+        # 没有断开的SSH连接
+        for m_SshContext in ssh.sshSession.values():
+            try:
+                if m_SshContext.getSftpHandler() is not None:
+                    m_SshContext.getSftpHandler().close()
+                if m_SshContext.getSshTransport() is not None:
+                    m_SshContext.getSshTransport().close()
+            except Exception:
+                pass
+        ssh.sshSession.clear()
+        ssh.sshCurrentSessionName = "NONAME"
+
+    @staticmethod
+    def runSQLCli(p_args):
+        import sys
+
+        sys.exit(JOBManager.runSQLCliScript(p_args))
+
+    # 预先启动的Worker进程，从管道中依次接收需要运行的脚本，运行结束后返回退出状态
+    # 进程内的JVM、JDBC驱动、解析器在多次运行之间保持不变，不再需要每次重新初始化
+    @staticmethod
+    def runSQLCliPool(p_Conn):
+        bWarmedUp = False
+        while True:
+            try:
+                m_args = p_Conn.recv()
+            except EOFError:
+                # 主进程已经退出
+                break
+            if m_args is None:
+                break
+            try:
+                JOBManager.resetSQLCliState()
+                m_ExitCode = JOBManager.runSQLCliScript(m_args, p_WarmUp=not bWarmedUp)
+                bWarmedUp = True
+            except SystemExit as se:
+                m_ExitCode = se.code
+            except Exception:
+                traceback.print_exc()
+                m_ExitCode = 1
+            if m_ExitCode is None:
+                m_ExitCode = 0
+            elif not isinstance(m_ExitCode, int):
+                m_ExitCode = 1
+            p_Conn.send(m_ExitCode)
+        p_Conn.close()
+
+    # 返回JOB指定Worker可以使用的预先启动进程，没有空闲进程的时候启动一个新的进程
+    def getPoolWorker(self, p_Job: JOB, p_WorkerHandlerID: int):
+        m_PoolKey = (p_Job.getJobID(), p_WorkerHandlerID)
+        m_Process = self.workerPool.get(m_PoolKey)
+        if m_Process is None or not m_Process.isIdle():
+            if m_Process is not None:
+                m_Process.close()
+            m_Process = WorkerProcess(target=self.runSQLCliPool)
+            self.workerPool[m_PoolKey] = m_Process
+        return m_Process
+
+    # 关闭不再需要的预先启动进程
+    def closePoolWorkers(self, p_ActiveJobIDList=None):
+        for m_PoolKey in list(self.workerPool.keys()):
+            if p_ActiveJobIDList is not None and m_PoolKey[0] in p_ActiveJobIDList:
+                continue
+            self.workerPool.pop(m_PoolKey).close()
 
     # 后台守护线程，跟踪进程信息，启动或强制关闭进程
     def JOBManagerAgent(self):
@@ -884,8 +1206,11 @@ class JOBManager(object):
                 if self.getWorkerStatus() == "WAITINGFOR_STOP":
                     self.setWorkerStatus("STOPPED")
                     break
+                # 清除已经收到的唤醒消息，随后的状态变化会重新唤醒Agent
+                self.clearAgentWakeup()
                 # 循环处理工作JOB
-                for m_Job in self.getAllJobs():
+                m_JobList = self.getAllJobs()
+                for m_Job in m_JobList:
                     if m_Job.getStatus() in ("Submitted", "FAILED", "SHUTDOWNED", "FINISHED", "ABORTED"):
                         # 已经结束的Case不再处理， 或者刚提交，但是没有执行的
                         continue
@@ -1025,6 +1350,7 @@ class JOBManager(object):
                                       "nologo": self.getProcessContextInfo("nologo"),
                                       "commandMap": self.getProcessContextInfo("commandMap"),
                                       "script": m_Job.getScriptFullName(),
+                                      "parserWarmUp": self.getProcessContextInfo("parserWarmUp"),
                                       "workername":
                                           m_Job.getJobName() + "#" + str(m_WorkerStarter) + "-" +
                                           str(m_JOB_Sequence+1)
@@ -1059,12 +1385,9 @@ class JOBManager(object):
                                     str(m_JOB_Sequence+1) + "-" + \
                                     str(m_WorkerStarter) + ".log"
                             m_args["logfilename"] = logFileName
-                            # jpype无法运行在fork机制下的子进程中，linux默认为fork机制，所以这里要强制为spawn
-                            # fork模式下，子进程会继承父进程的一些信息
-                            # spawn模式下，子进程为全新进程
-                            m_ProcessManagerContext = multiprocessing.get_context("spawn")
-                            m_Process = m_ProcessManagerContext.Process(target=self.runSQLCli, args=(m_args,))
-                            m_Process.start()
+                            # 同一个Worker的多次循环使用同一个预先启动的进程，进程不可用的时候才重新启动
+                            m_Process = self.getPoolWorker(m_Job, m_WorkerStarter)
+                            m_Process.submit(m_args)
 
                             # 更新Worker字典信息
                             m_Job.StartWorker(self.MetaConn, m_WorkerStarter, m_Process.pid)
@@ -1076,18 +1399,87 @@ class JOBManager(object):
                             m_JOB_Sequence = m_JOB_Sequence + 1
                             self.SaveJob(m_Job)
                             self.processHandlerInfo[m_Process.pid] = m_Process
-                # 每0.5秒检查一次任务
-                time.sleep(3)
+
+                # 已经退出，但是不再属于任何运行中JOB的进程，直接释放，避免反复唤醒Agent
+                m_ActiveProcessIDList = []
+                for m_Job in m_JobList:
+                    if m_Job.getStatus() in ("RUNNING", "WAITINGFOR_SHUTDOWN", "WAITINGFOR_ABORT"):
+                        for m_Worker in m_Job.getWorkers():
+                            m_ActiveProcessIDList.append(m_Worker.ProcessID)
+                for m_ProcessID in list(self.processHandlerInfo.keys()):
+                    if m_ProcessID not in m_ActiveProcessIDList and \
+                            not self.processHandlerInfo[m_ProcessID].is_alive():
+                        self.processHandlerInfo.pop(m_ProcessID)
+                        self.notifyJobStatusChanged()
+                # 已经结束的JOB，关闭对应的预先启动进程
+                self.closePoolWorkers(
+                    [m_Job.getJobID() for m_Job in m_JobList
+                     if m_Job.getStatus() in ("RUNNING", "WAITINGFOR_SHUTDOWN", "WAITINGFOR_ABORT")])
+
+                # 等待下一个事件：Worker进程退出、任务状态变化、或者最近一个需要定时处理的时间点
+                m_NextDeadline = None
+                for m_Job in m_JobList:
+                    if m_Job.getStatus() in ("RUNNING", "WAITINGFOR_SHUTDOWN", "WAITINGFOR_ABORT"):
+                        m_JobDeadline = m_Job.getAgentDeadline()
+                        if m_JobDeadline is not None:
+                            if m_NextDeadline is None or m_JobDeadline < m_NextDeadline:
+                                m_NextDeadline = m_JobDeadline
+                m_WaitTimeout = JOBMANAGER_AGENT_MAXWAIT
+                if m_NextDeadline is not None:
+                    m_WaitTimeout = min(m_WaitTimeout, max(m_NextDeadline - time.time(), 0))
+                m_WaitList = [self.agentWakeupReader]
+                for m_Process in self.processHandlerInfo.values():
+                    m_WaitList.extend(m_Process.getWaitHandles())
+                multiprocessing.connection.wait(m_WaitList, timeout=m_WaitTimeout)
         except Exception as e:
             click.secho("JobManager failed with [" + repr(e) + "]. Quit JobManager Agent.", err=True, fg="red")
             self.isAgentStarted = False
+            # 通知正在等待的waitjob，Agent已经退出
+            self.notifyJobStatusChanged()
+
+    # 唤醒Agent，处理新的任务状态
+    # Agent线程自身修改任务状态时不需要唤醒，当前这一轮处理结束后会重新计算
+    def wakeupAgent(self, force=False):
+        if self.agentWakeupWriter is None:
+            return
+        if not force and threading.current_thread() is self.agentThread:
+            return
+        with self.agentWakeupLock:
+            if self.agentWakeupPending:
+                # 已经有没有处理的唤醒消息
+                return
+            self.agentWakeupPending = True
+            self.agentWakeupWriter.send_bytes(b"W")
+
+    # 清除Agent已经收到的唤醒消息
+    def clearAgentWakeup(self):
+        with self.agentWakeupLock:
+            while self.agentWakeupReader.poll():
+                self.agentWakeupReader.recv_bytes()
+            self.agentWakeupPending = False
+
+    # 通知任务状态已经发生变化
+    def notifyJobStatusChanged(self):
+        with self.jobStatusCondition:
+            self.jobStatusVersion = self.jobStatusVersion + 1
+            self.jobStatusCondition.notify_all()
+        self.wakeupAgent()
+
+    # 等待任务状态发生变化，返回最新的版本号
+    def waitJobStatusChanged(self, p_LastVersion, p_Timeout):
+        with self.jobStatusCondition:
+            self.jobStatusCondition.wait_for(lambda: self.jobStatusVersion != p_LastVersion, timeout=p_Timeout)
+            return self.jobStatusVersion
 
     # 启动Agent进程
     def registerAgent(self):
+        if self.agentWakeupReader is None:
+            self.agentWakeupReader, self.agentWakeupWriter = multiprocessing.Pipe(duplex=False)
         # 启动后台守护线程，用来处理延时启动，超时等问题
         Agenthread = threading.Thread(target=self.JOBManagerAgent)
         Agenthread.daemon = True  # 主进程退出，守护进程也会退出
         Agenthread.name = "JobManagerAgent"
+        self.agentThread = Agenthread
         Agenthread.start()
         self.isAgentStarted = True
 
@@ -1096,11 +1488,9 @@ class JOBManager(object):
         if self.isAgentStarted:
             if self.getWorkerStatus() == "RUNNING":
                 self.setWorkerStatus("WAITINGFOR_STOP")
-                while True:
-                    if self.getWorkerStatus() == "STOPPED":
-                        break
-                    else:
-                        time.sleep(1)
+                self.wakeupAgent(force=True)
+                self.agentThread.join()
+            self.closePoolWorkers()
             self.isAgentStarted = False
 
     def SaveJob(self, p_objJOB: JOB):
@@ -1202,6 +1592,8 @@ class JOBManager(object):
                 print('traceback.format_exc():\n%s' % traceback.format_exc())
         finally:
             self.MetaLockHandler.release()
+        # 通知Agent以及正在等待的waitjob
+        self.notifyJobStatusChanged()
 
     # 提交一个任务
     def createjob(self, p_szname: str):
@@ -1256,7 +1648,7 @@ class JOBManager(object):
             if m_Job is None:
                 return None, None, None, None, "JOB [" + jobName + "] does not exist."
             strMessages = strMessages + 'JOB_Name = [{0:12}]; ID = [{1:4d}]; Tag = [{2:12}], Status = [{3:12}]\n'.\
-                format(jobName, m_Job.getJobID(), m_Job.getTag(), m_Job.getStatus())
+                format(jobName, m_Job.getJobID(), str(m_Job.getTag()), m_Job.getStatus())
             strMessages = strMessages + 'ActiveJobs/FailedJobs/FinishedJobs: [{0:15d}/{1:15d}/{2:15d}]\n'.\
                 format(m_Job.getActiveJobs(), m_Job.getFailedJobs(), m_Job.getFinishedJobs())
             strMessages = strMessages + 'Submit Time: [{0:70}]\n'.format(str(m_Job.getSubmitTime()))
@@ -1270,7 +1662,7 @@ class JOBManager(object):
             if m_Job.getStartTime() is None:
                 m_ElapsedTime = 0
             else:
-                m_ElapsedTime = time.time() - time.mktime(time.strptime(m_Job.getStartTime(), "%Y-%m-%d %H:%M:%S"))
+                m_ElapsedTime = time.time() - time.mktime(time.strptime(str(m_Job.getStartTime())[:19], "%Y-%m-%d %H:%M:%S"))
             strMessages = strMessages + 'Think time: [{0:15d}]; Timeout: [{1:15d}]; Elapsed: [{2:15s}]\n'.\
                 format(m_Job.getThinkTime(), m_Job.getTimeOut(), "%10.2f" % float(m_ElapsedTime))
             strMessages = strMessages + 'Blowout Threshold Count: [{0:58d}]\n'.\
@@ -1299,6 +1691,25 @@ class JOBManager(object):
                            m_StartTime, m_EndTime, str(m_Worker.Timer_Point))
                 strMessages = strMessages + '+{0:10s}+{1:10s}+{2:20s}+{3:20s}+{4:20s}+\n'.\
                     format('-' * 10, '-' * 10, '-' * 20, '-' * 20, '-' * 20)
+            m_BarrierStatistics = self.getBarrierStatistics(m_Job)
+            if len(m_BarrierStatistics) != 0:
+                # 聚合点的到达时间和释放时间差，单位为毫秒
+                strMessages = strMessages + 'Timer Points>>>:\n'
+                strMessages = strMessages + '+{0:20s}+{1:8s}+{2:15s}+{3:15s}+{4:15s}+{5:15s}+\n'.format(
+                    '-'*20, '-'*8, '-'*15, '-'*15, '-'*15, '-'*15)
+                strMessages = strMessages + '|{0:20s}|{1:8s}|{2:15s}|{3:15s}|{4:15s}|{5:15s}|\n'.format(
+                    'Timer_Point', 'Parties', 'First_Arrival', 'Released', 'Arrival_Skew', 'Release_Skew')
+                strMessages = strMessages + '+{0:20s}+{1:8s}+{2:15s}+{3:15s}+{4:15s}+{5:15s}+\n'.format(
+                    '-'*20, '-'*8, '-'*15, '-'*15, '-'*15, '-'*15)
+                for m_Row in m_BarrierStatistics:
+                    strMessages = strMessages + '|{0:20s}|{1:8d}|{2:15s}|{3:15s}|{4:15s}|{5:15s}|\n'.format(
+                        str(m_Row[1]), m_Row[2],
+                        datetime.datetime.fromtimestamp(m_Row[3]).strftime("%H:%M:%S.%f")[:12],
+                        datetime.datetime.fromtimestamp(m_Row[5]).strftime("%H:%M:%S.%f")[:12],
+                        "%.3fms" % m_Row[6],
+                        "N/A" if m_Row[7] is None else "%.3fms" % m_Row[7])
+                    strMessages = strMessages + '+{0:20s}+{1:8s}+{2:15s}+{3:15s}+{4:15s}+{5:15s}+\n'.format(
+                        '-'*20, '-'*8, '-'*15, '-'*15, '-'*15, '-'*15)
             return {
                 "type": "result",
                 "title": None,
@@ -1338,40 +1749,34 @@ class JOBManager(object):
                     raise TestCliException("Invalid timeout set [" + str(paramValue) + "], it must be digit.")
                 timeoutLimit = int(paramValue)
         start = time.time()
-        if p_jobName.lower() == "all":
-            while True:
-                # 如果JobManager意外退出，也没有继续等待下去的意义
-                if not self.isAgentStarted:
-                    raise TestCliException("Job agent unexpected lost. Job wait failed.")
-                # 等待也是有时间限制的
-                if (timeoutLimit > 0) and ((time.time() - start) > timeoutLimit):
-                    raise TestCliException("Job wait terminated. Timeout [" + str(timeoutLimit) + "]")
-                # 没有正在运行的JOB
-                if not self.isAllJobClosed():
-                    time.sleep(3)
-                    continue
-                # 没有已经提交，但是还没有运行的JOB
-                bAllProcessFinished = True
-                for m_Job in self.getAllJobs():
-                    if m_Job.getStatus() not in \
-                            ["Submitted", "FINISHED", "SHUTDOWNED", "ABORTED", "FAILED"]:
-                        bAllProcessFinished = False
-                        time.sleep(3)
-                        continue
-                if bAllProcessFinished:
-                    break
-        else:
-            while True:
-                # 如果JobManager意外退出，也没有继续等待下去的意义
-                if not self.isAgentStarted:
-                    raise TestCliException("Job agent unexpected lost. Job wait failed.")
-                # 等待也是有时间限制的
-                if (timeoutLimit > 0) and ((time.time() - start) > timeoutLimit):
-                    raise TestCliException("Job wait terminated. Timeout [" + str(timeoutLimit) + "]")
+        while True:
+            # 先记录状态版本，检查之后发生的变化都会唤醒后面的等待
+            m_StatusVersion = self.jobStatusVersion
+            # 如果JobManager意外退出，也没有继续等待下去的意义
+            if not self.isAgentStarted:
+                raise TestCliException("Job agent unexpected lost. Job wait failed.")
+            # 等待也是有时间限制的
+            if (timeoutLimit > 0) and ((time.time() - start) > timeoutLimit):
+                raise TestCliException("Job wait terminated. Timeout [" + str(timeoutLimit) + "]")
+            if p_jobName.lower() == "all":
+                # 没有正在运行的JOB, 也没有已经提交，但是还没有运行的JOB
+                if self.isAllJobClosed():
+                    bAllProcessFinished = True
+                    for m_Job in self.getAllJobs():
+                        if m_Job.getStatus() not in \
+                                ["Submitted", "FINISHED", "SHUTDOWNED", "ABORTED", "FAILED"]:
+                            bAllProcessFinished = False
+                            break
+                    if bAllProcessFinished:
+                        break
+            else:
                 if self.isJobClosed(p_jobName):
                     break
-                else:
-                    time.sleep(3)
+            # 等待任务状态发生变化
+            m_WaitTimeout = JOBMANAGER_AGENT_MAXWAIT
+            if timeoutLimit > 0:
+                m_WaitTimeout = min(m_WaitTimeout, max(start + timeoutLimit - time.time(), 0) + 0.1)
+            self.waitJobStatusChanged(m_StatusVersion, m_WaitTimeout)
 
     # 停止JOB作业
     def shutdownjob(self, p_jobName: str):
@@ -1409,6 +1814,57 @@ class JOBManager(object):
                 self.SaveJob(m_Job)
         return nJobAborted
 
+    # 启动聚合点服务
+    def startBarrierServer(self):
+        if self.barrierServer is not None:
+            return
+        self.barrierServer = startJobBarrierServer()
+        self.barrierURL = self.barrierServer.url
+        # 聚合点服务的地址记录在Meta中，连接到Meta的Worker进程都可以找到
+        m_SQL = "UPDATE TESTCLI_ServerInfo " \
+                "SET    BarrierURL = ? " \
+                "WHERE  ProcessID = ?"
+        m_db_cursor = self.MetaConn.cursor()
+        m_db_cursor.execute(m_SQL, parameters=[self.barrierURL, os.getpid()])
+        m_db_cursor.close()
+        self.MetaConn.commit()
+
+    # 停止聚合点服务
+    def stopBarrierServer(self):
+        if self.barrierServer is not None:
+            stopJobBarrierServer(self.barrierServer)
+            self.barrierServer = None
+            self.barrierURL = None
+
+    # 返回聚合点服务的地址
+    def getBarrierURL(self):
+        if self.barrierURL is None:
+            m_SQL = "SELECT BarrierURL FROM TESTCLI_ServerInfo WHERE BarrierURL Is Not Null"
+            m_db_cursor = self.MetaConn.cursor()
+            m_db_cursor.execute(m_SQL)
+            m_rs = m_db_cursor.fetchone()
+            m_db_cursor.close()
+            if m_rs is None:
+                raise TestCliException("TestCli-0000:  Job barrier service is not available.")
+            self.barrierURL = m_rs[0]
+        return self.barrierURL
+
+    # 返回JOB在聚合点服务中的分组名称，相同TAG的JOB属于同一个分组
+    @staticmethod
+    def getBarrierGroup(p_Job: JOB):
+        if (p_Job.getTag() is None) or (p_Job.getTag() == ""):
+            return "JOB:" + str(p_Job.getJobID())
+        else:
+            return "TAG:" + p_Job.getTag()
+
+    # 返回聚合点的统计信息，只有运行聚合点服务的进程可以查看
+    def getBarrierStatistics(self, p_Job: JOB = None):
+        if self.barrierServer is None:
+            return []
+        if p_Job is None:
+            return self.barrierServer.getStatistics()
+        return self.barrierServer.getStatistics(self.getBarrierGroup(p_Job))
+
     # 等待TimerPoint到特定的时间点
     def waitjobtimer(self, p_TimerPoint):
         # 获得当前的Worker_Tag
@@ -1428,88 +1884,40 @@ class JOBManager(object):
         else:
             m_SQL = "SELECT     Sum(J.Parallel) " \
                     "FROM       TESTCLI_JOBS J " \
-                    "WHERE      J.Job_TAG = '" + m_JobTag + "' " + \
+                    "WHERE      J.Job_TAG = ? " \
                     "AND        Status Not In ('FAILED', 'SHUTDOWNED', 'FINISHED', 'ABORTED') "
             m_db_cursor = self.MetaConn.cursor()
-            m_db_cursor.execute(m_SQL)
+            m_db_cursor.execute(m_SQL, parameters=[m_JobTag])
             m_rs = m_db_cursor.fetchone()
             m_TotalParallel = m_rs[0]
             m_db_cursor.close()
 
-        # 自己已经到达时间点， 标记Timer_Point为自己等待的时间点
+        # 自己已经到达时间点， 标记Timer_Point为自己等待的时间点，用于显示JOB的运行情况
         m_Worker.Timer_Point = p_TimerPoint
         m_Job.setWorker(m_Worker)
-        m_db_cursor = self.MetaConn.cursor()
         m_SQL = "UPDATE TESTCLI_WORKERS " \
                 "SET    Timer_Point = ? " \
-                "WHERE  ProcessID=" + str(os.getpid())
-        m_Data = [
-            m_Worker.Timer_Point
-        ]
-        m_db_cursor.execute(m_SQL, parameters=m_Data)
+                "WHERE  ProcessID = ?"
+        m_db_cursor = self.MetaConn.cursor()
+        m_db_cursor.execute(m_SQL, parameters=[p_TimerPoint, os.getpid()])
+        m_db_cursor.close()
         self.MetaConn.commit()
 
-        # 检查是否为READY状态，如果是，则可以离开
-        while True:
-            # 检查其他进程是否到达该检查点
-            m_TimerPointAllArrived = False
-            if (m_JobTag is None) or (m_JobTag == ""):
-                m_SQL = "SELECT     COUNT(1) " \
-                        "FROM       TESTCLI_WORKERS T " \
-                        "WHERE      T.Job_ID = " + str(m_Job.id) + " " + \
-                        "AND        T.Timer_Point ='" + p_TimerPoint + "'"
-            else:
-                m_SQL = "SELECT     COUNT(1) " \
-                        "FROM       TESTCLI_WORKERS T " \
-                        "WHERE      T.Job_TAG = '" + m_JobTag + "' " + \
-                        "AND        T.Timer_Point ='" + p_TimerPoint + "'"
-            m_db_cursor = self.MetaConn.cursor()
-            m_db_cursor.execute(m_SQL)
-            m_rs = m_db_cursor.fetchone()
-            if m_rs[0] == m_TotalParallel:
-                m_db_cursor.close()
-                m_TimerPointAllArrived = True
-            m_db_cursor.close()
-
-            # 如果所有进程都已经到达检查点，则标记所有进程为READY符号，否则等待其他进程标记
-            if m_TimerPointAllArrived:
-                if (m_JobTag is None) or (m_JobTag == ""):
-                    m_SQL = "UPDATE     TESTCLI_WORKERS T " \
-                            "SET        T.Timer_Point ='__READY__'" \
-                            "WHERE      T.Job_ID = " + str(m_Job.id) + \
-                            "AND        T.Timer_Point ='" + p_TimerPoint + "'"
-                else:
-                    m_SQL = "UPDATE     TESTCLI_WORKERS T " \
-                            "SET        T.Timer_Point ='__READY__'" \
-                            "WHERE      T.Job_Tag = '" + m_JobTag + "'" \
-                            "AND        T.Timer_Point ='" + p_TimerPoint + "'"
-                m_db_cursor = self.MetaConn.cursor()
-                m_db_cursor.execute(m_SQL)
-                m_db_cursor.close()
-                self.MetaConn.commit()
-
-            # 如果已经被其他进程标记为READY，退出等待
-            m_SQL = "SELECT    COUNT(*) " \
-                    "FROM      TESTCLI_WORKERS " \
-                    "WHERE     ProcessID = " + str(os.getpid()) + " " + \
-                    "AND       Timer_Point = '__READY__' "
-            m_db_cursor = self.MetaConn.cursor()
-            m_db_cursor.execute(m_SQL)
-            m_rs = m_db_cursor.fetchone()
-            if m_rs[0] != 0:
-                m_db_cursor.close()
-                break
-            self.MetaConn.commit()
-
-            # 2秒钟之后再检查Worker的状态
-            time.sleep(2)
+        # 在聚合点服务上等待其他进程到达，最后一个进程到达后所有进程同时被释放
+        waitJobBarrier(
+            barrierURL=self.getBarrierURL(),
+            groupName=self.getBarrierGroup(m_Job),
+            timerPoint=p_TimerPoint,
+            workerName=m_Job.getJobName() + "#" + str(m_Worker.WorkerHandler_ID) + "-" + str(os.getpid()),
+            parties=int(m_TotalParallel)
+        )
 
-        # 离开当前等待，清空READY状态
-        m_db_cursor = self.MetaConn.cursor()
+        # 离开当前等待，清空等待状态
         m_SQL = "UPDATE TESTCLI_WORKERS " \
                 "SET    Timer_Point = Null " \
-                "WHERE  ProcessID =" + str(os.getpid())
-        m_db_cursor.execute(m_SQL)
+                "WHERE  ProcessID = ?"
+        m_db_cursor = self.MetaConn.cursor()
+        m_db_cursor.execute(m_SQL, parameters=[os.getpid()])
         m_db_cursor.close()
         self.MetaConn.commit()
 
@@ -1629,6 +2037,7 @@ class JOBManager(object):
                     if cls.MetaHandler.dbConn is not None:
                         os.environ["TESTCLI_JOBMANAGERURL"] = cls.MetaHandler.MetaURL
                         cls.JobHandler.setMetaConn(cls.MetaHandler.dbConn)
+                        cls.JobHandler.startBarrierServer()
                         cls.testOptions.set("JOBMANAGER", "ON")
                         cls.testOptions.set("JOBMANAGER_METAURL", cls.MetaHandler.MetaURL)
                         yield {
@@ -1660,6 +2069,7 @@ class JOBManager(object):
                     del os.environ["TESTCLI_JOBMANAGERURL"]
                     cls.testOptions.set("JOBMANAGER", "OFF")
                     cls.testOptions.set("JOBMANAGER_METAURL", '')
+                    cls.JobHandler.stopBarrierServer()
                     cls.MetaHandler.ShutdownServer()
                     yield {
                         "type": "result",
@@ -42,6 +42,10 @@ class TestOptions(object):
                                     "Value": 10000,
                                     "Comments": '',
                                     "Hidden": False})
+        self.testOptionList.append({"Name": "SQL_FETCHMODE",
+                                    "Value": "BULK",
+                                    "Comments": 'BULK|ROW',
+                                    "Hidden": False})
         self.testOptionList.append({"Name": "LOB_LENGTH",
                                     "Value": 20,
                                     "Comments": '',
@@ -152,6 +156,20 @@ class TestOptions(object):
                                     "Comments": '',
                                     "Hidden": False})
 
+        self.testOptionList.append({"Name": "SCRIPT_PARSECACHE",
+                                    "Value": "OFF",
+                                    "Comments": 'ON|OFF',
+                                    "Hidden": False})
+
+        self.testOptionList.append({"Name": "PARSER_POOL",
+                                    "Value": "ON",
+                                    "Comments": 'ON|OFF',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "PARSER_WARMUP",
+                                    "Value": "OFF",
+                                    "Comments": 'ON|OFF',
+                                    "Hidden": False})
+
         self.testOptionList.append({"Name": "SCRIPT_ENCODING",
                                     "Value": "UTF-8",
                                     "Comments": '',
@@ -172,9 +190,9 @@ class TestOptions(object):
                                     "Comments": 'Default compare algorithm.',
                                     "Hidden": False})
 
-        self.testOptionList.append({"Name": "COMPARE_DIFFLIB_THRESHOLD",
+        self.testOptionList.append({"Name": "COMPARE_LINEAR_THRESHOLD",
                                     "Value": 1000,
-                                    "Comments": 'Threshold(lines) for use difflib in auto compare algorithm.',
+                                    "Comments": 'Threshold(lines) for use linear space myers in compare algorithm.',
                                     "Hidden": False})
 
         self.testOptionList.append({"Name": "NAMESPACE",
@@ -195,6 +213,34 @@ class TestOptions(object):
                                     "Value": "",
                                     "Comments": 'Proxy address of http request. (Default)',
                                     "Hidden": False})
+        self.testOptionList.append({"Name": "DATA_PARALLEL",
+                                    "Value": 1,
+                                    "Comments": 'Number of processes for _DATA CREATE.',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "DATA_PARALLEL_MERGE",
+                                    "Value": "ON",
+                                    "Comments": 'ON(Default)|OFF. Merge part files of parallel _DATA CREATE.',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "DATA_SEED",
+                                    "Value": "",
+                                    "Comments": 'Random seed of _DATA CREATE. Default is none.',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "API_KEEPALIVE",
+                                    "Value": "ON",
+                                    "Comments": 'ON(Default)|OFF. Reuse http connections in api session.',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "API_POOLSIZE",
+                                    "Value": 10,
+                                    "Comments": 'Max http connections per host in api session.',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "SORT_SPILLROWS",
+                                    "Value": 1000000,
+                                    "Comments": 'Max rows sorted in memory for [Order] hint, more rows will spill to temp files.',
+                                    "Hidden": False})
+        self.testOptionList.append({"Name": "EXPRESSION_CACHESIZE",
+                                    "Value": 1024,
+                                    "Comments": 'Max compiled expressions and embedded scripts kept in cache.',
+                                    "Hidden": False})
 
         # 如果DEBUG选项设置为TRUE，需要处理
         for pos in range(0, len(self.testOptionList)):
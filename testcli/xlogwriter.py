@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+    扩展日志(xlog)的异步写入
+
+    执行语句和性能监控都会把结果写入xlog(sqlite数据库)，如果每一条记录都单独提交，
+    语句的执行时间会受到磁盘同步(fsync)的影响，多个线程、进程之间也会争抢数据库锁
+    这里用一个后台线程负责写入：
+        调用者只把记录放入有界队列，不等待写入完成。队列满的时候调用者等待，避免内存无限增长
+        后台线程每累计XLOG_BATCHROWS行，或者距离第一条未提交记录超过XLOG_FLUSHINTERVAL秒，提交一次
+        数据库使用WAL模式，写入时不阻塞读取，并发进程之间的锁冲突也更少
+        程序退出（包括异常中断）时，队列中剩余的记录会全部写入
+"""
+import os
+import time
+import queue
+import atexit
+import sqlite3
+import threading
+import weakref
+
+# 队列中最多保留的记录数量
+XLOG_QUEUESIZE = 10000
+# 每次提交的最大记录数量
+XLOG_BATCHROWS = 1000
+# 未提交的记录最多等待的时间（秒）
+XLOG_FLUSHINTERVAL = 0.2
+# 等待数据库锁的时间（秒）
+XLOG_LOCKTIMEOUT = 30
+
+XLOG_INSERT_COMMAND = \
+    "Insert Into TestCli_Xlog(Script,Started,Elapsed,RawCommand," \
+    "CommandType,Command,CommandStatus,ErrorCode,WorkerName,SuiteName,CaseName," \
+    "TestRunId, ScenarioId, ScenarioName) " \
+    "Values(?,?,?,?,  ?,?,?,?,?,?,?,  ?,?,?)"
+XLOG_INSERT_PERFLOG = \
+    "Insert Into TestCli_PerfLog(MonitorTime,TaskId,TaskName,MonitorItem,MonitorValue) " \
+    "Values(?,?,?,?,?)"
+
+# 队列中的控制消息
+_XLOG_FLUSH = "FLUSH"
+_XLOG_STOP = "STOP"
+
+# 所有还在运行的写入线程，程序退出时统一关闭
+_xlogWriters = weakref.WeakSet()
+
+
+def openXlogDatabase(xlogFile: str):
+    """
+        打开xlog数据库，并切换到WAL模式
+    """
+    xlogHandle = sqlite3.connect(
+        database=xlogFile,
+        check_same_thread=False,
+        timeout=XLOG_LOCKTIMEOUT,
+    )
+    xlogHandle.execute("PRAGMA journal_mode=WAL")
+    xlogHandle.execute("PRAGMA synchronous=NORMAL")
+    return xlogHandle
+
+
+def removeXlogDatabase(xlogFile: str):
+    """
+        删除xlog数据库，包括WAL模式下的附属文件
+    """
+    for fileName in [xlogFile, xlogFile + "-wal", xlogFile + "-shm"]:
+        if os.path.exists(fileName):
+            os.remove(fileName)
+
+
+class XlogWriter(threading.Thread):
+    def __init__(self, xlogFile: str,
+                 batchRows: int = XLOG_BATCHROWS,
+                 flushInterval: float = XLOG_FLUSHINTERVAL,
+                 queueSize: int = XLOG_QUEUESIZE):
+        threading.Thread.__init__(self, name="XlogWriter", daemon=True)
+        self.xlogFile = xlogFile
+        self.batchRows = batchRows
+        self.flushInterval = flushInterval
+        self.rowQueue = queue.Queue(maxsize=queueSize)
+        self.xlogHandle = openXlogDatabase(xlogFile)
+        self.isClosed = False
+        self.closeLock = threading.Lock()
+        _xlogWriters.add(self)
+        self.start()
+
+    def append(self, command: str, data: tuple):
+        """
+            添加一条记录，命令为XLOG_INSERT_COMMAND或XLOG_INSERT_PERFLOG
+            写入线程已经关闭的时候，记录被忽略
+        """
+        if not self.isClosed:
+            self.rowQueue.put((command, data))
+
+    def flush(self):
+        """
+            等待队列中已有的记录全部提交
+        """
+        if self.isClosed or not self.is_alive():
+            return
+        flushEvent = threading.Event()
+        self.rowQueue.put((_XLOG_FLUSH, flushEvent))
+        while not flushEvent.wait(timeout=1):
+            if not self.is_alive():
+                # 写入线程已经结束
+                break
+
+    def close(self):
+        """
+            写入队列中剩余的记录，并结束写入线程
+        """
+        with self.closeLock:
+            if self.isClosed:
+                return
+            self.isClosed = True
+        if self.is_alive():
+            self.rowQueue.put((_XLOG_STOP, None))
+            self.join()
+        self.xlogHandle.close()
+        _xlogWriters.discard(self)
+
+    def commit(self, pendingRows: int):
+        if pendingRows == 0:
+            return
+        try:
+            self.xlogHandle.commit()
+        except Exception as ex:
+            print("Internal error:: xlog file [" + str(self.xlogFile) + "] write not complete. " + repr(ex))
+
+    def run(self):
+        pendingRows = 0
+        firstPendingTime = None
+        while True:
+            if pendingRows == 0:
+                timeout = None
+            else:
+                timeout = max(0.0, firstPendingTime + self.flushInterval - time.monotonic())
+            try:
+                command, data = self.rowQueue.get(timeout=timeout)
+            except queue.Empty:
+                # 超过了最长等待时间
+                self.commit(pendingRows)
+                pendingRows = 0
+                continue
+            if command == _XLOG_STOP:
+                self.commit(pendingRows)
+                break
+            if command == _XLOG_FLUSH:
+                self.commit(pendingRows)
+                pendingRows = 0
+                data.set()
+                continue
+            try:
+                # 相同的命令文本由sqlite3缓存预编译后的语句
+                self.xlogHandle.execute(command, data)
+            except Exception as ex:
+                print("Internal error:: xlog file [" + str(self.xlogFile) + "] write not complete. " + repr(ex))
+                continue
+            if pendingRows == 0:
+                firstPendingTime = time.monotonic()
+            pendingRows = pendingRows + 1
+            if pendingRows >= self.batchRows:
+                self.commit(pendingRows)
+                pendingRows = 0
+
+
+@atexit.register
+def closeXlogWriters():
+    # 程序退出的时候，保证队列中的记录全部写入
+    for xlogWriter in list(_xlogWriters):
+        xlogWriter.close()